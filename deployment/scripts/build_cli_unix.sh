@@ -174,6 +174,10 @@ nuitka_args=(
     --file-version="${CLI_VERSION}"
     --product-version="${CLI_VERSION}"
     --include-package=rich._unicode_data
+    # The generated client and the overridden controllers are imported lazily via importlib,
+    # which Nuitka cannot follow.
+    --include-package=src.client.generated
+    --include-package=src.client.overridden
     --include-data-files=src/cli/data/tool_schemas.json=data/tool_schemas.json
 )
 
@@ -120,6 +120,8 @@ uv run --python 3.13 --extra dev nuitka ^
     --file-version=%CLI_VERSION% ^
     --product-version=%CLI_VERSION% ^
     --include-package=rich._unicode_data ^
+    --include-package=src.client.generated ^
+    --include-package=src.client.overridden ^
     --include-data-files=src/cli/data/tool_schemas.json=data/tool_schemas.json ^
     %NUITKA_CACHE_FLAGS% ^
     %NUITKA_COMPRESSION_FLAGS% ^
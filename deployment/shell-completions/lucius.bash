@@ -103,7 +103,7 @@ _lucius_completion() {
 
     case "$prev" in
         --format|-f)
-            COMPREPLY=($(compgen -W "json table plain csv" -- "$cur"))
+            COMPREPLY=($(compgen -W "json table plain csv ndjson" -- "$cur"))
             return 0
             ;;
         --args|-a)
@@ -34,6 +34,6 @@ complete -c lucius -n "__fish_seen_subcommand_from test-suite test-suites test_s
 
 # Common action options
 complete -c lucius -n "__fish_seen_subcommand_from add-test-result-attachment add-test-step-attachment add_test_result_attachment add_test_step_attachment assign-test-cases assign_test_cases close create delete delete-archived delete-unused delete_archived delete_unused get get-custom-fields get_custom_fields link-test-case link_test_case list list-test-cases list-test-results list_test_cases list_test_results manage-content manage_content reopen rerun-test-results-manually rerun_test_results_manually search start-manual-test-session start_manual_test_session submit-manual-test-results submit_manual_test_results unlink-test-case unlink_test_case update" -l args -s a -r -d "JSON arguments"
-complete -c lucius -n "__fish_seen_subcommand_from add-test-result-attachment add-test-step-attachment add_test_result_attachment add_test_step_attachment assign-test-cases assign_test_cases close create delete delete-archived delete-unused delete_archived delete_unused get get-custom-fields get_custom_fields link-test-case link_test_case list list-test-cases list-test-results list_test_cases list_test_results manage-content manage_content reopen rerun-test-results-manually rerun_test_results_manually search start-manual-test-session start_manual_test_session submit-manual-test-results submit_manual_test_results unlink-test-case unlink_test_case update" -l format -s f -r -x -a "json table plain csv" -d "Output format"
+complete -c lucius -n "__fish_seen_subcommand_from add-test-result-attachment add-test-step-attachment add_test_result_attachment add_test_step_attachment assign-test-cases assign_test_cases close create delete delete-archived delete-unused delete_archived delete_unused get get-custom-fields get_custom_fields link-test-case link_test_case list list-test-cases list-test-results list_test_cases list_test_results manage-content manage_content reopen rerun-test-results-manually rerun_test_results_manually search start-manual-test-session start_manual_test_session submit-manual-test-results submit_manual_test_results unlink-test-case unlink_test_case update" -l format -s f -r -x -a "json table plain csv ndjson" -d "Output format"
 complete -c lucius -n "__fish_seen_subcommand_from add-test-result-attachment add-test-step-attachment add_test_result_attachment add_test_step_attachment assign-test-cases assign_test_cases close create delete delete-archived delete-unused delete_archived delete_unused get get-custom-fields get_custom_fields link-test-case link_test_case list list-test-cases list-test-results list_test_cases list_test_results manage-content manage_content reopen rerun-test-results-manually rerun_test_results_manually search start-manual-test-session start_manual_test_session submit-manual-test-results submit_manual_test_results unlink-test-case unlink_test_case update" -l pretty -d "Pretty-print JSON output"
 complete -c lucius -n "__fish_seen_subcommand_from add-test-result-attachment add-test-step-attachment add_test_result_attachment add_test_step_attachment assign-test-cases assign_test_cases close create delete delete-archived delete-unused delete_archived delete_unused get get-custom-fields get_custom_fields link-test-case link_test_case list list-test-cases list-test-results list_test_cases list_test_results manage-content manage_content reopen rerun-test-results-manually rerun_test_results_manually search start-manual-test-session start_manual_test_session submit-manual-test-results submit_manual_test_results unlink-test-case unlink_test_case update" -l help -s h -d "Show action help"
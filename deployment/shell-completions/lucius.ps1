@@ -5,7 +5,7 @@ Register-ArgumentCompleter -Native -CommandName lucius -ScriptBlock {
 
     $entities = @("cf", "cfv", "custom-field", "custom-field-value", "custom-field-values", "custom-fields", "custom_field", "custom_field_value", "custom_field_values", "custom_fields", "defect", "defect-matcher", "defect-matchers", "defect_matcher", "defect_matchers", "defects", "df", "dm", "int", "integration", "integrations", "launch", "launches", "ln", "shared-step", "shared-steps", "shared_step", "shared_steps", "ss", "tc", "test-case", "test-cases", "test-layer", "test-layer-schema", "test-layer-schemas", "test-layers", "test-plan", "test-plans", "test-suite", "test-suites", "test_case", "test_cases", "test_layer", "test_layer_schema", "test_layer_schemas", "test_layers", "test_plan", "test_plans", "test_suite", "test_suites", "tl", "tls", "tp", "ts")
     $globalTokens = @("--help", "-h", "--version", "-V", "help", "version", "auth", "list", "install-completions")
-    $formats = @("json", "table", "plain", "csv")
+    $formats = @("json", "table", "plain", "csv", "ndjson")
     $options = @("--args", "-a", "--format", "-f", "--pretty", "--help", "-h")
     $authOptions = @("--url", "--token", "--project", "--help", "-h")
     $authSubcommands = @("status", "clear")
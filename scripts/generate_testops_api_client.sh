@@ -17,4 +17,7 @@ uv run openapi-generator-cli generate \
 
 mv src/client/generated_README.md src/client/generated/README.md
 
+echo "Making generated package imports lazy..."
+uv run python scripts/lazify_generated_client.py
+
 echo "✅ Client generated successfully in src/client/generated"
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Rewrite the generated client's package ``__init__`` modules to import lazily.
+
+OpenAPI Generator emits ``__init__.py`` files that eagerly import every API
+controller and model. Because Python runs a package's ``__init__`` before any of
+its submodules, importing a single controller used to load the whole client.
+
+This post-processing step keeps the public names of each package but moves
+the imports behind ``TYPE_CHECKING`` and a module-level ``__getattr__`` that
+imports a name on first access. Run it after regenerating the client.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Configuration
+GENERATED_DIR = Path("src/client/generated")
+PACKAGES = ("__init__.py", "api/__init__.py", "models/__init__.py")
+LAZY_MARKER = "_LAZY_IMPORTS"
+
+IMPORT_LINE = re.compile(r"^from (?P<module>[\w.]+) import (?P<name>\w+)(?: as (?P<alias>\w+))?\s*$")
+IMPORT_COMMENT = re.compile(r"^# import .+ into .+$")
+
+LOADER = """
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+"""
+
+
+def lazify(source: str) -> str:
+    """Return ``source`` with its ``from x import Name`` lines replaced by lazy loading."""
+    if LAZY_MARKER in source:
+        return source
+
+    kept: list[str] = []
+    imports: list[str] = []
+    targets: dict[str, str] = {}
+    insert_at: int | None = None
+    for line in source.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            if insert_at is None:
+                insert_at = len(kept)
+            imports.append(line)
+            targets[match["alias"] or match["name"]] = match["module"]
+        elif not IMPORT_COMMENT.match(line):
+            kept.append(line)
+
+    if insert_at is None:
+        return source
+
+    table = "\n".join(f'    "{name}": "{module}",' for name, module in targets.items())
+    block = [
+        "import importlib",
+        "from typing import TYPE_CHECKING, Any",
+        "",
+        "# Names are imported on first access; see scripts/lazify_generated_client.py.",
+        f"{LAZY_MARKER}: dict[str, str] = {{",
+        table,
+        "}",
+        "",
+        "if TYPE_CHECKING:",
+        *(f"    {line}" for line in imports),
+    ]
+    if "__all__" not in source:
+        block += ["", f"__all__ = list({LAZY_MARKER})"]
+
+    lines = [*kept[:insert_at], *block, *kept[insert_at:]]
+    return "\n".join(lines).rstrip() + "\n" + LOADER
+
+
+def main() -> int:
+    for relative in PACKAGES:
+        path = GENERATED_DIR / relative
+        path.write_text(lazify(path.read_text()))
+        print(f"Lazified {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
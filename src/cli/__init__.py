@@ -30,6 +30,7 @@ _EXPORTS: dict[str, str] = {
     "format_as_plain": "src.cli.formatting",
     "format_as_table": "src.cli.formatting",
     "format_json": "src.cli.formatting",
+    "load_stream_function": "src.cli.runtime",
     "load_tool_function": "src.cli.runtime",
     "load_tool_schemas": "src.cli.schema_loader",
     "main": "src.cli.cli_entry",
@@ -44,6 +45,7 @@ _EXPORTS: dict[str, str] = {
     "resolve_tool_schema_path": "src.cli.schema_loader",
     "run_cli": "src.cli.cli_entry",
     "run_cli_command": "src.cli.command_runner",
+    "stream_tool_rows": "src.cli.runtime",
     "validate_args_against_schema": "src.cli.option_parsing",
 }
 
@@ -18,6 +18,7 @@ from src.cli.local_commands import (
     auth_usage_lines,
 )
 from src.cli.models import CLIContext, CLIError
+from src.cli.token_cache import TOKEN_CACHE_FILENAME, FileTokenCache
 from src.client.client import AllureClient
 from src.client.exceptions import AllureAPIError, AllureAuthError, AllureNotFoundError, AllureValidationError
 
@@ -241,6 +242,7 @@ def _render_auth_status(context: CLIContext) -> None:
 def _clear_auth(context: CLIContext) -> None:
     path = auth_config_path()
     removed = clear_auth_config(path)
+    FileTokenCache(path.parent / TOKEN_CACHE_FILENAME).clear()
     if removed:
         context.console_out.print("Cleared saved CLI auth configuration.")
         context.console_out.print(f"Location: {path}", soft_wrap=True)
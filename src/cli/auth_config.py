@@ -173,7 +173,8 @@ def load_auth_config(path: Path | None = None) -> AuthConfig | None:
     return _build_auth_config(raw_data, path=resolved_path)
 
 
-def _ensure_directory_permissions(directory: Path) -> None:
+def ensure_directory_permissions(directory: Path) -> None:
+    """Restrict a directory holding CLI credentials to its owner, where the platform allows it."""
     if os.name == "nt":
         return
     try:
@@ -183,7 +184,8 @@ def _ensure_directory_permissions(directory: Path) -> None:
         return
 
 
-def _set_file_permissions(path: Path) -> None:
+def set_file_permissions(path: Path) -> None:
+    """Make a CLI credential file readable and writable by its owner only."""
     if os.name == "nt":
         return
     try:
@@ -214,7 +216,7 @@ def save_auth_config(
             hint=f"Check write permissions for {resolved_path.parent}.",
             exit_code=1,
         ) from None
-    _ensure_directory_permissions(resolved_path.parent)
+    ensure_directory_permissions(resolved_path.parent)
 
     existing_created_at = _load_existing_created_at(resolved_path)
 
@@ -237,7 +239,7 @@ def save_auth_config(
             handle.write(payload)
             handle.flush()
             os.fsync(handle.fileno())
-        _set_file_permissions(temp_path)
+        set_file_permissions(temp_path)
         temp_path.replace(resolved_path)
     except CLIError as error:
         pending_error = error
@@ -23,7 +23,7 @@ from src.cli.list_command import handle_list_command
 from src.cli.models import CLIContext, CLIError
 from src.cli.option_parsing import parse_action_options, validate_args_against_schema
 from src.cli.routing import build_command_registry, resolve_action_name, resolve_entity_name
-from src.cli.runtime import call_tool_function, error_hint_from_exception, exit_with_cli_error
+from src.cli.runtime import call_tool_function, error_hint_from_exception, exit_with_cli_error, stream_tool_rows
 from src.cli.schema_loader import load_tool_schemas
 from src.version import __version__
 
@@ -60,17 +60,21 @@ def run_cli(argv: list[str]) -> None:
 
         handle_install_completions_command(argv[1:], context=context)
         return
-    run_cli_command(
-        argv,
-        context=context,
-        load_tool_schemas=load_cli_tool_schemas,
-        build_command_registry=build_command_registry,
-        resolve_entity_name=resolve_entity_name,
-        resolve_action_name=resolve_action_name,
-        parse_action_options=parse_action_options,
-        validate_args_against_schema=validate_args_against_schema,
-        call_tool_function=call_tool_function,
-    )
+    from src.cli.token_cache import cli_token_cache
+
+    with cli_token_cache():
+        run_cli_command(
+            argv,
+            context=context,
+            load_tool_schemas=load_cli_tool_schemas,
+            build_command_registry=build_command_registry,
+            resolve_entity_name=resolve_entity_name,
+            resolve_action_name=resolve_action_name,
+            parse_action_options=parse_action_options,
+            validate_args_against_schema=validate_args_against_schema,
+            call_tool_function=call_tool_function,
+            stream_tool_rows=stream_tool_rows,
+        )
 
 
 def main() -> None:
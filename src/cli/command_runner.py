@@ -18,6 +18,10 @@ from src.cli.formatting import (
 )
 from src.cli.help_output import render_action_help, render_entity_actions, render_global_help
 from src.cli.models import OUTPUT_FORMATS, CLIContext, CLIError, PreparedCommand
+from src.cli.runtime import stream_tool_rows as default_stream_tool_rows
+
+# Paging arguments that have no meaning when every page is streamed as NDJSON rows.
+NDJSON_IGNORED_ARGS = frozenset({"page", "size", "all_pages"})
 
 PRETTY_JSON_HINT = "--pretty is valid only for action commands using JSON output: omit --format or use --format json."
 
@@ -44,6 +48,8 @@ def parse_args_json(args_json: str) -> dict[str, typing.Any]:
 
 def build_tool_args(args_dict: dict[str, typing.Any], output_format: str) -> dict[str, typing.Any]:
     """Append the tool contract output format to validated command arguments."""
+    if output_format == "ndjson":
+        return {name: value for name, value in args_dict.items() if name not in NDJSON_IGNORED_ARGS}
     tool_output_format = "plain" if output_format == "plain" else "json"
     return {**args_dict, "output_format": tool_output_format}
 
@@ -105,7 +111,7 @@ def prepare_command(
     if options.output_format not in OUTPUT_FORMATS:
         raise CLIError(
             f"Invalid format '{options.output_format}'",
-            hint="Use --format json|table|plain|csv",
+            hint="Use --format json|table|plain|csv|ndjson",
             exit_code=1,
         )
 
@@ -207,6 +213,23 @@ def render_tool_result(
     render_output(select_tabular_payload(parsed), output_format, console_out)
 
 
+def stream_ndjson_rows(
+    prepared: PreparedCommand,
+    *,
+    console_out: typing.Any,
+    stream_tool_rows: typing.Callable[
+        [str, dict[str, typing.Any], typing.Callable[[typing.Any], None]],
+        Coroutine[typing.Any, typing.Any, None],
+    ],
+) -> None:
+    """Print one compact JSON document per streamed row, flushing each as it arrives."""
+
+    def emit(row: typing.Any) -> None:
+        console_out.print(json.dumps(row, ensure_ascii=False), markup=False, highlight=False, soft_wrap=True)
+
+    asyncio.run(stream_tool_rows(prepared.spec.tool_name, prepared.tool_args, emit))
+
+
 def run_cli_command(
     argv: list[str],
     *,
@@ -218,6 +241,13 @@ def run_cli_command(
     parse_action_options: typing.Callable[[list[str]], typing.Any],
     validate_args_against_schema: typing.Callable[[dict[str, typing.Any], str, dict[str, typing.Any]], None],
     call_tool_function: typing.Callable[[str, dict[str, typing.Any]], Coroutine[typing.Any, typing.Any, typing.Any]],
+    stream_tool_rows: (
+        typing.Callable[
+            [str, dict[str, typing.Any], typing.Callable[[typing.Any], None]],
+            Coroutine[typing.Any, typing.Any, None],
+        ]
+        | None
+    ) = None,
 ) -> None:
     """Route a CLI request from argv through parse, invoke, and render phases."""
     prepared = prepare_command(
@@ -233,6 +263,14 @@ def run_cli_command(
     if prepared is None:
         return
 
+    if prepared.options.output_format == "ndjson":
+        stream_ndjson_rows(
+            prepared,
+            console_out=context.console_out,
+            stream_tool_rows=stream_tool_rows or default_stream_tool_rows,
+        )
+        return
+
     result: typing.Any = asyncio.run(call_tool_function(prepared.spec.tool_name, prepared.tool_args))
     render_tool_result(
         prepared,
@@ -16,7 +16,7 @@ from src.cli.route_matrix import (
 )
 
 SUPPORTED_COMPLETION_SHELLS = ("bash", "zsh", "fish", "powershell")
-FORMATS = ["json", "table", "plain", "csv"]
+FORMATS = ["json", "table", "plain", "csv", "ndjson"]
 GLOBAL_TOKENS = ["--help", "-h", "--version", "-V", "help", "version", *CLI_LOCAL_COMMANDS]
 ACTION_OPTIONS = ["--args", "-a", "--format", "-f", "--pretty", "--help", "-h"]
 
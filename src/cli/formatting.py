@@ -382,7 +382,7 @@ def render_output(data: typing.Any, output_format: str, console: typing.Any) ->
     else:
         raise CLIError(
             f"Invalid output format: {output_format}",
-            hint="Use --format json|table|plain|csv",
+            hint="Use --format json|table|plain|csv|ndjson",
             exit_code=1,
         )
 
@@ -8,7 +8,7 @@ import typing
 from dataclasses import dataclass
 from pathlib import Path
 
-OUTPUT_FORMATS = {"json", "table", "plain", "csv"}
+OUTPUT_FORMATS = {"json", "table", "plain", "csv", "ndjson"}
 
 
 class CLIError(Exception):
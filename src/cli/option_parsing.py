@@ -31,7 +31,7 @@ def parse_action_options(argv: list[str]) -> ActionOptions:
             continue
         if token in {"--format", "-f"}:
             if index + 1 >= len(argv):
-                raise CLIError("Missing value for --format", hint="Use --format json|table|plain|csv")
+                raise CLIError("Missing value for --format", hint="Use --format json|table|plain|csv|ndjson")
             options.output_format = argv[index + 1]
             index += 2
             continue
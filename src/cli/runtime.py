@@ -5,8 +5,9 @@ Runtime helpers for CLI error handling and tool invocation.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import typing
-from collections.abc import Coroutine
+from collections.abc import AsyncGenerator, Callable, Coroutine
 
 from src.cli.models import CLIError
 from src.cli.tool_resolver import resolve_tool_function
@@ -80,6 +81,60 @@ async def call_tool_function(
         ) from None
 
 
+def load_stream_function(tool_name: str) -> Callable[..., AsyncGenerator[typing.Any]]:
+    """Lazy-load the row streaming counterpart (``stream_<tool_name>``) of a tool."""
+    try:
+        resolved = resolve_tool_function(f"stream_{tool_name}")
+    except RuntimeError:
+        raise CLIError(
+            f"Tool '{tool_name}' does not support --format ndjson",
+            hint="Use --format ndjson with 'test_case list' or 'test_case search', or pick another format.",
+            exit_code=1,
+        ) from None
+    return typing.cast(Callable[..., AsyncGenerator[typing.Any]], resolved)
+
+
+async def stream_tool_rows(
+    tool_name: str,
+    args: dict[str, typing.Any],
+    emit: Callable[[typing.Any], None],
+    *,
+    stream_loader: Callable[[str], Callable[..., AsyncGenerator[typing.Any]]] | None = None,
+    error_hint_provider: Callable[[Exception], str] | None = None,
+) -> None:
+    """Pass each row of a tool's row stream to ``emit`` as soon as it arrives."""
+    if stream_loader is None:
+        stream_loader = load_stream_function
+    if error_hint_provider is None:
+        error_hint_provider = error_hint_from_exception
+    stream_function = stream_loader(tool_name)
+    try:
+        # Closing the stream when ``emit`` fails cancels the pages still being fetched.
+        async with contextlib.aclosing(stream_function(**args)) as rows:
+            async for row in rows:
+                emit(row)
+    except CLIError:
+        raise
+    except asyncio.CancelledError:
+        raise CLIError(
+            "Command execution cancelled",
+            hint="The operation was interrupted",
+            exit_code=130,
+        ) from None
+    except TypeError as error:
+        raise CLIError(
+            f"Invalid parameters for tool '{tool_name}': {error}",
+            hint="Check parameter names and types with --help.",
+            exit_code=1,
+        ) from None
+    except Exception as error:
+        raise CLIError(
+            f"Error executing '{tool_name}': {error}",
+            hint=error_hint_provider(error),
+            exit_code=1,
+        ) from None
+
+
 def exit_with_cli_error(error: CLIError, console_err: typing.Any) -> typing.NoReturn:
     """Render a CLI error and exit with its configured status code."""
     console_err.print(f"[red]Error:[/red] {error.message}")
@@ -0,0 +1,150 @@
+"""Persistent JWT cache for CLI runs.
+
+Each ``lucius <entity> <action>`` run is a fresh process. Caching the exchanged
+JWT next to the saved auth config lets consecutive runs skip the token exchange
+while the JWT is still valid. The cache is best effort: unreadable or unwritable
+cache files never fail a command.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import SecretStr
+
+from src.cli.auth_config import auth_config_path, ensure_directory_permissions, set_file_permissions
+from src.cli.models import CLIError
+from src.client.session_pool import token_fingerprint
+from src.client.token_cache import CachedToken, TokenCache, get_token_cache, set_token_cache
+from src.utils.logger import get_logger
+
+TOKEN_CACHE_FILENAME = "token_cache.json"  # noqa: S105
+TOKEN_CACHE_ENV = "LUCIUS_TOKEN_CACHE"  # noqa: S105
+
+logger = get_logger(__name__)
+
+
+def token_cache_path() -> Path:
+    """Return the JWT cache path, next to the saved CLI auth config."""
+    return auth_config_path().parent / TOKEN_CACHE_FILENAME
+
+
+def token_cache_enabled() -> bool:
+    """Return whether the persistent JWT cache is enabled (``LUCIUS_TOKEN_CACHE=0`` disables it)."""
+    return os.environ.get(TOKEN_CACHE_ENV, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class FileTokenCache:
+    """JWT cache stored as a 0600 JSON file keyed by endpoint and API token hash."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        return self._path or token_cache_path()
+
+    @staticmethod
+    def cache_key(base_url: str, token: SecretStr) -> str:
+        return f"{base_url.rstrip('/')}#{token_fingerprint(token)}"
+
+    def load(self, base_url: str, token: SecretStr) -> CachedToken | None:
+        entry = self._read_entries().get(self.cache_key(base_url, token))
+        if not isinstance(entry, dict):
+            return None
+        jwt_token = entry.get("access_token")
+        expires_at = entry.get("expires_at")
+        csrf_token = entry.get("csrf_token")
+        if not isinstance(jwt_token, str) or not jwt_token:
+            return None
+        if isinstance(expires_at, bool) or not isinstance(expires_at, int | float):
+            return None
+        return CachedToken(
+            jwt_token=jwt_token,
+            expires_at=float(expires_at),
+            csrf_token=csrf_token if isinstance(csrf_token, str) else None,
+        )
+
+    def store(self, base_url: str, token: SecretStr, cached: CachedToken) -> None:
+        entries = self._live_entries()
+        entries[self.cache_key(base_url, token)] = {
+            "access_token": cached.jwt_token,
+            "expires_at": cached.expires_at,
+            "csrf_token": cached.csrf_token,
+        }
+        self._write_entries(entries)
+
+    def discard(self, base_url: str, token: SecretStr) -> None:
+        entries = self._live_entries()
+        entries.pop(self.cache_key(base_url, token), None)
+        self._write_entries(entries)
+
+    def clear(self) -> bool:
+        """Remove the cache file if it exists."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            return False
+        except (OSError, CLIError) as error:
+            logger.debug("Failed to remove CLI token cache: %s", error)
+            return False
+        return True
+
+    def _read_entries(self) -> dict[str, object]:
+        try:
+            raw_data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, CLIError) as error:
+            logger.debug("Ignoring unreadable CLI token cache: %s", error)
+            return {}
+        if not isinstance(raw_data, dict) or not isinstance(raw_data.get("tokens"), dict):
+            return {}
+        return dict(raw_data["tokens"])
+
+    def _live_entries(self) -> dict[str, object]:
+        now = time.time()
+        live: dict[str, object] = {}
+        for key, entry in self._read_entries().items():
+            expires_at = entry.get("expires_at") if isinstance(entry, dict) else None
+            if isinstance(expires_at, int | float) and expires_at > now:
+                live[key] = entry
+        return live
+
+    def _write_entries(self, entries: dict[str, object]) -> None:
+        temp_path: Path | None = None
+        try:
+            path = self.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory_permissions(path.parent)
+            fd, raw_temp_path = tempfile.mkstemp(prefix=".token_cache.", suffix=".tmp", dir=str(path.parent))
+            temp_path = Path(raw_temp_path)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"tokens": entries}, indent=2, sort_keys=True) + "\n")
+            set_file_permissions(temp_path)
+            temp_path.replace(path)
+        except (OSError, CLIError) as error:
+            logger.debug("Failed to write CLI token cache: %s", error)
+        finally:
+            if temp_path is not None and temp_path.exists():
+                with contextlib.suppress(OSError):
+                    temp_path.unlink()
+
+
+@contextlib.contextmanager
+def cli_token_cache(cache: TokenCache | None = None) -> Iterator[TokenCache | None]:
+    """Install the persistent JWT cache for the duration of one CLI command."""
+    if cache is None and token_cache_enabled():
+        cache = FileTokenCache()
+    previous = get_token_cache()
+    set_token_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_token_cache(previous)
@@ -8,57 +8,36 @@ standardized error handling.
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import importlib
+import inspect
 import json
 import time
 from collections.abc import Awaitable
 from dataclasses import dataclass
-from typing import Literal, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
 import httpx
 from pydantic import Field, SecretStr
 
 from src.utils.auth_resolution import resolve_auth_settings
+from src.utils.config import settings
+from src.utils.deadline import cap_timeout, deadline_expired, remaining_time
 from src.utils.logger import get_logger
+from src.utils.metrics import TOKEN_REFRESHES, UPSTREAM_REQUESTS_IN_FLIGHT, observe_upstream_request
 
+from .deserialization import FastApiClient
 from .exceptions import (
     AllureAPIError,
     AllureAuthError,
+    AllureDeadlineExceededError,
     AllureNotFoundError,
     AllureRateLimitError,
     AllureValidationError,
     TestCaseNotFoundError,
 )
-from .generated.api.custom_field_controller_api import CustomFieldControllerApi
-from .generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi
-from .generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api
-from .generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi
-from .generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi
-from .generated.api.integration_controller_api import IntegrationControllerApi
-from .generated.api.launch_controller_api import LaunchControllerApi
-from .generated.api.launch_search_controller_api import LaunchSearchControllerApi
-from .generated.api.project_controller_api import ProjectControllerApi
-from .generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi
-from .generated.api.shared_step_controller_api import SharedStepControllerApi
-from .generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi
 from .generated.api.test_case_attachment_controller_api import TestCaseAttachmentControllerApi
-from .generated.api.test_case_controller_api import TestCaseControllerApi
-from .generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi
 from .generated.api.test_case_scenario_controller_api import TestCaseScenarioControllerApi
-from .generated.api.test_case_search_controller_api import TestCaseSearchControllerApi
-from .generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api
-from .generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api
-from .generated.api.test_layer_controller_api import TestLayerControllerApi
-from .generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi
-from .generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi
-from .generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi
-from .generated.api.test_result_controller_api import TestResultControllerApi
-from .generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi
-from .generated.api.test_result_flat_controller_api import TestResultFlatControllerApi
-from .generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi
-from .generated.api.test_result_run_controller_api import TestResultRunControllerApi
-from .generated.api.tree_controller_v2_api import TreeControllerV2Api
-from .generated.api.upload_controller_api import UploadControllerApi
-from .generated.api.upload_test_result_controller_api import UploadTestResultControllerApi
 from .generated.api_client import ApiClient
 from .generated.configuration import Configuration
 from .generated.exceptions import ApiException
@@ -86,6 +65,7 @@ from .generated.models.launch_upload_response_dto import LaunchUploadResponseDto
 from .generated.models.manual_session_request_dto import ManualSessionRequestDto
 from .generated.models.normalized_scenario_dto import NormalizedScenarioDto
 from .generated.models.normalized_scenario_dto_attachments_value import NormalizedScenarioDtoAttachmentsValue
+from .generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto
 from .generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto
 from .generated.models.page_id_and_name_only_dto import PageIdAndNameOnlyDto
 from .generated.models.page_launch_dto import PageLaunchDto
@@ -149,7 +129,42 @@ from .generated.models.upload_fixtures_results_dto import UploadFixturesResultsD
 from .generated.models.upload_results_dto import UploadResultsDto
 from .generated.models.upload_results_response_dto import UploadResultsResponseDto
 from .generated.rest import RESTResponse
-from .overridden.test_case_custom_fields_v2 import TestCaseCustomFieldV2ControllerApi
+from .pagination import iter_page_items
+from .session_pool import AllureSession, AllureSessionPool, get_session_pool, token_fingerprint
+from .token_cache import TOKEN_CACHE_MIN_TTL_SECONDS, CachedToken, get_token_cache
+from .transport import AllureRESTClient, TransportConfig, use_transfer_timeouts
+
+if TYPE_CHECKING:
+    from .generated.api.custom_field_controller_api import CustomFieldControllerApi
+    from .generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi
+    from .generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api
+    from .generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi
+    from .generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi
+    from .generated.api.integration_controller_api import IntegrationControllerApi
+    from .generated.api.launch_controller_api import LaunchControllerApi
+    from .generated.api.launch_search_controller_api import LaunchSearchControllerApi
+    from .generated.api.project_controller_api import ProjectControllerApi
+    from .generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi
+    from .generated.api.shared_step_controller_api import SharedStepControllerApi
+    from .generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi
+    from .generated.api.test_case_controller_api import TestCaseControllerApi
+    from .generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi
+    from .generated.api.test_case_search_controller_api import TestCaseSearchControllerApi
+    from .generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api
+    from .generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api
+    from .generated.api.test_layer_controller_api import TestLayerControllerApi
+    from .generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi
+    from .generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi
+    from .generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi
+    from .generated.api.test_result_controller_api import TestResultControllerApi
+    from .generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi
+    from .generated.api.test_result_flat_controller_api import TestResultFlatControllerApi
+    from .generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi
+    from .generated.api.test_result_run_controller_api import TestResultRunControllerApi
+    from .generated.api.tree_controller_v2_api import TreeControllerV2Api
+    from .generated.api.upload_controller_api import UploadControllerApi
+    from .generated.api.upload_test_result_controller_api import UploadTestResultControllerApi
+    from .overridden.test_case_custom_fields_v2 import TestCaseCustomFieldV2ControllerApi
 
 
 # Subclasses to add missing fields to generated models
@@ -203,6 +218,15 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Start renewing a JWT this many seconds before it must be refreshed.
+TOKEN_RENEWAL_LEAD_SECONDS = 300.0
+# Wait this long before retrying a failed background renewal.
+TOKEN_RENEWAL_RETRY_SECONDS = 30.0
+# Page size used when reading every custom field of a project and every value of a field.
+CUSTOM_FIELD_PAGE_SIZE = 100
+# Maximum number of custom fields whose values are fetched at the same time.
+CUSTOM_FIELD_VALUE_CONCURRENCY = 8
+
 type ApiType = (
     TestCaseControllerApi
     | SharedStepControllerApi
@@ -287,6 +311,71 @@ __all__ = [
 ]
 
 
+def _operation_name(call: object) -> str:
+    """Return the generated API operation behind a pending call, e.g. ``TestCaseControllerApi.find_one11``."""
+    name = getattr(call, "__qualname__", None)
+    if not isinstance(name, str):
+        return "unknown"
+    return name.removesuffix("_without_preload_content").removesuffix("_with_http_info")
+
+
+async def _await_within_deadline[R](call: Awaitable[R]) -> R:
+    """Await a pending API call, giving up with ``AllureDeadlineExceededError`` when the tool deadline passes."""
+    budget = remaining_time()
+    if budget is None:
+        return await call
+    if budget <= 0:
+        if inspect.iscoroutine(call):
+            call.close()
+        raise AllureDeadlineExceededError()
+    try:
+        async with asyncio.timeout(budget):
+            return await call
+    except (TimeoutError, httpx.TimeoutException) as e:
+        if deadline_expired():
+            raise AllureDeadlineExceededError() from e
+        raise
+
+
+class _LazyController[ControllerT]:
+    """Create a generated controller for the client's ApiClient on first access.
+
+    Importing every generated controller (and the models they pull in) up front
+    dominated cold start, so each one is imported when a client first needs it.
+    Assigning the attribute, e.g. to a test double or ``None``, replaces the lazy value.
+    """
+
+    def __init__(self, module: str, class_name: str) -> None:
+        self._module = module
+        self._class_name = class_name
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _LazyController[ControllerT]: ...
+
+    @overload
+    def __get__(self, instance: AllureClient, owner: type) -> ControllerT | None: ...
+
+    def __get__(self, instance: AllureClient | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        if self._name in instance.__dict__:
+            return instance.__dict__[self._name]
+        api_client = instance._api_client
+        if api_client is None:
+            return None
+        controller_class = getattr(importlib.import_module(self._module, __package__), self._class_name)
+        controller = controller_class(api_client)
+        instance.__dict__[self._name] = controller
+        return controller
+
+    def __set__(self, instance: AllureClient, value: ControllerT | None) -> None:
+        instance.__dict__[self._name] = value
+
+
 class AllureClient:
     """Async client for Allure TestOps API.
 
@@ -309,12 +398,113 @@ class AllureClient:
         ```
     """
 
+    # Generated client components, created for the session's ApiClient on first use.
+    _test_case_api: _LazyController[TestCaseControllerApi] = _LazyController(
+        ".generated.api.test_case_controller_api", "TestCaseControllerApi"
+    )
+    _shared_step_api: _LazyController[SharedStepControllerApi] = _LazyController(
+        ".generated.api.shared_step_controller_api", "SharedStepControllerApi"
+    )
+    _shared_step_attachment_api: _LazyController[SharedStepAttachmentControllerApi] = _LazyController(
+        ".generated.api.shared_step_attachment_controller_api", "SharedStepAttachmentControllerApi"
+    )
+    _attachment_api: _LazyController[TestCaseAttachmentControllerApi] = _LazyController(
+        ".generated.api.test_case_attachment_controller_api", "TestCaseAttachmentControllerApi"
+    )
+    _scenario_api: _LazyController[TestCaseScenarioControllerApi] = _LazyController(
+        ".generated.api.test_case_scenario_controller_api", "TestCaseScenarioControllerApi"
+    )
+    _shared_step_scenario_api: _LazyController[SharedStepScenarioControllerApi] = _LazyController(
+        ".generated.api.shared_step_scenario_controller_api", "SharedStepScenarioControllerApi"
+    )
+    _overview_api: _LazyController[TestCaseOverviewControllerApi] = _LazyController(
+        ".generated.api.test_case_overview_controller_api", "TestCaseOverviewControllerApi"
+    )
+    _search_api: _LazyController[TestCaseSearchControllerApi] = _LazyController(
+        ".generated.api.test_case_search_controller_api", "TestCaseSearchControllerApi"
+    )
+    _test_case_custom_field_api: _LazyController[TestCaseCustomFieldV2ControllerApi] = _LazyController(
+        ".overridden.test_case_custom_fields_v2", "TestCaseCustomFieldV2ControllerApi"
+    )
+    _custom_field_api: _LazyController[CustomFieldControllerApi] = _LazyController(
+        ".generated.api.custom_field_controller_api", "CustomFieldControllerApi"
+    )
+    _custom_field_project_api: _LazyController[CustomFieldProjectControllerApi] = _LazyController(
+        ".generated.api.custom_field_project_controller_api", "CustomFieldProjectControllerApi"
+    )
+    _custom_field_project_v2_api: _LazyController[CustomFieldProjectControllerV2Api] = _LazyController(
+        ".generated.api.custom_field_project_controller_v2_api", "CustomFieldProjectControllerV2Api"
+    )
+    _custom_field_value_api: _LazyController[CustomFieldValueControllerApi] = _LazyController(
+        ".generated.api.custom_field_value_controller_api", "CustomFieldValueControllerApi"
+    )
+    _custom_field_value_project_api: _LazyController[CustomFieldValueProjectControllerApi] = _LazyController(
+        ".generated.api.custom_field_value_project_controller_api", "CustomFieldValueProjectControllerApi"
+    )
+    _test_layer_api: _LazyController[TestLayerControllerApi] = _LazyController(
+        ".generated.api.test_layer_controller_api", "TestLayerControllerApi"
+    )
+    _test_layer_schema_api: _LazyController[TestLayerSchemaControllerApi] = _LazyController(
+        ".generated.api.test_layer_schema_controller_api", "TestLayerSchemaControllerApi"
+    )
+    _launch_api: _LazyController[LaunchControllerApi] = _LazyController(
+        ".generated.api.launch_controller_api", "LaunchControllerApi"
+    )
+    _launch_search_api: _LazyController[LaunchSearchControllerApi] = _LazyController(
+        ".generated.api.launch_search_controller_api", "LaunchSearchControllerApi"
+    )
+    _test_result_attachment_api: _LazyController[TestResultAttachmentControllerApi] = _LazyController(
+        ".generated.api.test_result_attachment_controller_api", "TestResultAttachmentControllerApi"
+    )
+    _test_result_api: _LazyController[TestResultControllerApi] = _LazyController(
+        ".generated.api.test_result_controller_api", "TestResultControllerApi"
+    )
+    _test_result_bulk_api: _LazyController[TestResultBulkControllerApi] = _LazyController(
+        ".generated.api.test_result_bulk_controller_api", "TestResultBulkControllerApi"
+    )
+    _test_result_fixture_api: _LazyController[TestResultFixtureControllerApi] = _LazyController(
+        ".generated.api.test_result_fixture_controller_api", "TestResultFixtureControllerApi"
+    )
+    _test_result_flat_api: _LazyController[TestResultFlatControllerApi] = _LazyController(
+        ".generated.api.test_result_flat_controller_api", "TestResultFlatControllerApi"
+    )
+    _test_result_rerun_api: _LazyController[TestResultRerunControllerApi] = _LazyController(
+        ".generated.api.test_result_rerun_controller_api", "TestResultRerunControllerApi"
+    )
+    _test_result_run_api: _LazyController[TestResultRunControllerApi] = _LazyController(
+        ".generated.api.test_result_run_controller_api", "TestResultRunControllerApi"
+    )
+    _tree_api: _LazyController[TreeControllerV2Api] = _LazyController(
+        ".generated.api.tree_controller_v2_api", "TreeControllerV2Api"
+    )
+    _test_case_tree_api: _LazyController[TestCaseTreeControllerV2Api] = _LazyController(
+        ".generated.api.test_case_tree_controller_v2_api", "TestCaseTreeControllerV2Api"
+    )
+    _test_case_tree_bulk_api: _LazyController[TestCaseTreeBulkControllerV2Api] = _LazyController(
+        ".generated.api.test_case_tree_bulk_controller_v2_api", "TestCaseTreeBulkControllerV2Api"
+    )
+    _integration_api: _LazyController[IntegrationControllerApi] = _LazyController(
+        ".generated.api.integration_controller_api", "IntegrationControllerApi"
+    )
+    _project_api: _LazyController[ProjectControllerApi] = _LazyController(
+        ".generated.api.project_controller_api", "ProjectControllerApi"
+    )
+    _upload_api: _LazyController[UploadControllerApi] = _LazyController(
+        ".generated.api.upload_controller_api", "UploadControllerApi"
+    )
+    _upload_test_result_api: _LazyController[UploadTestResultControllerApi] = _LazyController(
+        ".generated.api.upload_test_result_controller_api", "UploadTestResultControllerApi"
+    )
+
     def __init__(
         self,
         base_url: str,
         token: SecretStr,
         project: int,
         timeout: float = 30.0,
+        transport: TransportConfig | None = None,
+        *,
+        fast_deserialization: bool = False,
     ) -> None:
         """Initialize AllureClient.
 
@@ -322,7 +512,11 @@ class AllureClient:
             base_url: Allure TestOps instance base URL
             token: API token (will be exchanged for JWT Bearer token)
             project: Target Allure TestOps project ID
-            timeout: Request timeout in seconds (default: 30.0)
+            timeout: Read timeout for API calls in seconds (default: 30.0)
+            transport: Connection pooling, HTTP/2, and per-phase timeout settings.
+                Uploads and downloads use its transfer timeout profile.
+            fast_deserialization: Decode responses with ``orjson`` when installed and
+                validate list pages in a single pydantic pass.
         """
         if not base_url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid base_url scheme: {base_url}. Must start with http:// or https://")
@@ -331,49 +525,18 @@ class AllureClient:
         self._token = token
         self._project = project
         self._timeout = timeout
-        self._jwt_token: str | None = None
-        self._token_expires_at: float | None = None
-        self._csrf_token: str | None = None
-
-        # Generated client components
-        self._api_client: ApiClient | None = None
-        self._test_case_api: TestCaseControllerApi | None = None
-        self._shared_step_api: SharedStepControllerApi | None = None
-        self._shared_step_attachment_api: SharedStepAttachmentControllerApi | None = None
-        self._attachment_api: TestCaseAttachmentControllerApi | None = None
-        self._scenario_api: TestCaseScenarioControllerApi | None = None
-        self._shared_step_scenario_api: SharedStepScenarioControllerApi | None = None
-        self._overview_api: TestCaseOverviewControllerApi
-        self._search_api: TestCaseSearchControllerApi | None = None
-        self._test_case_custom_field_api: TestCaseCustomFieldV2ControllerApi | None = None
-        self._custom_field_api: CustomFieldControllerApi | None = None
-        self._custom_field_project_api: CustomFieldProjectControllerApi | None = None
-        self._custom_field_project_v2_api: CustomFieldProjectControllerV2Api | None = None
-        self._custom_field_value_api: CustomFieldValueControllerApi | None = None
-        self._custom_field_value_project_api: CustomFieldValueProjectControllerApi | None = None
-        self._test_layer_api: TestLayerControllerApi | None = None
-        self._test_layer_schema_api: TestLayerSchemaControllerApi | None = None
-        self._launch_api: LaunchControllerApi | None = None
-        self._launch_search_api: LaunchSearchControllerApi | None = None
-        self._test_result_attachment_api: TestResultAttachmentControllerApi | None = None
-        self._test_result_api: TestResultControllerApi | None = None
-        self._test_result_bulk_api: TestResultBulkControllerApi | None = None
-        self._test_result_fixture_api: TestResultFixtureControllerApi | None = None
-        self._test_result_flat_api: TestResultFlatControllerApi | None = None
-        self._test_result_rerun_api: TestResultRerunControllerApi | None = None
-        self._test_result_run_api: TestResultRunControllerApi | None = None
-        self._tree_api: TreeControllerV2Api | None = None
-        self._test_case_tree_api: TestCaseTreeControllerV2Api | None = None
-        self._test_case_tree_bulk_api: TestCaseTreeBulkControllerV2Api | None = None
-        self._integration_api: IntegrationControllerApi | None = None
-        self._project_api: ProjectControllerApi | None = None
-        self._upload_api: UploadControllerApi | None = None
-        self._upload_test_result_api: UploadTestResultControllerApi | None = None
+        self._transport = transport or TransportConfig()
+        self._fast_deserialization = fast_deserialization
+        # Token state and the generated ApiClient live on a session so that a
+        # process-wide AllureSessionPool can share them across tool calls.
+        self._session = AllureSession(base_url=self._base_url)
+        self._session_pool: AllureSessionPool | None = None
+
         self._is_entered = False
 
     @classmethod
     def from_env(
-        cls, project: int | None = None, timeout: float = 30.0, *, require_project: bool = True
+        cls, project: int | None = None, timeout: float | None = None, *, require_project: bool = True
     ) -> AllureClient:
         """Initialize AllureClient from environment variables.
 
@@ -384,7 +547,7 @@ class AllureClient:
 
         Args:
             project: Optional target Allure TestOps project ID to override the one from environment variables.
-            timeout: Request timeout in seconds (default: 30.0)
+            timeout: Read timeout for API calls in seconds (default: ``ALLURE_HTTP_READ_TIMEOUT``)
             require_project: Whether a default project ID is required. Set to
                 ``False`` only for global discovery endpoints that do not use
                 project context.
@@ -405,11 +568,14 @@ class AllureClient:
         if require_project and (not isinstance(resolved.project_id, int) or resolved.project_id <= 0):
             raise ValueError("Project ID is required and must be positive")
 
+        transport = TransportConfig.from_settings(settings)
         return cls(
             base_url=resolved.endpoint,
             token=resolved.api_token,
             project=resolved.project_id or 0,
-            timeout=timeout,
+            timeout=timeout if timeout is not None else transport.timeouts.read,
+            transport=transport,
+            fast_deserialization=settings.ALLURE_FAST_DESERIALIZATION,
         )
 
     def set_project(self, project: int) -> None:
@@ -421,6 +587,57 @@ class AllureClient:
     def get_base_url(self) -> str:
         return self._base_url
 
+    def get_auth_scope(self) -> str:
+        """Return the fingerprint of this client's API token, for keying data only its token may see."""
+        return token_fingerprint(self._token)
+
+    def clone(self) -> AllureClient:
+        """Return a new, not yet entered client with the same endpoint, token, project, and settings.
+
+        Background work that may outlive this client enters its own clone; with an
+        active session pool, the clone reuses the pooled session.
+        """
+        return AllureClient(
+            base_url=self._base_url,
+            token=self._token,
+            project=self._project,
+            timeout=self._timeout,
+            transport=self._transport,
+            fast_deserialization=self._fast_deserialization,
+        )
+
+    @property
+    def _api_client(self) -> ApiClient | None:
+        return self._session.api_client
+
+    @_api_client.setter
+    def _api_client(self, value: ApiClient | None) -> None:
+        self._session.api_client = value
+
+    @property
+    def _jwt_token(self) -> str | None:
+        return self._session.jwt_token
+
+    @_jwt_token.setter
+    def _jwt_token(self, value: str | None) -> None:
+        self._session.jwt_token = value
+
+    @property
+    def _token_expires_at(self) -> float | None:
+        return self._session.token_expires_at
+
+    @_token_expires_at.setter
+    def _token_expires_at(self, value: float | None) -> None:
+        self._session.token_expires_at = value
+
+    @property
+    def _csrf_token(self) -> str | None:
+        return self._session.csrf_token
+
+    @_csrf_token.setter
+    def _csrf_token(self, value: str | None) -> None:
+        self._session.csrf_token = value
+
     async def _get_jwt_token(self) -> str:
         """Exchange API token for a JWT Bearer token.
 
@@ -446,7 +663,7 @@ class AllureClient:
                         "token": self._token.get_secret_value(),
                     },
                     headers={"Accept": "application/json"},
-                    timeout=self._timeout * 2,
+                    timeout=cap_timeout(self._timeout * 2),
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -456,89 +673,182 @@ class AllureClient:
                 self._jwt_token = access_token
                 # Refresh 60 seconds before expiry
                 self._token_expires_at = time.time() + expires_in - 60
+                self._session.token_renew_at = self._token_expires_at - self._renewal_lead(expires_in - 60)
 
                 # Capture CSRF token if present (standard Spring Security/Angular convention)
                 self._csrf_token = response.cookies.get("XSRF-TOKEN")
 
+                TOKEN_REFRESHES.inc("success")
                 return access_token
             except httpx.HTTPStatusError as e:
+                TOKEN_REFRESHES.inc("error")
                 raise AllureAuthError(
                     f"Token exchange failed: {e.response.text}",
                     status_code=e.response.status_code,
                     response_body=e.response.text,
                 ) from e
             except (json.JSONDecodeError, KeyError, TypeError) as e:
+                TOKEN_REFRESHES.inc("error")
                 raise AllureAuthError(
                     "Token exchange failed: invalid response",
                     status_code=response.status_code,
                     response_body=response.text,
                 ) from e
             except httpx.RequestError as e:
+                TOKEN_REFRESHES.inc("error")
+                if deadline_expired():
+                    raise AllureDeadlineExceededError() from e
                 raise AllureAPIError(f"Token exchange request error: {e}") from e
 
     async def _ensure_valid_token(self) -> None:
         """Ensure the session has a valid JWT token.
 
-        Checks the token expiration and triggers a refresh if it's missing
-        or about to expire (within 60 seconds). Also initializes or updates
-        the internal ApiClient and controllers.
+        Blocks only when the token is missing or about to expire (within 60
+        seconds); concurrent callers share a single exchange. Inside the renewal
+        window before that point, the token is renewed in the background while
+        requests keep using the current one.
         """
-        if self._token_expires_at is None or time.time() >= self._token_expires_at:
-            new_token = await self._get_jwt_token()
-
-            # Initialize or update ApiClient
-            if self._api_client is None:
-                config = Configuration(host=self._base_url, access_token=new_token, retries=3)
-                self._api_client = ApiClient(configuration=config)
-                # Set custom timeout on the underlying REST client if possible
-                # The generated client typically uses default timeout or per-request
-            else:
-                self._api_client.configuration.access_token = new_token
-
-            if self._api_client:
-                # Ensure Authorization header is set as generated client might not pick it up automatically
-                self._api_client.default_headers["Authorization"] = f"Bearer {new_token}"
-
-            # Inject CSRF token if available
-            if self._csrf_token and self._api_client:
-                # Cookie for standard session checks
-                self._api_client.cookie = f"XSRF-TOKEN={self._csrf_token}"
-                # Header for CSRF protection
-                self._api_client.default_headers["X-XSRF-TOKEN"] = self._csrf_token
-
-            # Re-initialize controllers
-            self._test_case_api = TestCaseControllerApi(self._api_client)
-            self._shared_step_api = SharedStepControllerApi(self._api_client)
-            self._shared_step_attachment_api = SharedStepAttachmentControllerApi(self._api_client)
-            self._attachment_api = TestCaseAttachmentControllerApi(self._api_client)
-            self._scenario_api = TestCaseScenarioControllerApi(self._api_client)
-            self._shared_step_scenario_api = SharedStepScenarioControllerApi(self._api_client)
-            self._overview_api = TestCaseOverviewControllerApi(self._api_client)
-            self._search_api = TestCaseSearchControllerApi(self._api_client)
-            self._test_case_custom_field_api = TestCaseCustomFieldV2ControllerApi(self._api_client)
-            self._custom_field_api = CustomFieldControllerApi(self._api_client)
-            self._custom_field_project_api = CustomFieldProjectControllerApi(self._api_client)
-            self._custom_field_project_v2_api = CustomFieldProjectControllerV2Api(self._api_client)
-            self._custom_field_value_api = CustomFieldValueControllerApi(self._api_client)
-            self._custom_field_value_project_api = CustomFieldValueProjectControllerApi(self._api_client)
-            self._test_layer_api = TestLayerControllerApi(self._api_client)
-            self._test_layer_schema_api = TestLayerSchemaControllerApi(self._api_client)
-            self._launch_api = LaunchControllerApi(self._api_client)
-            self._launch_search_api = LaunchSearchControllerApi(self._api_client)
-            self._test_result_attachment_api = TestResultAttachmentControllerApi(self._api_client)
-            self._test_result_api = TestResultControllerApi(self._api_client)
-            self._test_result_bulk_api = TestResultBulkControllerApi(self._api_client)
-            self._test_result_fixture_api = TestResultFixtureControllerApi(self._api_client)
-            self._test_result_flat_api = TestResultFlatControllerApi(self._api_client)
-            self._test_result_rerun_api = TestResultRerunControllerApi(self._api_client)
-            self._test_result_run_api = TestResultRunControllerApi(self._api_client)
-            self._tree_api = TreeControllerV2Api(self._api_client)
-            self._test_case_tree_api = TestCaseTreeControllerV2Api(self._api_client)
-            self._test_case_tree_bulk_api = TestCaseTreeBulkControllerV2Api(self._api_client)
-            self._integration_api = IntegrationControllerApi(self._api_client)
-            self._project_api = ProjectControllerApi(self._api_client)
-            self._upload_api = UploadControllerApi(self._api_client)
-            self._upload_test_result_api = UploadTestResultControllerApi(self._api_client)
+        if self._token_is_stale():
+            async with self._session.lock:
+                # Another caller may have refreshed while we waited for the lock.
+                if self._token_is_stale():
+                    await self._refresh_session()
+        elif self._token_needs_renewal():
+            self._schedule_token_renewal()
+
+    def _token_is_stale(self) -> bool:
+        return self._token_expires_at is None or time.time() >= self._token_expires_at
+
+    def _token_needs_renewal(self) -> bool:
+        renew_at = self._session.token_renew_at
+        return renew_at is not None and time.time() >= renew_at
+
+    @staticmethod
+    def _renewal_lead(lifetime: float) -> float:
+        """Seconds before the refresh deadline at which background renewal starts."""
+        return max(0.0, min(TOKEN_RENEWAL_LEAD_SECONDS, lifetime / 2))
+
+    def _schedule_token_renewal(self, delay: float = 0.0, *, replace: bool = False) -> None:
+        """Renew the session token in the background after ``delay`` seconds.
+
+        Without ``replace`` the call is a no-op while another renewal is pending;
+        with it, a pending renewal timer is superseded by the new one.
+        """
+        session = self._session
+        pending = session.renewal_task
+        if pending is not None and not pending.done() and pending is not asyncio.current_task():
+            if not replace:
+                return
+            pending.cancel()
+        # A fresh context keeps the renewal from inheriting the deadline of the tool call that scheduled it.
+        session.renewal_task = asyncio.get_running_loop().create_task(
+            self._renew_token_in_background(delay), context=contextvars.Context()
+        )
+
+    async def _renew_token_in_background(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            async with self._session.lock:
+                if self._token_needs_renewal() or self._token_is_stale():
+                    await self._refresh_session()
+        except Exception as exc:
+            # Callers fall back to a blocking refresh once the token is stale;
+            # until then, back off instead of retrying on every request.
+            logger.warning("Background JWT renewal failed: %s", exc)
+            expires_at = self._token_expires_at
+            if expires_at is not None:
+                self._session.token_renew_at = min(time.time() + TOKEN_RENEWAL_RETRY_SECONDS, expires_at)
+
+    async def _obtain_jwt_token(self, *, use_cache: bool = True) -> str:
+        """Return a JWT from the installed token cache, or exchange a new one.
+
+        The cache is consulted only while the session holds no token yet, so
+        in-process renewals always perform a real exchange.
+        """
+        cache = get_token_cache()
+        if cache is None:
+            return await self._get_jwt_token()
+
+        if use_cache and self._jwt_token is None:
+            cached = cache.load(self._base_url, self._token)
+            if cached is not None and cached.expires_at - time.time() > TOKEN_CACHE_MIN_TTL_SECONDS:
+                self._jwt_token = cached.jwt_token
+                self._token_expires_at = cached.expires_at
+                self._csrf_token = cached.csrf_token
+                # The remaining lifetime is unknown; refresh once it runs out.
+                self._session.token_renew_at = None
+                return cached.jwt_token
+
+        access_token = await self._get_jwt_token()
+        if self._token_expires_at is not None:
+            cache.store(
+                self._base_url,
+                self._token,
+                CachedToken(jwt_token=access_token, expires_at=self._token_expires_at, csrf_token=self._csrf_token),
+            )
+        return access_token
+
+    async def _reauthenticate(self, rejected_token: str | None) -> str | None:
+        """Replace a JWT the server rejected with 401 and return the new one."""
+        async with self._session.lock:
+            if rejected_token is not None and rejected_token != self._jwt_token:
+                # Another request already replaced the rejected token.
+                return self._jwt_token
+            logger.info("JWT rejected by %s; exchanging the API token again", self._base_url)
+            cache = get_token_cache()
+            if cache is not None:
+                cache.discard(self._base_url, self._token)
+            self._token_expires_at = None
+            await self._refresh_session(use_cache=False)
+            return self._jwt_token
+
+    async def _refresh_session(self, *, use_cache: bool = True) -> None:
+        """Obtain a JWT and apply it to the session's ApiClient.
+
+        Controllers hold a reference to the ApiClient, so a refresh only swaps
+        the Authorization (and CSRF) headers; they are built once per ApiClient.
+        """
+        new_token = await self._obtain_jwt_token(use_cache=use_cache)
+
+        # Initialize or update ApiClient
+        created = self._api_client is None
+        if self._api_client is None:
+            config = Configuration(host=self._base_url, access_token=new_token, retries=3)
+            self._api_client = FastApiClient(configuration=config, fast_deserialization=self._fast_deserialization)
+            self._api_client.rest_client = AllureRESTClient(
+                config,
+                transport=self._transport,
+                on_unauthorized=self._reauthenticate,
+                cache_scope=self.get_auth_scope(),
+            )
+        else:
+            self._api_client.configuration.access_token = new_token
+
+        if self._api_client:
+            # Ensure Authorization header is set as generated client might not pick it up automatically
+            self._api_client.default_headers["Authorization"] = f"Bearer {new_token}"
+
+        # Inject CSRF token if available
+        if self._csrf_token and self._api_client:
+            # Cookie for standard session checks
+            self._api_client.cookie = f"XSRF-TOKEN={self._csrf_token}"
+            # Header for CSRF protection
+            self._api_client.default_headers["X-XSRF-TOKEN"] = self._csrf_token
+
+        if created:
+            self._init_controllers()
+
+        # Long-lived pooled sessions renew ahead of expiry on a timer.
+        renew_at = self._session.token_renew_at
+        if self._session.pooled and renew_at is not None:
+            self._schedule_token_renewal(max(renew_at - time.time(), 0.0), replace=True)
+
+    def _init_controllers(self) -> None:
+        """Forget controllers bound to a previous ApiClient; they are recreated on first use."""
+        for name, attribute in vars(AllureClient).items():
+            if isinstance(attribute, _LazyController):
+                self.__dict__.pop(name, None)
 
     @property
     def api_client(self) -> ApiClient:
@@ -591,24 +901,50 @@ class AllureClient:
         """Initialize the client session within an async context.
 
         Performs token exchange and prepares all generated API controllers.
+        When a process-wide ``AllureSessionPool`` is active, the client attaches
+        to the pooled session for its endpoint and token instead, reusing its
+        JWT and warm connections.
 
         Returns:
             Self (authenticated and ready to use).
         """
-        await self._ensure_valid_token()
-        if self._api_client:
+        pool = get_session_pool()
+        if pool is not None:
+            self._session = await pool.acquire(self._base_url, self._token)
+            self._session_pool = pool
+        try:
+            await self._ensure_valid_token()
+        except BaseException:
+            await self._release_session()
+            raise
+        if self._session.pooled:
+            # The pooled session may already be authenticated by another client.
+            self._init_controllers()
+        elif self._api_client:
             # Generate client's __aenter__ is untyped
             await self._api_client.__aenter__()  # type: ignore[no-untyped-call]
         self._is_entered = True
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        """Cleanly close the client session and underlying HTTP transport."""
+        """Cleanly close the client session and underlying HTTP transport.
+
+        Pooled sessions stay open for the next client; only the lease is returned.
+        """
         self._is_entered = False
+        if self._session.pooled:
+            await self._release_session()
+            return
+        self._session.cancel_renewal()
         if self._api_client:
             # Generated client's __aexit__ is untyped
             await self._api_client.__aexit__(*args)  # type: ignore[no-untyped-call]
 
+    async def _release_session(self) -> None:
+        pool, self._session_pool = self._session_pool, None
+        if pool is not None:
+            await pool.release(self._session)
+
     def _handle_api_exception(self, e: ApiException) -> None:
         """Map generated client exceptions to lucius-mcp custom exceptions.
 
@@ -801,18 +1137,36 @@ class AllureClient:
         return cast(ApiType, api)
 
     async def _call_api(self, coro: Awaitable[T]) -> T:
+        started_at = time.perf_counter()
+        status: int | None = None
+        UPSTREAM_REQUESTS_IN_FLIGHT.inc()
         try:
-            return await coro
+            result = await _await_within_deadline(coro)
+            status = 200
+            return result
         except ApiException as e:
+            status = e.status
             self._handle_api_exception(e)
             raise
+        finally:
+            UPSTREAM_REQUESTS_IN_FLIGHT.dec()
+            observe_upstream_request(_operation_name(coro), status, time.perf_counter() - started_at)
 
     async def _call_api_raw(self, coro: Awaitable[httpx.Response | RESTResponse]) -> httpx.Response | RESTResponse:
+        started_at = time.perf_counter()
+        status: int | None = None
+        UPSTREAM_REQUESTS_IN_FLIGHT.inc()
         try:
-            return await coro
+            response = await _await_within_deadline(coro)
+            status = getattr(self._unwrap_http_response(response), "status_code", None)
+            return response
         except ApiException as e:
+            status = e.status
             self._handle_api_exception(e)
             raise
+        finally:
+            UPSTREAM_REQUESTS_IN_FLIGHT.dec()
+            observe_upstream_request(_operation_name(coro), status, time.perf_counter() - started_at)
 
     @staticmethod
     def _extract_response_data(response: httpx.Response | RESTResponse) -> dict[str, object]:
@@ -1056,6 +1410,76 @@ class AllureClient:
             raise AllureAPIError("Invalid response from scenario step creation")
         return result
 
+    async def _write_scenario_via_api(
+        self,
+        resource_path: str,
+        entity_id: int,
+        steps: list[SharedStepScenarioDtoStepsInner],
+    ) -> list[int]:
+        if self._api_client is None:
+            raise AllureAPIError("Client not initialized. Use 'async with AllureClient(...)'")
+
+        request_args = self._api_client.param_serialize(
+            method="POST",
+            resource_path=resource_path,
+            path_params={"id": entity_id},
+            header_params={"Content-Type": "application/json"},
+            body={"steps": [payload for step in steps if (payload := self._scenario_step_payload(step)) is not None]},
+            auth_settings=[],
+        )
+        call_coro = self._api_client.call_api(
+            *request_args,
+            _request_timeout=self._timeout,
+        )
+        response = await self._call_api_raw(cast(Awaitable[httpx.Response], call_coro))
+        return self._scenario_step_ids(self._extract_response_data(response))
+
+    @staticmethod
+    def _scenario_step_payload(step: SharedStepScenarioDtoStepsInner) -> dict[str, object] | None:
+        """Serialize a scenario step tree for a scenario write.
+
+        The generated ``to_dict`` does not unwrap the oneOf children of nested steps,
+        and the read-side ``id``/``name`` extensions are not part of the write model.
+
+        Raises:
+            AllureValidationError: If a step carries an expected result, which scenario
+                writes cannot encode.
+        """
+        instance = step.actual_instance
+        if instance is None:
+            return None
+        if getattr(instance, "expected_result", None):
+            raise AllureValidationError("Scenario writes cannot carry expected results; create such steps one by one")
+        payload: dict[str, object] = instance.model_dump(
+            by_alias=True, exclude_none=True, exclude={"id", "name", "steps"}
+        )
+        children = getattr(instance, "steps", None)
+        if children:
+            payload["steps"] = [
+                child_payload
+                for child in children
+                if (child_payload := AllureClient._scenario_step_payload(child)) is not None
+            ]
+        return payload
+
+    @staticmethod
+    def _scenario_step_ids(raw: dict[str, object]) -> list[int]:
+        """Step IDs of a raw NormalizedScenarioDto, depth-first in scenario order."""
+        root = raw.get("root")
+        scenario_steps = raw.get("scenarioSteps")
+        if not isinstance(root, dict) or not isinstance(scenario_steps, dict):
+            return []
+
+        step_ids: list[int] = []
+        pending = list(reversed(root.get("children") or []))
+        while pending:
+            step_id = pending.pop()
+            step_ids.append(step_id)
+            step_def = scenario_steps.get(str(step_id))
+            if isinstance(step_def, dict):
+                pending.extend(reversed(step_def.get("children") or []))
+        return step_ids
+
     @overload
     async def _upload_attachment_via_api(
         self,
@@ -1169,6 +1593,7 @@ class AllureClient:
         search: str | None = None,
         tags: list[str] | None = None,
         status: str | None = None,
+        sort: list[str] | None = None,
     ) -> PageTestCaseDto:
         """List test cases for a project.
 
@@ -1179,6 +1604,7 @@ class AllureClient:
             search: Optional name/description search.
             tags: Optional list of tags to filter (AQL syntax).
             status: Optional status filter for AQL query.
+            sort: Optional sort criteria (e.g., ["lastModifiedDate,DESC"]).
 
         Returns:
             Paginated test cases for the project.
@@ -1207,6 +1633,7 @@ class AllureClient:
                 rql=rql,
                 page=page,
                 size=size,
+                sort=sort,
                 _request_timeout=self._timeout,
             )
         )
@@ -1447,6 +1874,8 @@ class AllureClient:
             if exc.status_code == 403:
                 return None
             raise
+        except AllureDeadlineExceededError:
+            raise
         except AllureAPIError as exc:
             raise AllureAPIError(
                 f"Unable to enrich launch detail from {endpoint} endpoint: {exc}",
@@ -1716,16 +2145,17 @@ class AllureClient:
         if not isinstance(attachment_id, int) or attachment_id <= 0:
             raise AllureValidationError("Attachment ID must be a positive integer")
 
-        response = await self._call_api_raw(
-            cast(
-                Awaitable[httpx.Response],
-                api.read_content_without_preload_content(
-                    id=attachment_id,
-                    inline=inline,
-                    _request_timeout=self._timeout,
-                ),
+        with use_transfer_timeouts():
+            response = await self._call_api_raw(
+                cast(
+                    Awaitable[httpx.Response],
+                    api.read_content_without_preload_content(
+                        id=attachment_id,
+                        inline=inline,
+                        _request_timeout=self._timeout,
+                    ),
+                )
             )
-        )
         http_response = self._unwrap_http_response(response)
         if not 200 <= http_response.status_code <= 299:
             raise ApiException(
@@ -1983,7 +2413,7 @@ class AllureClient:
                     accept_header="*/*",
                 )
             except AllureAPIError as exc:
-                if exc.status_code is None:
+                if exc.status_code is None or isinstance(exc, AllureDeadlineExceededError):
                     raise
                 last_error = ApiException(
                     status=exc.status_code,
@@ -2293,6 +2723,32 @@ class AllureClient:
             with_expected_result=with_expected_result,
         )
 
+    async def set_test_case_scenario(
+        self,
+        test_case_id: int,
+        steps: list[SharedStepScenarioDtoStepsInner],
+    ) -> list[int]:
+        """Replace the whole scenario of a test case in a single request.
+
+        Nested steps, expected results, attachment steps and shared step references
+        are all sent in one tree, instead of one ``create_scenario_step`` call each.
+
+        Args:
+            test_case_id: The ID of the test case.
+            steps: Top-level scenario steps; body steps may carry child ``steps`` but not ``expected_result``.
+
+        Returns:
+            The IDs TestOps assigned to the written steps, depth-first in scenario order.
+
+        Raises:
+            AllureNotFoundError: If test case doesn't exist.
+            AllureValidationError: If input data fails validation.
+            AllureAuthError: If unauthorized.
+            AllureAPIError: If the server returns an error.
+        """
+        await self._get_api("_scenario_api")
+        return await self._write_scenario_via_api("/api/testcase/{id}/scenario", test_case_id, steps)
+
     async def list_custom_field_values(
         self,
         project_id: int,
@@ -2457,7 +2913,10 @@ class AllureClient:
 
         This method uses CustomFieldProjectControllerV2Api to find all custom fields
         associated with the project and then fetches their allowed values using
-        CustomFieldValueProjectControllerApi.
+        CustomFieldValueProjectControllerApi. Both listings are read page by page;
+        values are fetched for up to ``CUSTOM_FIELD_VALUE_CONCURRENCY`` fields at once.
+        A field whose values cannot be fetched is returned with ``values`` set to None,
+        so callers can tell it apart from a field that has no values.
 
         Args:
             project_id: Target project ID.
@@ -2477,34 +2936,46 @@ class AllureClient:
         val_api = await self._get_api("_custom_field_value_project_api")
 
         # 1. Get all custom fields for project
-        page = await self._call_api(v2_api.find_by_project1(project_id=project_id))
+        async def _fetch_fields(page: int) -> PageCustomFieldProjectDto:
+            return await self._call_api(
+                v2_api.find_by_project1(project_id=project_id, page=page, size=CUSTOM_FIELD_PAGE_SIZE)
+            )
 
-        results: list[CustomFieldProjectWithValuesDto] = []
+        project_fields = [
+            (cf_proj, cf_proj.custom_field.id, cf_proj.custom_field.name)
+            async for cf_proj in iter_page_items(_fetch_fields, lambda page: page.content)
+            if cf_proj.custom_field and cf_proj.custom_field.id is not None
+        ]
 
-        for cf_proj in page.content or []:
-            if not cf_proj.custom_field or cf_proj.custom_field.id is None:
-                continue
+        # 2. Get values for each field, a bounded number of fields at a time
+        semaphore = asyncio.Semaphore(CUSTOM_FIELD_VALUE_CONCURRENCY)
 
-            # 2. Get values for each field
-            try:
-                values_page = await self._call_api(
-                    val_api.find_all22(project_id=project_id, custom_field_id=cf_proj.custom_field.id)
+        async def _with_values(
+            cf_proj: CustomFieldProjectDto, field_id: int, field_name: str | None
+        ) -> CustomFieldProjectWithValuesDto:
+            async def _fetch_values(page: int) -> PageCustomFieldValueWithTcCountDto:
+                return await self._call_api(
+                    val_api.find_all22(
+                        project_id=project_id, custom_field_id=field_id, page=page, size=CUSTOM_FIELD_PAGE_SIZE
+                    )
                 )
 
-                allowed_values = [CustomFieldValueDto(id=v.id, name=v.name) for v in values_page.content or []]
+            async with semaphore:
+                try:
+                    allowed_values = [
+                        CustomFieldValueDto(id=v.id, name=v.name)
+                        async for v in iter_page_items(_fetch_values, lambda page: page.content)
+                    ]
+                except AllureDeadlineExceededError:
+                    raise
+                except AllureAPIError as e:
+                    # If fetching values fails for one field, log and continue
+                    logger.warning(f"Failed to fetch values for custom field {field_name}: {e}")
+                    return CustomFieldProjectWithValuesDto(custom_field=cf_proj, values=None)
 
-                results.append(
-                    CustomFieldProjectWithValuesDto(
-                        custom_field=cf_proj,  # Wait, CustomFieldProjectWithValuesDto expect CustomFieldProjectDto
-                        values=allowed_values,
-                    )
-                )
-            except AllureAPIError as e:
-                # If fetching values fails for one field, log and continue
-                logger.warning(f"Failed to fetch values for custom field {cf_proj.custom_field.name}: {e}")
-                results.append(CustomFieldProjectWithValuesDto(custom_field=cf_proj, values=[]))
+            return CustomFieldProjectWithValuesDto(custom_field=cf_proj, values=allowed_values)
 
-        return results
+        return list(await asyncio.gather(*(_with_values(*field) for field in project_fields)))
 
     async def get_test_case_custom_fields(
         self,
@@ -2594,7 +3065,7 @@ class AllureClient:
 
             # Fetch custom fields from overview
             try:
-                overview = await self._overview_api.get_overview(
+                overview = await cast("TestCaseOverviewControllerApi", self._overview_api).get_overview(
                     test_case_id=test_case_id, _request_timeout=self._timeout
                 )
                 if overview.custom_fields:
@@ -3269,6 +3740,23 @@ class AllureClient:
 
         return await self._create_scenario_step_via_api(shared_step_scenario_api, step)
 
+    async def set_shared_step_scenario(
+        self,
+        shared_step_id: int,
+        steps: list[SharedStepScenarioDtoStepsInner],
+    ) -> list[int]:
+        """Replace the whole scenario of a shared step in a single request.
+
+        Args:
+            shared_step_id: The ID of the shared step.
+            steps: Top-level scenario steps; body steps may carry child ``steps`` but not ``expected_result``.
+
+        Returns:
+            The IDs TestOps assigned to the written steps, depth-first in scenario order.
+        """
+        await self._get_api("_shared_step_scenario_api")
+        return await self._write_scenario_via_api("/api/sharedstep/{id}/scenario", shared_step_id, steps)
+
     async def patch_test_case_scenario_step(
         self,
         step_id: int,
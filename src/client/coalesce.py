@@ -0,0 +1,105 @@
+"""Single-flight coalescing of identical in-flight GET requests.
+
+When several coroutines (or several MCP sessions sharing a process) ask for the
+same resource at the same time, only the first request goes upstream; the
+others await the same task and each receive their own copy of the response.
+
+The shared task outlives any single waiter: a cancelled waiter only detaches
+itself, and the upstream request is cancelled once nobody is waiting for it
+anymore. Errors raised by the upstream request are re-raised in every waiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+type CoalesceKey = tuple[int, str, str, str]
+
+
+@dataclass
+class _InFlight:
+    task: asyncio.Task[httpx.Response]
+    waiters: int = 0
+
+
+def copy_response(response: httpx.Response) -> httpx.Response:
+    """Return an independent copy of a fully read response."""
+    return httpx.Response(
+        response.status_code,
+        headers=response.headers,
+        content=response.content,
+        request=response.request,
+        extensions=response.extensions,
+    )
+
+
+class RequestCoalescer:
+    """Share one upstream request between concurrent identical callers."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[CoalesceKey, _InFlight] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(
+        self,
+        scope: str,
+        method: str,
+        url: str,
+        fetch: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Await ``fetch`` or join an identical request that is already in flight.
+
+        ``fetch`` must return a response whose body has been read. Every caller
+        gets its own copy, so one caller closing or consuming its response does
+        not affect the others.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks are bound to their loop, so never join a request started on another one.
+        key = (id(loop), scope, method, url)
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _InFlight(task=loop.create_task(self._fetch(fetch)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda task: self._forget(key, task))
+
+        flight.waiters += 1
+        try:
+            response = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                # Last waiter gone: stop the upstream request and let new callers start afresh.
+                flight.task.cancel()
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            raise
+        finally:
+            flight.waiters -= 1
+        return copy_response(response)
+
+    @staticmethod
+    async def _fetch(fetch: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        response = await fetch()
+        await response.aread()
+        return response
+
+    def _forget(self, key: CoalesceKey, task: asyncio.Task[httpx.Response]) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        # Retrieve the exception so an upstream error nobody awaited is not logged as unhandled.
+        if not task.cancelled():
+            task.exception()
+
+
+_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Return the process-wide request coalescer."""
+    return _coalescer
@@ -0,0 +1,115 @@
+"""Opt-in fast deserialization of Allure TestOps responses.
+
+The generated ``ApiClient`` decodes with the stdlib ``json`` module and builds
+models through ``from_dict``, which walks every nested DTO in Python and calls
+``model_validate`` once per item. For read-only list pages (``Page*Dto``
+responses of up to hundreds of test results, test cases, or launches) that
+per-item overhead dominates CPU time.
+
+``FastApiClient`` keeps the generated behaviour by default. With fast mode
+enabled it decodes JSON with ``orjson`` when installed and validates a
+``Page*Dto`` in a single ``model_validate`` pass, so pydantic-core handles the
+nested items without Python round-trips. The result is validated exactly as
+strictly as before. Pages containing oneOf/discriminated models, which need
+their generated ``from_dict``, and every other response type still take the
+generated path.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import re
+from collections.abc import Callable
+from functools import cache
+from typing import Any, get_args
+
+from pydantic import BaseModel
+
+import src.client.generated.models as generated_models
+
+from .generated.api_client import ApiClient
+from .generated.configuration import Configuration
+
+_JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+_PAGE_RESPONSE_TYPE = re.compile(r"^Page[A-Z]\w*Dto$")
+
+
+def orjson_available() -> bool:
+    """Return whether the ``orjson`` package of the ``fast`` extra is installed."""
+    return importlib.util.find_spec("orjson") is not None
+
+
+def _load_json_parser() -> Callable[[str], Any]:
+    if not orjson_available():
+        return json.loads
+    loads: Callable[[str], Any] = importlib.import_module("orjson").loads
+    return loads
+
+
+fast_json_loads = _load_json_parser()
+
+
+@cache
+def single_pass_model(response_type: str) -> type[BaseModel] | None:
+    """Return the model for a list page that can be validated in one pass, if ``response_type`` is one."""
+    if _PAGE_RESPONSE_TYPE.match(response_type) is None:
+        return None
+    model = getattr(generated_models, response_type, None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return None
+    return model if _validates_natively(model, set()) else None
+
+
+def _validates_natively(model: type[BaseModel], seen: set[type[BaseModel]]) -> bool:
+    """Return whether ``model_validate`` on ``model`` matches its generated ``from_dict`` throughout the tree."""
+    if model in seen:
+        return True
+    seen.add(model)
+    decorators = model.__pydantic_decorators__
+    if (
+        "actual_instance" in model.model_fields
+        or "additional_properties" in model.model_fields
+        or hasattr(model, "get_discriminator_value")
+        or decorators.field_validators
+        or decorators.model_validators
+    ):
+        return False
+    return all(
+        _validates_natively(nested, seen)
+        for info in model.model_fields.values()
+        for nested in _nested_models(info.annotation)
+    )
+
+
+def _nested_models(annotation: Any) -> list[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model for arg in get_args(annotation) for model in _nested_models(arg)]
+
+
+class FastApiClient(ApiClient):
+    """Generated ``ApiClient`` with an opt-in fast path for list pages."""
+
+    def __init__(self, configuration: Configuration | None = None, *, fast_deserialization: bool = False) -> None:
+        super().__init__(configuration=configuration)
+        self.fast_deserialization = fast_deserialization
+
+    def deserialize(self, response_text: str, response_type: str, content_type: str | None) -> Any:
+        if not self.fast_deserialization or (content_type is not None and not _JSON_CONTENT_TYPE.match(content_type)):
+            return super().deserialize(response_text, response_type, content_type)
+
+        if response_text == "" and content_type is not None:
+            data: Any = ""
+        else:
+            try:
+                data = fast_json_loads(response_text)
+            except ValueError:
+                if content_type is not None:
+                    raise
+                data = response_text
+
+        model = single_pass_model(response_type) if isinstance(data, dict) else None
+        if model is not None:
+            return model.model_validate(data)
+        return self._ApiClient__deserialize(data, response_type)  # type: ignore[attr-defined]
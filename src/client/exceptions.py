@@ -72,10 +72,25 @@ class AllureRateLimitError(AllureClientError):
     """Rate limit exceeded (429)."""
 
 
+class AllureDeadlineExceededError(AllureClientError):
+    """The tool call's time budget ran out before an Allure TestOps request completed."""
+
+    def __init__(self, message: str = "Tool deadline exceeded while waiting for Allure TestOps") -> None:
+        super().__init__(
+            message,
+            status_code=504,
+            suggestions=[
+                "Narrow the request with filters or a smaller page size",
+                "Pass a larger deadline_seconds where the tool accepts one, or raise TOOL_DEADLINE_SECONDS",
+            ],
+        )
+
+
 __all__ = [
     "AllureAPIError",
     "AllureAuthError",
     "AllureClientError",
+    "AllureDeadlineExceededError",
     "AllureNotFoundError",
     "AllureRateLimitError",
     "AllureValidationError",
@@ -755,744 +755,1496 @@ __all__ = [
     "WorkflowSchemaPatchDto",
 ]
 
-# import apis into sdk package
-from src.client.generated.api.custom_field_controller_api import CustomFieldControllerApi as CustomFieldControllerApi
-from src.client.generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi as CustomFieldProjectControllerApi
-from src.client.generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api as CustomFieldProjectControllerV2Api
-from src.client.generated.api.custom_field_schema_controller_api import CustomFieldSchemaControllerApi as CustomFieldSchemaControllerApi
-from src.client.generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi as CustomFieldValueControllerApi
-from src.client.generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi as CustomFieldValueProjectControllerApi
-from src.client.generated.api.defect_controller_api import DefectControllerApi as DefectControllerApi
-from src.client.generated.api.defect_matcher_controller_api import DefectMatcherControllerApi as DefectMatcherControllerApi
-from src.client.generated.api.ide_controller_api import IdeControllerApi as IdeControllerApi
-from src.client.generated.api.integration_controller_api import IntegrationControllerApi as IntegrationControllerApi
-from src.client.generated.api.launch_controller_api import LaunchControllerApi as LaunchControllerApi
-from src.client.generated.api.launch_search_controller_api import LaunchSearchControllerApi as LaunchSearchControllerApi
-from src.client.generated.api.project_controller_api import ProjectControllerApi as ProjectControllerApi
-from src.client.generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi as SharedStepAttachmentControllerApi
-from src.client.generated.api.shared_step_controller_api import SharedStepControllerApi as SharedStepControllerApi
-from src.client.generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi as SharedStepScenarioControllerApi
-from src.client.generated.api.status_controller_api import StatusControllerApi as StatusControllerApi
-from src.client.generated.api.test_case_attachment_controller_api import TestCaseAttachmentControllerApi as TestCaseAttachmentControllerApi
-from src.client.generated.api.test_case_bulk_controller_api import TestCaseBulkControllerApi as TestCaseBulkControllerApi
-from src.client.generated.api.test_case_controller_api import TestCaseControllerApi as TestCaseControllerApi
-from src.client.generated.api.test_case_custom_field_controller_api import TestCaseCustomFieldControllerApi as TestCaseCustomFieldControllerApi
-from src.client.generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi as TestCaseOverviewControllerApi
-from src.client.generated.api.test_case_scenario_controller_api import TestCaseScenarioControllerApi as TestCaseScenarioControllerApi
-from src.client.generated.api.test_case_search_controller_api import TestCaseSearchControllerApi as TestCaseSearchControllerApi
-from src.client.generated.api.test_case_tag_controller_api import TestCaseTagControllerApi as TestCaseTagControllerApi
-from src.client.generated.api.test_case_test_plan_bulk_controller_api import TestCaseTestPlanBulkControllerApi as TestCaseTestPlanBulkControllerApi
-from src.client.generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api as TestCaseTreeBulkControllerV2Api
-from src.client.generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api as TestCaseTreeControllerV2Api
-from src.client.generated.api.test_layer_controller_api import TestLayerControllerApi as TestLayerControllerApi
-from src.client.generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi as TestLayerSchemaControllerApi
-from src.client.generated.api.test_plan_controller_api import TestPlanControllerApi as TestPlanControllerApi
-from src.client.generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi as TestResultAttachmentControllerApi
-from src.client.generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi as TestResultBulkControllerApi
-from src.client.generated.api.test_result_controller_api import TestResultControllerApi as TestResultControllerApi
-from src.client.generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi as TestResultFixtureControllerApi
-from src.client.generated.api.test_result_flat_controller_api import TestResultFlatControllerApi as TestResultFlatControllerApi
-from src.client.generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi as TestResultRerunControllerApi
-from src.client.generated.api.test_result_run_controller_api import TestResultRunControllerApi as TestResultRunControllerApi
-from src.client.generated.api.tree_controller_v2_api import TreeControllerV2Api as TreeControllerV2Api
-from src.client.generated.api.upload_controller_api import UploadControllerApi as UploadControllerApi
-from src.client.generated.api.upload_test_result_controller_api import UploadTestResultControllerApi as UploadTestResultControllerApi
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Names are imported on first access; see scripts/lazify_generated_client.py.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CustomFieldControllerApi": "src.client.generated.api.custom_field_controller_api",
+    "CustomFieldProjectControllerApi": "src.client.generated.api.custom_field_project_controller_api",
+    "CustomFieldProjectControllerV2Api": "src.client.generated.api.custom_field_project_controller_v2_api",
+    "CustomFieldSchemaControllerApi": "src.client.generated.api.custom_field_schema_controller_api",
+    "CustomFieldValueControllerApi": "src.client.generated.api.custom_field_value_controller_api",
+    "CustomFieldValueProjectControllerApi": "src.client.generated.api.custom_field_value_project_controller_api",
+    "DefectControllerApi": "src.client.generated.api.defect_controller_api",
+    "DefectMatcherControllerApi": "src.client.generated.api.defect_matcher_controller_api",
+    "IdeControllerApi": "src.client.generated.api.ide_controller_api",
+    "IntegrationControllerApi": "src.client.generated.api.integration_controller_api",
+    "LaunchControllerApi": "src.client.generated.api.launch_controller_api",
+    "LaunchSearchControllerApi": "src.client.generated.api.launch_search_controller_api",
+    "ProjectControllerApi": "src.client.generated.api.project_controller_api",
+    "SharedStepAttachmentControllerApi": "src.client.generated.api.shared_step_attachment_controller_api",
+    "SharedStepControllerApi": "src.client.generated.api.shared_step_controller_api",
+    "SharedStepScenarioControllerApi": "src.client.generated.api.shared_step_scenario_controller_api",
+    "StatusControllerApi": "src.client.generated.api.status_controller_api",
+    "TestCaseAttachmentControllerApi": "src.client.generated.api.test_case_attachment_controller_api",
+    "TestCaseBulkControllerApi": "src.client.generated.api.test_case_bulk_controller_api",
+    "TestCaseControllerApi": "src.client.generated.api.test_case_controller_api",
+    "TestCaseCustomFieldControllerApi": "src.client.generated.api.test_case_custom_field_controller_api",
+    "TestCaseOverviewControllerApi": "src.client.generated.api.test_case_overview_controller_api",
+    "TestCaseScenarioControllerApi": "src.client.generated.api.test_case_scenario_controller_api",
+    "TestCaseSearchControllerApi": "src.client.generated.api.test_case_search_controller_api",
+    "TestCaseTagControllerApi": "src.client.generated.api.test_case_tag_controller_api",
+    "TestCaseTestPlanBulkControllerApi": "src.client.generated.api.test_case_test_plan_bulk_controller_api",
+    "TestCaseTreeBulkControllerV2Api": "src.client.generated.api.test_case_tree_bulk_controller_v2_api",
+    "TestCaseTreeControllerV2Api": "src.client.generated.api.test_case_tree_controller_v2_api",
+    "TestLayerControllerApi": "src.client.generated.api.test_layer_controller_api",
+    "TestLayerSchemaControllerApi": "src.client.generated.api.test_layer_schema_controller_api",
+    "TestPlanControllerApi": "src.client.generated.api.test_plan_controller_api",
+    "TestResultAttachmentControllerApi": "src.client.generated.api.test_result_attachment_controller_api",
+    "TestResultBulkControllerApi": "src.client.generated.api.test_result_bulk_controller_api",
+    "TestResultControllerApi": "src.client.generated.api.test_result_controller_api",
+    "TestResultFixtureControllerApi": "src.client.generated.api.test_result_fixture_controller_api",
+    "TestResultFlatControllerApi": "src.client.generated.api.test_result_flat_controller_api",
+    "TestResultRerunControllerApi": "src.client.generated.api.test_result_rerun_controller_api",
+    "TestResultRunControllerApi": "src.client.generated.api.test_result_run_controller_api",
+    "TreeControllerV2Api": "src.client.generated.api.tree_controller_v2_api",
+    "UploadControllerApi": "src.client.generated.api.upload_controller_api",
+    "UploadTestResultControllerApi": "src.client.generated.api.upload_test_result_controller_api",
+    "ApiResponse": "src.client.generated.api_response",
+    "ApiClient": "src.client.generated.api_client",
+    "Configuration": "src.client.generated.configuration",
+    "OpenApiException": "src.client.generated.exceptions",
+    "ApiTypeError": "src.client.generated.exceptions",
+    "ApiValueError": "src.client.generated.exceptions",
+    "ApiKeyError": "src.client.generated.exceptions",
+    "ApiAttributeError": "src.client.generated.exceptions",
+    "ApiException": "src.client.generated.exceptions",
+    "AccessGroupBulkDto": "src.client.generated.models.access_group_bulk_dto",
+    "AccessGroupCreateDto": "src.client.generated.models.access_group_create_dto",
+    "AccessGroupDto": "src.client.generated.models.access_group_dto",
+    "AccessGroupPaDto": "src.client.generated.models.access_group_pa_dto",
+    "AccessGroupPatchDto": "src.client.generated.models.access_group_patch_dto",
+    "AccessGroupProjectAccessDto": "src.client.generated.models.access_group_project_access_dto",
+    "AccessGroupProjectsAddDto": "src.client.generated.models.access_group_projects_add_dto",
+    "AccessGroupUserDto": "src.client.generated.models.access_group_user_dto",
+    "AccessGroupUsersAddDto": "src.client.generated.models.access_group_users_add_dto",
+    "AllowedRoleDto": "src.client.generated.models.allowed_role_dto",
+    "AnalyticAutomationTrendDto": "src.client.generated.models.analytic_automation_trend_dto",
+    "AnalyticDto": "src.client.generated.models.analytic_dto",
+    "AnalyticInterval": "src.client.generated.models.analytic_interval",
+    "AnalyticLaunchDurationHistogramDto": "src.client.generated.models.analytic_launch_duration_histogram_dto",
+    "AnalyticMuteTrendDto": "src.client.generated.models.analytic_mute_trend_dto",
+    "AnalyticTcAutomationCountDto": "src.client.generated.models.analytic_tc_automation_count_dto",
+    "AnalyticTcStatusCountDto": "src.client.generated.models.analytic_tc_status_count_dto",
+    "AnalyticTrByStatusTrendDto": "src.client.generated.models.analytic_tr_by_status_trend_dto",
+    "AqlValidateResponseDto": "src.client.generated.models.aql_validate_response_dto",
+    "AssignRequestDto": "src.client.generated.models.assign_request_dto",
+    "AsyncJobDto": "src.client.generated.models.async_job_dto",
+    "AsyncJobStatusDto": "src.client.generated.models.async_job_status_dto",
+    "AsyncJobStepDto": "src.client.generated.models.async_job_step_dto",
+    "AsyncJobStepStatusDto": "src.client.generated.models.async_job_step_status_dto",
+    "AsyncJobWithStepsDto": "src.client.generated.models.async_job_with_steps_dto",
+    "AttachmentRow": "src.client.generated.models.attachment_row",
+    "AttachmentStepDto": "src.client.generated.models.attachment_step_dto",
+    "Attrs": "src.client.generated.models.attrs",
+    "AuditActionTypeDto": "src.client.generated.models.audit_action_type_dto",
+    "BlobStorageStats": "src.client.generated.models.blob_storage_stats",
+    "BlobStorageUpdateStats": "src.client.generated.models.blob_storage_update_stats",
+    "BodyStepDto": "src.client.generated.models.body_step_dto",
+    "BoldMark": "src.client.generated.models.bold_mark",
+    "BusinessMetricDto": "src.client.generated.models.business_metric_dto",
+    "CategoryCreateDto": "src.client.generated.models.category_create_dto",
+    "CategoryDto": "src.client.generated.models.category_dto",
+    "CategoryMatcherCreateDto": "src.client.generated.models.category_matcher_create_dto",
+    "CategoryMatcherDto": "src.client.generated.models.category_matcher_dto",
+    "CategoryMatcherPatchDto": "src.client.generated.models.category_matcher_patch_dto",
+    "CategoryPatchDto": "src.client.generated.models.category_patch_dto",
+    "CfvMergeToExistingGlobalValueDto": "src.client.generated.models.cfv_merge_to_existing_global_value_dto",
+    "CfvMergeToNewGlobalValueDto": "src.client.generated.models.cfv_merge_to_new_global_value_dto",
+    "Ci": "src.client.generated.models.ci",
+    "CleanerSchemaCreateDto": "src.client.generated.models.cleaner_schema_create_dto",
+    "CleanerSchemaDto": "src.client.generated.models.cleaner_schema_dto",
+    "CleanerSchemaPatchDto": "src.client.generated.models.cleaner_schema_patch_dto",
+    "CleanerSchemaTargetDto": "src.client.generated.models.cleaner_schema_target_dto",
+    "CodeBlockDocumentNode": "src.client.generated.models.code_block_document_node",
+    "CodeMark": "src.client.generated.models.code_mark",
+    "CommentCreateDto": "src.client.generated.models.comment_create_dto",
+    "CommentDto": "src.client.generated.models.comment_dto",
+    "CommentPatchDto": "src.client.generated.models.comment_patch_dto",
+    "CreateLaunchEvent": "src.client.generated.models.create_launch_event",
+    "CsvImportOptions": "src.client.generated.models.csv_import_options",
+    "CustomFieldBulkAddToProjectsDto": "src.client.generated.models.custom_field_bulk_add_to_projects_dto",
+    "CustomFieldBulkArchiveDto": "src.client.generated.models.custom_field_bulk_archive_dto",
+    "CustomFieldCreateDto": "src.client.generated.models.custom_field_create_dto",
+    "CustomFieldDto": "src.client.generated.models.custom_field_dto",
+    "CustomFieldExportFieldMapping": "src.client.generated.models.custom_field_export_field_mapping",
+    "CustomFieldImportFieldMapping": "src.client.generated.models.custom_field_import_field_mapping",
+    "CustomFieldMergeDto": "src.client.generated.models.custom_field_merge_dto",
+    "CustomFieldPatchDto": "src.client.generated.models.custom_field_patch_dto",
+    "CustomFieldProjectCountDto": "src.client.generated.models.custom_field_project_count_dto",
+    "CustomFieldProjectDto": "src.client.generated.models.custom_field_project_dto",
+    "CustomFieldProjectPatchDto": "src.client.generated.models.custom_field_project_patch_dto",
+    "CustomFieldProjectWithValuesDto": "src.client.generated.models.custom_field_project_with_values_dto",
+    "CustomFieldRawDto": "src.client.generated.models.custom_field_raw_dto",
+    "CustomFieldSchemaCountDto": "src.client.generated.models.custom_field_schema_count_dto",
+    "CustomFieldSchemaCreateDto": "src.client.generated.models.custom_field_schema_create_dto",
+    "CustomFieldSchemaDto": "src.client.generated.models.custom_field_schema_dto",
+    "CustomFieldSchemaPatchDto": "src.client.generated.models.custom_field_schema_patch_dto",
+    "CustomFieldValueBulkDeleteDto": "src.client.generated.models.custom_field_value_bulk_delete_dto",
+    "CustomFieldValueBulkMergeDto": "src.client.generated.models.custom_field_value_bulk_merge_dto",
+    "CustomFieldValueDto": "src.client.generated.models.custom_field_value_dto",
+    "CustomFieldValuePatchDto": "src.client.generated.models.custom_field_value_patch_dto",
+    "CustomFieldValueProjectCreateDto": "src.client.generated.models.custom_field_value_project_create_dto",
+    "CustomFieldValueProjectMergeByIdDto": "src.client.generated.models.custom_field_value_project_merge_by_id_dto",
+    "CustomFieldValueProjectMergeByNameDto": "src.client.generated.models.custom_field_value_project_merge_by_name_dto",
+    "CustomFieldValueProjectPatchDto": "src.client.generated.models.custom_field_value_project_patch_dto",
+    "CustomFieldValueProjectRenameDto": "src.client.generated.models.custom_field_value_project_rename_dto",
+    "CustomFieldValueWithCfDto": "src.client.generated.models.custom_field_value_with_cf_dto",
+    "CustomFieldValueWithTcCountDto": "src.client.generated.models.custom_field_value_with_tc_count_dto",
+    "CustomFieldWithValuesDto": "src.client.generated.models.custom_field_with_values_dto",
+    "DashboardCopyDto": "src.client.generated.models.dashboard_copy_dto",
+    "DashboardCreateDto": "src.client.generated.models.dashboard_create_dto",
+    "DashboardDragAndDropDto": "src.client.generated.models.dashboard_drag_and_drop_dto",
+    "DashboardDto": "src.client.generated.models.dashboard_dto",
+    "DashboardOverviewDto": "src.client.generated.models.dashboard_overview_dto",
+    "DashboardPatchDto": "src.client.generated.models.dashboard_patch_dto",
+    "DashboardUpdateDto": "src.client.generated.models.dashboard_update_dto",
+    "DefaultCustomFieldValueDto": "src.client.generated.models.default_custom_field_value_dto",
+    "DefaultTextMarkupDocument": "src.client.generated.models.default_text_markup_document",
+    "DefaultTextMarkupDocumentAllOfContent": "src.client.generated.models.default_text_markup_document_all_of_content",
+    "DefaultWebhookSettings": "src.client.generated.models.default_webhook_settings",
+    "DefaultWebhookSettingsAllOfSubjects": "src.client.generated.models.default_webhook_settings_all_of_subjects",
+    "DefectBulkDto": "src.client.generated.models.defect_bulk_dto",
+    "DefectCountRowDto": "src.client.generated.models.defect_count_row_dto",
+    "DefectCreateDto": "src.client.generated.models.defect_create_dto",
+    "DefectDto": "src.client.generated.models.defect_dto",
+    "DefectIssueLinkDto": "src.client.generated.models.defect_issue_link_dto",
+    "DefectMatcherCreateDto": "src.client.generated.models.defect_matcher_create_dto",
+    "DefectMatcherDto": "src.client.generated.models.defect_matcher_dto",
+    "DefectMatcherPatchDto": "src.client.generated.models.defect_matcher_patch_dto",
+    "DefectOverviewDto": "src.client.generated.models.defect_overview_dto",
+    "DefectPatchDto": "src.client.generated.models.defect_patch_dto",
+    "DefectRowDto": "src.client.generated.models.defect_row_dto",
+    "DefectWebhook": "src.client.generated.models.defect_webhook",
+    "DiffValueChangeBoolean": "src.client.generated.models.diff_value_change_boolean",
+    "DiffValueChangeLong": "src.client.generated.models.diff_value_change_long",
+    "DiffValueChangeSetLong": "src.client.generated.models.diff_value_change_set_long",
+    "DiffValueChangeString": "src.client.generated.models.diff_value_change_string",
+    "DocumentNode": "src.client.generated.models.document_node",
+    "EnvVarCreateDto": "src.client.generated.models.env_var_create_dto",
+    "EnvVarDto": "src.client.generated.models.env_var_dto",
+    "EnvVarMergeDto": "src.client.generated.models.env_var_merge_dto",
+    "EnvVarPatchDto": "src.client.generated.models.env_var_patch_dto",
+    "EnvVarSchemaCreateDto": "src.client.generated.models.env_var_schema_create_dto",
+    "EnvVarSchemaDto": "src.client.generated.models.env_var_schema_dto",
+    "EnvVarSchemaPatchDto": "src.client.generated.models.env_var_schema_patch_dto",
+    "EnvVarValueCreateDto": "src.client.generated.models.env_var_value_create_dto",
+    "EnvVarValueDto": "src.client.generated.models.env_var_value_dto",
+    "EnvVarValuePatchDto": "src.client.generated.models.env_var_value_patch_dto",
+    "EnvironmentSetDto": "src.client.generated.models.environment_set_dto",
+    "EventType": "src.client.generated.models.event_type",
+    "EventTypeSettings": "src.client.generated.models.event_type_settings",
+    "ExampleExportFieldMapping": "src.client.generated.models.example_export_field_mapping",
+    "ExpectedBodyStepDto": "src.client.generated.models.expected_body_step_dto",
+    "ExportFieldMappingTestCaseExportField": "src.client.generated.models.export_field_mapping_test_case_export_field",
+    "ExportFieldMappingTestResultExportField": "src.client.generated.models.export_field_mapping_test_result_export_field",
+    "ExportRequestDto": "src.client.generated.models.export_request_dto",
+    "ExportStatus": "src.client.generated.models.export_status",
+    "ExportType": "src.client.generated.models.export_type",
+    "ExtFormField": "src.client.generated.models.ext_form_field",
+    "ExtFormFieldCheckbox": "src.client.generated.models.ext_form_field_checkbox",
+    "ExtFormFieldComposite": "src.client.generated.models.ext_form_field_composite",
+    "ExtFormFieldExternalSelect": "src.client.generated.models.ext_form_field_external_select",
+    "ExtFormFieldFormChoice": "src.client.generated.models.ext_form_field_form_choice",
+    "ExtFormFieldFormChoiceOption": "src.client.generated.models.ext_form_field_form_choice_option",
+    "ExtFormFieldList": "src.client.generated.models.ext_form_field_list",
+    "ExtFormFieldNumber": "src.client.generated.models.ext_form_field_number",
+    "ExtFormFieldOption": "src.client.generated.models.ext_form_field_option",
+    "ExtFormFieldPassword": "src.client.generated.models.ext_form_field_password",
+    "ExtFormFieldSelect": "src.client.generated.models.ext_form_field_select",
+    "ExtFormFieldSlider": "src.client.generated.models.ext_form_field_slider",
+    "ExtFormFieldText": "src.client.generated.models.ext_form_field_text",
+    "ExtFormFieldTextarea": "src.client.generated.models.ext_form_field_textarea",
+    "ExtFormFieldUnknown": "src.client.generated.models.ext_form_field_unknown",
+    "ExtIssueLink": "src.client.generated.models.ext_issue_link",
+    "ExtIssueType": "src.client.generated.models.ext_issue_type",
+    "ExtProject": "src.client.generated.models.ext_project",
+    "ExtSelectValue": "src.client.generated.models.ext_select_value",
+    "ExternalLinkDto": "src.client.generated.models.external_link_dto",
+    "ExternalRunResponseDto": "src.client.generated.models.external_run_response_dto",
+    "ExternalRunStartRequestDto": "src.client.generated.models.external_run_start_request_dto",
+    "ExternalRunStopRequestDto": "src.client.generated.models.external_run_stop_request_dto",
+    "FileUploadResponseDto": "src.client.generated.models.file_upload_response_dto",
+    "FilterBaseSetDto": "src.client.generated.models.filter_base_set_dto",
+    "FilterCreateDto": "src.client.generated.models.filter_create_dto",
+    "FilterDto": "src.client.generated.models.filter_dto",
+    "FilterPatchDto": "src.client.generated.models.filter_patch_dto",
+    "FilterTypeDto": "src.client.generated.models.filter_type_dto",
+    "FindAll29200Response": "src.client.generated.models.find_all29200_response",
+    "GlobalPermissionsDto": "src.client.generated.models.global_permissions_dto",
+    "GlobalSettingsDto": "src.client.generated.models.global_settings_dto",
+    "GlobalSettingsProjectCreatePatchDto": "src.client.generated.models.global_settings_project_create_patch_dto",
+    "GridPosDto": "src.client.generated.models.grid_pos_dto",
+    "GroupBy": "src.client.generated.models.group_by",
+    "GroupNodeContext": "src.client.generated.models.group_node_context",
+    "IdAndNameOnlyDto": "src.client.generated.models.id_and_name_only_dto",
+    "IdOnlyDto": "src.client.generated.models.id_only_dto",
+    "ImportRequestDto": "src.client.generated.models.import_request_dto",
+    "ImportRequestInfoDto": "src.client.generated.models.import_request_info_dto",
+    "ImportRequestStateDto": "src.client.generated.models.import_request_state_dto",
+    "ImportRequestTypeDto": "src.client.generated.models.import_request_type_dto",
+    "IntegrationCreateDto": "src.client.generated.models.integration_create_dto",
+    "IntegrationDto": "src.client.generated.models.integration_dto",
+    "IntegrationExportCreateDto": "src.client.generated.models.integration_export_create_dto",
+    "IntegrationExportDto": "src.client.generated.models.integration_export_dto",
+    "IntegrationExportPatchDto": "src.client.generated.models.integration_export_patch_dto",
+    "IntegrationFieldsFormDto": "src.client.generated.models.integration_fields_form_dto",
+    "IntegrationFieldsFormDtoDefaultProjectFieldsInner": "src.client.generated.models.integration_fields_form_dto_default_project_fields_inner",
+    "IntegrationInfoDto": "src.client.generated.models.integration_info_dto",
+    "IntegrationLinksFixedDto": "src.client.generated.models.integration_links_fixed_dto",
+    "IntegrationOperationTypeDto": "src.client.generated.models.integration_operation_type_dto",
+    "IntegrationPatchDto": "src.client.generated.models.integration_patch_dto",
+    "IntegrationRoutineTypeDto": "src.client.generated.models.integration_routine_type_dto",
+    "IntegrationTypeDto": "src.client.generated.models.integration_type_dto",
+    "IntegrationValidateDto": "src.client.generated.models.integration_validate_dto",
+    "IntegrationWebhookCreateDto": "src.client.generated.models.integration_webhook_create_dto",
+    "IntegrationWebhookDto": "src.client.generated.models.integration_webhook_dto",
+    "IntegrationWebhookLogDto": "src.client.generated.models.integration_webhook_log_dto",
+    "IntegrationWebhookPatchDto": "src.client.generated.models.integration_webhook_patch_dto",
+    "IntegrationWebhookTokenDto": "src.client.generated.models.integration_webhook_token_dto",
+    "IssueCreateDto": "src.client.generated.models.issue_create_dto",
+    "IssueDto": "src.client.generated.models.issue_dto",
+    "IssueImportFieldMapping": "src.client.generated.models.issue_import_field_mapping",
+    "IssueIntegrationExportFieldMapping": "src.client.generated.models.issue_integration_export_field_mapping",
+    "IssuePatchDto": "src.client.generated.models.issue_patch_dto",
+    "IssueSchemaCreateDto": "src.client.generated.models.issue_schema_create_dto",
+    "IssueSchemaDto": "src.client.generated.models.issue_schema_dto",
+    "IssueSchemaPatchDto": "src.client.generated.models.issue_schema_patch_dto",
+    "IssueToCreateDto": "src.client.generated.models.issue_to_create_dto",
+    "ItalicMark": "src.client.generated.models.italic_mark",
+    "Job": "src.client.generated.models.job",
+    "JobCreateDto": "src.client.generated.models.job_create_dto",
+    "JobDto": "src.client.generated.models.job_dto",
+    "JobInfoDto": "src.client.generated.models.job_info_dto",
+    "JobMapping": "src.client.generated.models.job_mapping",
+    "JobParameterDto": "src.client.generated.models.job_parameter_dto",
+    "JobPatchDto": "src.client.generated.models.job_patch_dto",
+    "JobRerunRequestDto": "src.client.generated.models.job_rerun_request_dto",
+    "JobRun": "src.client.generated.models.job_run",
+    "JobRunDto": "src.client.generated.models.job_run_dto",
+    "JobRunRequestDto": "src.client.generated.models.job_run_request_dto",
+    "JobRunStageDto": "src.client.generated.models.job_run_stage_dto",
+    "JobRunStatusDto": "src.client.generated.models.job_run_status_dto",
+    "JobRunUploadInfoDto": "src.client.generated.models.job_run_upload_info_dto",
+    "JobTestCasesStatDto": "src.client.generated.models.job_test_cases_stat_dto",
+    "Launch": "src.client.generated.models.launch",
+    "LaunchCleanupRequest": "src.client.generated.models.launch_cleanup_request",
+    "LaunchCloseConfigDto": "src.client.generated.models.launch_close_config_dto",
+    "LaunchCopyRqDto": "src.client.generated.models.launch_copy_rq_dto",
+    "LaunchCreateAndUploadDto": "src.client.generated.models.launch_create_and_upload_dto",
+    "LaunchCreateDto": "src.client.generated.models.launch_create_dto",
+    "LaunchDiffCell": "src.client.generated.models.launch_diff_cell",
+    "LaunchDiffMode": "src.client.generated.models.launch_diff_mode",
+    "LaunchDiffRow": "src.client.generated.models.launch_diff_row",
+    "LaunchDiffStatusChangeDto": "src.client.generated.models.launch_diff_status_change_dto",
+    "LaunchDiffTestResult": "src.client.generated.models.launch_diff_test_result",
+    "LaunchDiffTestResultDto": "src.client.generated.models.launch_diff_test_result_dto",
+    "LaunchDto": "src.client.generated.models.launch_dto",
+    "LaunchExistingUploadDto": "src.client.generated.models.launch_existing_upload_dto",
+    "LaunchLiveDocConfigDto": "src.client.generated.models.launch_live_doc_config_dto",
+    "LaunchMemberStatsDto": "src.client.generated.models.launch_member_stats_dto",
+    "LaunchMergeDto": "src.client.generated.models.launch_merge_dto",
+    "LaunchPatchDto": "src.client.generated.models.launch_patch_dto",
+    "LaunchPdfOptions": "src.client.generated.models.launch_pdf_options",
+    "LaunchPdfPart": "src.client.generated.models.launch_pdf_part",
+    "LaunchPdfStructure": "src.client.generated.models.launch_pdf_structure",
+    "LaunchPreviewDto": "src.client.generated.models.launch_preview_dto",
+    "LaunchProgressDto": "src.client.generated.models.launch_progress_dto",
+    "LaunchRowDto": "src.client.generated.models.launch_row_dto",
+    "LaunchTagCreateDto": "src.client.generated.models.launch_tag_create_dto",
+    "LaunchTagDto": "src.client.generated.models.launch_tag_dto",
+    "LaunchTagPatchDto": "src.client.generated.models.launch_tag_patch_dto",
+    "LaunchTestCasesAddDto": "src.client.generated.models.launch_test_cases_add_dto",
+    "LaunchTestPlanAddDto": "src.client.generated.models.launch_test_plan_add_dto",
+    "LaunchUploadResponseDto": "src.client.generated.models.launch_upload_response_dto",
+    "LaunchVariableDto": "src.client.generated.models.launch_variable_dto",
+    "LaunchWebhook": "src.client.generated.models.launch_webhook",
+    "LineBreakParagraphNode": "src.client.generated.models.line_break_paragraph_node",
+    "LinkExportFieldMapping": "src.client.generated.models.link_export_field_mapping",
+    "LinkImportFieldMapping": "src.client.generated.models.link_import_field_mapping",
+    "LinkMark": "src.client.generated.models.link_mark",
+    "ListSelectionDto": "src.client.generated.models.list_selection_dto",
+    "ManualSessionRequestDto": "src.client.generated.models.manual_session_request_dto",
+    "Matcher": "src.client.generated.models.matcher",
+    "MemberCreateDto": "src.client.generated.models.member_create_dto",
+    "MemberDto": "src.client.generated.models.member_dto",
+    "MemberPatchDto": "src.client.generated.models.member_patch_dto",
+    "Metric": "src.client.generated.models.metric",
+    "MfaGlobalSettingsDto": "src.client.generated.models.mfa_global_settings_dto",
+    "MfaGlobalSettingsPatchDto": "src.client.generated.models.mfa_global_settings_patch_dto",
+    "MultiValueExportFieldMapping": "src.client.generated.models.multi_value_export_field_mapping",
+    "MultiValueImportFieldMapping": "src.client.generated.models.multi_value_import_field_mapping",
+    "MultiValueMapStringString": "src.client.generated.models.multi_value_map_string_string",
+    "MuteCreateDto": "src.client.generated.models.mute_create_dto",
+    "MuteDto": "src.client.generated.models.mute_dto",
+    "NameOnlyDto": "src.client.generated.models.name_only_dto",
+    "NodeType": "src.client.generated.models.node_type",
+    "NormalizedScenarioDto": "src.client.generated.models.normalized_scenario_dto",
+    "NormalizedScenarioDtoAttachmentsValue": "src.client.generated.models.normalized_scenario_dto_attachments_value",
+    "NormalizedScenarioStepDto": "src.client.generated.models.normalized_scenario_step_dto",
+    "OrderedValueDtoString": "src.client.generated.models.ordered_value_dto_string",
+    "PageAccessGroupDto": "src.client.generated.models.page_access_group_dto",
+    "PageAccessGroupDtoSort": "src.client.generated.models.page_access_group_dto_sort",
+    "PageAccessGroupPaDto": "src.client.generated.models.page_access_group_pa_dto",
+    "PageAccessGroupUserDto": "src.client.generated.models.page_access_group_user_dto",
+    "PageAsyncJobDto": "src.client.generated.models.page_async_job_dto",
+    "PageCategoryDto": "src.client.generated.models.page_category_dto",
+    "PageCategoryMatcherDto": "src.client.generated.models.page_category_matcher_dto",
+    "PageCleanerSchemaDto": "src.client.generated.models.page_cleaner_schema_dto",
+    "PageCommentDto": "src.client.generated.models.page_comment_dto",
+    "PageCustomFieldProjectDto": "src.client.generated.models.page_custom_field_project_dto",
+    "PageCustomFieldSchemaDto": "src.client.generated.models.page_custom_field_schema_dto",
+    "PageCustomFieldValueWithTcCountDto": "src.client.generated.models.page_custom_field_value_with_tc_count_dto",
+    "PageDashboardDto": "src.client.generated.models.page_dashboard_dto",
+    "PageDefectCountRowDto": "src.client.generated.models.page_defect_count_row_dto",
+    "PageDefectDto": "src.client.generated.models.page_defect_dto",
+    "PageDefectMatcherDto": "src.client.generated.models.page_defect_matcher_dto",
+    "PageDefectRowDto": "src.client.generated.models.page_defect_row_dto",
+    "PageEnvVarSchemaDto": "src.client.generated.models.page_env_var_schema_dto",
+    "PageExportRequestDto": "src.client.generated.models.page_export_request_dto",
+    "PageFilterDto": "src.client.generated.models.page_filter_dto",
+    "PageIdAndNameOnlyDto": "src.client.generated.models.page_id_and_name_only_dto",
+    "PageImportRequestDto": "src.client.generated.models.page_import_request_dto",
+    "PageIntegrationDto": "src.client.generated.models.page_integration_dto",
+    "PageIntegrationExportDto": "src.client.generated.models.page_integration_export_dto",
+    "PageIntegrationInfoDto": "src.client.generated.models.page_integration_info_dto",
+    "PageIntegrationWebhookDto": "src.client.generated.models.page_integration_webhook_dto",
+    "PageIntegrationWebhookLogDto": "src.client.generated.models.page_integration_webhook_log_dto",
+    "PageIssueDto": "src.client.generated.models.page_issue_dto",
+    "PageIssueSchemaDto": "src.client.generated.models.page_issue_schema_dto",
+    "PageJobDto": "src.client.generated.models.page_job_dto",
+    "PageLaunchDiffRow": "src.client.generated.models.page_launch_diff_row",
+    "PageLaunchDto": "src.client.generated.models.page_launch_dto",
+    "PageLaunchMemberStatsDto": "src.client.generated.models.page_launch_member_stats_dto",
+    "PageLaunchPreviewDto": "src.client.generated.models.page_launch_preview_dto",
+    "PageLaunchRowDto": "src.client.generated.models.page_launch_row_dto",
+    "PageLaunchTagDto": "src.client.generated.models.page_launch_tag_dto",
+    "PageLaunchVariableDto": "src.client.generated.models.page_launch_variable_dto",
+    "PageMemberDto": "src.client.generated.models.page_member_dto",
+    "PageMuteDto": "src.client.generated.models.page_mute_dto",
+    "PagePermissionSetDto": "src.client.generated.models.page_permission_set_dto",
+    "PageProjectCollaboratorAccessDto": "src.client.generated.models.page_project_collaborator_access_dto",
+    "PageProjectCollaboratorDto": "src.client.generated.models.page_project_collaborator_dto",
+    "PageProjectCustomFieldDto": "src.client.generated.models.page_project_custom_field_dto",
+    "PageProjectDto": "src.client.generated.models.page_project_dto",
+    "PageProjectGroupAccessDto": "src.client.generated.models.page_project_group_access_dto",
+    "PageProjectIntegrationDto": "src.client.generated.models.page_project_integration_dto",
+    "PageProjectSuggestDto": "src.client.generated.models.page_project_suggest_dto",
+    "PageRoleSchemaDto": "src.client.generated.models.page_role_schema_dto",
+    "PageSharedStepAttachmentRowDto": "src.client.generated.models.page_shared_step_attachment_row_dto",
+    "PageSharedStepDto": "src.client.generated.models.page_shared_step_dto",
+    "PageStatisticWidgetItem": "src.client.generated.models.page_statistic_widget_item",
+    "PageStatusDto": "src.client.generated.models.page_status_dto",
+    "PageTemplateDto": "src.client.generated.models.page_template_dto",
+    "PageTestCaseAttachmentRowDto": "src.client.generated.models.page_test_case_attachment_row_dto",
+    "PageTestCaseAuditLogEntryDto": "src.client.generated.models.page_test_case_audit_log_entry_dto",
+    "PageTestCaseDto": "src.client.generated.models.page_test_case_dto",
+    "PageTestCaseExampleDto": "src.client.generated.models.page_test_case_example_dto",
+    "PageTestCaseFlatDto": "src.client.generated.models.page_test_case_flat_dto",
+    "PageTestCaseRowDto": "src.client.generated.models.page_test_case_row_dto",
+    "PageTestCaseTreeGroupDto": "src.client.generated.models.page_test_case_tree_group_dto",
+    "PageTestCaseTreeLeafDto": "src.client.generated.models.page_test_case_tree_leaf_dto",
+    "PageTestCaseTreeNodeDto": "src.client.generated.models.page_test_case_tree_node_dto",
+    "PageTestCaseTreeNodeDtoContentInner": "src.client.generated.models.page_test_case_tree_node_dto_content_inner",
+    "PageTestFixtureResultAttachmentRowDto": "src.client.generated.models.page_test_fixture_result_attachment_row_dto",
+    "PageTestKeySchemaDto": "src.client.generated.models.page_test_key_schema_dto",
+    "PageTestLayerDto": "src.client.generated.models.page_test_layer_dto",
+    "PageTestLayerSchemaDto": "src.client.generated.models.page_test_layer_schema_dto",
+    "PageTestPlanDto": "src.client.generated.models.page_test_plan_dto",
+    "PageTestPlanRowDto": "src.client.generated.models.page_test_plan_row_dto",
+    "PageTestResultAttachmentRowDto": "src.client.generated.models.page_test_result_attachment_row_dto",
+    "PageTestResultDefectMatchDto": "src.client.generated.models.page_test_result_defect_match_dto",
+    "PageTestResultDto": "src.client.generated.models.page_test_result_dto",
+    "PageTestResultFlatDto": "src.client.generated.models.page_test_result_flat_dto",
+    "PageTestResultHistoryDto": "src.client.generated.models.page_test_result_history_dto",
+    "PageTestResultRetriesRowDto": "src.client.generated.models.page_test_result_retries_row_dto",
+    "PageTestResultRowDto": "src.client.generated.models.page_test_result_row_dto",
+    "PageTestResultTreeGroupDto": "src.client.generated.models.page_test_result_tree_group_dto",
+    "PageTestResultTreeLeafDto": "src.client.generated.models.page_test_result_tree_leaf_dto",
+    "PageTestResultTreeNodeDto": "src.client.generated.models.page_test_result_tree_node_dto",
+    "PageTestResultTreeNodeDtoContentInner": "src.client.generated.models.page_test_result_tree_node_dto_content_inner",
+    "PageTreeDto": "src.client.generated.models.page_tree_dto",
+    "PageTreeDtoV2": "src.client.generated.models.page_tree_dto_v2",
+    "PageTreePathDto": "src.client.generated.models.page_tree_path_dto",
+    "PageWebhookDto": "src.client.generated.models.page_webhook_dto",
+    "PageWidgetDto": "src.client.generated.models.page_widget_dto",
+    "PageWorkflowDto": "src.client.generated.models.page_workflow_dto",
+    "PageWorkflowSchemaDto": "src.client.generated.models.page_workflow_schema_dto",
+    "Pageable": "src.client.generated.models.pageable",
+    "ParagraphDocumentNode": "src.client.generated.models.paragraph_document_node",
+    "ParagraphDocumentNodeAllOfContent": "src.client.generated.models.paragraph_document_node_all_of_content",
+    "ParagraphNode": "src.client.generated.models.paragraph_node",
+    "Parameter": "src.client.generated.models.parameter",
+    "ParameterValueDto": "src.client.generated.models.parameter_value_dto",
+    "PermissionDto": "src.client.generated.models.permission_dto",
+    "PermissionSetCreateDto": "src.client.generated.models.permission_set_create_dto",
+    "PermissionSetDto": "src.client.generated.models.permission_set_dto",
+    "PermissionSetPatchDto": "src.client.generated.models.permission_set_patch_dto",
+    "ProjectAccessCollaboratorAddDto": "src.client.generated.models.project_access_collaborator_add_dto",
+    "ProjectAccessGroupAddDto": "src.client.generated.models.project_access_group_add_dto",
+    "ProjectCategoryAddDto": "src.client.generated.models.project_category_add_dto",
+    "ProjectCategoryMatcherAddDto": "src.client.generated.models.project_category_matcher_add_dto",
+    "ProjectCategoryMatcherRemoveDto": "src.client.generated.models.project_category_matcher_remove_dto",
+    "ProjectCategoryRemoveDto": "src.client.generated.models.project_category_remove_dto",
+    "ProjectCollaboratorAccessDto": "src.client.generated.models.project_collaborator_access_dto",
+    "ProjectCollaboratorDto": "src.client.generated.models.project_collaborator_dto",
+    "ProjectCreateDto": "src.client.generated.models.project_create_dto",
+    "ProjectCustomFieldDto": "src.client.generated.models.project_custom_field_dto",
+    "ProjectDto": "src.client.generated.models.project_dto",
+    "ProjectGroupAccessAddDto": "src.client.generated.models.project_group_access_add_dto",
+    "ProjectGroupAccessDto": "src.client.generated.models.project_group_access_dto",
+    "ProjectIntegrationCreateDto": "src.client.generated.models.project_integration_create_dto",
+    "ProjectIntegrationDto": "src.client.generated.models.project_integration_dto",
+    "ProjectIntegrationFieldsFormDto": "src.client.generated.models.project_integration_fields_form_dto",
+    "ProjectIntegrationPatchDto": "src.client.generated.models.project_integration_patch_dto",
+    "ProjectIntegrationValidateDto": "src.client.generated.models.project_integration_validate_dto",
+    "ProjectMetricDto": "src.client.generated.models.project_metric_dto",
+    "ProjectPatchDto": "src.client.generated.models.project_patch_dto",
+    "ProjectPropertyCreateDto": "src.client.generated.models.project_property_create_dto",
+    "ProjectPropertyDto": "src.client.generated.models.project_property_dto",
+    "ProjectPropertyPatchDto": "src.client.generated.models.project_property_patch_dto",
+    "ProjectStatsDto": "src.client.generated.models.project_stats_dto",
+    "ProjectSuggestDto": "src.client.generated.models.project_suggest_dto",
+    "ProjectSyncRequest": "src.client.generated.models.project_sync_request",
+    "ProjectTestCaseCountDto": "src.client.generated.models.project_test_case_count_dto",
+    "ResolveRequestV2Dto": "src.client.generated.models.resolve_request_v2_dto",
+    "Retry": "src.client.generated.models.retry",
+    "RoleCreateDto": "src.client.generated.models.role_create_dto",
+    "RoleDto": "src.client.generated.models.role_dto",
+    "RoleExportFieldMapping": "src.client.generated.models.role_export_field_mapping",
+    "RoleImportFieldMapping": "src.client.generated.models.role_import_field_mapping",
+    "RolePatchDto": "src.client.generated.models.role_patch_dto",
+    "RoleSchemaCreateDto": "src.client.generated.models.role_schema_create_dto",
+    "RoleSchemaDto": "src.client.generated.models.role_schema_dto",
+    "RoleSchemaPatchDto": "src.client.generated.models.role_schema_patch_dto",
+    "ScenarioExportFieldMapping": "src.client.generated.models.scenario_export_field_mapping",
+    "ScenarioStepCopyDto": "src.client.generated.models.scenario_step_copy_dto",
+    "ScenarioStepCreateDto": "src.client.generated.models.scenario_step_create_dto",
+    "ScenarioStepCreatedResponseDto": "src.client.generated.models.scenario_step_created_response_dto",
+    "ScenarioStepDto": "src.client.generated.models.scenario_step_dto",
+    "ScenarioStepMoveDto": "src.client.generated.models.scenario_step_move_dto",
+    "ScenarioStepPatchDto": "src.client.generated.models.scenario_step_patch_dto",
+    "SessionVariable": "src.client.generated.models.session_variable",
+    "SharedStepAttachmentPatchDto": "src.client.generated.models.shared_step_attachment_patch_dto",
+    "SharedStepAttachmentRowDto": "src.client.generated.models.shared_step_attachment_row_dto",
+    "SharedStepCreateDto": "src.client.generated.models.shared_step_create_dto",
+    "SharedStepDto": "src.client.generated.models.shared_step_dto",
+    "SharedStepPatchDto": "src.client.generated.models.shared_step_patch_dto",
+    "SharedStepScenarioDto": "src.client.generated.models.shared_step_scenario_dto",
+    "SharedStepScenarioDtoStepsInner": "src.client.generated.models.shared_step_scenario_dto_steps_inner",
+    "SharedStepStepDto": "src.client.generated.models.shared_step_step_dto",
+    "StatisticDto": "src.client.generated.models.statistic_dto",
+    "StatisticWidgetItem": "src.client.generated.models.statistic_widget_item",
+    "Status": "src.client.generated.models.status",
+    "StatusCreateDto": "src.client.generated.models.status_create_dto",
+    "StatusDto": "src.client.generated.models.status_dto",
+    "StatusPatchDto": "src.client.generated.models.status_patch_dto",
+    "StrikeMark": "src.client.generated.models.strike_mark",
+    "TagImportFieldMapping": "src.client.generated.models.tag_import_field_mapping",
+    "TemplateDto": "src.client.generated.models.template_dto",
+    "TemplateOverviewDto": "src.client.generated.models.template_overview_dto",
+    "TestCaseAssociationDiff": "src.client.generated.models.test_case_association_diff",
+    "TestCaseAttachmentPatchDto": "src.client.generated.models.test_case_attachment_patch_dto",
+    "TestCaseAttachmentRowDto": "src.client.generated.models.test_case_attachment_row_dto",
+    "TestCaseAuditLogData": "src.client.generated.models.test_case_audit_log_data",
+    "TestCaseAuditLogDataDiff": "src.client.generated.models.test_case_audit_log_data_diff",
+    "TestCaseAuditLogEntryDto": "src.client.generated.models.test_case_audit_log_entry_dto",
+    "TestCaseBulkCfMoveStrategy": "src.client.generated.models.test_case_bulk_cf_move_strategy",
+    "TestCaseBulkChangeProjectDtoV2": "src.client.generated.models.test_case_bulk_change_project_dto_v2",
+    "TestCaseBulkCloneDto": "src.client.generated.models.test_case_bulk_clone_dto",
+    "TestCaseBulkCloneDtoV2": "src.client.generated.models.test_case_bulk_clone_dto_v2",
+    "TestCaseBulkDragAndDropDto": "src.client.generated.models.test_case_bulk_drag_and_drop_dto",
+    "TestCaseBulkDragAndDropDtoV2": "src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2",
+    "TestCaseBulkDto": "src.client.generated.models.test_case_bulk_dto",
+    "TestCaseBulkDtoV2": "src.client.generated.models.test_case_bulk_dto_v2",
+    "TestCaseBulkEntityIdsDto": "src.client.generated.models.test_case_bulk_entity_ids_dto",
+    "TestCaseBulkEntityIdsDtoV2": "src.client.generated.models.test_case_bulk_entity_ids_dto_v2",
+    "TestCaseBulkExportCsvOptions": "src.client.generated.models.test_case_bulk_export_csv_options",
+    "TestCaseBulkExportCsvOptionsMappingInner": "src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner",
+    "TestCaseBulkExportPdfOptions": "src.client.generated.models.test_case_bulk_export_pdf_options",
+    "TestCaseBulkExternalLinkDto": "src.client.generated.models.test_case_bulk_external_link_dto",
+    "TestCaseBulkIssueDto": "src.client.generated.models.test_case_bulk_issue_dto",
+    "TestCaseBulkLayerDto": "src.client.generated.models.test_case_bulk_layer_dto",
+    "TestCaseBulkMemberDto": "src.client.generated.models.test_case_bulk_member_dto",
+    "TestCaseBulkMuteDto": "src.client.generated.models.test_case_bulk_mute_dto",
+    "TestCaseBulkNewCfvDto": "src.client.generated.models.test_case_bulk_new_cfv_dto",
+    "TestCaseBulkProjectChangeDto": "src.client.generated.models.test_case_bulk_project_change_dto",
+    "TestCaseBulkRunExistingLaunchDto": "src.client.generated.models.test_case_bulk_run_existing_launch_dto",
+    "TestCaseBulkRunNewLaunchDto": "src.client.generated.models.test_case_bulk_run_new_launch_dto",
+    "TestCaseBulkStatusDto": "src.client.generated.models.test_case_bulk_status_dto",
+    "TestCaseBulkTagDto": "src.client.generated.models.test_case_bulk_tag_dto",
+    "TestCaseBulkTestPlanCreateDto": "src.client.generated.models.test_case_bulk_test_plan_create_dto",
+    "TestCaseCfBulkDeltaDtoV2": "src.client.generated.models.test_case_cf_bulk_delta_dto_v2",
+    "TestCaseCfvBulkAddDto": "src.client.generated.models.test_case_cfv_bulk_add_dto",
+    "TestCaseCloneRqDto": "src.client.generated.models.test_case_clone_rq_dto",
+    "TestCaseCountDto": "src.client.generated.models.test_case_count_dto",
+    "TestCaseCreateV2Dto": "src.client.generated.models.test_case_create_v2_dto",
+    "TestCaseCsvExportOptions": "src.client.generated.models.test_case_csv_export_options",
+    "TestCaseCsvImportOptions": "src.client.generated.models.test_case_csv_import_options",
+    "TestCaseCsvImportOptionsMappingInner": "src.client.generated.models.test_case_csv_import_options_mapping_inner",
+    "TestCaseCsvPreviewOptions": "src.client.generated.models.test_case_csv_preview_options",
+    "TestCaseDetachAutomationRqDto": "src.client.generated.models.test_case_detach_automation_rq_dto",
+    "TestCaseDiff": "src.client.generated.models.test_case_diff",
+    "TestCaseDto": "src.client.generated.models.test_case_dto",
+    "TestCaseExampleDto": "src.client.generated.models.test_case_example_dto",
+    "TestCaseExportField": "src.client.generated.models.test_case_export_field",
+    "TestCaseExternalLinkBulkAddDto": "src.client.generated.models.test_case_external_link_bulk_add_dto",
+    "TestCaseFlatDto": "src.client.generated.models.test_case_flat_dto",
+    "TestCaseFullTreeNodeDto": "src.client.generated.models.test_case_full_tree_node_dto",
+    "TestCaseImportDto": "src.client.generated.models.test_case_import_dto",
+    "TestCaseImportField": "src.client.generated.models.test_case_import_field",
+    "TestCaseImportMapping": "src.client.generated.models.test_case_import_mapping",
+    "TestCaseInfo": "src.client.generated.models.test_case_info",
+    "TestCaseIssueBulkAddDto": "src.client.generated.models.test_case_issue_bulk_add_dto",
+    "TestCaseLastResultDto": "src.client.generated.models.test_case_last_result_dto",
+    "TestCaseLayerBulkSetDto": "src.client.generated.models.test_case_layer_bulk_set_dto",
+    "TestCaseLightTreeNodeDto": "src.client.generated.models.test_case_light_tree_node_dto",
+    "TestCaseMemberBulkAddDto": "src.client.generated.models.test_case_member_bulk_add_dto",
+    "TestCaseMuteBulkAddDto": "src.client.generated.models.test_case_mute_bulk_add_dto",
+    "TestCaseOverviewDto": "src.client.generated.models.test_case_overview_dto",
+    "TestCaseParameterDto": "src.client.generated.models.test_case_parameter_dto",
+    "TestCaseParameterValues": "src.client.generated.models.test_case_parameter_values",
+    "TestCasePatchV2Dto": "src.client.generated.models.test_case_patch_v2_dto",
+    "TestCasePdfOptions": "src.client.generated.models.test_case_pdf_options",
+    "TestCasePdfPart": "src.client.generated.models.test_case_pdf_part",
+    "TestCaseRelationDto": "src.client.generated.models.test_case_relation_dto",
+    "TestCaseRelationTypeDto": "src.client.generated.models.test_case_relation_type_dto",
+    "TestCaseRowDto": "src.client.generated.models.test_case_row_dto",
+    "TestCaseRunBulkExistingLaunchDto": "src.client.generated.models.test_case_run_bulk_existing_launch_dto",
+    "TestCaseRunBulkNewLaunchDto": "src.client.generated.models.test_case_run_bulk_new_launch_dto",
+    "TestCaseRunByStats": "src.client.generated.models.test_case_run_by_stats",
+    "TestCaseRunStatsRequestDto": "src.client.generated.models.test_case_run_stats_request_dto",
+    "TestCaseScenarioDto": "src.client.generated.models.test_case_scenario_dto",
+    "TestCaseScenarioStepDto": "src.client.generated.models.test_case_scenario_step_dto",
+    "TestCaseScenarioV2Dto": "src.client.generated.models.test_case_scenario_v2_dto",
+    "TestCaseSelectionDtoV2": "src.client.generated.models.test_case_selection_dto_v2",
+    "TestCaseStatusBulkSetDto": "src.client.generated.models.test_case_status_bulk_set_dto",
+    "TestCaseStyle": "src.client.generated.models.test_case_style",
+    "TestCaseSyncFromTo": "src.client.generated.models.test_case_sync_from_to",
+    "TestCaseSyncRqDto": "src.client.generated.models.test_case_sync_rq_dto",
+    "TestCaseTagBulkAddDto": "src.client.generated.models.test_case_tag_bulk_add_dto",
+    "TestCaseTestPlanBulkCreateDto": "src.client.generated.models.test_case_test_plan_bulk_create_dto",
+    "TestCaseTreeAllPathsDto": "src.client.generated.models.test_case_tree_all_paths_dto",
+    "TestCaseTreeFilterCountDto": "src.client.generated.models.test_case_tree_filter_count_dto",
+    "TestCaseTreeGroupAddDto": "src.client.generated.models.test_case_tree_group_add_dto",
+    "TestCaseTreeGroupDto": "src.client.generated.models.test_case_tree_group_dto",
+    "TestCaseTreeGroupRenameDto": "src.client.generated.models.test_case_tree_group_rename_dto",
+    "TestCaseTreeLeafAddDto": "src.client.generated.models.test_case_tree_leaf_add_dto",
+    "TestCaseTreeLeafDto": "src.client.generated.models.test_case_tree_leaf_dto",
+    "TestCaseTreeLeafDtoV2": "src.client.generated.models.test_case_tree_leaf_dto_v2",
+    "TestCaseTreeLeafRenameDto": "src.client.generated.models.test_case_tree_leaf_rename_dto",
+    "TestCaseTreeNodeDto": "src.client.generated.models.test_case_tree_node_dto",
+    "TestCaseTreeRunStatRequestDto": "src.client.generated.models.test_case_tree_run_stat_request_dto",
+    "TestCaseTreeSelectionDto": "src.client.generated.models.test_case_tree_selection_dto",
+    "TestCaseTreeSelectionDtoV2": "src.client.generated.models.test_case_tree_selection_dto_v2",
+    "TestCaseType": "src.client.generated.models.test_case_type",
+    "TestCaseUpdateFieldDto": "src.client.generated.models.test_case_update_field_dto",
+    "TestCaseUpdatePolicyDto": "src.client.generated.models.test_case_update_policy_dto",
+    "TestCaseUpdateSchemaCreateDto": "src.client.generated.models.test_case_update_schema_create_dto",
+    "TestCaseUpdateSchemaDto": "src.client.generated.models.test_case_update_schema_dto",
+    "TestCaseUpdateSchemaPatchDto": "src.client.generated.models.test_case_update_schema_patch_dto",
+    "TestCaseVersionDto": "src.client.generated.models.test_case_version_dto",
+    "TestCaseVersionPatchDto": "src.client.generated.models.test_case_version_patch_dto",
+    "TestCaseVersionRqDto": "src.client.generated.models.test_case_version_rq_dto",
+    "TestCodeGenerationRequestDto": "src.client.generated.models.test_code_generation_request_dto",
+    "TestCodeGenerationResponseDto": "src.client.generated.models.test_code_generation_response_dto",
+    "TestDurationCount": "src.client.generated.models.test_duration_count",
+    "TestFixtureResultAttachmentPatchDto": "src.client.generated.models.test_fixture_result_attachment_patch_dto",
+    "TestFixtureResultAttachmentRowDto": "src.client.generated.models.test_fixture_result_attachment_row_dto",
+    "TestFixtureResultTypeDto": "src.client.generated.models.test_fixture_result_type_dto",
+    "TestFixtureResultV2Dto": "src.client.generated.models.test_fixture_result_v2_dto",
+    "TestKeyDto": "src.client.generated.models.test_key_dto",
+    "TestKeyImportFieldMapping": "src.client.generated.models.test_key_import_field_mapping",
+    "TestKeySchemaCreateDto": "src.client.generated.models.test_key_schema_create_dto",
+    "TestKeySchemaDto": "src.client.generated.models.test_key_schema_dto",
+    "TestKeySchemaPatchDto": "src.client.generated.models.test_key_schema_patch_dto",
+    "TestLayerCreateDto": "src.client.generated.models.test_layer_create_dto",
+    "TestLayerDto": "src.client.generated.models.test_layer_dto",
+    "TestLayerPatchDto": "src.client.generated.models.test_layer_patch_dto",
+    "TestLayerSchemaCreateDto": "src.client.generated.models.test_layer_schema_create_dto",
+    "TestLayerSchemaDto": "src.client.generated.models.test_layer_schema_dto",
+    "TestLayerSchemaPatchDto": "src.client.generated.models.test_layer_schema_patch_dto",
+    "TestPlanAssignDto": "src.client.generated.models.test_plan_assign_dto",
+    "TestPlanCreateDto": "src.client.generated.models.test_plan_create_dto",
+    "TestPlanDiffDto": "src.client.generated.models.test_plan_diff_dto",
+    "TestPlanDto": "src.client.generated.models.test_plan_dto",
+    "TestPlanJobParametersDto": "src.client.generated.models.test_plan_job_parameters_dto",
+    "TestPlanJobStatDto": "src.client.generated.models.test_plan_job_stat_dto",
+    "TestPlanMemberStatDto": "src.client.generated.models.test_plan_member_stat_dto",
+    "TestPlanPatchDto": "src.client.generated.models.test_plan_patch_dto",
+    "TestPlanRowDto": "src.client.generated.models.test_plan_row_dto",
+    "TestPlanRunRequestDto": "src.client.generated.models.test_plan_run_request_dto",
+    "TestPlanTreeSelectionDto": "src.client.generated.models.test_plan_tree_selection_dto",
+    "TestPlanWebhook": "src.client.generated.models.test_plan_webhook",
+    "TestResultAttachmentPatchDto": "src.client.generated.models.test_result_attachment_patch_dto",
+    "TestResultAttachmentRowDto": "src.client.generated.models.test_result_attachment_row_dto",
+    "TestResultAttachmentStepDto": "src.client.generated.models.test_result_attachment_step_dto",
+    "TestResultAttachmentStepDtoAllOfAttachment": "src.client.generated.models.test_result_attachment_step_dto_all_of_attachment",
+    "TestResultBodyStepDto": "src.client.generated.models.test_result_body_step_dto",
+    "TestResultBulkAssignDto": "src.client.generated.models.test_result_bulk_assign_dto",
+    "TestResultBulkDto": "src.client.generated.models.test_result_bulk_dto",
+    "TestResultBulkEntityIdsDto": "src.client.generated.models.test_result_bulk_entity_ids_dto",
+    "TestResultBulkMuteDto": "src.client.generated.models.test_result_bulk_mute_dto",
+    "TestResultBulkRerunDto": "src.client.generated.models.test_result_bulk_rerun_dto",
+    "TestResultBulkResolveDto": "src.client.generated.models.test_result_bulk_resolve_dto",
+    "TestResultBulkTagDto": "src.client.generated.models.test_result_bulk_tag_dto",
+    "TestResultCreateV2Dto": "src.client.generated.models.test_result_create_v2_dto",
+    "TestResultCsvExportOptions": "src.client.generated.models.test_result_csv_export_options",
+    "TestResultCsvExportOptionsMappingInner": "src.client.generated.models.test_result_csv_export_options_mapping_inner",
+    "TestResultDefectMatchDto": "src.client.generated.models.test_result_defect_match_dto",
+    "TestResultDefectMatcherDto": "src.client.generated.models.test_result_defect_matcher_dto",
+    "TestResultDto": "src.client.generated.models.test_result_dto",
+    "TestResultExpectedBodyStepDto": "src.client.generated.models.test_result_expected_body_step_dto",
+    "TestResultExportField": "src.client.generated.models.test_result_export_field",
+    "TestResultFlatDto": "src.client.generated.models.test_result_flat_dto",
+    "TestResultGroupNode": "src.client.generated.models.test_result_group_node",
+    "TestResultHistoryDto": "src.client.generated.models.test_result_history_dto",
+    "TestResultLeafNode": "src.client.generated.models.test_result_leaf_node",
+    "TestResultLinkDefectDto": "src.client.generated.models.test_result_link_defect_dto",
+    "TestResultMuteReason": "src.client.generated.models.test_result_mute_reason",
+    "TestResultNewDefectDto": "src.client.generated.models.test_result_new_defect_dto",
+    "TestResultParameterDto": "src.client.generated.models.test_result_parameter_dto",
+    "TestResultPatchDto": "src.client.generated.models.test_result_patch_dto",
+    "TestResultRerunDto": "src.client.generated.models.test_result_rerun_dto",
+    "TestResultRetriesRowDto": "src.client.generated.models.test_result_retries_row_dto",
+    "TestResultRowDto": "src.client.generated.models.test_result_row_dto",
+    "TestResultScenarioDto": "src.client.generated.models.test_result_scenario_dto",
+    "TestResultScenarioStepDto": "src.client.generated.models.test_result_scenario_step_dto",
+    "TestResultScenarioStepParameter": "src.client.generated.models.test_result_scenario_step_parameter",
+    "TestResultScenarioV2Dto": "src.client.generated.models.test_result_scenario_v2_dto",
+    "TestResultScenarioV2DtoStepsInner": "src.client.generated.models.test_result_scenario_v2_dto_steps_inner",
+    "TestResultStatsDto": "src.client.generated.models.test_result_stats_dto",
+    "TestResultTree": "src.client.generated.models.test_result_tree",
+    "TestResultTreeFilterCountDto": "src.client.generated.models.test_result_tree_filter_count_dto",
+    "TestResultTreeGroupDto": "src.client.generated.models.test_result_tree_group_dto",
+    "TestResultTreeGroupDtoV2": "src.client.generated.models.test_result_tree_group_dto_v2",
+    "TestResultTreeLeafDto": "src.client.generated.models.test_result_tree_leaf_dto",
+    "TestResultTreeLeafDtoV2": "src.client.generated.models.test_result_tree_leaf_dto_v2",
+    "TestResultTreeNodeDto": "src.client.generated.models.test_result_tree_node_dto",
+    "TestResultTreeSelectionDto": "src.client.generated.models.test_result_tree_selection_dto",
+    "TestSessionResponseDto": "src.client.generated.models.test_session_response_dto",
+    "TestStatus": "src.client.generated.models.test_status",
+    "TestStatusCount": "src.client.generated.models.test_status_count",
+    "TestTagCreateDto": "src.client.generated.models.test_tag_create_dto",
+    "TestTagDto": "src.client.generated.models.test_tag_dto",
+    "TestTagPatchDto": "src.client.generated.models.test_tag_patch_dto",
+    "TextColorMark": "src.client.generated.models.text_color_mark",
+    "TextFillMark": "src.client.generated.models.text_fill_mark",
+    "TextMark": "src.client.generated.models.text_mark",
+    "TextMarkupDocument": "src.client.generated.models.text_markup_document",
+    "TextParagraphNode": "src.client.generated.models.text_paragraph_node",
+    "TextParagraphNodeMarksInner": "src.client.generated.models.text_paragraph_node_marks_inner",
+    "TrScenarioStepDto": "src.client.generated.models.tr_scenario_step_dto",
+    "TreeCreateDto": "src.client.generated.models.tree_create_dto",
+    "TreeCustomFieldProjectDto": "src.client.generated.models.tree_custom_field_project_dto",
+    "TreeDto": "src.client.generated.models.tree_dto",
+    "TreeDtoV2": "src.client.generated.models.tree_dto_v2",
+    "TreePatchDto": "src.client.generated.models.tree_patch_dto",
+    "TreePathCreateDto": "src.client.generated.models.tree_path_create_dto",
+    "TreePathDto": "src.client.generated.models.tree_path_dto",
+    "TreePathItemDto": "src.client.generated.models.tree_path_item_dto",
+    "TreeSelectionDto": "src.client.generated.models.tree_selection_dto",
+    "UnderlineMark": "src.client.generated.models.underline_mark",
+    "UploadAttachmentDto": "src.client.generated.models.upload_attachment_dto",
+    "UploadFixturesResultsDto": "src.client.generated.models.upload_fixtures_results_dto",
+    "UploadLabelDto": "src.client.generated.models.upload_label_dto",
+    "UploadLinkDto": "src.client.generated.models.upload_link_dto",
+    "UploadParameterDto": "src.client.generated.models.upload_parameter_dto",
+    "UploadResultsDto": "src.client.generated.models.upload_results_dto",
+    "UploadResultsResponseDto": "src.client.generated.models.upload_results_response_dto",
+    "UploadTestCaseDto": "src.client.generated.models.upload_test_case_dto",
+    "UploadTestFixtureResultDto": "src.client.generated.models.upload_test_fixture_result_dto",
+    "UploadTestFixtureResultDtoStepsInner": "src.client.generated.models.upload_test_fixture_result_dto_steps_inner",
+    "UploadTestFixtureType": "src.client.generated.models.upload_test_fixture_type",
+    "UploadTestResultAttachmentStepDto": "src.client.generated.models.upload_test_result_attachment_step_dto",
+    "UploadTestResultBodyStepDto": "src.client.generated.models.upload_test_result_body_step_dto",
+    "UploadTestResultDto": "src.client.generated.models.upload_test_result_dto",
+    "UploadTestResultExpectedBodyStepDto": "src.client.generated.models.upload_test_result_expected_body_step_dto",
+    "UploadTestResultStepDto": "src.client.generated.models.upload_test_result_step_dto",
+    "UploadTestStatus": "src.client.generated.models.upload_test_status",
+    "WebhookCreateDto": "src.client.generated.models.webhook_create_dto",
+    "WebhookDto": "src.client.generated.models.webhook_dto",
+    "WebhookPatchDto": "src.client.generated.models.webhook_patch_dto",
+    "WebhookSettings": "src.client.generated.models.webhook_settings",
+    "WebhookSubject": "src.client.generated.models.webhook_subject",
+    "WebhookValidateDto": "src.client.generated.models.webhook_validate_dto",
+    "WidgetCreateDto": "src.client.generated.models.widget_create_dto",
+    "WidgetCreateDtoOptions": "src.client.generated.models.widget_create_dto_options",
+    "WidgetDataDto": "src.client.generated.models.widget_data_dto",
+    "WidgetDto": "src.client.generated.models.widget_dto",
+    "WidgetOptions": "src.client.generated.models.widget_options",
+    "WidgetOptionsAnalyticGraph": "src.client.generated.models.widget_options_analytic_graph",
+    "WidgetOptionsHavingSettableAql": "src.client.generated.models.widget_options_having_settable_aql",
+    "WidgetOptionsLastLaunchPieChart": "src.client.generated.models.widget_options_last_launch_pie_chart",
+    "WidgetOptionsLaunchList": "src.client.generated.models.widget_options_launch_list",
+    "WidgetOptionsLaunchTrend": "src.client.generated.models.widget_options_launch_trend",
+    "WidgetOptionsMarkdown": "src.client.generated.models.widget_options_markdown",
+    "WidgetOptionsStatisticTrend": "src.client.generated.models.widget_options_statistic_trend",
+    "WidgetOptionsTcPieChart": "src.client.generated.models.widget_options_tc_pie_chart",
+    "WidgetOptionsTcTreeMap": "src.client.generated.models.widget_options_tc_tree_map",
+    "WidgetOptionsTopTc": "src.client.generated.models.widget_options_top_tc",
+    "WidgetOptionsTrend": "src.client.generated.models.widget_options_trend",
+    "WidgetOptionsTrendV2": "src.client.generated.models.widget_options_trend_v2",
+    "WidgetPatchDto": "src.client.generated.models.widget_patch_dto",
+    "WidgetTypeDto": "src.client.generated.models.widget_type_dto",
+    "WorkflowCreateDto": "src.client.generated.models.workflow_create_dto",
+    "WorkflowDto": "src.client.generated.models.workflow_dto",
+    "WorkflowPatchDto": "src.client.generated.models.workflow_patch_dto",
+    "WorkflowRowDto": "src.client.generated.models.workflow_row_dto",
+    "WorkflowSchemaCreateDto": "src.client.generated.models.workflow_schema_create_dto",
+    "WorkflowSchemaDto": "src.client.generated.models.workflow_schema_dto",
+    "WorkflowSchemaPatchDto": "src.client.generated.models.workflow_schema_patch_dto",
+}
+
+if TYPE_CHECKING:
+    from src.client.generated.api.custom_field_controller_api import CustomFieldControllerApi as CustomFieldControllerApi
+    from src.client.generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi as CustomFieldProjectControllerApi
+    from src.client.generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api as CustomFieldProjectControllerV2Api
+    from src.client.generated.api.custom_field_schema_controller_api import CustomFieldSchemaControllerApi as CustomFieldSchemaControllerApi
+    from src.client.generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi as CustomFieldValueControllerApi
+    from src.client.generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi as CustomFieldValueProjectControllerApi
+    from src.client.generated.api.defect_controller_api import DefectControllerApi as DefectControllerApi
+    from src.client.generated.api.defect_matcher_controller_api import DefectMatcherControllerApi as DefectMatcherControllerApi
+    from src.client.generated.api.ide_controller_api import IdeControllerApi as IdeControllerApi
+    from src.client.generated.api.integration_controller_api import IntegrationControllerApi as IntegrationControllerApi
+    from src.client.generated.api.launch_controller_api import LaunchControllerApi as LaunchControllerApi
+    from src.client.generated.api.launch_search_controller_api import LaunchSearchControllerApi as LaunchSearchControllerApi
+    from src.client.generated.api.project_controller_api import ProjectControllerApi as ProjectControllerApi
+    from src.client.generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi as SharedStepAttachmentControllerApi
+    from src.client.generated.api.shared_step_controller_api import SharedStepControllerApi as SharedStepControllerApi
+    from src.client.generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi as SharedStepScenarioControllerApi
+    from src.client.generated.api.status_controller_api import StatusControllerApi as StatusControllerApi
+    from src.client.generated.api.test_case_attachment_controller_api import TestCaseAttachmentControllerApi as TestCaseAttachmentControllerApi
+    from src.client.generated.api.test_case_bulk_controller_api import TestCaseBulkControllerApi as TestCaseBulkControllerApi
+    from src.client.generated.api.test_case_controller_api import TestCaseControllerApi as TestCaseControllerApi
+    from src.client.generated.api.test_case_custom_field_controller_api import TestCaseCustomFieldControllerApi as TestCaseCustomFieldControllerApi
+    from src.client.generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi as TestCaseOverviewControllerApi
+    from src.client.generated.api.test_case_scenario_controller_api import TestCaseScenarioControllerApi as TestCaseScenarioControllerApi
+    from src.client.generated.api.test_case_search_controller_api import TestCaseSearchControllerApi as TestCaseSearchControllerApi
+    from src.client.generated.api.test_case_tag_controller_api import TestCaseTagControllerApi as TestCaseTagControllerApi
+    from src.client.generated.api.test_case_test_plan_bulk_controller_api import TestCaseTestPlanBulkControllerApi as TestCaseTestPlanBulkControllerApi
+    from src.client.generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api as TestCaseTreeBulkControllerV2Api
+    from src.client.generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api as TestCaseTreeControllerV2Api
+    from src.client.generated.api.test_layer_controller_api import TestLayerControllerApi as TestLayerControllerApi
+    from src.client.generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi as TestLayerSchemaControllerApi
+    from src.client.generated.api.test_plan_controller_api import TestPlanControllerApi as TestPlanControllerApi
+    from src.client.generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi as TestResultAttachmentControllerApi
+    from src.client.generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi as TestResultBulkControllerApi
+    from src.client.generated.api.test_result_controller_api import TestResultControllerApi as TestResultControllerApi
+    from src.client.generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi as TestResultFixtureControllerApi
+    from src.client.generated.api.test_result_flat_controller_api import TestResultFlatControllerApi as TestResultFlatControllerApi
+    from src.client.generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi as TestResultRerunControllerApi
+    from src.client.generated.api.test_result_run_controller_api import TestResultRunControllerApi as TestResultRunControllerApi
+    from src.client.generated.api.tree_controller_v2_api import TreeControllerV2Api as TreeControllerV2Api
+    from src.client.generated.api.upload_controller_api import UploadControllerApi as UploadControllerApi
+    from src.client.generated.api.upload_test_result_controller_api import UploadTestResultControllerApi as UploadTestResultControllerApi
+    from src.client.generated.api_response import ApiResponse as ApiResponse
+    from src.client.generated.api_client import ApiClient as ApiClient
+    from src.client.generated.configuration import Configuration as Configuration
+    from src.client.generated.exceptions import OpenApiException as OpenApiException
+    from src.client.generated.exceptions import ApiTypeError as ApiTypeError
+    from src.client.generated.exceptions import ApiValueError as ApiValueError
+    from src.client.generated.exceptions import ApiKeyError as ApiKeyError
+    from src.client.generated.exceptions import ApiAttributeError as ApiAttributeError
+    from src.client.generated.exceptions import ApiException as ApiException
+    from src.client.generated.models.access_group_bulk_dto import AccessGroupBulkDto as AccessGroupBulkDto
+    from src.client.generated.models.access_group_create_dto import AccessGroupCreateDto as AccessGroupCreateDto
+    from src.client.generated.models.access_group_dto import AccessGroupDto as AccessGroupDto
+    from src.client.generated.models.access_group_pa_dto import AccessGroupPaDto as AccessGroupPaDto
+    from src.client.generated.models.access_group_patch_dto import AccessGroupPatchDto as AccessGroupPatchDto
+    from src.client.generated.models.access_group_project_access_dto import AccessGroupProjectAccessDto as AccessGroupProjectAccessDto
+    from src.client.generated.models.access_group_projects_add_dto import AccessGroupProjectsAddDto as AccessGroupProjectsAddDto
+    from src.client.generated.models.access_group_user_dto import AccessGroupUserDto as AccessGroupUserDto
+    from src.client.generated.models.access_group_users_add_dto import AccessGroupUsersAddDto as AccessGroupUsersAddDto
+    from src.client.generated.models.allowed_role_dto import AllowedRoleDto as AllowedRoleDto
+    from src.client.generated.models.analytic_automation_trend_dto import AnalyticAutomationTrendDto as AnalyticAutomationTrendDto
+    from src.client.generated.models.analytic_dto import AnalyticDto as AnalyticDto
+    from src.client.generated.models.analytic_interval import AnalyticInterval as AnalyticInterval
+    from src.client.generated.models.analytic_launch_duration_histogram_dto import AnalyticLaunchDurationHistogramDto as AnalyticLaunchDurationHistogramDto
+    from src.client.generated.models.analytic_mute_trend_dto import AnalyticMuteTrendDto as AnalyticMuteTrendDto
+    from src.client.generated.models.analytic_tc_automation_count_dto import AnalyticTcAutomationCountDto as AnalyticTcAutomationCountDto
+    from src.client.generated.models.analytic_tc_status_count_dto import AnalyticTcStatusCountDto as AnalyticTcStatusCountDto
+    from src.client.generated.models.analytic_tr_by_status_trend_dto import AnalyticTrByStatusTrendDto as AnalyticTrByStatusTrendDto
+    from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto as AqlValidateResponseDto
+    from src.client.generated.models.assign_request_dto import AssignRequestDto as AssignRequestDto
+    from src.client.generated.models.async_job_dto import AsyncJobDto as AsyncJobDto
+    from src.client.generated.models.async_job_status_dto import AsyncJobStatusDto as AsyncJobStatusDto
+    from src.client.generated.models.async_job_step_dto import AsyncJobStepDto as AsyncJobStepDto
+    from src.client.generated.models.async_job_step_status_dto import AsyncJobStepStatusDto as AsyncJobStepStatusDto
+    from src.client.generated.models.async_job_with_steps_dto import AsyncJobWithStepsDto as AsyncJobWithStepsDto
+    from src.client.generated.models.attachment_row import AttachmentRow as AttachmentRow
+    from src.client.generated.models.attachment_step_dto import AttachmentStepDto as AttachmentStepDto
+    from src.client.generated.models.attrs import Attrs as Attrs
+    from src.client.generated.models.audit_action_type_dto import AuditActionTypeDto as AuditActionTypeDto
+    from src.client.generated.models.blob_storage_stats import BlobStorageStats as BlobStorageStats
+    from src.client.generated.models.blob_storage_update_stats import BlobStorageUpdateStats as BlobStorageUpdateStats
+    from src.client.generated.models.body_step_dto import BodyStepDto as BodyStepDto
+    from src.client.generated.models.bold_mark import BoldMark as BoldMark
+    from src.client.generated.models.business_metric_dto import BusinessMetricDto as BusinessMetricDto
+    from src.client.generated.models.category_create_dto import CategoryCreateDto as CategoryCreateDto
+    from src.client.generated.models.category_dto import CategoryDto as CategoryDto
+    from src.client.generated.models.category_matcher_create_dto import CategoryMatcherCreateDto as CategoryMatcherCreateDto
+    from src.client.generated.models.category_matcher_dto import CategoryMatcherDto as CategoryMatcherDto
+    from src.client.generated.models.category_matcher_patch_dto import CategoryMatcherPatchDto as CategoryMatcherPatchDto
+    from src.client.generated.models.category_patch_dto import CategoryPatchDto as CategoryPatchDto
+    from src.client.generated.models.cfv_merge_to_existing_global_value_dto import CfvMergeToExistingGlobalValueDto as CfvMergeToExistingGlobalValueDto
+    from src.client.generated.models.cfv_merge_to_new_global_value_dto import CfvMergeToNewGlobalValueDto as CfvMergeToNewGlobalValueDto
+    from src.client.generated.models.ci import Ci as Ci
+    from src.client.generated.models.cleaner_schema_create_dto import CleanerSchemaCreateDto as CleanerSchemaCreateDto
+    from src.client.generated.models.cleaner_schema_dto import CleanerSchemaDto as CleanerSchemaDto
+    from src.client.generated.models.cleaner_schema_patch_dto import CleanerSchemaPatchDto as CleanerSchemaPatchDto
+    from src.client.generated.models.cleaner_schema_target_dto import CleanerSchemaTargetDto as CleanerSchemaTargetDto
+    from src.client.generated.models.code_block_document_node import CodeBlockDocumentNode as CodeBlockDocumentNode
+    from src.client.generated.models.code_mark import CodeMark as CodeMark
+    from src.client.generated.models.comment_create_dto import CommentCreateDto as CommentCreateDto
+    from src.client.generated.models.comment_dto import CommentDto as CommentDto
+    from src.client.generated.models.comment_patch_dto import CommentPatchDto as CommentPatchDto
+    from src.client.generated.models.create_launch_event import CreateLaunchEvent as CreateLaunchEvent
+    from src.client.generated.models.csv_import_options import CsvImportOptions as CsvImportOptions
+    from src.client.generated.models.custom_field_bulk_add_to_projects_dto import CustomFieldBulkAddToProjectsDto as CustomFieldBulkAddToProjectsDto
+    from src.client.generated.models.custom_field_bulk_archive_dto import CustomFieldBulkArchiveDto as CustomFieldBulkArchiveDto
+    from src.client.generated.models.custom_field_create_dto import CustomFieldCreateDto as CustomFieldCreateDto
+    from src.client.generated.models.custom_field_dto import CustomFieldDto as CustomFieldDto
+    from src.client.generated.models.custom_field_export_field_mapping import CustomFieldExportFieldMapping as CustomFieldExportFieldMapping
+    from src.client.generated.models.custom_field_import_field_mapping import CustomFieldImportFieldMapping as CustomFieldImportFieldMapping
+    from src.client.generated.models.custom_field_merge_dto import CustomFieldMergeDto as CustomFieldMergeDto
+    from src.client.generated.models.custom_field_patch_dto import CustomFieldPatchDto as CustomFieldPatchDto
+    from src.client.generated.models.custom_field_project_count_dto import CustomFieldProjectCountDto as CustomFieldProjectCountDto
+    from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto as CustomFieldProjectDto
+    from src.client.generated.models.custom_field_project_patch_dto import CustomFieldProjectPatchDto as CustomFieldProjectPatchDto
+    from src.client.generated.models.custom_field_project_with_values_dto import CustomFieldProjectWithValuesDto as CustomFieldProjectWithValuesDto
+    from src.client.generated.models.custom_field_raw_dto import CustomFieldRawDto as CustomFieldRawDto
+    from src.client.generated.models.custom_field_schema_count_dto import CustomFieldSchemaCountDto as CustomFieldSchemaCountDto
+    from src.client.generated.models.custom_field_schema_create_dto import CustomFieldSchemaCreateDto as CustomFieldSchemaCreateDto
+    from src.client.generated.models.custom_field_schema_dto import CustomFieldSchemaDto as CustomFieldSchemaDto
+    from src.client.generated.models.custom_field_schema_patch_dto import CustomFieldSchemaPatchDto as CustomFieldSchemaPatchDto
+    from src.client.generated.models.custom_field_value_bulk_delete_dto import CustomFieldValueBulkDeleteDto as CustomFieldValueBulkDeleteDto
+    from src.client.generated.models.custom_field_value_bulk_merge_dto import CustomFieldValueBulkMergeDto as CustomFieldValueBulkMergeDto
+    from src.client.generated.models.custom_field_value_dto import CustomFieldValueDto as CustomFieldValueDto
+    from src.client.generated.models.custom_field_value_patch_dto import CustomFieldValuePatchDto as CustomFieldValuePatchDto
+    from src.client.generated.models.custom_field_value_project_create_dto import CustomFieldValueProjectCreateDto as CustomFieldValueProjectCreateDto
+    from src.client.generated.models.custom_field_value_project_merge_by_id_dto import CustomFieldValueProjectMergeByIdDto as CustomFieldValueProjectMergeByIdDto
+    from src.client.generated.models.custom_field_value_project_merge_by_name_dto import CustomFieldValueProjectMergeByNameDto as CustomFieldValueProjectMergeByNameDto
+    from src.client.generated.models.custom_field_value_project_patch_dto import CustomFieldValueProjectPatchDto as CustomFieldValueProjectPatchDto
+    from src.client.generated.models.custom_field_value_project_rename_dto import CustomFieldValueProjectRenameDto as CustomFieldValueProjectRenameDto
+    from src.client.generated.models.custom_field_value_with_cf_dto import CustomFieldValueWithCfDto as CustomFieldValueWithCfDto
+    from src.client.generated.models.custom_field_value_with_tc_count_dto import CustomFieldValueWithTcCountDto as CustomFieldValueWithTcCountDto
+    from src.client.generated.models.custom_field_with_values_dto import CustomFieldWithValuesDto as CustomFieldWithValuesDto
+    from src.client.generated.models.dashboard_copy_dto import DashboardCopyDto as DashboardCopyDto
+    from src.client.generated.models.dashboard_create_dto import DashboardCreateDto as DashboardCreateDto
+    from src.client.generated.models.dashboard_drag_and_drop_dto import DashboardDragAndDropDto as DashboardDragAndDropDto
+    from src.client.generated.models.dashboard_dto import DashboardDto as DashboardDto
+    from src.client.generated.models.dashboard_overview_dto import DashboardOverviewDto as DashboardOverviewDto
+    from src.client.generated.models.dashboard_patch_dto import DashboardPatchDto as DashboardPatchDto
+    from src.client.generated.models.dashboard_update_dto import DashboardUpdateDto as DashboardUpdateDto
+    from src.client.generated.models.default_custom_field_value_dto import DefaultCustomFieldValueDto as DefaultCustomFieldValueDto
+    from src.client.generated.models.default_text_markup_document import DefaultTextMarkupDocument as DefaultTextMarkupDocument
+    from src.client.generated.models.default_text_markup_document_all_of_content import DefaultTextMarkupDocumentAllOfContent as DefaultTextMarkupDocumentAllOfContent
+    from src.client.generated.models.default_webhook_settings import DefaultWebhookSettings as DefaultWebhookSettings
+    from src.client.generated.models.default_webhook_settings_all_of_subjects import DefaultWebhookSettingsAllOfSubjects as DefaultWebhookSettingsAllOfSubjects
+    from src.client.generated.models.defect_bulk_dto import DefectBulkDto as DefectBulkDto
+    from src.client.generated.models.defect_count_row_dto import DefectCountRowDto as DefectCountRowDto
+    from src.client.generated.models.defect_create_dto import DefectCreateDto as DefectCreateDto
+    from src.client.generated.models.defect_dto import DefectDto as DefectDto
+    from src.client.generated.models.defect_issue_link_dto import DefectIssueLinkDto as DefectIssueLinkDto
+    from src.client.generated.models.defect_matcher_create_dto import DefectMatcherCreateDto as DefectMatcherCreateDto
+    from src.client.generated.models.defect_matcher_dto import DefectMatcherDto as DefectMatcherDto
+    from src.client.generated.models.defect_matcher_patch_dto import DefectMatcherPatchDto as DefectMatcherPatchDto
+    from src.client.generated.models.defect_overview_dto import DefectOverviewDto as DefectOverviewDto
+    from src.client.generated.models.defect_patch_dto import DefectPatchDto as DefectPatchDto
+    from src.client.generated.models.defect_row_dto import DefectRowDto as DefectRowDto
+    from src.client.generated.models.defect_webhook import DefectWebhook as DefectWebhook
+    from src.client.generated.models.diff_value_change_boolean import DiffValueChangeBoolean as DiffValueChangeBoolean
+    from src.client.generated.models.diff_value_change_long import DiffValueChangeLong as DiffValueChangeLong
+    from src.client.generated.models.diff_value_change_set_long import DiffValueChangeSetLong as DiffValueChangeSetLong
+    from src.client.generated.models.diff_value_change_string import DiffValueChangeString as DiffValueChangeString
+    from src.client.generated.models.document_node import DocumentNode as DocumentNode
+    from src.client.generated.models.env_var_create_dto import EnvVarCreateDto as EnvVarCreateDto
+    from src.client.generated.models.env_var_dto import EnvVarDto as EnvVarDto
+    from src.client.generated.models.env_var_merge_dto import EnvVarMergeDto as EnvVarMergeDto
+    from src.client.generated.models.env_var_patch_dto import EnvVarPatchDto as EnvVarPatchDto
+    from src.client.generated.models.env_var_schema_create_dto import EnvVarSchemaCreateDto as EnvVarSchemaCreateDto
+    from src.client.generated.models.env_var_schema_dto import EnvVarSchemaDto as EnvVarSchemaDto
+    from src.client.generated.models.env_var_schema_patch_dto import EnvVarSchemaPatchDto as EnvVarSchemaPatchDto
+    from src.client.generated.models.env_var_value_create_dto import EnvVarValueCreateDto as EnvVarValueCreateDto
+    from src.client.generated.models.env_var_value_dto import EnvVarValueDto as EnvVarValueDto
+    from src.client.generated.models.env_var_value_patch_dto import EnvVarValuePatchDto as EnvVarValuePatchDto
+    from src.client.generated.models.environment_set_dto import EnvironmentSetDto as EnvironmentSetDto
+    from src.client.generated.models.event_type import EventType as EventType
+    from src.client.generated.models.event_type_settings import EventTypeSettings as EventTypeSettings
+    from src.client.generated.models.example_export_field_mapping import ExampleExportFieldMapping as ExampleExportFieldMapping
+    from src.client.generated.models.expected_body_step_dto import ExpectedBodyStepDto as ExpectedBodyStepDto
+    from src.client.generated.models.export_field_mapping_test_case_export_field import ExportFieldMappingTestCaseExportField as ExportFieldMappingTestCaseExportField
+    from src.client.generated.models.export_field_mapping_test_result_export_field import ExportFieldMappingTestResultExportField as ExportFieldMappingTestResultExportField
+    from src.client.generated.models.export_request_dto import ExportRequestDto as ExportRequestDto
+    from src.client.generated.models.export_status import ExportStatus as ExportStatus
+    from src.client.generated.models.export_type import ExportType as ExportType
+    from src.client.generated.models.ext_form_field import ExtFormField as ExtFormField
+    from src.client.generated.models.ext_form_field_checkbox import ExtFormFieldCheckbox as ExtFormFieldCheckbox
+    from src.client.generated.models.ext_form_field_composite import ExtFormFieldComposite as ExtFormFieldComposite
+    from src.client.generated.models.ext_form_field_external_select import ExtFormFieldExternalSelect as ExtFormFieldExternalSelect
+    from src.client.generated.models.ext_form_field_form_choice import ExtFormFieldFormChoice as ExtFormFieldFormChoice
+    from src.client.generated.models.ext_form_field_form_choice_option import ExtFormFieldFormChoiceOption as ExtFormFieldFormChoiceOption
+    from src.client.generated.models.ext_form_field_list import ExtFormFieldList as ExtFormFieldList
+    from src.client.generated.models.ext_form_field_number import ExtFormFieldNumber as ExtFormFieldNumber
+    from src.client.generated.models.ext_form_field_option import ExtFormFieldOption as ExtFormFieldOption
+    from src.client.generated.models.ext_form_field_password import ExtFormFieldPassword as ExtFormFieldPassword
+    from src.client.generated.models.ext_form_field_select import ExtFormFieldSelect as ExtFormFieldSelect
+    from src.client.generated.models.ext_form_field_slider import ExtFormFieldSlider as ExtFormFieldSlider
+    from src.client.generated.models.ext_form_field_text import ExtFormFieldText as ExtFormFieldText
+    from src.client.generated.models.ext_form_field_textarea import ExtFormFieldTextarea as ExtFormFieldTextarea
+    from src.client.generated.models.ext_form_field_unknown import ExtFormFieldUnknown as ExtFormFieldUnknown
+    from src.client.generated.models.ext_issue_link import ExtIssueLink as ExtIssueLink
+    from src.client.generated.models.ext_issue_type import ExtIssueType as ExtIssueType
+    from src.client.generated.models.ext_project import ExtProject as ExtProject
+    from src.client.generated.models.ext_select_value import ExtSelectValue as ExtSelectValue
+    from src.client.generated.models.external_link_dto import ExternalLinkDto as ExternalLinkDto
+    from src.client.generated.models.external_run_response_dto import ExternalRunResponseDto as ExternalRunResponseDto
+    from src.client.generated.models.external_run_start_request_dto import ExternalRunStartRequestDto as ExternalRunStartRequestDto
+    from src.client.generated.models.external_run_stop_request_dto import ExternalRunStopRequestDto as ExternalRunStopRequestDto
+    from src.client.generated.models.file_upload_response_dto import FileUploadResponseDto as FileUploadResponseDto
+    from src.client.generated.models.filter_base_set_dto import FilterBaseSetDto as FilterBaseSetDto
+    from src.client.generated.models.filter_create_dto import FilterCreateDto as FilterCreateDto
+    from src.client.generated.models.filter_dto import FilterDto as FilterDto
+    from src.client.generated.models.filter_patch_dto import FilterPatchDto as FilterPatchDto
+    from src.client.generated.models.filter_type_dto import FilterTypeDto as FilterTypeDto
+    from src.client.generated.models.find_all29200_response import FindAll29200Response as FindAll29200Response
+    from src.client.generated.models.global_permissions_dto import GlobalPermissionsDto as GlobalPermissionsDto
+    from src.client.generated.models.global_settings_dto import GlobalSettingsDto as GlobalSettingsDto
+    from src.client.generated.models.global_settings_project_create_patch_dto import GlobalSettingsProjectCreatePatchDto as GlobalSettingsProjectCreatePatchDto
+    from src.client.generated.models.grid_pos_dto import GridPosDto as GridPosDto
+    from src.client.generated.models.group_by import GroupBy as GroupBy
+    from src.client.generated.models.group_node_context import GroupNodeContext as GroupNodeContext
+    from src.client.generated.models.id_and_name_only_dto import IdAndNameOnlyDto as IdAndNameOnlyDto
+    from src.client.generated.models.id_only_dto import IdOnlyDto as IdOnlyDto
+    from src.client.generated.models.import_request_dto import ImportRequestDto as ImportRequestDto
+    from src.client.generated.models.import_request_info_dto import ImportRequestInfoDto as ImportRequestInfoDto
+    from src.client.generated.models.import_request_state_dto import ImportRequestStateDto as ImportRequestStateDto
+    from src.client.generated.models.import_request_type_dto import ImportRequestTypeDto as ImportRequestTypeDto
+    from src.client.generated.models.integration_create_dto import IntegrationCreateDto as IntegrationCreateDto
+    from src.client.generated.models.integration_dto import IntegrationDto as IntegrationDto
+    from src.client.generated.models.integration_export_create_dto import IntegrationExportCreateDto as IntegrationExportCreateDto
+    from src.client.generated.models.integration_export_dto import IntegrationExportDto as IntegrationExportDto
+    from src.client.generated.models.integration_export_patch_dto import IntegrationExportPatchDto as IntegrationExportPatchDto
+    from src.client.generated.models.integration_fields_form_dto import IntegrationFieldsFormDto as IntegrationFieldsFormDto
+    from src.client.generated.models.integration_fields_form_dto_default_project_fields_inner import IntegrationFieldsFormDtoDefaultProjectFieldsInner as IntegrationFieldsFormDtoDefaultProjectFieldsInner
+    from src.client.generated.models.integration_info_dto import IntegrationInfoDto as IntegrationInfoDto
+    from src.client.generated.models.integration_links_fixed_dto import IntegrationLinksFixedDto as IntegrationLinksFixedDto
+    from src.client.generated.models.integration_operation_type_dto import IntegrationOperationTypeDto as IntegrationOperationTypeDto
+    from src.client.generated.models.integration_patch_dto import IntegrationPatchDto as IntegrationPatchDto
+    from src.client.generated.models.integration_routine_type_dto import IntegrationRoutineTypeDto as IntegrationRoutineTypeDto
+    from src.client.generated.models.integration_type_dto import IntegrationTypeDto as IntegrationTypeDto
+    from src.client.generated.models.integration_validate_dto import IntegrationValidateDto as IntegrationValidateDto
+    from src.client.generated.models.integration_webhook_create_dto import IntegrationWebhookCreateDto as IntegrationWebhookCreateDto
+    from src.client.generated.models.integration_webhook_dto import IntegrationWebhookDto as IntegrationWebhookDto
+    from src.client.generated.models.integration_webhook_log_dto import IntegrationWebhookLogDto as IntegrationWebhookLogDto
+    from src.client.generated.models.integration_webhook_patch_dto import IntegrationWebhookPatchDto as IntegrationWebhookPatchDto
+    from src.client.generated.models.integration_webhook_token_dto import IntegrationWebhookTokenDto as IntegrationWebhookTokenDto
+    from src.client.generated.models.issue_create_dto import IssueCreateDto as IssueCreateDto
+    from src.client.generated.models.issue_dto import IssueDto as IssueDto
+    from src.client.generated.models.issue_import_field_mapping import IssueImportFieldMapping as IssueImportFieldMapping
+    from src.client.generated.models.issue_integration_export_field_mapping import IssueIntegrationExportFieldMapping as IssueIntegrationExportFieldMapping
+    from src.client.generated.models.issue_patch_dto import IssuePatchDto as IssuePatchDto
+    from src.client.generated.models.issue_schema_create_dto import IssueSchemaCreateDto as IssueSchemaCreateDto
+    from src.client.generated.models.issue_schema_dto import IssueSchemaDto as IssueSchemaDto
+    from src.client.generated.models.issue_schema_patch_dto import IssueSchemaPatchDto as IssueSchemaPatchDto
+    from src.client.generated.models.issue_to_create_dto import IssueToCreateDto as IssueToCreateDto
+    from src.client.generated.models.italic_mark import ItalicMark as ItalicMark
+    from src.client.generated.models.job import Job as Job
+    from src.client.generated.models.job_create_dto import JobCreateDto as JobCreateDto
+    from src.client.generated.models.job_dto import JobDto as JobDto
+    from src.client.generated.models.job_info_dto import JobInfoDto as JobInfoDto
+    from src.client.generated.models.job_mapping import JobMapping as JobMapping
+    from src.client.generated.models.job_parameter_dto import JobParameterDto as JobParameterDto
+    from src.client.generated.models.job_patch_dto import JobPatchDto as JobPatchDto
+    from src.client.generated.models.job_rerun_request_dto import JobRerunRequestDto as JobRerunRequestDto
+    from src.client.generated.models.job_run import JobRun as JobRun
+    from src.client.generated.models.job_run_dto import JobRunDto as JobRunDto
+    from src.client.generated.models.job_run_request_dto import JobRunRequestDto as JobRunRequestDto
+    from src.client.generated.models.job_run_stage_dto import JobRunStageDto as JobRunStageDto
+    from src.client.generated.models.job_run_status_dto import JobRunStatusDto as JobRunStatusDto
+    from src.client.generated.models.job_run_upload_info_dto import JobRunUploadInfoDto as JobRunUploadInfoDto
+    from src.client.generated.models.job_test_cases_stat_dto import JobTestCasesStatDto as JobTestCasesStatDto
+    from src.client.generated.models.launch import Launch as Launch
+    from src.client.generated.models.launch_cleanup_request import LaunchCleanupRequest as LaunchCleanupRequest
+    from src.client.generated.models.launch_close_config_dto import LaunchCloseConfigDto as LaunchCloseConfigDto
+    from src.client.generated.models.launch_copy_rq_dto import LaunchCopyRqDto as LaunchCopyRqDto
+    from src.client.generated.models.launch_create_and_upload_dto import LaunchCreateAndUploadDto as LaunchCreateAndUploadDto
+    from src.client.generated.models.launch_create_dto import LaunchCreateDto as LaunchCreateDto
+    from src.client.generated.models.launch_diff_cell import LaunchDiffCell as LaunchDiffCell
+    from src.client.generated.models.launch_diff_mode import LaunchDiffMode as LaunchDiffMode
+    from src.client.generated.models.launch_diff_row import LaunchDiffRow as LaunchDiffRow
+    from src.client.generated.models.launch_diff_status_change_dto import LaunchDiffStatusChangeDto as LaunchDiffStatusChangeDto
+    from src.client.generated.models.launch_diff_test_result import LaunchDiffTestResult as LaunchDiffTestResult
+    from src.client.generated.models.launch_diff_test_result_dto import LaunchDiffTestResultDto as LaunchDiffTestResultDto
+    from src.client.generated.models.launch_dto import LaunchDto as LaunchDto
+    from src.client.generated.models.launch_existing_upload_dto import LaunchExistingUploadDto as LaunchExistingUploadDto
+    from src.client.generated.models.launch_live_doc_config_dto import LaunchLiveDocConfigDto as LaunchLiveDocConfigDto
+    from src.client.generated.models.launch_member_stats_dto import LaunchMemberStatsDto as LaunchMemberStatsDto
+    from src.client.generated.models.launch_merge_dto import LaunchMergeDto as LaunchMergeDto
+    from src.client.generated.models.launch_patch_dto import LaunchPatchDto as LaunchPatchDto
+    from src.client.generated.models.launch_pdf_options import LaunchPdfOptions as LaunchPdfOptions
+    from src.client.generated.models.launch_pdf_part import LaunchPdfPart as LaunchPdfPart
+    from src.client.generated.models.launch_pdf_structure import LaunchPdfStructure as LaunchPdfStructure
+    from src.client.generated.models.launch_preview_dto import LaunchPreviewDto as LaunchPreviewDto
+    from src.client.generated.models.launch_progress_dto import LaunchProgressDto as LaunchProgressDto
+    from src.client.generated.models.launch_row_dto import LaunchRowDto as LaunchRowDto
+    from src.client.generated.models.launch_tag_create_dto import LaunchTagCreateDto as LaunchTagCreateDto
+    from src.client.generated.models.launch_tag_dto import LaunchTagDto as LaunchTagDto
+    from src.client.generated.models.launch_tag_patch_dto import LaunchTagPatchDto as LaunchTagPatchDto
+    from src.client.generated.models.launch_test_cases_add_dto import LaunchTestCasesAddDto as LaunchTestCasesAddDto
+    from src.client.generated.models.launch_test_plan_add_dto import LaunchTestPlanAddDto as LaunchTestPlanAddDto
+    from src.client.generated.models.launch_upload_response_dto import LaunchUploadResponseDto as LaunchUploadResponseDto
+    from src.client.generated.models.launch_variable_dto import LaunchVariableDto as LaunchVariableDto
+    from src.client.generated.models.launch_webhook import LaunchWebhook as LaunchWebhook
+    from src.client.generated.models.line_break_paragraph_node import LineBreakParagraphNode as LineBreakParagraphNode
+    from src.client.generated.models.link_export_field_mapping import LinkExportFieldMapping as LinkExportFieldMapping
+    from src.client.generated.models.link_import_field_mapping import LinkImportFieldMapping as LinkImportFieldMapping
+    from src.client.generated.models.link_mark import LinkMark as LinkMark
+    from src.client.generated.models.list_selection_dto import ListSelectionDto as ListSelectionDto
+    from src.client.generated.models.manual_session_request_dto import ManualSessionRequestDto as ManualSessionRequestDto
+    from src.client.generated.models.matcher import Matcher as Matcher
+    from src.client.generated.models.member_create_dto import MemberCreateDto as MemberCreateDto
+    from src.client.generated.models.member_dto import MemberDto as MemberDto
+    from src.client.generated.models.member_patch_dto import MemberPatchDto as MemberPatchDto
+    from src.client.generated.models.metric import Metric as Metric
+    from src.client.generated.models.mfa_global_settings_dto import MfaGlobalSettingsDto as MfaGlobalSettingsDto
+    from src.client.generated.models.mfa_global_settings_patch_dto import MfaGlobalSettingsPatchDto as MfaGlobalSettingsPatchDto
+    from src.client.generated.models.multi_value_export_field_mapping import MultiValueExportFieldMapping as MultiValueExportFieldMapping
+    from src.client.generated.models.multi_value_import_field_mapping import MultiValueImportFieldMapping as MultiValueImportFieldMapping
+    from src.client.generated.models.multi_value_map_string_string import MultiValueMapStringString as MultiValueMapStringString
+    from src.client.generated.models.mute_create_dto import MuteCreateDto as MuteCreateDto
+    from src.client.generated.models.mute_dto import MuteDto as MuteDto
+    from src.client.generated.models.name_only_dto import NameOnlyDto as NameOnlyDto
+    from src.client.generated.models.node_type import NodeType as NodeType
+    from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto as NormalizedScenarioDto
+    from src.client.generated.models.normalized_scenario_dto_attachments_value import NormalizedScenarioDtoAttachmentsValue as NormalizedScenarioDtoAttachmentsValue
+    from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto as NormalizedScenarioStepDto
+    from src.client.generated.models.ordered_value_dto_string import OrderedValueDtoString as OrderedValueDtoString
+    from src.client.generated.models.page_access_group_dto import PageAccessGroupDto as PageAccessGroupDto
+    from src.client.generated.models.page_access_group_dto_sort import PageAccessGroupDtoSort as PageAccessGroupDtoSort
+    from src.client.generated.models.page_access_group_pa_dto import PageAccessGroupPaDto as PageAccessGroupPaDto
+    from src.client.generated.models.page_access_group_user_dto import PageAccessGroupUserDto as PageAccessGroupUserDto
+    from src.client.generated.models.page_async_job_dto import PageAsyncJobDto as PageAsyncJobDto
+    from src.client.generated.models.page_category_dto import PageCategoryDto as PageCategoryDto
+    from src.client.generated.models.page_category_matcher_dto import PageCategoryMatcherDto as PageCategoryMatcherDto
+    from src.client.generated.models.page_cleaner_schema_dto import PageCleanerSchemaDto as PageCleanerSchemaDto
+    from src.client.generated.models.page_comment_dto import PageCommentDto as PageCommentDto
+    from src.client.generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto as PageCustomFieldProjectDto
+    from src.client.generated.models.page_custom_field_schema_dto import PageCustomFieldSchemaDto as PageCustomFieldSchemaDto
+    from src.client.generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto as PageCustomFieldValueWithTcCountDto
+    from src.client.generated.models.page_dashboard_dto import PageDashboardDto as PageDashboardDto
+    from src.client.generated.models.page_defect_count_row_dto import PageDefectCountRowDto as PageDefectCountRowDto
+    from src.client.generated.models.page_defect_dto import PageDefectDto as PageDefectDto
+    from src.client.generated.models.page_defect_matcher_dto import PageDefectMatcherDto as PageDefectMatcherDto
+    from src.client.generated.models.page_defect_row_dto import PageDefectRowDto as PageDefectRowDto
+    from src.client.generated.models.page_env_var_schema_dto import PageEnvVarSchemaDto as PageEnvVarSchemaDto
+    from src.client.generated.models.page_export_request_dto import PageExportRequestDto as PageExportRequestDto
+    from src.client.generated.models.page_filter_dto import PageFilterDto as PageFilterDto
+    from src.client.generated.models.page_id_and_name_only_dto import PageIdAndNameOnlyDto as PageIdAndNameOnlyDto
+    from src.client.generated.models.page_import_request_dto import PageImportRequestDto as PageImportRequestDto
+    from src.client.generated.models.page_integration_dto import PageIntegrationDto as PageIntegrationDto
+    from src.client.generated.models.page_integration_export_dto import PageIntegrationExportDto as PageIntegrationExportDto
+    from src.client.generated.models.page_integration_info_dto import PageIntegrationInfoDto as PageIntegrationInfoDto
+    from src.client.generated.models.page_integration_webhook_dto import PageIntegrationWebhookDto as PageIntegrationWebhookDto
+    from src.client.generated.models.page_integration_webhook_log_dto import PageIntegrationWebhookLogDto as PageIntegrationWebhookLogDto
+    from src.client.generated.models.page_issue_dto import PageIssueDto as PageIssueDto
+    from src.client.generated.models.page_issue_schema_dto import PageIssueSchemaDto as PageIssueSchemaDto
+    from src.client.generated.models.page_job_dto import PageJobDto as PageJobDto
+    from src.client.generated.models.page_launch_diff_row import PageLaunchDiffRow as PageLaunchDiffRow
+    from src.client.generated.models.page_launch_dto import PageLaunchDto as PageLaunchDto
+    from src.client.generated.models.page_launch_member_stats_dto import PageLaunchMemberStatsDto as PageLaunchMemberStatsDto
+    from src.client.generated.models.page_launch_preview_dto import PageLaunchPreviewDto as PageLaunchPreviewDto
+    from src.client.generated.models.page_launch_row_dto import PageLaunchRowDto as PageLaunchRowDto
+    from src.client.generated.models.page_launch_tag_dto import PageLaunchTagDto as PageLaunchTagDto
+    from src.client.generated.models.page_launch_variable_dto import PageLaunchVariableDto as PageLaunchVariableDto
+    from src.client.generated.models.page_member_dto import PageMemberDto as PageMemberDto
+    from src.client.generated.models.page_mute_dto import PageMuteDto as PageMuteDto
+    from src.client.generated.models.page_permission_set_dto import PagePermissionSetDto as PagePermissionSetDto
+    from src.client.generated.models.page_project_collaborator_access_dto import PageProjectCollaboratorAccessDto as PageProjectCollaboratorAccessDto
+    from src.client.generated.models.page_project_collaborator_dto import PageProjectCollaboratorDto as PageProjectCollaboratorDto
+    from src.client.generated.models.page_project_custom_field_dto import PageProjectCustomFieldDto as PageProjectCustomFieldDto
+    from src.client.generated.models.page_project_dto import PageProjectDto as PageProjectDto
+    from src.client.generated.models.page_project_group_access_dto import PageProjectGroupAccessDto as PageProjectGroupAccessDto
+    from src.client.generated.models.page_project_integration_dto import PageProjectIntegrationDto as PageProjectIntegrationDto
+    from src.client.generated.models.page_project_suggest_dto import PageProjectSuggestDto as PageProjectSuggestDto
+    from src.client.generated.models.page_role_schema_dto import PageRoleSchemaDto as PageRoleSchemaDto
+    from src.client.generated.models.page_shared_step_attachment_row_dto import PageSharedStepAttachmentRowDto as PageSharedStepAttachmentRowDto
+    from src.client.generated.models.page_shared_step_dto import PageSharedStepDto as PageSharedStepDto
+    from src.client.generated.models.page_statistic_widget_item import PageStatisticWidgetItem as PageStatisticWidgetItem
+    from src.client.generated.models.page_status_dto import PageStatusDto as PageStatusDto
+    from src.client.generated.models.page_template_dto import PageTemplateDto as PageTemplateDto
+    from src.client.generated.models.page_test_case_attachment_row_dto import PageTestCaseAttachmentRowDto as PageTestCaseAttachmentRowDto
+    from src.client.generated.models.page_test_case_audit_log_entry_dto import PageTestCaseAuditLogEntryDto as PageTestCaseAuditLogEntryDto
+    from src.client.generated.models.page_test_case_dto import PageTestCaseDto as PageTestCaseDto
+    from src.client.generated.models.page_test_case_example_dto import PageTestCaseExampleDto as PageTestCaseExampleDto
+    from src.client.generated.models.page_test_case_flat_dto import PageTestCaseFlatDto as PageTestCaseFlatDto
+    from src.client.generated.models.page_test_case_row_dto import PageTestCaseRowDto as PageTestCaseRowDto
+    from src.client.generated.models.page_test_case_tree_group_dto import PageTestCaseTreeGroupDto as PageTestCaseTreeGroupDto
+    from src.client.generated.models.page_test_case_tree_leaf_dto import PageTestCaseTreeLeafDto as PageTestCaseTreeLeafDto
+    from src.client.generated.models.page_test_case_tree_node_dto import PageTestCaseTreeNodeDto as PageTestCaseTreeNodeDto
+    from src.client.generated.models.page_test_case_tree_node_dto_content_inner import PageTestCaseTreeNodeDtoContentInner as PageTestCaseTreeNodeDtoContentInner
+    from src.client.generated.models.page_test_fixture_result_attachment_row_dto import PageTestFixtureResultAttachmentRowDto as PageTestFixtureResultAttachmentRowDto
+    from src.client.generated.models.page_test_key_schema_dto import PageTestKeySchemaDto as PageTestKeySchemaDto
+    from src.client.generated.models.page_test_layer_dto import PageTestLayerDto as PageTestLayerDto
+    from src.client.generated.models.page_test_layer_schema_dto import PageTestLayerSchemaDto as PageTestLayerSchemaDto
+    from src.client.generated.models.page_test_plan_dto import PageTestPlanDto as PageTestPlanDto
+    from src.client.generated.models.page_test_plan_row_dto import PageTestPlanRowDto as PageTestPlanRowDto
+    from src.client.generated.models.page_test_result_attachment_row_dto import PageTestResultAttachmentRowDto as PageTestResultAttachmentRowDto
+    from src.client.generated.models.page_test_result_defect_match_dto import PageTestResultDefectMatchDto as PageTestResultDefectMatchDto
+    from src.client.generated.models.page_test_result_dto import PageTestResultDto as PageTestResultDto
+    from src.client.generated.models.page_test_result_flat_dto import PageTestResultFlatDto as PageTestResultFlatDto
+    from src.client.generated.models.page_test_result_history_dto import PageTestResultHistoryDto as PageTestResultHistoryDto
+    from src.client.generated.models.page_test_result_retries_row_dto import PageTestResultRetriesRowDto as PageTestResultRetriesRowDto
+    from src.client.generated.models.page_test_result_row_dto import PageTestResultRowDto as PageTestResultRowDto
+    from src.client.generated.models.page_test_result_tree_group_dto import PageTestResultTreeGroupDto as PageTestResultTreeGroupDto
+    from src.client.generated.models.page_test_result_tree_leaf_dto import PageTestResultTreeLeafDto as PageTestResultTreeLeafDto
+    from src.client.generated.models.page_test_result_tree_node_dto import PageTestResultTreeNodeDto as PageTestResultTreeNodeDto
+    from src.client.generated.models.page_test_result_tree_node_dto_content_inner import PageTestResultTreeNodeDtoContentInner as PageTestResultTreeNodeDtoContentInner
+    from src.client.generated.models.page_tree_dto import PageTreeDto as PageTreeDto
+    from src.client.generated.models.page_tree_dto_v2 import PageTreeDtoV2 as PageTreeDtoV2
+    from src.client.generated.models.page_tree_path_dto import PageTreePathDto as PageTreePathDto
+    from src.client.generated.models.page_webhook_dto import PageWebhookDto as PageWebhookDto
+    from src.client.generated.models.page_widget_dto import PageWidgetDto as PageWidgetDto
+    from src.client.generated.models.page_workflow_dto import PageWorkflowDto as PageWorkflowDto
+    from src.client.generated.models.page_workflow_schema_dto import PageWorkflowSchemaDto as PageWorkflowSchemaDto
+    from src.client.generated.models.pageable import Pageable as Pageable
+    from src.client.generated.models.paragraph_document_node import ParagraphDocumentNode as ParagraphDocumentNode
+    from src.client.generated.models.paragraph_document_node_all_of_content import ParagraphDocumentNodeAllOfContent as ParagraphDocumentNodeAllOfContent
+    from src.client.generated.models.paragraph_node import ParagraphNode as ParagraphNode
+    from src.client.generated.models.parameter import Parameter as Parameter
+    from src.client.generated.models.parameter_value_dto import ParameterValueDto as ParameterValueDto
+    from src.client.generated.models.permission_dto import PermissionDto as PermissionDto
+    from src.client.generated.models.permission_set_create_dto import PermissionSetCreateDto as PermissionSetCreateDto
+    from src.client.generated.models.permission_set_dto import PermissionSetDto as PermissionSetDto
+    from src.client.generated.models.permission_set_patch_dto import PermissionSetPatchDto as PermissionSetPatchDto
+    from src.client.generated.models.project_access_collaborator_add_dto import ProjectAccessCollaboratorAddDto as ProjectAccessCollaboratorAddDto
+    from src.client.generated.models.project_access_group_add_dto import ProjectAccessGroupAddDto as ProjectAccessGroupAddDto
+    from src.client.generated.models.project_category_add_dto import ProjectCategoryAddDto as ProjectCategoryAddDto
+    from src.client.generated.models.project_category_matcher_add_dto import ProjectCategoryMatcherAddDto as ProjectCategoryMatcherAddDto
+    from src.client.generated.models.project_category_matcher_remove_dto import ProjectCategoryMatcherRemoveDto as ProjectCategoryMatcherRemoveDto
+    from src.client.generated.models.project_category_remove_dto import ProjectCategoryRemoveDto as ProjectCategoryRemoveDto
+    from src.client.generated.models.project_collaborator_access_dto import ProjectCollaboratorAccessDto as ProjectCollaboratorAccessDto
+    from src.client.generated.models.project_collaborator_dto import ProjectCollaboratorDto as ProjectCollaboratorDto
+    from src.client.generated.models.project_create_dto import ProjectCreateDto as ProjectCreateDto
+    from src.client.generated.models.project_custom_field_dto import ProjectCustomFieldDto as ProjectCustomFieldDto
+    from src.client.generated.models.project_dto import ProjectDto as ProjectDto
+    from src.client.generated.models.project_group_access_add_dto import ProjectGroupAccessAddDto as ProjectGroupAccessAddDto
+    from src.client.generated.models.project_group_access_dto import ProjectGroupAccessDto as ProjectGroupAccessDto
+    from src.client.generated.models.project_integration_create_dto import ProjectIntegrationCreateDto as ProjectIntegrationCreateDto
+    from src.client.generated.models.project_integration_dto import ProjectIntegrationDto as ProjectIntegrationDto
+    from src.client.generated.models.project_integration_fields_form_dto import ProjectIntegrationFieldsFormDto as ProjectIntegrationFieldsFormDto
+    from src.client.generated.models.project_integration_patch_dto import ProjectIntegrationPatchDto as ProjectIntegrationPatchDto
+    from src.client.generated.models.project_integration_validate_dto import ProjectIntegrationValidateDto as ProjectIntegrationValidateDto
+    from src.client.generated.models.project_metric_dto import ProjectMetricDto as ProjectMetricDto
+    from src.client.generated.models.project_patch_dto import ProjectPatchDto as ProjectPatchDto
+    from src.client.generated.models.project_property_create_dto import ProjectPropertyCreateDto as ProjectPropertyCreateDto
+    from src.client.generated.models.project_property_dto import ProjectPropertyDto as ProjectPropertyDto
+    from src.client.generated.models.project_property_patch_dto import ProjectPropertyPatchDto as ProjectPropertyPatchDto
+    from src.client.generated.models.project_stats_dto import ProjectStatsDto as ProjectStatsDto
+    from src.client.generated.models.project_suggest_dto import ProjectSuggestDto as ProjectSuggestDto
+    from src.client.generated.models.project_sync_request import ProjectSyncRequest as ProjectSyncRequest
+    from src.client.generated.models.project_test_case_count_dto import ProjectTestCaseCountDto as ProjectTestCaseCountDto
+    from src.client.generated.models.resolve_request_v2_dto import ResolveRequestV2Dto as ResolveRequestV2Dto
+    from src.client.generated.models.retry import Retry as Retry
+    from src.client.generated.models.role_create_dto import RoleCreateDto as RoleCreateDto
+    from src.client.generated.models.role_dto import RoleDto as RoleDto
+    from src.client.generated.models.role_export_field_mapping import RoleExportFieldMapping as RoleExportFieldMapping
+    from src.client.generated.models.role_import_field_mapping import RoleImportFieldMapping as RoleImportFieldMapping
+    from src.client.generated.models.role_patch_dto import RolePatchDto as RolePatchDto
+    from src.client.generated.models.role_schema_create_dto import RoleSchemaCreateDto as RoleSchemaCreateDto
+    from src.client.generated.models.role_schema_dto import RoleSchemaDto as RoleSchemaDto
+    from src.client.generated.models.role_schema_patch_dto import RoleSchemaPatchDto as RoleSchemaPatchDto
+    from src.client.generated.models.scenario_export_field_mapping import ScenarioExportFieldMapping as ScenarioExportFieldMapping
+    from src.client.generated.models.scenario_step_copy_dto import ScenarioStepCopyDto as ScenarioStepCopyDto
+    from src.client.generated.models.scenario_step_create_dto import ScenarioStepCreateDto as ScenarioStepCreateDto
+    from src.client.generated.models.scenario_step_created_response_dto import ScenarioStepCreatedResponseDto as ScenarioStepCreatedResponseDto
+    from src.client.generated.models.scenario_step_dto import ScenarioStepDto as ScenarioStepDto
+    from src.client.generated.models.scenario_step_move_dto import ScenarioStepMoveDto as ScenarioStepMoveDto
+    from src.client.generated.models.scenario_step_patch_dto import ScenarioStepPatchDto as ScenarioStepPatchDto
+    from src.client.generated.models.session_variable import SessionVariable as SessionVariable
+    from src.client.generated.models.shared_step_attachment_patch_dto import SharedStepAttachmentPatchDto as SharedStepAttachmentPatchDto
+    from src.client.generated.models.shared_step_attachment_row_dto import SharedStepAttachmentRowDto as SharedStepAttachmentRowDto
+    from src.client.generated.models.shared_step_create_dto import SharedStepCreateDto as SharedStepCreateDto
+    from src.client.generated.models.shared_step_dto import SharedStepDto as SharedStepDto
+    from src.client.generated.models.shared_step_patch_dto import SharedStepPatchDto as SharedStepPatchDto
+    from src.client.generated.models.shared_step_scenario_dto import SharedStepScenarioDto as SharedStepScenarioDto
+    from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner as SharedStepScenarioDtoStepsInner
+    from src.client.generated.models.shared_step_step_dto import SharedStepStepDto as SharedStepStepDto
+    from src.client.generated.models.statistic_dto import StatisticDto as StatisticDto
+    from src.client.generated.models.statistic_widget_item import StatisticWidgetItem as StatisticWidgetItem
+    from src.client.generated.models.status import Status as Status
+    from src.client.generated.models.status_create_dto import StatusCreateDto as StatusCreateDto
+    from src.client.generated.models.status_dto import StatusDto as StatusDto
+    from src.client.generated.models.status_patch_dto import StatusPatchDto as StatusPatchDto
+    from src.client.generated.models.strike_mark import StrikeMark as StrikeMark
+    from src.client.generated.models.tag_import_field_mapping import TagImportFieldMapping as TagImportFieldMapping
+    from src.client.generated.models.template_dto import TemplateDto as TemplateDto
+    from src.client.generated.models.template_overview_dto import TemplateOverviewDto as TemplateOverviewDto
+    from src.client.generated.models.test_case_association_diff import TestCaseAssociationDiff as TestCaseAssociationDiff
+    from src.client.generated.models.test_case_attachment_patch_dto import TestCaseAttachmentPatchDto as TestCaseAttachmentPatchDto
+    from src.client.generated.models.test_case_attachment_row_dto import TestCaseAttachmentRowDto as TestCaseAttachmentRowDto
+    from src.client.generated.models.test_case_audit_log_data import TestCaseAuditLogData as TestCaseAuditLogData
+    from src.client.generated.models.test_case_audit_log_data_diff import TestCaseAuditLogDataDiff as TestCaseAuditLogDataDiff
+    from src.client.generated.models.test_case_audit_log_entry_dto import TestCaseAuditLogEntryDto as TestCaseAuditLogEntryDto
+    from src.client.generated.models.test_case_bulk_cf_move_strategy import TestCaseBulkCfMoveStrategy as TestCaseBulkCfMoveStrategy
+    from src.client.generated.models.test_case_bulk_change_project_dto_v2 import TestCaseBulkChangeProjectDtoV2 as TestCaseBulkChangeProjectDtoV2
+    from src.client.generated.models.test_case_bulk_clone_dto import TestCaseBulkCloneDto as TestCaseBulkCloneDto
+    from src.client.generated.models.test_case_bulk_clone_dto_v2 import TestCaseBulkCloneDtoV2 as TestCaseBulkCloneDtoV2
+    from src.client.generated.models.test_case_bulk_drag_and_drop_dto import TestCaseBulkDragAndDropDto as TestCaseBulkDragAndDropDto
+    from src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2 import TestCaseBulkDragAndDropDtoV2 as TestCaseBulkDragAndDropDtoV2
+    from src.client.generated.models.test_case_bulk_dto import TestCaseBulkDto as TestCaseBulkDto
+    from src.client.generated.models.test_case_bulk_dto_v2 import TestCaseBulkDtoV2 as TestCaseBulkDtoV2
+    from src.client.generated.models.test_case_bulk_entity_ids_dto import TestCaseBulkEntityIdsDto as TestCaseBulkEntityIdsDto
+    from src.client.generated.models.test_case_bulk_entity_ids_dto_v2 import TestCaseBulkEntityIdsDtoV2 as TestCaseBulkEntityIdsDtoV2
+    from src.client.generated.models.test_case_bulk_export_csv_options import TestCaseBulkExportCsvOptions as TestCaseBulkExportCsvOptions
+    from src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner import TestCaseBulkExportCsvOptionsMappingInner as TestCaseBulkExportCsvOptionsMappingInner
+    from src.client.generated.models.test_case_bulk_export_pdf_options import TestCaseBulkExportPdfOptions as TestCaseBulkExportPdfOptions
+    from src.client.generated.models.test_case_bulk_external_link_dto import TestCaseBulkExternalLinkDto as TestCaseBulkExternalLinkDto
+    from src.client.generated.models.test_case_bulk_issue_dto import TestCaseBulkIssueDto as TestCaseBulkIssueDto
+    from src.client.generated.models.test_case_bulk_layer_dto import TestCaseBulkLayerDto as TestCaseBulkLayerDto
+    from src.client.generated.models.test_case_bulk_member_dto import TestCaseBulkMemberDto as TestCaseBulkMemberDto
+    from src.client.generated.models.test_case_bulk_mute_dto import TestCaseBulkMuteDto as TestCaseBulkMuteDto
+    from src.client.generated.models.test_case_bulk_new_cfv_dto import TestCaseBulkNewCfvDto as TestCaseBulkNewCfvDto
+    from src.client.generated.models.test_case_bulk_project_change_dto import TestCaseBulkProjectChangeDto as TestCaseBulkProjectChangeDto
+    from src.client.generated.models.test_case_bulk_run_existing_launch_dto import TestCaseBulkRunExistingLaunchDto as TestCaseBulkRunExistingLaunchDto
+    from src.client.generated.models.test_case_bulk_run_new_launch_dto import TestCaseBulkRunNewLaunchDto as TestCaseBulkRunNewLaunchDto
+    from src.client.generated.models.test_case_bulk_status_dto import TestCaseBulkStatusDto as TestCaseBulkStatusDto
+    from src.client.generated.models.test_case_bulk_tag_dto import TestCaseBulkTagDto as TestCaseBulkTagDto
+    from src.client.generated.models.test_case_bulk_test_plan_create_dto import TestCaseBulkTestPlanCreateDto as TestCaseBulkTestPlanCreateDto
+    from src.client.generated.models.test_case_cf_bulk_delta_dto_v2 import TestCaseCfBulkDeltaDtoV2 as TestCaseCfBulkDeltaDtoV2
+    from src.client.generated.models.test_case_cfv_bulk_add_dto import TestCaseCfvBulkAddDto as TestCaseCfvBulkAddDto
+    from src.client.generated.models.test_case_clone_rq_dto import TestCaseCloneRqDto as TestCaseCloneRqDto
+    from src.client.generated.models.test_case_count_dto import TestCaseCountDto as TestCaseCountDto
+    from src.client.generated.models.test_case_create_v2_dto import TestCaseCreateV2Dto as TestCaseCreateV2Dto
+    from src.client.generated.models.test_case_csv_export_options import TestCaseCsvExportOptions as TestCaseCsvExportOptions
+    from src.client.generated.models.test_case_csv_import_options import TestCaseCsvImportOptions as TestCaseCsvImportOptions
+    from src.client.generated.models.test_case_csv_import_options_mapping_inner import TestCaseCsvImportOptionsMappingInner as TestCaseCsvImportOptionsMappingInner
+    from src.client.generated.models.test_case_csv_preview_options import TestCaseCsvPreviewOptions as TestCaseCsvPreviewOptions
+    from src.client.generated.models.test_case_detach_automation_rq_dto import TestCaseDetachAutomationRqDto as TestCaseDetachAutomationRqDto
+    from src.client.generated.models.test_case_diff import TestCaseDiff as TestCaseDiff
+    from src.client.generated.models.test_case_dto import TestCaseDto as TestCaseDto
+    from src.client.generated.models.test_case_example_dto import TestCaseExampleDto as TestCaseExampleDto
+    from src.client.generated.models.test_case_export_field import TestCaseExportField as TestCaseExportField
+    from src.client.generated.models.test_case_external_link_bulk_add_dto import TestCaseExternalLinkBulkAddDto as TestCaseExternalLinkBulkAddDto
+    from src.client.generated.models.test_case_flat_dto import TestCaseFlatDto as TestCaseFlatDto
+    from src.client.generated.models.test_case_full_tree_node_dto import TestCaseFullTreeNodeDto as TestCaseFullTreeNodeDto
+    from src.client.generated.models.test_case_import_dto import TestCaseImportDto as TestCaseImportDto
+    from src.client.generated.models.test_case_import_field import TestCaseImportField as TestCaseImportField
+    from src.client.generated.models.test_case_import_mapping import TestCaseImportMapping as TestCaseImportMapping
+    from src.client.generated.models.test_case_info import TestCaseInfo as TestCaseInfo
+    from src.client.generated.models.test_case_issue_bulk_add_dto import TestCaseIssueBulkAddDto as TestCaseIssueBulkAddDto
+    from src.client.generated.models.test_case_last_result_dto import TestCaseLastResultDto as TestCaseLastResultDto
+    from src.client.generated.models.test_case_layer_bulk_set_dto import TestCaseLayerBulkSetDto as TestCaseLayerBulkSetDto
+    from src.client.generated.models.test_case_light_tree_node_dto import TestCaseLightTreeNodeDto as TestCaseLightTreeNodeDto
+    from src.client.generated.models.test_case_member_bulk_add_dto import TestCaseMemberBulkAddDto as TestCaseMemberBulkAddDto
+    from src.client.generated.models.test_case_mute_bulk_add_dto import TestCaseMuteBulkAddDto as TestCaseMuteBulkAddDto
+    from src.client.generated.models.test_case_overview_dto import TestCaseOverviewDto as TestCaseOverviewDto
+    from src.client.generated.models.test_case_parameter_dto import TestCaseParameterDto as TestCaseParameterDto
+    from src.client.generated.models.test_case_parameter_values import TestCaseParameterValues as TestCaseParameterValues
+    from src.client.generated.models.test_case_patch_v2_dto import TestCasePatchV2Dto as TestCasePatchV2Dto
+    from src.client.generated.models.test_case_pdf_options import TestCasePdfOptions as TestCasePdfOptions
+    from src.client.generated.models.test_case_pdf_part import TestCasePdfPart as TestCasePdfPart
+    from src.client.generated.models.test_case_relation_dto import TestCaseRelationDto as TestCaseRelationDto
+    from src.client.generated.models.test_case_relation_type_dto import TestCaseRelationTypeDto as TestCaseRelationTypeDto
+    from src.client.generated.models.test_case_row_dto import TestCaseRowDto as TestCaseRowDto
+    from src.client.generated.models.test_case_run_bulk_existing_launch_dto import TestCaseRunBulkExistingLaunchDto as TestCaseRunBulkExistingLaunchDto
+    from src.client.generated.models.test_case_run_bulk_new_launch_dto import TestCaseRunBulkNewLaunchDto as TestCaseRunBulkNewLaunchDto
+    from src.client.generated.models.test_case_run_by_stats import TestCaseRunByStats as TestCaseRunByStats
+    from src.client.generated.models.test_case_run_stats_request_dto import TestCaseRunStatsRequestDto as TestCaseRunStatsRequestDto
+    from src.client.generated.models.test_case_scenario_dto import TestCaseScenarioDto as TestCaseScenarioDto
+    from src.client.generated.models.test_case_scenario_step_dto import TestCaseScenarioStepDto as TestCaseScenarioStepDto
+    from src.client.generated.models.test_case_scenario_v2_dto import TestCaseScenarioV2Dto as TestCaseScenarioV2Dto
+    from src.client.generated.models.test_case_selection_dto_v2 import TestCaseSelectionDtoV2 as TestCaseSelectionDtoV2
+    from src.client.generated.models.test_case_status_bulk_set_dto import TestCaseStatusBulkSetDto as TestCaseStatusBulkSetDto
+    from src.client.generated.models.test_case_style import TestCaseStyle as TestCaseStyle
+    from src.client.generated.models.test_case_sync_from_to import TestCaseSyncFromTo as TestCaseSyncFromTo
+    from src.client.generated.models.test_case_sync_rq_dto import TestCaseSyncRqDto as TestCaseSyncRqDto
+    from src.client.generated.models.test_case_tag_bulk_add_dto import TestCaseTagBulkAddDto as TestCaseTagBulkAddDto
+    from src.client.generated.models.test_case_test_plan_bulk_create_dto import TestCaseTestPlanBulkCreateDto as TestCaseTestPlanBulkCreateDto
+    from src.client.generated.models.test_case_tree_all_paths_dto import TestCaseTreeAllPathsDto as TestCaseTreeAllPathsDto
+    from src.client.generated.models.test_case_tree_filter_count_dto import TestCaseTreeFilterCountDto as TestCaseTreeFilterCountDto
+    from src.client.generated.models.test_case_tree_group_add_dto import TestCaseTreeGroupAddDto as TestCaseTreeGroupAddDto
+    from src.client.generated.models.test_case_tree_group_dto import TestCaseTreeGroupDto as TestCaseTreeGroupDto
+    from src.client.generated.models.test_case_tree_group_rename_dto import TestCaseTreeGroupRenameDto as TestCaseTreeGroupRenameDto
+    from src.client.generated.models.test_case_tree_leaf_add_dto import TestCaseTreeLeafAddDto as TestCaseTreeLeafAddDto
+    from src.client.generated.models.test_case_tree_leaf_dto import TestCaseTreeLeafDto as TestCaseTreeLeafDto
+    from src.client.generated.models.test_case_tree_leaf_dto_v2 import TestCaseTreeLeafDtoV2 as TestCaseTreeLeafDtoV2
+    from src.client.generated.models.test_case_tree_leaf_rename_dto import TestCaseTreeLeafRenameDto as TestCaseTreeLeafRenameDto
+    from src.client.generated.models.test_case_tree_node_dto import TestCaseTreeNodeDto as TestCaseTreeNodeDto
+    from src.client.generated.models.test_case_tree_run_stat_request_dto import TestCaseTreeRunStatRequestDto as TestCaseTreeRunStatRequestDto
+    from src.client.generated.models.test_case_tree_selection_dto import TestCaseTreeSelectionDto as TestCaseTreeSelectionDto
+    from src.client.generated.models.test_case_tree_selection_dto_v2 import TestCaseTreeSelectionDtoV2 as TestCaseTreeSelectionDtoV2
+    from src.client.generated.models.test_case_type import TestCaseType as TestCaseType
+    from src.client.generated.models.test_case_update_field_dto import TestCaseUpdateFieldDto as TestCaseUpdateFieldDto
+    from src.client.generated.models.test_case_update_policy_dto import TestCaseUpdatePolicyDto as TestCaseUpdatePolicyDto
+    from src.client.generated.models.test_case_update_schema_create_dto import TestCaseUpdateSchemaCreateDto as TestCaseUpdateSchemaCreateDto
+    from src.client.generated.models.test_case_update_schema_dto import TestCaseUpdateSchemaDto as TestCaseUpdateSchemaDto
+    from src.client.generated.models.test_case_update_schema_patch_dto import TestCaseUpdateSchemaPatchDto as TestCaseUpdateSchemaPatchDto
+    from src.client.generated.models.test_case_version_dto import TestCaseVersionDto as TestCaseVersionDto
+    from src.client.generated.models.test_case_version_patch_dto import TestCaseVersionPatchDto as TestCaseVersionPatchDto
+    from src.client.generated.models.test_case_version_rq_dto import TestCaseVersionRqDto as TestCaseVersionRqDto
+    from src.client.generated.models.test_code_generation_request_dto import TestCodeGenerationRequestDto as TestCodeGenerationRequestDto
+    from src.client.generated.models.test_code_generation_response_dto import TestCodeGenerationResponseDto as TestCodeGenerationResponseDto
+    from src.client.generated.models.test_duration_count import TestDurationCount as TestDurationCount
+    from src.client.generated.models.test_fixture_result_attachment_patch_dto import TestFixtureResultAttachmentPatchDto as TestFixtureResultAttachmentPatchDto
+    from src.client.generated.models.test_fixture_result_attachment_row_dto import TestFixtureResultAttachmentRowDto as TestFixtureResultAttachmentRowDto
+    from src.client.generated.models.test_fixture_result_type_dto import TestFixtureResultTypeDto as TestFixtureResultTypeDto
+    from src.client.generated.models.test_fixture_result_v2_dto import TestFixtureResultV2Dto as TestFixtureResultV2Dto
+    from src.client.generated.models.test_key_dto import TestKeyDto as TestKeyDto
+    from src.client.generated.models.test_key_import_field_mapping import TestKeyImportFieldMapping as TestKeyImportFieldMapping
+    from src.client.generated.models.test_key_schema_create_dto import TestKeySchemaCreateDto as TestKeySchemaCreateDto
+    from src.client.generated.models.test_key_schema_dto import TestKeySchemaDto as TestKeySchemaDto
+    from src.client.generated.models.test_key_schema_patch_dto import TestKeySchemaPatchDto as TestKeySchemaPatchDto
+    from src.client.generated.models.test_layer_create_dto import TestLayerCreateDto as TestLayerCreateDto
+    from src.client.generated.models.test_layer_dto import TestLayerDto as TestLayerDto
+    from src.client.generated.models.test_layer_patch_dto import TestLayerPatchDto as TestLayerPatchDto
+    from src.client.generated.models.test_layer_schema_create_dto import TestLayerSchemaCreateDto as TestLayerSchemaCreateDto
+    from src.client.generated.models.test_layer_schema_dto import TestLayerSchemaDto as TestLayerSchemaDto
+    from src.client.generated.models.test_layer_schema_patch_dto import TestLayerSchemaPatchDto as TestLayerSchemaPatchDto
+    from src.client.generated.models.test_plan_assign_dto import TestPlanAssignDto as TestPlanAssignDto
+    from src.client.generated.models.test_plan_create_dto import TestPlanCreateDto as TestPlanCreateDto
+    from src.client.generated.models.test_plan_diff_dto import TestPlanDiffDto as TestPlanDiffDto
+    from src.client.generated.models.test_plan_dto import TestPlanDto as TestPlanDto
+    from src.client.generated.models.test_plan_job_parameters_dto import TestPlanJobParametersDto as TestPlanJobParametersDto
+    from src.client.generated.models.test_plan_job_stat_dto import TestPlanJobStatDto as TestPlanJobStatDto
+    from src.client.generated.models.test_plan_member_stat_dto import TestPlanMemberStatDto as TestPlanMemberStatDto
+    from src.client.generated.models.test_plan_patch_dto import TestPlanPatchDto as TestPlanPatchDto
+    from src.client.generated.models.test_plan_row_dto import TestPlanRowDto as TestPlanRowDto
+    from src.client.generated.models.test_plan_run_request_dto import TestPlanRunRequestDto as TestPlanRunRequestDto
+    from src.client.generated.models.test_plan_tree_selection_dto import TestPlanTreeSelectionDto as TestPlanTreeSelectionDto
+    from src.client.generated.models.test_plan_webhook import TestPlanWebhook as TestPlanWebhook
+    from src.client.generated.models.test_result_attachment_patch_dto import TestResultAttachmentPatchDto as TestResultAttachmentPatchDto
+    from src.client.generated.models.test_result_attachment_row_dto import TestResultAttachmentRowDto as TestResultAttachmentRowDto
+    from src.client.generated.models.test_result_attachment_step_dto import TestResultAttachmentStepDto as TestResultAttachmentStepDto
+    from src.client.generated.models.test_result_attachment_step_dto_all_of_attachment import TestResultAttachmentStepDtoAllOfAttachment as TestResultAttachmentStepDtoAllOfAttachment
+    from src.client.generated.models.test_result_body_step_dto import TestResultBodyStepDto as TestResultBodyStepDto
+    from src.client.generated.models.test_result_bulk_assign_dto import TestResultBulkAssignDto as TestResultBulkAssignDto
+    from src.client.generated.models.test_result_bulk_dto import TestResultBulkDto as TestResultBulkDto
+    from src.client.generated.models.test_result_bulk_entity_ids_dto import TestResultBulkEntityIdsDto as TestResultBulkEntityIdsDto
+    from src.client.generated.models.test_result_bulk_mute_dto import TestResultBulkMuteDto as TestResultBulkMuteDto
+    from src.client.generated.models.test_result_bulk_rerun_dto import TestResultBulkRerunDto as TestResultBulkRerunDto
+    from src.client.generated.models.test_result_bulk_resolve_dto import TestResultBulkResolveDto as TestResultBulkResolveDto
+    from src.client.generated.models.test_result_bulk_tag_dto import TestResultBulkTagDto as TestResultBulkTagDto
+    from src.client.generated.models.test_result_create_v2_dto import TestResultCreateV2Dto as TestResultCreateV2Dto
+    from src.client.generated.models.test_result_csv_export_options import TestResultCsvExportOptions as TestResultCsvExportOptions
+    from src.client.generated.models.test_result_csv_export_options_mapping_inner import TestResultCsvExportOptionsMappingInner as TestResultCsvExportOptionsMappingInner
+    from src.client.generated.models.test_result_defect_match_dto import TestResultDefectMatchDto as TestResultDefectMatchDto
+    from src.client.generated.models.test_result_defect_matcher_dto import TestResultDefectMatcherDto as TestResultDefectMatcherDto
+    from src.client.generated.models.test_result_dto import TestResultDto as TestResultDto
+    from src.client.generated.models.test_result_expected_body_step_dto import TestResultExpectedBodyStepDto as TestResultExpectedBodyStepDto
+    from src.client.generated.models.test_result_export_field import TestResultExportField as TestResultExportField
+    from src.client.generated.models.test_result_flat_dto import TestResultFlatDto as TestResultFlatDto
+    from src.client.generated.models.test_result_group_node import TestResultGroupNode as TestResultGroupNode
+    from src.client.generated.models.test_result_history_dto import TestResultHistoryDto as TestResultHistoryDto
+    from src.client.generated.models.test_result_leaf_node import TestResultLeafNode as TestResultLeafNode
+    from src.client.generated.models.test_result_link_defect_dto import TestResultLinkDefectDto as TestResultLinkDefectDto
+    from src.client.generated.models.test_result_mute_reason import TestResultMuteReason as TestResultMuteReason
+    from src.client.generated.models.test_result_new_defect_dto import TestResultNewDefectDto as TestResultNewDefectDto
+    from src.client.generated.models.test_result_parameter_dto import TestResultParameterDto as TestResultParameterDto
+    from src.client.generated.models.test_result_patch_dto import TestResultPatchDto as TestResultPatchDto
+    from src.client.generated.models.test_result_rerun_dto import TestResultRerunDto as TestResultRerunDto
+    from src.client.generated.models.test_result_retries_row_dto import TestResultRetriesRowDto as TestResultRetriesRowDto
+    from src.client.generated.models.test_result_row_dto import TestResultRowDto as TestResultRowDto
+    from src.client.generated.models.test_result_scenario_dto import TestResultScenarioDto as TestResultScenarioDto
+    from src.client.generated.models.test_result_scenario_step_dto import TestResultScenarioStepDto as TestResultScenarioStepDto
+    from src.client.generated.models.test_result_scenario_step_parameter import TestResultScenarioStepParameter as TestResultScenarioStepParameter
+    from src.client.generated.models.test_result_scenario_v2_dto import TestResultScenarioV2Dto as TestResultScenarioV2Dto
+    from src.client.generated.models.test_result_scenario_v2_dto_steps_inner import TestResultScenarioV2DtoStepsInner as TestResultScenarioV2DtoStepsInner
+    from src.client.generated.models.test_result_stats_dto import TestResultStatsDto as TestResultStatsDto
+    from src.client.generated.models.test_result_tree import TestResultTree as TestResultTree
+    from src.client.generated.models.test_result_tree_filter_count_dto import TestResultTreeFilterCountDto as TestResultTreeFilterCountDto
+    from src.client.generated.models.test_result_tree_group_dto import TestResultTreeGroupDto as TestResultTreeGroupDto
+    from src.client.generated.models.test_result_tree_group_dto_v2 import TestResultTreeGroupDtoV2 as TestResultTreeGroupDtoV2
+    from src.client.generated.models.test_result_tree_leaf_dto import TestResultTreeLeafDto as TestResultTreeLeafDto
+    from src.client.generated.models.test_result_tree_leaf_dto_v2 import TestResultTreeLeafDtoV2 as TestResultTreeLeafDtoV2
+    from src.client.generated.models.test_result_tree_node_dto import TestResultTreeNodeDto as TestResultTreeNodeDto
+    from src.client.generated.models.test_result_tree_selection_dto import TestResultTreeSelectionDto as TestResultTreeSelectionDto
+    from src.client.generated.models.test_session_response_dto import TestSessionResponseDto as TestSessionResponseDto
+    from src.client.generated.models.test_status import TestStatus as TestStatus
+    from src.client.generated.models.test_status_count import TestStatusCount as TestStatusCount
+    from src.client.generated.models.test_tag_create_dto import TestTagCreateDto as TestTagCreateDto
+    from src.client.generated.models.test_tag_dto import TestTagDto as TestTagDto
+    from src.client.generated.models.test_tag_patch_dto import TestTagPatchDto as TestTagPatchDto
+    from src.client.generated.models.text_color_mark import TextColorMark as TextColorMark
+    from src.client.generated.models.text_fill_mark import TextFillMark as TextFillMark
+    from src.client.generated.models.text_mark import TextMark as TextMark
+    from src.client.generated.models.text_markup_document import TextMarkupDocument as TextMarkupDocument
+    from src.client.generated.models.text_paragraph_node import TextParagraphNode as TextParagraphNode
+    from src.client.generated.models.text_paragraph_node_marks_inner import TextParagraphNodeMarksInner as TextParagraphNodeMarksInner
+    from src.client.generated.models.tr_scenario_step_dto import TrScenarioStepDto as TrScenarioStepDto
+    from src.client.generated.models.tree_create_dto import TreeCreateDto as TreeCreateDto
+    from src.client.generated.models.tree_custom_field_project_dto import TreeCustomFieldProjectDto as TreeCustomFieldProjectDto
+    from src.client.generated.models.tree_dto import TreeDto as TreeDto
+    from src.client.generated.models.tree_dto_v2 import TreeDtoV2 as TreeDtoV2
+    from src.client.generated.models.tree_patch_dto import TreePatchDto as TreePatchDto
+    from src.client.generated.models.tree_path_create_dto import TreePathCreateDto as TreePathCreateDto
+    from src.client.generated.models.tree_path_dto import TreePathDto as TreePathDto
+    from src.client.generated.models.tree_path_item_dto import TreePathItemDto as TreePathItemDto
+    from src.client.generated.models.tree_selection_dto import TreeSelectionDto as TreeSelectionDto
+    from src.client.generated.models.underline_mark import UnderlineMark as UnderlineMark
+    from src.client.generated.models.upload_attachment_dto import UploadAttachmentDto as UploadAttachmentDto
+    from src.client.generated.models.upload_fixtures_results_dto import UploadFixturesResultsDto as UploadFixturesResultsDto
+    from src.client.generated.models.upload_label_dto import UploadLabelDto as UploadLabelDto
+    from src.client.generated.models.upload_link_dto import UploadLinkDto as UploadLinkDto
+    from src.client.generated.models.upload_parameter_dto import UploadParameterDto as UploadParameterDto
+    from src.client.generated.models.upload_results_dto import UploadResultsDto as UploadResultsDto
+    from src.client.generated.models.upload_results_response_dto import UploadResultsResponseDto as UploadResultsResponseDto
+    from src.client.generated.models.upload_test_case_dto import UploadTestCaseDto as UploadTestCaseDto
+    from src.client.generated.models.upload_test_fixture_result_dto import UploadTestFixtureResultDto as UploadTestFixtureResultDto
+    from src.client.generated.models.upload_test_fixture_result_dto_steps_inner import UploadTestFixtureResultDtoStepsInner as UploadTestFixtureResultDtoStepsInner
+    from src.client.generated.models.upload_test_fixture_type import UploadTestFixtureType as UploadTestFixtureType
+    from src.client.generated.models.upload_test_result_attachment_step_dto import UploadTestResultAttachmentStepDto as UploadTestResultAttachmentStepDto
+    from src.client.generated.models.upload_test_result_body_step_dto import UploadTestResultBodyStepDto as UploadTestResultBodyStepDto
+    from src.client.generated.models.upload_test_result_dto import UploadTestResultDto as UploadTestResultDto
+    from src.client.generated.models.upload_test_result_expected_body_step_dto import UploadTestResultExpectedBodyStepDto as UploadTestResultExpectedBodyStepDto
+    from src.client.generated.models.upload_test_result_step_dto import UploadTestResultStepDto as UploadTestResultStepDto
+    from src.client.generated.models.upload_test_status import UploadTestStatus as UploadTestStatus
+    from src.client.generated.models.webhook_create_dto import WebhookCreateDto as WebhookCreateDto
+    from src.client.generated.models.webhook_dto import WebhookDto as WebhookDto
+    from src.client.generated.models.webhook_patch_dto import WebhookPatchDto as WebhookPatchDto
+    from src.client.generated.models.webhook_settings import WebhookSettings as WebhookSettings
+    from src.client.generated.models.webhook_subject import WebhookSubject as WebhookSubject
+    from src.client.generated.models.webhook_validate_dto import WebhookValidateDto as WebhookValidateDto
+    from src.client.generated.models.widget_create_dto import WidgetCreateDto as WidgetCreateDto
+    from src.client.generated.models.widget_create_dto_options import WidgetCreateDtoOptions as WidgetCreateDtoOptions
+    from src.client.generated.models.widget_data_dto import WidgetDataDto as WidgetDataDto
+    from src.client.generated.models.widget_dto import WidgetDto as WidgetDto
+    from src.client.generated.models.widget_options import WidgetOptions as WidgetOptions
+    from src.client.generated.models.widget_options_analytic_graph import WidgetOptionsAnalyticGraph as WidgetOptionsAnalyticGraph
+    from src.client.generated.models.widget_options_having_settable_aql import WidgetOptionsHavingSettableAql as WidgetOptionsHavingSettableAql
+    from src.client.generated.models.widget_options_last_launch_pie_chart import WidgetOptionsLastLaunchPieChart as WidgetOptionsLastLaunchPieChart
+    from src.client.generated.models.widget_options_launch_list import WidgetOptionsLaunchList as WidgetOptionsLaunchList
+    from src.client.generated.models.widget_options_launch_trend import WidgetOptionsLaunchTrend as WidgetOptionsLaunchTrend
+    from src.client.generated.models.widget_options_markdown import WidgetOptionsMarkdown as WidgetOptionsMarkdown
+    from src.client.generated.models.widget_options_statistic_trend import WidgetOptionsStatisticTrend as WidgetOptionsStatisticTrend
+    from src.client.generated.models.widget_options_tc_pie_chart import WidgetOptionsTcPieChart as WidgetOptionsTcPieChart
+    from src.client.generated.models.widget_options_tc_tree_map import WidgetOptionsTcTreeMap as WidgetOptionsTcTreeMap
+    from src.client.generated.models.widget_options_top_tc import WidgetOptionsTopTc as WidgetOptionsTopTc
+    from src.client.generated.models.widget_options_trend import WidgetOptionsTrend as WidgetOptionsTrend
+    from src.client.generated.models.widget_options_trend_v2 import WidgetOptionsTrendV2 as WidgetOptionsTrendV2
+    from src.client.generated.models.widget_patch_dto import WidgetPatchDto as WidgetPatchDto
+    from src.client.generated.models.widget_type_dto import WidgetTypeDto as WidgetTypeDto
+    from src.client.generated.models.workflow_create_dto import WorkflowCreateDto as WorkflowCreateDto
+    from src.client.generated.models.workflow_dto import WorkflowDto as WorkflowDto
+    from src.client.generated.models.workflow_patch_dto import WorkflowPatchDto as WorkflowPatchDto
+    from src.client.generated.models.workflow_row_dto import WorkflowRowDto as WorkflowRowDto
+    from src.client.generated.models.workflow_schema_create_dto import WorkflowSchemaCreateDto as WorkflowSchemaCreateDto
+    from src.client.generated.models.workflow_schema_dto import WorkflowSchemaDto as WorkflowSchemaDto
+    from src.client.generated.models.workflow_schema_patch_dto import WorkflowSchemaPatchDto as WorkflowSchemaPatchDto
 
 # import ApiClient
-from src.client.generated.api_response import ApiResponse as ApiResponse
-from src.client.generated.api_client import ApiClient as ApiClient
-from src.client.generated.configuration import Configuration as Configuration
-from src.client.generated.exceptions import OpenApiException as OpenApiException
-from src.client.generated.exceptions import ApiTypeError as ApiTypeError
-from src.client.generated.exceptions import ApiValueError as ApiValueError
-from src.client.generated.exceptions import ApiKeyError as ApiKeyError
-from src.client.generated.exceptions import ApiAttributeError as ApiAttributeError
-from src.client.generated.exceptions import ApiException as ApiException
 
-# import models into sdk package
-from src.client.generated.models.access_group_bulk_dto import AccessGroupBulkDto as AccessGroupBulkDto
-from src.client.generated.models.access_group_create_dto import AccessGroupCreateDto as AccessGroupCreateDto
-from src.client.generated.models.access_group_dto import AccessGroupDto as AccessGroupDto
-from src.client.generated.models.access_group_pa_dto import AccessGroupPaDto as AccessGroupPaDto
-from src.client.generated.models.access_group_patch_dto import AccessGroupPatchDto as AccessGroupPatchDto
-from src.client.generated.models.access_group_project_access_dto import AccessGroupProjectAccessDto as AccessGroupProjectAccessDto
-from src.client.generated.models.access_group_projects_add_dto import AccessGroupProjectsAddDto as AccessGroupProjectsAddDto
-from src.client.generated.models.access_group_user_dto import AccessGroupUserDto as AccessGroupUserDto
-from src.client.generated.models.access_group_users_add_dto import AccessGroupUsersAddDto as AccessGroupUsersAddDto
-from src.client.generated.models.allowed_role_dto import AllowedRoleDto as AllowedRoleDto
-from src.client.generated.models.analytic_automation_trend_dto import AnalyticAutomationTrendDto as AnalyticAutomationTrendDto
-from src.client.generated.models.analytic_dto import AnalyticDto as AnalyticDto
-from src.client.generated.models.analytic_interval import AnalyticInterval as AnalyticInterval
-from src.client.generated.models.analytic_launch_duration_histogram_dto import AnalyticLaunchDurationHistogramDto as AnalyticLaunchDurationHistogramDto
-from src.client.generated.models.analytic_mute_trend_dto import AnalyticMuteTrendDto as AnalyticMuteTrendDto
-from src.client.generated.models.analytic_tc_automation_count_dto import AnalyticTcAutomationCountDto as AnalyticTcAutomationCountDto
-from src.client.generated.models.analytic_tc_status_count_dto import AnalyticTcStatusCountDto as AnalyticTcStatusCountDto
-from src.client.generated.models.analytic_tr_by_status_trend_dto import AnalyticTrByStatusTrendDto as AnalyticTrByStatusTrendDto
-from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto as AqlValidateResponseDto
-from src.client.generated.models.assign_request_dto import AssignRequestDto as AssignRequestDto
-from src.client.generated.models.async_job_dto import AsyncJobDto as AsyncJobDto
-from src.client.generated.models.async_job_status_dto import AsyncJobStatusDto as AsyncJobStatusDto
-from src.client.generated.models.async_job_step_dto import AsyncJobStepDto as AsyncJobStepDto
-from src.client.generated.models.async_job_step_status_dto import AsyncJobStepStatusDto as AsyncJobStepStatusDto
-from src.client.generated.models.async_job_with_steps_dto import AsyncJobWithStepsDto as AsyncJobWithStepsDto
-from src.client.generated.models.attachment_row import AttachmentRow as AttachmentRow
-from src.client.generated.models.attachment_step_dto import AttachmentStepDto as AttachmentStepDto
-from src.client.generated.models.attrs import Attrs as Attrs
-from src.client.generated.models.audit_action_type_dto import AuditActionTypeDto as AuditActionTypeDto
-from src.client.generated.models.blob_storage_stats import BlobStorageStats as BlobStorageStats
-from src.client.generated.models.blob_storage_update_stats import BlobStorageUpdateStats as BlobStorageUpdateStats
-from src.client.generated.models.body_step_dto import BodyStepDto as BodyStepDto
-from src.client.generated.models.bold_mark import BoldMark as BoldMark
-from src.client.generated.models.business_metric_dto import BusinessMetricDto as BusinessMetricDto
-from src.client.generated.models.category_create_dto import CategoryCreateDto as CategoryCreateDto
-from src.client.generated.models.category_dto import CategoryDto as CategoryDto
-from src.client.generated.models.category_matcher_create_dto import CategoryMatcherCreateDto as CategoryMatcherCreateDto
-from src.client.generated.models.category_matcher_dto import CategoryMatcherDto as CategoryMatcherDto
-from src.client.generated.models.category_matcher_patch_dto import CategoryMatcherPatchDto as CategoryMatcherPatchDto
-from src.client.generated.models.category_patch_dto import CategoryPatchDto as CategoryPatchDto
-from src.client.generated.models.cfv_merge_to_existing_global_value_dto import CfvMergeToExistingGlobalValueDto as CfvMergeToExistingGlobalValueDto
-from src.client.generated.models.cfv_merge_to_new_global_value_dto import CfvMergeToNewGlobalValueDto as CfvMergeToNewGlobalValueDto
-from src.client.generated.models.ci import Ci as Ci
-from src.client.generated.models.cleaner_schema_create_dto import CleanerSchemaCreateDto as CleanerSchemaCreateDto
-from src.client.generated.models.cleaner_schema_dto import CleanerSchemaDto as CleanerSchemaDto
-from src.client.generated.models.cleaner_schema_patch_dto import CleanerSchemaPatchDto as CleanerSchemaPatchDto
-from src.client.generated.models.cleaner_schema_target_dto import CleanerSchemaTargetDto as CleanerSchemaTargetDto
-from src.client.generated.models.code_block_document_node import CodeBlockDocumentNode as CodeBlockDocumentNode
-from src.client.generated.models.code_mark import CodeMark as CodeMark
-from src.client.generated.models.comment_create_dto import CommentCreateDto as CommentCreateDto
-from src.client.generated.models.comment_dto import CommentDto as CommentDto
-from src.client.generated.models.comment_patch_dto import CommentPatchDto as CommentPatchDto
-from src.client.generated.models.create_launch_event import CreateLaunchEvent as CreateLaunchEvent
-from src.client.generated.models.csv_import_options import CsvImportOptions as CsvImportOptions
-from src.client.generated.models.custom_field_bulk_add_to_projects_dto import CustomFieldBulkAddToProjectsDto as CustomFieldBulkAddToProjectsDto
-from src.client.generated.models.custom_field_bulk_archive_dto import CustomFieldBulkArchiveDto as CustomFieldBulkArchiveDto
-from src.client.generated.models.custom_field_create_dto import CustomFieldCreateDto as CustomFieldCreateDto
-from src.client.generated.models.custom_field_dto import CustomFieldDto as CustomFieldDto
-from src.client.generated.models.custom_field_export_field_mapping import CustomFieldExportFieldMapping as CustomFieldExportFieldMapping
-from src.client.generated.models.custom_field_import_field_mapping import CustomFieldImportFieldMapping as CustomFieldImportFieldMapping
-from src.client.generated.models.custom_field_merge_dto import CustomFieldMergeDto as CustomFieldMergeDto
-from src.client.generated.models.custom_field_patch_dto import CustomFieldPatchDto as CustomFieldPatchDto
-from src.client.generated.models.custom_field_project_count_dto import CustomFieldProjectCountDto as CustomFieldProjectCountDto
-from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto as CustomFieldProjectDto
-from src.client.generated.models.custom_field_project_patch_dto import CustomFieldProjectPatchDto as CustomFieldProjectPatchDto
-from src.client.generated.models.custom_field_project_with_values_dto import CustomFieldProjectWithValuesDto as CustomFieldProjectWithValuesDto
-from src.client.generated.models.custom_field_raw_dto import CustomFieldRawDto as CustomFieldRawDto
-from src.client.generated.models.custom_field_schema_count_dto import CustomFieldSchemaCountDto as CustomFieldSchemaCountDto
-from src.client.generated.models.custom_field_schema_create_dto import CustomFieldSchemaCreateDto as CustomFieldSchemaCreateDto
-from src.client.generated.models.custom_field_schema_dto import CustomFieldSchemaDto as CustomFieldSchemaDto
-from src.client.generated.models.custom_field_schema_patch_dto import CustomFieldSchemaPatchDto as CustomFieldSchemaPatchDto
-from src.client.generated.models.custom_field_value_bulk_delete_dto import CustomFieldValueBulkDeleteDto as CustomFieldValueBulkDeleteDto
-from src.client.generated.models.custom_field_value_bulk_merge_dto import CustomFieldValueBulkMergeDto as CustomFieldValueBulkMergeDto
-from src.client.generated.models.custom_field_value_dto import CustomFieldValueDto as CustomFieldValueDto
-from src.client.generated.models.custom_field_value_patch_dto import CustomFieldValuePatchDto as CustomFieldValuePatchDto
-from src.client.generated.models.custom_field_value_project_create_dto import CustomFieldValueProjectCreateDto as CustomFieldValueProjectCreateDto
-from src.client.generated.models.custom_field_value_project_merge_by_id_dto import CustomFieldValueProjectMergeByIdDto as CustomFieldValueProjectMergeByIdDto
-from src.client.generated.models.custom_field_value_project_merge_by_name_dto import CustomFieldValueProjectMergeByNameDto as CustomFieldValueProjectMergeByNameDto
-from src.client.generated.models.custom_field_value_project_patch_dto import CustomFieldValueProjectPatchDto as CustomFieldValueProjectPatchDto
-from src.client.generated.models.custom_field_value_project_rename_dto import CustomFieldValueProjectRenameDto as CustomFieldValueProjectRenameDto
-from src.client.generated.models.custom_field_value_with_cf_dto import CustomFieldValueWithCfDto as CustomFieldValueWithCfDto
-from src.client.generated.models.custom_field_value_with_tc_count_dto import CustomFieldValueWithTcCountDto as CustomFieldValueWithTcCountDto
-from src.client.generated.models.custom_field_with_values_dto import CustomFieldWithValuesDto as CustomFieldWithValuesDto
-from src.client.generated.models.dashboard_copy_dto import DashboardCopyDto as DashboardCopyDto
-from src.client.generated.models.dashboard_create_dto import DashboardCreateDto as DashboardCreateDto
-from src.client.generated.models.dashboard_drag_and_drop_dto import DashboardDragAndDropDto as DashboardDragAndDropDto
-from src.client.generated.models.dashboard_dto import DashboardDto as DashboardDto
-from src.client.generated.models.dashboard_overview_dto import DashboardOverviewDto as DashboardOverviewDto
-from src.client.generated.models.dashboard_patch_dto import DashboardPatchDto as DashboardPatchDto
-from src.client.generated.models.dashboard_update_dto import DashboardUpdateDto as DashboardUpdateDto
-from src.client.generated.models.default_custom_field_value_dto import DefaultCustomFieldValueDto as DefaultCustomFieldValueDto
-from src.client.generated.models.default_text_markup_document import DefaultTextMarkupDocument as DefaultTextMarkupDocument
-from src.client.generated.models.default_text_markup_document_all_of_content import DefaultTextMarkupDocumentAllOfContent as DefaultTextMarkupDocumentAllOfContent
-from src.client.generated.models.default_webhook_settings import DefaultWebhookSettings as DefaultWebhookSettings
-from src.client.generated.models.default_webhook_settings_all_of_subjects import DefaultWebhookSettingsAllOfSubjects as DefaultWebhookSettingsAllOfSubjects
-from src.client.generated.models.defect_bulk_dto import DefectBulkDto as DefectBulkDto
-from src.client.generated.models.defect_count_row_dto import DefectCountRowDto as DefectCountRowDto
-from src.client.generated.models.defect_create_dto import DefectCreateDto as DefectCreateDto
-from src.client.generated.models.defect_dto import DefectDto as DefectDto
-from src.client.generated.models.defect_issue_link_dto import DefectIssueLinkDto as DefectIssueLinkDto
-from src.client.generated.models.defect_matcher_create_dto import DefectMatcherCreateDto as DefectMatcherCreateDto
-from src.client.generated.models.defect_matcher_dto import DefectMatcherDto as DefectMatcherDto
-from src.client.generated.models.defect_matcher_patch_dto import DefectMatcherPatchDto as DefectMatcherPatchDto
-from src.client.generated.models.defect_overview_dto import DefectOverviewDto as DefectOverviewDto
-from src.client.generated.models.defect_patch_dto import DefectPatchDto as DefectPatchDto
-from src.client.generated.models.defect_row_dto import DefectRowDto as DefectRowDto
-from src.client.generated.models.defect_webhook import DefectWebhook as DefectWebhook
-from src.client.generated.models.diff_value_change_boolean import DiffValueChangeBoolean as DiffValueChangeBoolean
-from src.client.generated.models.diff_value_change_long import DiffValueChangeLong as DiffValueChangeLong
-from src.client.generated.models.diff_value_change_set_long import DiffValueChangeSetLong as DiffValueChangeSetLong
-from src.client.generated.models.diff_value_change_string import DiffValueChangeString as DiffValueChangeString
-from src.client.generated.models.document_node import DocumentNode as DocumentNode
-from src.client.generated.models.env_var_create_dto import EnvVarCreateDto as EnvVarCreateDto
-from src.client.generated.models.env_var_dto import EnvVarDto as EnvVarDto
-from src.client.generated.models.env_var_merge_dto import EnvVarMergeDto as EnvVarMergeDto
-from src.client.generated.models.env_var_patch_dto import EnvVarPatchDto as EnvVarPatchDto
-from src.client.generated.models.env_var_schema_create_dto import EnvVarSchemaCreateDto as EnvVarSchemaCreateDto
-from src.client.generated.models.env_var_schema_dto import EnvVarSchemaDto as EnvVarSchemaDto
-from src.client.generated.models.env_var_schema_patch_dto import EnvVarSchemaPatchDto as EnvVarSchemaPatchDto
-from src.client.generated.models.env_var_value_create_dto import EnvVarValueCreateDto as EnvVarValueCreateDto
-from src.client.generated.models.env_var_value_dto import EnvVarValueDto as EnvVarValueDto
-from src.client.generated.models.env_var_value_patch_dto import EnvVarValuePatchDto as EnvVarValuePatchDto
-from src.client.generated.models.environment_set_dto import EnvironmentSetDto as EnvironmentSetDto
-from src.client.generated.models.event_type import EventType as EventType
-from src.client.generated.models.event_type_settings import EventTypeSettings as EventTypeSettings
-from src.client.generated.models.example_export_field_mapping import ExampleExportFieldMapping as ExampleExportFieldMapping
-from src.client.generated.models.expected_body_step_dto import ExpectedBodyStepDto as ExpectedBodyStepDto
-from src.client.generated.models.export_field_mapping_test_case_export_field import ExportFieldMappingTestCaseExportField as ExportFieldMappingTestCaseExportField
-from src.client.generated.models.export_field_mapping_test_result_export_field import ExportFieldMappingTestResultExportField as ExportFieldMappingTestResultExportField
-from src.client.generated.models.export_request_dto import ExportRequestDto as ExportRequestDto
-from src.client.generated.models.export_status import ExportStatus as ExportStatus
-from src.client.generated.models.export_type import ExportType as ExportType
-from src.client.generated.models.ext_form_field import ExtFormField as ExtFormField
-from src.client.generated.models.ext_form_field_checkbox import ExtFormFieldCheckbox as ExtFormFieldCheckbox
-from src.client.generated.models.ext_form_field_composite import ExtFormFieldComposite as ExtFormFieldComposite
-from src.client.generated.models.ext_form_field_external_select import ExtFormFieldExternalSelect as ExtFormFieldExternalSelect
-from src.client.generated.models.ext_form_field_form_choice import ExtFormFieldFormChoice as ExtFormFieldFormChoice
-from src.client.generated.models.ext_form_field_form_choice_option import ExtFormFieldFormChoiceOption as ExtFormFieldFormChoiceOption
-from src.client.generated.models.ext_form_field_list import ExtFormFieldList as ExtFormFieldList
-from src.client.generated.models.ext_form_field_number import ExtFormFieldNumber as ExtFormFieldNumber
-from src.client.generated.models.ext_form_field_option import ExtFormFieldOption as ExtFormFieldOption
-from src.client.generated.models.ext_form_field_password import ExtFormFieldPassword as ExtFormFieldPassword
-from src.client.generated.models.ext_form_field_select import ExtFormFieldSelect as ExtFormFieldSelect
-from src.client.generated.models.ext_form_field_slider import ExtFormFieldSlider as ExtFormFieldSlider
-from src.client.generated.models.ext_form_field_text import ExtFormFieldText as ExtFormFieldText
-from src.client.generated.models.ext_form_field_textarea import ExtFormFieldTextarea as ExtFormFieldTextarea
-from src.client.generated.models.ext_form_field_unknown import ExtFormFieldUnknown as ExtFormFieldUnknown
-from src.client.generated.models.ext_issue_link import ExtIssueLink as ExtIssueLink
-from src.client.generated.models.ext_issue_type import ExtIssueType as ExtIssueType
-from src.client.generated.models.ext_project import ExtProject as ExtProject
-from src.client.generated.models.ext_select_value import ExtSelectValue as ExtSelectValue
-from src.client.generated.models.external_link_dto import ExternalLinkDto as ExternalLinkDto
-from src.client.generated.models.external_run_response_dto import ExternalRunResponseDto as ExternalRunResponseDto
-from src.client.generated.models.external_run_start_request_dto import ExternalRunStartRequestDto as ExternalRunStartRequestDto
-from src.client.generated.models.external_run_stop_request_dto import ExternalRunStopRequestDto as ExternalRunStopRequestDto
-from src.client.generated.models.file_upload_response_dto import FileUploadResponseDto as FileUploadResponseDto
-from src.client.generated.models.filter_base_set_dto import FilterBaseSetDto as FilterBaseSetDto
-from src.client.generated.models.filter_create_dto import FilterCreateDto as FilterCreateDto
-from src.client.generated.models.filter_dto import FilterDto as FilterDto
-from src.client.generated.models.filter_patch_dto import FilterPatchDto as FilterPatchDto
-from src.client.generated.models.filter_type_dto import FilterTypeDto as FilterTypeDto
-from src.client.generated.models.find_all29200_response import FindAll29200Response as FindAll29200Response
-from src.client.generated.models.global_permissions_dto import GlobalPermissionsDto as GlobalPermissionsDto
-from src.client.generated.models.global_settings_dto import GlobalSettingsDto as GlobalSettingsDto
-from src.client.generated.models.global_settings_project_create_patch_dto import GlobalSettingsProjectCreatePatchDto as GlobalSettingsProjectCreatePatchDto
-from src.client.generated.models.grid_pos_dto import GridPosDto as GridPosDto
-from src.client.generated.models.group_by import GroupBy as GroupBy
-from src.client.generated.models.group_node_context import GroupNodeContext as GroupNodeContext
-from src.client.generated.models.id_and_name_only_dto import IdAndNameOnlyDto as IdAndNameOnlyDto
-from src.client.generated.models.id_only_dto import IdOnlyDto as IdOnlyDto
-from src.client.generated.models.import_request_dto import ImportRequestDto as ImportRequestDto
-from src.client.generated.models.import_request_info_dto import ImportRequestInfoDto as ImportRequestInfoDto
-from src.client.generated.models.import_request_state_dto import ImportRequestStateDto as ImportRequestStateDto
-from src.client.generated.models.import_request_type_dto import ImportRequestTypeDto as ImportRequestTypeDto
-from src.client.generated.models.integration_create_dto import IntegrationCreateDto as IntegrationCreateDto
-from src.client.generated.models.integration_dto import IntegrationDto as IntegrationDto
-from src.client.generated.models.integration_export_create_dto import IntegrationExportCreateDto as IntegrationExportCreateDto
-from src.client.generated.models.integration_export_dto import IntegrationExportDto as IntegrationExportDto
-from src.client.generated.models.integration_export_patch_dto import IntegrationExportPatchDto as IntegrationExportPatchDto
-from src.client.generated.models.integration_fields_form_dto import IntegrationFieldsFormDto as IntegrationFieldsFormDto
-from src.client.generated.models.integration_fields_form_dto_default_project_fields_inner import IntegrationFieldsFormDtoDefaultProjectFieldsInner as IntegrationFieldsFormDtoDefaultProjectFieldsInner
-from src.client.generated.models.integration_info_dto import IntegrationInfoDto as IntegrationInfoDto
-from src.client.generated.models.integration_links_fixed_dto import IntegrationLinksFixedDto as IntegrationLinksFixedDto
-from src.client.generated.models.integration_operation_type_dto import IntegrationOperationTypeDto as IntegrationOperationTypeDto
-from src.client.generated.models.integration_patch_dto import IntegrationPatchDto as IntegrationPatchDto
-from src.client.generated.models.integration_routine_type_dto import IntegrationRoutineTypeDto as IntegrationRoutineTypeDto
-from src.client.generated.models.integration_type_dto import IntegrationTypeDto as IntegrationTypeDto
-from src.client.generated.models.integration_validate_dto import IntegrationValidateDto as IntegrationValidateDto
-from src.client.generated.models.integration_webhook_create_dto import IntegrationWebhookCreateDto as IntegrationWebhookCreateDto
-from src.client.generated.models.integration_webhook_dto import IntegrationWebhookDto as IntegrationWebhookDto
-from src.client.generated.models.integration_webhook_log_dto import IntegrationWebhookLogDto as IntegrationWebhookLogDto
-from src.client.generated.models.integration_webhook_patch_dto import IntegrationWebhookPatchDto as IntegrationWebhookPatchDto
-from src.client.generated.models.integration_webhook_token_dto import IntegrationWebhookTokenDto as IntegrationWebhookTokenDto
-from src.client.generated.models.issue_create_dto import IssueCreateDto as IssueCreateDto
-from src.client.generated.models.issue_dto import IssueDto as IssueDto
-from src.client.generated.models.issue_import_field_mapping import IssueImportFieldMapping as IssueImportFieldMapping
-from src.client.generated.models.issue_integration_export_field_mapping import IssueIntegrationExportFieldMapping as IssueIntegrationExportFieldMapping
-from src.client.generated.models.issue_patch_dto import IssuePatchDto as IssuePatchDto
-from src.client.generated.models.issue_schema_create_dto import IssueSchemaCreateDto as IssueSchemaCreateDto
-from src.client.generated.models.issue_schema_dto import IssueSchemaDto as IssueSchemaDto
-from src.client.generated.models.issue_schema_patch_dto import IssueSchemaPatchDto as IssueSchemaPatchDto
-from src.client.generated.models.issue_to_create_dto import IssueToCreateDto as IssueToCreateDto
-from src.client.generated.models.italic_mark import ItalicMark as ItalicMark
-from src.client.generated.models.job import Job as Job
-from src.client.generated.models.job_create_dto import JobCreateDto as JobCreateDto
-from src.client.generated.models.job_dto import JobDto as JobDto
-from src.client.generated.models.job_info_dto import JobInfoDto as JobInfoDto
-from src.client.generated.models.job_mapping import JobMapping as JobMapping
-from src.client.generated.models.job_parameter_dto import JobParameterDto as JobParameterDto
-from src.client.generated.models.job_patch_dto import JobPatchDto as JobPatchDto
-from src.client.generated.models.job_rerun_request_dto import JobRerunRequestDto as JobRerunRequestDto
-from src.client.generated.models.job_run import JobRun as JobRun
-from src.client.generated.models.job_run_dto import JobRunDto as JobRunDto
-from src.client.generated.models.job_run_request_dto import JobRunRequestDto as JobRunRequestDto
-from src.client.generated.models.job_run_stage_dto import JobRunStageDto as JobRunStageDto
-from src.client.generated.models.job_run_status_dto import JobRunStatusDto as JobRunStatusDto
-from src.client.generated.models.job_run_upload_info_dto import JobRunUploadInfoDto as JobRunUploadInfoDto
-from src.client.generated.models.job_test_cases_stat_dto import JobTestCasesStatDto as JobTestCasesStatDto
-from src.client.generated.models.launch import Launch as Launch
-from src.client.generated.models.launch_cleanup_request import LaunchCleanupRequest as LaunchCleanupRequest
-from src.client.generated.models.launch_close_config_dto import LaunchCloseConfigDto as LaunchCloseConfigDto
-from src.client.generated.models.launch_copy_rq_dto import LaunchCopyRqDto as LaunchCopyRqDto
-from src.client.generated.models.launch_create_and_upload_dto import LaunchCreateAndUploadDto as LaunchCreateAndUploadDto
-from src.client.generated.models.launch_create_dto import LaunchCreateDto as LaunchCreateDto
-from src.client.generated.models.launch_diff_cell import LaunchDiffCell as LaunchDiffCell
-from src.client.generated.models.launch_diff_mode import LaunchDiffMode as LaunchDiffMode
-from src.client.generated.models.launch_diff_row import LaunchDiffRow as LaunchDiffRow
-from src.client.generated.models.launch_diff_status_change_dto import LaunchDiffStatusChangeDto as LaunchDiffStatusChangeDto
-from src.client.generated.models.launch_diff_test_result import LaunchDiffTestResult as LaunchDiffTestResult
-from src.client.generated.models.launch_diff_test_result_dto import LaunchDiffTestResultDto as LaunchDiffTestResultDto
-from src.client.generated.models.launch_dto import LaunchDto as LaunchDto
-from src.client.generated.models.launch_existing_upload_dto import LaunchExistingUploadDto as LaunchExistingUploadDto
-from src.client.generated.models.launch_live_doc_config_dto import LaunchLiveDocConfigDto as LaunchLiveDocConfigDto
-from src.client.generated.models.launch_member_stats_dto import LaunchMemberStatsDto as LaunchMemberStatsDto
-from src.client.generated.models.launch_merge_dto import LaunchMergeDto as LaunchMergeDto
-from src.client.generated.models.launch_patch_dto import LaunchPatchDto as LaunchPatchDto
-from src.client.generated.models.launch_pdf_options import LaunchPdfOptions as LaunchPdfOptions
-from src.client.generated.models.launch_pdf_part import LaunchPdfPart as LaunchPdfPart
-from src.client.generated.models.launch_pdf_structure import LaunchPdfStructure as LaunchPdfStructure
-from src.client.generated.models.launch_preview_dto import LaunchPreviewDto as LaunchPreviewDto
-from src.client.generated.models.launch_progress_dto import LaunchProgressDto as LaunchProgressDto
-from src.client.generated.models.launch_row_dto import LaunchRowDto as LaunchRowDto
-from src.client.generated.models.launch_tag_create_dto import LaunchTagCreateDto as LaunchTagCreateDto
-from src.client.generated.models.launch_tag_dto import LaunchTagDto as LaunchTagDto
-from src.client.generated.models.launch_tag_patch_dto import LaunchTagPatchDto as LaunchTagPatchDto
-from src.client.generated.models.launch_test_cases_add_dto import LaunchTestCasesAddDto as LaunchTestCasesAddDto
-from src.client.generated.models.launch_test_plan_add_dto import LaunchTestPlanAddDto as LaunchTestPlanAddDto
-from src.client.generated.models.launch_upload_response_dto import LaunchUploadResponseDto as LaunchUploadResponseDto
-from src.client.generated.models.launch_variable_dto import LaunchVariableDto as LaunchVariableDto
-from src.client.generated.models.launch_webhook import LaunchWebhook as LaunchWebhook
-from src.client.generated.models.line_break_paragraph_node import LineBreakParagraphNode as LineBreakParagraphNode
-from src.client.generated.models.link_export_field_mapping import LinkExportFieldMapping as LinkExportFieldMapping
-from src.client.generated.models.link_import_field_mapping import LinkImportFieldMapping as LinkImportFieldMapping
-from src.client.generated.models.link_mark import LinkMark as LinkMark
-from src.client.generated.models.list_selection_dto import ListSelectionDto as ListSelectionDto
-from src.client.generated.models.manual_session_request_dto import ManualSessionRequestDto as ManualSessionRequestDto
-from src.client.generated.models.matcher import Matcher as Matcher
-from src.client.generated.models.member_create_dto import MemberCreateDto as MemberCreateDto
-from src.client.generated.models.member_dto import MemberDto as MemberDto
-from src.client.generated.models.member_patch_dto import MemberPatchDto as MemberPatchDto
-from src.client.generated.models.metric import Metric as Metric
-from src.client.generated.models.mfa_global_settings_dto import MfaGlobalSettingsDto as MfaGlobalSettingsDto
-from src.client.generated.models.mfa_global_settings_patch_dto import MfaGlobalSettingsPatchDto as MfaGlobalSettingsPatchDto
-from src.client.generated.models.multi_value_export_field_mapping import MultiValueExportFieldMapping as MultiValueExportFieldMapping
-from src.client.generated.models.multi_value_import_field_mapping import MultiValueImportFieldMapping as MultiValueImportFieldMapping
-from src.client.generated.models.multi_value_map_string_string import MultiValueMapStringString as MultiValueMapStringString
-from src.client.generated.models.mute_create_dto import MuteCreateDto as MuteCreateDto
-from src.client.generated.models.mute_dto import MuteDto as MuteDto
-from src.client.generated.models.name_only_dto import NameOnlyDto as NameOnlyDto
-from src.client.generated.models.node_type import NodeType as NodeType
-from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto as NormalizedScenarioDto
-from src.client.generated.models.normalized_scenario_dto_attachments_value import NormalizedScenarioDtoAttachmentsValue as NormalizedScenarioDtoAttachmentsValue
-from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto as NormalizedScenarioStepDto
-from src.client.generated.models.ordered_value_dto_string import OrderedValueDtoString as OrderedValueDtoString
-from src.client.generated.models.page_access_group_dto import PageAccessGroupDto as PageAccessGroupDto
-from src.client.generated.models.page_access_group_dto_sort import PageAccessGroupDtoSort as PageAccessGroupDtoSort
-from src.client.generated.models.page_access_group_pa_dto import PageAccessGroupPaDto as PageAccessGroupPaDto
-from src.client.generated.models.page_access_group_user_dto import PageAccessGroupUserDto as PageAccessGroupUserDto
-from src.client.generated.models.page_async_job_dto import PageAsyncJobDto as PageAsyncJobDto
-from src.client.generated.models.page_category_dto import PageCategoryDto as PageCategoryDto
-from src.client.generated.models.page_category_matcher_dto import PageCategoryMatcherDto as PageCategoryMatcherDto
-from src.client.generated.models.page_cleaner_schema_dto import PageCleanerSchemaDto as PageCleanerSchemaDto
-from src.client.generated.models.page_comment_dto import PageCommentDto as PageCommentDto
-from src.client.generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto as PageCustomFieldProjectDto
-from src.client.generated.models.page_custom_field_schema_dto import PageCustomFieldSchemaDto as PageCustomFieldSchemaDto
-from src.client.generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto as PageCustomFieldValueWithTcCountDto
-from src.client.generated.models.page_dashboard_dto import PageDashboardDto as PageDashboardDto
-from src.client.generated.models.page_defect_count_row_dto import PageDefectCountRowDto as PageDefectCountRowDto
-from src.client.generated.models.page_defect_dto import PageDefectDto as PageDefectDto
-from src.client.generated.models.page_defect_matcher_dto import PageDefectMatcherDto as PageDefectMatcherDto
-from src.client.generated.models.page_defect_row_dto import PageDefectRowDto as PageDefectRowDto
-from src.client.generated.models.page_env_var_schema_dto import PageEnvVarSchemaDto as PageEnvVarSchemaDto
-from src.client.generated.models.page_export_request_dto import PageExportRequestDto as PageExportRequestDto
-from src.client.generated.models.page_filter_dto import PageFilterDto as PageFilterDto
-from src.client.generated.models.page_id_and_name_only_dto import PageIdAndNameOnlyDto as PageIdAndNameOnlyDto
-from src.client.generated.models.page_import_request_dto import PageImportRequestDto as PageImportRequestDto
-from src.client.generated.models.page_integration_dto import PageIntegrationDto as PageIntegrationDto
-from src.client.generated.models.page_integration_export_dto import PageIntegrationExportDto as PageIntegrationExportDto
-from src.client.generated.models.page_integration_info_dto import PageIntegrationInfoDto as PageIntegrationInfoDto
-from src.client.generated.models.page_integration_webhook_dto import PageIntegrationWebhookDto as PageIntegrationWebhookDto
-from src.client.generated.models.page_integration_webhook_log_dto import PageIntegrationWebhookLogDto as PageIntegrationWebhookLogDto
-from src.client.generated.models.page_issue_dto import PageIssueDto as PageIssueDto
-from src.client.generated.models.page_issue_schema_dto import PageIssueSchemaDto as PageIssueSchemaDto
-from src.client.generated.models.page_job_dto import PageJobDto as PageJobDto
-from src.client.generated.models.page_launch_diff_row import PageLaunchDiffRow as PageLaunchDiffRow
-from src.client.generated.models.page_launch_dto import PageLaunchDto as PageLaunchDto
-from src.client.generated.models.page_launch_member_stats_dto import PageLaunchMemberStatsDto as PageLaunchMemberStatsDto
-from src.client.generated.models.page_launch_preview_dto import PageLaunchPreviewDto as PageLaunchPreviewDto
-from src.client.generated.models.page_launch_row_dto import PageLaunchRowDto as PageLaunchRowDto
-from src.client.generated.models.page_launch_tag_dto import PageLaunchTagDto as PageLaunchTagDto
-from src.client.generated.models.page_launch_variable_dto import PageLaunchVariableDto as PageLaunchVariableDto
-from src.client.generated.models.page_member_dto import PageMemberDto as PageMemberDto
-from src.client.generated.models.page_mute_dto import PageMuteDto as PageMuteDto
-from src.client.generated.models.page_permission_set_dto import PagePermissionSetDto as PagePermissionSetDto
-from src.client.generated.models.page_project_collaborator_access_dto import PageProjectCollaboratorAccessDto as PageProjectCollaboratorAccessDto
-from src.client.generated.models.page_project_collaborator_dto import PageProjectCollaboratorDto as PageProjectCollaboratorDto
-from src.client.generated.models.page_project_custom_field_dto import PageProjectCustomFieldDto as PageProjectCustomFieldDto
-from src.client.generated.models.page_project_dto import PageProjectDto as PageProjectDto
-from src.client.generated.models.page_project_group_access_dto import PageProjectGroupAccessDto as PageProjectGroupAccessDto
-from src.client.generated.models.page_project_integration_dto import PageProjectIntegrationDto as PageProjectIntegrationDto
-from src.client.generated.models.page_project_suggest_dto import PageProjectSuggestDto as PageProjectSuggestDto
-from src.client.generated.models.page_role_schema_dto import PageRoleSchemaDto as PageRoleSchemaDto
-from src.client.generated.models.page_shared_step_attachment_row_dto import PageSharedStepAttachmentRowDto as PageSharedStepAttachmentRowDto
-from src.client.generated.models.page_shared_step_dto import PageSharedStepDto as PageSharedStepDto
-from src.client.generated.models.page_statistic_widget_item import PageStatisticWidgetItem as PageStatisticWidgetItem
-from src.client.generated.models.page_status_dto import PageStatusDto as PageStatusDto
-from src.client.generated.models.page_template_dto import PageTemplateDto as PageTemplateDto
-from src.client.generated.models.page_test_case_attachment_row_dto import PageTestCaseAttachmentRowDto as PageTestCaseAttachmentRowDto
-from src.client.generated.models.page_test_case_audit_log_entry_dto import PageTestCaseAuditLogEntryDto as PageTestCaseAuditLogEntryDto
-from src.client.generated.models.page_test_case_dto import PageTestCaseDto as PageTestCaseDto
-from src.client.generated.models.page_test_case_example_dto import PageTestCaseExampleDto as PageTestCaseExampleDto
-from src.client.generated.models.page_test_case_flat_dto import PageTestCaseFlatDto as PageTestCaseFlatDto
-from src.client.generated.models.page_test_case_row_dto import PageTestCaseRowDto as PageTestCaseRowDto
-from src.client.generated.models.page_test_case_tree_group_dto import PageTestCaseTreeGroupDto as PageTestCaseTreeGroupDto
-from src.client.generated.models.page_test_case_tree_leaf_dto import PageTestCaseTreeLeafDto as PageTestCaseTreeLeafDto
-from src.client.generated.models.page_test_case_tree_node_dto import PageTestCaseTreeNodeDto as PageTestCaseTreeNodeDto
-from src.client.generated.models.page_test_case_tree_node_dto_content_inner import PageTestCaseTreeNodeDtoContentInner as PageTestCaseTreeNodeDtoContentInner
-from src.client.generated.models.page_test_fixture_result_attachment_row_dto import PageTestFixtureResultAttachmentRowDto as PageTestFixtureResultAttachmentRowDto
-from src.client.generated.models.page_test_key_schema_dto import PageTestKeySchemaDto as PageTestKeySchemaDto
-from src.client.generated.models.page_test_layer_dto import PageTestLayerDto as PageTestLayerDto
-from src.client.generated.models.page_test_layer_schema_dto import PageTestLayerSchemaDto as PageTestLayerSchemaDto
-from src.client.generated.models.page_test_plan_dto import PageTestPlanDto as PageTestPlanDto
-from src.client.generated.models.page_test_plan_row_dto import PageTestPlanRowDto as PageTestPlanRowDto
-from src.client.generated.models.page_test_result_attachment_row_dto import PageTestResultAttachmentRowDto as PageTestResultAttachmentRowDto
-from src.client.generated.models.page_test_result_defect_match_dto import PageTestResultDefectMatchDto as PageTestResultDefectMatchDto
-from src.client.generated.models.page_test_result_dto import PageTestResultDto as PageTestResultDto
-from src.client.generated.models.page_test_result_flat_dto import PageTestResultFlatDto as PageTestResultFlatDto
-from src.client.generated.models.page_test_result_history_dto import PageTestResultHistoryDto as PageTestResultHistoryDto
-from src.client.generated.models.page_test_result_retries_row_dto import PageTestResultRetriesRowDto as PageTestResultRetriesRowDto
-from src.client.generated.models.page_test_result_row_dto import PageTestResultRowDto as PageTestResultRowDto
-from src.client.generated.models.page_test_result_tree_group_dto import PageTestResultTreeGroupDto as PageTestResultTreeGroupDto
-from src.client.generated.models.page_test_result_tree_leaf_dto import PageTestResultTreeLeafDto as PageTestResultTreeLeafDto
-from src.client.generated.models.page_test_result_tree_node_dto import PageTestResultTreeNodeDto as PageTestResultTreeNodeDto
-from src.client.generated.models.page_test_result_tree_node_dto_content_inner import PageTestResultTreeNodeDtoContentInner as PageTestResultTreeNodeDtoContentInner
-from src.client.generated.models.page_tree_dto import PageTreeDto as PageTreeDto
-from src.client.generated.models.page_tree_dto_v2 import PageTreeDtoV2 as PageTreeDtoV2
-from src.client.generated.models.page_tree_path_dto import PageTreePathDto as PageTreePathDto
-from src.client.generated.models.page_webhook_dto import PageWebhookDto as PageWebhookDto
-from src.client.generated.models.page_widget_dto import PageWidgetDto as PageWidgetDto
-from src.client.generated.models.page_workflow_dto import PageWorkflowDto as PageWorkflowDto
-from src.client.generated.models.page_workflow_schema_dto import PageWorkflowSchemaDto as PageWorkflowSchemaDto
-from src.client.generated.models.pageable import Pageable as Pageable
-from src.client.generated.models.paragraph_document_node import ParagraphDocumentNode as ParagraphDocumentNode
-from src.client.generated.models.paragraph_document_node_all_of_content import ParagraphDocumentNodeAllOfContent as ParagraphDocumentNodeAllOfContent
-from src.client.generated.models.paragraph_node import ParagraphNode as ParagraphNode
-from src.client.generated.models.parameter import Parameter as Parameter
-from src.client.generated.models.parameter_value_dto import ParameterValueDto as ParameterValueDto
-from src.client.generated.models.permission_dto import PermissionDto as PermissionDto
-from src.client.generated.models.permission_set_create_dto import PermissionSetCreateDto as PermissionSetCreateDto
-from src.client.generated.models.permission_set_dto import PermissionSetDto as PermissionSetDto
-from src.client.generated.models.permission_set_patch_dto import PermissionSetPatchDto as PermissionSetPatchDto
-from src.client.generated.models.project_access_collaborator_add_dto import ProjectAccessCollaboratorAddDto as ProjectAccessCollaboratorAddDto
-from src.client.generated.models.project_access_group_add_dto import ProjectAccessGroupAddDto as ProjectAccessGroupAddDto
-from src.client.generated.models.project_category_add_dto import ProjectCategoryAddDto as ProjectCategoryAddDto
-from src.client.generated.models.project_category_matcher_add_dto import ProjectCategoryMatcherAddDto as ProjectCategoryMatcherAddDto
-from src.client.generated.models.project_category_matcher_remove_dto import ProjectCategoryMatcherRemoveDto as ProjectCategoryMatcherRemoveDto
-from src.client.generated.models.project_category_remove_dto import ProjectCategoryRemoveDto as ProjectCategoryRemoveDto
-from src.client.generated.models.project_collaborator_access_dto import ProjectCollaboratorAccessDto as ProjectCollaboratorAccessDto
-from src.client.generated.models.project_collaborator_dto import ProjectCollaboratorDto as ProjectCollaboratorDto
-from src.client.generated.models.project_create_dto import ProjectCreateDto as ProjectCreateDto
-from src.client.generated.models.project_custom_field_dto import ProjectCustomFieldDto as ProjectCustomFieldDto
-from src.client.generated.models.project_dto import ProjectDto as ProjectDto
-from src.client.generated.models.project_group_access_add_dto import ProjectGroupAccessAddDto as ProjectGroupAccessAddDto
-from src.client.generated.models.project_group_access_dto import ProjectGroupAccessDto as ProjectGroupAccessDto
-from src.client.generated.models.project_integration_create_dto import ProjectIntegrationCreateDto as ProjectIntegrationCreateDto
-from src.client.generated.models.project_integration_dto import ProjectIntegrationDto as ProjectIntegrationDto
-from src.client.generated.models.project_integration_fields_form_dto import ProjectIntegrationFieldsFormDto as ProjectIntegrationFieldsFormDto
-from src.client.generated.models.project_integration_patch_dto import ProjectIntegrationPatchDto as ProjectIntegrationPatchDto
-from src.client.generated.models.project_integration_validate_dto import ProjectIntegrationValidateDto as ProjectIntegrationValidateDto
-from src.client.generated.models.project_metric_dto import ProjectMetricDto as ProjectMetricDto
-from src.client.generated.models.project_patch_dto import ProjectPatchDto as ProjectPatchDto
-from src.client.generated.models.project_property_create_dto import ProjectPropertyCreateDto as ProjectPropertyCreateDto
-from src.client.generated.models.project_property_dto import ProjectPropertyDto as ProjectPropertyDto
-from src.client.generated.models.project_property_patch_dto import ProjectPropertyPatchDto as ProjectPropertyPatchDto
-from src.client.generated.models.project_stats_dto import ProjectStatsDto as ProjectStatsDto
-from src.client.generated.models.project_suggest_dto import ProjectSuggestDto as ProjectSuggestDto
-from src.client.generated.models.project_sync_request import ProjectSyncRequest as ProjectSyncRequest
-from src.client.generated.models.project_test_case_count_dto import ProjectTestCaseCountDto as ProjectTestCaseCountDto
-from src.client.generated.models.resolve_request_v2_dto import ResolveRequestV2Dto as ResolveRequestV2Dto
-from src.client.generated.models.retry import Retry as Retry
-from src.client.generated.models.role_create_dto import RoleCreateDto as RoleCreateDto
-from src.client.generated.models.role_dto import RoleDto as RoleDto
-from src.client.generated.models.role_export_field_mapping import RoleExportFieldMapping as RoleExportFieldMapping
-from src.client.generated.models.role_import_field_mapping import RoleImportFieldMapping as RoleImportFieldMapping
-from src.client.generated.models.role_patch_dto import RolePatchDto as RolePatchDto
-from src.client.generated.models.role_schema_create_dto import RoleSchemaCreateDto as RoleSchemaCreateDto
-from src.client.generated.models.role_schema_dto import RoleSchemaDto as RoleSchemaDto
-from src.client.generated.models.role_schema_patch_dto import RoleSchemaPatchDto as RoleSchemaPatchDto
-from src.client.generated.models.scenario_export_field_mapping import ScenarioExportFieldMapping as ScenarioExportFieldMapping
-from src.client.generated.models.scenario_step_copy_dto import ScenarioStepCopyDto as ScenarioStepCopyDto
-from src.client.generated.models.scenario_step_create_dto import ScenarioStepCreateDto as ScenarioStepCreateDto
-from src.client.generated.models.scenario_step_created_response_dto import ScenarioStepCreatedResponseDto as ScenarioStepCreatedResponseDto
-from src.client.generated.models.scenario_step_dto import ScenarioStepDto as ScenarioStepDto
-from src.client.generated.models.scenario_step_move_dto import ScenarioStepMoveDto as ScenarioStepMoveDto
-from src.client.generated.models.scenario_step_patch_dto import ScenarioStepPatchDto as ScenarioStepPatchDto
-from src.client.generated.models.session_variable import SessionVariable as SessionVariable
-from src.client.generated.models.shared_step_attachment_patch_dto import SharedStepAttachmentPatchDto as SharedStepAttachmentPatchDto
-from src.client.generated.models.shared_step_attachment_row_dto import SharedStepAttachmentRowDto as SharedStepAttachmentRowDto
-from src.client.generated.models.shared_step_create_dto import SharedStepCreateDto as SharedStepCreateDto
-from src.client.generated.models.shared_step_dto import SharedStepDto as SharedStepDto
-from src.client.generated.models.shared_step_patch_dto import SharedStepPatchDto as SharedStepPatchDto
-from src.client.generated.models.shared_step_scenario_dto import SharedStepScenarioDto as SharedStepScenarioDto
-from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner as SharedStepScenarioDtoStepsInner
-from src.client.generated.models.shared_step_step_dto import SharedStepStepDto as SharedStepStepDto
-from src.client.generated.models.statistic_dto import StatisticDto as StatisticDto
-from src.client.generated.models.statistic_widget_item import StatisticWidgetItem as StatisticWidgetItem
-from src.client.generated.models.status import Status as Status
-from src.client.generated.models.status_create_dto import StatusCreateDto as StatusCreateDto
-from src.client.generated.models.status_dto import StatusDto as StatusDto
-from src.client.generated.models.status_patch_dto import StatusPatchDto as StatusPatchDto
-from src.client.generated.models.strike_mark import StrikeMark as StrikeMark
-from src.client.generated.models.tag_import_field_mapping import TagImportFieldMapping as TagImportFieldMapping
-from src.client.generated.models.template_dto import TemplateDto as TemplateDto
-from src.client.generated.models.template_overview_dto import TemplateOverviewDto as TemplateOverviewDto
-from src.client.generated.models.test_case_association_diff import TestCaseAssociationDiff as TestCaseAssociationDiff
-from src.client.generated.models.test_case_attachment_patch_dto import TestCaseAttachmentPatchDto as TestCaseAttachmentPatchDto
-from src.client.generated.models.test_case_attachment_row_dto import TestCaseAttachmentRowDto as TestCaseAttachmentRowDto
-from src.client.generated.models.test_case_audit_log_data import TestCaseAuditLogData as TestCaseAuditLogData
-from src.client.generated.models.test_case_audit_log_data_diff import TestCaseAuditLogDataDiff as TestCaseAuditLogDataDiff
-from src.client.generated.models.test_case_audit_log_entry_dto import TestCaseAuditLogEntryDto as TestCaseAuditLogEntryDto
-from src.client.generated.models.test_case_bulk_cf_move_strategy import TestCaseBulkCfMoveStrategy as TestCaseBulkCfMoveStrategy
-from src.client.generated.models.test_case_bulk_change_project_dto_v2 import TestCaseBulkChangeProjectDtoV2 as TestCaseBulkChangeProjectDtoV2
-from src.client.generated.models.test_case_bulk_clone_dto import TestCaseBulkCloneDto as TestCaseBulkCloneDto
-from src.client.generated.models.test_case_bulk_clone_dto_v2 import TestCaseBulkCloneDtoV2 as TestCaseBulkCloneDtoV2
-from src.client.generated.models.test_case_bulk_drag_and_drop_dto import TestCaseBulkDragAndDropDto as TestCaseBulkDragAndDropDto
-from src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2 import TestCaseBulkDragAndDropDtoV2 as TestCaseBulkDragAndDropDtoV2
-from src.client.generated.models.test_case_bulk_dto import TestCaseBulkDto as TestCaseBulkDto
-from src.client.generated.models.test_case_bulk_dto_v2 import TestCaseBulkDtoV2 as TestCaseBulkDtoV2
-from src.client.generated.models.test_case_bulk_entity_ids_dto import TestCaseBulkEntityIdsDto as TestCaseBulkEntityIdsDto
-from src.client.generated.models.test_case_bulk_entity_ids_dto_v2 import TestCaseBulkEntityIdsDtoV2 as TestCaseBulkEntityIdsDtoV2
-from src.client.generated.models.test_case_bulk_export_csv_options import TestCaseBulkExportCsvOptions as TestCaseBulkExportCsvOptions
-from src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner import TestCaseBulkExportCsvOptionsMappingInner as TestCaseBulkExportCsvOptionsMappingInner
-from src.client.generated.models.test_case_bulk_export_pdf_options import TestCaseBulkExportPdfOptions as TestCaseBulkExportPdfOptions
-from src.client.generated.models.test_case_bulk_external_link_dto import TestCaseBulkExternalLinkDto as TestCaseBulkExternalLinkDto
-from src.client.generated.models.test_case_bulk_issue_dto import TestCaseBulkIssueDto as TestCaseBulkIssueDto
-from src.client.generated.models.test_case_bulk_layer_dto import TestCaseBulkLayerDto as TestCaseBulkLayerDto
-from src.client.generated.models.test_case_bulk_member_dto import TestCaseBulkMemberDto as TestCaseBulkMemberDto
-from src.client.generated.models.test_case_bulk_mute_dto import TestCaseBulkMuteDto as TestCaseBulkMuteDto
-from src.client.generated.models.test_case_bulk_new_cfv_dto import TestCaseBulkNewCfvDto as TestCaseBulkNewCfvDto
-from src.client.generated.models.test_case_bulk_project_change_dto import TestCaseBulkProjectChangeDto as TestCaseBulkProjectChangeDto
-from src.client.generated.models.test_case_bulk_run_existing_launch_dto import TestCaseBulkRunExistingLaunchDto as TestCaseBulkRunExistingLaunchDto
-from src.client.generated.models.test_case_bulk_run_new_launch_dto import TestCaseBulkRunNewLaunchDto as TestCaseBulkRunNewLaunchDto
-from src.client.generated.models.test_case_bulk_status_dto import TestCaseBulkStatusDto as TestCaseBulkStatusDto
-from src.client.generated.models.test_case_bulk_tag_dto import TestCaseBulkTagDto as TestCaseBulkTagDto
-from src.client.generated.models.test_case_bulk_test_plan_create_dto import TestCaseBulkTestPlanCreateDto as TestCaseBulkTestPlanCreateDto
-from src.client.generated.models.test_case_cf_bulk_delta_dto_v2 import TestCaseCfBulkDeltaDtoV2 as TestCaseCfBulkDeltaDtoV2
-from src.client.generated.models.test_case_cfv_bulk_add_dto import TestCaseCfvBulkAddDto as TestCaseCfvBulkAddDto
-from src.client.generated.models.test_case_clone_rq_dto import TestCaseCloneRqDto as TestCaseCloneRqDto
-from src.client.generated.models.test_case_count_dto import TestCaseCountDto as TestCaseCountDto
-from src.client.generated.models.test_case_create_v2_dto import TestCaseCreateV2Dto as TestCaseCreateV2Dto
-from src.client.generated.models.test_case_csv_export_options import TestCaseCsvExportOptions as TestCaseCsvExportOptions
-from src.client.generated.models.test_case_csv_import_options import TestCaseCsvImportOptions as TestCaseCsvImportOptions
-from src.client.generated.models.test_case_csv_import_options_mapping_inner import TestCaseCsvImportOptionsMappingInner as TestCaseCsvImportOptionsMappingInner
-from src.client.generated.models.test_case_csv_preview_options import TestCaseCsvPreviewOptions as TestCaseCsvPreviewOptions
-from src.client.generated.models.test_case_detach_automation_rq_dto import TestCaseDetachAutomationRqDto as TestCaseDetachAutomationRqDto
-from src.client.generated.models.test_case_diff import TestCaseDiff as TestCaseDiff
-from src.client.generated.models.test_case_dto import TestCaseDto as TestCaseDto
-from src.client.generated.models.test_case_example_dto import TestCaseExampleDto as TestCaseExampleDto
-from src.client.generated.models.test_case_export_field import TestCaseExportField as TestCaseExportField
-from src.client.generated.models.test_case_external_link_bulk_add_dto import TestCaseExternalLinkBulkAddDto as TestCaseExternalLinkBulkAddDto
-from src.client.generated.models.test_case_flat_dto import TestCaseFlatDto as TestCaseFlatDto
-from src.client.generated.models.test_case_full_tree_node_dto import TestCaseFullTreeNodeDto as TestCaseFullTreeNodeDto
-from src.client.generated.models.test_case_import_dto import TestCaseImportDto as TestCaseImportDto
-from src.client.generated.models.test_case_import_field import TestCaseImportField as TestCaseImportField
-from src.client.generated.models.test_case_import_mapping import TestCaseImportMapping as TestCaseImportMapping
-from src.client.generated.models.test_case_info import TestCaseInfo as TestCaseInfo
-from src.client.generated.models.test_case_issue_bulk_add_dto import TestCaseIssueBulkAddDto as TestCaseIssueBulkAddDto
-from src.client.generated.models.test_case_last_result_dto import TestCaseLastResultDto as TestCaseLastResultDto
-from src.client.generated.models.test_case_layer_bulk_set_dto import TestCaseLayerBulkSetDto as TestCaseLayerBulkSetDto
-from src.client.generated.models.test_case_light_tree_node_dto import TestCaseLightTreeNodeDto as TestCaseLightTreeNodeDto
-from src.client.generated.models.test_case_member_bulk_add_dto import TestCaseMemberBulkAddDto as TestCaseMemberBulkAddDto
-from src.client.generated.models.test_case_mute_bulk_add_dto import TestCaseMuteBulkAddDto as TestCaseMuteBulkAddDto
-from src.client.generated.models.test_case_overview_dto import TestCaseOverviewDto as TestCaseOverviewDto
-from src.client.generated.models.test_case_parameter_dto import TestCaseParameterDto as TestCaseParameterDto
-from src.client.generated.models.test_case_parameter_values import TestCaseParameterValues as TestCaseParameterValues
-from src.client.generated.models.test_case_patch_v2_dto import TestCasePatchV2Dto as TestCasePatchV2Dto
-from src.client.generated.models.test_case_pdf_options import TestCasePdfOptions as TestCasePdfOptions
-from src.client.generated.models.test_case_pdf_part import TestCasePdfPart as TestCasePdfPart
-from src.client.generated.models.test_case_relation_dto import TestCaseRelationDto as TestCaseRelationDto
-from src.client.generated.models.test_case_relation_type_dto import TestCaseRelationTypeDto as TestCaseRelationTypeDto
-from src.client.generated.models.test_case_row_dto import TestCaseRowDto as TestCaseRowDto
-from src.client.generated.models.test_case_run_bulk_existing_launch_dto import TestCaseRunBulkExistingLaunchDto as TestCaseRunBulkExistingLaunchDto
-from src.client.generated.models.test_case_run_bulk_new_launch_dto import TestCaseRunBulkNewLaunchDto as TestCaseRunBulkNewLaunchDto
-from src.client.generated.models.test_case_run_by_stats import TestCaseRunByStats as TestCaseRunByStats
-from src.client.generated.models.test_case_run_stats_request_dto import TestCaseRunStatsRequestDto as TestCaseRunStatsRequestDto
-from src.client.generated.models.test_case_scenario_dto import TestCaseScenarioDto as TestCaseScenarioDto
-from src.client.generated.models.test_case_scenario_step_dto import TestCaseScenarioStepDto as TestCaseScenarioStepDto
-from src.client.generated.models.test_case_scenario_v2_dto import TestCaseScenarioV2Dto as TestCaseScenarioV2Dto
-from src.client.generated.models.test_case_selection_dto_v2 import TestCaseSelectionDtoV2 as TestCaseSelectionDtoV2
-from src.client.generated.models.test_case_status_bulk_set_dto import TestCaseStatusBulkSetDto as TestCaseStatusBulkSetDto
-from src.client.generated.models.test_case_style import TestCaseStyle as TestCaseStyle
-from src.client.generated.models.test_case_sync_from_to import TestCaseSyncFromTo as TestCaseSyncFromTo
-from src.client.generated.models.test_case_sync_rq_dto import TestCaseSyncRqDto as TestCaseSyncRqDto
-from src.client.generated.models.test_case_tag_bulk_add_dto import TestCaseTagBulkAddDto as TestCaseTagBulkAddDto
-from src.client.generated.models.test_case_test_plan_bulk_create_dto import TestCaseTestPlanBulkCreateDto as TestCaseTestPlanBulkCreateDto
-from src.client.generated.models.test_case_tree_all_paths_dto import TestCaseTreeAllPathsDto as TestCaseTreeAllPathsDto
-from src.client.generated.models.test_case_tree_filter_count_dto import TestCaseTreeFilterCountDto as TestCaseTreeFilterCountDto
-from src.client.generated.models.test_case_tree_group_add_dto import TestCaseTreeGroupAddDto as TestCaseTreeGroupAddDto
-from src.client.generated.models.test_case_tree_group_dto import TestCaseTreeGroupDto as TestCaseTreeGroupDto
-from src.client.generated.models.test_case_tree_group_rename_dto import TestCaseTreeGroupRenameDto as TestCaseTreeGroupRenameDto
-from src.client.generated.models.test_case_tree_leaf_add_dto import TestCaseTreeLeafAddDto as TestCaseTreeLeafAddDto
-from src.client.generated.models.test_case_tree_leaf_dto import TestCaseTreeLeafDto as TestCaseTreeLeafDto
-from src.client.generated.models.test_case_tree_leaf_dto_v2 import TestCaseTreeLeafDtoV2 as TestCaseTreeLeafDtoV2
-from src.client.generated.models.test_case_tree_leaf_rename_dto import TestCaseTreeLeafRenameDto as TestCaseTreeLeafRenameDto
-from src.client.generated.models.test_case_tree_node_dto import TestCaseTreeNodeDto as TestCaseTreeNodeDto
-from src.client.generated.models.test_case_tree_run_stat_request_dto import TestCaseTreeRunStatRequestDto as TestCaseTreeRunStatRequestDto
-from src.client.generated.models.test_case_tree_selection_dto import TestCaseTreeSelectionDto as TestCaseTreeSelectionDto
-from src.client.generated.models.test_case_tree_selection_dto_v2 import TestCaseTreeSelectionDtoV2 as TestCaseTreeSelectionDtoV2
-from src.client.generated.models.test_case_type import TestCaseType as TestCaseType
-from src.client.generated.models.test_case_update_field_dto import TestCaseUpdateFieldDto as TestCaseUpdateFieldDto
-from src.client.generated.models.test_case_update_policy_dto import TestCaseUpdatePolicyDto as TestCaseUpdatePolicyDto
-from src.client.generated.models.test_case_update_schema_create_dto import TestCaseUpdateSchemaCreateDto as TestCaseUpdateSchemaCreateDto
-from src.client.generated.models.test_case_update_schema_dto import TestCaseUpdateSchemaDto as TestCaseUpdateSchemaDto
-from src.client.generated.models.test_case_update_schema_patch_dto import TestCaseUpdateSchemaPatchDto as TestCaseUpdateSchemaPatchDto
-from src.client.generated.models.test_case_version_dto import TestCaseVersionDto as TestCaseVersionDto
-from src.client.generated.models.test_case_version_patch_dto import TestCaseVersionPatchDto as TestCaseVersionPatchDto
-from src.client.generated.models.test_case_version_rq_dto import TestCaseVersionRqDto as TestCaseVersionRqDto
-from src.client.generated.models.test_code_generation_request_dto import TestCodeGenerationRequestDto as TestCodeGenerationRequestDto
-from src.client.generated.models.test_code_generation_response_dto import TestCodeGenerationResponseDto as TestCodeGenerationResponseDto
-from src.client.generated.models.test_duration_count import TestDurationCount as TestDurationCount
-from src.client.generated.models.test_fixture_result_attachment_patch_dto import TestFixtureResultAttachmentPatchDto as TestFixtureResultAttachmentPatchDto
-from src.client.generated.models.test_fixture_result_attachment_row_dto import TestFixtureResultAttachmentRowDto as TestFixtureResultAttachmentRowDto
-from src.client.generated.models.test_fixture_result_type_dto import TestFixtureResultTypeDto as TestFixtureResultTypeDto
-from src.client.generated.models.test_fixture_result_v2_dto import TestFixtureResultV2Dto as TestFixtureResultV2Dto
-from src.client.generated.models.test_key_dto import TestKeyDto as TestKeyDto
-from src.client.generated.models.test_key_import_field_mapping import TestKeyImportFieldMapping as TestKeyImportFieldMapping
-from src.client.generated.models.test_key_schema_create_dto import TestKeySchemaCreateDto as TestKeySchemaCreateDto
-from src.client.generated.models.test_key_schema_dto import TestKeySchemaDto as TestKeySchemaDto
-from src.client.generated.models.test_key_schema_patch_dto import TestKeySchemaPatchDto as TestKeySchemaPatchDto
-from src.client.generated.models.test_layer_create_dto import TestLayerCreateDto as TestLayerCreateDto
-from src.client.generated.models.test_layer_dto import TestLayerDto as TestLayerDto
-from src.client.generated.models.test_layer_patch_dto import TestLayerPatchDto as TestLayerPatchDto
-from src.client.generated.models.test_layer_schema_create_dto import TestLayerSchemaCreateDto as TestLayerSchemaCreateDto
-from src.client.generated.models.test_layer_schema_dto import TestLayerSchemaDto as TestLayerSchemaDto
-from src.client.generated.models.test_layer_schema_patch_dto import TestLayerSchemaPatchDto as TestLayerSchemaPatchDto
-from src.client.generated.models.test_plan_assign_dto import TestPlanAssignDto as TestPlanAssignDto
-from src.client.generated.models.test_plan_create_dto import TestPlanCreateDto as TestPlanCreateDto
-from src.client.generated.models.test_plan_diff_dto import TestPlanDiffDto as TestPlanDiffDto
-from src.client.generated.models.test_plan_dto import TestPlanDto as TestPlanDto
-from src.client.generated.models.test_plan_job_parameters_dto import TestPlanJobParametersDto as TestPlanJobParametersDto
-from src.client.generated.models.test_plan_job_stat_dto import TestPlanJobStatDto as TestPlanJobStatDto
-from src.client.generated.models.test_plan_member_stat_dto import TestPlanMemberStatDto as TestPlanMemberStatDto
-from src.client.generated.models.test_plan_patch_dto import TestPlanPatchDto as TestPlanPatchDto
-from src.client.generated.models.test_plan_row_dto import TestPlanRowDto as TestPlanRowDto
-from src.client.generated.models.test_plan_run_request_dto import TestPlanRunRequestDto as TestPlanRunRequestDto
-from src.client.generated.models.test_plan_tree_selection_dto import TestPlanTreeSelectionDto as TestPlanTreeSelectionDto
-from src.client.generated.models.test_plan_webhook import TestPlanWebhook as TestPlanWebhook
-from src.client.generated.models.test_result_attachment_patch_dto import TestResultAttachmentPatchDto as TestResultAttachmentPatchDto
-from src.client.generated.models.test_result_attachment_row_dto import TestResultAttachmentRowDto as TestResultAttachmentRowDto
-from src.client.generated.models.test_result_attachment_step_dto import TestResultAttachmentStepDto as TestResultAttachmentStepDto
-from src.client.generated.models.test_result_attachment_step_dto_all_of_attachment import TestResultAttachmentStepDtoAllOfAttachment as TestResultAttachmentStepDtoAllOfAttachment
-from src.client.generated.models.test_result_body_step_dto import TestResultBodyStepDto as TestResultBodyStepDto
-from src.client.generated.models.test_result_bulk_assign_dto import TestResultBulkAssignDto as TestResultBulkAssignDto
-from src.client.generated.models.test_result_bulk_dto import TestResultBulkDto as TestResultBulkDto
-from src.client.generated.models.test_result_bulk_entity_ids_dto import TestResultBulkEntityIdsDto as TestResultBulkEntityIdsDto
-from src.client.generated.models.test_result_bulk_mute_dto import TestResultBulkMuteDto as TestResultBulkMuteDto
-from src.client.generated.models.test_result_bulk_rerun_dto import TestResultBulkRerunDto as TestResultBulkRerunDto
-from src.client.generated.models.test_result_bulk_resolve_dto import TestResultBulkResolveDto as TestResultBulkResolveDto
-from src.client.generated.models.test_result_bulk_tag_dto import TestResultBulkTagDto as TestResultBulkTagDto
-from src.client.generated.models.test_result_create_v2_dto import TestResultCreateV2Dto as TestResultCreateV2Dto
-from src.client.generated.models.test_result_csv_export_options import TestResultCsvExportOptions as TestResultCsvExportOptions
-from src.client.generated.models.test_result_csv_export_options_mapping_inner import TestResultCsvExportOptionsMappingInner as TestResultCsvExportOptionsMappingInner
-from src.client.generated.models.test_result_defect_match_dto import TestResultDefectMatchDto as TestResultDefectMatchDto
-from src.client.generated.models.test_result_defect_matcher_dto import TestResultDefectMatcherDto as TestResultDefectMatcherDto
-from src.client.generated.models.test_result_dto import TestResultDto as TestResultDto
-from src.client.generated.models.test_result_expected_body_step_dto import TestResultExpectedBodyStepDto as TestResultExpectedBodyStepDto
-from src.client.generated.models.test_result_export_field import TestResultExportField as TestResultExportField
-from src.client.generated.models.test_result_flat_dto import TestResultFlatDto as TestResultFlatDto
-from src.client.generated.models.test_result_group_node import TestResultGroupNode as TestResultGroupNode
-from src.client.generated.models.test_result_history_dto import TestResultHistoryDto as TestResultHistoryDto
-from src.client.generated.models.test_result_leaf_node import TestResultLeafNode as TestResultLeafNode
-from src.client.generated.models.test_result_link_defect_dto import TestResultLinkDefectDto as TestResultLinkDefectDto
-from src.client.generated.models.test_result_mute_reason import TestResultMuteReason as TestResultMuteReason
-from src.client.generated.models.test_result_new_defect_dto import TestResultNewDefectDto as TestResultNewDefectDto
-from src.client.generated.models.test_result_parameter_dto import TestResultParameterDto as TestResultParameterDto
-from src.client.generated.models.test_result_patch_dto import TestResultPatchDto as TestResultPatchDto
-from src.client.generated.models.test_result_rerun_dto import TestResultRerunDto as TestResultRerunDto
-from src.client.generated.models.test_result_retries_row_dto import TestResultRetriesRowDto as TestResultRetriesRowDto
-from src.client.generated.models.test_result_row_dto import TestResultRowDto as TestResultRowDto
-from src.client.generated.models.test_result_scenario_dto import TestResultScenarioDto as TestResultScenarioDto
-from src.client.generated.models.test_result_scenario_step_dto import TestResultScenarioStepDto as TestResultScenarioStepDto
-from src.client.generated.models.test_result_scenario_step_parameter import TestResultScenarioStepParameter as TestResultScenarioStepParameter
-from src.client.generated.models.test_result_scenario_v2_dto import TestResultScenarioV2Dto as TestResultScenarioV2Dto
-from src.client.generated.models.test_result_scenario_v2_dto_steps_inner import TestResultScenarioV2DtoStepsInner as TestResultScenarioV2DtoStepsInner
-from src.client.generated.models.test_result_stats_dto import TestResultStatsDto as TestResultStatsDto
-from src.client.generated.models.test_result_tree import TestResultTree as TestResultTree
-from src.client.generated.models.test_result_tree_filter_count_dto import TestResultTreeFilterCountDto as TestResultTreeFilterCountDto
-from src.client.generated.models.test_result_tree_group_dto import TestResultTreeGroupDto as TestResultTreeGroupDto
-from src.client.generated.models.test_result_tree_group_dto_v2 import TestResultTreeGroupDtoV2 as TestResultTreeGroupDtoV2
-from src.client.generated.models.test_result_tree_leaf_dto import TestResultTreeLeafDto as TestResultTreeLeafDto
-from src.client.generated.models.test_result_tree_leaf_dto_v2 import TestResultTreeLeafDtoV2 as TestResultTreeLeafDtoV2
-from src.client.generated.models.test_result_tree_node_dto import TestResultTreeNodeDto as TestResultTreeNodeDto
-from src.client.generated.models.test_result_tree_selection_dto import TestResultTreeSelectionDto as TestResultTreeSelectionDto
-from src.client.generated.models.test_session_response_dto import TestSessionResponseDto as TestSessionResponseDto
-from src.client.generated.models.test_status import TestStatus as TestStatus
-from src.client.generated.models.test_status_count import TestStatusCount as TestStatusCount
-from src.client.generated.models.test_tag_create_dto import TestTagCreateDto as TestTagCreateDto
-from src.client.generated.models.test_tag_dto import TestTagDto as TestTagDto
-from src.client.generated.models.test_tag_patch_dto import TestTagPatchDto as TestTagPatchDto
-from src.client.generated.models.text_color_mark import TextColorMark as TextColorMark
-from src.client.generated.models.text_fill_mark import TextFillMark as TextFillMark
-from src.client.generated.models.text_mark import TextMark as TextMark
-from src.client.generated.models.text_markup_document import TextMarkupDocument as TextMarkupDocument
-from src.client.generated.models.text_paragraph_node import TextParagraphNode as TextParagraphNode
-from src.client.generated.models.text_paragraph_node_marks_inner import TextParagraphNodeMarksInner as TextParagraphNodeMarksInner
-from src.client.generated.models.tr_scenario_step_dto import TrScenarioStepDto as TrScenarioStepDto
-from src.client.generated.models.tree_create_dto import TreeCreateDto as TreeCreateDto
-from src.client.generated.models.tree_custom_field_project_dto import TreeCustomFieldProjectDto as TreeCustomFieldProjectDto
-from src.client.generated.models.tree_dto import TreeDto as TreeDto
-from src.client.generated.models.tree_dto_v2 import TreeDtoV2 as TreeDtoV2
-from src.client.generated.models.tree_patch_dto import TreePatchDto as TreePatchDto
-from src.client.generated.models.tree_path_create_dto import TreePathCreateDto as TreePathCreateDto
-from src.client.generated.models.tree_path_dto import TreePathDto as TreePathDto
-from src.client.generated.models.tree_path_item_dto import TreePathItemDto as TreePathItemDto
-from src.client.generated.models.tree_selection_dto import TreeSelectionDto as TreeSelectionDto
-from src.client.generated.models.underline_mark import UnderlineMark as UnderlineMark
-from src.client.generated.models.upload_attachment_dto import UploadAttachmentDto as UploadAttachmentDto
-from src.client.generated.models.upload_fixtures_results_dto import UploadFixturesResultsDto as UploadFixturesResultsDto
-from src.client.generated.models.upload_label_dto import UploadLabelDto as UploadLabelDto
-from src.client.generated.models.upload_link_dto import UploadLinkDto as UploadLinkDto
-from src.client.generated.models.upload_parameter_dto import UploadParameterDto as UploadParameterDto
-from src.client.generated.models.upload_results_dto import UploadResultsDto as UploadResultsDto
-from src.client.generated.models.upload_results_response_dto import UploadResultsResponseDto as UploadResultsResponseDto
-from src.client.generated.models.upload_test_case_dto import UploadTestCaseDto as UploadTestCaseDto
-from src.client.generated.models.upload_test_fixture_result_dto import UploadTestFixtureResultDto as UploadTestFixtureResultDto
-from src.client.generated.models.upload_test_fixture_result_dto_steps_inner import UploadTestFixtureResultDtoStepsInner as UploadTestFixtureResultDtoStepsInner
-from src.client.generated.models.upload_test_fixture_type import UploadTestFixtureType as UploadTestFixtureType
-from src.client.generated.models.upload_test_result_attachment_step_dto import UploadTestResultAttachmentStepDto as UploadTestResultAttachmentStepDto
-from src.client.generated.models.upload_test_result_body_step_dto import UploadTestResultBodyStepDto as UploadTestResultBodyStepDto
-from src.client.generated.models.upload_test_result_dto import UploadTestResultDto as UploadTestResultDto
-from src.client.generated.models.upload_test_result_expected_body_step_dto import UploadTestResultExpectedBodyStepDto as UploadTestResultExpectedBodyStepDto
-from src.client.generated.models.upload_test_result_step_dto import UploadTestResultStepDto as UploadTestResultStepDto
-from src.client.generated.models.upload_test_status import UploadTestStatus as UploadTestStatus
-from src.client.generated.models.webhook_create_dto import WebhookCreateDto as WebhookCreateDto
-from src.client.generated.models.webhook_dto import WebhookDto as WebhookDto
-from src.client.generated.models.webhook_patch_dto import WebhookPatchDto as WebhookPatchDto
-from src.client.generated.models.webhook_settings import WebhookSettings as WebhookSettings
-from src.client.generated.models.webhook_subject import WebhookSubject as WebhookSubject
-from src.client.generated.models.webhook_validate_dto import WebhookValidateDto as WebhookValidateDto
-from src.client.generated.models.widget_create_dto import WidgetCreateDto as WidgetCreateDto
-from src.client.generated.models.widget_create_dto_options import WidgetCreateDtoOptions as WidgetCreateDtoOptions
-from src.client.generated.models.widget_data_dto import WidgetDataDto as WidgetDataDto
-from src.client.generated.models.widget_dto import WidgetDto as WidgetDto
-from src.client.generated.models.widget_options import WidgetOptions as WidgetOptions
-from src.client.generated.models.widget_options_analytic_graph import WidgetOptionsAnalyticGraph as WidgetOptionsAnalyticGraph
-from src.client.generated.models.widget_options_having_settable_aql import WidgetOptionsHavingSettableAql as WidgetOptionsHavingSettableAql
-from src.client.generated.models.widget_options_last_launch_pie_chart import WidgetOptionsLastLaunchPieChart as WidgetOptionsLastLaunchPieChart
-from src.client.generated.models.widget_options_launch_list import WidgetOptionsLaunchList as WidgetOptionsLaunchList
-from src.client.generated.models.widget_options_launch_trend import WidgetOptionsLaunchTrend as WidgetOptionsLaunchTrend
-from src.client.generated.models.widget_options_markdown import WidgetOptionsMarkdown as WidgetOptionsMarkdown
-from src.client.generated.models.widget_options_statistic_trend import WidgetOptionsStatisticTrend as WidgetOptionsStatisticTrend
-from src.client.generated.models.widget_options_tc_pie_chart import WidgetOptionsTcPieChart as WidgetOptionsTcPieChart
-from src.client.generated.models.widget_options_tc_tree_map import WidgetOptionsTcTreeMap as WidgetOptionsTcTreeMap
-from src.client.generated.models.widget_options_top_tc import WidgetOptionsTopTc as WidgetOptionsTopTc
-from src.client.generated.models.widget_options_trend import WidgetOptionsTrend as WidgetOptionsTrend
-from src.client.generated.models.widget_options_trend_v2 import WidgetOptionsTrendV2 as WidgetOptionsTrendV2
-from src.client.generated.models.widget_patch_dto import WidgetPatchDto as WidgetPatchDto
-from src.client.generated.models.widget_type_dto import WidgetTypeDto as WidgetTypeDto
-from src.client.generated.models.workflow_create_dto import WorkflowCreateDto as WorkflowCreateDto
-from src.client.generated.models.workflow_dto import WorkflowDto as WorkflowDto
-from src.client.generated.models.workflow_patch_dto import WorkflowPatchDto as WorkflowPatchDto
-from src.client.generated.models.workflow_row_dto import WorkflowRowDto as WorkflowRowDto
-from src.client.generated.models.workflow_schema_create_dto import WorkflowSchemaCreateDto as WorkflowSchemaCreateDto
-from src.client.generated.models.workflow_schema_dto import WorkflowSchemaDto as WorkflowSchemaDto
-from src.client.generated.models.workflow_schema_patch_dto import WorkflowSchemaPatchDto as WorkflowSchemaPatchDto
 
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -1,45 +1,107 @@
 # flake8: noqa
 
-# import apis into api package
-from src.client.generated.api.custom_field_controller_api import CustomFieldControllerApi
-from src.client.generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi
-from src.client.generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api
-from src.client.generated.api.custom_field_schema_controller_api import CustomFieldSchemaControllerApi
-from src.client.generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi
-from src.client.generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi
-from src.client.generated.api.defect_controller_api import DefectControllerApi
-from src.client.generated.api.defect_matcher_controller_api import DefectMatcherControllerApi
-from src.client.generated.api.ide_controller_api import IdeControllerApi
-from src.client.generated.api.integration_controller_api import IntegrationControllerApi
-from src.client.generated.api.launch_controller_api import LaunchControllerApi
-from src.client.generated.api.launch_search_controller_api import LaunchSearchControllerApi
-from src.client.generated.api.project_controller_api import ProjectControllerApi
-from src.client.generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi
-from src.client.generated.api.shared_step_controller_api import SharedStepControllerApi
-from src.client.generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi
-from src.client.generated.api.status_controller_api import StatusControllerApi
-from src.client.generated.api.test_case_attachment_controller_api import TestCaseAttachmentControllerApi
-from src.client.generated.api.test_case_bulk_controller_api import TestCaseBulkControllerApi
-from src.client.generated.api.test_case_controller_api import TestCaseControllerApi
-from src.client.generated.api.test_case_custom_field_controller_api import TestCaseCustomFieldControllerApi
-from src.client.generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi
-from src.client.generated.api.test_case_scenario_controller_api import TestCaseScenarioControllerApi
-from src.client.generated.api.test_case_search_controller_api import TestCaseSearchControllerApi
-from src.client.generated.api.test_case_tag_controller_api import TestCaseTagControllerApi
-from src.client.generated.api.test_case_test_plan_bulk_controller_api import TestCaseTestPlanBulkControllerApi
-from src.client.generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api
-from src.client.generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api
-from src.client.generated.api.test_layer_controller_api import TestLayerControllerApi
-from src.client.generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi
-from src.client.generated.api.test_plan_controller_api import TestPlanControllerApi
-from src.client.generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi
-from src.client.generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi
-from src.client.generated.api.test_result_controller_api import TestResultControllerApi
-from src.client.generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi
-from src.client.generated.api.test_result_flat_controller_api import TestResultFlatControllerApi
-from src.client.generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi
-from src.client.generated.api.test_result_run_controller_api import TestResultRunControllerApi
-from src.client.generated.api.tree_controller_v2_api import TreeControllerV2Api
-from src.client.generated.api.upload_controller_api import UploadControllerApi
-from src.client.generated.api.upload_test_result_controller_api import UploadTestResultControllerApi
+import importlib
+from typing import TYPE_CHECKING, Any
 
+# Names are imported on first access; see scripts/lazify_generated_client.py.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CustomFieldControllerApi": "src.client.generated.api.custom_field_controller_api",
+    "CustomFieldProjectControllerApi": "src.client.generated.api.custom_field_project_controller_api",
+    "CustomFieldProjectControllerV2Api": "src.client.generated.api.custom_field_project_controller_v2_api",
+    "CustomFieldSchemaControllerApi": "src.client.generated.api.custom_field_schema_controller_api",
+    "CustomFieldValueControllerApi": "src.client.generated.api.custom_field_value_controller_api",
+    "CustomFieldValueProjectControllerApi": "src.client.generated.api.custom_field_value_project_controller_api",
+    "DefectControllerApi": "src.client.generated.api.defect_controller_api",
+    "DefectMatcherControllerApi": "src.client.generated.api.defect_matcher_controller_api",
+    "IdeControllerApi": "src.client.generated.api.ide_controller_api",
+    "IntegrationControllerApi": "src.client.generated.api.integration_controller_api",
+    "LaunchControllerApi": "src.client.generated.api.launch_controller_api",
+    "LaunchSearchControllerApi": "src.client.generated.api.launch_search_controller_api",
+    "ProjectControllerApi": "src.client.generated.api.project_controller_api",
+    "SharedStepAttachmentControllerApi": "src.client.generated.api.shared_step_attachment_controller_api",
+    "SharedStepControllerApi": "src.client.generated.api.shared_step_controller_api",
+    "SharedStepScenarioControllerApi": "src.client.generated.api.shared_step_scenario_controller_api",
+    "StatusControllerApi": "src.client.generated.api.status_controller_api",
+    "TestCaseAttachmentControllerApi": "src.client.generated.api.test_case_attachment_controller_api",
+    "TestCaseBulkControllerApi": "src.client.generated.api.test_case_bulk_controller_api",
+    "TestCaseControllerApi": "src.client.generated.api.test_case_controller_api",
+    "TestCaseCustomFieldControllerApi": "src.client.generated.api.test_case_custom_field_controller_api",
+    "TestCaseOverviewControllerApi": "src.client.generated.api.test_case_overview_controller_api",
+    "TestCaseScenarioControllerApi": "src.client.generated.api.test_case_scenario_controller_api",
+    "TestCaseSearchControllerApi": "src.client.generated.api.test_case_search_controller_api",
+    "TestCaseTagControllerApi": "src.client.generated.api.test_case_tag_controller_api",
+    "TestCaseTestPlanBulkControllerApi": "src.client.generated.api.test_case_test_plan_bulk_controller_api",
+    "TestCaseTreeBulkControllerV2Api": "src.client.generated.api.test_case_tree_bulk_controller_v2_api",
+    "TestCaseTreeControllerV2Api": "src.client.generated.api.test_case_tree_controller_v2_api",
+    "TestLayerControllerApi": "src.client.generated.api.test_layer_controller_api",
+    "TestLayerSchemaControllerApi": "src.client.generated.api.test_layer_schema_controller_api",
+    "TestPlanControllerApi": "src.client.generated.api.test_plan_controller_api",
+    "TestResultAttachmentControllerApi": "src.client.generated.api.test_result_attachment_controller_api",
+    "TestResultBulkControllerApi": "src.client.generated.api.test_result_bulk_controller_api",
+    "TestResultControllerApi": "src.client.generated.api.test_result_controller_api",
+    "TestResultFixtureControllerApi": "src.client.generated.api.test_result_fixture_controller_api",
+    "TestResultFlatControllerApi": "src.client.generated.api.test_result_flat_controller_api",
+    "TestResultRerunControllerApi": "src.client.generated.api.test_result_rerun_controller_api",
+    "TestResultRunControllerApi": "src.client.generated.api.test_result_run_controller_api",
+    "TreeControllerV2Api": "src.client.generated.api.tree_controller_v2_api",
+    "UploadControllerApi": "src.client.generated.api.upload_controller_api",
+    "UploadTestResultControllerApi": "src.client.generated.api.upload_test_result_controller_api",
+}
+
+if TYPE_CHECKING:
+    from src.client.generated.api.custom_field_controller_api import CustomFieldControllerApi
+    from src.client.generated.api.custom_field_project_controller_api import CustomFieldProjectControllerApi
+    from src.client.generated.api.custom_field_project_controller_v2_api import CustomFieldProjectControllerV2Api
+    from src.client.generated.api.custom_field_schema_controller_api import CustomFieldSchemaControllerApi
+    from src.client.generated.api.custom_field_value_controller_api import CustomFieldValueControllerApi
+    from src.client.generated.api.custom_field_value_project_controller_api import CustomFieldValueProjectControllerApi
+    from src.client.generated.api.defect_controller_api import DefectControllerApi
+    from src.client.generated.api.defect_matcher_controller_api import DefectMatcherControllerApi
+    from src.client.generated.api.ide_controller_api import IdeControllerApi
+    from src.client.generated.api.integration_controller_api import IntegrationControllerApi
+    from src.client.generated.api.launch_controller_api import LaunchControllerApi
+    from src.client.generated.api.launch_search_controller_api import LaunchSearchControllerApi
+    from src.client.generated.api.project_controller_api import ProjectControllerApi
+    from src.client.generated.api.shared_step_attachment_controller_api import SharedStepAttachmentControllerApi
+    from src.client.generated.api.shared_step_controller_api import SharedStepControllerApi
+    from src.client.generated.api.shared_step_scenario_controller_api import SharedStepScenarioControllerApi
+    from src.client.generated.api.status_controller_api import StatusControllerApi
+    from src.client.generated.api.test_case_attachment_controller_api import TestCaseAttachmentControllerApi
+    from src.client.generated.api.test_case_bulk_controller_api import TestCaseBulkControllerApi
+    from src.client.generated.api.test_case_controller_api import TestCaseControllerApi
+    from src.client.generated.api.test_case_custom_field_controller_api import TestCaseCustomFieldControllerApi
+    from src.client.generated.api.test_case_overview_controller_api import TestCaseOverviewControllerApi
+    from src.client.generated.api.test_case_scenario_controller_api import TestCaseScenarioControllerApi
+    from src.client.generated.api.test_case_search_controller_api import TestCaseSearchControllerApi
+    from src.client.generated.api.test_case_tag_controller_api import TestCaseTagControllerApi
+    from src.client.generated.api.test_case_test_plan_bulk_controller_api import TestCaseTestPlanBulkControllerApi
+    from src.client.generated.api.test_case_tree_bulk_controller_v2_api import TestCaseTreeBulkControllerV2Api
+    from src.client.generated.api.test_case_tree_controller_v2_api import TestCaseTreeControllerV2Api
+    from src.client.generated.api.test_layer_controller_api import TestLayerControllerApi
+    from src.client.generated.api.test_layer_schema_controller_api import TestLayerSchemaControllerApi
+    from src.client.generated.api.test_plan_controller_api import TestPlanControllerApi
+    from src.client.generated.api.test_result_attachment_controller_api import TestResultAttachmentControllerApi
+    from src.client.generated.api.test_result_bulk_controller_api import TestResultBulkControllerApi
+    from src.client.generated.api.test_result_controller_api import TestResultControllerApi
+    from src.client.generated.api.test_result_fixture_controller_api import TestResultFixtureControllerApi
+    from src.client.generated.api.test_result_flat_controller_api import TestResultFlatControllerApi
+    from src.client.generated.api.test_result_rerun_controller_api import TestResultRerunControllerApi
+    from src.client.generated.api.test_result_run_controller_api import TestResultRunControllerApi
+    from src.client.generated.api.tree_controller_v2_api import TreeControllerV2Api
+    from src.client.generated.api.upload_controller_api import UploadControllerApi
+    from src.client.generated.api.upload_test_result_controller_api import UploadTestResultControllerApi
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
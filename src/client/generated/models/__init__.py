@@ -12,690 +12,1396 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from src.client.generated.models.access_group_bulk_dto import AccessGroupBulkDto
-from src.client.generated.models.access_group_create_dto import AccessGroupCreateDto
-from src.client.generated.models.access_group_dto import AccessGroupDto
-from src.client.generated.models.access_group_pa_dto import AccessGroupPaDto
-from src.client.generated.models.access_group_patch_dto import AccessGroupPatchDto
-from src.client.generated.models.access_group_project_access_dto import AccessGroupProjectAccessDto
-from src.client.generated.models.access_group_projects_add_dto import AccessGroupProjectsAddDto
-from src.client.generated.models.access_group_user_dto import AccessGroupUserDto
-from src.client.generated.models.access_group_users_add_dto import AccessGroupUsersAddDto
-from src.client.generated.models.allowed_role_dto import AllowedRoleDto
-from src.client.generated.models.analytic_automation_trend_dto import AnalyticAutomationTrendDto
-from src.client.generated.models.analytic_dto import AnalyticDto
-from src.client.generated.models.analytic_interval import AnalyticInterval
-from src.client.generated.models.analytic_launch_duration_histogram_dto import AnalyticLaunchDurationHistogramDto
-from src.client.generated.models.analytic_mute_trend_dto import AnalyticMuteTrendDto
-from src.client.generated.models.analytic_tc_automation_count_dto import AnalyticTcAutomationCountDto
-from src.client.generated.models.analytic_tc_status_count_dto import AnalyticTcStatusCountDto
-from src.client.generated.models.analytic_tr_by_status_trend_dto import AnalyticTrByStatusTrendDto
-from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto
-from src.client.generated.models.assign_request_dto import AssignRequestDto
-from src.client.generated.models.async_job_dto import AsyncJobDto
-from src.client.generated.models.async_job_status_dto import AsyncJobStatusDto
-from src.client.generated.models.async_job_step_dto import AsyncJobStepDto
-from src.client.generated.models.async_job_step_status_dto import AsyncJobStepStatusDto
-from src.client.generated.models.async_job_with_steps_dto import AsyncJobWithStepsDto
-from src.client.generated.models.attachment_row import AttachmentRow
-from src.client.generated.models.attachment_step_dto import AttachmentStepDto
-from src.client.generated.models.attrs import Attrs
-from src.client.generated.models.audit_action_type_dto import AuditActionTypeDto
-from src.client.generated.models.blob_storage_stats import BlobStorageStats
-from src.client.generated.models.blob_storage_update_stats import BlobStorageUpdateStats
-from src.client.generated.models.body_step_dto import BodyStepDto
-from src.client.generated.models.bold_mark import BoldMark
-from src.client.generated.models.business_metric_dto import BusinessMetricDto
-from src.client.generated.models.category_create_dto import CategoryCreateDto
-from src.client.generated.models.category_dto import CategoryDto
-from src.client.generated.models.category_matcher_create_dto import CategoryMatcherCreateDto
-from src.client.generated.models.category_matcher_dto import CategoryMatcherDto
-from src.client.generated.models.category_matcher_patch_dto import CategoryMatcherPatchDto
-from src.client.generated.models.category_patch_dto import CategoryPatchDto
-from src.client.generated.models.cfv_merge_to_existing_global_value_dto import CfvMergeToExistingGlobalValueDto
-from src.client.generated.models.cfv_merge_to_new_global_value_dto import CfvMergeToNewGlobalValueDto
-from src.client.generated.models.ci import Ci
-from src.client.generated.models.cleaner_schema_create_dto import CleanerSchemaCreateDto
-from src.client.generated.models.cleaner_schema_dto import CleanerSchemaDto
-from src.client.generated.models.cleaner_schema_patch_dto import CleanerSchemaPatchDto
-from src.client.generated.models.cleaner_schema_target_dto import CleanerSchemaTargetDto
-from src.client.generated.models.code_block_document_node import CodeBlockDocumentNode
-from src.client.generated.models.code_mark import CodeMark
-from src.client.generated.models.comment_create_dto import CommentCreateDto
-from src.client.generated.models.comment_dto import CommentDto
-from src.client.generated.models.comment_patch_dto import CommentPatchDto
-from src.client.generated.models.create_launch_event import CreateLaunchEvent
-from src.client.generated.models.csv_import_options import CsvImportOptions
-from src.client.generated.models.custom_field_bulk_add_to_projects_dto import CustomFieldBulkAddToProjectsDto
-from src.client.generated.models.custom_field_bulk_archive_dto import CustomFieldBulkArchiveDto
-from src.client.generated.models.custom_field_create_dto import CustomFieldCreateDto
-from src.client.generated.models.custom_field_dto import CustomFieldDto
-from src.client.generated.models.custom_field_export_field_mapping import CustomFieldExportFieldMapping
-from src.client.generated.models.custom_field_import_field_mapping import CustomFieldImportFieldMapping
-from src.client.generated.models.custom_field_merge_dto import CustomFieldMergeDto
-from src.client.generated.models.custom_field_patch_dto import CustomFieldPatchDto
-from src.client.generated.models.custom_field_project_count_dto import CustomFieldProjectCountDto
-from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto
-from src.client.generated.models.custom_field_project_patch_dto import CustomFieldProjectPatchDto
-from src.client.generated.models.custom_field_project_with_values_dto import CustomFieldProjectWithValuesDto
-from src.client.generated.models.custom_field_raw_dto import CustomFieldRawDto
-from src.client.generated.models.custom_field_schema_count_dto import CustomFieldSchemaCountDto
-from src.client.generated.models.custom_field_schema_create_dto import CustomFieldSchemaCreateDto
-from src.client.generated.models.custom_field_schema_dto import CustomFieldSchemaDto
-from src.client.generated.models.custom_field_schema_patch_dto import CustomFieldSchemaPatchDto
-from src.client.generated.models.custom_field_value_bulk_delete_dto import CustomFieldValueBulkDeleteDto
-from src.client.generated.models.custom_field_value_bulk_merge_dto import CustomFieldValueBulkMergeDto
-from src.client.generated.models.custom_field_value_dto import CustomFieldValueDto
-from src.client.generated.models.custom_field_value_patch_dto import CustomFieldValuePatchDto
-from src.client.generated.models.custom_field_value_project_create_dto import CustomFieldValueProjectCreateDto
-from src.client.generated.models.custom_field_value_project_merge_by_id_dto import CustomFieldValueProjectMergeByIdDto
-from src.client.generated.models.custom_field_value_project_merge_by_name_dto import CustomFieldValueProjectMergeByNameDto
-from src.client.generated.models.custom_field_value_project_patch_dto import CustomFieldValueProjectPatchDto
-from src.client.generated.models.custom_field_value_project_rename_dto import CustomFieldValueProjectRenameDto
-from src.client.generated.models.custom_field_value_with_cf_dto import CustomFieldValueWithCfDto
-from src.client.generated.models.custom_field_value_with_tc_count_dto import CustomFieldValueWithTcCountDto
-from src.client.generated.models.custom_field_with_values_dto import CustomFieldWithValuesDto
-from src.client.generated.models.dashboard_copy_dto import DashboardCopyDto
-from src.client.generated.models.dashboard_create_dto import DashboardCreateDto
-from src.client.generated.models.dashboard_drag_and_drop_dto import DashboardDragAndDropDto
-from src.client.generated.models.dashboard_dto import DashboardDto
-from src.client.generated.models.dashboard_overview_dto import DashboardOverviewDto
-from src.client.generated.models.dashboard_patch_dto import DashboardPatchDto
-from src.client.generated.models.dashboard_update_dto import DashboardUpdateDto
-from src.client.generated.models.default_custom_field_value_dto import DefaultCustomFieldValueDto
-from src.client.generated.models.default_text_markup_document import DefaultTextMarkupDocument
-from src.client.generated.models.default_text_markup_document_all_of_content import DefaultTextMarkupDocumentAllOfContent
-from src.client.generated.models.default_webhook_settings import DefaultWebhookSettings
-from src.client.generated.models.default_webhook_settings_all_of_subjects import DefaultWebhookSettingsAllOfSubjects
-from src.client.generated.models.defect_bulk_dto import DefectBulkDto
-from src.client.generated.models.defect_count_row_dto import DefectCountRowDto
-from src.client.generated.models.defect_create_dto import DefectCreateDto
-from src.client.generated.models.defect_dto import DefectDto
-from src.client.generated.models.defect_issue_link_dto import DefectIssueLinkDto
-from src.client.generated.models.defect_matcher_create_dto import DefectMatcherCreateDto
-from src.client.generated.models.defect_matcher_dto import DefectMatcherDto
-from src.client.generated.models.defect_matcher_patch_dto import DefectMatcherPatchDto
-from src.client.generated.models.defect_overview_dto import DefectOverviewDto
-from src.client.generated.models.defect_patch_dto import DefectPatchDto
-from src.client.generated.models.defect_row_dto import DefectRowDto
-from src.client.generated.models.defect_webhook import DefectWebhook
-from src.client.generated.models.diff_value_change_boolean import DiffValueChangeBoolean
-from src.client.generated.models.diff_value_change_long import DiffValueChangeLong
-from src.client.generated.models.diff_value_change_set_long import DiffValueChangeSetLong
-from src.client.generated.models.diff_value_change_string import DiffValueChangeString
-from src.client.generated.models.document_node import DocumentNode
-from src.client.generated.models.env_var_create_dto import EnvVarCreateDto
-from src.client.generated.models.env_var_dto import EnvVarDto
-from src.client.generated.models.env_var_merge_dto import EnvVarMergeDto
-from src.client.generated.models.env_var_patch_dto import EnvVarPatchDto
-from src.client.generated.models.env_var_schema_create_dto import EnvVarSchemaCreateDto
-from src.client.generated.models.env_var_schema_dto import EnvVarSchemaDto
-from src.client.generated.models.env_var_schema_patch_dto import EnvVarSchemaPatchDto
-from src.client.generated.models.env_var_value_create_dto import EnvVarValueCreateDto
-from src.client.generated.models.env_var_value_dto import EnvVarValueDto
-from src.client.generated.models.env_var_value_patch_dto import EnvVarValuePatchDto
-from src.client.generated.models.environment_set_dto import EnvironmentSetDto
-from src.client.generated.models.event_type import EventType
-from src.client.generated.models.event_type_settings import EventTypeSettings
-from src.client.generated.models.example_export_field_mapping import ExampleExportFieldMapping
-from src.client.generated.models.expected_body_step_dto import ExpectedBodyStepDto
-from src.client.generated.models.export_field_mapping_test_case_export_field import ExportFieldMappingTestCaseExportField
-from src.client.generated.models.export_field_mapping_test_result_export_field import ExportFieldMappingTestResultExportField
-from src.client.generated.models.export_request_dto import ExportRequestDto
-from src.client.generated.models.export_status import ExportStatus
-from src.client.generated.models.export_type import ExportType
-from src.client.generated.models.ext_form_field import ExtFormField
-from src.client.generated.models.ext_form_field_checkbox import ExtFormFieldCheckbox
-from src.client.generated.models.ext_form_field_composite import ExtFormFieldComposite
-from src.client.generated.models.ext_form_field_external_select import ExtFormFieldExternalSelect
-from src.client.generated.models.ext_form_field_form_choice import ExtFormFieldFormChoice
-from src.client.generated.models.ext_form_field_form_choice_option import ExtFormFieldFormChoiceOption
-from src.client.generated.models.ext_form_field_list import ExtFormFieldList
-from src.client.generated.models.ext_form_field_number import ExtFormFieldNumber
-from src.client.generated.models.ext_form_field_option import ExtFormFieldOption
-from src.client.generated.models.ext_form_field_password import ExtFormFieldPassword
-from src.client.generated.models.ext_form_field_select import ExtFormFieldSelect
-from src.client.generated.models.ext_form_field_slider import ExtFormFieldSlider
-from src.client.generated.models.ext_form_field_text import ExtFormFieldText
-from src.client.generated.models.ext_form_field_textarea import ExtFormFieldTextarea
-from src.client.generated.models.ext_form_field_unknown import ExtFormFieldUnknown
-from src.client.generated.models.ext_issue_link import ExtIssueLink
-from src.client.generated.models.ext_issue_type import ExtIssueType
-from src.client.generated.models.ext_project import ExtProject
-from src.client.generated.models.ext_select_value import ExtSelectValue
-from src.client.generated.models.external_link_dto import ExternalLinkDto
-from src.client.generated.models.external_run_response_dto import ExternalRunResponseDto
-from src.client.generated.models.external_run_start_request_dto import ExternalRunStartRequestDto
-from src.client.generated.models.external_run_stop_request_dto import ExternalRunStopRequestDto
-from src.client.generated.models.file_upload_response_dto import FileUploadResponseDto
-from src.client.generated.models.filter_base_set_dto import FilterBaseSetDto
-from src.client.generated.models.filter_create_dto import FilterCreateDto
-from src.client.generated.models.filter_dto import FilterDto
-from src.client.generated.models.filter_patch_dto import FilterPatchDto
-from src.client.generated.models.filter_type_dto import FilterTypeDto
-from src.client.generated.models.find_all29200_response import FindAll29200Response
-from src.client.generated.models.global_permissions_dto import GlobalPermissionsDto
-from src.client.generated.models.global_settings_dto import GlobalSettingsDto
-from src.client.generated.models.global_settings_project_create_patch_dto import GlobalSettingsProjectCreatePatchDto
-from src.client.generated.models.grid_pos_dto import GridPosDto
-from src.client.generated.models.group_by import GroupBy
-from src.client.generated.models.group_node_context import GroupNodeContext
-from src.client.generated.models.id_and_name_only_dto import IdAndNameOnlyDto
-from src.client.generated.models.id_only_dto import IdOnlyDto
-from src.client.generated.models.import_request_dto import ImportRequestDto
-from src.client.generated.models.import_request_info_dto import ImportRequestInfoDto
-from src.client.generated.models.import_request_state_dto import ImportRequestStateDto
-from src.client.generated.models.import_request_type_dto import ImportRequestTypeDto
-from src.client.generated.models.integration_create_dto import IntegrationCreateDto
-from src.client.generated.models.integration_dto import IntegrationDto
-from src.client.generated.models.integration_export_create_dto import IntegrationExportCreateDto
-from src.client.generated.models.integration_export_dto import IntegrationExportDto
-from src.client.generated.models.integration_export_patch_dto import IntegrationExportPatchDto
-from src.client.generated.models.integration_fields_form_dto import IntegrationFieldsFormDto
-from src.client.generated.models.integration_fields_form_dto_default_project_fields_inner import IntegrationFieldsFormDtoDefaultProjectFieldsInner
-from src.client.generated.models.integration_info_dto import IntegrationInfoDto
-from src.client.generated.models.integration_links_fixed_dto import IntegrationLinksFixedDto
-from src.client.generated.models.integration_operation_type_dto import IntegrationOperationTypeDto
-from src.client.generated.models.integration_patch_dto import IntegrationPatchDto
-from src.client.generated.models.integration_routine_type_dto import IntegrationRoutineTypeDto
-from src.client.generated.models.integration_type_dto import IntegrationTypeDto
-from src.client.generated.models.integration_validate_dto import IntegrationValidateDto
-from src.client.generated.models.integration_webhook_create_dto import IntegrationWebhookCreateDto
-from src.client.generated.models.integration_webhook_dto import IntegrationWebhookDto
-from src.client.generated.models.integration_webhook_log_dto import IntegrationWebhookLogDto
-from src.client.generated.models.integration_webhook_patch_dto import IntegrationWebhookPatchDto
-from src.client.generated.models.integration_webhook_token_dto import IntegrationWebhookTokenDto
-from src.client.generated.models.issue_create_dto import IssueCreateDto
-from src.client.generated.models.issue_dto import IssueDto
-from src.client.generated.models.issue_import_field_mapping import IssueImportFieldMapping
-from src.client.generated.models.issue_integration_export_field_mapping import IssueIntegrationExportFieldMapping
-from src.client.generated.models.issue_patch_dto import IssuePatchDto
-from src.client.generated.models.issue_schema_create_dto import IssueSchemaCreateDto
-from src.client.generated.models.issue_schema_dto import IssueSchemaDto
-from src.client.generated.models.issue_schema_patch_dto import IssueSchemaPatchDto
-from src.client.generated.models.issue_to_create_dto import IssueToCreateDto
-from src.client.generated.models.italic_mark import ItalicMark
-from src.client.generated.models.job import Job
-from src.client.generated.models.job_create_dto import JobCreateDto
-from src.client.generated.models.job_dto import JobDto
-from src.client.generated.models.job_info_dto import JobInfoDto
-from src.client.generated.models.job_mapping import JobMapping
-from src.client.generated.models.job_parameter_dto import JobParameterDto
-from src.client.generated.models.job_patch_dto import JobPatchDto
-from src.client.generated.models.job_rerun_request_dto import JobRerunRequestDto
-from src.client.generated.models.job_run import JobRun
-from src.client.generated.models.job_run_dto import JobRunDto
-from src.client.generated.models.job_run_request_dto import JobRunRequestDto
-from src.client.generated.models.job_run_stage_dto import JobRunStageDto
-from src.client.generated.models.job_run_status_dto import JobRunStatusDto
-from src.client.generated.models.job_run_upload_info_dto import JobRunUploadInfoDto
-from src.client.generated.models.job_test_cases_stat_dto import JobTestCasesStatDto
-from src.client.generated.models.launch import Launch
-from src.client.generated.models.launch_cleanup_request import LaunchCleanupRequest
-from src.client.generated.models.launch_close_config_dto import LaunchCloseConfigDto
-from src.client.generated.models.launch_copy_rq_dto import LaunchCopyRqDto
-from src.client.generated.models.launch_create_and_upload_dto import LaunchCreateAndUploadDto
-from src.client.generated.models.launch_create_dto import LaunchCreateDto
-from src.client.generated.models.launch_diff_cell import LaunchDiffCell
-from src.client.generated.models.launch_diff_mode import LaunchDiffMode
-from src.client.generated.models.launch_diff_row import LaunchDiffRow
-from src.client.generated.models.launch_diff_status_change_dto import LaunchDiffStatusChangeDto
-from src.client.generated.models.launch_diff_test_result import LaunchDiffTestResult
-from src.client.generated.models.launch_diff_test_result_dto import LaunchDiffTestResultDto
-from src.client.generated.models.launch_dto import LaunchDto
-from src.client.generated.models.launch_existing_upload_dto import LaunchExistingUploadDto
-from src.client.generated.models.launch_live_doc_config_dto import LaunchLiveDocConfigDto
-from src.client.generated.models.launch_member_stats_dto import LaunchMemberStatsDto
-from src.client.generated.models.launch_merge_dto import LaunchMergeDto
-from src.client.generated.models.launch_patch_dto import LaunchPatchDto
-from src.client.generated.models.launch_pdf_options import LaunchPdfOptions
-from src.client.generated.models.launch_pdf_part import LaunchPdfPart
-from src.client.generated.models.launch_pdf_structure import LaunchPdfStructure
-from src.client.generated.models.launch_preview_dto import LaunchPreviewDto
-from src.client.generated.models.launch_progress_dto import LaunchProgressDto
-from src.client.generated.models.launch_row_dto import LaunchRowDto
-from src.client.generated.models.launch_tag_create_dto import LaunchTagCreateDto
-from src.client.generated.models.launch_tag_dto import LaunchTagDto
-from src.client.generated.models.launch_tag_patch_dto import LaunchTagPatchDto
-from src.client.generated.models.launch_test_cases_add_dto import LaunchTestCasesAddDto
-from src.client.generated.models.launch_test_plan_add_dto import LaunchTestPlanAddDto
-from src.client.generated.models.launch_upload_response_dto import LaunchUploadResponseDto
-from src.client.generated.models.launch_variable_dto import LaunchVariableDto
-from src.client.generated.models.launch_webhook import LaunchWebhook
-from src.client.generated.models.line_break_paragraph_node import LineBreakParagraphNode
-from src.client.generated.models.link_export_field_mapping import LinkExportFieldMapping
-from src.client.generated.models.link_import_field_mapping import LinkImportFieldMapping
-from src.client.generated.models.link_mark import LinkMark
-from src.client.generated.models.list_selection_dto import ListSelectionDto
-from src.client.generated.models.manual_session_request_dto import ManualSessionRequestDto
-from src.client.generated.models.matcher import Matcher
-from src.client.generated.models.member_create_dto import MemberCreateDto
-from src.client.generated.models.member_dto import MemberDto
-from src.client.generated.models.member_patch_dto import MemberPatchDto
-from src.client.generated.models.metric import Metric
-from src.client.generated.models.mfa_global_settings_dto import MfaGlobalSettingsDto
-from src.client.generated.models.mfa_global_settings_patch_dto import MfaGlobalSettingsPatchDto
-from src.client.generated.models.multi_value_export_field_mapping import MultiValueExportFieldMapping
-from src.client.generated.models.multi_value_import_field_mapping import MultiValueImportFieldMapping
-from src.client.generated.models.multi_value_map_string_string import MultiValueMapStringString
-from src.client.generated.models.mute_create_dto import MuteCreateDto
-from src.client.generated.models.mute_dto import MuteDto
-from src.client.generated.models.name_only_dto import NameOnlyDto
-from src.client.generated.models.node_type import NodeType
-from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto
-from src.client.generated.models.normalized_scenario_dto_attachments_value import NormalizedScenarioDtoAttachmentsValue
-from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto
-from src.client.generated.models.ordered_value_dto_string import OrderedValueDtoString
-from src.client.generated.models.page_access_group_dto import PageAccessGroupDto
-from src.client.generated.models.page_access_group_dto_sort import PageAccessGroupDtoSort
-from src.client.generated.models.page_access_group_pa_dto import PageAccessGroupPaDto
-from src.client.generated.models.page_access_group_user_dto import PageAccessGroupUserDto
-from src.client.generated.models.page_async_job_dto import PageAsyncJobDto
-from src.client.generated.models.page_category_dto import PageCategoryDto
-from src.client.generated.models.page_category_matcher_dto import PageCategoryMatcherDto
-from src.client.generated.models.page_cleaner_schema_dto import PageCleanerSchemaDto
-from src.client.generated.models.page_comment_dto import PageCommentDto
-from src.client.generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto
-from src.client.generated.models.page_custom_field_schema_dto import PageCustomFieldSchemaDto
-from src.client.generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto
-from src.client.generated.models.page_dashboard_dto import PageDashboardDto
-from src.client.generated.models.page_defect_count_row_dto import PageDefectCountRowDto
-from src.client.generated.models.page_defect_dto import PageDefectDto
-from src.client.generated.models.page_defect_matcher_dto import PageDefectMatcherDto
-from src.client.generated.models.page_defect_row_dto import PageDefectRowDto
-from src.client.generated.models.page_env_var_schema_dto import PageEnvVarSchemaDto
-from src.client.generated.models.page_export_request_dto import PageExportRequestDto
-from src.client.generated.models.page_filter_dto import PageFilterDto
-from src.client.generated.models.page_id_and_name_only_dto import PageIdAndNameOnlyDto
-from src.client.generated.models.page_import_request_dto import PageImportRequestDto
-from src.client.generated.models.page_integration_dto import PageIntegrationDto
-from src.client.generated.models.page_integration_export_dto import PageIntegrationExportDto
-from src.client.generated.models.page_integration_info_dto import PageIntegrationInfoDto
-from src.client.generated.models.page_integration_webhook_dto import PageIntegrationWebhookDto
-from src.client.generated.models.page_integration_webhook_log_dto import PageIntegrationWebhookLogDto
-from src.client.generated.models.page_issue_dto import PageIssueDto
-from src.client.generated.models.page_issue_schema_dto import PageIssueSchemaDto
-from src.client.generated.models.page_job_dto import PageJobDto
-from src.client.generated.models.page_launch_diff_row import PageLaunchDiffRow
-from src.client.generated.models.page_launch_dto import PageLaunchDto
-from src.client.generated.models.page_launch_member_stats_dto import PageLaunchMemberStatsDto
-from src.client.generated.models.page_launch_preview_dto import PageLaunchPreviewDto
-from src.client.generated.models.page_launch_row_dto import PageLaunchRowDto
-from src.client.generated.models.page_launch_tag_dto import PageLaunchTagDto
-from src.client.generated.models.page_launch_variable_dto import PageLaunchVariableDto
-from src.client.generated.models.page_member_dto import PageMemberDto
-from src.client.generated.models.page_mute_dto import PageMuteDto
-from src.client.generated.models.page_permission_set_dto import PagePermissionSetDto
-from src.client.generated.models.page_project_collaborator_access_dto import PageProjectCollaboratorAccessDto
-from src.client.generated.models.page_project_collaborator_dto import PageProjectCollaboratorDto
-from src.client.generated.models.page_project_custom_field_dto import PageProjectCustomFieldDto
-from src.client.generated.models.page_project_dto import PageProjectDto
-from src.client.generated.models.page_project_group_access_dto import PageProjectGroupAccessDto
-from src.client.generated.models.page_project_integration_dto import PageProjectIntegrationDto
-from src.client.generated.models.page_project_suggest_dto import PageProjectSuggestDto
-from src.client.generated.models.page_role_schema_dto import PageRoleSchemaDto
-from src.client.generated.models.page_shared_step_attachment_row_dto import PageSharedStepAttachmentRowDto
-from src.client.generated.models.page_shared_step_dto import PageSharedStepDto
-from src.client.generated.models.page_statistic_widget_item import PageStatisticWidgetItem
-from src.client.generated.models.page_status_dto import PageStatusDto
-from src.client.generated.models.page_template_dto import PageTemplateDto
-from src.client.generated.models.page_test_case_attachment_row_dto import PageTestCaseAttachmentRowDto
-from src.client.generated.models.page_test_case_audit_log_entry_dto import PageTestCaseAuditLogEntryDto
-from src.client.generated.models.page_test_case_dto import PageTestCaseDto
-from src.client.generated.models.page_test_case_example_dto import PageTestCaseExampleDto
-from src.client.generated.models.page_test_case_flat_dto import PageTestCaseFlatDto
-from src.client.generated.models.page_test_case_row_dto import PageTestCaseRowDto
-from src.client.generated.models.page_test_case_tree_group_dto import PageTestCaseTreeGroupDto
-from src.client.generated.models.page_test_case_tree_leaf_dto import PageTestCaseTreeLeafDto
-from src.client.generated.models.page_test_case_tree_node_dto import PageTestCaseTreeNodeDto
-from src.client.generated.models.page_test_case_tree_node_dto_content_inner import PageTestCaseTreeNodeDtoContentInner
-from src.client.generated.models.page_test_fixture_result_attachment_row_dto import PageTestFixtureResultAttachmentRowDto
-from src.client.generated.models.page_test_key_schema_dto import PageTestKeySchemaDto
-from src.client.generated.models.page_test_layer_dto import PageTestLayerDto
-from src.client.generated.models.page_test_layer_schema_dto import PageTestLayerSchemaDto
-from src.client.generated.models.page_test_plan_dto import PageTestPlanDto
-from src.client.generated.models.page_test_plan_row_dto import PageTestPlanRowDto
-from src.client.generated.models.page_test_result_attachment_row_dto import PageTestResultAttachmentRowDto
-from src.client.generated.models.page_test_result_defect_match_dto import PageTestResultDefectMatchDto
-from src.client.generated.models.page_test_result_dto import PageTestResultDto
-from src.client.generated.models.page_test_result_flat_dto import PageTestResultFlatDto
-from src.client.generated.models.page_test_result_history_dto import PageTestResultHistoryDto
-from src.client.generated.models.page_test_result_retries_row_dto import PageTestResultRetriesRowDto
-from src.client.generated.models.page_test_result_row_dto import PageTestResultRowDto
-from src.client.generated.models.page_test_result_tree_group_dto import PageTestResultTreeGroupDto
-from src.client.generated.models.page_test_result_tree_leaf_dto import PageTestResultTreeLeafDto
-from src.client.generated.models.page_test_result_tree_node_dto import PageTestResultTreeNodeDto
-from src.client.generated.models.page_test_result_tree_node_dto_content_inner import PageTestResultTreeNodeDtoContentInner
-from src.client.generated.models.page_tree_dto import PageTreeDto
-from src.client.generated.models.page_tree_dto_v2 import PageTreeDtoV2
-from src.client.generated.models.page_tree_path_dto import PageTreePathDto
-from src.client.generated.models.page_webhook_dto import PageWebhookDto
-from src.client.generated.models.page_widget_dto import PageWidgetDto
-from src.client.generated.models.page_workflow_dto import PageWorkflowDto
-from src.client.generated.models.page_workflow_schema_dto import PageWorkflowSchemaDto
-from src.client.generated.models.pageable import Pageable
-from src.client.generated.models.paragraph_document_node import ParagraphDocumentNode
-from src.client.generated.models.paragraph_document_node_all_of_content import ParagraphDocumentNodeAllOfContent
-from src.client.generated.models.paragraph_node import ParagraphNode
-from src.client.generated.models.parameter import Parameter
-from src.client.generated.models.parameter_value_dto import ParameterValueDto
-from src.client.generated.models.permission_dto import PermissionDto
-from src.client.generated.models.permission_set_create_dto import PermissionSetCreateDto
-from src.client.generated.models.permission_set_dto import PermissionSetDto
-from src.client.generated.models.permission_set_patch_dto import PermissionSetPatchDto
-from src.client.generated.models.project_access_collaborator_add_dto import ProjectAccessCollaboratorAddDto
-from src.client.generated.models.project_access_group_add_dto import ProjectAccessGroupAddDto
-from src.client.generated.models.project_category_add_dto import ProjectCategoryAddDto
-from src.client.generated.models.project_category_matcher_add_dto import ProjectCategoryMatcherAddDto
-from src.client.generated.models.project_category_matcher_remove_dto import ProjectCategoryMatcherRemoveDto
-from src.client.generated.models.project_category_remove_dto import ProjectCategoryRemoveDto
-from src.client.generated.models.project_collaborator_access_dto import ProjectCollaboratorAccessDto
-from src.client.generated.models.project_collaborator_dto import ProjectCollaboratorDto
-from src.client.generated.models.project_create_dto import ProjectCreateDto
-from src.client.generated.models.project_custom_field_dto import ProjectCustomFieldDto
-from src.client.generated.models.project_dto import ProjectDto
-from src.client.generated.models.project_group_access_add_dto import ProjectGroupAccessAddDto
-from src.client.generated.models.project_group_access_dto import ProjectGroupAccessDto
-from src.client.generated.models.project_integration_create_dto import ProjectIntegrationCreateDto
-from src.client.generated.models.project_integration_dto import ProjectIntegrationDto
-from src.client.generated.models.project_integration_fields_form_dto import ProjectIntegrationFieldsFormDto
-from src.client.generated.models.project_integration_patch_dto import ProjectIntegrationPatchDto
-from src.client.generated.models.project_integration_validate_dto import ProjectIntegrationValidateDto
-from src.client.generated.models.project_metric_dto import ProjectMetricDto
-from src.client.generated.models.project_patch_dto import ProjectPatchDto
-from src.client.generated.models.project_property_create_dto import ProjectPropertyCreateDto
-from src.client.generated.models.project_property_dto import ProjectPropertyDto
-from src.client.generated.models.project_property_patch_dto import ProjectPropertyPatchDto
-from src.client.generated.models.project_stats_dto import ProjectStatsDto
-from src.client.generated.models.project_suggest_dto import ProjectSuggestDto
-from src.client.generated.models.project_sync_request import ProjectSyncRequest
-from src.client.generated.models.project_test_case_count_dto import ProjectTestCaseCountDto
-from src.client.generated.models.resolve_request_v2_dto import ResolveRequestV2Dto
-from src.client.generated.models.retry import Retry
-from src.client.generated.models.role_create_dto import RoleCreateDto
-from src.client.generated.models.role_dto import RoleDto
-from src.client.generated.models.role_export_field_mapping import RoleExportFieldMapping
-from src.client.generated.models.role_import_field_mapping import RoleImportFieldMapping
-from src.client.generated.models.role_patch_dto import RolePatchDto
-from src.client.generated.models.role_schema_create_dto import RoleSchemaCreateDto
-from src.client.generated.models.role_schema_dto import RoleSchemaDto
-from src.client.generated.models.role_schema_patch_dto import RoleSchemaPatchDto
-from src.client.generated.models.scenario_export_field_mapping import ScenarioExportFieldMapping
-from src.client.generated.models.scenario_step_copy_dto import ScenarioStepCopyDto
-from src.client.generated.models.scenario_step_create_dto import ScenarioStepCreateDto
-from src.client.generated.models.scenario_step_created_response_dto import ScenarioStepCreatedResponseDto
-from src.client.generated.models.scenario_step_dto import ScenarioStepDto
-from src.client.generated.models.scenario_step_move_dto import ScenarioStepMoveDto
-from src.client.generated.models.scenario_step_patch_dto import ScenarioStepPatchDto
-from src.client.generated.models.session_variable import SessionVariable
-from src.client.generated.models.shared_step_attachment_patch_dto import SharedStepAttachmentPatchDto
-from src.client.generated.models.shared_step_attachment_row_dto import SharedStepAttachmentRowDto
-from src.client.generated.models.shared_step_create_dto import SharedStepCreateDto
-from src.client.generated.models.shared_step_dto import SharedStepDto
-from src.client.generated.models.shared_step_patch_dto import SharedStepPatchDto
-from src.client.generated.models.shared_step_scenario_dto import SharedStepScenarioDto
-from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner
-from src.client.generated.models.shared_step_step_dto import SharedStepStepDto
-from src.client.generated.models.statistic_dto import StatisticDto
-from src.client.generated.models.statistic_widget_item import StatisticWidgetItem
-from src.client.generated.models.status import Status
-from src.client.generated.models.status_create_dto import StatusCreateDto
-from src.client.generated.models.status_dto import StatusDto
-from src.client.generated.models.status_patch_dto import StatusPatchDto
-from src.client.generated.models.strike_mark import StrikeMark
-from src.client.generated.models.tag_import_field_mapping import TagImportFieldMapping
-from src.client.generated.models.template_dto import TemplateDto
-from src.client.generated.models.template_overview_dto import TemplateOverviewDto
-from src.client.generated.models.test_case_association_diff import TestCaseAssociationDiff
-from src.client.generated.models.test_case_attachment_patch_dto import TestCaseAttachmentPatchDto
-from src.client.generated.models.test_case_attachment_row_dto import TestCaseAttachmentRowDto
-from src.client.generated.models.test_case_audit_log_data import TestCaseAuditLogData
-from src.client.generated.models.test_case_audit_log_data_diff import TestCaseAuditLogDataDiff
-from src.client.generated.models.test_case_audit_log_entry_dto import TestCaseAuditLogEntryDto
-from src.client.generated.models.test_case_bulk_cf_move_strategy import TestCaseBulkCfMoveStrategy
-from src.client.generated.models.test_case_bulk_change_project_dto_v2 import TestCaseBulkChangeProjectDtoV2
-from src.client.generated.models.test_case_bulk_clone_dto import TestCaseBulkCloneDto
-from src.client.generated.models.test_case_bulk_clone_dto_v2 import TestCaseBulkCloneDtoV2
-from src.client.generated.models.test_case_bulk_drag_and_drop_dto import TestCaseBulkDragAndDropDto
-from src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2 import TestCaseBulkDragAndDropDtoV2
-from src.client.generated.models.test_case_bulk_dto import TestCaseBulkDto
-from src.client.generated.models.test_case_bulk_dto_v2 import TestCaseBulkDtoV2
-from src.client.generated.models.test_case_bulk_entity_ids_dto import TestCaseBulkEntityIdsDto
-from src.client.generated.models.test_case_bulk_entity_ids_dto_v2 import TestCaseBulkEntityIdsDtoV2
-from src.client.generated.models.test_case_bulk_export_csv_options import TestCaseBulkExportCsvOptions
-from src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner import TestCaseBulkExportCsvOptionsMappingInner
-from src.client.generated.models.test_case_bulk_export_pdf_options import TestCaseBulkExportPdfOptions
-from src.client.generated.models.test_case_bulk_external_link_dto import TestCaseBulkExternalLinkDto
-from src.client.generated.models.test_case_bulk_issue_dto import TestCaseBulkIssueDto
-from src.client.generated.models.test_case_bulk_layer_dto import TestCaseBulkLayerDto
-from src.client.generated.models.test_case_bulk_member_dto import TestCaseBulkMemberDto
-from src.client.generated.models.test_case_bulk_mute_dto import TestCaseBulkMuteDto
-from src.client.generated.models.test_case_bulk_new_cfv_dto import TestCaseBulkNewCfvDto
-from src.client.generated.models.test_case_bulk_project_change_dto import TestCaseBulkProjectChangeDto
-from src.client.generated.models.test_case_bulk_run_existing_launch_dto import TestCaseBulkRunExistingLaunchDto
-from src.client.generated.models.test_case_bulk_run_new_launch_dto import TestCaseBulkRunNewLaunchDto
-from src.client.generated.models.test_case_bulk_status_dto import TestCaseBulkStatusDto
-from src.client.generated.models.test_case_bulk_tag_dto import TestCaseBulkTagDto
-from src.client.generated.models.test_case_bulk_test_plan_create_dto import TestCaseBulkTestPlanCreateDto
-from src.client.generated.models.test_case_cf_bulk_delta_dto_v2 import TestCaseCfBulkDeltaDtoV2
-from src.client.generated.models.test_case_cfv_bulk_add_dto import TestCaseCfvBulkAddDto
-from src.client.generated.models.test_case_clone_rq_dto import TestCaseCloneRqDto
-from src.client.generated.models.test_case_count_dto import TestCaseCountDto
-from src.client.generated.models.test_case_create_v2_dto import TestCaseCreateV2Dto
-from src.client.generated.models.test_case_csv_export_options import TestCaseCsvExportOptions
-from src.client.generated.models.test_case_csv_import_options import TestCaseCsvImportOptions
-from src.client.generated.models.test_case_csv_import_options_mapping_inner import TestCaseCsvImportOptionsMappingInner
-from src.client.generated.models.test_case_csv_preview_options import TestCaseCsvPreviewOptions
-from src.client.generated.models.test_case_detach_automation_rq_dto import TestCaseDetachAutomationRqDto
-from src.client.generated.models.test_case_diff import TestCaseDiff
-from src.client.generated.models.test_case_dto import TestCaseDto
-from src.client.generated.models.test_case_example_dto import TestCaseExampleDto
-from src.client.generated.models.test_case_export_field import TestCaseExportField
-from src.client.generated.models.test_case_external_link_bulk_add_dto import TestCaseExternalLinkBulkAddDto
-from src.client.generated.models.test_case_flat_dto import TestCaseFlatDto
-from src.client.generated.models.test_case_full_tree_node_dto import TestCaseFullTreeNodeDto
-from src.client.generated.models.test_case_import_dto import TestCaseImportDto
-from src.client.generated.models.test_case_import_field import TestCaseImportField
-from src.client.generated.models.test_case_import_mapping import TestCaseImportMapping
-from src.client.generated.models.test_case_info import TestCaseInfo
-from src.client.generated.models.test_case_issue_bulk_add_dto import TestCaseIssueBulkAddDto
-from src.client.generated.models.test_case_last_result_dto import TestCaseLastResultDto
-from src.client.generated.models.test_case_layer_bulk_set_dto import TestCaseLayerBulkSetDto
-from src.client.generated.models.test_case_light_tree_node_dto import TestCaseLightTreeNodeDto
-from src.client.generated.models.test_case_member_bulk_add_dto import TestCaseMemberBulkAddDto
-from src.client.generated.models.test_case_mute_bulk_add_dto import TestCaseMuteBulkAddDto
-from src.client.generated.models.test_case_overview_dto import TestCaseOverviewDto
-from src.client.generated.models.test_case_parameter_dto import TestCaseParameterDto
-from src.client.generated.models.test_case_parameter_values import TestCaseParameterValues
-from src.client.generated.models.test_case_patch_v2_dto import TestCasePatchV2Dto
-from src.client.generated.models.test_case_pdf_options import TestCasePdfOptions
-from src.client.generated.models.test_case_pdf_part import TestCasePdfPart
-from src.client.generated.models.test_case_relation_dto import TestCaseRelationDto
-from src.client.generated.models.test_case_relation_type_dto import TestCaseRelationTypeDto
-from src.client.generated.models.test_case_row_dto import TestCaseRowDto
-from src.client.generated.models.test_case_run_bulk_existing_launch_dto import TestCaseRunBulkExistingLaunchDto
-from src.client.generated.models.test_case_run_bulk_new_launch_dto import TestCaseRunBulkNewLaunchDto
-from src.client.generated.models.test_case_run_by_stats import TestCaseRunByStats
-from src.client.generated.models.test_case_run_stats_request_dto import TestCaseRunStatsRequestDto
-from src.client.generated.models.test_case_scenario_dto import TestCaseScenarioDto
-from src.client.generated.models.test_case_scenario_step_dto import TestCaseScenarioStepDto
-from src.client.generated.models.test_case_scenario_v2_dto import TestCaseScenarioV2Dto
-from src.client.generated.models.test_case_selection_dto_v2 import TestCaseSelectionDtoV2
-from src.client.generated.models.test_case_status_bulk_set_dto import TestCaseStatusBulkSetDto
-from src.client.generated.models.test_case_style import TestCaseStyle
-from src.client.generated.models.test_case_sync_from_to import TestCaseSyncFromTo
-from src.client.generated.models.test_case_sync_rq_dto import TestCaseSyncRqDto
-from src.client.generated.models.test_case_tag_bulk_add_dto import TestCaseTagBulkAddDto
-from src.client.generated.models.test_case_test_plan_bulk_create_dto import TestCaseTestPlanBulkCreateDto
-from src.client.generated.models.test_case_tree_all_paths_dto import TestCaseTreeAllPathsDto
-from src.client.generated.models.test_case_tree_filter_count_dto import TestCaseTreeFilterCountDto
-from src.client.generated.models.test_case_tree_group_add_dto import TestCaseTreeGroupAddDto
-from src.client.generated.models.test_case_tree_group_dto import TestCaseTreeGroupDto
-from src.client.generated.models.test_case_tree_group_rename_dto import TestCaseTreeGroupRenameDto
-from src.client.generated.models.test_case_tree_leaf_add_dto import TestCaseTreeLeafAddDto
-from src.client.generated.models.test_case_tree_leaf_dto import TestCaseTreeLeafDto
-from src.client.generated.models.test_case_tree_leaf_dto_v2 import TestCaseTreeLeafDtoV2
-from src.client.generated.models.test_case_tree_leaf_rename_dto import TestCaseTreeLeafRenameDto
-from src.client.generated.models.test_case_tree_node_dto import TestCaseTreeNodeDto
-from src.client.generated.models.test_case_tree_run_stat_request_dto import TestCaseTreeRunStatRequestDto
-from src.client.generated.models.test_case_tree_selection_dto import TestCaseTreeSelectionDto
-from src.client.generated.models.test_case_tree_selection_dto_v2 import TestCaseTreeSelectionDtoV2
-from src.client.generated.models.test_case_type import TestCaseType
-from src.client.generated.models.test_case_update_field_dto import TestCaseUpdateFieldDto
-from src.client.generated.models.test_case_update_policy_dto import TestCaseUpdatePolicyDto
-from src.client.generated.models.test_case_update_schema_create_dto import TestCaseUpdateSchemaCreateDto
-from src.client.generated.models.test_case_update_schema_dto import TestCaseUpdateSchemaDto
-from src.client.generated.models.test_case_update_schema_patch_dto import TestCaseUpdateSchemaPatchDto
-from src.client.generated.models.test_case_version_dto import TestCaseVersionDto
-from src.client.generated.models.test_case_version_patch_dto import TestCaseVersionPatchDto
-from src.client.generated.models.test_case_version_rq_dto import TestCaseVersionRqDto
-from src.client.generated.models.test_code_generation_request_dto import TestCodeGenerationRequestDto
-from src.client.generated.models.test_code_generation_response_dto import TestCodeGenerationResponseDto
-from src.client.generated.models.test_duration_count import TestDurationCount
-from src.client.generated.models.test_fixture_result_attachment_patch_dto import TestFixtureResultAttachmentPatchDto
-from src.client.generated.models.test_fixture_result_attachment_row_dto import TestFixtureResultAttachmentRowDto
-from src.client.generated.models.test_fixture_result_type_dto import TestFixtureResultTypeDto
-from src.client.generated.models.test_fixture_result_v2_dto import TestFixtureResultV2Dto
-from src.client.generated.models.test_key_dto import TestKeyDto
-from src.client.generated.models.test_key_import_field_mapping import TestKeyImportFieldMapping
-from src.client.generated.models.test_key_schema_create_dto import TestKeySchemaCreateDto
-from src.client.generated.models.test_key_schema_dto import TestKeySchemaDto
-from src.client.generated.models.test_key_schema_patch_dto import TestKeySchemaPatchDto
-from src.client.generated.models.test_layer_create_dto import TestLayerCreateDto
-from src.client.generated.models.test_layer_dto import TestLayerDto
-from src.client.generated.models.test_layer_patch_dto import TestLayerPatchDto
-from src.client.generated.models.test_layer_schema_create_dto import TestLayerSchemaCreateDto
-from src.client.generated.models.test_layer_schema_dto import TestLayerSchemaDto
-from src.client.generated.models.test_layer_schema_patch_dto import TestLayerSchemaPatchDto
-from src.client.generated.models.test_plan_assign_dto import TestPlanAssignDto
-from src.client.generated.models.test_plan_create_dto import TestPlanCreateDto
-from src.client.generated.models.test_plan_diff_dto import TestPlanDiffDto
-from src.client.generated.models.test_plan_dto import TestPlanDto
-from src.client.generated.models.test_plan_job_parameters_dto import TestPlanJobParametersDto
-from src.client.generated.models.test_plan_job_stat_dto import TestPlanJobStatDto
-from src.client.generated.models.test_plan_member_stat_dto import TestPlanMemberStatDto
-from src.client.generated.models.test_plan_patch_dto import TestPlanPatchDto
-from src.client.generated.models.test_plan_row_dto import TestPlanRowDto
-from src.client.generated.models.test_plan_run_request_dto import TestPlanRunRequestDto
-from src.client.generated.models.test_plan_tree_selection_dto import TestPlanTreeSelectionDto
-from src.client.generated.models.test_plan_webhook import TestPlanWebhook
-from src.client.generated.models.test_result_attachment_patch_dto import TestResultAttachmentPatchDto
-from src.client.generated.models.test_result_attachment_row_dto import TestResultAttachmentRowDto
-from src.client.generated.models.test_result_attachment_step_dto import TestResultAttachmentStepDto
-from src.client.generated.models.test_result_attachment_step_dto_all_of_attachment import TestResultAttachmentStepDtoAllOfAttachment
-from src.client.generated.models.test_result_body_step_dto import TestResultBodyStepDto
-from src.client.generated.models.test_result_bulk_assign_dto import TestResultBulkAssignDto
-from src.client.generated.models.test_result_bulk_dto import TestResultBulkDto
-from src.client.generated.models.test_result_bulk_entity_ids_dto import TestResultBulkEntityIdsDto
-from src.client.generated.models.test_result_bulk_mute_dto import TestResultBulkMuteDto
-from src.client.generated.models.test_result_bulk_rerun_dto import TestResultBulkRerunDto
-from src.client.generated.models.test_result_bulk_resolve_dto import TestResultBulkResolveDto
-from src.client.generated.models.test_result_bulk_tag_dto import TestResultBulkTagDto
-from src.client.generated.models.test_result_create_v2_dto import TestResultCreateV2Dto
-from src.client.generated.models.test_result_csv_export_options import TestResultCsvExportOptions
-from src.client.generated.models.test_result_csv_export_options_mapping_inner import TestResultCsvExportOptionsMappingInner
-from src.client.generated.models.test_result_defect_match_dto import TestResultDefectMatchDto
-from src.client.generated.models.test_result_defect_matcher_dto import TestResultDefectMatcherDto
-from src.client.generated.models.test_result_dto import TestResultDto
-from src.client.generated.models.test_result_expected_body_step_dto import TestResultExpectedBodyStepDto
-from src.client.generated.models.test_result_export_field import TestResultExportField
-from src.client.generated.models.test_result_flat_dto import TestResultFlatDto
-from src.client.generated.models.test_result_group_node import TestResultGroupNode
-from src.client.generated.models.test_result_history_dto import TestResultHistoryDto
-from src.client.generated.models.test_result_leaf_node import TestResultLeafNode
-from src.client.generated.models.test_result_link_defect_dto import TestResultLinkDefectDto
-from src.client.generated.models.test_result_mute_reason import TestResultMuteReason
-from src.client.generated.models.test_result_new_defect_dto import TestResultNewDefectDto
-from src.client.generated.models.test_result_parameter_dto import TestResultParameterDto
-from src.client.generated.models.test_result_patch_dto import TestResultPatchDto
-from src.client.generated.models.test_result_rerun_dto import TestResultRerunDto
-from src.client.generated.models.test_result_retries_row_dto import TestResultRetriesRowDto
-from src.client.generated.models.test_result_row_dto import TestResultRowDto
-from src.client.generated.models.test_result_scenario_dto import TestResultScenarioDto
-from src.client.generated.models.test_result_scenario_step_dto import TestResultScenarioStepDto
-from src.client.generated.models.test_result_scenario_step_parameter import TestResultScenarioStepParameter
-from src.client.generated.models.test_result_scenario_v2_dto import TestResultScenarioV2Dto
-from src.client.generated.models.test_result_scenario_v2_dto_steps_inner import TestResultScenarioV2DtoStepsInner
-from src.client.generated.models.test_result_stats_dto import TestResultStatsDto
-from src.client.generated.models.test_result_tree import TestResultTree
-from src.client.generated.models.test_result_tree_filter_count_dto import TestResultTreeFilterCountDto
-from src.client.generated.models.test_result_tree_group_dto import TestResultTreeGroupDto
-from src.client.generated.models.test_result_tree_group_dto_v2 import TestResultTreeGroupDtoV2
-from src.client.generated.models.test_result_tree_leaf_dto import TestResultTreeLeafDto
-from src.client.generated.models.test_result_tree_leaf_dto_v2 import TestResultTreeLeafDtoV2
-from src.client.generated.models.test_result_tree_node_dto import TestResultTreeNodeDto
-from src.client.generated.models.test_result_tree_selection_dto import TestResultTreeSelectionDto
-from src.client.generated.models.test_session_response_dto import TestSessionResponseDto
-from src.client.generated.models.test_status import TestStatus
-from src.client.generated.models.test_status_count import TestStatusCount
-from src.client.generated.models.test_tag_create_dto import TestTagCreateDto
-from src.client.generated.models.test_tag_dto import TestTagDto
-from src.client.generated.models.test_tag_patch_dto import TestTagPatchDto
-from src.client.generated.models.text_color_mark import TextColorMark
-from src.client.generated.models.text_fill_mark import TextFillMark
-from src.client.generated.models.text_mark import TextMark
-from src.client.generated.models.text_markup_document import TextMarkupDocument
-from src.client.generated.models.text_paragraph_node import TextParagraphNode
-from src.client.generated.models.text_paragraph_node_marks_inner import TextParagraphNodeMarksInner
-from src.client.generated.models.tr_scenario_step_dto import TrScenarioStepDto
-from src.client.generated.models.tree_create_dto import TreeCreateDto
-from src.client.generated.models.tree_custom_field_project_dto import TreeCustomFieldProjectDto
-from src.client.generated.models.tree_dto import TreeDto
-from src.client.generated.models.tree_dto_v2 import TreeDtoV2
-from src.client.generated.models.tree_patch_dto import TreePatchDto
-from src.client.generated.models.tree_path_create_dto import TreePathCreateDto
-from src.client.generated.models.tree_path_dto import TreePathDto
-from src.client.generated.models.tree_path_item_dto import TreePathItemDto
-from src.client.generated.models.tree_selection_dto import TreeSelectionDto
-from src.client.generated.models.underline_mark import UnderlineMark
-from src.client.generated.models.upload_attachment_dto import UploadAttachmentDto
-from src.client.generated.models.upload_fixtures_results_dto import UploadFixturesResultsDto
-from src.client.generated.models.upload_label_dto import UploadLabelDto
-from src.client.generated.models.upload_link_dto import UploadLinkDto
-from src.client.generated.models.upload_parameter_dto import UploadParameterDto
-from src.client.generated.models.upload_results_dto import UploadResultsDto
-from src.client.generated.models.upload_results_response_dto import UploadResultsResponseDto
-from src.client.generated.models.upload_test_case_dto import UploadTestCaseDto
-from src.client.generated.models.upload_test_fixture_result_dto import UploadTestFixtureResultDto
-from src.client.generated.models.upload_test_fixture_result_dto_steps_inner import UploadTestFixtureResultDtoStepsInner
-from src.client.generated.models.upload_test_fixture_type import UploadTestFixtureType
-from src.client.generated.models.upload_test_result_attachment_step_dto import UploadTestResultAttachmentStepDto
-from src.client.generated.models.upload_test_result_body_step_dto import UploadTestResultBodyStepDto
-from src.client.generated.models.upload_test_result_dto import UploadTestResultDto
-from src.client.generated.models.upload_test_result_expected_body_step_dto import UploadTestResultExpectedBodyStepDto
-from src.client.generated.models.upload_test_result_step_dto import UploadTestResultStepDto
-from src.client.generated.models.upload_test_status import UploadTestStatus
-from src.client.generated.models.webhook_create_dto import WebhookCreateDto
-from src.client.generated.models.webhook_dto import WebhookDto
-from src.client.generated.models.webhook_patch_dto import WebhookPatchDto
-from src.client.generated.models.webhook_settings import WebhookSettings
-from src.client.generated.models.webhook_subject import WebhookSubject
-from src.client.generated.models.webhook_validate_dto import WebhookValidateDto
-from src.client.generated.models.widget_create_dto import WidgetCreateDto
-from src.client.generated.models.widget_create_dto_options import WidgetCreateDtoOptions
-from src.client.generated.models.widget_data_dto import WidgetDataDto
-from src.client.generated.models.widget_dto import WidgetDto
-from src.client.generated.models.widget_options import WidgetOptions
-from src.client.generated.models.widget_options_analytic_graph import WidgetOptionsAnalyticGraph
-from src.client.generated.models.widget_options_having_settable_aql import WidgetOptionsHavingSettableAql
-from src.client.generated.models.widget_options_last_launch_pie_chart import WidgetOptionsLastLaunchPieChart
-from src.client.generated.models.widget_options_launch_list import WidgetOptionsLaunchList
-from src.client.generated.models.widget_options_launch_trend import WidgetOptionsLaunchTrend
-from src.client.generated.models.widget_options_markdown import WidgetOptionsMarkdown
-from src.client.generated.models.widget_options_statistic_trend import WidgetOptionsStatisticTrend
-from src.client.generated.models.widget_options_tc_pie_chart import WidgetOptionsTcPieChart
-from src.client.generated.models.widget_options_tc_tree_map import WidgetOptionsTcTreeMap
-from src.client.generated.models.widget_options_top_tc import WidgetOptionsTopTc
-from src.client.generated.models.widget_options_trend import WidgetOptionsTrend
-from src.client.generated.models.widget_options_trend_v2 import WidgetOptionsTrendV2
-from src.client.generated.models.widget_patch_dto import WidgetPatchDto
-from src.client.generated.models.widget_type_dto import WidgetTypeDto
-from src.client.generated.models.workflow_create_dto import WorkflowCreateDto
-from src.client.generated.models.workflow_dto import WorkflowDto
-from src.client.generated.models.workflow_patch_dto import WorkflowPatchDto
-from src.client.generated.models.workflow_row_dto import WorkflowRowDto
-from src.client.generated.models.workflow_schema_create_dto import WorkflowSchemaCreateDto
-from src.client.generated.models.workflow_schema_dto import WorkflowSchemaDto
-from src.client.generated.models.workflow_schema_patch_dto import WorkflowSchemaPatchDto
+import importlib
+from typing import TYPE_CHECKING, Any
 
+# Names are imported on first access; see scripts/lazify_generated_client.py.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AccessGroupBulkDto": "src.client.generated.models.access_group_bulk_dto",
+    "AccessGroupCreateDto": "src.client.generated.models.access_group_create_dto",
+    "AccessGroupDto": "src.client.generated.models.access_group_dto",
+    "AccessGroupPaDto": "src.client.generated.models.access_group_pa_dto",
+    "AccessGroupPatchDto": "src.client.generated.models.access_group_patch_dto",
+    "AccessGroupProjectAccessDto": "src.client.generated.models.access_group_project_access_dto",
+    "AccessGroupProjectsAddDto": "src.client.generated.models.access_group_projects_add_dto",
+    "AccessGroupUserDto": "src.client.generated.models.access_group_user_dto",
+    "AccessGroupUsersAddDto": "src.client.generated.models.access_group_users_add_dto",
+    "AllowedRoleDto": "src.client.generated.models.allowed_role_dto",
+    "AnalyticAutomationTrendDto": "src.client.generated.models.analytic_automation_trend_dto",
+    "AnalyticDto": "src.client.generated.models.analytic_dto",
+    "AnalyticInterval": "src.client.generated.models.analytic_interval",
+    "AnalyticLaunchDurationHistogramDto": "src.client.generated.models.analytic_launch_duration_histogram_dto",
+    "AnalyticMuteTrendDto": "src.client.generated.models.analytic_mute_trend_dto",
+    "AnalyticTcAutomationCountDto": "src.client.generated.models.analytic_tc_automation_count_dto",
+    "AnalyticTcStatusCountDto": "src.client.generated.models.analytic_tc_status_count_dto",
+    "AnalyticTrByStatusTrendDto": "src.client.generated.models.analytic_tr_by_status_trend_dto",
+    "AqlValidateResponseDto": "src.client.generated.models.aql_validate_response_dto",
+    "AssignRequestDto": "src.client.generated.models.assign_request_dto",
+    "AsyncJobDto": "src.client.generated.models.async_job_dto",
+    "AsyncJobStatusDto": "src.client.generated.models.async_job_status_dto",
+    "AsyncJobStepDto": "src.client.generated.models.async_job_step_dto",
+    "AsyncJobStepStatusDto": "src.client.generated.models.async_job_step_status_dto",
+    "AsyncJobWithStepsDto": "src.client.generated.models.async_job_with_steps_dto",
+    "AttachmentRow": "src.client.generated.models.attachment_row",
+    "AttachmentStepDto": "src.client.generated.models.attachment_step_dto",
+    "Attrs": "src.client.generated.models.attrs",
+    "AuditActionTypeDto": "src.client.generated.models.audit_action_type_dto",
+    "BlobStorageStats": "src.client.generated.models.blob_storage_stats",
+    "BlobStorageUpdateStats": "src.client.generated.models.blob_storage_update_stats",
+    "BodyStepDto": "src.client.generated.models.body_step_dto",
+    "BoldMark": "src.client.generated.models.bold_mark",
+    "BusinessMetricDto": "src.client.generated.models.business_metric_dto",
+    "CategoryCreateDto": "src.client.generated.models.category_create_dto",
+    "CategoryDto": "src.client.generated.models.category_dto",
+    "CategoryMatcherCreateDto": "src.client.generated.models.category_matcher_create_dto",
+    "CategoryMatcherDto": "src.client.generated.models.category_matcher_dto",
+    "CategoryMatcherPatchDto": "src.client.generated.models.category_matcher_patch_dto",
+    "CategoryPatchDto": "src.client.generated.models.category_patch_dto",
+    "CfvMergeToExistingGlobalValueDto": "src.client.generated.models.cfv_merge_to_existing_global_value_dto",
+    "CfvMergeToNewGlobalValueDto": "src.client.generated.models.cfv_merge_to_new_global_value_dto",
+    "Ci": "src.client.generated.models.ci",
+    "CleanerSchemaCreateDto": "src.client.generated.models.cleaner_schema_create_dto",
+    "CleanerSchemaDto": "src.client.generated.models.cleaner_schema_dto",
+    "CleanerSchemaPatchDto": "src.client.generated.models.cleaner_schema_patch_dto",
+    "CleanerSchemaTargetDto": "src.client.generated.models.cleaner_schema_target_dto",
+    "CodeBlockDocumentNode": "src.client.generated.models.code_block_document_node",
+    "CodeMark": "src.client.generated.models.code_mark",
+    "CommentCreateDto": "src.client.generated.models.comment_create_dto",
+    "CommentDto": "src.client.generated.models.comment_dto",
+    "CommentPatchDto": "src.client.generated.models.comment_patch_dto",
+    "CreateLaunchEvent": "src.client.generated.models.create_launch_event",
+    "CsvImportOptions": "src.client.generated.models.csv_import_options",
+    "CustomFieldBulkAddToProjectsDto": "src.client.generated.models.custom_field_bulk_add_to_projects_dto",
+    "CustomFieldBulkArchiveDto": "src.client.generated.models.custom_field_bulk_archive_dto",
+    "CustomFieldCreateDto": "src.client.generated.models.custom_field_create_dto",
+    "CustomFieldDto": "src.client.generated.models.custom_field_dto",
+    "CustomFieldExportFieldMapping": "src.client.generated.models.custom_field_export_field_mapping",
+    "CustomFieldImportFieldMapping": "src.client.generated.models.custom_field_import_field_mapping",
+    "CustomFieldMergeDto": "src.client.generated.models.custom_field_merge_dto",
+    "CustomFieldPatchDto": "src.client.generated.models.custom_field_patch_dto",
+    "CustomFieldProjectCountDto": "src.client.generated.models.custom_field_project_count_dto",
+    "CustomFieldProjectDto": "src.client.generated.models.custom_field_project_dto",
+    "CustomFieldProjectPatchDto": "src.client.generated.models.custom_field_project_patch_dto",
+    "CustomFieldProjectWithValuesDto": "src.client.generated.models.custom_field_project_with_values_dto",
+    "CustomFieldRawDto": "src.client.generated.models.custom_field_raw_dto",
+    "CustomFieldSchemaCountDto": "src.client.generated.models.custom_field_schema_count_dto",
+    "CustomFieldSchemaCreateDto": "src.client.generated.models.custom_field_schema_create_dto",
+    "CustomFieldSchemaDto": "src.client.generated.models.custom_field_schema_dto",
+    "CustomFieldSchemaPatchDto": "src.client.generated.models.custom_field_schema_patch_dto",
+    "CustomFieldValueBulkDeleteDto": "src.client.generated.models.custom_field_value_bulk_delete_dto",
+    "CustomFieldValueBulkMergeDto": "src.client.generated.models.custom_field_value_bulk_merge_dto",
+    "CustomFieldValueDto": "src.client.generated.models.custom_field_value_dto",
+    "CustomFieldValuePatchDto": "src.client.generated.models.custom_field_value_patch_dto",
+    "CustomFieldValueProjectCreateDto": "src.client.generated.models.custom_field_value_project_create_dto",
+    "CustomFieldValueProjectMergeByIdDto": "src.client.generated.models.custom_field_value_project_merge_by_id_dto",
+    "CustomFieldValueProjectMergeByNameDto": "src.client.generated.models.custom_field_value_project_merge_by_name_dto",
+    "CustomFieldValueProjectPatchDto": "src.client.generated.models.custom_field_value_project_patch_dto",
+    "CustomFieldValueProjectRenameDto": "src.client.generated.models.custom_field_value_project_rename_dto",
+    "CustomFieldValueWithCfDto": "src.client.generated.models.custom_field_value_with_cf_dto",
+    "CustomFieldValueWithTcCountDto": "src.client.generated.models.custom_field_value_with_tc_count_dto",
+    "CustomFieldWithValuesDto": "src.client.generated.models.custom_field_with_values_dto",
+    "DashboardCopyDto": "src.client.generated.models.dashboard_copy_dto",
+    "DashboardCreateDto": "src.client.generated.models.dashboard_create_dto",
+    "DashboardDragAndDropDto": "src.client.generated.models.dashboard_drag_and_drop_dto",
+    "DashboardDto": "src.client.generated.models.dashboard_dto",
+    "DashboardOverviewDto": "src.client.generated.models.dashboard_overview_dto",
+    "DashboardPatchDto": "src.client.generated.models.dashboard_patch_dto",
+    "DashboardUpdateDto": "src.client.generated.models.dashboard_update_dto",
+    "DefaultCustomFieldValueDto": "src.client.generated.models.default_custom_field_value_dto",
+    "DefaultTextMarkupDocument": "src.client.generated.models.default_text_markup_document",
+    "DefaultTextMarkupDocumentAllOfContent": "src.client.generated.models.default_text_markup_document_all_of_content",
+    "DefaultWebhookSettings": "src.client.generated.models.default_webhook_settings",
+    "DefaultWebhookSettingsAllOfSubjects": "src.client.generated.models.default_webhook_settings_all_of_subjects",
+    "DefectBulkDto": "src.client.generated.models.defect_bulk_dto",
+    "DefectCountRowDto": "src.client.generated.models.defect_count_row_dto",
+    "DefectCreateDto": "src.client.generated.models.defect_create_dto",
+    "DefectDto": "src.client.generated.models.defect_dto",
+    "DefectIssueLinkDto": "src.client.generated.models.defect_issue_link_dto",
+    "DefectMatcherCreateDto": "src.client.generated.models.defect_matcher_create_dto",
+    "DefectMatcherDto": "src.client.generated.models.defect_matcher_dto",
+    "DefectMatcherPatchDto": "src.client.generated.models.defect_matcher_patch_dto",
+    "DefectOverviewDto": "src.client.generated.models.defect_overview_dto",
+    "DefectPatchDto": "src.client.generated.models.defect_patch_dto",
+    "DefectRowDto": "src.client.generated.models.defect_row_dto",
+    "DefectWebhook": "src.client.generated.models.defect_webhook",
+    "DiffValueChangeBoolean": "src.client.generated.models.diff_value_change_boolean",
+    "DiffValueChangeLong": "src.client.generated.models.diff_value_change_long",
+    "DiffValueChangeSetLong": "src.client.generated.models.diff_value_change_set_long",
+    "DiffValueChangeString": "src.client.generated.models.diff_value_change_string",
+    "DocumentNode": "src.client.generated.models.document_node",
+    "EnvVarCreateDto": "src.client.generated.models.env_var_create_dto",
+    "EnvVarDto": "src.client.generated.models.env_var_dto",
+    "EnvVarMergeDto": "src.client.generated.models.env_var_merge_dto",
+    "EnvVarPatchDto": "src.client.generated.models.env_var_patch_dto",
+    "EnvVarSchemaCreateDto": "src.client.generated.models.env_var_schema_create_dto",
+    "EnvVarSchemaDto": "src.client.generated.models.env_var_schema_dto",
+    "EnvVarSchemaPatchDto": "src.client.generated.models.env_var_schema_patch_dto",
+    "EnvVarValueCreateDto": "src.client.generated.models.env_var_value_create_dto",
+    "EnvVarValueDto": "src.client.generated.models.env_var_value_dto",
+    "EnvVarValuePatchDto": "src.client.generated.models.env_var_value_patch_dto",
+    "EnvironmentSetDto": "src.client.generated.models.environment_set_dto",
+    "EventType": "src.client.generated.models.event_type",
+    "EventTypeSettings": "src.client.generated.models.event_type_settings",
+    "ExampleExportFieldMapping": "src.client.generated.models.example_export_field_mapping",
+    "ExpectedBodyStepDto": "src.client.generated.models.expected_body_step_dto",
+    "ExportFieldMappingTestCaseExportField": "src.client.generated.models.export_field_mapping_test_case_export_field",
+    "ExportFieldMappingTestResultExportField": "src.client.generated.models.export_field_mapping_test_result_export_field",
+    "ExportRequestDto": "src.client.generated.models.export_request_dto",
+    "ExportStatus": "src.client.generated.models.export_status",
+    "ExportType": "src.client.generated.models.export_type",
+    "ExtFormField": "src.client.generated.models.ext_form_field",
+    "ExtFormFieldCheckbox": "src.client.generated.models.ext_form_field_checkbox",
+    "ExtFormFieldComposite": "src.client.generated.models.ext_form_field_composite",
+    "ExtFormFieldExternalSelect": "src.client.generated.models.ext_form_field_external_select",
+    "ExtFormFieldFormChoice": "src.client.generated.models.ext_form_field_form_choice",
+    "ExtFormFieldFormChoiceOption": "src.client.generated.models.ext_form_field_form_choice_option",
+    "ExtFormFieldList": "src.client.generated.models.ext_form_field_list",
+    "ExtFormFieldNumber": "src.client.generated.models.ext_form_field_number",
+    "ExtFormFieldOption": "src.client.generated.models.ext_form_field_option",
+    "ExtFormFieldPassword": "src.client.generated.models.ext_form_field_password",
+    "ExtFormFieldSelect": "src.client.generated.models.ext_form_field_select",
+    "ExtFormFieldSlider": "src.client.generated.models.ext_form_field_slider",
+    "ExtFormFieldText": "src.client.generated.models.ext_form_field_text",
+    "ExtFormFieldTextarea": "src.client.generated.models.ext_form_field_textarea",
+    "ExtFormFieldUnknown": "src.client.generated.models.ext_form_field_unknown",
+    "ExtIssueLink": "src.client.generated.models.ext_issue_link",
+    "ExtIssueType": "src.client.generated.models.ext_issue_type",
+    "ExtProject": "src.client.generated.models.ext_project",
+    "ExtSelectValue": "src.client.generated.models.ext_select_value",
+    "ExternalLinkDto": "src.client.generated.models.external_link_dto",
+    "ExternalRunResponseDto": "src.client.generated.models.external_run_response_dto",
+    "ExternalRunStartRequestDto": "src.client.generated.models.external_run_start_request_dto",
+    "ExternalRunStopRequestDto": "src.client.generated.models.external_run_stop_request_dto",
+    "FileUploadResponseDto": "src.client.generated.models.file_upload_response_dto",
+    "FilterBaseSetDto": "src.client.generated.models.filter_base_set_dto",
+    "FilterCreateDto": "src.client.generated.models.filter_create_dto",
+    "FilterDto": "src.client.generated.models.filter_dto",
+    "FilterPatchDto": "src.client.generated.models.filter_patch_dto",
+    "FilterTypeDto": "src.client.generated.models.filter_type_dto",
+    "FindAll29200Response": "src.client.generated.models.find_all29200_response",
+    "GlobalPermissionsDto": "src.client.generated.models.global_permissions_dto",
+    "GlobalSettingsDto": "src.client.generated.models.global_settings_dto",
+    "GlobalSettingsProjectCreatePatchDto": "src.client.generated.models.global_settings_project_create_patch_dto",
+    "GridPosDto": "src.client.generated.models.grid_pos_dto",
+    "GroupBy": "src.client.generated.models.group_by",
+    "GroupNodeContext": "src.client.generated.models.group_node_context",
+    "IdAndNameOnlyDto": "src.client.generated.models.id_and_name_only_dto",
+    "IdOnlyDto": "src.client.generated.models.id_only_dto",
+    "ImportRequestDto": "src.client.generated.models.import_request_dto",
+    "ImportRequestInfoDto": "src.client.generated.models.import_request_info_dto",
+    "ImportRequestStateDto": "src.client.generated.models.import_request_state_dto",
+    "ImportRequestTypeDto": "src.client.generated.models.import_request_type_dto",
+    "IntegrationCreateDto": "src.client.generated.models.integration_create_dto",
+    "IntegrationDto": "src.client.generated.models.integration_dto",
+    "IntegrationExportCreateDto": "src.client.generated.models.integration_export_create_dto",
+    "IntegrationExportDto": "src.client.generated.models.integration_export_dto",
+    "IntegrationExportPatchDto": "src.client.generated.models.integration_export_patch_dto",
+    "IntegrationFieldsFormDto": "src.client.generated.models.integration_fields_form_dto",
+    "IntegrationFieldsFormDtoDefaultProjectFieldsInner": "src.client.generated.models.integration_fields_form_dto_default_project_fields_inner",
+    "IntegrationInfoDto": "src.client.generated.models.integration_info_dto",
+    "IntegrationLinksFixedDto": "src.client.generated.models.integration_links_fixed_dto",
+    "IntegrationOperationTypeDto": "src.client.generated.models.integration_operation_type_dto",
+    "IntegrationPatchDto": "src.client.generated.models.integration_patch_dto",
+    "IntegrationRoutineTypeDto": "src.client.generated.models.integration_routine_type_dto",
+    "IntegrationTypeDto": "src.client.generated.models.integration_type_dto",
+    "IntegrationValidateDto": "src.client.generated.models.integration_validate_dto",
+    "IntegrationWebhookCreateDto": "src.client.generated.models.integration_webhook_create_dto",
+    "IntegrationWebhookDto": "src.client.generated.models.integration_webhook_dto",
+    "IntegrationWebhookLogDto": "src.client.generated.models.integration_webhook_log_dto",
+    "IntegrationWebhookPatchDto": "src.client.generated.models.integration_webhook_patch_dto",
+    "IntegrationWebhookTokenDto": "src.client.generated.models.integration_webhook_token_dto",
+    "IssueCreateDto": "src.client.generated.models.issue_create_dto",
+    "IssueDto": "src.client.generated.models.issue_dto",
+    "IssueImportFieldMapping": "src.client.generated.models.issue_import_field_mapping",
+    "IssueIntegrationExportFieldMapping": "src.client.generated.models.issue_integration_export_field_mapping",
+    "IssuePatchDto": "src.client.generated.models.issue_patch_dto",
+    "IssueSchemaCreateDto": "src.client.generated.models.issue_schema_create_dto",
+    "IssueSchemaDto": "src.client.generated.models.issue_schema_dto",
+    "IssueSchemaPatchDto": "src.client.generated.models.issue_schema_patch_dto",
+    "IssueToCreateDto": "src.client.generated.models.issue_to_create_dto",
+    "ItalicMark": "src.client.generated.models.italic_mark",
+    "Job": "src.client.generated.models.job",
+    "JobCreateDto": "src.client.generated.models.job_create_dto",
+    "JobDto": "src.client.generated.models.job_dto",
+    "JobInfoDto": "src.client.generated.models.job_info_dto",
+    "JobMapping": "src.client.generated.models.job_mapping",
+    "JobParameterDto": "src.client.generated.models.job_parameter_dto",
+    "JobPatchDto": "src.client.generated.models.job_patch_dto",
+    "JobRerunRequestDto": "src.client.generated.models.job_rerun_request_dto",
+    "JobRun": "src.client.generated.models.job_run",
+    "JobRunDto": "src.client.generated.models.job_run_dto",
+    "JobRunRequestDto": "src.client.generated.models.job_run_request_dto",
+    "JobRunStageDto": "src.client.generated.models.job_run_stage_dto",
+    "JobRunStatusDto": "src.client.generated.models.job_run_status_dto",
+    "JobRunUploadInfoDto": "src.client.generated.models.job_run_upload_info_dto",
+    "JobTestCasesStatDto": "src.client.generated.models.job_test_cases_stat_dto",
+    "Launch": "src.client.generated.models.launch",
+    "LaunchCleanupRequest": "src.client.generated.models.launch_cleanup_request",
+    "LaunchCloseConfigDto": "src.client.generated.models.launch_close_config_dto",
+    "LaunchCopyRqDto": "src.client.generated.models.launch_copy_rq_dto",
+    "LaunchCreateAndUploadDto": "src.client.generated.models.launch_create_and_upload_dto",
+    "LaunchCreateDto": "src.client.generated.models.launch_create_dto",
+    "LaunchDiffCell": "src.client.generated.models.launch_diff_cell",
+    "LaunchDiffMode": "src.client.generated.models.launch_diff_mode",
+    "LaunchDiffRow": "src.client.generated.models.launch_diff_row",
+    "LaunchDiffStatusChangeDto": "src.client.generated.models.launch_diff_status_change_dto",
+    "LaunchDiffTestResult": "src.client.generated.models.launch_diff_test_result",
+    "LaunchDiffTestResultDto": "src.client.generated.models.launch_diff_test_result_dto",
+    "LaunchDto": "src.client.generated.models.launch_dto",
+    "LaunchExistingUploadDto": "src.client.generated.models.launch_existing_upload_dto",
+    "LaunchLiveDocConfigDto": "src.client.generated.models.launch_live_doc_config_dto",
+    "LaunchMemberStatsDto": "src.client.generated.models.launch_member_stats_dto",
+    "LaunchMergeDto": "src.client.generated.models.launch_merge_dto",
+    "LaunchPatchDto": "src.client.generated.models.launch_patch_dto",
+    "LaunchPdfOptions": "src.client.generated.models.launch_pdf_options",
+    "LaunchPdfPart": "src.client.generated.models.launch_pdf_part",
+    "LaunchPdfStructure": "src.client.generated.models.launch_pdf_structure",
+    "LaunchPreviewDto": "src.client.generated.models.launch_preview_dto",
+    "LaunchProgressDto": "src.client.generated.models.launch_progress_dto",
+    "LaunchRowDto": "src.client.generated.models.launch_row_dto",
+    "LaunchTagCreateDto": "src.client.generated.models.launch_tag_create_dto",
+    "LaunchTagDto": "src.client.generated.models.launch_tag_dto",
+    "LaunchTagPatchDto": "src.client.generated.models.launch_tag_patch_dto",
+    "LaunchTestCasesAddDto": "src.client.generated.models.launch_test_cases_add_dto",
+    "LaunchTestPlanAddDto": "src.client.generated.models.launch_test_plan_add_dto",
+    "LaunchUploadResponseDto": "src.client.generated.models.launch_upload_response_dto",
+    "LaunchVariableDto": "src.client.generated.models.launch_variable_dto",
+    "LaunchWebhook": "src.client.generated.models.launch_webhook",
+    "LineBreakParagraphNode": "src.client.generated.models.line_break_paragraph_node",
+    "LinkExportFieldMapping": "src.client.generated.models.link_export_field_mapping",
+    "LinkImportFieldMapping": "src.client.generated.models.link_import_field_mapping",
+    "LinkMark": "src.client.generated.models.link_mark",
+    "ListSelectionDto": "src.client.generated.models.list_selection_dto",
+    "ManualSessionRequestDto": "src.client.generated.models.manual_session_request_dto",
+    "Matcher": "src.client.generated.models.matcher",
+    "MemberCreateDto": "src.client.generated.models.member_create_dto",
+    "MemberDto": "src.client.generated.models.member_dto",
+    "MemberPatchDto": "src.client.generated.models.member_patch_dto",
+    "Metric": "src.client.generated.models.metric",
+    "MfaGlobalSettingsDto": "src.client.generated.models.mfa_global_settings_dto",
+    "MfaGlobalSettingsPatchDto": "src.client.generated.models.mfa_global_settings_patch_dto",
+    "MultiValueExportFieldMapping": "src.client.generated.models.multi_value_export_field_mapping",
+    "MultiValueImportFieldMapping": "src.client.generated.models.multi_value_import_field_mapping",
+    "MultiValueMapStringString": "src.client.generated.models.multi_value_map_string_string",
+    "MuteCreateDto": "src.client.generated.models.mute_create_dto",
+    "MuteDto": "src.client.generated.models.mute_dto",
+    "NameOnlyDto": "src.client.generated.models.name_only_dto",
+    "NodeType": "src.client.generated.models.node_type",
+    "NormalizedScenarioDto": "src.client.generated.models.normalized_scenario_dto",
+    "NormalizedScenarioDtoAttachmentsValue": "src.client.generated.models.normalized_scenario_dto_attachments_value",
+    "NormalizedScenarioStepDto": "src.client.generated.models.normalized_scenario_step_dto",
+    "OrderedValueDtoString": "src.client.generated.models.ordered_value_dto_string",
+    "PageAccessGroupDto": "src.client.generated.models.page_access_group_dto",
+    "PageAccessGroupDtoSort": "src.client.generated.models.page_access_group_dto_sort",
+    "PageAccessGroupPaDto": "src.client.generated.models.page_access_group_pa_dto",
+    "PageAccessGroupUserDto": "src.client.generated.models.page_access_group_user_dto",
+    "PageAsyncJobDto": "src.client.generated.models.page_async_job_dto",
+    "PageCategoryDto": "src.client.generated.models.page_category_dto",
+    "PageCategoryMatcherDto": "src.client.generated.models.page_category_matcher_dto",
+    "PageCleanerSchemaDto": "src.client.generated.models.page_cleaner_schema_dto",
+    "PageCommentDto": "src.client.generated.models.page_comment_dto",
+    "PageCustomFieldProjectDto": "src.client.generated.models.page_custom_field_project_dto",
+    "PageCustomFieldSchemaDto": "src.client.generated.models.page_custom_field_schema_dto",
+    "PageCustomFieldValueWithTcCountDto": "src.client.generated.models.page_custom_field_value_with_tc_count_dto",
+    "PageDashboardDto": "src.client.generated.models.page_dashboard_dto",
+    "PageDefectCountRowDto": "src.client.generated.models.page_defect_count_row_dto",
+    "PageDefectDto": "src.client.generated.models.page_defect_dto",
+    "PageDefectMatcherDto": "src.client.generated.models.page_defect_matcher_dto",
+    "PageDefectRowDto": "src.client.generated.models.page_defect_row_dto",
+    "PageEnvVarSchemaDto": "src.client.generated.models.page_env_var_schema_dto",
+    "PageExportRequestDto": "src.client.generated.models.page_export_request_dto",
+    "PageFilterDto": "src.client.generated.models.page_filter_dto",
+    "PageIdAndNameOnlyDto": "src.client.generated.models.page_id_and_name_only_dto",
+    "PageImportRequestDto": "src.client.generated.models.page_import_request_dto",
+    "PageIntegrationDto": "src.client.generated.models.page_integration_dto",
+    "PageIntegrationExportDto": "src.client.generated.models.page_integration_export_dto",
+    "PageIntegrationInfoDto": "src.client.generated.models.page_integration_info_dto",
+    "PageIntegrationWebhookDto": "src.client.generated.models.page_integration_webhook_dto",
+    "PageIntegrationWebhookLogDto": "src.client.generated.models.page_integration_webhook_log_dto",
+    "PageIssueDto": "src.client.generated.models.page_issue_dto",
+    "PageIssueSchemaDto": "src.client.generated.models.page_issue_schema_dto",
+    "PageJobDto": "src.client.generated.models.page_job_dto",
+    "PageLaunchDiffRow": "src.client.generated.models.page_launch_diff_row",
+    "PageLaunchDto": "src.client.generated.models.page_launch_dto",
+    "PageLaunchMemberStatsDto": "src.client.generated.models.page_launch_member_stats_dto",
+    "PageLaunchPreviewDto": "src.client.generated.models.page_launch_preview_dto",
+    "PageLaunchRowDto": "src.client.generated.models.page_launch_row_dto",
+    "PageLaunchTagDto": "src.client.generated.models.page_launch_tag_dto",
+    "PageLaunchVariableDto": "src.client.generated.models.page_launch_variable_dto",
+    "PageMemberDto": "src.client.generated.models.page_member_dto",
+    "PageMuteDto": "src.client.generated.models.page_mute_dto",
+    "PagePermissionSetDto": "src.client.generated.models.page_permission_set_dto",
+    "PageProjectCollaboratorAccessDto": "src.client.generated.models.page_project_collaborator_access_dto",
+    "PageProjectCollaboratorDto": "src.client.generated.models.page_project_collaborator_dto",
+    "PageProjectCustomFieldDto": "src.client.generated.models.page_project_custom_field_dto",
+    "PageProjectDto": "src.client.generated.models.page_project_dto",
+    "PageProjectGroupAccessDto": "src.client.generated.models.page_project_group_access_dto",
+    "PageProjectIntegrationDto": "src.client.generated.models.page_project_integration_dto",
+    "PageProjectSuggestDto": "src.client.generated.models.page_project_suggest_dto",
+    "PageRoleSchemaDto": "src.client.generated.models.page_role_schema_dto",
+    "PageSharedStepAttachmentRowDto": "src.client.generated.models.page_shared_step_attachment_row_dto",
+    "PageSharedStepDto": "src.client.generated.models.page_shared_step_dto",
+    "PageStatisticWidgetItem": "src.client.generated.models.page_statistic_widget_item",
+    "PageStatusDto": "src.client.generated.models.page_status_dto",
+    "PageTemplateDto": "src.client.generated.models.page_template_dto",
+    "PageTestCaseAttachmentRowDto": "src.client.generated.models.page_test_case_attachment_row_dto",
+    "PageTestCaseAuditLogEntryDto": "src.client.generated.models.page_test_case_audit_log_entry_dto",
+    "PageTestCaseDto": "src.client.generated.models.page_test_case_dto",
+    "PageTestCaseExampleDto": "src.client.generated.models.page_test_case_example_dto",
+    "PageTestCaseFlatDto": "src.client.generated.models.page_test_case_flat_dto",
+    "PageTestCaseRowDto": "src.client.generated.models.page_test_case_row_dto",
+    "PageTestCaseTreeGroupDto": "src.client.generated.models.page_test_case_tree_group_dto",
+    "PageTestCaseTreeLeafDto": "src.client.generated.models.page_test_case_tree_leaf_dto",
+    "PageTestCaseTreeNodeDto": "src.client.generated.models.page_test_case_tree_node_dto",
+    "PageTestCaseTreeNodeDtoContentInner": "src.client.generated.models.page_test_case_tree_node_dto_content_inner",
+    "PageTestFixtureResultAttachmentRowDto": "src.client.generated.models.page_test_fixture_result_attachment_row_dto",
+    "PageTestKeySchemaDto": "src.client.generated.models.page_test_key_schema_dto",
+    "PageTestLayerDto": "src.client.generated.models.page_test_layer_dto",
+    "PageTestLayerSchemaDto": "src.client.generated.models.page_test_layer_schema_dto",
+    "PageTestPlanDto": "src.client.generated.models.page_test_plan_dto",
+    "PageTestPlanRowDto": "src.client.generated.models.page_test_plan_row_dto",
+    "PageTestResultAttachmentRowDto": "src.client.generated.models.page_test_result_attachment_row_dto",
+    "PageTestResultDefectMatchDto": "src.client.generated.models.page_test_result_defect_match_dto",
+    "PageTestResultDto": "src.client.generated.models.page_test_result_dto",
+    "PageTestResultFlatDto": "src.client.generated.models.page_test_result_flat_dto",
+    "PageTestResultHistoryDto": "src.client.generated.models.page_test_result_history_dto",
+    "PageTestResultRetriesRowDto": "src.client.generated.models.page_test_result_retries_row_dto",
+    "PageTestResultRowDto": "src.client.generated.models.page_test_result_row_dto",
+    "PageTestResultTreeGroupDto": "src.client.generated.models.page_test_result_tree_group_dto",
+    "PageTestResultTreeLeafDto": "src.client.generated.models.page_test_result_tree_leaf_dto",
+    "PageTestResultTreeNodeDto": "src.client.generated.models.page_test_result_tree_node_dto",
+    "PageTestResultTreeNodeDtoContentInner": "src.client.generated.models.page_test_result_tree_node_dto_content_inner",
+    "PageTreeDto": "src.client.generated.models.page_tree_dto",
+    "PageTreeDtoV2": "src.client.generated.models.page_tree_dto_v2",
+    "PageTreePathDto": "src.client.generated.models.page_tree_path_dto",
+    "PageWebhookDto": "src.client.generated.models.page_webhook_dto",
+    "PageWidgetDto": "src.client.generated.models.page_widget_dto",
+    "PageWorkflowDto": "src.client.generated.models.page_workflow_dto",
+    "PageWorkflowSchemaDto": "src.client.generated.models.page_workflow_schema_dto",
+    "Pageable": "src.client.generated.models.pageable",
+    "ParagraphDocumentNode": "src.client.generated.models.paragraph_document_node",
+    "ParagraphDocumentNodeAllOfContent": "src.client.generated.models.paragraph_document_node_all_of_content",
+    "ParagraphNode": "src.client.generated.models.paragraph_node",
+    "Parameter": "src.client.generated.models.parameter",
+    "ParameterValueDto": "src.client.generated.models.parameter_value_dto",
+    "PermissionDto": "src.client.generated.models.permission_dto",
+    "PermissionSetCreateDto": "src.client.generated.models.permission_set_create_dto",
+    "PermissionSetDto": "src.client.generated.models.permission_set_dto",
+    "PermissionSetPatchDto": "src.client.generated.models.permission_set_patch_dto",
+    "ProjectAccessCollaboratorAddDto": "src.client.generated.models.project_access_collaborator_add_dto",
+    "ProjectAccessGroupAddDto": "src.client.generated.models.project_access_group_add_dto",
+    "ProjectCategoryAddDto": "src.client.generated.models.project_category_add_dto",
+    "ProjectCategoryMatcherAddDto": "src.client.generated.models.project_category_matcher_add_dto",
+    "ProjectCategoryMatcherRemoveDto": "src.client.generated.models.project_category_matcher_remove_dto",
+    "ProjectCategoryRemoveDto": "src.client.generated.models.project_category_remove_dto",
+    "ProjectCollaboratorAccessDto": "src.client.generated.models.project_collaborator_access_dto",
+    "ProjectCollaboratorDto": "src.client.generated.models.project_collaborator_dto",
+    "ProjectCreateDto": "src.client.generated.models.project_create_dto",
+    "ProjectCustomFieldDto": "src.client.generated.models.project_custom_field_dto",
+    "ProjectDto": "src.client.generated.models.project_dto",
+    "ProjectGroupAccessAddDto": "src.client.generated.models.project_group_access_add_dto",
+    "ProjectGroupAccessDto": "src.client.generated.models.project_group_access_dto",
+    "ProjectIntegrationCreateDto": "src.client.generated.models.project_integration_create_dto",
+    "ProjectIntegrationDto": "src.client.generated.models.project_integration_dto",
+    "ProjectIntegrationFieldsFormDto": "src.client.generated.models.project_integration_fields_form_dto",
+    "ProjectIntegrationPatchDto": "src.client.generated.models.project_integration_patch_dto",
+    "ProjectIntegrationValidateDto": "src.client.generated.models.project_integration_validate_dto",
+    "ProjectMetricDto": "src.client.generated.models.project_metric_dto",
+    "ProjectPatchDto": "src.client.generated.models.project_patch_dto",
+    "ProjectPropertyCreateDto": "src.client.generated.models.project_property_create_dto",
+    "ProjectPropertyDto": "src.client.generated.models.project_property_dto",
+    "ProjectPropertyPatchDto": "src.client.generated.models.project_property_patch_dto",
+    "ProjectStatsDto": "src.client.generated.models.project_stats_dto",
+    "ProjectSuggestDto": "src.client.generated.models.project_suggest_dto",
+    "ProjectSyncRequest": "src.client.generated.models.project_sync_request",
+    "ProjectTestCaseCountDto": "src.client.generated.models.project_test_case_count_dto",
+    "ResolveRequestV2Dto": "src.client.generated.models.resolve_request_v2_dto",
+    "Retry": "src.client.generated.models.retry",
+    "RoleCreateDto": "src.client.generated.models.role_create_dto",
+    "RoleDto": "src.client.generated.models.role_dto",
+    "RoleExportFieldMapping": "src.client.generated.models.role_export_field_mapping",
+    "RoleImportFieldMapping": "src.client.generated.models.role_import_field_mapping",
+    "RolePatchDto": "src.client.generated.models.role_patch_dto",
+    "RoleSchemaCreateDto": "src.client.generated.models.role_schema_create_dto",
+    "RoleSchemaDto": "src.client.generated.models.role_schema_dto",
+    "RoleSchemaPatchDto": "src.client.generated.models.role_schema_patch_dto",
+    "ScenarioExportFieldMapping": "src.client.generated.models.scenario_export_field_mapping",
+    "ScenarioStepCopyDto": "src.client.generated.models.scenario_step_copy_dto",
+    "ScenarioStepCreateDto": "src.client.generated.models.scenario_step_create_dto",
+    "ScenarioStepCreatedResponseDto": "src.client.generated.models.scenario_step_created_response_dto",
+    "ScenarioStepDto": "src.client.generated.models.scenario_step_dto",
+    "ScenarioStepMoveDto": "src.client.generated.models.scenario_step_move_dto",
+    "ScenarioStepPatchDto": "src.client.generated.models.scenario_step_patch_dto",
+    "SessionVariable": "src.client.generated.models.session_variable",
+    "SharedStepAttachmentPatchDto": "src.client.generated.models.shared_step_attachment_patch_dto",
+    "SharedStepAttachmentRowDto": "src.client.generated.models.shared_step_attachment_row_dto",
+    "SharedStepCreateDto": "src.client.generated.models.shared_step_create_dto",
+    "SharedStepDto": "src.client.generated.models.shared_step_dto",
+    "SharedStepPatchDto": "src.client.generated.models.shared_step_patch_dto",
+    "SharedStepScenarioDto": "src.client.generated.models.shared_step_scenario_dto",
+    "SharedStepScenarioDtoStepsInner": "src.client.generated.models.shared_step_scenario_dto_steps_inner",
+    "SharedStepStepDto": "src.client.generated.models.shared_step_step_dto",
+    "StatisticDto": "src.client.generated.models.statistic_dto",
+    "StatisticWidgetItem": "src.client.generated.models.statistic_widget_item",
+    "Status": "src.client.generated.models.status",
+    "StatusCreateDto": "src.client.generated.models.status_create_dto",
+    "StatusDto": "src.client.generated.models.status_dto",
+    "StatusPatchDto": "src.client.generated.models.status_patch_dto",
+    "StrikeMark": "src.client.generated.models.strike_mark",
+    "TagImportFieldMapping": "src.client.generated.models.tag_import_field_mapping",
+    "TemplateDto": "src.client.generated.models.template_dto",
+    "TemplateOverviewDto": "src.client.generated.models.template_overview_dto",
+    "TestCaseAssociationDiff": "src.client.generated.models.test_case_association_diff",
+    "TestCaseAttachmentPatchDto": "src.client.generated.models.test_case_attachment_patch_dto",
+    "TestCaseAttachmentRowDto": "src.client.generated.models.test_case_attachment_row_dto",
+    "TestCaseAuditLogData": "src.client.generated.models.test_case_audit_log_data",
+    "TestCaseAuditLogDataDiff": "src.client.generated.models.test_case_audit_log_data_diff",
+    "TestCaseAuditLogEntryDto": "src.client.generated.models.test_case_audit_log_entry_dto",
+    "TestCaseBulkCfMoveStrategy": "src.client.generated.models.test_case_bulk_cf_move_strategy",
+    "TestCaseBulkChangeProjectDtoV2": "src.client.generated.models.test_case_bulk_change_project_dto_v2",
+    "TestCaseBulkCloneDto": "src.client.generated.models.test_case_bulk_clone_dto",
+    "TestCaseBulkCloneDtoV2": "src.client.generated.models.test_case_bulk_clone_dto_v2",
+    "TestCaseBulkDragAndDropDto": "src.client.generated.models.test_case_bulk_drag_and_drop_dto",
+    "TestCaseBulkDragAndDropDtoV2": "src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2",
+    "TestCaseBulkDto": "src.client.generated.models.test_case_bulk_dto",
+    "TestCaseBulkDtoV2": "src.client.generated.models.test_case_bulk_dto_v2",
+    "TestCaseBulkEntityIdsDto": "src.client.generated.models.test_case_bulk_entity_ids_dto",
+    "TestCaseBulkEntityIdsDtoV2": "src.client.generated.models.test_case_bulk_entity_ids_dto_v2",
+    "TestCaseBulkExportCsvOptions": "src.client.generated.models.test_case_bulk_export_csv_options",
+    "TestCaseBulkExportCsvOptionsMappingInner": "src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner",
+    "TestCaseBulkExportPdfOptions": "src.client.generated.models.test_case_bulk_export_pdf_options",
+    "TestCaseBulkExternalLinkDto": "src.client.generated.models.test_case_bulk_external_link_dto",
+    "TestCaseBulkIssueDto": "src.client.generated.models.test_case_bulk_issue_dto",
+    "TestCaseBulkLayerDto": "src.client.generated.models.test_case_bulk_layer_dto",
+    "TestCaseBulkMemberDto": "src.client.generated.models.test_case_bulk_member_dto",
+    "TestCaseBulkMuteDto": "src.client.generated.models.test_case_bulk_mute_dto",
+    "TestCaseBulkNewCfvDto": "src.client.generated.models.test_case_bulk_new_cfv_dto",
+    "TestCaseBulkProjectChangeDto": "src.client.generated.models.test_case_bulk_project_change_dto",
+    "TestCaseBulkRunExistingLaunchDto": "src.client.generated.models.test_case_bulk_run_existing_launch_dto",
+    "TestCaseBulkRunNewLaunchDto": "src.client.generated.models.test_case_bulk_run_new_launch_dto",
+    "TestCaseBulkStatusDto": "src.client.generated.models.test_case_bulk_status_dto",
+    "TestCaseBulkTagDto": "src.client.generated.models.test_case_bulk_tag_dto",
+    "TestCaseBulkTestPlanCreateDto": "src.client.generated.models.test_case_bulk_test_plan_create_dto",
+    "TestCaseCfBulkDeltaDtoV2": "src.client.generated.models.test_case_cf_bulk_delta_dto_v2",
+    "TestCaseCfvBulkAddDto": "src.client.generated.models.test_case_cfv_bulk_add_dto",
+    "TestCaseCloneRqDto": "src.client.generated.models.test_case_clone_rq_dto",
+    "TestCaseCountDto": "src.client.generated.models.test_case_count_dto",
+    "TestCaseCreateV2Dto": "src.client.generated.models.test_case_create_v2_dto",
+    "TestCaseCsvExportOptions": "src.client.generated.models.test_case_csv_export_options",
+    "TestCaseCsvImportOptions": "src.client.generated.models.test_case_csv_import_options",
+    "TestCaseCsvImportOptionsMappingInner": "src.client.generated.models.test_case_csv_import_options_mapping_inner",
+    "TestCaseCsvPreviewOptions": "src.client.generated.models.test_case_csv_preview_options",
+    "TestCaseDetachAutomationRqDto": "src.client.generated.models.test_case_detach_automation_rq_dto",
+    "TestCaseDiff": "src.client.generated.models.test_case_diff",
+    "TestCaseDto": "src.client.generated.models.test_case_dto",
+    "TestCaseExampleDto": "src.client.generated.models.test_case_example_dto",
+    "TestCaseExportField": "src.client.generated.models.test_case_export_field",
+    "TestCaseExternalLinkBulkAddDto": "src.client.generated.models.test_case_external_link_bulk_add_dto",
+    "TestCaseFlatDto": "src.client.generated.models.test_case_flat_dto",
+    "TestCaseFullTreeNodeDto": "src.client.generated.models.test_case_full_tree_node_dto",
+    "TestCaseImportDto": "src.client.generated.models.test_case_import_dto",
+    "TestCaseImportField": "src.client.generated.models.test_case_import_field",
+    "TestCaseImportMapping": "src.client.generated.models.test_case_import_mapping",
+    "TestCaseInfo": "src.client.generated.models.test_case_info",
+    "TestCaseIssueBulkAddDto": "src.client.generated.models.test_case_issue_bulk_add_dto",
+    "TestCaseLastResultDto": "src.client.generated.models.test_case_last_result_dto",
+    "TestCaseLayerBulkSetDto": "src.client.generated.models.test_case_layer_bulk_set_dto",
+    "TestCaseLightTreeNodeDto": "src.client.generated.models.test_case_light_tree_node_dto",
+    "TestCaseMemberBulkAddDto": "src.client.generated.models.test_case_member_bulk_add_dto",
+    "TestCaseMuteBulkAddDto": "src.client.generated.models.test_case_mute_bulk_add_dto",
+    "TestCaseOverviewDto": "src.client.generated.models.test_case_overview_dto",
+    "TestCaseParameterDto": "src.client.generated.models.test_case_parameter_dto",
+    "TestCaseParameterValues": "src.client.generated.models.test_case_parameter_values",
+    "TestCasePatchV2Dto": "src.client.generated.models.test_case_patch_v2_dto",
+    "TestCasePdfOptions": "src.client.generated.models.test_case_pdf_options",
+    "TestCasePdfPart": "src.client.generated.models.test_case_pdf_part",
+    "TestCaseRelationDto": "src.client.generated.models.test_case_relation_dto",
+    "TestCaseRelationTypeDto": "src.client.generated.models.test_case_relation_type_dto",
+    "TestCaseRowDto": "src.client.generated.models.test_case_row_dto",
+    "TestCaseRunBulkExistingLaunchDto": "src.client.generated.models.test_case_run_bulk_existing_launch_dto",
+    "TestCaseRunBulkNewLaunchDto": "src.client.generated.models.test_case_run_bulk_new_launch_dto",
+    "TestCaseRunByStats": "src.client.generated.models.test_case_run_by_stats",
+    "TestCaseRunStatsRequestDto": "src.client.generated.models.test_case_run_stats_request_dto",
+    "TestCaseScenarioDto": "src.client.generated.models.test_case_scenario_dto",
+    "TestCaseScenarioStepDto": "src.client.generated.models.test_case_scenario_step_dto",
+    "TestCaseScenarioV2Dto": "src.client.generated.models.test_case_scenario_v2_dto",
+    "TestCaseSelectionDtoV2": "src.client.generated.models.test_case_selection_dto_v2",
+    "TestCaseStatusBulkSetDto": "src.client.generated.models.test_case_status_bulk_set_dto",
+    "TestCaseStyle": "src.client.generated.models.test_case_style",
+    "TestCaseSyncFromTo": "src.client.generated.models.test_case_sync_from_to",
+    "TestCaseSyncRqDto": "src.client.generated.models.test_case_sync_rq_dto",
+    "TestCaseTagBulkAddDto": "src.client.generated.models.test_case_tag_bulk_add_dto",
+    "TestCaseTestPlanBulkCreateDto": "src.client.generated.models.test_case_test_plan_bulk_create_dto",
+    "TestCaseTreeAllPathsDto": "src.client.generated.models.test_case_tree_all_paths_dto",
+    "TestCaseTreeFilterCountDto": "src.client.generated.models.test_case_tree_filter_count_dto",
+    "TestCaseTreeGroupAddDto": "src.client.generated.models.test_case_tree_group_add_dto",
+    "TestCaseTreeGroupDto": "src.client.generated.models.test_case_tree_group_dto",
+    "TestCaseTreeGroupRenameDto": "src.client.generated.models.test_case_tree_group_rename_dto",
+    "TestCaseTreeLeafAddDto": "src.client.generated.models.test_case_tree_leaf_add_dto",
+    "TestCaseTreeLeafDto": "src.client.generated.models.test_case_tree_leaf_dto",
+    "TestCaseTreeLeafDtoV2": "src.client.generated.models.test_case_tree_leaf_dto_v2",
+    "TestCaseTreeLeafRenameDto": "src.client.generated.models.test_case_tree_leaf_rename_dto",
+    "TestCaseTreeNodeDto": "src.client.generated.models.test_case_tree_node_dto",
+    "TestCaseTreeRunStatRequestDto": "src.client.generated.models.test_case_tree_run_stat_request_dto",
+    "TestCaseTreeSelectionDto": "src.client.generated.models.test_case_tree_selection_dto",
+    "TestCaseTreeSelectionDtoV2": "src.client.generated.models.test_case_tree_selection_dto_v2",
+    "TestCaseType": "src.client.generated.models.test_case_type",
+    "TestCaseUpdateFieldDto": "src.client.generated.models.test_case_update_field_dto",
+    "TestCaseUpdatePolicyDto": "src.client.generated.models.test_case_update_policy_dto",
+    "TestCaseUpdateSchemaCreateDto": "src.client.generated.models.test_case_update_schema_create_dto",
+    "TestCaseUpdateSchemaDto": "src.client.generated.models.test_case_update_schema_dto",
+    "TestCaseUpdateSchemaPatchDto": "src.client.generated.models.test_case_update_schema_patch_dto",
+    "TestCaseVersionDto": "src.client.generated.models.test_case_version_dto",
+    "TestCaseVersionPatchDto": "src.client.generated.models.test_case_version_patch_dto",
+    "TestCaseVersionRqDto": "src.client.generated.models.test_case_version_rq_dto",
+    "TestCodeGenerationRequestDto": "src.client.generated.models.test_code_generation_request_dto",
+    "TestCodeGenerationResponseDto": "src.client.generated.models.test_code_generation_response_dto",
+    "TestDurationCount": "src.client.generated.models.test_duration_count",
+    "TestFixtureResultAttachmentPatchDto": "src.client.generated.models.test_fixture_result_attachment_patch_dto",
+    "TestFixtureResultAttachmentRowDto": "src.client.generated.models.test_fixture_result_attachment_row_dto",
+    "TestFixtureResultTypeDto": "src.client.generated.models.test_fixture_result_type_dto",
+    "TestFixtureResultV2Dto": "src.client.generated.models.test_fixture_result_v2_dto",
+    "TestKeyDto": "src.client.generated.models.test_key_dto",
+    "TestKeyImportFieldMapping": "src.client.generated.models.test_key_import_field_mapping",
+    "TestKeySchemaCreateDto": "src.client.generated.models.test_key_schema_create_dto",
+    "TestKeySchemaDto": "src.client.generated.models.test_key_schema_dto",
+    "TestKeySchemaPatchDto": "src.client.generated.models.test_key_schema_patch_dto",
+    "TestLayerCreateDto": "src.client.generated.models.test_layer_create_dto",
+    "TestLayerDto": "src.client.generated.models.test_layer_dto",
+    "TestLayerPatchDto": "src.client.generated.models.test_layer_patch_dto",
+    "TestLayerSchemaCreateDto": "src.client.generated.models.test_layer_schema_create_dto",
+    "TestLayerSchemaDto": "src.client.generated.models.test_layer_schema_dto",
+    "TestLayerSchemaPatchDto": "src.client.generated.models.test_layer_schema_patch_dto",
+    "TestPlanAssignDto": "src.client.generated.models.test_plan_assign_dto",
+    "TestPlanCreateDto": "src.client.generated.models.test_plan_create_dto",
+    "TestPlanDiffDto": "src.client.generated.models.test_plan_diff_dto",
+    "TestPlanDto": "src.client.generated.models.test_plan_dto",
+    "TestPlanJobParametersDto": "src.client.generated.models.test_plan_job_parameters_dto",
+    "TestPlanJobStatDto": "src.client.generated.models.test_plan_job_stat_dto",
+    "TestPlanMemberStatDto": "src.client.generated.models.test_plan_member_stat_dto",
+    "TestPlanPatchDto": "src.client.generated.models.test_plan_patch_dto",
+    "TestPlanRowDto": "src.client.generated.models.test_plan_row_dto",
+    "TestPlanRunRequestDto": "src.client.generated.models.test_plan_run_request_dto",
+    "TestPlanTreeSelectionDto": "src.client.generated.models.test_plan_tree_selection_dto",
+    "TestPlanWebhook": "src.client.generated.models.test_plan_webhook",
+    "TestResultAttachmentPatchDto": "src.client.generated.models.test_result_attachment_patch_dto",
+    "TestResultAttachmentRowDto": "src.client.generated.models.test_result_attachment_row_dto",
+    "TestResultAttachmentStepDto": "src.client.generated.models.test_result_attachment_step_dto",
+    "TestResultAttachmentStepDtoAllOfAttachment": "src.client.generated.models.test_result_attachment_step_dto_all_of_attachment",
+    "TestResultBodyStepDto": "src.client.generated.models.test_result_body_step_dto",
+    "TestResultBulkAssignDto": "src.client.generated.models.test_result_bulk_assign_dto",
+    "TestResultBulkDto": "src.client.generated.models.test_result_bulk_dto",
+    "TestResultBulkEntityIdsDto": "src.client.generated.models.test_result_bulk_entity_ids_dto",
+    "TestResultBulkMuteDto": "src.client.generated.models.test_result_bulk_mute_dto",
+    "TestResultBulkRerunDto": "src.client.generated.models.test_result_bulk_rerun_dto",
+    "TestResultBulkResolveDto": "src.client.generated.models.test_result_bulk_resolve_dto",
+    "TestResultBulkTagDto": "src.client.generated.models.test_result_bulk_tag_dto",
+    "TestResultCreateV2Dto": "src.client.generated.models.test_result_create_v2_dto",
+    "TestResultCsvExportOptions": "src.client.generated.models.test_result_csv_export_options",
+    "TestResultCsvExportOptionsMappingInner": "src.client.generated.models.test_result_csv_export_options_mapping_inner",
+    "TestResultDefectMatchDto": "src.client.generated.models.test_result_defect_match_dto",
+    "TestResultDefectMatcherDto": "src.client.generated.models.test_result_defect_matcher_dto",
+    "TestResultDto": "src.client.generated.models.test_result_dto",
+    "TestResultExpectedBodyStepDto": "src.client.generated.models.test_result_expected_body_step_dto",
+    "TestResultExportField": "src.client.generated.models.test_result_export_field",
+    "TestResultFlatDto": "src.client.generated.models.test_result_flat_dto",
+    "TestResultGroupNode": "src.client.generated.models.test_result_group_node",
+    "TestResultHistoryDto": "src.client.generated.models.test_result_history_dto",
+    "TestResultLeafNode": "src.client.generated.models.test_result_leaf_node",
+    "TestResultLinkDefectDto": "src.client.generated.models.test_result_link_defect_dto",
+    "TestResultMuteReason": "src.client.generated.models.test_result_mute_reason",
+    "TestResultNewDefectDto": "src.client.generated.models.test_result_new_defect_dto",
+    "TestResultParameterDto": "src.client.generated.models.test_result_parameter_dto",
+    "TestResultPatchDto": "src.client.generated.models.test_result_patch_dto",
+    "TestResultRerunDto": "src.client.generated.models.test_result_rerun_dto",
+    "TestResultRetriesRowDto": "src.client.generated.models.test_result_retries_row_dto",
+    "TestResultRowDto": "src.client.generated.models.test_result_row_dto",
+    "TestResultScenarioDto": "src.client.generated.models.test_result_scenario_dto",
+    "TestResultScenarioStepDto": "src.client.generated.models.test_result_scenario_step_dto",
+    "TestResultScenarioStepParameter": "src.client.generated.models.test_result_scenario_step_parameter",
+    "TestResultScenarioV2Dto": "src.client.generated.models.test_result_scenario_v2_dto",
+    "TestResultScenarioV2DtoStepsInner": "src.client.generated.models.test_result_scenario_v2_dto_steps_inner",
+    "TestResultStatsDto": "src.client.generated.models.test_result_stats_dto",
+    "TestResultTree": "src.client.generated.models.test_result_tree",
+    "TestResultTreeFilterCountDto": "src.client.generated.models.test_result_tree_filter_count_dto",
+    "TestResultTreeGroupDto": "src.client.generated.models.test_result_tree_group_dto",
+    "TestResultTreeGroupDtoV2": "src.client.generated.models.test_result_tree_group_dto_v2",
+    "TestResultTreeLeafDto": "src.client.generated.models.test_result_tree_leaf_dto",
+    "TestResultTreeLeafDtoV2": "src.client.generated.models.test_result_tree_leaf_dto_v2",
+    "TestResultTreeNodeDto": "src.client.generated.models.test_result_tree_node_dto",
+    "TestResultTreeSelectionDto": "src.client.generated.models.test_result_tree_selection_dto",
+    "TestSessionResponseDto": "src.client.generated.models.test_session_response_dto",
+    "TestStatus": "src.client.generated.models.test_status",
+    "TestStatusCount": "src.client.generated.models.test_status_count",
+    "TestTagCreateDto": "src.client.generated.models.test_tag_create_dto",
+    "TestTagDto": "src.client.generated.models.test_tag_dto",
+    "TestTagPatchDto": "src.client.generated.models.test_tag_patch_dto",
+    "TextColorMark": "src.client.generated.models.text_color_mark",
+    "TextFillMark": "src.client.generated.models.text_fill_mark",
+    "TextMark": "src.client.generated.models.text_mark",
+    "TextMarkupDocument": "src.client.generated.models.text_markup_document",
+    "TextParagraphNode": "src.client.generated.models.text_paragraph_node",
+    "TextParagraphNodeMarksInner": "src.client.generated.models.text_paragraph_node_marks_inner",
+    "TrScenarioStepDto": "src.client.generated.models.tr_scenario_step_dto",
+    "TreeCreateDto": "src.client.generated.models.tree_create_dto",
+    "TreeCustomFieldProjectDto": "src.client.generated.models.tree_custom_field_project_dto",
+    "TreeDto": "src.client.generated.models.tree_dto",
+    "TreeDtoV2": "src.client.generated.models.tree_dto_v2",
+    "TreePatchDto": "src.client.generated.models.tree_patch_dto",
+    "TreePathCreateDto": "src.client.generated.models.tree_path_create_dto",
+    "TreePathDto": "src.client.generated.models.tree_path_dto",
+    "TreePathItemDto": "src.client.generated.models.tree_path_item_dto",
+    "TreeSelectionDto": "src.client.generated.models.tree_selection_dto",
+    "UnderlineMark": "src.client.generated.models.underline_mark",
+    "UploadAttachmentDto": "src.client.generated.models.upload_attachment_dto",
+    "UploadFixturesResultsDto": "src.client.generated.models.upload_fixtures_results_dto",
+    "UploadLabelDto": "src.client.generated.models.upload_label_dto",
+    "UploadLinkDto": "src.client.generated.models.upload_link_dto",
+    "UploadParameterDto": "src.client.generated.models.upload_parameter_dto",
+    "UploadResultsDto": "src.client.generated.models.upload_results_dto",
+    "UploadResultsResponseDto": "src.client.generated.models.upload_results_response_dto",
+    "UploadTestCaseDto": "src.client.generated.models.upload_test_case_dto",
+    "UploadTestFixtureResultDto": "src.client.generated.models.upload_test_fixture_result_dto",
+    "UploadTestFixtureResultDtoStepsInner": "src.client.generated.models.upload_test_fixture_result_dto_steps_inner",
+    "UploadTestFixtureType": "src.client.generated.models.upload_test_fixture_type",
+    "UploadTestResultAttachmentStepDto": "src.client.generated.models.upload_test_result_attachment_step_dto",
+    "UploadTestResultBodyStepDto": "src.client.generated.models.upload_test_result_body_step_dto",
+    "UploadTestResultDto": "src.client.generated.models.upload_test_result_dto",
+    "UploadTestResultExpectedBodyStepDto": "src.client.generated.models.upload_test_result_expected_body_step_dto",
+    "UploadTestResultStepDto": "src.client.generated.models.upload_test_result_step_dto",
+    "UploadTestStatus": "src.client.generated.models.upload_test_status",
+    "WebhookCreateDto": "src.client.generated.models.webhook_create_dto",
+    "WebhookDto": "src.client.generated.models.webhook_dto",
+    "WebhookPatchDto": "src.client.generated.models.webhook_patch_dto",
+    "WebhookSettings": "src.client.generated.models.webhook_settings",
+    "WebhookSubject": "src.client.generated.models.webhook_subject",
+    "WebhookValidateDto": "src.client.generated.models.webhook_validate_dto",
+    "WidgetCreateDto": "src.client.generated.models.widget_create_dto",
+    "WidgetCreateDtoOptions": "src.client.generated.models.widget_create_dto_options",
+    "WidgetDataDto": "src.client.generated.models.widget_data_dto",
+    "WidgetDto": "src.client.generated.models.widget_dto",
+    "WidgetOptions": "src.client.generated.models.widget_options",
+    "WidgetOptionsAnalyticGraph": "src.client.generated.models.widget_options_analytic_graph",
+    "WidgetOptionsHavingSettableAql": "src.client.generated.models.widget_options_having_settable_aql",
+    "WidgetOptionsLastLaunchPieChart": "src.client.generated.models.widget_options_last_launch_pie_chart",
+    "WidgetOptionsLaunchList": "src.client.generated.models.widget_options_launch_list",
+    "WidgetOptionsLaunchTrend": "src.client.generated.models.widget_options_launch_trend",
+    "WidgetOptionsMarkdown": "src.client.generated.models.widget_options_markdown",
+    "WidgetOptionsStatisticTrend": "src.client.generated.models.widget_options_statistic_trend",
+    "WidgetOptionsTcPieChart": "src.client.generated.models.widget_options_tc_pie_chart",
+    "WidgetOptionsTcTreeMap": "src.client.generated.models.widget_options_tc_tree_map",
+    "WidgetOptionsTopTc": "src.client.generated.models.widget_options_top_tc",
+    "WidgetOptionsTrend": "src.client.generated.models.widget_options_trend",
+    "WidgetOptionsTrendV2": "src.client.generated.models.widget_options_trend_v2",
+    "WidgetPatchDto": "src.client.generated.models.widget_patch_dto",
+    "WidgetTypeDto": "src.client.generated.models.widget_type_dto",
+    "WorkflowCreateDto": "src.client.generated.models.workflow_create_dto",
+    "WorkflowDto": "src.client.generated.models.workflow_dto",
+    "WorkflowPatchDto": "src.client.generated.models.workflow_patch_dto",
+    "WorkflowRowDto": "src.client.generated.models.workflow_row_dto",
+    "WorkflowSchemaCreateDto": "src.client.generated.models.workflow_schema_create_dto",
+    "WorkflowSchemaDto": "src.client.generated.models.workflow_schema_dto",
+    "WorkflowSchemaPatchDto": "src.client.generated.models.workflow_schema_patch_dto",
+}
+
+if TYPE_CHECKING:
+    from src.client.generated.models.access_group_bulk_dto import AccessGroupBulkDto
+    from src.client.generated.models.access_group_create_dto import AccessGroupCreateDto
+    from src.client.generated.models.access_group_dto import AccessGroupDto
+    from src.client.generated.models.access_group_pa_dto import AccessGroupPaDto
+    from src.client.generated.models.access_group_patch_dto import AccessGroupPatchDto
+    from src.client.generated.models.access_group_project_access_dto import AccessGroupProjectAccessDto
+    from src.client.generated.models.access_group_projects_add_dto import AccessGroupProjectsAddDto
+    from src.client.generated.models.access_group_user_dto import AccessGroupUserDto
+    from src.client.generated.models.access_group_users_add_dto import AccessGroupUsersAddDto
+    from src.client.generated.models.allowed_role_dto import AllowedRoleDto
+    from src.client.generated.models.analytic_automation_trend_dto import AnalyticAutomationTrendDto
+    from src.client.generated.models.analytic_dto import AnalyticDto
+    from src.client.generated.models.analytic_interval import AnalyticInterval
+    from src.client.generated.models.analytic_launch_duration_histogram_dto import AnalyticLaunchDurationHistogramDto
+    from src.client.generated.models.analytic_mute_trend_dto import AnalyticMuteTrendDto
+    from src.client.generated.models.analytic_tc_automation_count_dto import AnalyticTcAutomationCountDto
+    from src.client.generated.models.analytic_tc_status_count_dto import AnalyticTcStatusCountDto
+    from src.client.generated.models.analytic_tr_by_status_trend_dto import AnalyticTrByStatusTrendDto
+    from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto
+    from src.client.generated.models.assign_request_dto import AssignRequestDto
+    from src.client.generated.models.async_job_dto import AsyncJobDto
+    from src.client.generated.models.async_job_status_dto import AsyncJobStatusDto
+    from src.client.generated.models.async_job_step_dto import AsyncJobStepDto
+    from src.client.generated.models.async_job_step_status_dto import AsyncJobStepStatusDto
+    from src.client.generated.models.async_job_with_steps_dto import AsyncJobWithStepsDto
+    from src.client.generated.models.attachment_row import AttachmentRow
+    from src.client.generated.models.attachment_step_dto import AttachmentStepDto
+    from src.client.generated.models.attrs import Attrs
+    from src.client.generated.models.audit_action_type_dto import AuditActionTypeDto
+    from src.client.generated.models.blob_storage_stats import BlobStorageStats
+    from src.client.generated.models.blob_storage_update_stats import BlobStorageUpdateStats
+    from src.client.generated.models.body_step_dto import BodyStepDto
+    from src.client.generated.models.bold_mark import BoldMark
+    from src.client.generated.models.business_metric_dto import BusinessMetricDto
+    from src.client.generated.models.category_create_dto import CategoryCreateDto
+    from src.client.generated.models.category_dto import CategoryDto
+    from src.client.generated.models.category_matcher_create_dto import CategoryMatcherCreateDto
+    from src.client.generated.models.category_matcher_dto import CategoryMatcherDto
+    from src.client.generated.models.category_matcher_patch_dto import CategoryMatcherPatchDto
+    from src.client.generated.models.category_patch_dto import CategoryPatchDto
+    from src.client.generated.models.cfv_merge_to_existing_global_value_dto import CfvMergeToExistingGlobalValueDto
+    from src.client.generated.models.cfv_merge_to_new_global_value_dto import CfvMergeToNewGlobalValueDto
+    from src.client.generated.models.ci import Ci
+    from src.client.generated.models.cleaner_schema_create_dto import CleanerSchemaCreateDto
+    from src.client.generated.models.cleaner_schema_dto import CleanerSchemaDto
+    from src.client.generated.models.cleaner_schema_patch_dto import CleanerSchemaPatchDto
+    from src.client.generated.models.cleaner_schema_target_dto import CleanerSchemaTargetDto
+    from src.client.generated.models.code_block_document_node import CodeBlockDocumentNode
+    from src.client.generated.models.code_mark import CodeMark
+    from src.client.generated.models.comment_create_dto import CommentCreateDto
+    from src.client.generated.models.comment_dto import CommentDto
+    from src.client.generated.models.comment_patch_dto import CommentPatchDto
+    from src.client.generated.models.create_launch_event import CreateLaunchEvent
+    from src.client.generated.models.csv_import_options import CsvImportOptions
+    from src.client.generated.models.custom_field_bulk_add_to_projects_dto import CustomFieldBulkAddToProjectsDto
+    from src.client.generated.models.custom_field_bulk_archive_dto import CustomFieldBulkArchiveDto
+    from src.client.generated.models.custom_field_create_dto import CustomFieldCreateDto
+    from src.client.generated.models.custom_field_dto import CustomFieldDto
+    from src.client.generated.models.custom_field_export_field_mapping import CustomFieldExportFieldMapping
+    from src.client.generated.models.custom_field_import_field_mapping import CustomFieldImportFieldMapping
+    from src.client.generated.models.custom_field_merge_dto import CustomFieldMergeDto
+    from src.client.generated.models.custom_field_patch_dto import CustomFieldPatchDto
+    from src.client.generated.models.custom_field_project_count_dto import CustomFieldProjectCountDto
+    from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto
+    from src.client.generated.models.custom_field_project_patch_dto import CustomFieldProjectPatchDto
+    from src.client.generated.models.custom_field_project_with_values_dto import CustomFieldProjectWithValuesDto
+    from src.client.generated.models.custom_field_raw_dto import CustomFieldRawDto
+    from src.client.generated.models.custom_field_schema_count_dto import CustomFieldSchemaCountDto
+    from src.client.generated.models.custom_field_schema_create_dto import CustomFieldSchemaCreateDto
+    from src.client.generated.models.custom_field_schema_dto import CustomFieldSchemaDto
+    from src.client.generated.models.custom_field_schema_patch_dto import CustomFieldSchemaPatchDto
+    from src.client.generated.models.custom_field_value_bulk_delete_dto import CustomFieldValueBulkDeleteDto
+    from src.client.generated.models.custom_field_value_bulk_merge_dto import CustomFieldValueBulkMergeDto
+    from src.client.generated.models.custom_field_value_dto import CustomFieldValueDto
+    from src.client.generated.models.custom_field_value_patch_dto import CustomFieldValuePatchDto
+    from src.client.generated.models.custom_field_value_project_create_dto import CustomFieldValueProjectCreateDto
+    from src.client.generated.models.custom_field_value_project_merge_by_id_dto import CustomFieldValueProjectMergeByIdDto
+    from src.client.generated.models.custom_field_value_project_merge_by_name_dto import CustomFieldValueProjectMergeByNameDto
+    from src.client.generated.models.custom_field_value_project_patch_dto import CustomFieldValueProjectPatchDto
+    from src.client.generated.models.custom_field_value_project_rename_dto import CustomFieldValueProjectRenameDto
+    from src.client.generated.models.custom_field_value_with_cf_dto import CustomFieldValueWithCfDto
+    from src.client.generated.models.custom_field_value_with_tc_count_dto import CustomFieldValueWithTcCountDto
+    from src.client.generated.models.custom_field_with_values_dto import CustomFieldWithValuesDto
+    from src.client.generated.models.dashboard_copy_dto import DashboardCopyDto
+    from src.client.generated.models.dashboard_create_dto import DashboardCreateDto
+    from src.client.generated.models.dashboard_drag_and_drop_dto import DashboardDragAndDropDto
+    from src.client.generated.models.dashboard_dto import DashboardDto
+    from src.client.generated.models.dashboard_overview_dto import DashboardOverviewDto
+    from src.client.generated.models.dashboard_patch_dto import DashboardPatchDto
+    from src.client.generated.models.dashboard_update_dto import DashboardUpdateDto
+    from src.client.generated.models.default_custom_field_value_dto import DefaultCustomFieldValueDto
+    from src.client.generated.models.default_text_markup_document import DefaultTextMarkupDocument
+    from src.client.generated.models.default_text_markup_document_all_of_content import DefaultTextMarkupDocumentAllOfContent
+    from src.client.generated.models.default_webhook_settings import DefaultWebhookSettings
+    from src.client.generated.models.default_webhook_settings_all_of_subjects import DefaultWebhookSettingsAllOfSubjects
+    from src.client.generated.models.defect_bulk_dto import DefectBulkDto
+    from src.client.generated.models.defect_count_row_dto import DefectCountRowDto
+    from src.client.generated.models.defect_create_dto import DefectCreateDto
+    from src.client.generated.models.defect_dto import DefectDto
+    from src.client.generated.models.defect_issue_link_dto import DefectIssueLinkDto
+    from src.client.generated.models.defect_matcher_create_dto import DefectMatcherCreateDto
+    from src.client.generated.models.defect_matcher_dto import DefectMatcherDto
+    from src.client.generated.models.defect_matcher_patch_dto import DefectMatcherPatchDto
+    from src.client.generated.models.defect_overview_dto import DefectOverviewDto
+    from src.client.generated.models.defect_patch_dto import DefectPatchDto
+    from src.client.generated.models.defect_row_dto import DefectRowDto
+    from src.client.generated.models.defect_webhook import DefectWebhook
+    from src.client.generated.models.diff_value_change_boolean import DiffValueChangeBoolean
+    from src.client.generated.models.diff_value_change_long import DiffValueChangeLong
+    from src.client.generated.models.diff_value_change_set_long import DiffValueChangeSetLong
+    from src.client.generated.models.diff_value_change_string import DiffValueChangeString
+    from src.client.generated.models.document_node import DocumentNode
+    from src.client.generated.models.env_var_create_dto import EnvVarCreateDto
+    from src.client.generated.models.env_var_dto import EnvVarDto
+    from src.client.generated.models.env_var_merge_dto import EnvVarMergeDto
+    from src.client.generated.models.env_var_patch_dto import EnvVarPatchDto
+    from src.client.generated.models.env_var_schema_create_dto import EnvVarSchemaCreateDto
+    from src.client.generated.models.env_var_schema_dto import EnvVarSchemaDto
+    from src.client.generated.models.env_var_schema_patch_dto import EnvVarSchemaPatchDto
+    from src.client.generated.models.env_var_value_create_dto import EnvVarValueCreateDto
+    from src.client.generated.models.env_var_value_dto import EnvVarValueDto
+    from src.client.generated.models.env_var_value_patch_dto import EnvVarValuePatchDto
+    from src.client.generated.models.environment_set_dto import EnvironmentSetDto
+    from src.client.generated.models.event_type import EventType
+    from src.client.generated.models.event_type_settings import EventTypeSettings
+    from src.client.generated.models.example_export_field_mapping import ExampleExportFieldMapping
+    from src.client.generated.models.expected_body_step_dto import ExpectedBodyStepDto
+    from src.client.generated.models.export_field_mapping_test_case_export_field import ExportFieldMappingTestCaseExportField
+    from src.client.generated.models.export_field_mapping_test_result_export_field import ExportFieldMappingTestResultExportField
+    from src.client.generated.models.export_request_dto import ExportRequestDto
+    from src.client.generated.models.export_status import ExportStatus
+    from src.client.generated.models.export_type import ExportType
+    from src.client.generated.models.ext_form_field import ExtFormField
+    from src.client.generated.models.ext_form_field_checkbox import ExtFormFieldCheckbox
+    from src.client.generated.models.ext_form_field_composite import ExtFormFieldComposite
+    from src.client.generated.models.ext_form_field_external_select import ExtFormFieldExternalSelect
+    from src.client.generated.models.ext_form_field_form_choice import ExtFormFieldFormChoice
+    from src.client.generated.models.ext_form_field_form_choice_option import ExtFormFieldFormChoiceOption
+    from src.client.generated.models.ext_form_field_list import ExtFormFieldList
+    from src.client.generated.models.ext_form_field_number import ExtFormFieldNumber
+    from src.client.generated.models.ext_form_field_option import ExtFormFieldOption
+    from src.client.generated.models.ext_form_field_password import ExtFormFieldPassword
+    from src.client.generated.models.ext_form_field_select import ExtFormFieldSelect
+    from src.client.generated.models.ext_form_field_slider import ExtFormFieldSlider
+    from src.client.generated.models.ext_form_field_text import ExtFormFieldText
+    from src.client.generated.models.ext_form_field_textarea import ExtFormFieldTextarea
+    from src.client.generated.models.ext_form_field_unknown import ExtFormFieldUnknown
+    from src.client.generated.models.ext_issue_link import ExtIssueLink
+    from src.client.generated.models.ext_issue_type import ExtIssueType
+    from src.client.generated.models.ext_project import ExtProject
+    from src.client.generated.models.ext_select_value import ExtSelectValue
+    from src.client.generated.models.external_link_dto import ExternalLinkDto
+    from src.client.generated.models.external_run_response_dto import ExternalRunResponseDto
+    from src.client.generated.models.external_run_start_request_dto import ExternalRunStartRequestDto
+    from src.client.generated.models.external_run_stop_request_dto import ExternalRunStopRequestDto
+    from src.client.generated.models.file_upload_response_dto import FileUploadResponseDto
+    from src.client.generated.models.filter_base_set_dto import FilterBaseSetDto
+    from src.client.generated.models.filter_create_dto import FilterCreateDto
+    from src.client.generated.models.filter_dto import FilterDto
+    from src.client.generated.models.filter_patch_dto import FilterPatchDto
+    from src.client.generated.models.filter_type_dto import FilterTypeDto
+    from src.client.generated.models.find_all29200_response import FindAll29200Response
+    from src.client.generated.models.global_permissions_dto import GlobalPermissionsDto
+    from src.client.generated.models.global_settings_dto import GlobalSettingsDto
+    from src.client.generated.models.global_settings_project_create_patch_dto import GlobalSettingsProjectCreatePatchDto
+    from src.client.generated.models.grid_pos_dto import GridPosDto
+    from src.client.generated.models.group_by import GroupBy
+    from src.client.generated.models.group_node_context import GroupNodeContext
+    from src.client.generated.models.id_and_name_only_dto import IdAndNameOnlyDto
+    from src.client.generated.models.id_only_dto import IdOnlyDto
+    from src.client.generated.models.import_request_dto import ImportRequestDto
+    from src.client.generated.models.import_request_info_dto import ImportRequestInfoDto
+    from src.client.generated.models.import_request_state_dto import ImportRequestStateDto
+    from src.client.generated.models.import_request_type_dto import ImportRequestTypeDto
+    from src.client.generated.models.integration_create_dto import IntegrationCreateDto
+    from src.client.generated.models.integration_dto import IntegrationDto
+    from src.client.generated.models.integration_export_create_dto import IntegrationExportCreateDto
+    from src.client.generated.models.integration_export_dto import IntegrationExportDto
+    from src.client.generated.models.integration_export_patch_dto import IntegrationExportPatchDto
+    from src.client.generated.models.integration_fields_form_dto import IntegrationFieldsFormDto
+    from src.client.generated.models.integration_fields_form_dto_default_project_fields_inner import IntegrationFieldsFormDtoDefaultProjectFieldsInner
+    from src.client.generated.models.integration_info_dto import IntegrationInfoDto
+    from src.client.generated.models.integration_links_fixed_dto import IntegrationLinksFixedDto
+    from src.client.generated.models.integration_operation_type_dto import IntegrationOperationTypeDto
+    from src.client.generated.models.integration_patch_dto import IntegrationPatchDto
+    from src.client.generated.models.integration_routine_type_dto import IntegrationRoutineTypeDto
+    from src.client.generated.models.integration_type_dto import IntegrationTypeDto
+    from src.client.generated.models.integration_validate_dto import IntegrationValidateDto
+    from src.client.generated.models.integration_webhook_create_dto import IntegrationWebhookCreateDto
+    from src.client.generated.models.integration_webhook_dto import IntegrationWebhookDto
+    from src.client.generated.models.integration_webhook_log_dto import IntegrationWebhookLogDto
+    from src.client.generated.models.integration_webhook_patch_dto import IntegrationWebhookPatchDto
+    from src.client.generated.models.integration_webhook_token_dto import IntegrationWebhookTokenDto
+    from src.client.generated.models.issue_create_dto import IssueCreateDto
+    from src.client.generated.models.issue_dto import IssueDto
+    from src.client.generated.models.issue_import_field_mapping import IssueImportFieldMapping
+    from src.client.generated.models.issue_integration_export_field_mapping import IssueIntegrationExportFieldMapping
+    from src.client.generated.models.issue_patch_dto import IssuePatchDto
+    from src.client.generated.models.issue_schema_create_dto import IssueSchemaCreateDto
+    from src.client.generated.models.issue_schema_dto import IssueSchemaDto
+    from src.client.generated.models.issue_schema_patch_dto import IssueSchemaPatchDto
+    from src.client.generated.models.issue_to_create_dto import IssueToCreateDto
+    from src.client.generated.models.italic_mark import ItalicMark
+    from src.client.generated.models.job import Job
+    from src.client.generated.models.job_create_dto import JobCreateDto
+    from src.client.generated.models.job_dto import JobDto
+    from src.client.generated.models.job_info_dto import JobInfoDto
+    from src.client.generated.models.job_mapping import JobMapping
+    from src.client.generated.models.job_parameter_dto import JobParameterDto
+    from src.client.generated.models.job_patch_dto import JobPatchDto
+    from src.client.generated.models.job_rerun_request_dto import JobRerunRequestDto
+    from src.client.generated.models.job_run import JobRun
+    from src.client.generated.models.job_run_dto import JobRunDto
+    from src.client.generated.models.job_run_request_dto import JobRunRequestDto
+    from src.client.generated.models.job_run_stage_dto import JobRunStageDto
+    from src.client.generated.models.job_run_status_dto import JobRunStatusDto
+    from src.client.generated.models.job_run_upload_info_dto import JobRunUploadInfoDto
+    from src.client.generated.models.job_test_cases_stat_dto import JobTestCasesStatDto
+    from src.client.generated.models.launch import Launch
+    from src.client.generated.models.launch_cleanup_request import LaunchCleanupRequest
+    from src.client.generated.models.launch_close_config_dto import LaunchCloseConfigDto
+    from src.client.generated.models.launch_copy_rq_dto import LaunchCopyRqDto
+    from src.client.generated.models.launch_create_and_upload_dto import LaunchCreateAndUploadDto
+    from src.client.generated.models.launch_create_dto import LaunchCreateDto
+    from src.client.generated.models.launch_diff_cell import LaunchDiffCell
+    from src.client.generated.models.launch_diff_mode import LaunchDiffMode
+    from src.client.generated.models.launch_diff_row import LaunchDiffRow
+    from src.client.generated.models.launch_diff_status_change_dto import LaunchDiffStatusChangeDto
+    from src.client.generated.models.launch_diff_test_result import LaunchDiffTestResult
+    from src.client.generated.models.launch_diff_test_result_dto import LaunchDiffTestResultDto
+    from src.client.generated.models.launch_dto import LaunchDto
+    from src.client.generated.models.launch_existing_upload_dto import LaunchExistingUploadDto
+    from src.client.generated.models.launch_live_doc_config_dto import LaunchLiveDocConfigDto
+    from src.client.generated.models.launch_member_stats_dto import LaunchMemberStatsDto
+    from src.client.generated.models.launch_merge_dto import LaunchMergeDto
+    from src.client.generated.models.launch_patch_dto import LaunchPatchDto
+    from src.client.generated.models.launch_pdf_options import LaunchPdfOptions
+    from src.client.generated.models.launch_pdf_part import LaunchPdfPart
+    from src.client.generated.models.launch_pdf_structure import LaunchPdfStructure
+    from src.client.generated.models.launch_preview_dto import LaunchPreviewDto
+    from src.client.generated.models.launch_progress_dto import LaunchProgressDto
+    from src.client.generated.models.launch_row_dto import LaunchRowDto
+    from src.client.generated.models.launch_tag_create_dto import LaunchTagCreateDto
+    from src.client.generated.models.launch_tag_dto import LaunchTagDto
+    from src.client.generated.models.launch_tag_patch_dto import LaunchTagPatchDto
+    from src.client.generated.models.launch_test_cases_add_dto import LaunchTestCasesAddDto
+    from src.client.generated.models.launch_test_plan_add_dto import LaunchTestPlanAddDto
+    from src.client.generated.models.launch_upload_response_dto import LaunchUploadResponseDto
+    from src.client.generated.models.launch_variable_dto import LaunchVariableDto
+    from src.client.generated.models.launch_webhook import LaunchWebhook
+    from src.client.generated.models.line_break_paragraph_node import LineBreakParagraphNode
+    from src.client.generated.models.link_export_field_mapping import LinkExportFieldMapping
+    from src.client.generated.models.link_import_field_mapping import LinkImportFieldMapping
+    from src.client.generated.models.link_mark import LinkMark
+    from src.client.generated.models.list_selection_dto import ListSelectionDto
+    from src.client.generated.models.manual_session_request_dto import ManualSessionRequestDto
+    from src.client.generated.models.matcher import Matcher
+    from src.client.generated.models.member_create_dto import MemberCreateDto
+    from src.client.generated.models.member_dto import MemberDto
+    from src.client.generated.models.member_patch_dto import MemberPatchDto
+    from src.client.generated.models.metric import Metric
+    from src.client.generated.models.mfa_global_settings_dto import MfaGlobalSettingsDto
+    from src.client.generated.models.mfa_global_settings_patch_dto import MfaGlobalSettingsPatchDto
+    from src.client.generated.models.multi_value_export_field_mapping import MultiValueExportFieldMapping
+    from src.client.generated.models.multi_value_import_field_mapping import MultiValueImportFieldMapping
+    from src.client.generated.models.multi_value_map_string_string import MultiValueMapStringString
+    from src.client.generated.models.mute_create_dto import MuteCreateDto
+    from src.client.generated.models.mute_dto import MuteDto
+    from src.client.generated.models.name_only_dto import NameOnlyDto
+    from src.client.generated.models.node_type import NodeType
+    from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto
+    from src.client.generated.models.normalized_scenario_dto_attachments_value import NormalizedScenarioDtoAttachmentsValue
+    from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto
+    from src.client.generated.models.ordered_value_dto_string import OrderedValueDtoString
+    from src.client.generated.models.page_access_group_dto import PageAccessGroupDto
+    from src.client.generated.models.page_access_group_dto_sort import PageAccessGroupDtoSort
+    from src.client.generated.models.page_access_group_pa_dto import PageAccessGroupPaDto
+    from src.client.generated.models.page_access_group_user_dto import PageAccessGroupUserDto
+    from src.client.generated.models.page_async_job_dto import PageAsyncJobDto
+    from src.client.generated.models.page_category_dto import PageCategoryDto
+    from src.client.generated.models.page_category_matcher_dto import PageCategoryMatcherDto
+    from src.client.generated.models.page_cleaner_schema_dto import PageCleanerSchemaDto
+    from src.client.generated.models.page_comment_dto import PageCommentDto
+    from src.client.generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto
+    from src.client.generated.models.page_custom_field_schema_dto import PageCustomFieldSchemaDto
+    from src.client.generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto
+    from src.client.generated.models.page_dashboard_dto import PageDashboardDto
+    from src.client.generated.models.page_defect_count_row_dto import PageDefectCountRowDto
+    from src.client.generated.models.page_defect_dto import PageDefectDto
+    from src.client.generated.models.page_defect_matcher_dto import PageDefectMatcherDto
+    from src.client.generated.models.page_defect_row_dto import PageDefectRowDto
+    from src.client.generated.models.page_env_var_schema_dto import PageEnvVarSchemaDto
+    from src.client.generated.models.page_export_request_dto import PageExportRequestDto
+    from src.client.generated.models.page_filter_dto import PageFilterDto
+    from src.client.generated.models.page_id_and_name_only_dto import PageIdAndNameOnlyDto
+    from src.client.generated.models.page_import_request_dto import PageImportRequestDto
+    from src.client.generated.models.page_integration_dto import PageIntegrationDto
+    from src.client.generated.models.page_integration_export_dto import PageIntegrationExportDto
+    from src.client.generated.models.page_integration_info_dto import PageIntegrationInfoDto
+    from src.client.generated.models.page_integration_webhook_dto import PageIntegrationWebhookDto
+    from src.client.generated.models.page_integration_webhook_log_dto import PageIntegrationWebhookLogDto
+    from src.client.generated.models.page_issue_dto import PageIssueDto
+    from src.client.generated.models.page_issue_schema_dto import PageIssueSchemaDto
+    from src.client.generated.models.page_job_dto import PageJobDto
+    from src.client.generated.models.page_launch_diff_row import PageLaunchDiffRow
+    from src.client.generated.models.page_launch_dto import PageLaunchDto
+    from src.client.generated.models.page_launch_member_stats_dto import PageLaunchMemberStatsDto
+    from src.client.generated.models.page_launch_preview_dto import PageLaunchPreviewDto
+    from src.client.generated.models.page_launch_row_dto import PageLaunchRowDto
+    from src.client.generated.models.page_launch_tag_dto import PageLaunchTagDto
+    from src.client.generated.models.page_launch_variable_dto import PageLaunchVariableDto
+    from src.client.generated.models.page_member_dto import PageMemberDto
+    from src.client.generated.models.page_mute_dto import PageMuteDto
+    from src.client.generated.models.page_permission_set_dto import PagePermissionSetDto
+    from src.client.generated.models.page_project_collaborator_access_dto import PageProjectCollaboratorAccessDto
+    from src.client.generated.models.page_project_collaborator_dto import PageProjectCollaboratorDto
+    from src.client.generated.models.page_project_custom_field_dto import PageProjectCustomFieldDto
+    from src.client.generated.models.page_project_dto import PageProjectDto
+    from src.client.generated.models.page_project_group_access_dto import PageProjectGroupAccessDto
+    from src.client.generated.models.page_project_integration_dto import PageProjectIntegrationDto
+    from src.client.generated.models.page_project_suggest_dto import PageProjectSuggestDto
+    from src.client.generated.models.page_role_schema_dto import PageRoleSchemaDto
+    from src.client.generated.models.page_shared_step_attachment_row_dto import PageSharedStepAttachmentRowDto
+    from src.client.generated.models.page_shared_step_dto import PageSharedStepDto
+    from src.client.generated.models.page_statistic_widget_item import PageStatisticWidgetItem
+    from src.client.generated.models.page_status_dto import PageStatusDto
+    from src.client.generated.models.page_template_dto import PageTemplateDto
+    from src.client.generated.models.page_test_case_attachment_row_dto import PageTestCaseAttachmentRowDto
+    from src.client.generated.models.page_test_case_audit_log_entry_dto import PageTestCaseAuditLogEntryDto
+    from src.client.generated.models.page_test_case_dto import PageTestCaseDto
+    from src.client.generated.models.page_test_case_example_dto import PageTestCaseExampleDto
+    from src.client.generated.models.page_test_case_flat_dto import PageTestCaseFlatDto
+    from src.client.generated.models.page_test_case_row_dto import PageTestCaseRowDto
+    from src.client.generated.models.page_test_case_tree_group_dto import PageTestCaseTreeGroupDto
+    from src.client.generated.models.page_test_case_tree_leaf_dto import PageTestCaseTreeLeafDto
+    from src.client.generated.models.page_test_case_tree_node_dto import PageTestCaseTreeNodeDto
+    from src.client.generated.models.page_test_case_tree_node_dto_content_inner import PageTestCaseTreeNodeDtoContentInner
+    from src.client.generated.models.page_test_fixture_result_attachment_row_dto import PageTestFixtureResultAttachmentRowDto
+    from src.client.generated.models.page_test_key_schema_dto import PageTestKeySchemaDto
+    from src.client.generated.models.page_test_layer_dto import PageTestLayerDto
+    from src.client.generated.models.page_test_layer_schema_dto import PageTestLayerSchemaDto
+    from src.client.generated.models.page_test_plan_dto import PageTestPlanDto
+    from src.client.generated.models.page_test_plan_row_dto import PageTestPlanRowDto
+    from src.client.generated.models.page_test_result_attachment_row_dto import PageTestResultAttachmentRowDto
+    from src.client.generated.models.page_test_result_defect_match_dto import PageTestResultDefectMatchDto
+    from src.client.generated.models.page_test_result_dto import PageTestResultDto
+    from src.client.generated.models.page_test_result_flat_dto import PageTestResultFlatDto
+    from src.client.generated.models.page_test_result_history_dto import PageTestResultHistoryDto
+    from src.client.generated.models.page_test_result_retries_row_dto import PageTestResultRetriesRowDto
+    from src.client.generated.models.page_test_result_row_dto import PageTestResultRowDto
+    from src.client.generated.models.page_test_result_tree_group_dto import PageTestResultTreeGroupDto
+    from src.client.generated.models.page_test_result_tree_leaf_dto import PageTestResultTreeLeafDto
+    from src.client.generated.models.page_test_result_tree_node_dto import PageTestResultTreeNodeDto
+    from src.client.generated.models.page_test_result_tree_node_dto_content_inner import PageTestResultTreeNodeDtoContentInner
+    from src.client.generated.models.page_tree_dto import PageTreeDto
+    from src.client.generated.models.page_tree_dto_v2 import PageTreeDtoV2
+    from src.client.generated.models.page_tree_path_dto import PageTreePathDto
+    from src.client.generated.models.page_webhook_dto import PageWebhookDto
+    from src.client.generated.models.page_widget_dto import PageWidgetDto
+    from src.client.generated.models.page_workflow_dto import PageWorkflowDto
+    from src.client.generated.models.page_workflow_schema_dto import PageWorkflowSchemaDto
+    from src.client.generated.models.pageable import Pageable
+    from src.client.generated.models.paragraph_document_node import ParagraphDocumentNode
+    from src.client.generated.models.paragraph_document_node_all_of_content import ParagraphDocumentNodeAllOfContent
+    from src.client.generated.models.paragraph_node import ParagraphNode
+    from src.client.generated.models.parameter import Parameter
+    from src.client.generated.models.parameter_value_dto import ParameterValueDto
+    from src.client.generated.models.permission_dto import PermissionDto
+    from src.client.generated.models.permission_set_create_dto import PermissionSetCreateDto
+    from src.client.generated.models.permission_set_dto import PermissionSetDto
+    from src.client.generated.models.permission_set_patch_dto import PermissionSetPatchDto
+    from src.client.generated.models.project_access_collaborator_add_dto import ProjectAccessCollaboratorAddDto
+    from src.client.generated.models.project_access_group_add_dto import ProjectAccessGroupAddDto
+    from src.client.generated.models.project_category_add_dto import ProjectCategoryAddDto
+    from src.client.generated.models.project_category_matcher_add_dto import ProjectCategoryMatcherAddDto
+    from src.client.generated.models.project_category_matcher_remove_dto import ProjectCategoryMatcherRemoveDto
+    from src.client.generated.models.project_category_remove_dto import ProjectCategoryRemoveDto
+    from src.client.generated.models.project_collaborator_access_dto import ProjectCollaboratorAccessDto
+    from src.client.generated.models.project_collaborator_dto import ProjectCollaboratorDto
+    from src.client.generated.models.project_create_dto import ProjectCreateDto
+    from src.client.generated.models.project_custom_field_dto import ProjectCustomFieldDto
+    from src.client.generated.models.project_dto import ProjectDto
+    from src.client.generated.models.project_group_access_add_dto import ProjectGroupAccessAddDto
+    from src.client.generated.models.project_group_access_dto import ProjectGroupAccessDto
+    from src.client.generated.models.project_integration_create_dto import ProjectIntegrationCreateDto
+    from src.client.generated.models.project_integration_dto import ProjectIntegrationDto
+    from src.client.generated.models.project_integration_fields_form_dto import ProjectIntegrationFieldsFormDto
+    from src.client.generated.models.project_integration_patch_dto import ProjectIntegrationPatchDto
+    from src.client.generated.models.project_integration_validate_dto import ProjectIntegrationValidateDto
+    from src.client.generated.models.project_metric_dto import ProjectMetricDto
+    from src.client.generated.models.project_patch_dto import ProjectPatchDto
+    from src.client.generated.models.project_property_create_dto import ProjectPropertyCreateDto
+    from src.client.generated.models.project_property_dto import ProjectPropertyDto
+    from src.client.generated.models.project_property_patch_dto import ProjectPropertyPatchDto
+    from src.client.generated.models.project_stats_dto import ProjectStatsDto
+    from src.client.generated.models.project_suggest_dto import ProjectSuggestDto
+    from src.client.generated.models.project_sync_request import ProjectSyncRequest
+    from src.client.generated.models.project_test_case_count_dto import ProjectTestCaseCountDto
+    from src.client.generated.models.resolve_request_v2_dto import ResolveRequestV2Dto
+    from src.client.generated.models.retry import Retry
+    from src.client.generated.models.role_create_dto import RoleCreateDto
+    from src.client.generated.models.role_dto import RoleDto
+    from src.client.generated.models.role_export_field_mapping import RoleExportFieldMapping
+    from src.client.generated.models.role_import_field_mapping import RoleImportFieldMapping
+    from src.client.generated.models.role_patch_dto import RolePatchDto
+    from src.client.generated.models.role_schema_create_dto import RoleSchemaCreateDto
+    from src.client.generated.models.role_schema_dto import RoleSchemaDto
+    from src.client.generated.models.role_schema_patch_dto import RoleSchemaPatchDto
+    from src.client.generated.models.scenario_export_field_mapping import ScenarioExportFieldMapping
+    from src.client.generated.models.scenario_step_copy_dto import ScenarioStepCopyDto
+    from src.client.generated.models.scenario_step_create_dto import ScenarioStepCreateDto
+    from src.client.generated.models.scenario_step_created_response_dto import ScenarioStepCreatedResponseDto
+    from src.client.generated.models.scenario_step_dto import ScenarioStepDto
+    from src.client.generated.models.scenario_step_move_dto import ScenarioStepMoveDto
+    from src.client.generated.models.scenario_step_patch_dto import ScenarioStepPatchDto
+    from src.client.generated.models.session_variable import SessionVariable
+    from src.client.generated.models.shared_step_attachment_patch_dto import SharedStepAttachmentPatchDto
+    from src.client.generated.models.shared_step_attachment_row_dto import SharedStepAttachmentRowDto
+    from src.client.generated.models.shared_step_create_dto import SharedStepCreateDto
+    from src.client.generated.models.shared_step_dto import SharedStepDto
+    from src.client.generated.models.shared_step_patch_dto import SharedStepPatchDto
+    from src.client.generated.models.shared_step_scenario_dto import SharedStepScenarioDto
+    from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner
+    from src.client.generated.models.shared_step_step_dto import SharedStepStepDto
+    from src.client.generated.models.statistic_dto import StatisticDto
+    from src.client.generated.models.statistic_widget_item import StatisticWidgetItem
+    from src.client.generated.models.status import Status
+    from src.client.generated.models.status_create_dto import StatusCreateDto
+    from src.client.generated.models.status_dto import StatusDto
+    from src.client.generated.models.status_patch_dto import StatusPatchDto
+    from src.client.generated.models.strike_mark import StrikeMark
+    from src.client.generated.models.tag_import_field_mapping import TagImportFieldMapping
+    from src.client.generated.models.template_dto import TemplateDto
+    from src.client.generated.models.template_overview_dto import TemplateOverviewDto
+    from src.client.generated.models.test_case_association_diff import TestCaseAssociationDiff
+    from src.client.generated.models.test_case_attachment_patch_dto import TestCaseAttachmentPatchDto
+    from src.client.generated.models.test_case_attachment_row_dto import TestCaseAttachmentRowDto
+    from src.client.generated.models.test_case_audit_log_data import TestCaseAuditLogData
+    from src.client.generated.models.test_case_audit_log_data_diff import TestCaseAuditLogDataDiff
+    from src.client.generated.models.test_case_audit_log_entry_dto import TestCaseAuditLogEntryDto
+    from src.client.generated.models.test_case_bulk_cf_move_strategy import TestCaseBulkCfMoveStrategy
+    from src.client.generated.models.test_case_bulk_change_project_dto_v2 import TestCaseBulkChangeProjectDtoV2
+    from src.client.generated.models.test_case_bulk_clone_dto import TestCaseBulkCloneDto
+    from src.client.generated.models.test_case_bulk_clone_dto_v2 import TestCaseBulkCloneDtoV2
+    from src.client.generated.models.test_case_bulk_drag_and_drop_dto import TestCaseBulkDragAndDropDto
+    from src.client.generated.models.test_case_bulk_drag_and_drop_dto_v2 import TestCaseBulkDragAndDropDtoV2
+    from src.client.generated.models.test_case_bulk_dto import TestCaseBulkDto
+    from src.client.generated.models.test_case_bulk_dto_v2 import TestCaseBulkDtoV2
+    from src.client.generated.models.test_case_bulk_entity_ids_dto import TestCaseBulkEntityIdsDto
+    from src.client.generated.models.test_case_bulk_entity_ids_dto_v2 import TestCaseBulkEntityIdsDtoV2
+    from src.client.generated.models.test_case_bulk_export_csv_options import TestCaseBulkExportCsvOptions
+    from src.client.generated.models.test_case_bulk_export_csv_options_mapping_inner import TestCaseBulkExportCsvOptionsMappingInner
+    from src.client.generated.models.test_case_bulk_export_pdf_options import TestCaseBulkExportPdfOptions
+    from src.client.generated.models.test_case_bulk_external_link_dto import TestCaseBulkExternalLinkDto
+    from src.client.generated.models.test_case_bulk_issue_dto import TestCaseBulkIssueDto
+    from src.client.generated.models.test_case_bulk_layer_dto import TestCaseBulkLayerDto
+    from src.client.generated.models.test_case_bulk_member_dto import TestCaseBulkMemberDto
+    from src.client.generated.models.test_case_bulk_mute_dto import TestCaseBulkMuteDto
+    from src.client.generated.models.test_case_bulk_new_cfv_dto import TestCaseBulkNewCfvDto
+    from src.client.generated.models.test_case_bulk_project_change_dto import TestCaseBulkProjectChangeDto
+    from src.client.generated.models.test_case_bulk_run_existing_launch_dto import TestCaseBulkRunExistingLaunchDto
+    from src.client.generated.models.test_case_bulk_run_new_launch_dto import TestCaseBulkRunNewLaunchDto
+    from src.client.generated.models.test_case_bulk_status_dto import TestCaseBulkStatusDto
+    from src.client.generated.models.test_case_bulk_tag_dto import TestCaseBulkTagDto
+    from src.client.generated.models.test_case_bulk_test_plan_create_dto import TestCaseBulkTestPlanCreateDto
+    from src.client.generated.models.test_case_cf_bulk_delta_dto_v2 import TestCaseCfBulkDeltaDtoV2
+    from src.client.generated.models.test_case_cfv_bulk_add_dto import TestCaseCfvBulkAddDto
+    from src.client.generated.models.test_case_clone_rq_dto import TestCaseCloneRqDto
+    from src.client.generated.models.test_case_count_dto import TestCaseCountDto
+    from src.client.generated.models.test_case_create_v2_dto import TestCaseCreateV2Dto
+    from src.client.generated.models.test_case_csv_export_options import TestCaseCsvExportOptions
+    from src.client.generated.models.test_case_csv_import_options import TestCaseCsvImportOptions
+    from src.client.generated.models.test_case_csv_import_options_mapping_inner import TestCaseCsvImportOptionsMappingInner
+    from src.client.generated.models.test_case_csv_preview_options import TestCaseCsvPreviewOptions
+    from src.client.generated.models.test_case_detach_automation_rq_dto import TestCaseDetachAutomationRqDto
+    from src.client.generated.models.test_case_diff import TestCaseDiff
+    from src.client.generated.models.test_case_dto import TestCaseDto
+    from src.client.generated.models.test_case_example_dto import TestCaseExampleDto
+    from src.client.generated.models.test_case_export_field import TestCaseExportField
+    from src.client.generated.models.test_case_external_link_bulk_add_dto import TestCaseExternalLinkBulkAddDto
+    from src.client.generated.models.test_case_flat_dto import TestCaseFlatDto
+    from src.client.generated.models.test_case_full_tree_node_dto import TestCaseFullTreeNodeDto
+    from src.client.generated.models.test_case_import_dto import TestCaseImportDto
+    from src.client.generated.models.test_case_import_field import TestCaseImportField
+    from src.client.generated.models.test_case_import_mapping import TestCaseImportMapping
+    from src.client.generated.models.test_case_info import TestCaseInfo
+    from src.client.generated.models.test_case_issue_bulk_add_dto import TestCaseIssueBulkAddDto
+    from src.client.generated.models.test_case_last_result_dto import TestCaseLastResultDto
+    from src.client.generated.models.test_case_layer_bulk_set_dto import TestCaseLayerBulkSetDto
+    from src.client.generated.models.test_case_light_tree_node_dto import TestCaseLightTreeNodeDto
+    from src.client.generated.models.test_case_member_bulk_add_dto import TestCaseMemberBulkAddDto
+    from src.client.generated.models.test_case_mute_bulk_add_dto import TestCaseMuteBulkAddDto
+    from src.client.generated.models.test_case_overview_dto import TestCaseOverviewDto
+    from src.client.generated.models.test_case_parameter_dto import TestCaseParameterDto
+    from src.client.generated.models.test_case_parameter_values import TestCaseParameterValues
+    from src.client.generated.models.test_case_patch_v2_dto import TestCasePatchV2Dto
+    from src.client.generated.models.test_case_pdf_options import TestCasePdfOptions
+    from src.client.generated.models.test_case_pdf_part import TestCasePdfPart
+    from src.client.generated.models.test_case_relation_dto import TestCaseRelationDto
+    from src.client.generated.models.test_case_relation_type_dto import TestCaseRelationTypeDto
+    from src.client.generated.models.test_case_row_dto import TestCaseRowDto
+    from src.client.generated.models.test_case_run_bulk_existing_launch_dto import TestCaseRunBulkExistingLaunchDto
+    from src.client.generated.models.test_case_run_bulk_new_launch_dto import TestCaseRunBulkNewLaunchDto
+    from src.client.generated.models.test_case_run_by_stats import TestCaseRunByStats
+    from src.client.generated.models.test_case_run_stats_request_dto import TestCaseRunStatsRequestDto
+    from src.client.generated.models.test_case_scenario_dto import TestCaseScenarioDto
+    from src.client.generated.models.test_case_scenario_step_dto import TestCaseScenarioStepDto
+    from src.client.generated.models.test_case_scenario_v2_dto import TestCaseScenarioV2Dto
+    from src.client.generated.models.test_case_selection_dto_v2 import TestCaseSelectionDtoV2
+    from src.client.generated.models.test_case_status_bulk_set_dto import TestCaseStatusBulkSetDto
+    from src.client.generated.models.test_case_style import TestCaseStyle
+    from src.client.generated.models.test_case_sync_from_to import TestCaseSyncFromTo
+    from src.client.generated.models.test_case_sync_rq_dto import TestCaseSyncRqDto
+    from src.client.generated.models.test_case_tag_bulk_add_dto import TestCaseTagBulkAddDto
+    from src.client.generated.models.test_case_test_plan_bulk_create_dto import TestCaseTestPlanBulkCreateDto
+    from src.client.generated.models.test_case_tree_all_paths_dto import TestCaseTreeAllPathsDto
+    from src.client.generated.models.test_case_tree_filter_count_dto import TestCaseTreeFilterCountDto
+    from src.client.generated.models.test_case_tree_group_add_dto import TestCaseTreeGroupAddDto
+    from src.client.generated.models.test_case_tree_group_dto import TestCaseTreeGroupDto
+    from src.client.generated.models.test_case_tree_group_rename_dto import TestCaseTreeGroupRenameDto
+    from src.client.generated.models.test_case_tree_leaf_add_dto import TestCaseTreeLeafAddDto
+    from src.client.generated.models.test_case_tree_leaf_dto import TestCaseTreeLeafDto
+    from src.client.generated.models.test_case_tree_leaf_dto_v2 import TestCaseTreeLeafDtoV2
+    from src.client.generated.models.test_case_tree_leaf_rename_dto import TestCaseTreeLeafRenameDto
+    from src.client.generated.models.test_case_tree_node_dto import TestCaseTreeNodeDto
+    from src.client.generated.models.test_case_tree_run_stat_request_dto import TestCaseTreeRunStatRequestDto
+    from src.client.generated.models.test_case_tree_selection_dto import TestCaseTreeSelectionDto
+    from src.client.generated.models.test_case_tree_selection_dto_v2 import TestCaseTreeSelectionDtoV2
+    from src.client.generated.models.test_case_type import TestCaseType
+    from src.client.generated.models.test_case_update_field_dto import TestCaseUpdateFieldDto
+    from src.client.generated.models.test_case_update_policy_dto import TestCaseUpdatePolicyDto
+    from src.client.generated.models.test_case_update_schema_create_dto import TestCaseUpdateSchemaCreateDto
+    from src.client.generated.models.test_case_update_schema_dto import TestCaseUpdateSchemaDto
+    from src.client.generated.models.test_case_update_schema_patch_dto import TestCaseUpdateSchemaPatchDto
+    from src.client.generated.models.test_case_version_dto import TestCaseVersionDto
+    from src.client.generated.models.test_case_version_patch_dto import TestCaseVersionPatchDto
+    from src.client.generated.models.test_case_version_rq_dto import TestCaseVersionRqDto
+    from src.client.generated.models.test_code_generation_request_dto import TestCodeGenerationRequestDto
+    from src.client.generated.models.test_code_generation_response_dto import TestCodeGenerationResponseDto
+    from src.client.generated.models.test_duration_count import TestDurationCount
+    from src.client.generated.models.test_fixture_result_attachment_patch_dto import TestFixtureResultAttachmentPatchDto
+    from src.client.generated.models.test_fixture_result_attachment_row_dto import TestFixtureResultAttachmentRowDto
+    from src.client.generated.models.test_fixture_result_type_dto import TestFixtureResultTypeDto
+    from src.client.generated.models.test_fixture_result_v2_dto import TestFixtureResultV2Dto
+    from src.client.generated.models.test_key_dto import TestKeyDto
+    from src.client.generated.models.test_key_import_field_mapping import TestKeyImportFieldMapping
+    from src.client.generated.models.test_key_schema_create_dto import TestKeySchemaCreateDto
+    from src.client.generated.models.test_key_schema_dto import TestKeySchemaDto
+    from src.client.generated.models.test_key_schema_patch_dto import TestKeySchemaPatchDto
+    from src.client.generated.models.test_layer_create_dto import TestLayerCreateDto
+    from src.client.generated.models.test_layer_dto import TestLayerDto
+    from src.client.generated.models.test_layer_patch_dto import TestLayerPatchDto
+    from src.client.generated.models.test_layer_schema_create_dto import TestLayerSchemaCreateDto
+    from src.client.generated.models.test_layer_schema_dto import TestLayerSchemaDto
+    from src.client.generated.models.test_layer_schema_patch_dto import TestLayerSchemaPatchDto
+    from src.client.generated.models.test_plan_assign_dto import TestPlanAssignDto
+    from src.client.generated.models.test_plan_create_dto import TestPlanCreateDto
+    from src.client.generated.models.test_plan_diff_dto import TestPlanDiffDto
+    from src.client.generated.models.test_plan_dto import TestPlanDto
+    from src.client.generated.models.test_plan_job_parameters_dto import TestPlanJobParametersDto
+    from src.client.generated.models.test_plan_job_stat_dto import TestPlanJobStatDto
+    from src.client.generated.models.test_plan_member_stat_dto import TestPlanMemberStatDto
+    from src.client.generated.models.test_plan_patch_dto import TestPlanPatchDto
+    from src.client.generated.models.test_plan_row_dto import TestPlanRowDto
+    from src.client.generated.models.test_plan_run_request_dto import TestPlanRunRequestDto
+    from src.client.generated.models.test_plan_tree_selection_dto import TestPlanTreeSelectionDto
+    from src.client.generated.models.test_plan_webhook import TestPlanWebhook
+    from src.client.generated.models.test_result_attachment_patch_dto import TestResultAttachmentPatchDto
+    from src.client.generated.models.test_result_attachment_row_dto import TestResultAttachmentRowDto
+    from src.client.generated.models.test_result_attachment_step_dto import TestResultAttachmentStepDto
+    from src.client.generated.models.test_result_attachment_step_dto_all_of_attachment import TestResultAttachmentStepDtoAllOfAttachment
+    from src.client.generated.models.test_result_body_step_dto import TestResultBodyStepDto
+    from src.client.generated.models.test_result_bulk_assign_dto import TestResultBulkAssignDto
+    from src.client.generated.models.test_result_bulk_dto import TestResultBulkDto
+    from src.client.generated.models.test_result_bulk_entity_ids_dto import TestResultBulkEntityIdsDto
+    from src.client.generated.models.test_result_bulk_mute_dto import TestResultBulkMuteDto
+    from src.client.generated.models.test_result_bulk_rerun_dto import TestResultBulkRerunDto
+    from src.client.generated.models.test_result_bulk_resolve_dto import TestResultBulkResolveDto
+    from src.client.generated.models.test_result_bulk_tag_dto import TestResultBulkTagDto
+    from src.client.generated.models.test_result_create_v2_dto import TestResultCreateV2Dto
+    from src.client.generated.models.test_result_csv_export_options import TestResultCsvExportOptions
+    from src.client.generated.models.test_result_csv_export_options_mapping_inner import TestResultCsvExportOptionsMappingInner
+    from src.client.generated.models.test_result_defect_match_dto import TestResultDefectMatchDto
+    from src.client.generated.models.test_result_defect_matcher_dto import TestResultDefectMatcherDto
+    from src.client.generated.models.test_result_dto import TestResultDto
+    from src.client.generated.models.test_result_expected_body_step_dto import TestResultExpectedBodyStepDto
+    from src.client.generated.models.test_result_export_field import TestResultExportField
+    from src.client.generated.models.test_result_flat_dto import TestResultFlatDto
+    from src.client.generated.models.test_result_group_node import TestResultGroupNode
+    from src.client.generated.models.test_result_history_dto import TestResultHistoryDto
+    from src.client.generated.models.test_result_leaf_node import TestResultLeafNode
+    from src.client.generated.models.test_result_link_defect_dto import TestResultLinkDefectDto
+    from src.client.generated.models.test_result_mute_reason import TestResultMuteReason
+    from src.client.generated.models.test_result_new_defect_dto import TestResultNewDefectDto
+    from src.client.generated.models.test_result_parameter_dto import TestResultParameterDto
+    from src.client.generated.models.test_result_patch_dto import TestResultPatchDto
+    from src.client.generated.models.test_result_rerun_dto import TestResultRerunDto
+    from src.client.generated.models.test_result_retries_row_dto import TestResultRetriesRowDto
+    from src.client.generated.models.test_result_row_dto import TestResultRowDto
+    from src.client.generated.models.test_result_scenario_dto import TestResultScenarioDto
+    from src.client.generated.models.test_result_scenario_step_dto import TestResultScenarioStepDto
+    from src.client.generated.models.test_result_scenario_step_parameter import TestResultScenarioStepParameter
+    from src.client.generated.models.test_result_scenario_v2_dto import TestResultScenarioV2Dto
+    from src.client.generated.models.test_result_scenario_v2_dto_steps_inner import TestResultScenarioV2DtoStepsInner
+    from src.client.generated.models.test_result_stats_dto import TestResultStatsDto
+    from src.client.generated.models.test_result_tree import TestResultTree
+    from src.client.generated.models.test_result_tree_filter_count_dto import TestResultTreeFilterCountDto
+    from src.client.generated.models.test_result_tree_group_dto import TestResultTreeGroupDto
+    from src.client.generated.models.test_result_tree_group_dto_v2 import TestResultTreeGroupDtoV2
+    from src.client.generated.models.test_result_tree_leaf_dto import TestResultTreeLeafDto
+    from src.client.generated.models.test_result_tree_leaf_dto_v2 import TestResultTreeLeafDtoV2
+    from src.client.generated.models.test_result_tree_node_dto import TestResultTreeNodeDto
+    from src.client.generated.models.test_result_tree_selection_dto import TestResultTreeSelectionDto
+    from src.client.generated.models.test_session_response_dto import TestSessionResponseDto
+    from src.client.generated.models.test_status import TestStatus
+    from src.client.generated.models.test_status_count import TestStatusCount
+    from src.client.generated.models.test_tag_create_dto import TestTagCreateDto
+    from src.client.generated.models.test_tag_dto import TestTagDto
+    from src.client.generated.models.test_tag_patch_dto import TestTagPatchDto
+    from src.client.generated.models.text_color_mark import TextColorMark
+    from src.client.generated.models.text_fill_mark import TextFillMark
+    from src.client.generated.models.text_mark import TextMark
+    from src.client.generated.models.text_markup_document import TextMarkupDocument
+    from src.client.generated.models.text_paragraph_node import TextParagraphNode
+    from src.client.generated.models.text_paragraph_node_marks_inner import TextParagraphNodeMarksInner
+    from src.client.generated.models.tr_scenario_step_dto import TrScenarioStepDto
+    from src.client.generated.models.tree_create_dto import TreeCreateDto
+    from src.client.generated.models.tree_custom_field_project_dto import TreeCustomFieldProjectDto
+    from src.client.generated.models.tree_dto import TreeDto
+    from src.client.generated.models.tree_dto_v2 import TreeDtoV2
+    from src.client.generated.models.tree_patch_dto import TreePatchDto
+    from src.client.generated.models.tree_path_create_dto import TreePathCreateDto
+    from src.client.generated.models.tree_path_dto import TreePathDto
+    from src.client.generated.models.tree_path_item_dto import TreePathItemDto
+    from src.client.generated.models.tree_selection_dto import TreeSelectionDto
+    from src.client.generated.models.underline_mark import UnderlineMark
+    from src.client.generated.models.upload_attachment_dto import UploadAttachmentDto
+    from src.client.generated.models.upload_fixtures_results_dto import UploadFixturesResultsDto
+    from src.client.generated.models.upload_label_dto import UploadLabelDto
+    from src.client.generated.models.upload_link_dto import UploadLinkDto
+    from src.client.generated.models.upload_parameter_dto import UploadParameterDto
+    from src.client.generated.models.upload_results_dto import UploadResultsDto
+    from src.client.generated.models.upload_results_response_dto import UploadResultsResponseDto
+    from src.client.generated.models.upload_test_case_dto import UploadTestCaseDto
+    from src.client.generated.models.upload_test_fixture_result_dto import UploadTestFixtureResultDto
+    from src.client.generated.models.upload_test_fixture_result_dto_steps_inner import UploadTestFixtureResultDtoStepsInner
+    from src.client.generated.models.upload_test_fixture_type import UploadTestFixtureType
+    from src.client.generated.models.upload_test_result_attachment_step_dto import UploadTestResultAttachmentStepDto
+    from src.client.generated.models.upload_test_result_body_step_dto import UploadTestResultBodyStepDto
+    from src.client.generated.models.upload_test_result_dto import UploadTestResultDto
+    from src.client.generated.models.upload_test_result_expected_body_step_dto import UploadTestResultExpectedBodyStepDto
+    from src.client.generated.models.upload_test_result_step_dto import UploadTestResultStepDto
+    from src.client.generated.models.upload_test_status import UploadTestStatus
+    from src.client.generated.models.webhook_create_dto import WebhookCreateDto
+    from src.client.generated.models.webhook_dto import WebhookDto
+    from src.client.generated.models.webhook_patch_dto import WebhookPatchDto
+    from src.client.generated.models.webhook_settings import WebhookSettings
+    from src.client.generated.models.webhook_subject import WebhookSubject
+    from src.client.generated.models.webhook_validate_dto import WebhookValidateDto
+    from src.client.generated.models.widget_create_dto import WidgetCreateDto
+    from src.client.generated.models.widget_create_dto_options import WidgetCreateDtoOptions
+    from src.client.generated.models.widget_data_dto import WidgetDataDto
+    from src.client.generated.models.widget_dto import WidgetDto
+    from src.client.generated.models.widget_options import WidgetOptions
+    from src.client.generated.models.widget_options_analytic_graph import WidgetOptionsAnalyticGraph
+    from src.client.generated.models.widget_options_having_settable_aql import WidgetOptionsHavingSettableAql
+    from src.client.generated.models.widget_options_last_launch_pie_chart import WidgetOptionsLastLaunchPieChart
+    from src.client.generated.models.widget_options_launch_list import WidgetOptionsLaunchList
+    from src.client.generated.models.widget_options_launch_trend import WidgetOptionsLaunchTrend
+    from src.client.generated.models.widget_options_markdown import WidgetOptionsMarkdown
+    from src.client.generated.models.widget_options_statistic_trend import WidgetOptionsStatisticTrend
+    from src.client.generated.models.widget_options_tc_pie_chart import WidgetOptionsTcPieChart
+    from src.client.generated.models.widget_options_tc_tree_map import WidgetOptionsTcTreeMap
+    from src.client.generated.models.widget_options_top_tc import WidgetOptionsTopTc
+    from src.client.generated.models.widget_options_trend import WidgetOptionsTrend
+    from src.client.generated.models.widget_options_trend_v2 import WidgetOptionsTrendV2
+    from src.client.generated.models.widget_patch_dto import WidgetPatchDto
+    from src.client.generated.models.widget_type_dto import WidgetTypeDto
+    from src.client.generated.models.workflow_create_dto import WorkflowCreateDto
+    from src.client.generated.models.workflow_dto import WorkflowDto
+    from src.client.generated.models.workflow_patch_dto import WorkflowPatchDto
+    from src.client.generated.models.workflow_row_dto import WorkflowRowDto
+    from src.client.generated.models.workflow_schema_create_dto import WorkflowSchemaCreateDto
+    from src.client.generated.models.workflow_schema_dto import WorkflowSchemaDto
+    from src.client.generated.models.workflow_schema_patch_dto import WorkflowSchemaPatchDto
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,268 @@
+"""Conditional-GET response cache for Allure TestOps read endpoints.
+
+Successful GET responses that carry an ``ETag`` or ``Last-Modified`` validator
+(or match an endpoint with a configured TTL) are kept in a byte-bounded LRU.
+Entries are served without a request while their TTL lasts and are otherwise
+revalidated with ``If-None-Match``/``If-Modified-Since``, so an unchanged
+resource costs a bodiless 304 instead of a full download.
+
+Cache keys include an auth scope (the API token fingerprint), so clients using
+different credentials never share entries. Any successful write in a scope
+demotes that scope's entries to revalidate-only, so a tool never reads back a
+TTL-cached copy of something it just changed.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.utils.metrics import CallbackMetric, LabelValues
+from src.utils.metrics import registry as metrics_registry
+
+from .generated.rest import RESTResponse
+
+type CacheKey = tuple[str, str]
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+
+@dataclass(frozen=True)
+class HttpCacheConfig:
+    """Size bounds and per-endpoint freshness for the response cache.
+
+    ``ttls`` maps API path prefixes to seconds during which a cached response is
+    served without revalidation; the longest matching prefix wins. Paths without
+    a TTL are always revalidated.
+    """
+
+    max_entries: int = 1024
+    max_bytes: int = 32 * 1024 * 1024
+    max_entry_bytes: int = 2 * 1024 * 1024
+    ttls: tuple[tuple[str, float], ...] = ()
+
+    def ttl_for(self, path: str) -> float:
+        best_prefix = ""
+        best_ttl = 0.0
+        for prefix, ttl in self.ttls:
+            if path.startswith(prefix) and len(prefix) > len(best_prefix):
+                best_prefix, best_ttl = prefix, ttl
+        return best_ttl
+
+
+@dataclass
+class HttpCacheStats:
+    """Counters describing how much upstream traffic the cache saved."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        served = self.hits + self.revalidated
+        total = served + self.misses
+        return served / total if total else 0.0
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: dict[str, str]
+    content: bytes
+    fresh_until: float
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(self.content)
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, url: str) -> RESTResponse:
+        response = httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", url),
+        )
+        return RESTResponse(response)
+
+
+def parse_cache_ttls(raw: str) -> tuple[tuple[str, float], ...]:
+    """Parse ``"/api/integration=300,/api/testlayer=60"`` into prefix/TTL pairs."""
+    ttls: list[tuple[str, float]] = []
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        prefix, separator, seconds = item.partition("=")
+        if not separator or not prefix.strip().startswith("/"):
+            raise ValueError(f"Invalid cache TTL entry '{item.strip()}'; expected '/api/path=seconds'")
+        ttls.append((prefix.strip(), float(seconds)))
+    return tuple(ttls)
+
+
+class HttpResponseCache:
+    """Byte-bounded LRU of GET responses keyed by auth scope and URL."""
+
+    def __init__(self, config: HttpCacheConfig | None = None) -> None:
+        self._config = config or HttpCacheConfig()
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self.stats = HttpCacheStats()
+
+    @property
+    def config(self) -> HttpCacheConfig:
+        return self._config
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, scope: str, url: str) -> CachedResponse | None:
+        entry = self._entries.get((scope, url))
+        if entry is not None:
+            self._entries.move_to_end((scope, url))
+        return entry
+
+    def record_hit(self) -> None:
+        self.stats.hits += 1
+
+    def record_miss(self) -> None:
+        self.stats.misses += 1
+
+    def revalidated(self, scope: str, url: str, entry: CachedResponse, response: httpx.Response) -> None:
+        """Refresh an entry after the server confirmed it with 304 Not Modified."""
+        self.stats.revalidated += 1
+        for name in ("etag", "last-modified"):
+            if name in response.headers:
+                entry.headers[name] = response.headers[name]
+        entry.fresh_until = time.time() + self._config.ttl_for(urlsplit(url).path)
+        if (scope, url) in self._entries:
+            self._entries.move_to_end((scope, url))
+
+    def store(self, scope: str, url: str, response: httpx.Response) -> None:
+        """Remember a 200 response if it carries validators or its endpoint has a TTL."""
+        ttl = self._config.ttl_for(urlsplit(url).path)
+        has_validators = "etag" in response.headers or "last-modified" in response.headers
+        if response.status_code != 200 or not (has_validators or ttl > 0):
+            return
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return
+        content = response.content
+        if len(content) > self._config.max_entry_bytes:
+            return
+
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        self._remove((scope, url))
+        entry = CachedResponse(status=200, headers=headers, content=content, fresh_until=time.time() + ttl)
+        self._entries[(scope, url)] = entry
+        self._bytes += entry.size
+        self.stats.stores += 1
+        self._evict_overflow()
+
+    def expire_scope(self, scope: str) -> None:
+        """Force revalidation of every entry in a scope, e.g. after a write."""
+        unvalidated: list[CacheKey] = []
+        for key, entry in self._entries.items():
+            if key[0] != scope:
+                continue
+            if entry.etag or entry.last_modified:
+                entry.fresh_until = 0.0
+            else:
+                # TTL-only entries cannot be revalidated, so drop them.
+                unvalidated.append(key)
+        for key in unvalidated:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict_overflow(self) -> None:
+        while self._entries and (len(self._entries) > self._config.max_entries or self._bytes > self._config.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
+
+
+_response_cache: HttpResponseCache | None = None
+
+
+def get_response_cache() -> HttpResponseCache | None:
+    """Return the process-wide response cache, if one was created."""
+    return _response_cache
+
+
+def shared_response_cache(config: HttpCacheConfig) -> HttpResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = HttpResponseCache(config)
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Drop the process-wide response cache (used by tests)."""
+    global _response_cache
+    _response_cache = None
+
+
+def _cache_request_counts() -> dict[LabelValues, float]:
+    if _response_cache is None:
+        return {}
+    stats = _response_cache.stats
+    return {("hit",): stats.hits, ("revalidated",): stats.revalidated, ("miss",): stats.misses}
+
+
+def _cache_hit_ratio() -> dict[LabelValues, float]:
+    return {(): _response_cache.stats.hit_rate} if _response_cache is not None else {}
+
+
+metrics_registry.register(
+    CallbackMetric(
+        "lucius_http_cache_requests_total",
+        "Cacheable GET requests by response cache result",
+        ("result",),
+        _cache_request_counts,
+        kind="counter",
+    )
+)
+metrics_registry.register(
+    CallbackMetric(
+        "lucius_http_cache_hit_ratio",
+        "Share of cacheable GET requests answered from the response cache",
+        (),
+        _cache_hit_ratio,
+    )
+)
@@ -0,0 +1,105 @@
+"""Async iteration over paginated Allure TestOps endpoints.
+
+TestOps list endpoints are zero-indexed and report ``total_pages`` with every
+page. ``iter_pages`` fetches page 0, reads the page count, and then fetches the
+remaining pages concurrently through a bounded window while still yielding them
+in page order. Closing the iterator with ``aclose()`` cancels the pages that are
+still in flight. A bare ``break`` out of ``async for`` does not close it: the
+pages keep running until the event loop finalizes the abandoned generator, so
+callers that may stop early iterate inside ``contextlib.aclosing(iter_pages(...))``.
+
+Endpoints that return a bare list, or a page without ``total_pages``, are walked
+one page at a time until a page comes back shorter than ``page_size``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+
+DEFAULT_PAGE_CONCURRENCY = 4
+
+type FetchPage[PageT] = Callable[[int], Awaitable[PageT]]
+
+
+def _page_items(page: object) -> Sequence[object]:
+    if isinstance(page, Sequence):
+        return page
+    content = getattr(page, "content", None)
+    return content if isinstance(content, Sequence) else []
+
+
+def _total_pages(page: object) -> int | None:
+    total = getattr(page, "total_pages", None)
+    return total if isinstance(total, int) and not isinstance(total, bool) else None
+
+
+async def iter_pages[PageT](
+    fetch_page: FetchPage[PageT],
+    *,
+    page_size: int | None = None,
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+) -> AsyncGenerator[PageT]:
+    """Yield every page of a paginated endpoint in order.
+
+    Args:
+        fetch_page: Coroutine function fetching the page with the given zero-based number.
+        page_size: Requested page size. Only used for endpoints that do not report
+            ``total_pages``, where a shorter page marks the end of the listing.
+        concurrency: Maximum number of pages fetched at the same time after page 0.
+
+    Yields:
+        Pages in page order. Errors raised while fetching a page are re-raised when
+        that page is reached, after the remaining in-flight pages are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    first = await fetch_page(0)
+    yield first
+
+    total_pages = _total_pages(first)
+    if total_pages is None:
+        page = first
+        page_number = 0
+        while page_size is not None and len(_page_items(page)) >= page_size > 0:
+            page_number += 1
+            page = await fetch_page(page_number)
+            if not _page_items(page):
+                return
+            yield page
+        return
+
+    pending: deque[asyncio.Task[PageT]] = deque()
+    next_page = 1
+    try:
+        while next_page < total_pages or pending:
+            while next_page < total_pages and len(pending) < concurrency:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def iter_page_items[PageT, ItemT](
+    fetch_page: FetchPage[PageT],
+    items: Callable[[PageT], Sequence[ItemT] | None],
+    *,
+    page_size: int | None = None,
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+) -> AsyncGenerator[ItemT]:
+    """Yield the items of every page in order; see ``iter_pages`` for the paging rules.
+
+    ``items`` extracts the items from a page, for example ``lambda page: page.content``.
+    """
+    pages = iter_pages(fetch_page, page_size=page_size, concurrency=concurrency)
+    try:
+        async for page in pages:
+            for item in items(page) or ():
+                yield item
+    finally:
+        await pages.aclose()
@@ -0,0 +1,164 @@
+"""Client-side rate limiting and retry backoff for Allure TestOps requests.
+
+Every TestOps endpoint gets one adaptive token bucket shared by all clients in
+the process. By default the bucket does not limit anything until the server
+first throttles (429/503); it then starts at half the rate requests were being
+sent at. From there it halves the rate on every throttled response and creeps
+back up on successful ones, so bulk tools settle at the highest rate the server
+accepts. A configured rate is a ceiling that applies from the first request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Token-bucket settings for one TestOps endpoint.
+
+    ``rate`` is an opt-in ceiling in requests per second; ``0`` means no ceiling,
+    so requests are only limited after the server throttles them.
+    """
+
+    rate: float = 0.0
+    burst: int = 50
+    min_rate: float = 1.0
+    recovery_per_success: float = 0.5
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry budget and backoff for throttled or temporarily unavailable responses.
+
+    429 responses are retried for every method because the server rejected the
+    request without processing it; 502/503/504 are retried only for idempotent
+    methods.
+    """
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+
+    def should_retry(self, method: str, status: int, attempt: int) -> bool:
+        if attempt >= self.max_attempts or status not in self.retry_statuses:
+            return False
+        return status == 429 or method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before retry ``attempt`` (1-based), honouring ``Retry-After``."""
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            # Small jitter so clients told the same deadline do not retry in lockstep.
+            return min(requested, self.backoff_max) + random.uniform(0, self.backoff_base)  # noqa: S311
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if value is None or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate adapts to server throttling (AIMD)."""
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        self._config = config
+        self._rate = config.rate
+        self._tokens = float(config.burst)
+        self._updated_at = time.monotonic()
+        # Send times within the last second while not limiting, to pick a rate on the first throttle.
+        self._recent: deque[float] = deque()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second; ``0`` while requests are not limited."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self._rate <= 0:
+            self._record_send()
+            return
+        # Reserve a token up front; a negative balance is the queue of waiters
+        # ahead of us, so each caller sleeps until its own slot comes due.
+        self._refill()
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+    def on_success(self) -> None:
+        if self._rate <= 0:
+            return
+        ceiling = self._config.rate or math.inf
+        self._rate = min(ceiling, self._rate + self._config.recovery_per_success)
+
+    def on_throttle(self) -> None:
+        self._refill()
+        current = self._rate if self._rate > 0 else self._observed_rate()
+        self._rate = max(self._config.min_rate, current / 2)
+        self._tokens = min(self._tokens, 0.0)
+        self._recent.clear()
+
+    def _record_send(self) -> None:
+        now = time.monotonic()
+        self._recent.append(now)
+        while now - self._recent[0] > 1.0:
+            self._recent.popleft()
+
+    def _observed_rate(self) -> float:
+        now = time.monotonic()
+        return float(sum(1 for sent_at in self._recent if now - sent_at <= 1.0))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        capacity = max(1.0, float(self._config.burst))
+        self._tokens = min(capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+_buckets: dict[str, AdaptiveTokenBucket] = {}
+
+
+def endpoint_key(url: str) -> str:
+    """Return the rate-limit scope (scheme and host) for a TestOps URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_endpoint_limiter(url: str, config: RateLimitConfig) -> AdaptiveTokenBucket:
+    """Return the process-wide token bucket for the endpoint serving ``url``."""
+    key = endpoint_key(url)
+    bucket = _buckets.get(key)
+    if bucket is None:
+        bucket = AdaptiveTokenBucket(config)
+        _buckets[key] = bucket
+    return bucket
+
+
+def reset_endpoint_limiters() -> None:
+    """Forget all endpoint buckets (used by tests)."""
+    _buckets.clear()
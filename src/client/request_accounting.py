@@ -0,0 +1,67 @@
+"""Per-operation accounting of Allure TestOps API requests.
+
+Every request the generated client issues through ``AllureRESTClient`` is
+reported to the ledgers opened with ``count_requests``. Ledgers live in a
+context variable, so a ledger opened around a tool call also sees requests
+made from tasks the tool starts (such as concurrently fetched pages), and
+nested ledgers each see the requests made inside them.
+
+Counts are logical requests: transport retries, 401 replays, token exchanges,
+and cache or coalescing hits do not change them, which keeps the numbers
+stable enough to assert on. Requests are keyed by method and path with numeric
+segments folded, e.g. ``GET /api/testcase/{id}/scenario``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+_ledgers: ContextVar[tuple[RequestLedger, ...]] = ContextVar("allure_request_ledgers", default=())
+
+
+@dataclass
+class RequestLedger:
+    """Requests made inside a ``count_requests`` block, keyed by method and path template."""
+
+    calls: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return self.calls.total()
+
+    def summary(self) -> str:
+        """Render the requests as ``route xN`` pairs, most frequent first."""
+        return ", ".join(f"{route} x{count}" for route, count in self.calls.most_common())
+
+
+@contextlib.contextmanager
+def count_requests() -> Iterator[RequestLedger]:
+    """Count the requests made inside the block, in addition to any enclosing ledger."""
+    ledger = RequestLedger()
+    reset_token = _ledgers.set((*_ledgers.get(), ledger))
+    try:
+        yield ledger
+    finally:
+        _ledgers.reset(reset_token)
+
+
+def route_template(method: str, path: str) -> str:
+    """Return ``METHOD /path`` with numeric path segments replaced by ``{id}``."""
+    return f"{method.upper()} {_NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+def record_request(method: str, path: str) -> None:
+    """Add one request to every open ledger."""
+    ledgers = _ledgers.get()
+    if not ledgers:
+        return
+    route = route_template(method, path)
+    for ledger in ledgers:
+        ledger.calls[route] += 1
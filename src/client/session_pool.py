@@ -0,0 +1,159 @@
+"""Process-wide pool of authenticated Allure TestOps sessions.
+
+Tools open a short-lived ``AllureClient`` per call. While a pool is active, those
+clients attach to a long-lived :class:`AllureSession` keyed by endpoint and token
+fingerprint instead of exchanging the API token and opening a fresh connection
+pool on every call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from pydantic import SecretStr
+
+from src.utils.logger import get_logger
+
+from .generated.api_client import ApiClient
+
+logger = get_logger(__name__)
+
+type SessionKey = tuple[str, str]
+
+DEFAULT_MAX_SESSIONS = 16
+
+
+def token_fingerprint(token: SecretStr) -> str:
+    """Return a stable, non-reversible identifier for an API token."""
+    return hashlib.sha256(token.get_secret_value().encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class AllureSession:
+    """Authenticated transport state that can outlive a single AllureClient."""
+
+    base_url: str
+    pooled: bool = False
+    api_client: ApiClient | None = None
+    jwt_token: str | None = None
+    token_expires_at: float | None = None
+    token_renew_at: float | None = None
+    csrf_token: str | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    renewal_task: asyncio.Task[None] | None = field(default=None, repr=False)
+    leases: int = 0
+    evicted: bool = False
+
+    def cancel_renewal(self) -> None:
+        """Cancel a pending background token renewal, if any."""
+        task, self.renewal_task = self.renewal_task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def close(self) -> None:
+        """Drop the cached token and close the underlying connection pool."""
+        self.cancel_renewal()
+        api_client, self.api_client = self.api_client, None
+        self.jwt_token = None
+        self.token_expires_at = None
+        self.token_renew_at = None
+        self.csrf_token = None
+        if api_client is not None:
+            await api_client.close()  # type: ignore[no-untyped-call]
+
+
+class AllureSessionPool:
+    """Registry of shared sessions, entered for the lifetime of the server.
+
+    Example:
+        ```python
+        async with AllureSessionPool():
+            async with AllureClient.from_env() as client:
+                ...  # reuses the pooled session on subsequent calls
+        ```
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS) -> None:
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be a positive integer")
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[SessionKey, AllureSession] = OrderedDict()
+
+    @staticmethod
+    def session_key(base_url: str, token: SecretStr) -> SessionKey:
+        return (base_url.rstrip("/"), token_fingerprint(token))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def acquire(self, base_url: str, token: SecretStr) -> AllureSession:
+        """Lease the shared session for an endpoint and token, creating it on first use."""
+        key = self.session_key(base_url, token)
+        session = self._sessions.get(key)
+        if session is None:
+            session = AllureSession(base_url=key[0], pooled=True)
+            self._sessions[key] = session
+        else:
+            self._sessions.move_to_end(key)
+        session.leases += 1
+        await self._evict_overflow()
+        return session
+
+    async def release(self, session: AllureSession) -> None:
+        """Return a leased session; evicted sessions close once their last lease ends."""
+        session.leases = max(0, session.leases - 1)
+        if session.evicted and session.leases == 0:
+            await session.close()
+
+    async def discard(self, base_url: str, token: SecretStr) -> None:
+        """Forget the session for an endpoint and token, e.g. after the token was revoked."""
+        session = self._sessions.pop(self.session_key(base_url, token), None)
+        if session is None:
+            return
+        session.evicted = True
+        if session.leases == 0:
+            await session.close()
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            session.evicted = True
+            try:
+                await session.close()
+            except Exception as exc:
+                logger.warning("Failed to close pooled Allure session for %s: %s", session.base_url, exc)
+
+    async def _evict_overflow(self) -> None:
+        while len(self._sessions) > self._max_sessions:
+            _, oldest = self._sessions.popitem(last=False)
+            oldest.evicted = True
+            if oldest.leases == 0:
+                await oldest.close()
+
+    async def __aenter__(self) -> AllureSessionPool:
+        set_session_pool(self)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        if get_session_pool() is self:
+            set_session_pool(None)
+        await self.close()
+
+
+_session_pool: AllureSessionPool | None = None
+
+
+def get_session_pool() -> AllureSessionPool | None:
+    """Return the active process-wide session pool, if any."""
+    return _session_pool
+
+
+def set_session_pool(pool: AllureSessionPool | None) -> None:
+    """Install (or clear) the process-wide session pool used by AllureClient."""
+    global _session_pool
+    _session_pool = pool
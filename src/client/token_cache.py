@@ -0,0 +1,55 @@
+"""Pluggable cache of exchanged JWTs, shared across AllureClient instances.
+
+Short-lived processes such as the ``lucius`` CLI install a persistent cache so that
+consecutive runs reuse a still-valid JWT instead of paying a token exchange each
+time. The server keeps JWTs in its session pool and does not install a cache.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+
+from pydantic import SecretStr
+
+# Cached JWTs closer than this to their refresh deadline are exchanged anew.
+TOKEN_CACHE_MIN_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """An exchanged JWT and the time after which it must be refreshed."""
+
+    jwt_token: str
+    expires_at: float
+    csrf_token: str | None = None
+
+
+class TokenCache(Protocol):
+    """Storage for exchanged JWTs keyed by endpoint and API token."""
+
+    def load(self, base_url: str, token: SecretStr) -> CachedToken | None:
+        """Return the cached JWT for an endpoint and API token, if any."""
+        ...
+
+    def store(self, base_url: str, token: SecretStr, cached: CachedToken) -> None:
+        """Remember a freshly exchanged JWT."""
+        ...
+
+    def discard(self, base_url: str, token: SecretStr) -> None:
+        """Forget the cached JWT, e.g. after the server rejected it."""
+        ...
+
+
+_token_cache: TokenCache | None = None
+
+
+def get_token_cache() -> TokenCache | None:
+    """Return the active process-wide JWT cache, if any."""
+    return _token_cache
+
+
+def set_token_cache(cache: TokenCache | None) -> None:
+    """Install (or clear) the process-wide JWT cache used by AllureClient."""
+    global _token_cache
+    _token_cache = cache
@@ -0,0 +1,388 @@
+"""HTTP transport used by the generated Allure TestOps client."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import httpx
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+
+from src.utils.deadline import cap_timeout, remaining_time
+from src.utils.logger import get_logger
+from src.utils.tracing import span, tracing_enabled
+
+from .coalesce import get_request_coalescer
+from .generated.configuration import Configuration
+from .generated.rest import RESTClientObject, RESTResponse
+from .http_cache import HttpCacheConfig, HttpResponseCache, parse_cache_ttls, shared_response_cache
+from .rate_limit import THROTTLE_STATUSES, RateLimitConfig, RetryPolicy, get_endpoint_limiter
+from .request_accounting import record_request
+
+if TYPE_CHECKING:
+    from src.utils.config import Settings
+
+logger = get_logger(__name__)
+
+type ReauthenticateHook = Callable[[str | None], Awaitable[str | None]]
+
+_BEARER_PREFIX = "Bearer "
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Set while the client downloads attachment content; uploads are detected from the request itself.
+_transfer_requested: ContextVar[bool] = ContextVar("allure_transfer_requested", default=False)
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    """Per-phase HTTP timeouts in seconds."""
+
+    connect: float = 10.0
+    read: float = 30.0
+    write: float = 30.0
+    pool: float = 10.0
+
+    def to_httpx(self, *, connect: float | None = None, read: float | None = None) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect if connect is None else connect,
+            read=self.read if read is None else read,
+            write=self.write,
+            pool=self.pool,
+        )
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pooling, protocol, timeout, retry, and caching settings for Allure TestOps requests.
+
+    ``timeouts`` applies to regular API calls; ``transfer_timeouts`` applies to
+    multipart uploads and attachment downloads, which move far more data.
+    ``cache`` configures the conditional-GET response cache (``None`` disables it);
+    ``coalesce_gets`` lets concurrent identical GETs share one upstream request.
+    """
+
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeouts: TimeoutProfile = field(default_factory=TimeoutProfile)
+    transfer_timeouts: TimeoutProfile = field(
+        default_factory=lambda: TimeoutProfile(connect=10.0, read=300.0, write=300.0, pool=30.0)
+    )
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    cache: HttpCacheConfig | None = field(default_factory=HttpCacheConfig)
+    coalesce_gets: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TransportConfig:
+        return cls(
+            http2=settings.ALLURE_HTTP2,
+            max_connections=settings.ALLURE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.ALLURE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.ALLURE_HTTP_KEEPALIVE_EXPIRY,
+            timeouts=TimeoutProfile(
+                connect=settings.ALLURE_HTTP_CONNECT_TIMEOUT,
+                read=settings.ALLURE_HTTP_READ_TIMEOUT,
+                write=settings.ALLURE_HTTP_WRITE_TIMEOUT,
+                pool=settings.ALLURE_HTTP_POOL_TIMEOUT,
+            ),
+            transfer_timeouts=TimeoutProfile(
+                connect=settings.ALLURE_HTTP_CONNECT_TIMEOUT,
+                read=settings.ALLURE_HTTP_TRANSFER_TIMEOUT,
+                write=settings.ALLURE_HTTP_TRANSFER_TIMEOUT,
+                pool=settings.ALLURE_HTTP_POOL_TIMEOUT,
+            ),
+            rate_limit=RateLimitConfig(rate=settings.ALLURE_RATE_LIMIT_RPS, burst=settings.ALLURE_RATE_LIMIT_BURST),
+            retry=RetryPolicy(
+                max_attempts=settings.ALLURE_RETRY_MAX_ATTEMPTS,
+                backoff_base=settings.ALLURE_RETRY_BACKOFF_BASE,
+                backoff_max=settings.ALLURE_RETRY_BACKOFF_MAX,
+            ),
+            cache=(
+                HttpCacheConfig(
+                    max_entries=settings.ALLURE_HTTP_CACHE_MAX_ENTRIES,
+                    max_bytes=settings.ALLURE_HTTP_CACHE_MAX_BYTES,
+                    ttls=parse_cache_ttls(settings.ALLURE_HTTP_CACHE_TTLS),
+                )
+                if settings.ALLURE_HTTP_CACHE_ENABLED
+                else None
+            ),
+            coalesce_gets=settings.ALLURE_HTTP_COALESCE_GETS,
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def http2_available() -> bool:
+    """Return whether the ``h2`` package needed for HTTP/2 (the ``http2`` extra) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@contextlib.contextmanager
+def use_transfer_timeouts() -> Iterator[None]:
+    """Apply the transfer timeout profile to requests made inside the block."""
+    reset_token = _transfer_requested.set(True)
+    try:
+        yield
+    finally:
+        _transfer_requested.reset(reset_token)
+
+
+def _bearer_token(headers: dict[str, str]) -> str | None:
+    authorization = headers.get("Authorization")
+    if authorization is None or not authorization.startswith(_BEARER_PREFIX):
+        return None
+    return authorization.removeprefix(_BEARER_PREFIX)
+
+
+def _is_upload(headers: dict[str, str]) -> bool:
+    return headers.get("Content-Type", "").startswith("multipart/")
+
+
+def _within_deadline(timeout: httpx.Timeout) -> httpx.Timeout:
+    """Cap every timeout phase at the time left before the tool deadline."""
+    if remaining_time() is None:
+        return timeout
+    return httpx.Timeout(
+        connect=cap_timeout(timeout.connect),
+        read=cap_timeout(timeout.read),
+        write=cap_timeout(timeout.write),
+        pool=cap_timeout(timeout.pool),
+    )
+
+
+class AllureRESTClient(RESTClientObject):
+    """REST transport with pooling, timeouts, rate limiting, and retries for Allure TestOps.
+
+    Regular calls pass a scalar ``_request_timeout`` (the client's read timeout);
+    connect, write, and pool timeouts come from the configured profile. Uploads
+    and downloads use the transfer profile instead.
+
+    Requests wait on the endpoint's shared token bucket. Throttled (429) and
+    temporarily unavailable (502/503/504) responses are retried with jittered
+    backoff that honours ``Retry-After``, as allowed by the retry policy.
+    Inside a tool deadline, timeouts are capped at the remaining budget and a
+    retry that would sleep past the deadline is not attempted.
+
+    With a ``cache_scope`` (the API token fingerprint), regular GETs go through the
+    process-wide conditional-GET cache and successful writes expire the scope.
+    Concurrent identical GETs in the same auth scope are coalesced into a single
+    upstream request whose response each caller receives a copy of.
+
+    Each request is reported once to the open request ledgers (see
+    ``request_accounting``) before any cache lookup, coalescing, or retry.
+
+    When a bearer-authenticated request is answered with 401, ``on_unauthorized``
+    is awaited with the rejected JWT and must return a replacement (or ``None`` to
+    give up). The request is then replayed once with the new token.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        *,
+        transport: TransportConfig | None = None,
+        on_unauthorized: ReauthenticateHook | None = None,
+        cache_scope: str | None = None,
+    ) -> None:
+        super().__init__(configuration)
+        self._transport = transport or TransportConfig()
+        self._on_unauthorized = on_unauthorized
+        self._cache_scope = cache_scope or ""
+        self._cache: HttpResponseCache | None = None
+        if cache_scope and self._transport.cache is not None:
+            self._cache = shared_response_cache(self._transport.cache)
+        self._limiter = get_endpoint_limiter(configuration.host, self._transport.rate_limit)
+        self._sleep = asyncio.sleep
+
+    @property
+    def transport(self) -> TransportConfig:
+        return self._transport
+
+    def resolve_timeout(self, request_timeout: Any, *, transfer: bool = False) -> httpx.Timeout:
+        """Map a generated-client ``_request_timeout`` onto a per-phase ``httpx.Timeout``."""
+        if transfer:
+            return self._transport.transfer_timeouts.to_httpx()
+        profile = self._transport.timeouts
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+            return profile.to_httpx(connect=connect_timeout, read=read_timeout)
+        if isinstance(request_timeout, int | float):
+            return profile.to_httpx(read=request_timeout)
+        return profile.to_httpx()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> RESTResponse:
+        method = method.upper()
+        parts = urlsplit(url)
+        record_request(method, parts.path)
+        if not tracing_enabled():
+            return await self._dispatch(method, url, headers, body, post_params, _request_timeout)
+
+        attributes = {"http.request.method": method, "server.address": parts.hostname or "", "url.path": parts.path}
+        with span(f"HTTP {method}", kind=SpanKind.CLIENT, attributes=attributes) as current:
+            response = await self._dispatch(method, url, headers, body, post_params, _request_timeout)
+            if current is not None:
+                current.set_attribute("http.response.status_code", response.status)
+            return response
+
+    async def _dispatch(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        body: Any,
+        post_params: Any,
+        request_timeout: Any,
+    ) -> RESTResponse:
+        # The base implementation mutates headers (e.g. drops the multipart
+        # Content-Type), so keep a pristine copy for a possible replay.
+        original_headers = dict(headers or {})
+        transfer = _transfer_requested.get() or _is_upload(original_headers)
+        timeout = self.resolve_timeout(request_timeout, transfer=transfer)
+
+        if method != "GET" or transfer:
+            response = await self._request_with_reauth(method, url, original_headers, body, post_params, timeout)
+            if self._cache is not None and method not in _SAFE_METHODS and response.status < 400:
+                self._cache.expire_scope(self._cache_scope)
+            return response
+
+        if not self._transport.coalesce_gets:
+            return await self._get(url, original_headers, timeout)
+
+        async def _fetch() -> httpx.Response:
+            fetched: httpx.Response = (await self._get(url, original_headers, timeout)).response
+            return fetched
+
+        scope = self._cache_scope or _bearer_token(original_headers) or ""
+        shared = await get_request_coalescer().run(scope, method, url, _fetch)
+        return RESTResponse(shared)
+
+    async def _get(self, url: str, headers: dict[str, str], timeout: httpx.Timeout) -> RESTResponse:
+        cache = self._cache
+        if cache is None:
+            return await self._request_with_reauth("GET", url, headers, None, None, timeout)
+
+        cached = cache.lookup(self._cache_scope, url)
+        if cached is not None and cached.is_fresh(time.time()):
+            cache.record_hit()
+            return cached.to_response(url)
+        if cached is not None:
+            headers = {**headers, **cached.validator_headers()}
+
+        response = await self._request_with_reauth("GET", url, headers, None, None, timeout)
+        if response.status == 304 and cached is not None:
+            await response.response.aclose()
+            cache.revalidated(self._cache_scope, url, cached, response.response)
+            return cached.to_response(url)
+        cache.record_miss()
+        cache.store(self._cache_scope, url, response.response)
+        return response
+
+    async def _request_with_reauth(
+        self,
+        method: str,
+        url: str,
+        original_headers: dict[str, str],
+        body: Any,
+        post_params: Any,
+        timeout: httpx.Timeout,
+    ) -> RESTResponse:
+        response = await self._send(method, url, original_headers, body, post_params, timeout)
+        if response.status != 401 or self._on_unauthorized is None:
+            return response
+
+        rejected = _bearer_token(original_headers)
+        if rejected is None:
+            return response
+        replacement = await self._on_unauthorized(rejected)
+        if replacement is None or replacement == rejected:
+            return response
+
+        await response.response.aclose()
+        retry_headers = {**original_headers, "Authorization": f"{_BEARER_PREFIX}{replacement}"}
+        return await self._send(method, url, retry_headers, body, post_params, timeout)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: Any,
+        post_params: Any,
+        timeout: httpx.Timeout,
+    ) -> RESTResponse:
+        retry = self._transport.retry
+        attempt = 1
+        while True:
+            await self._limiter.acquire()
+            response: RESTResponse = await super().request(  # type: ignore[no-untyped-call]
+                method, url, dict(headers), body, post_params, _within_deadline(timeout)
+            )
+            if response.status in THROTTLE_STATUSES:
+                self._limiter.on_throttle()
+            elif response.status < 500:
+                self._limiter.on_success()
+            if not retry.should_retry(method, response.status, attempt):
+                return response
+
+            delay = retry.delay(attempt, response.getheader("Retry-After"))  # type: ignore[no-untyped-call]
+            budget = remaining_time()
+            if budget is not None and delay >= budget:
+                # The retry could not finish before the tool deadline; surface this response instead.
+                return response
+            logger.info(
+                "Allure TestOps answered %s %s with %s; retrying in %.2fs (attempt %s of %s)",
+                method.upper(),
+                url,
+                response.status,
+                delay,
+                attempt + 1,
+                retry.max_attempts,
+            )
+            trace.get_current_span().add_event(
+                "retry", {"http.response.status_code": response.status, "retry.delay_seconds": delay}
+            )
+            await response.response.aclose()
+            await self._sleep(delay)
+            attempt += 1
+
+    def _create_pool_manager(self) -> httpx.AsyncClient:
+        http2 = self._transport.http2
+        if http2 and not http2_available():
+            logger.warning(
+                "HTTP/2 requested for Allure TestOps but the 'h2' package is not installed; using HTTP/1.1. "
+                "Install the 'http2' extra: pip install 'lucius-mcp[http2]'"
+            )
+            http2 = False
+
+        proxy = httpx.Proxy(url=self.proxy, headers=self.proxy_headers) if self.proxy else None
+        return httpx.AsyncClient(
+            limits=self._transport.limits(),
+            timeout=self._transport.timeouts.to_httpx(),
+            http2=http2,
+            proxy=proxy,
+            verify=self.ssl_context,
+            trust_env=True,
+        )
@@ -5,16 +5,31 @@ import typing
 
 from fastmcp import FastMCP
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Mount, Route
 
+from src.client import AllureClient
+from src.client.session_pool import AllureSessionPool
+from src.services.search_index import SearchIndexRefresher, get_test_case_index, reset_test_case_indexes
 from src.services.telemetry_service import TelemetryService
+from src.services.warmup_service import WarmupService
 from src.tools import all_tools
-from src.tools.annotations import get_tool_annotations, get_tool_tags, validate_tool_annotation_coverage
+from src.tools.annotations import (
+    get_tool_annotations,
+    get_tool_tags,
+    uses_default_deadline,
+    validate_tool_annotation_coverage,
+)
 from src.tools.output_schemas import output_model_for, output_schema_for, validate_registry_coverage
 from src.utils.config import settings
+from src.utils.deadline import deadline_scope
 from src.utils.error import agent_hint_handler
 from src.utils.logger import configure_logging, get_logger
+from src.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from src.utils.metrics import render_metrics
 from src.utils.telemetry import set_telemetry_service, wrap_tool_with_telemetry
+from src.utils.tracing import configure_tracing, shutdown_tracing
 from src.version import __version__
 
 # Configure logging early
@@ -40,7 +55,13 @@ for tool in all_tools:
         tags=get_tool_tags(tool.__name__),
         annotations=get_tool_annotations(tool.__name__),
         output_schema=output_schema_for(tool.__name__),
-    )(wrap_tool_with_telemetry(tool, output_model=output_model_for(tool.__name__)))
+    )(
+        wrap_tool_with_telemetry(
+            tool,
+            output_model=output_model_for(tool.__name__),
+            default_deadline=uses_default_deadline(tool.__name__),
+        )
+    )
 
 # The ASGI app and main app are created lazily or only when needed for HTTP mode
 _mcp_asgi = None
@@ -53,6 +74,91 @@ def get_mcp_asgi() -> Starlette:
     return _mcp_asgi
 
 
+@contextlib.contextmanager
+def tracing_scope() -> typing.Iterator[None]:
+    """Export spans for the lifetime of the server when tracing is enabled."""
+    configure_tracing(enabled=settings.TRACING_ENABLED, otlp_endpoint=settings.TRACING_OTLP_ENDPOINT)
+    try:
+        yield
+    finally:
+        shutdown_tracing()
+
+
+def session_pool_scope() -> contextlib.AbstractAsyncContextManager[AllureSessionPool | None]:
+    """Return the process-wide Allure session pool context, or a no-op when disabled."""
+    if not settings.ALLURE_SESSION_POOL_ENABLED:
+        return contextlib.nullcontext()
+    return AllureSessionPool(max_sessions=settings.ALLURE_SESSION_POOL_MAX_SESSIONS)
+
+
+async def warm_up() -> None:
+    """Authenticate and prefetch the default project's metadata; failures are logged, never raised."""
+    try:
+        with deadline_scope(settings.TOOL_DEADLINE_SECONDS or None):
+            async with AllureClient.from_env() as client:
+                warmed = await WarmupService(client).warm_up()
+    except (KeyError, ValueError) as e:
+        logger.info(f"Skipping startup warm-up: {e}")
+    except Exception as e:
+        logger.warning(f"Startup warm-up failed: {e}")
+    else:
+        logger.info(f"Startup warm-up finished: {', '.join(warmed) or 'nothing prefetched'}")
+
+
+@contextlib.asynccontextmanager
+async def warmup_scope() -> typing.AsyncGenerator[None]:
+    """Run the startup warm-up in the background, so it never delays the MCP handshake."""
+    if not settings.STARTUP_WARMUP_ENABLED:
+        yield
+        return
+    task = asyncio.create_task(warm_up(), name="lucius-startup-warmup")
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def refresh_search_index() -> None:
+    """Build or refresh the default project's local search index; failures are logged, never raised."""
+    try:
+        async with AllureClient.from_env() as client:
+            index = get_test_case_index(client.get_base_url(), client.get_project(), client.get_auth_scope())
+            if index is None:
+                return
+            refresher = SearchIndexRefresher(client, index, custom_fields=settings.SEARCH_INDEX_CUSTOM_FIELDS)
+            indexed = await refresher.refresh()
+    except (KeyError, ValueError) as e:
+        logger.info(f"Skipping search index refresh: {e}")
+    except Exception as e:
+        logger.warning(f"Search index refresh failed: {e}")
+    else:
+        logger.info(f"Search index refreshed: {indexed} test cases written")
+
+
+@contextlib.asynccontextmanager
+async def search_index_scope() -> typing.AsyncGenerator[None]:
+    """Keep the local search index current in the background while the server runs."""
+    if not settings.SEARCH_INDEX_ENABLED:
+        yield
+        return
+
+    async def refresh_periodically() -> None:
+        while True:
+            await refresh_search_index()
+            await asyncio.sleep(settings.SEARCH_INDEX_REFRESH_SECONDS)
+
+    task = asyncio.create_task(refresh_periodically(), name="lucius-search-index")
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        reset_test_case_indexes()
+
+
 @contextlib.asynccontextmanager
 async def lifespan(app: Starlette) -> typing.AsyncGenerator[None]:
     """
@@ -63,26 +169,35 @@ async def lifespan(app: Starlette) -> typing.AsyncGenerator[None]:
     telemetry_service.emit_startup_event()
     logger.info(f"Starting Lucius MCP Server in {settings.MCP_MODE} mode")
     mcp_asgi = get_mcp_asgi()
-    # Ensure MCP task group is initialized by entering its lifespan
-    if hasattr(mcp_asgi, "lifespan"):
-        async with mcp_asgi.lifespan(app):
-            yield
-    else:
-        yield
+    with tracing_scope():
+        async with session_pool_scope(), warmup_scope(), search_index_scope():
+            # Ensure MCP task group is initialized by entering its lifespan
+            if hasattr(mcp_asgi, "lifespan"):
+                async with mcp_asgi.lifespan(app):
+                    yield
+            else:
+                yield
     logger.info("Shutting down Lucius MCP Server")
 
 
+async def metrics(request: Request) -> Response:
+    """Serve Prometheus metrics for scraping."""
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 # Create main Starlette application lazily
 def get_app() -> Starlette | None:
     if settings.MCP_MODE == "http":
+        routes: list[BaseRoute] = []
+        if settings.METRICS_ENABLED:
+            routes.append(Route("/metrics", metrics, methods=["GET"]))
+        # Mount the FastMCP ASGI app under /
+        routes.append(Mount("/", app=get_mcp_asgi()))
         return Starlette(
             debug=False,
             lifespan=lifespan,
             exception_handlers={Exception: agent_hint_handler},
-            routes=[
-                # Mount the FastMCP ASGI app under /
-                Mount("/", app=get_mcp_asgi())
-            ],
+            routes=routes,
         )
     else:
         return None
@@ -95,7 +210,9 @@ app = get_app()
 async def _run_stdio() -> None:
     telemetry_service.log_status()
     telemetry_service.emit_startup_event()
-    await mcp.run_stdio_async(show_banner=False, log_level=settings.LOG_LEVEL)
+    with tracing_scope():
+        async with session_pool_scope(), warmup_scope(), search_index_scope():
+            await mcp.run_stdio_async(show_banner=False, log_level=settings.LOG_LEVEL)
 
 
 def start() -> None:
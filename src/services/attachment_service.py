@@ -1,7 +1,9 @@
 """Service for handling attachments."""
 
+import asyncio
 import base64
 import binascii
+from collections.abc import Sequence
 
 import httpx
 
@@ -11,6 +13,7 @@ from src.client.generated.models import TestCaseAttachmentRowDto
 
 # Default limits
 MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024  # 10MB
+ATTACHMENT_UPLOAD_CONCURRENCY = 8
 ALLOWED_MIME_TYPES = {
     "image/png",
     "image/jpeg",
@@ -76,6 +79,36 @@ class AttachmentService:
         # Return the first (and only) attachment
         return results[0]
 
+    async def upload_attachments(
+        self, test_case_id: int, attachments: Sequence[dict[str, str]]
+    ) -> list[TestCaseAttachmentRowDto]:
+        """Upload several attachments concurrently, up to ``ATTACHMENT_UPLOAD_CONCURRENCY`` at a time.
+
+        Args:
+            test_case_id: Test case ID to attach the files to.
+            attachments: Attachment data dictionaries, as for ``upload_attachment``.
+
+        Returns:
+            The uploaded attachment info, in the order of ``attachments``.
+
+        Raises:
+            AllureValidationError: If any attachment is invalid or fails to upload; the
+                first failure in ``attachments`` order is raised once all uploads finish.
+        """
+        semaphore = asyncio.Semaphore(ATTACHMENT_UPLOAD_CONCURRENCY)
+
+        async def _upload(data: dict[str, str]) -> TestCaseAttachmentRowDto:
+            async with semaphore:
+                return await self.upload_attachment(test_case_id, data)
+
+        outcomes = await asyncio.gather(*(_upload(data) for data in attachments), return_exceptions=True)
+        rows: list[TestCaseAttachmentRowDto] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            rows.append(outcome)
+        return rows
+
     async def _retrieve_content(self, data: dict[str, str]) -> bytes:
         """Retrieve content from base64 string or URL."""
         content_b64 = data.get("content")
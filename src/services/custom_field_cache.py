@@ -0,0 +1,48 @@
+"""Process-wide cache of resolved custom fields per TestOps endpoint and project.
+
+Entries are fresh for ``CUSTOM_FIELD_CACHE_TTL_SECONDS`` and are then served for
+``CUSTOM_FIELD_CACHE_STALE_SECONDS`` more while they reload in the background.
+Writes to custom fields or their values invalidate the entry of their project.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.services.metadata_cache import StaleWhileRevalidateCache
+from src.utils.config import settings
+
+if TYPE_CHECKING:
+    from src.services.test_case_service import ResolvedCustomFieldInfo
+
+type CacheKey = tuple[str, int]
+
+_resolved_custom_fields: StaleWhileRevalidateCache[CacheKey, dict[str, ResolvedCustomFieldInfo]] | None = None
+
+
+def resolved_custom_field_cache() -> StaleWhileRevalidateCache[CacheKey, dict[str, ResolvedCustomFieldInfo]]:
+    """Return the process-wide resolved custom field cache, creating it on first use."""
+    global _resolved_custom_fields
+    if _resolved_custom_fields is None:
+        _resolved_custom_fields = StaleWhileRevalidateCache(
+            "custom fields", settings.CUSTOM_FIELD_CACHE_TTL_SECONDS, settings.CUSTOM_FIELD_CACHE_STALE_SECONDS
+        )
+    return _resolved_custom_fields
+
+
+def resolved_custom_fields_key(base_url: str, project_id: int) -> CacheKey:
+    return (base_url.rstrip("/"), project_id)
+
+
+def invalidate_resolved_custom_fields(base_url: str, project_id: int) -> None:
+    """Drop the cached custom fields of a project after they were changed."""
+    if _resolved_custom_fields is not None:
+        _resolved_custom_fields.invalidate(resolved_custom_fields_key(base_url, project_id))
+
+
+def reset_resolved_custom_field_cache() -> None:
+    """Drop the process-wide cache and cancel its reloads (used by tests)."""
+    global _resolved_custom_fields
+    if _resolved_custom_fields is not None:
+        _resolved_custom_fields.clear()
+    _resolved_custom_fields = None
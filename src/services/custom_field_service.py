@@ -1,7 +1,15 @@
 import logging
 
 from src.client import AllureClient
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+)
+from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto
+from src.client.pagination import iter_page_items
+from src.services.custom_field_cache import invalidate_resolved_custom_fields
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +38,8 @@ class CustomFieldService:
 
                 if await self._remove_field_from_project(field_id):
                     deleted_count += 1
+            except AllureDeadlineExceededError:
+                raise
             except AllureAPIError as exc:
                 logger.warning(
                     "Failed to process custom field %s in project %s during cleanup: %s",
@@ -39,31 +49,20 @@ class CustomFieldService:
                 )
                 continue
 
+        if deleted_count:
+            invalidate_resolved_custom_fields(self._client.get_base_url(), self._project_id)
         return deleted_count
 
     async def _list_project_field_ids(self, page_size: int) -> list[int]:
-        field_ids: list[int] = []
-        page = 0
-
-        while True:
-            fields = await self._client.list_project_custom_fields(
-                project_id=self._project_id,
-                page=page,
-                size=page_size,
-            )
-            if not fields:
-                break
-
-            for field in fields:
-                if field.custom_field is None or field.custom_field.id is None:
-                    continue
-                field_ids.append(field.custom_field.id)
-
-            if len(fields) < page_size:
-                break
-            page += 1
-
-        return sorted(set(field_ids))
+        async def _fetch(page: int) -> list[CustomFieldProjectDto]:
+            return await self._client.list_project_custom_fields(project_id=self._project_id, page=page, size=page_size)
+
+        field_ids = {
+            field.custom_field.id
+            async for field in iter_page_items(_fetch, lambda fields: fields, page_size=page_size)
+            if field.custom_field is not None and field.custom_field.id is not None
+        }
+        return sorted(field_ids)
 
     async def _is_field_in_use(self, field_id: int) -> bool:
         # Evaluate usage in both active and archived test cases to avoid
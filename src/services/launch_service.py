@@ -3,9 +3,10 @@
 import asyncio
 import base64
 import binascii
+import contextlib
 import ipaddress
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 from urllib.parse import urlsplit
@@ -21,7 +22,13 @@ from src.client import (
     LaunchDto,
     LaunchUploadResponseDto,
 )
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError, LaunchNotFoundError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+    LaunchNotFoundError,
+)
 from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto
 from src.client.generated.models.external_link_dto import ExternalLinkDto
 from src.client.generated.models.external_run_start_request_dto import ExternalRunStartRequestDto
@@ -64,14 +71,17 @@ from src.client.generated.models.upload_test_result_body_step_dto import UploadT
 from src.client.generated.models.upload_test_result_dto import UploadTestResultDto
 from src.client.generated.models.upload_test_result_expected_body_step_dto import UploadTestResultExpectedBodyStepDto
 from src.client.generated.models.upload_test_status import UploadTestStatus
+from src.client.pagination import iter_page_items
 from src.services.attachment_service import ALLOWED_MIME_TYPES, MAX_ATTACHMENT_SIZE
 from src.utils.aql import quote_aql_string
 from src.utils.schema_hint import generate_schema_hint
+from src.utils.tracing import traced
 
 MAX_NAME_LENGTH = 255
 MAX_TAG_LENGTH = 255
 MAX_LAUNCH_RESULT_UPLOAD_BATCH_SIZE = 1000
 MAX_LAUNCH_RESULT_UPLOAD_CONCURRENCY = 20
+LAUNCH_RESULTS_SCAN_PAGE_SIZE = 100
 ATTACHMENT_DOWNLOAD_TIMEOUT_SECONDS = 10.0
 ALLOWED_ATTACHMENT_URL_SCHEMES = frozenset({"http", "https"})
 BLOCKED_ATTACHMENT_HOSTNAMES = frozenset({"localhost"})
@@ -140,13 +150,18 @@ class LaunchTestResultListItem:
 
 @dataclass
 class LaunchTestResultListResult:
-    """Paginated launch test results."""
+    """Paginated launch test results.
+
+    ``partial`` is set when the tool deadline ran out while scanning the launch
+    for filtered results, so ``total`` only counts the results scanned so far.
+    """
 
     items: Sequence[LaunchTestResultListItem]
     total: int
     page: int
     size: int
     total_pages: int
+    partial: bool = False
 
 
 @dataclass
@@ -495,6 +510,7 @@ class LaunchService:
 
         return self._launch_detail(reopened)
 
+    @traced
     async def upload_results_to_launch(
         self,
         launch_id: int,
@@ -510,6 +526,7 @@ class LaunchService:
         upload_info = LaunchExistingUploadDto()
         return await self._client.upload_results_to_launch(launch_id=launch_id, files=files, info=upload_info)
 
+    @traced
     async def add_results(self, launch_id: int, results: list[dict[str, Any]]) -> LaunchResultUploadResult:
         """Upload externally produced results to a launch concurrently.
 
@@ -642,27 +659,15 @@ class LaunchService:
         self._validate_positive_id(test_case_id, "Test Case ID")
         expected_status = self._normalize_launch_result_status_filter(status)
         matches: list[LaunchTestResultListItem] = []
-        current_page = 0
-        total_pages = 1
 
-        while current_page < total_pages:
-            response = await self._fetch_launch_results_page(
-                launch_id=launch_id,
-                page=current_page,
-                size=100,
-                search=None,
-                filter_id=None,
-                sort=None,
-            )
-            total_pages = response.total_pages or 1
-            for item in response.content or []:
+        async with contextlib.aclosing(self._iter_launch_results(launch_id)) as items:
+            async for item in items:
                 if item.manual is not True or item.test_case_id != test_case_id:
                     continue
                 item_status = item.status.value if isinstance(item.status, TestStatus) else None
                 if expected_status != "any" and item_status != expected_status:
                     continue
                 matches.append(self._to_launch_test_result_item(item))
-            current_page += 1
 
         if not matches:
             status_label = expected_status if expected_status != "any" else "any"
@@ -943,7 +948,7 @@ class LaunchService:
         )
 
     async def _ensure_result_ids_belong_to_launch(self, launch_id: int, result_ids: Sequence[int]) -> None:
-        available_result_ids = await self._collect_launch_result_ids(launch_id)
+        available_result_ids = await self._collect_launch_result_ids(launch_id, result_ids)
         missing_result_ids = [result_id for result_id in result_ids if result_id not in available_result_ids]
         if missing_result_ids:
             missing_result_ids = await self._resolve_missing_launch_result_ids(launch_id, missing_result_ids)
@@ -971,23 +976,19 @@ class LaunchService:
 
         return unresolved_result_ids
 
-    async def _collect_launch_result_ids(self, launch_id: int) -> set[int]:
+    async def _collect_launch_result_ids(self, launch_id: int, wanted_ids: Sequence[int]) -> set[int]:
+        """Return which of ``wanted_ids`` are listed in the launch, stopping once all are found."""
+        remaining = set(wanted_ids)
         available_result_ids: set[int] = set()
-        current_page = 0
-        total_pages = 1
 
-        while current_page < total_pages:
-            response = await self._fetch_launch_results_page(
-                launch_id=launch_id,
-                page=current_page,
-                size=100,
-                search=None,
-                filter_id=None,
-                sort=None,
-            )
-            total_pages = response.total_pages or 1
-            available_result_ids.update(item.id for item in response.content or [] if isinstance(item.id, int))
-            current_page += 1
+        # Closing the pager on ``break`` cancels the pages that are still in flight.
+        async with contextlib.aclosing(self._iter_launch_results(launch_id)) as items:
+            async for item in items:
+                if isinstance(item.id, int) and item.id in remaining:
+                    available_result_ids.add(item.id)
+                    remaining.discard(item.id)
+                    if not remaining:
+                        break
 
         return available_result_ids
 
@@ -1318,27 +1319,21 @@ class LaunchService:
         failed_only: bool,
     ) -> LaunchTestResultListResult:
         collected: list[TestResultFlatDto] = []
-        current_page = 0
-        total_pages = 1
+        partial = False
 
-        while current_page < total_pages:
-            response = await self._fetch_launch_results_page(
-                launch_id=launch_id,
-                page=current_page,
-                size=100,
-                search=search,
-                filter_id=filter_id,
-                sort=sort,
-            )
-            total_pages = response.total_pages or 1
-            for item in response.content or []:
-                if manual_only and item.manual is not True:
-                    continue
-                status_value = item.status.value if isinstance(item.status, TestStatus) else None
-                if failed_only and status_value not in {TestStatus.FAILED.value, TestStatus.BROKEN.value}:
-                    continue
-                collected.append(item)
-            current_page += 1
+        items = self._iter_launch_results(launch_id, search=search, filter_id=filter_id, sort=sort)
+        try:
+            async with contextlib.aclosing(items):
+                async for item in items:
+                    if manual_only and item.manual is not True:
+                        continue
+                    status_value = item.status.value if isinstance(item.status, TestStatus) else None
+                    if failed_only and status_value not in {TestStatus.FAILED.value, TestStatus.BROKEN.value}:
+                        continue
+                    collected.append(item)
+        except AllureDeadlineExceededError:
+            # Pages still in flight were cancelled by the pager; report what was scanned.
+            partial = True
 
         start_index = page * size
         end_index = start_index + size
@@ -1352,8 +1347,29 @@ class LaunchService:
             page=page,
             size=size,
             total_pages=filtered_total_pages,
+            partial=partial,
         )
 
+    def _iter_launch_results(
+        self,
+        launch_id: int,
+        *,
+        search: str | None = None,
+        filter_id: int | None = None,
+        sort: list[str] | None = None,
+    ) -> AsyncGenerator[TestResultFlatDto]:
+        async def _fetch(page: int) -> PageTestResultFlatDto:
+            return await self._fetch_launch_results_page(
+                launch_id=launch_id,
+                page=page,
+                size=LAUNCH_RESULTS_SCAN_PAGE_SIZE,
+                search=search,
+                filter_id=filter_id,
+                sort=sort,
+            )
+
+        return iter_page_items(_fetch, lambda response: response.content)
+
     async def _fetch_launch_results_page(
         self,
         *,
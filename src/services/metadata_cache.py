@@ -0,0 +1,112 @@
+"""Process-wide caches of TestOps metadata shared across tool calls.
+
+Every tool call builds its own services, so caches on a service only last for one
+call. ``StaleWhileRevalidateCache`` outlives them: an entry is fresh for ``ttl``
+seconds and is then served stale for up to ``stale_ttl`` more while a single
+background task reloads it. Older entries are reloaded before they are returned.
+
+Writes invalidate the entries they affect. A reload that was already running
+when its entry was invalidated is discarded, and so is a value that ``cacheable``
+rejects, such as one assembled from partly failed requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry[V]:
+    value: V
+    loaded_at: float
+
+
+class StaleWhileRevalidateCache[K: Hashable, V]:
+    """TTL cache that keeps serving expired entries for a while as they reload in the background."""
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0.0) -> None:
+        self._name = name
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._entries: dict[K, _Entry[V]] = {}
+        self._generations: dict[K, int] = {}
+        self._reloads: dict[K, asyncio.Task[None]] = {}
+
+    async def get(
+        self,
+        key: K,
+        load: Callable[[], Awaitable[V]],
+        reload: Callable[[], Awaitable[V]] | None = None,
+        cacheable: Callable[[V], bool] | None = None,
+    ) -> V:
+        """Return the cached value for ``key``, loading it with ``load`` when missing or too old.
+
+        ``reload`` loads the value in a background task for a stale entry; it
+        defaults to ``load`` and must not depend on the caller staying alive.
+        Loaded values for which ``cacheable`` returns False are returned but not stored.
+        """
+        if self._ttl <= 0:
+            return await load()
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.loaded_at
+            if age < self._ttl:
+                return entry.value
+            if age < self._ttl + self._stale_ttl:
+                self._start_reload(key, reload or load, cacheable)
+                return entry.value
+        return await self._load(key, load, cacheable)
+
+    def invalidate(self, key: K) -> None:
+        """Drop the entry for ``key`` and discard a reload that is in progress."""
+        self._entries.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        task = self._reloads.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    async def wait_for_reloads(self) -> None:
+        """Wait until the background reloads started so far have finished."""
+        await asyncio.gather(*self._reloads.values(), return_exceptions=True)
+
+    def clear(self) -> None:
+        for task in self._reloads.values():
+            task.cancel()
+        self._reloads.clear()
+        self._entries.clear()
+        self._generations.clear()
+
+    async def _load(self, key: K, load: Callable[[], Awaitable[V]], cacheable: Callable[[V], bool] | None = None) -> V:
+        generation = self._generations.get(key, 0)
+        value = await load()
+        if cacheable is not None and not cacheable(value):
+            logger.info("Not caching incomplete %s for %s", self._name, key)
+        elif self._generations.get(key, 0) == generation:
+            self._entries[key] = _Entry(value, time.monotonic())
+        return value
+
+    def _start_reload(
+        self, key: K, reload: Callable[[], Awaitable[V]], cacheable: Callable[[V], bool] | None = None
+    ) -> None:
+        if key in self._reloads:
+            return
+
+        async def _run() -> None:
+            try:
+                await self._load(key, reload, cacheable)
+            except Exception as e:
+                logger.warning("Background reload of %s for %s failed: %s", self._name, key, e)
+            finally:
+                if self._reloads.get(key) is task:
+                    del self._reloads[key]
+
+        # A fresh context keeps the reload out of the calling tool's deadline and request ledger.
+        task = asyncio.create_task(_run(), name=f"lucius-{self._name}-reload", context=contextvars.Context())
+        self._reloads[key] = task
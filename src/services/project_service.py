@@ -3,7 +3,9 @@
 from src.client import AllureClient
 from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError
 from src.client.generated.exceptions import ApiException
+from src.client.generated.models.page_project_dto import PageProjectDto
 from src.client.generated.models.project_dto import ProjectDto
+from src.client.pagination import iter_page_items
 
 
 class ProjectService:
@@ -30,21 +32,11 @@ class ProjectService:
         if api is None:
             raise AllureAPIError("Project API is not initialized")
 
-        projects: list[ProjectDto] = []
-        page_number = 0
+        async def _fetch(page: int) -> PageProjectDto:
+            return await api.find_all21(page=page, size=100, sort=["name,asc"], _request_timeout=self._client._timeout)
+
         try:
-            while True:
-                page = await api.find_all21(
-                    page=page_number,
-                    size=100,
-                    sort=["name,asc"],
-                    _request_timeout=self._client._timeout,
-                )
-                projects.extend(page.content or [])
-                total_pages = page.total_pages or 0
-                if page_number + 1 >= total_pages:
-                    return projects
-                page_number += 1
+            return [project async for project in iter_page_items(_fetch, lambda page: page.content)]
         except ApiException as exc:
             self._client._handle_api_exception(exc)
             raise
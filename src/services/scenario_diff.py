@@ -0,0 +1,250 @@
+"""Minimal edits between two test case scenarios.
+
+A scenario is a tree: body steps may have child steps, and attachment and shared
+step references are leaves. :func:`diff_scenario` aligns each list of siblings
+with a longest common subsequence of their content, recurses into the children of
+aligned body steps, and turns what is left between aligned steps into patches
+(body steps at the same position whose text changed), deletions, and insertions.
+Step IDs of everything that is kept or patched survive the update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import cast
+
+from src.client.generated.models.attachment_step_dto import AttachmentStepDto
+from src.client.generated.models.body_step_dto import BodyStepDto
+from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner
+from src.client.generated.models.shared_step_step_dto import SharedStepStepDto
+
+type StepContent = BodyStepDto | AttachmentStepDto | SharedStepStepDto
+type StepKey = tuple[str, object, object]
+
+
+@dataclass(frozen=True)
+class DeleteStep:
+    """Delete an existing step together with its children."""
+
+    step_id: int
+
+    @property
+    def requests(self) -> int:
+        return 1
+
+
+@dataclass(frozen=True)
+class PatchStep:
+    """Change the text of an existing body step."""
+
+    step_id: int
+    body: str | None
+    expected_result: str | None
+
+    @property
+    def requests(self) -> int:
+        return 1
+
+
+@dataclass(frozen=True)
+class InsertSteps:
+    """Create new sibling steps, with their children, after an existing step.
+
+    ``parent_id`` None means the top level of the scenario and ``after_id`` None
+    means before the first sibling.
+    """
+
+    parent_id: int | None
+    after_id: int | None
+    steps: tuple[SharedStepScenarioDtoStepsInner, ...]
+
+    @property
+    def requests(self) -> int:
+        return sum(_creation_requests(step) for step in self.steps)
+
+
+type ScenarioOperation = DeleteStep | PatchStep | InsertSteps
+
+
+def diff_scenario(
+    current: Sequence[SharedStepScenarioDtoStepsInner],
+    desired: Sequence[SharedStepScenarioDtoStepsInner],
+) -> list[ScenarioOperation] | None:
+    """Operations that turn the ``current`` scenario into ``desired``, deletions first.
+
+    ``current`` is a scenario read back from TestOps, whose steps carry their ``id``.
+    Returns None when a current step has no ID and the scenario cannot be edited in place.
+    """
+    if not _all_have_ids(current):
+        return None
+    deletions: list[ScenarioOperation] = []
+    edits: list[ScenarioOperation] = []
+    _diff_siblings(current, desired, None, deletions, edits)
+    return deletions + edits
+
+
+def scenario_requests(operations: Sequence[ScenarioOperation]) -> int:
+    """Number of step requests needed to apply ``operations``."""
+    return sum(operation.requests for operation in operations)
+
+
+def has_expected_results(steps: Sequence[SharedStepScenarioDtoStepsInner]) -> bool:
+    """Whether any step of the tree has an expected result.
+
+    Scenario writes have no field for expected results, so these scenarios are
+    created one step at a time instead.
+    """
+    return any(_expected_result(step) is not None or has_expected_results(_children(step)) for step in steps)
+
+
+def _diff_siblings(
+    current: Sequence[SharedStepScenarioDtoStepsInner],
+    desired: Sequence[SharedStepScenarioDtoStepsInner],
+    parent_id: int | None,
+    deletions: list[ScenarioOperation],
+    edits: list[ScenarioOperation],
+) -> None:
+    current_steps = [step for step in current if _content(step) is not None]
+    desired_steps = [step for step in desired if _content(step) is not None]
+    anchors = _common_subsequence([_key(step) for step in current_steps], [_key(step) for step in desired_steps])
+
+    after_id: int | None = None
+    current_start = desired_start = 0
+    for current_end, desired_end in [*anchors, (len(current_steps), len(desired_steps))]:
+        after_id = _diff_gap(
+            current_steps[current_start:current_end],
+            desired_steps[desired_start:desired_end],
+            parent_id,
+            after_id,
+            deletions,
+            edits,
+        )
+        if current_end < len(current_steps):
+            kept = current_steps[current_end]
+            after_id = _id(kept)
+            _diff_siblings(_children(kept), _children(desired_steps[desired_end]), after_id, deletions, edits)
+        current_start, desired_start = current_end + 1, desired_end + 1
+
+
+def _diff_gap(
+    current: Sequence[SharedStepScenarioDtoStepsInner],
+    desired: Sequence[SharedStepScenarioDtoStepsInner],
+    parent_id: int | None,
+    after_id: int | None,
+    deletions: list[ScenarioOperation],
+    edits: list[ScenarioOperation],
+) -> int | None:
+    """Edit the unmatched siblings between two matched ones; returns the last step ID kept in place."""
+    pending: list[SharedStepScenarioDtoStepsInner] = []
+    for position, wanted in enumerate(desired):
+        existing = current[position] if position < len(current) else None
+        if existing is None or not _patchable(existing, wanted):
+            if existing is not None:
+                deletions.append(DeleteStep(_id(existing)))
+            pending.append(wanted)
+            continue
+        if pending:
+            edits.append(InsertSteps(parent_id, after_id, tuple(pending)))
+            pending = []
+        after_id = _id(existing)
+        edits.append(PatchStep(after_id, _body(wanted), _expected_result(wanted)))
+        _diff_siblings(_children(existing), _children(wanted), after_id, deletions, edits)
+    deletions.extend(DeleteStep(_id(step)) for step in current[len(desired) :])
+    if pending:
+        edits.append(InsertSteps(parent_id, after_id, tuple(pending)))
+    return after_id
+
+
+def _all_have_ids(steps: Sequence[SharedStepScenarioDtoStepsInner]) -> bool:
+    return all(
+        _step_id(step) is not None and _all_have_ids(_children(step)) for step in steps if _content(step) is not None
+    )
+
+
+def _common_subsequence(current: list[StepKey], desired: list[StepKey]) -> list[tuple[int, int]]:
+    """Index pairs of a longest common subsequence, in order."""
+    prefix = 0
+    while prefix < min(len(current), len(desired)) and current[prefix] == desired[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(len(current), len(desired)) - prefix
+        and current[len(current) - 1 - suffix] == desired[len(desired) - 1 - suffix]
+    ):
+        suffix += 1
+
+    middle_current = current[prefix : len(current) - suffix]
+    middle_desired = desired[prefix : len(desired) - suffix]
+    # lengths[i][j]: LCS length of middle_current[i:] and middle_desired[j:]
+    lengths = [[0] * (len(middle_desired) + 1) for _ in range(len(middle_current) + 1)]
+    for i in range(len(middle_current) - 1, -1, -1):
+        for j in range(len(middle_desired) - 1, -1, -1):
+            if middle_current[i] == middle_desired[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+
+    pairs = [(index, index) for index in range(prefix)]
+    i = j = 0
+    while i < len(middle_current) and j < len(middle_desired):
+        if middle_current[i] == middle_desired[j]:
+            pairs.append((prefix + i, prefix + j))
+            i += 1
+            j += 1
+        elif lengths[i + 1][j] >= lengths[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+    pairs.extend((len(current) - suffix + offset, len(desired) - suffix + offset) for offset in range(suffix))
+    return pairs
+
+
+def _content(step: SharedStepScenarioDtoStepsInner) -> StepContent | None:
+    instance = step.actual_instance
+    if isinstance(instance, (BodyStepDto, AttachmentStepDto, SharedStepStepDto)):
+        return instance
+    return None
+
+
+def _key(step: SharedStepScenarioDtoStepsInner) -> StepKey:
+    content = _content(step)
+    if isinstance(content, AttachmentStepDto):
+        return ("attachment", content.attachment_id, None)
+    if isinstance(content, SharedStepStepDto):
+        return ("shared_step", content.shared_step_id, None)
+    return ("body", _body(step), _expected_result(step))
+
+
+def _patchable(existing: SharedStepScenarioDtoStepsInner, wanted: SharedStepScenarioDtoStepsInner) -> bool:
+    """Whether ``existing`` can become ``wanted`` with a patch; a patch cannot clear an expected result."""
+    return (
+        isinstance(_content(existing), BodyStepDto)
+        and isinstance(_content(wanted), BodyStepDto)
+        and (_expected_result(wanted) is not None or _expected_result(existing) is None)
+    )
+
+
+def _body(step: SharedStepScenarioDtoStepsInner) -> str | None:
+    return getattr(step.actual_instance, "body", None)
+
+
+def _expected_result(step: SharedStepScenarioDtoStepsInner) -> str | None:
+    return getattr(step.actual_instance, "expected_result", None) or None
+
+
+def _children(step: SharedStepScenarioDtoStepsInner) -> list[SharedStepScenarioDtoStepsInner]:
+    return getattr(step.actual_instance, "steps", None) or []
+
+
+def _step_id(step: SharedStepScenarioDtoStepsInner) -> int | None:
+    return getattr(step.actual_instance, "id", None)
+
+
+def _id(step: SharedStepScenarioDtoStepsInner) -> int:
+    return cast(int, _step_id(step))
+
+
+def _creation_requests(step: SharedStepScenarioDtoStepsInner) -> int:
+    own = 2 if _expected_result(step) is not None else 1
+    return own + sum(_creation_requests(child) for child in _children(step))
@@ -0,0 +1,518 @@
+"""Opt-in local full-text index of a project's test cases.
+
+With ``SEARCH_INDEX_ENABLED`` the server keeps one SQLite database per TestOps
+endpoint, project, and API token under ``SEARCH_INDEX_DIR``. Like the HTTP
+response cache, indexes are keyed by the token fingerprint, because TestOps may
+show different test cases to different tokens: in ``http`` mode the index is
+built with the server's own token and only answers callers using that token.
+It holds the ID, name, tags,
+status, layer and custom field values of every test case; names live in an FTS5
+trigram table, so ``name ~=`` substring matches are answered from the index
+instead of scanning.
+
+``SearchIndexRefresher`` builds the index through the paginated search API and
+then keeps it current incrementally: it reads test cases newest-modified first
+and stops at the first one the index already holds unchanged. Deletions do not
+show up in that order, so a mismatch between the indexed count and the
+project's total triggers a full rebuild.
+
+``SearchService`` answers simple queries, list filters, and ``and``-joined AQL
+equality clauses from the index while its last refresh is younger than
+``SEARCH_INDEX_MAX_AGE_SECONDS``; everything else still goes to TestOps. Indexed
+results are ordered by ascending ID, and their test cases carry only the ID,
+name, status, test layer, tags, and last modification date.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import math
+import re
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import platformdirs
+
+from src.client import AllureClient, PageTestCaseDto, TestCaseDto
+from src.client.generated.models.status_dto import StatusDto
+from src.client.generated.models.test_layer_dto import TestLayerDto
+from src.client.generated.models.test_tag_dto import TestTagDto
+from src.client.pagination import iter_pages
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+INDEX_PAGE_SIZE = 100
+CUSTOM_FIELD_FETCH_CONCURRENCY = 8
+NEWEST_MODIFIED_FIRST = ["lastModifiedDate,DESC"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS test_cases (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT,
+    layer TEXT,
+    last_modified INTEGER NOT NULL,
+    generation INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_case_tags (
+    tag TEXT NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    PRIMARY KEY (tag, test_case_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS test_case_tags_by_test_case ON test_case_tags (test_case_id);
+CREATE TABLE IF NOT EXISTS test_case_custom_fields (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    PRIMARY KEY (field, value, test_case_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS test_case_custom_fields_by_test_case ON test_case_custom_fields (test_case_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS test_case_names USING fts5(name, tokenize='trigram');
+"""
+
+_AQL_CLAUSE = re.compile(
+    r'\s*(?:(?P<field>name|tag|status|layer)\s*(?P<op>~=|=)|cf\[\s*"(?P<cf>(?:[^"\\]|\\.)*)"\s*\]\s*=)'
+    r'\s*"(?P<value>(?:[^"\\]|\\.)*)"\s*'
+)
+_AQL_AND = re.compile(r"(?:and|AND)\s+")
+_AQL_ESCAPE = re.compile(r"\\(.)")
+
+
+@dataclass(frozen=True)
+class IndexedTestCase:
+    """The fields of one test case kept in the index."""
+
+    id: int
+    name: str
+    status: str | None
+    layer: str | None
+    tags: tuple[str, ...]
+    last_modified: int
+    custom_fields: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_dto(cls, tc: TestCaseDto, custom_fields: Sequence[tuple[str, str]] = ()) -> IndexedTestCase | None:
+        if tc.id is None:
+            return None
+        return cls(
+            id=tc.id,
+            name=tc.name or "",
+            status=tc.status.name if tc.status else None,
+            layer=tc.test_layer.name if tc.test_layer else None,
+            tags=tuple(sorted({tag.name for tag in tc.tags or [] if tag.name})),
+            last_modified=tc.last_modified_date or 0,
+            custom_fields=tuple(custom_fields),
+        )
+
+    def to_dto(self) -> TestCaseDto:
+        return TestCaseDto(
+            id=self.id,
+            name=self.name,
+            status=StatusDto(name=self.status) if self.status is not None else None,
+            testLayer=TestLayerDto(name=self.layer) if self.layer is not None else None,
+            tags=[TestTagDto(name=tag) for tag in self.tags],
+            lastModifiedDate=self.last_modified,
+        )
+
+
+@dataclass(frozen=True)
+class IndexQuery:
+    """Filters the index can answer; a test case matches when it passes all of them.
+
+    ``name`` is a case-insensitive substring, like AQL ``name ~=``; the other
+    filters are exact, like AQL ``=``.
+    """
+
+    name: str | None = None
+    tags: tuple[str, ...] = ()
+    status: str | None = None
+    layer: str | None = None
+    custom_fields: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_aql(cls, aql: str) -> IndexQuery | None:
+        """Translate ``and``-joined ``name ~=``, ``tag =``, ``status =``, ``layer =`` and ``cf["..."] =`` clauses.
+
+        Returns None for any other AQL (``or``, ``not``, parentheses, other fields
+        or operators), which has to be answered by TestOps.
+        """
+        clauses = _aql_clauses(aql)
+        if clauses is None:
+            return None
+        name: str | None = None
+        status: str | None = None
+        layer: str | None = None
+        tags: list[str] = []
+        custom_fields: list[tuple[str, str]] = []
+        for field, operator, value in clauses:
+            if isinstance(field, tuple):
+                custom_fields.append((field[0], value))
+            elif (field == "name") != (operator == "~="):
+                return None
+            elif field == "tag":
+                tags.append(value)
+            elif field == "name" and name is None:
+                name = value
+            elif field == "status" and status is None:
+                status = value
+            elif field == "layer" and layer is None:
+                layer = value
+            else:
+                return None
+        return cls(name=name, tags=tuple(tags), status=status, layer=layer, custom_fields=tuple(custom_fields))
+
+
+def _aql_clauses(aql: str) -> list[tuple[str | tuple[str], str, str]] | None:
+    """Split ``and``-joined AQL comparisons into (field, operator, value); None for anything else.
+
+    A custom field ``cf["X"]`` is returned as the one-element tuple ``("X",)``.
+    """
+    clauses: list[tuple[str | tuple[str], str, str]] = []
+    position = 0
+    while True:
+        clause = _AQL_CLAUSE.match(aql, position)
+        if clause is None:
+            return None
+        field: str | tuple[str] = (
+            (_AQL_ESCAPE.sub(r"\1", clause["cf"]),) if clause["cf"] is not None else clause["field"]
+        )
+        clauses.append((field, clause["op"] or "=", _AQL_ESCAPE.sub(r"\1", clause["value"])))
+        position = clause.end()
+        if position == len(aql):
+            return clauses
+        conjunction = _AQL_AND.match(aql, position)
+        if conjunction is None:
+            return None
+        position = conjunction.end()
+
+
+class TestCaseIndex:
+    """SQLite store of one project's test cases, queried with :class:`IndexQuery`.
+
+    Rows carry the generation of the build that last wrote them; finishing a
+    rebuild drops the rows an earlier generation left behind, so searches keep
+    working (on slightly stale data) while a rebuild is in progress.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, isolation_level=None)
+        try:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            if self._db.execute("PRAGMA user_version").fetchone()[0] not in (0, SCHEMA_VERSION):
+                self._drop_tables()
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error:
+            self._db.close()
+            raise
+
+    def _drop_tables(self) -> None:
+        for (table,) in self._db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+            if not table.startswith(("sqlite_", "test_case_names_")):
+                self._db.execute(f'DROP TABLE IF EXISTS "{table}"')
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: object) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    @property
+    def built(self) -> bool:
+        """Whether a full build has completed."""
+        return self._meta("built_at") is not None
+
+    @property
+    def generation(self) -> int:
+        return int(self._meta("generation") or 0)
+
+    @property
+    def refreshed_at(self) -> float | None:
+        value = self._meta("refreshed_at")
+        return float(value) if value is not None else None
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether the index is built and was refreshed within the last ``max_age`` seconds."""
+        refreshed_at = self.refreshed_at
+        return self.built and refreshed_at is not None and time.time() - refreshed_at <= max_age
+
+    def count(self) -> int:
+        return int(self._db.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0])
+
+    def watermark(self) -> int:
+        """The latest last-modified timestamp in the index, in epoch milliseconds."""
+        return int(self._db.execute("SELECT COALESCE(MAX(last_modified), 0) FROM test_cases").fetchone()[0])
+
+    def last_modified(self, test_case_ids: Sequence[int]) -> dict[int, int]:
+        if not test_case_ids:
+            return {}
+        placeholders = ", ".join("?" * len(test_case_ids))
+        rows = self._db.execute(
+            f"SELECT id, last_modified FROM test_cases WHERE id IN ({placeholders})",  # noqa: S608
+            tuple(test_case_ids),
+        )
+        return dict(rows.fetchall())
+
+    def upsert(self, test_cases: Sequence[IndexedTestCase], *, generation: int) -> None:
+        if not test_cases:
+            return
+        ids = [(tc.id,) for tc in test_cases]
+        with self._transaction():
+            self._db.executemany("DELETE FROM test_case_tags WHERE test_case_id = ?", ids)
+            self._db.executemany("DELETE FROM test_case_custom_fields WHERE test_case_id = ?", ids)
+            self._db.executemany("DELETE FROM test_case_names WHERE rowid = ?", ids)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO test_cases (id, name, status, layer, last_modified, generation) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(tc.id, tc.name, tc.status, tc.layer, tc.last_modified, generation) for tc in test_cases],
+            )
+            self._db.executemany(
+                "INSERT INTO test_case_names (rowid, name) VALUES (?, ?)", [(tc.id, tc.name) for tc in test_cases]
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO test_case_tags (tag, test_case_id) VALUES (?, ?)",
+                [(tag, tc.id) for tc in test_cases for tag in tc.tags],
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO test_case_custom_fields (field, value, test_case_id) VALUES (?, ?, ?)",
+                [(field, value, tc.id) for tc in test_cases for field, value in tc.custom_fields],
+            )
+
+    def start_rebuild(self) -> int:
+        """Return the generation number for the rows of a new full build."""
+        return self.generation + 1
+
+    def finish_rebuild(self, generation: int) -> None:
+        """Drop rows the rebuild did not see and mark the index built and refreshed."""
+        stale = "SELECT id FROM test_cases WHERE generation < ?"
+        with self._transaction():
+            self._db.execute(f"DELETE FROM test_case_tags WHERE test_case_id IN ({stale})", (generation,))  # noqa: S608
+            self._db.execute(
+                f"DELETE FROM test_case_custom_fields WHERE test_case_id IN ({stale})",  # noqa: S608
+                (generation,),
+            )
+            self._db.execute(f"DELETE FROM test_case_names WHERE rowid IN ({stale})", (generation,))  # noqa: S608
+            self._db.execute("DELETE FROM test_cases WHERE generation < ?", (generation,))
+            self._set_meta("generation", generation)
+            self._set_meta("built_at", time.time())
+            self._set_meta("refreshed_at", time.time())
+
+    def mark_refreshed(self) -> None:
+        self._set_meta("refreshed_at", time.time())
+
+    def search(self, query: IndexQuery, *, page: int, size: int) -> PageTestCaseDto:
+        """Return one page of matching test cases, ordered by ID, shaped like a TestOps search page."""
+        conditions: list[str] = []
+        params: list[object] = []
+        if query.name:
+            escaped = query.name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("id IN (SELECT rowid FROM test_case_names WHERE name LIKE ? ESCAPE '\\')")
+            params.append(f"%{escaped}%")
+        for tag in query.tags:
+            conditions.append("id IN (SELECT test_case_id FROM test_case_tags WHERE tag = ?)")
+            params.append(tag)
+        if query.status is not None:
+            conditions.append("status = ?")
+            params.append(query.status)
+        if query.layer is not None:
+            conditions.append("layer = ?")
+            params.append(query.layer)
+        for field, value in query.custom_fields:
+            conditions.append("id IN (SELECT test_case_id FROM test_case_custom_fields WHERE field = ? AND value = ?)")
+            params.extend((field, value))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        total = int(self._db.execute(f"SELECT COUNT(*) FROM test_cases {where}", params).fetchone()[0])  # noqa: S608
+        rows = self._db.execute(
+            f"SELECT id, name, status, layer, last_modified FROM test_cases {where} "  # noqa: S608
+            "ORDER BY id LIMIT ? OFFSET ?",
+            [*params, size, page * size],
+        ).fetchall()
+        tags = self._tags([row[0] for row in rows])
+        content = [
+            IndexedTestCase(
+                id=test_case_id,
+                name=name,
+                status=status,
+                layer=layer,
+                tags=tags.get(test_case_id, ()),
+                last_modified=last_modified,
+            ).to_dto()
+            for test_case_id, name, status, layer, last_modified in rows
+        ]
+        return PageTestCaseDto(
+            content=content,
+            total_elements=total,
+            number=page,
+            size=size,
+            total_pages=math.ceil(total / size),
+        )
+
+    def _tags(self, test_case_ids: Sequence[int]) -> dict[int, tuple[str, ...]]:
+        if not test_case_ids:
+            return {}
+        placeholders = ", ".join("?" * len(test_case_ids))
+        tags: dict[int, list[str]] = {}
+        for tag, test_case_id in self._db.execute(
+            f"SELECT tag, test_case_id FROM test_case_tags WHERE test_case_id IN ({placeholders}) ORDER BY tag",  # noqa: S608
+            tuple(test_case_ids),
+        ):
+            tags.setdefault(test_case_id, []).append(tag)
+        return {test_case_id: tuple(names) for test_case_id, names in tags.items()}
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+
+class SearchIndexRefresher:
+    """Builds and incrementally refreshes a :class:`TestCaseIndex` from TestOps."""
+
+    def __init__(self, client: AllureClient, index: TestCaseIndex, *, custom_fields: bool = True) -> None:
+        self._client = client
+        self._index = index
+        self._project_id = client.get_project()
+        self._custom_fields = custom_fields
+
+    async def refresh(self) -> int:
+        """Bring the index up to date, building it first if needed.
+
+        Returns:
+            Number of test cases written to the index
+        """
+        if not self._index.built:
+            return await self.rebuild()
+
+        watermark = self._index.watermark()
+        changed: list[TestCaseDto] = []
+        total = 0
+        page_number = 0
+        while True:
+            page = await self._client.list_test_cases(
+                project_id=self._project_id, page=page_number, size=INDEX_PAGE_SIZE, sort=NEWEST_MODIFIED_FIRST
+            )
+            if page_number == 0:
+                total = page.total_elements or 0
+            items = page.content or []
+            recent = [tc for tc in items if (tc.last_modified_date or 0) >= watermark]
+            changed.extend(recent)
+            page_number += 1
+            if len(recent) < len(items) or page_number >= (page.total_pages or 0):
+                break
+
+        known = self._index.last_modified([tc.id for tc in changed if tc.id is not None])
+        changed = [tc for tc in changed if tc.id is None or known.get(tc.id) != tc.last_modified_date]
+        await self._store(changed, generation=self._index.generation)
+
+        if self._index.count() != total:
+            logger.info("Search index holds %d test cases, TestOps reports %d; rebuilding", self._index.count(), total)
+            return await self.rebuild()
+        self._index.mark_refreshed()
+        return len(changed)
+
+    async def rebuild(self) -> int:
+        """Re-read every test case of the project and drop the ones that are gone."""
+        generation = self._index.start_rebuild()
+
+        async def _fetch(page: int) -> PageTestCaseDto:
+            return await self._client.list_test_cases(project_id=self._project_id, page=page, size=INDEX_PAGE_SIZE)
+
+        indexed = 0
+        async with contextlib.aclosing(iter_pages(_fetch, page_size=INDEX_PAGE_SIZE)) as pages:
+            async for page in pages:
+                indexed += await self._store(page.content or [], generation=generation)
+        self._index.finish_rebuild(generation)
+        return indexed
+
+    async def _store(self, test_cases: Sequence[TestCaseDto], *, generation: int) -> int:
+        custom_fields = await self._load_custom_fields(test_cases) if self._custom_fields else {}
+        records = [
+            record
+            for tc in test_cases
+            if (record := IndexedTestCase.from_dto(tc, custom_fields.get(tc.id or 0, ()))) is not None
+        ]
+        self._index.upsert(records, generation=generation)
+        return len(records)
+
+    async def _load_custom_fields(self, test_cases: Sequence[TestCaseDto]) -> dict[int, list[tuple[str, str]]]:
+        semaphore = asyncio.Semaphore(CUSTOM_FIELD_FETCH_CONCURRENCY)
+
+        async def _load(test_case_id: int) -> tuple[int, list[tuple[str, str]]]:
+            async with semaphore:
+                fields = await self._client.get_test_case_custom_fields(test_case_id, self._project_id)
+            values: list[tuple[str, str]] = []
+            for cf in fields:
+                if cf.custom_field and cf.custom_field.custom_field and cf.custom_field.custom_field.name:
+                    name = cf.custom_field.custom_field.name
+                    values.extend((name, value.name) for value in cf.values or [] if value.name is not None)
+            return test_case_id, values
+
+        loaded = await asyncio.gather(*(_load(tc.id) for tc in test_cases if tc.id is not None))
+        return dict(loaded)
+
+
+_indexes: dict[tuple[str, int, str], TestCaseIndex | None] = {}
+
+
+def index_path(base_url: str, project_id: int, auth_scope: str) -> Path:
+    """Location of the index database for an endpoint, project, and API token fingerprint."""
+    root = (
+        Path(settings.SEARCH_INDEX_DIR)
+        if settings.SEARCH_INDEX_DIR
+        else platformdirs.user_cache_path("lucius", appauthor=False) / "search-index"
+    )
+    endpoint = hashlib.sha256(base_url.rstrip("/").encode()).hexdigest()[:16]
+    return root / f"{endpoint}-{project_id}-{auth_scope}.sqlite3"
+
+
+def get_test_case_index(
+    base_url: str, project_id: int, auth_scope: str, *, create: bool = True
+) -> TestCaseIndex | None:
+    """Return the process-wide index for an endpoint, project, and API token fingerprint.
+
+    Returns None when ``SEARCH_INDEX_ENABLED`` is off, when ``create`` is false and
+    no index was built for this token, or when the index cannot be opened (for
+    example, SQLite was built without FTS5); the latter is logged once.
+    """
+    if not settings.SEARCH_INDEX_ENABLED or project_id <= 0:
+        return None
+    key = (base_url.rstrip("/"), project_id, auth_scope)
+    if key not in _indexes:
+        path = index_path(base_url, project_id, auth_scope)
+        if not create and not path.exists():
+            return None
+        try:
+            _indexes[key] = TestCaseIndex(path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Search index at %s is unavailable, searching TestOps instead: %s", path, e)
+            _indexes[key] = None
+    return _indexes[key]
+
+
+def reset_test_case_indexes() -> None:
+    """Close every open index; the next lookup reopens it from disk."""
+    for index in _indexes.values():
+        if index is not None:
+            index.close()
+    _indexes.clear()
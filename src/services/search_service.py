@@ -1,9 +1,17 @@
 import re
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 
 from src.client import AllureClient, PageTestCaseDto, TestCaseDto, TestCaseScenarioV2Dto
 from src.client.exceptions import AllureNotFoundError, AllureValidationError, TestCaseNotFoundError
+from src.client.pagination import FetchPage, iter_pages
+from src.services.search_index import IndexQuery, get_test_case_index
 from src.utils.aql import normalize_aql
+from src.utils.config import settings
+
+# Hard cap on the test cases one all-pages listing may return, and the page size it reads with.
+ALL_PAGES_MAX_ITEMS = 5000
+ALL_PAGES_PAGE_SIZE = 100
 
 
 @dataclass
@@ -17,6 +25,55 @@ class TestCaseListResult:
     total_pages: int
 
 
+@dataclass
+class TestCaseScanResult:
+    """Test cases gathered from every result page."""
+
+    items: list[TestCaseDto]
+    total: int
+    truncated: bool
+
+
+class TestCaseScan:
+    """Test cases from every page of a listing, deduplicated by ID and capped at ``max_items``.
+
+    Pages after the first are fetched concurrently. Offset pages can overlap when
+    test cases are created or deleted mid-scan, so a test case already yielded
+    from an earlier page is skipped. ``total`` (as reported by TestOps) is set once
+    the first page arrives and ``truncated`` once the cap cuts the listing short.
+    """
+
+    def __init__(self, fetch_page: FetchPage[PageTestCaseDto], max_items: int) -> None:
+        self._fetch_page = fetch_page
+        self._max_items = max_items
+        self.total = 0
+        self.truncated = False
+
+    async def __aiter__(self) -> AsyncGenerator[TestCaseDto]:
+        seen: set[int] = set()
+        returned = 0
+        pages = iter_pages(self._fetch_page, page_size=ALL_PAGES_PAGE_SIZE)
+        try:
+            async for page in pages:
+                self.total = max(self.total, page.total_elements or 0)
+                for item in page.content or []:
+                    if item.id is not None:
+                        if item.id in seen:
+                            continue
+                        seen.add(item.id)
+                    if returned == self._max_items:
+                        self.truncated = True
+                        return
+                    returned += 1
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def collect(self) -> TestCaseScanResult:
+        items = [item async for item in self]
+        return TestCaseScanResult(items=items, total=self.total, truncated=self.truncated)
+
+
 @dataclass
 class TestCaseDetails:
     """Full test case details including scenario."""
@@ -119,16 +176,8 @@ class SearchService:
         self._validate_project_id(self._project_id)
         self._validate_pagination(page, size)
 
-        response = await self._client.list_test_cases(
-            project_id=self._project_id,
-            page=page,
-            size=size,
-            search=name_filter,
-            tags=tags,
-            status=status,
-        )
-
-        return self._build_result(response)
+        fetch_page = self._list_page_fetcher(name_filter, tags, status, size=size)
+        return self._build_result(await fetch_page(page))
 
     async def search_test_cases(
         self,
@@ -162,12 +211,70 @@ class SearchService:
         self._validate_project_id(self._project_id)
         self._validate_pagination(page, size)
 
+        fetch_page = await self._search_page_fetcher(query, aql=aql, size=size)
+        return self._build_result(await fetch_page(page))
+
+    async def scan_test_cases(
+        self,
+        name_filter: str | None = None,
+        tags: list[str] | None = None,
+        status: str | None = None,
+        *,
+        max_items: int = ALL_PAGES_MAX_ITEMS,
+    ) -> TestCaseScan:
+        """List every page of test cases with the ``list_test_cases`` filters, up to ``max_items``."""
+        self._validate_project_id(self._project_id)
+        self._validate_max_items(max_items)
+        return TestCaseScan(self._list_page_fetcher(name_filter, tags, status, size=ALL_PAGES_PAGE_SIZE), max_items)
+
+    async def scan_search_results(
+        self,
+        query: str | None = None,
+        *,
+        aql: str | None = None,
+        max_items: int = ALL_PAGES_MAX_ITEMS,
+    ) -> TestCaseScan:
+        """Search every page of results for a simple query or raw AQL, up to ``max_items``.
+
+        The query is validated (and AQL syntax checked) before the scan is returned.
+        """
+        self._validate_project_id(self._project_id)
+        self._validate_max_items(max_items)
+        fetch_page = await self._search_page_fetcher(query, aql=aql, size=ALL_PAGES_PAGE_SIZE)
+        return TestCaseScan(fetch_page, max_items)
+
+    def _list_page_fetcher(
+        self, name_filter: str | None, tags: list[str] | None, status: str | None, *, size: int
+    ) -> FetchPage[PageTestCaseDto]:
+        index_query = IndexQuery(name=name_filter or None, tags=tuple(tags or ()), status=status or None)
+        if (from_index := self._index_page_fetcher(index_query, size=size)) is not None:
+            return from_index
+
+        async def _fetch(page: int) -> PageTestCaseDto:
+            return await self._client.list_test_cases(
+                project_id=self._project_id,
+                page=page,
+                size=size,
+                search=name_filter,
+                tags=tags,
+                status=status,
+            )
+
+        return _fetch
+
+    async def _search_page_fetcher(
+        self, query: str | None, *, aql: str | None, size: int
+    ) -> FetchPage[PageTestCaseDto]:
         # AQL mode: pass raw query to Allure
         if aql is not None:
             if not isinstance(aql, str) or not aql.strip():
                 raise AllureValidationError("AQL query must be a non-empty string")
             normalized_aql = normalize_aql(aql)
 
+            index_query = IndexQuery.from_aql(normalized_aql)
+            if index_query is not None and (from_index := self._index_page_fetcher(index_query, size=size)):
+                return from_index
+
             # Optionally validate AQL syntax before executing
             is_valid, _count = await self._client.validate_test_case_query(
                 project_id=self._project_id,
@@ -180,13 +287,15 @@ class SearchService:
                     'Example: \'status = "failed" and tag = "regression"\''
                 )
 
-            response = await self._client.search_test_cases_aql(
-                project_id=self._project_id,
-                rql=normalized_aql,
-                page=page,
-                size=size,
-            )
-            return self._build_result(response)
+            async def _fetch_aql(page: int) -> PageTestCaseDto:
+                return await self._client.search_test_cases_aql(
+                    project_id=self._project_id,
+                    rql=normalized_aql,
+                    page=page,
+                    size=size,
+                )
+
+            return _fetch_aql
 
         # Simple query mode: parse and translate to internal search
         if not isinstance(query, str) or not query.strip():
@@ -196,16 +305,40 @@ class SearchService:
         if not parsed.name_query and not parsed.tags:
             raise AllureValidationError("Search query must include a name or tag filter")
 
-        response = await self._client.list_test_cases(
-            project_id=self._project_id,
-            page=page,
-            size=size,
-            search=parsed.name_query,
-            tags=parsed.tags or None,
-            status=None,
+        index_query = IndexQuery(name=parsed.name_query, tags=tuple(parsed.tags))
+        if (from_index := self._index_page_fetcher(index_query, size=size)) is not None:
+            return from_index
+
+        async def _fetch_query(page: int) -> PageTestCaseDto:
+            return await self._client.list_test_cases(
+                project_id=self._project_id,
+                page=page,
+                size=size,
+                search=parsed.name_query,
+                tags=parsed.tags or None,
+                status=None,
+            )
+
+        return _fetch_query
+
+    def _index_page_fetcher(self, query: IndexQuery, *, size: int) -> FetchPage[PageTestCaseDto] | None:
+        """Return pages from the local search index, or None when it is disabled or stale.
+
+        Only an index built with the caller's own API token is used, so callers never
+        see test cases their token cannot.
+        """
+        if not settings.SEARCH_INDEX_ENABLED:
+            return None
+        index = get_test_case_index(
+            self._client.get_base_url(), self._project_id, self._client.get_auth_scope(), create=False
         )
+        if index is None or not index.is_fresh(settings.SEARCH_INDEX_MAX_AGE_SECONDS):
+            return None
+
+        async def _fetch_indexed(page: int) -> PageTestCaseDto:
+            return index.search(query, page=page, size=size)
 
-        return self._build_result(response)
+        return _fetch_indexed
 
     def _build_result(self, response: PageTestCaseDto) -> TestCaseListResult:
         items = response.content or []
@@ -230,3 +363,7 @@ class SearchService:
             raise AllureValidationError("Size must be a positive integer")
         if size > 100:
             raise AllureValidationError("Size must be 100 or less")
+
+    def _validate_max_items(self, max_items: int) -> None:
+        if not isinstance(max_items, int) or not 1 <= max_items <= ALL_PAGES_MAX_ITEMS:
+            raise AllureValidationError(f"max_items must be between 1 and {ALL_PAGES_MAX_ITEMS}")
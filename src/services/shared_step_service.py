@@ -7,14 +7,19 @@ from pydantic import ValidationError as PydanticValidationError
 
 from src.client import (
     AllureClient,
+    AttachmentStepDtoWithName,
     PageSharedStepDto,
-    ScenarioStepCreateDto,
-    ScenarioStepPatchDto,
     SharedStepAttachmentRowDto,
     SharedStepDto,
+    StepWithExpected,
 )
 from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError
+from src.client.generated.models.scenario_step_create_dto import ScenarioStepCreateDto
+from src.client.generated.models.scenario_step_patch_dto import ScenarioStepPatchDto
+from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner
+from src.client.pagination import iter_page_items
 from src.services.attachment_service import AttachmentService
+from src.services.scenario_diff import has_expected_results
 from src.utils.schema_hint import generate_schema_hint
 
 logger = logging.getLogger(__name__)
@@ -230,30 +235,20 @@ class SharedStepService:
         if not isinstance(page_size, int) or page_size <= 0:
             raise AllureValidationError("page_size must be a positive integer")
 
-        archived_ids: list[int] = []
-        page = 0
-        while True:
-            page_dto: PageSharedStepDto = await self._client.list_shared_steps(
+        async def _fetch(page: int) -> PageSharedStepDto:
+            return await self._client.list_shared_steps(
                 project_id=self._project_id,
                 page=page,
                 size=page_size,
                 search=None,
                 archived=True,
             )
-            steps = page_dto.content or []
-            if not steps:
-                break
 
-            for step in steps:
-                if step.id is None:
-                    continue
-                if step.archived is False:
-                    continue
-                archived_ids.append(step.id)
-
-            if len(steps) < page_size:
-                break
-            page += 1
+        archived_ids = [
+            step.id
+            async for step in iter_page_items(_fetch, lambda page_dto: page_dto.content, page_size=page_size)
+            if step.id is not None and step.archived is not False
+        ]
 
         deleted_count = 0
         for step_id in dict.fromkeys(archived_ids):
@@ -269,78 +264,127 @@ class SharedStepService:
     # Helper Methods
     # ==========================================
 
-    async def _add_steps(
-        self,
-        shared_step_id: int,
-        steps: list[dict[str, object]],
-        parent_step_id: int | None = None,
-    ) -> int | None:
-        """Recursively add steps to a shared step."""
-        last_step_id = None
+    async def _add_steps(self, shared_step_id: int, steps: list[dict[str, object]]) -> list[int]:
+        """Write the steps of a new shared step in a single request.
 
-        for s in steps:
-            action = str(s.get("action", ""))
-            expected = str(s.get("expected", ""))
-            step_attachments = cast(list[dict[str, str]], s.get("attachments", []))
+        A scenario write cannot carry expected results, so scenarios with expected
+        results are created step by step.
 
-            current_parent_id: int | None = parent_step_id
+        Returns:
+            IDs of the created steps, depth-first in scenario order.
+        """
+        scenario = await self._build_scenario(shared_step_id, steps)
+        if not scenario:
+            return []
+        if has_expected_results(scenario):
+            created: list[int] = []
+            await self._create_steps(shared_step_id, scenario, None, created)
+            return created
+        return await self._client.set_shared_step_scenario(shared_step_id, scenario)
+
+    async def _create_steps(
+        self,
+        shared_step_id: int,
+        steps: list[SharedStepScenarioDtoStepsInner],
+        parent_id: int | None,
+        created: list[int],
+    ) -> None:
+        """Create scenario steps one at a time, appending their IDs to ``created`` depth-first.
 
-            # 1. Action Step
-            if action:
-                step_dto = self._build_scenario_step_dto(
-                    shared_step_id=shared_step_id, body=action, parent_id=current_parent_id
+        An expected result is patched onto its action step and added as a body step below it.
+        """
+        for step in steps:
+            instance = step.actual_instance
+            body = getattr(instance, "body", None)
+            response = await self._client.create_shared_step_scenario_step(
+                self._build_scenario_step_dto(
+                    shared_step_id=shared_step_id,
+                    body=body,
+                    attachment_id=getattr(instance, "attachment_id", None),
+                    parent_id=parent_id,
                 )
-                response = await self._client.create_shared_step_scenario_step(step_dto)
-                current_parent_id = response.created_step_id
-
-                # 2. Expected Result (patch action step)
-                if expected and current_parent_id is not None:
-                    await self._client.patch_shared_step_scenario_step(
-                        step_id=current_parent_id,
-                        patch=ScenarioStepPatchDto(body=action, expected_result=expected),
-                    )
-                    await self._client.create_shared_step_scenario_step(
-                        self._build_scenario_step_dto(
-                            shared_step_id=shared_step_id,
-                            body=expected,
-                            parent_id=current_parent_id,
-                        )
+            )
+            step_id = response.created_step_id
+            if step_id is None:
+                raise AllureAPIError("Shared step scenario step was created without an ID")
+            created.append(step_id)
+
+            expected_result = getattr(instance, "expected_result", None)
+            if expected_result:
+                await self._client.patch_shared_step_scenario_step(
+                    step_id=step_id,
+                    patch=ScenarioStepPatchDto(body=body, expected_result=expected_result),
+                )
+                await self._client.create_shared_step_scenario_step(
+                    self._build_scenario_step_dto(
+                        shared_step_id=shared_step_id, body=expected_result, parent_id=step_id
                     )
+                )
 
-                # 3. Attachments (children of action)
-                if step_attachments:
-                    for att in step_attachments:
-                        # Upload using shared step attachment API
-                        # But wait, AttachmentService uses TestCaseAttachmentControllerApi?
-                        # Or does it use AllureClient wrapper?
-                        # AttachmentService.upload_attachment uses test_case_id.
-                        # I can't use AttachmentService directly for shared steps if it requires test_case_id.
-                        # I need to duplicate upload logic or enable AttachmentService to handle shared steps.
-                        # Shared API: create21(shared_step_id, file)
-                        # AttachmentService uses create16(test_case_id, file)
-                        # I'll implement internal upload here or extend AttachmentService.
-                        # Extending Service is better but for now internal helper is faster.
-
-                        # Handle content/url logic similar to AttachmentService
-                        # Simplified: assume content/name
-                        row = await self._upload_attachment(shared_step_id, att)
-
-                        att_step_dto = self._build_scenario_step_dto(
-                            shared_step_id=shared_step_id, attachment_id=row.id, parent_id=current_parent_id
-                        )
-                        await self._client.create_shared_step_scenario_step(att_step_dto)
+            await self._create_steps(shared_step_id, getattr(instance, "steps", None) or [], step_id, created)
 
-            # 4. Recursive Steps (sub-steps)
-            # The tool definition allows nested steps?
-            # "steps: list[Argument]" - usually recursive in our model.
-            # If the dict has "steps", recurse.
-            nested_steps = s.get("steps")
-            if nested_steps and isinstance(nested_steps, list):
-                await self._add_steps(shared_step_id, nested_steps, parent_step_id=current_parent_id)
+    def _build_scenario_step_dto(
+        self,
+        shared_step_id: int,
+        body: str | None = None,
+        attachment_id: int | None = None,
+        parent_id: int | None = None,
+    ) -> ScenarioStepCreateDto:
+        """Build ScenarioStepCreateDto."""
+        try:
+            return ScenarioStepCreateDto(
+                shared_step_id=shared_step_id, body=body, attachment_id=attachment_id, parent_id=parent_id
+            )
+        except PydanticValidationError as e:
+            hint = generate_schema_hint(ScenarioStepCreateDto)
+            raise AllureValidationError(f"Invalid step data: {e}", suggestions=[hint]) from e
 
-            last_step_id = current_parent_id
+    async def _build_scenario(
+        self, shared_step_id: int, steps: list[dict[str, object]]
+    ) -> list[SharedStepScenarioDtoStepsInner]:
+        """Build the scenario tree of step dicts, uploading their attachments.
 
-        return last_step_id
+        Attachments and nested ``steps`` become children of the action step; without
+        an action, attachments are skipped and nested steps move up a level.
+        """
+        scenario: list[SharedStepScenarioDtoStepsInner] = []
+        for s in steps:
+            action = str(s.get("action") or "")
+            expected = s.get("expected")
+            step_attachments = cast(list[dict[str, str]], s.get("attachments") or [])
+            nested_steps = s.get("steps")
+            nested = (
+                await self._build_scenario(shared_step_id, nested_steps)
+                if nested_steps and isinstance(nested_steps, list)
+                else []
+            )
+            if not action:
+                scenario.extend(nested)
+                continue
+
+            children: list[SharedStepScenarioDtoStepsInner] = []
+            for att in step_attachments:
+                row = await self._upload_attachment(shared_step_id, att)
+                children.append(
+                    SharedStepScenarioDtoStepsInner(
+                        actual_instance=AttachmentStepDtoWithName(
+                            type="AttachmentStepDto", attachment_id=row.id, name=row.name
+                        )
+                    )
+                )
+            children.extend(nested)
+            scenario.append(
+                SharedStepScenarioDtoStepsInner(
+                    actual_instance=StepWithExpected(
+                        type="BodyStepDto",
+                        body=action,
+                        expected_result=str(expected) if expected else None,
+                        steps=children,
+                    )
+                )
+            )
+
+        return scenario
 
     async def _upload_attachment(self, shared_step_id: int, att: dict[str, str]) -> SharedStepAttachmentRowDto:
         """Upload attachment for shared step."""
@@ -361,22 +405,6 @@ class SharedStepService:
             raise AllureAPIError("No attachment rows returned after upload")
         return rows[0]
 
-    def _build_scenario_step_dto(
-        self,
-        shared_step_id: int,
-        body: str | None = None,
-        attachment_id: int | None = None,
-        parent_id: int | None = None,
-    ) -> ScenarioStepCreateDto:
-        """Build ScenarioStepCreateDto."""
-        try:
-            return ScenarioStepCreateDto(
-                shared_step_id=shared_step_id, body=body, attachment_id=attachment_id, parent_id=parent_id
-            )
-        except PydanticValidationError as e:
-            hint = generate_schema_hint(ScenarioStepCreateDto)
-            raise AllureValidationError(f"Invalid step data: {e}", suggestions=[hint]) from e
-
     # ==========================================
     # Validation Methods
     # ==========================================
@@ -1,7 +1,8 @@
 import logging
 import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from typing import TypedDict, cast
+from typing import TypedDict
 
 from pydantic import ValidationError as PydanticValidationError
 
@@ -11,7 +12,13 @@ from src.client import (
     StepWithExpected,
     TestCaseDtoWithCF,
 )
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError, TestCaseNotFoundError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+    TestCaseNotFoundError,
+)
 from src.client.generated.exceptions import ApiException
 from src.client.generated.models import (
     CustomFieldDto,
@@ -19,8 +26,11 @@ from src.client.generated.models import (
     CustomFieldValueWithCfDto,
     ExternalLinkDto,
     IssueDto,
+    ScenarioStepCreatedResponseDto,
     ScenarioStepCreateDto,
+    ScenarioStepPatchDto,
     SharedStepScenarioDtoStepsInner,
+    TestCaseAttachmentRowDto,
     TestCaseBulkIssueDto,
     TestCaseCreateV2Dto,
     TestCaseDto,
@@ -30,14 +40,28 @@ from src.client.generated.models import (
     TestTagDto,
 )
 from src.client.generated.models.attachment_step_dto import AttachmentStepDto
-from src.client.generated.models.body_step_dto import BodyStepDto
-from src.client.generated.models.expected_body_step_dto import ExpectedBodyStepDto
+from src.client.generated.models.page_test_case_row_dto import PageTestCaseRowDto
 from src.client.generated.models.shared_step_step_dto import SharedStepStepDto
 from src.client.generated.models.test_case_patch_v2_dto import TestCasePatchV2Dto
-from src.client.generated.models.test_case_scenario_v2_dto import TestCaseScenarioV2Dto
+from src.client.pagination import iter_page_items
 from src.services.attachment_service import AttachmentService
+from src.services.custom_field_cache import (
+    invalidate_resolved_custom_fields,
+    resolved_custom_field_cache,
+    resolved_custom_fields_key,
+)
+from src.services.scenario_diff import (
+    DeleteStep,
+    InsertSteps,
+    PatchStep,
+    ScenarioOperation,
+    diff_scenario,
+    has_expected_results,
+    scenario_requests,
+)
 from src.services.test_layer_service import TestLayerService
 from src.utils.schema_hint import generate_schema_hint
+from src.utils.tracing import traced
 
 # Maximum lengths based on API constraints
 MAX_NAME_LENGTH = 255
@@ -45,6 +69,9 @@ MAX_PRECONDITION_LENGTH = 1000
 MAX_TAG_LENGTH = 255
 MAX_BODY_LENGTH = 10000  # Step body limit
 
+# Step edits above this many requests are replaced by one write of the whole scenario
+MAX_SCENARIO_EDIT_REQUESTS = 10
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +82,8 @@ class ResolvedCustomFieldInfo(TypedDict):
     single_select: bool | None
     values: list[str]
     values_map: dict[str, int | None]
+    # False when the allowed values could not be fetched; such mappings are not cached.
+    values_loaded: bool
 
 
 class CustomFieldDisplay(TypedDict):
@@ -88,6 +117,17 @@ class TestCaseUpdate:
     integration_name: str | None = None
 
 
+@dataclass(frozen=True)
+class _ScenarioUpdate:
+    """Desired scenario of a test case and the step edits that produce it.
+
+    ``operations`` is None when the current scenario could not be read or edited in place.
+    """
+
+    steps: list[SharedStepScenarioDtoStepsInner]
+    operations: list[ScenarioOperation] | None
+
+
 @dataclass
 class DeleteResult:
     """Result of a delete operation."""
@@ -98,6 +138,18 @@ class DeleteResult:
     name: str | None = None
 
 
+@dataclass
+class ArchivedCleanupResult:
+    """Result of permanently deleting archived test cases.
+
+    ``partial`` is set when the tool deadline ran out first; running the cleanup
+    again continues with the test cases that are still archived.
+    """
+
+    deleted_count: int
+    partial: bool = False
+
+
 class TestCaseService:
     """Service for managing Test Cases in Allure TestOps."""
 
@@ -114,6 +166,7 @@ class TestCaseService:
         # {project_id: {name: {"id": int, "values": list[str]}}}
         self._cf_cache: dict[int, dict[str, ResolvedCustomFieldInfo]] = {}
 
+    @traced
     async def create_test_case(  # noqa: C901
         self,
         name: str,
@@ -242,14 +295,10 @@ class TestCaseService:
         if test_case_id is None:
             raise AllureValidationError("Failed to get test case ID from created test case")
 
-        # 6. Add steps and attachments with rollback on failure
+        # 6. Write steps and attachments with rollback on failure
         try:
-            # Add steps one by one via separate API calls
-            last_step_id: int | None = None
-            last_step_id = await self._add_steps(test_case_id, steps, last_step_id)
-
-            # Add global attachments (appended at end of steps)
-            await self._add_global_attachments(test_case_id, attachments, last_step_id)
+            # Whole scenario in one request; global attachments are appended after the steps
+            await self._write_scenario(test_case_id, steps, attachments)
 
             # Add issue links
             if issues:
@@ -344,6 +393,7 @@ class TestCaseService:
         await self._client.update_test_case_custom_fields(test_case_id, resolved_dtos)
         return resolved_dtos
 
+    @traced
     async def update_test_case(self, test_case_id: int, data: TestCaseUpdate) -> TestCaseDto:  # noqa: C901
         """Update an existing test case.
 
@@ -494,8 +544,8 @@ class TestCaseService:
                 has_changes = True
 
         # 6. Handle Scenario
-        scenario_dto_v2 = await self._prepare_scenario_update(test_case_id, data)
-        if scenario_dto_v2:
+        scenario_update = await self._prepare_scenario_update(test_case_id, data)
+        if scenario_update:
             has_changes = True
 
         if not has_changes:
@@ -509,9 +559,9 @@ class TestCaseService:
             hint = generate_schema_hint(TestCasePatchV2Dto)
             raise AllureValidationError(f"Invalid update data: {e}", suggestions=[hint]) from e
 
-        # 8. Apply Scenario Re-creation
-        if scenario_dto_v2 and scenario_dto_v2.steps is not None:
-            await self._recreate_scenario(test_case_id, scenario_dto_v2.steps)
+        # 8. Apply Scenario Changes
+        if scenario_update:
+            await self._apply_scenario_update(test_case_id, scenario_update)
 
         updated_case = await self.get_test_case(test_case_id)
         return updated_case if updated_case is not None else current_case
@@ -558,58 +608,49 @@ class TestCaseService:
             message=f"Test Case {test_case_id}: '{test_case.name}' has been archived.",
         )
 
-    async def cleanup_archived(self, page_size: int = 100) -> int:
-        """Permanently delete archived/deleted test cases from the current project."""
+    async def cleanup_archived(self, page_size: int = 100) -> ArchivedCleanupResult:
+        """Permanently delete archived/deleted test cases from the current project.
+
+        Stops early, with a partial result, when the tool deadline runs out.
+        """
         self._validate_project_id(self._project_id)
         if not isinstance(page_size, int) or page_size <= 0:
             raise AllureValidationError("page_size must be a positive integer")
 
-        archived_ids: list[int] = []
-        page = 0
-        while True:
-            result_page = await self._client.list_deleted_test_cases(
-                project_id=self._project_id,
-                page=page,
-                size=page_size,
-            )
-            rows = result_page.content or []
-            if not rows:
-                break
-
-            for row in rows:
-                if row.id is None:
-                    continue
-                archived_ids.append(row.id)
-
-            if len(rows) < page_size:
-                break
-            page += 1
+        async def _fetch(page: int) -> PageTestCaseRowDto:
+            return await self._client.list_deleted_test_cases(project_id=self._project_id, page=page, size=page_size)
 
+        archived_ids: list[int] = []
         deleted_count = 0
-        for test_case_id in dict.fromkeys(archived_ids):
-            try:
-                await self._client.delete_test_case(test_case_id, force=True)
-                deleted_count += 1
-            except AllureNotFoundError:
-                logger.debug("Test case %s was already permanently removed.", test_case_id)
+        try:
+            async for row in iter_page_items(_fetch, lambda result_page: result_page.content, page_size=page_size):
+                if row.id is not None:
+                    archived_ids.append(row.id)
 
-        return deleted_count
+            for test_case_id in dict.fromkeys(archived_ids):
+                try:
+                    await self._client.delete_test_case(test_case_id, force=True)
+                    deleted_count += 1
+                except AllureNotFoundError:
+                    logger.debug("Test case %s was already permanently removed.", test_case_id)
+        except AllureDeadlineExceededError:
+            logger.warning("Tool deadline reached after deleting %s archived test case(s)", deleted_count)
+            return ArchivedCleanupResult(deleted_count=deleted_count, partial=True)
+
+        return ArchivedCleanupResult(deleted_count=deleted_count)
 
     async def add_shared_step_to_case(
         self,
         test_case_id: int,
         shared_step_id: int,
         position: int | None = None,
-    ) -> TestCaseDto:
+    ) -> None:
         """Add a shared step reference to a test case.
 
         Args:
             test_case_id: Target test case ID.
             shared_step_id: ID of the shared step to link.
             position: Optional 0-indexed position. None = append.
-
-        Returns:
-            Updated test case DTO.
         """
         # 1. Determine position (after_id)
         scen = await self._client.get_test_case_scenario(test_case_id)
@@ -646,25 +687,20 @@ class TestCaseService:
             after_id=after_id,
         )
 
-        return await self.get_test_case(test_case_id)
-
     async def remove_shared_step_from_case(
         self,
         test_case_id: int,
         shared_step_id: int,
-    ) -> TestCaseDto:
+    ) -> None:
         """Remove all references to a shared step from a test case.
 
         Args:
             test_case_id: Target test case ID.
             shared_step_id: ID of the shared step to unlink.
-
-        Returns:
-            Updated test case DTO.
         """
         scen = await self._client.get_test_case_scenario(test_case_id)
         if not scen or not scen.steps:
-            return await self.get_test_case(test_case_id)
+            return
 
         steps_to_delete = []
         for step in scen.steps:
@@ -679,8 +715,6 @@ class TestCaseService:
             if step_id:
                 await self._client.delete_scenario_step(step_id)
 
-        return await self.get_test_case(test_case_id)
-
     async def add_issues_to_test_case(
         self,
         test_case_id: int,
@@ -967,42 +1001,55 @@ class TestCaseService:
 
         return patch_kwargs, has_changes
 
-    async def _prepare_scenario_update(self, test_case_id: int, data: TestCaseUpdate) -> TestCaseScenarioV2Dto | None:
-        """Prepare the scenario DTO if steps or attachments need updating."""
+    async def _prepare_scenario_update(self, test_case_id: int, data: TestCaseUpdate) -> _ScenarioUpdate | None:
+        """Prepare the scenario changes if steps or attachments need updating.
+
+        Returns None when the requested scenario matches the current one.
+        """
         if data.steps is None and data.attachments is None:
             return None
 
-        existing_steps = await self._get_existing_steps_to_preserve(test_case_id, data)
+        current_steps = await self._get_current_scenario_steps(test_case_id)
+        existing_steps = self._get_existing_steps_to_preserve(current_steps or [], data)
         final_steps_list = await self._build_final_steps_list(test_case_id, data, existing_steps)
 
-        return TestCaseScenarioV2Dto(steps=final_steps_list)
-
-    async def _get_existing_steps_to_preserve(
-        self, test_case_id: int, data: TestCaseUpdate
-    ) -> list[SharedStepScenarioDtoStepsInner]:
-        """Fetch existing steps that should be preserved based on what's being updated."""
-        if data.steps is not None and data.attachments is not None:
-            return []  # Both provided, nothing to preserve
+        if current_steps is None:
+            return _ScenarioUpdate(steps=final_steps_list, operations=None)
+        operations = diff_scenario(current_steps, final_steps_list)
+        if operations == []:
+            return None
+        if not current_steps:
+            # Nothing to keep, so the scenario is written in one request
+            operations = None
+        return _ScenarioUpdate(steps=final_steps_list, operations=operations)
 
-        existing_steps: list[SharedStepScenarioDtoStepsInner] = []
+    async def _get_current_scenario_steps(self, test_case_id: int) -> list[SharedStepScenarioDtoStepsInner] | None:
+        """Fetch the current scenario steps, or None if they cannot be read."""
         try:
             current_scenario = await self._client.get_test_case_scenario(test_case_id)
-            if not current_scenario or not current_scenario.steps:
-                return existing_steps
-
-            for step in current_scenario.steps:
-                if not step.actual_instance:
-                    continue
-                is_attachment = isinstance(step.actual_instance, AttachmentStepDto)
-                # Preserve attachments if data.attachments is None
-                # Preserve body steps if data.steps is None
-                if is_attachment and data.attachments is None:
-                    existing_steps.append(step)
-                elif not is_attachment and data.steps is None:
-                    existing_steps.append(step)
-        except Exception:  # noqa: S110
-            pass
+        except AllureDeadlineExceededError:
+            raise
+        except Exception:
+            logger.debug("Could not read the scenario of test case %s", test_case_id, exc_info=True)
+            return None
+        if not current_scenario:
+            return None
+        return [step for step in current_scenario.steps or [] if step.actual_instance]
 
+    @staticmethod
+    def _get_existing_steps_to_preserve(
+        current_steps: list[SharedStepScenarioDtoStepsInner], data: TestCaseUpdate
+    ) -> list[SharedStepScenarioDtoStepsInner]:
+        """Select the current steps that should be preserved based on what's being updated."""
+        existing_steps: list[SharedStepScenarioDtoStepsInner] = []
+        for step in current_steps:
+            is_attachment = isinstance(step.actual_instance, AttachmentStepDto)
+            # Preserve attachments if data.attachments is None
+            # Preserve body steps if data.steps is None
+            if is_attachment and data.attachments is None:
+                existing_steps.append(step)
+            elif not is_attachment and data.steps is None:
+                existing_steps.append(step)
         return existing_steps
 
     async def _build_final_steps_list(
@@ -1011,12 +1058,20 @@ class TestCaseService:
         data: TestCaseUpdate,
         existing_steps: list[SharedStepScenarioDtoStepsInner],
     ) -> list[SharedStepScenarioDtoStepsInner]:
-        """Build the final list of steps combining new and preserved steps."""
+        """Build the final list of steps combining new and preserved steps.
+
+        All new step and test case level attachments are uploaded concurrently first.
+        """
+        uploads = iter(
+            await self._attachment_service.upload_attachments(
+                test_case_id, [*self._collect_step_attachments(data.steps or []), *(data.attachments or [])]
+            )
+        )
         final_steps: list[SharedStepScenarioDtoStepsInner] = []
 
         # Add new or existing body steps
         if data.steps is not None:
-            final_steps.extend(await self._build_steps_dtos_from_list(test_case_id, data.steps))
+            final_steps.extend(self._build_steps_dtos_from_list(data.steps, uploads))
         else:
             for step in existing_steps:
                 if step.actual_instance and not isinstance(step.actual_instance, AttachmentStepDto):
@@ -1024,8 +1079,8 @@ class TestCaseService:
 
         # Add new or existing attachments
         if data.attachments is not None:
-            for att in data.attachments:
-                row = await self._attachment_service.upload_attachment(test_case_id, att)
+            for _ in data.attachments:
+                row = next(uploads)
                 final_steps.append(
                     SharedStepScenarioDtoStepsInner(
                         actual_instance=AttachmentStepDto(type="AttachmentStepDto", attachment_id=row.id, name=row.name)
@@ -1038,35 +1093,39 @@ class TestCaseService:
 
         return final_steps
 
-    async def _build_steps_dtos_from_list(
-        self, test_case_id: int, steps: list[dict[str, object]]
+    @staticmethod
+    def _step_attachments(step: dict[str, object]) -> list[dict[str, str]]:
+        """Attachment definitions of a single step."""
+        attachments = step.get("attachments")
+        if not attachments or not isinstance(attachments, list):
+            return []
+        return [attachment for attachment in attachments if isinstance(attachment, dict)]
+
+    def _collect_step_attachments(self, steps: list[dict[str, object]]) -> list[dict[str, str]]:
+        """Step attachment definitions in the order ``_build_steps_dtos_from_list`` uses them."""
+        collected: list[dict[str, str]] = []
+        for s in steps:
+            collected.extend(self._step_attachments(s))
+            nested_steps_data = s.get("steps")
+            if nested_steps_data and isinstance(nested_steps_data, list):
+                collected.extend(self._collect_step_attachments(nested_steps_data))
+        return collected
+
+    def _build_steps_dtos_from_list(
+        self, steps: list[dict[str, object]], uploads: Iterator[TestCaseAttachmentRowDto]
     ) -> list[SharedStepScenarioDtoStepsInner]:
-        """Convert list of step dicts to DTOs for PATCH."""
+        """Convert list of step dicts to DTOs, taking uploaded step attachments from ``uploads`` in order."""
         dtos = []
         for s in steps:
             action = str(s.get("action", ""))
             expected = str(s.get("expected", ""))
-            step_attachments = s.get("attachments", [])
-
-            children: list[SharedStepScenarioDtoStepsInner] = []
-
-            if step_attachments and isinstance(step_attachments, list):
-                for sa in step_attachments:
-                    if isinstance(sa, dict):
-                        att_row = await self._attachment_service.upload_attachment(test_case_id, sa)
-                        children.append(
-                            SharedStepScenarioDtoStepsInner(
-                                actual_instance=AttachmentStepDtoWithName(
-                                    type="AttachmentStepDto", attachment_id=att_row.id, name=att_row.name
-                                )
-                            )
-                        )
+
+            children = [self._attachment_step(next(uploads)) for _ in self._step_attachments(s)]
 
             # Recursive steps processing
             nested_steps_data = s.get("steps")
             if nested_steps_data and isinstance(nested_steps_data, list):
-                nested_dtos = await self._build_steps_dtos_from_list(test_case_id, nested_steps_data)
-                children.extend(nested_dtos)
+                children.extend(self._build_steps_dtos_from_list(nested_steps_data, uploads))
 
             dtos.append(
                 SharedStepScenarioDtoStepsInner(
@@ -1222,7 +1281,7 @@ class TestCaseService:
         if not isinstance(test_layer_id, int) or test_layer_id < 0:
             raise AllureValidationError("Test layer ID must be a positive integer or 0 (to unset)")
 
-    def _format_available_layers(self, layers: list[TestLayerDto]) -> str:
+    def _format_available_layers(self, layers: Sequence[TestLayerDto]) -> str:
         display_lines: list[str] = []
         for layer in layers[:10]:
             display_lines.append(f"ID: {layer.id}, Name: {layer.name}")
@@ -1230,29 +1289,35 @@ class TestCaseService:
             display_lines.append("(none)")
         return "\n".join(display_lines)
 
-    async def _validate_test_layer_exists(self, test_layer_id: int, project_id: int) -> None:
+    async def _find_test_layer(self, test_layer_id: int, project_id: int) -> TestLayerDto | None:
         try:
-            await self._test_layer_service.get_test_layer(test_layer_id)
-        except AllureNotFoundError as e:
-            layers = await self._test_layer_service.list_test_layers(page=0, size=100)
-            available_layers = self._format_available_layers(layers)
+            return await self._test_layer_service.find_test_layer(test_layer_id)
+        except AllureDeadlineExceededError:
+            raise
+        except AllureAPIError as e:
+            raise AllureValidationError(
+                f"Unable to validate test layer ID {test_layer_id} for project {project_id}: {e}",
+                suggestions=["Use list_test_layers to find valid IDs", "Check API connectivity and permissions"],
+            ) from e
+
+    async def _available_test_layers(self) -> str:
+        catalogue = await self._test_layer_service.get_test_layer_catalogue()
+        return self._format_available_layers(catalogue.layers)
+
+    async def _validate_test_layer_exists(self, test_layer_id: int, project_id: int) -> None:
+        if await self._find_test_layer(test_layer_id, project_id) is None:
             raise AllureValidationError(
                 "\n".join(
                     [
                         f"Warning: Test layer ID {test_layer_id} does not exist in project {project_id}.",
                         "Test case update was not performed.",
                         "Available test layers (first 10):",
-                        available_layers,
+                        await self._available_test_layers(),
                         "Use list_test_layers(page=..., size=...) to see more.",
                         "To proceed without a test layer, omit test_layer_id.",
                     ]
                 )
-            ) from e
-        except AllureAPIError as e:
-            raise AllureValidationError(
-                f"Unable to validate test layer ID {test_layer_id} for project {project_id}: {e}",
-                suggestions=["Use list_test_layers to find valid IDs", "Check API connectivity and permissions"],
-            ) from e
+            )
 
     async def _validate_test_layer(
         self,
@@ -1270,42 +1335,31 @@ class TestCaseService:
             if test_layer_id == 0:
                 return 0
 
-            try:
-                await self._test_layer_service.get_test_layer(test_layer_id)
-            except AllureNotFoundError as e:
-                layers = await self._test_layer_service.list_test_layers(page=0, size=100)
-                available_layers = self._format_available_layers(layers)
+            if await self._find_test_layer(test_layer_id, self._project_id) is None:
                 raise AllureValidationError(
                     "\n".join(
                         [
                             f"Warning: Test layer ID {test_layer_id} does not exist in project {self._project_id}.",
                             "Test case creation was not performed.",
                             "Available test layers (first 10):",
-                            available_layers,
+                            await self._available_test_layers(),
                             "Use list_test_layers(page=..., size=...) to see more.",
                             "To proceed without a test layer, omit test_layer_id/test_layer_name.",
                         ]
                     )
-                ) from e
-            except AllureAPIError as e:
-                raise AllureValidationError(
-                    f"Unable to validate test layer ID {test_layer_id} for project {self._project_id}: {e}",
-                    suggestions=["Use list_test_layers to find valid IDs", "Check API connectivity and permissions"],
-                ) from e
+                )
             return test_layer_id
 
         if test_layer_name is not None:
-            layers = await self._test_layer_service.list_test_layers(page=0, size=100)
-            matches = [layer for layer in layers if layer.name == test_layer_name]
+            matches = await self._test_layer_service.find_test_layers_by_name(test_layer_name)
             if len(matches) == 0:
-                available_layers = self._format_available_layers(layers)
                 raise AllureValidationError(
                     "\n".join(
                         [
                             f"Warning: Test layer name '{test_layer_name}' not found.",
                             "Test case creation was not performed.",
                             "Available test layers (first 10):",
-                            available_layers,
+                            await self._available_test_layers(),
                             "Use list_test_layers(page=..., size=...) to see more.",
                             "To proceed without a test layer, omit test_layer_id/test_layer_name.",
                         ]
@@ -1346,17 +1400,34 @@ class TestCaseService:
         return tag_dtos
 
     async def _get_resolved_custom_fields(self, project_id: int) -> dict[str, ResolvedCustomFieldInfo]:
-        """Get or fetch custom field name-to-info mapping for a project."""
+        """Get or fetch custom field name-to-info mapping for a project.
+
+        Mappings are shared across tool calls through the process-wide custom field cache.
+        """
         if project_id in self._cf_cache:
             return self._cf_cache[project_id]
-        return await self._fetch_resolved_custom_fields(project_id)
+        mapping = await resolved_custom_field_cache().get(
+            resolved_custom_fields_key(self._client.get_base_url(), project_id),
+            lambda: self._fetch_resolved_custom_fields(project_id),
+            lambda: self._reload_resolved_custom_fields(project_id),
+            lambda mapping: all(info["values_loaded"] for info in mapping.values()),
+        )
+        self._cf_cache[project_id] = mapping
+        return mapping
 
     async def refresh_resolved_custom_fields(self, project_id: int) -> dict[str, ResolvedCustomFieldInfo]:
         """Refresh cached custom field name-to-info mapping for a project."""
         if project_id in self._cf_cache:
             del self._cf_cache[project_id]
-        return await self._fetch_resolved_custom_fields(project_id)
+        invalidate_resolved_custom_fields(self._client.get_base_url(), project_id)
+        return await self._get_resolved_custom_fields(project_id)
+
+    async def _reload_resolved_custom_fields(self, project_id: int) -> dict[str, ResolvedCustomFieldInfo]:
+        """Fetch the mapping through a client of its own, for reloads that outlive this service's client."""
+        async with self._client.clone() as client:
+            return await TestCaseService(client)._fetch_resolved_custom_fields(project_id)
 
+    @traced
     async def _fetch_resolved_custom_fields(self, project_id: int) -> dict[str, ResolvedCustomFieldInfo]:
         # Use the client wrapper method for consistent error handling and response processing
         cfs = await self._client.get_custom_fields_with_values(project_id)
@@ -1392,6 +1463,7 @@ class TestCaseService:
                         else None,
                         "values": values_list,
                         "values_map": values_map,
+                        "values_loaded": cf_with_values.values is not None,
                     }
         self._cf_cache[project_id] = mapping
         return mapping
@@ -1577,229 +1649,186 @@ class TestCaseService:
     # Step Creation Methods
     # ==========================================
 
-    async def _add_steps(
+    @traced
+    async def _write_scenario(
         self,
         test_case_id: int,
         steps: list[dict[str, object]] | None,
-        last_step_id: int | None,
-    ) -> int | None:
-        """Add steps to a test case using separate API calls.
+        attachments: list[dict[str, str]] | None,
+    ) -> list[int]:
+        """Write the steps and test case level attachments of a new test case.
+
+        Attachments are uploaded concurrently first, then the whole scenario tree is sent with
+        ``set_test_case_scenario`` instead of one ``create_scenario_step`` call per
+        action and attachment. A scenario write cannot carry expected results, so
+        scenarios with expected results are created step by step.
 
         Args:
-            test_case_id: Test case ID to add steps to.
-            steps: List of step definitions.
-            last_step_id: ID of the last created step (for ordering).
+            test_case_id: Test case ID to write the scenario of.
+            steps: List of step definitions; steps without an action are skipped.
+            attachments: List of test case level attachments, appended after the steps.
 
         Returns:
-            The ID of the last created step, or None if no steps were created.
+            IDs of the created steps, depth-first in scenario order.
         """
-        if not steps:
-            return last_step_id
-
-        for s in steps:
-            action = str(s.get("action", ""))
-            expected = str(s.get("expected", ""))
-            step_attachments = cast(list[dict[str, str]], s.get("attachments", []))
-
-            current_parent_id: int | None = None
-            last_child_id: int | None = None
+        kept_steps = [s for s in steps or [] if s.get("action")]
+        step_attachments = [self._step_attachments(s) for s in kept_steps]
+        uploads = iter(
+            await self._attachment_service.upload_attachments(
+                test_case_id, [*(sa for group in step_attachments for sa in group), *(attachments or [])]
+            )
+        )
 
-            # Action Step (body step)
-            if action:
-                step_dto = self._build_scenario_step_dto(test_case_id=test_case_id, body=action)
-                response = await self._client.create_scenario_step(
-                    test_case_id=test_case_id,
-                    step=step_dto,
-                    after_id=last_step_id,
-                    with_expected_result=bool(expected),
+        scenario: list[SharedStepScenarioDtoStepsInner] = []
+        for s, group in zip(kept_steps, step_attachments, strict=True):
+            expected = s.get("expected")
+            scenario.append(
+                SharedStepScenarioDtoStepsInner(
+                    actual_instance=StepWithExpected(
+                        type="BodyStepDto",
+                        body=str(s["action"]),
+                        expected_result=str(expected) if expected else None,
+                        steps=[self._attachment_step(next(uploads)) for _ in group],
+                    )
                 )
-                current_parent_id = response.created_step_id
-                last_step_id = current_parent_id
-
-                # If expected result logic matches HAR:
-                # 1. We called create with withExpectedResult=True
-                # 2. We get response with scenario mapping
-                # 3. We find expectedResultId for our step
-                # 4. We add the expected result text as a child of that expectedResultId
-                if (
-                    expected
-                    and current_parent_id is not None
-                    and response.scenario
-                    and response.scenario.scenario_steps
-                ):
-                    # Find our step in the scenario to get expectedResultId
-                    step_info = response.scenario.scenario_steps.get(str(current_parent_id))
-                    if step_info and step_info.expected_result_id:
-                        await self._client.create_scenario_step(
-                            test_case_id=test_case_id,
-                            step=self._build_scenario_step_dto(
-                                test_case_id=test_case_id,
-                                body=expected,
-                                parent_id=step_info.expected_result_id,
-                            ),
-                            after_id=None,
-                        )
+            )
+        scenario.extend(self._attachment_step(row) for row in uploads)
 
-                # Step Attachments (added as children of the action step)
-                if step_attachments and isinstance(step_attachments, list):
-                    for sa in step_attachments:
-                        if isinstance(sa, dict):
-                            attachment_row = await self._attachment_service.upload_attachment(test_case_id, sa)
-                            attachment_step_dto = self._build_scenario_step_dto(
-                                test_case_id=test_case_id,
-                                attachment_id=attachment_row.id,
-                                parent_id=current_parent_id,
-                            )
-                            attachment_response = await self._client.create_scenario_step(
-                                test_case_id=test_case_id,
-                                step=attachment_step_dto,
-                                after_id=last_child_id,
-                            )
-                            last_child_id = attachment_response.created_step_id
-
-        return last_step_id
+        if not scenario:
+            return []
+        if has_expected_results(scenario):
+            return await self._create_scenario_steps(test_case_id, scenario)
+        return await self._client.set_test_case_scenario(test_case_id, scenario)
 
-    async def _recreate_scenario(self, test_case_id: int, steps: list[SharedStepScenarioDtoStepsInner]) -> None:
-        """Recreate the entire scenario step by step."""
-        # 1. Fetch current scenario for rollback in case of failure
-        try:
-            previous_scenario = await self._client.get_test_case_scenario(test_case_id)
-        except Exception:
-            # If we can't get current scenario, we can't rollback to it. Proceed with caution.
-            previous_scenario = None
+    @staticmethod
+    def _attachment_step(row: TestCaseAttachmentRowDto) -> SharedStepScenarioDtoStepsInner:
+        """Scenario step referencing an uploaded attachment."""
+        return SharedStepScenarioDtoStepsInner(
+            actual_instance=AttachmentStepDtoWithName(type="AttachmentStepDto", attachment_id=row.id, name=row.name)
+        )
 
-        try:
-            # 2. Clear existing scenario
-            await self._client.update_test_case(
-                test_case_id, TestCasePatchV2Dto(scenario=TestCaseScenarioV2Dto(steps=[]))
-            )
+    @traced
+    async def _apply_scenario_update(self, test_case_id: int, update: _ScenarioUpdate) -> None:
+        """Apply the step edits of a scenario update, or rewrite the whole scenario.
 
-            # 3. Recursively add steps
-            last_step_id: int | None = None
-            for step in steps:
-                last_step_id = await self._recursive_add_step(test_case_id, step, after_id=last_step_id)
+        Small edits keep the IDs of unchanged steps. Edits that would take more than
+        ``MAX_SCENARIO_EDIT_REQUESTS`` requests, or that fail part way, are replaced by
+        a single write of the desired scenario.
+        """
+        operations = update.operations
+        if operations is None or scenario_requests(operations) > MAX_SCENARIO_EDIT_REQUESTS:
+            await self._recreate_scenario(test_case_id, update.steps)
+            return
 
+        try:
+            for operation in operations:
+                await self._apply_scenario_operation(test_case_id, operation)
+        except AllureDeadlineExceededError:
+            raise
         except Exception as e:
-            # Rollback Attempt
-            if previous_scenario and previous_scenario.steps:
-                try:
-                    # Clear any partial progress
-                    await self._client.update_test_case(
-                        test_case_id, TestCasePatchV2Dto(scenario=TestCaseScenarioV2Dto(steps=[]))
-                    )
-                    # Attempt to restore previous steps
-                    # Note: We can only best-effort restore. IDs will change.
-                    # We need to convert TestCaseScenarioDto steps -> SharedStepScenarioDtoStepsInner
-                    # This is complex because Read DTOs != Write DTOs.
-                    # For now, we raise a clear error indicating data was lost/partial.
-                    # Ideally, we would have logic to convert Read -> Write DTOs, but that's a larger feature.
-                    # Given the scope, raising a critical error is better than silent failure.
-                    pass
-                except Exception as rollback_error:
-                    # We log this as a warning because the original error will be raised anyway
-                    logger.warning(
-                        f"Rollback failed during scenario recreation. Partial data may persist. Error: {rollback_error}"
-                    )
-
-            raise AllureAPIError(
-                f"Failed to recreate scenario. Steps may be partially applied or lost. Error: {e}"
-            ) from e
+            logger.warning("Editing the scenario of test case %s failed, rewriting it: %s", test_case_id, e)
+            await self._recreate_scenario(test_case_id, update.steps)
+
+    async def _apply_scenario_operation(self, test_case_id: int, operation: ScenarioOperation) -> None:
+        """Send the step requests of one scenario edit."""
+        if isinstance(operation, DeleteStep):
+            await self._client.delete_scenario_step(operation.step_id)
+        elif isinstance(operation, PatchStep):
+            patch = ScenarioStepPatchDto(body=operation.body, expected_result=operation.expected_result)
+            await self._client.patch_test_case_scenario_step(operation.step_id, patch)
+        elif isinstance(operation, InsertSteps):
+            after_id = operation.after_id
+            for step in operation.steps:
+                after_id = await self._insert_scenario_step(test_case_id, step, operation.parent_id, after_id)
+
+    async def _create_scenario_steps(
+        self, test_case_id: int, steps: list[SharedStepScenarioDtoStepsInner]
+    ) -> list[int]:
+        """Create the steps of an empty scenario one at a time, returning their IDs depth-first."""
+        created: list[int] = []
+        after_id: int | None = None
+        for step in steps:
+            after_id = await self._insert_scenario_step(test_case_id, step, None, after_id, created)
+        return created
 
-    async def _recursive_add_step(
+    async def _insert_scenario_step(
         self,
         test_case_id: int,
         step: SharedStepScenarioDtoStepsInner,
-        parent_id: int | None = None,
-        after_id: int | None = None,
-    ) -> int | None:
-        """Recursively add a step and its children."""
-        if not step.actual_instance:
-            return after_id
+        parent_id: int | None,
+        after_id: int | None,
+        created: list[int] | None = None,
+    ) -> int:
+        """Create a step with its expected result and children, returning the new step ID.
 
+        The IDs of the step and its children are appended to ``created`` depth-first.
+        """
         instance = step.actual_instance
-        created_id = None
-
-        # Determine step type and create
-        if isinstance(instance, BodyStepDto):
-            expected_result = getattr(instance, "expected_result", None)
-            step_dto = self._build_scenario_step_dto(test_case_id=test_case_id, body=instance.body, parent_id=parent_id)
-            resp = await self._client.create_scenario_step(
-                test_case_id=test_case_id,
-                step=step_dto,
-                after_id=after_id,
-                with_expected_result=bool(expected_result),
-            )
-            created_id = resp.created_step_id
-
-            if expected_result and created_id is not None and resp.scenario and resp.scenario.scenario_steps:
-                step_info = resp.scenario.scenario_steps.get(str(created_id))
-                if step_info and step_info.expected_result_id:
-                    await self._client.create_scenario_step(
-                        test_case_id=test_case_id,
-                        step=self._build_scenario_step_dto(
-                            test_case_id=test_case_id,
-                            body=expected_result,
-                            parent_id=step_info.expected_result_id,
-                        ),
-                        after_id=None,
-                    )
-
-            # Add children (steps may not be a defined field in generated DTO,
-            # but we set it via model_construct)
-            child_steps = getattr(instance, "steps", None)
-            if child_steps:
-                last_child_id = None
-                for child in child_steps:
-                    last_child_id = await self._recursive_add_step(
-                        test_case_id, child, parent_id=created_id, after_id=last_child_id
-                    )
-
-        elif isinstance(instance, ExpectedBodyStepDto):
-            step_dto = self._build_scenario_step_dto(test_case_id=test_case_id, body=instance.body, parent_id=parent_id)
-            resp = await self._client.create_scenario_step(test_case_id=test_case_id, step=step_dto, after_id=after_id)
-            created_id = resp.created_step_id
-
-        elif isinstance(instance, AttachmentStepDto):
-            step_dto = self._build_scenario_step_dto(
-                test_case_id=test_case_id, attachment_id=instance.attachment_id, parent_id=parent_id
-            )
-            resp = await self._client.create_scenario_step(test_case_id=test_case_id, step=step_dto, after_id=after_id)
-            created_id = resp.created_step_id
+        expected_result = getattr(instance, "expected_result", None)
+        step_dto = self._build_scenario_step_dto(
+            test_case_id,
+            body=getattr(instance, "body", None),
+            attachment_id=getattr(instance, "attachment_id", None),
+            shared_step_id=getattr(instance, "shared_step_id", None),
+            parent_id=parent_id,
+        )
+        response = await self._client.create_scenario_step(
+            test_case_id=test_case_id, step=step_dto, after_id=after_id, with_expected_result=bool(expected_result)
+        )
+        step_id = response.created_step_id
+        if step_id is None:
+            raise AllureAPIError("Scenario step was created without an ID")
+        if created is not None:
+            created.append(step_id)
 
-        elif isinstance(instance, SharedStepStepDto):
-            step_dto = self._build_scenario_step_dto(
-                test_case_id=test_case_id, shared_step_id=instance.shared_step_id, parent_id=parent_id
-            )
-            resp = await self._client.create_scenario_step(test_case_id=test_case_id, step=step_dto, after_id=after_id)
-            created_id = resp.created_step_id
+        if expected_result:
+            await self._add_expected_result(test_case_id, response, step_id, step_dto.body, expected_result)
 
-        return created_id if created_id else after_id
+        child_after_id: int | None = None
+        for child in getattr(instance, "steps", None) or []:
+            child_after_id = await self._insert_scenario_step(test_case_id, child, step_id, child_after_id, created)
+        return step_id
 
-    async def _add_global_attachments(
+    async def _add_expected_result(
         self,
         test_case_id: int,
-        attachments: list[dict[str, str]] | None,
-        last_step_id: int | None,
+        response: ScenarioStepCreatedResponseDto,
+        step_id: int,
+        body: str | None,
+        expected_result: str,
     ) -> None:
-        """Add global attachments to a test case as attachment steps.
+        """Write the expected result of a step created with ``with_expected_result``.
 
-        Args:
-            test_case_id: Test case ID to add attachments to.
-            attachments: List of attachment definitions.
-            last_step_id: ID of the last created step (for ordering).
+        As in the TestOps UI, the text goes into the expected result container the step
+        was created with. Without one, it is patched onto the step itself.
         """
-        if not attachments:
-            return
-
-        for attachment in attachments:
-            attachment_row = await self._attachment_service.upload_attachment(test_case_id, attachment)
-            attachment_step_dto = self._build_scenario_step_dto(
-                test_case_id=test_case_id,
-                attachment_id=attachment_row.id,
-            )
-            response = await self._client.create_scenario_step(
+        scenario_steps = response.scenario.scenario_steps if response.scenario else None
+        step_info = (scenario_steps or {}).get(str(step_id))
+        if step_info is not None and step_info.expected_result_id is not None:
+            await self._client.create_scenario_step(
                 test_case_id=test_case_id,
-                step=attachment_step_dto,
-                after_id=last_step_id,
+                step=self._build_scenario_step_dto(
+                    test_case_id, body=expected_result, parent_id=step_info.expected_result_id
+                ),
             )
-            last_step_id = response.created_step_id
+        else:
+            patch = ScenarioStepPatchDto(body=body, expected_result=expected_result)
+            await self._client.patch_test_case_scenario_step(step_id, patch)
+
+    @traced
+    async def _recreate_scenario(self, test_case_id: int, steps: list[SharedStepScenarioDtoStepsInner]) -> None:
+        """Replace the entire scenario.
+
+        Without expected results the scenario is replaced in a single request, so it is
+        never left half-written. With them, it is cleared and created step by step.
+        """
+        try:
+            if has_expected_results(steps):
+                await self._client.set_test_case_scenario(test_case_id, [])
+                await self._create_scenario_steps(test_case_id, steps)
+            else:
+                await self._client.set_test_case_scenario(test_case_id, steps)
+        except AllureDeadlineExceededError:
+            raise
+        except Exception as e:
+            raise AllureAPIError(f"Failed to recreate scenario: {e}") from e
@@ -6,7 +6,12 @@ import logging
 from dataclasses import dataclass
 
 from src.client import AllureClient
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+)
 from src.client.generated.models.id_and_name_only_dto import IdAndNameOnlyDto
 from src.client.generated.models.page_tree_dto_v2 import PageTreeDtoV2
 from src.client.generated.models.test_case_full_tree_node_dto import TestCaseFullTreeNodeDto
@@ -129,6 +134,8 @@ class TestHierarchyService:
         except AllureNotFoundError:
             logger.info("Test suite %s already deleted or not found", target_suite_id)
             return False
+        except AllureDeadlineExceededError:
+            raise
         except AllureAPIError as exc:
             api_error = exc
 
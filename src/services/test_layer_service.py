@@ -1,11 +1,20 @@
 """Service for managing Test Layers in Allure TestOps."""
 
+from __future__ import annotations
+
 import logging
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 
 from pydantic import ValidationError as PydanticValidationError
 
 from src.client import AllureClient
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+)
 from src.client.generated.exceptions import ApiException
 from src.client.generated.models.page_test_layer_dto import PageTestLayerDto
 from src.client.generated.models.page_test_layer_schema_dto import PageTestLayerSchemaDto
@@ -15,6 +24,9 @@ from src.client.generated.models.test_layer_patch_dto import TestLayerPatchDto
 from src.client.generated.models.test_layer_schema_create_dto import TestLayerSchemaCreateDto
 from src.client.generated.models.test_layer_schema_dto import TestLayerSchemaDto
 from src.client.generated.models.test_layer_schema_patch_dto import TestLayerSchemaPatchDto
+from src.client.pagination import iter_page_items
+from src.services.metadata_cache import StaleWhileRevalidateCache
+from src.utils.config import settings
 from src.utils.schema_hint import generate_schema_hint
 
 logger = logging.getLogger(__name__)
@@ -23,6 +35,61 @@ logger = logging.getLogger(__name__)
 # These limits match the database schema VARCHAR field lengths for test layer names and schema keys
 MAX_NAME_LENGTH = 255
 MAX_KEY_LENGTH = 255
+CATALOGUE_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class TestLayerCatalogue:
+    """Every test layer of a TestOps instance, indexed by ID and by name."""
+
+    layers: tuple[TestLayerDto, ...]
+    by_id: Mapping[int, TestLayerDto]
+    by_name: Mapping[str, tuple[TestLayerDto, ...]]
+
+    @classmethod
+    def from_layers(cls, layers: Iterable[TestLayerDto]) -> TestLayerCatalogue:
+        layers = tuple(layers)
+        by_name: dict[str, tuple[TestLayerDto, ...]] = {}
+        for layer in layers:
+            if layer.name is not None:
+                by_name[layer.name] = (*by_name.get(layer.name, ()), layer)
+        return cls(
+            layers=layers,
+            by_id={layer.id: layer for layer in layers if layer.id is not None},
+            by_name=by_name,
+        )
+
+    def get(self, layer_id: int) -> TestLayerDto | None:
+        return self.by_id.get(layer_id)
+
+    def named(self, name: str) -> tuple[TestLayerDto, ...]:
+        return self.by_name.get(name, ())
+
+
+# Test layers are instance-wide in TestOps, so catalogues are keyed by endpoint
+_catalogues: StaleWhileRevalidateCache[str, TestLayerCatalogue] | None = None
+
+
+def test_layer_catalogues() -> StaleWhileRevalidateCache[str, TestLayerCatalogue]:
+    """Return the process-wide test layer catalogue cache, creating it on first use."""
+    global _catalogues
+    if _catalogues is None:
+        _catalogues = StaleWhileRevalidateCache("test layers", settings.TEST_LAYER_CACHE_TTL_SECONDS)
+    return _catalogues
+
+
+def invalidate_test_layer_catalogue(base_url: str) -> None:
+    """Drop the cached test layer catalogue of an endpoint after its layers were changed."""
+    if _catalogues is not None:
+        _catalogues.invalidate(base_url.rstrip("/"))
+
+
+def reset_test_layer_catalogues() -> None:
+    """Drop the process-wide cache (used by tests)."""
+    global _catalogues
+    if _catalogues is not None:
+        _catalogues.clear()
+    _catalogues = None
 
 
 class TestLayerService:
@@ -58,18 +125,92 @@ class TestLayerService:
         Raises:
             AllureAPIError: If the API request fails
         """
+        page_dto = await self._fetch_test_layer_page(page, size)
+        return page_dto.content or []
+
+    async def get_test_layer_catalogue(self, *, refresh: bool = False) -> TestLayerCatalogue:
+        """Return every test layer, loading all pages once and sharing them across tool calls.
+
+        Args:
+            refresh: Reload the catalogue even if a cached one is still fresh
+
+        Returns:
+            The TestLayerCatalogue
+
+        Raises:
+            AllureAPIError: If the API request fails
+        """
+        key = self._catalogue_key()
+        if refresh:
+            test_layer_catalogues().invalidate(key)
+        return await test_layer_catalogues().get(key, self._load_catalogue)
+
+    async def find_test_layer(self, layer_id: int) -> TestLayerDto | None:
+        """Find a test layer by ID in the catalogue.
+
+        A cached catalogue that misses the layer is reloaded once, so layers created
+        outside this server are still found.
+
+        Args:
+            layer_id: The test layer ID
+
+        Returns:
+            The TestLayerDto, or None if no such layer exists
+
+        Raises:
+            AllureAPIError: If the API request fails
+        """
+        return await self._lookup(lambda catalogue: catalogue.get(layer_id))
+
+    async def find_test_layers_by_name(self, name: str) -> tuple[TestLayerDto, ...]:
+        """Find the test layers with exactly this name in the catalogue.
+
+        Args:
+            name: The test layer name
+
+        Returns:
+            The matching layers; empty if none match
+
+        Raises:
+            AllureAPIError: If the API request fails
+        """
+        return await self._lookup(lambda catalogue: catalogue.named(name))
+
+    async def _lookup[T](self, find: Callable[[TestLayerCatalogue], T]) -> T:
+        loaded = False
+
+        async def _load() -> TestLayerCatalogue:
+            nonlocal loaded
+            loaded = True
+            return await self._load_catalogue()
+
+        key = self._catalogue_key()
+        found = find(await test_layer_catalogues().get(key, _load))
+        if not found and not loaded:
+            found = find(await self.get_test_layer_catalogue(refresh=True))
+        return found
+
+    async def _load_catalogue(self) -> TestLayerCatalogue:
+        async def _fetch(page: int) -> PageTestLayerDto:
+            return await self._fetch_test_layer_page(page, CATALOGUE_PAGE_SIZE)
+
+        layers = iter_page_items(_fetch, lambda page: page.content, page_size=CATALOGUE_PAGE_SIZE)
+        return TestLayerCatalogue.from_layers([layer async for layer in layers])
+
+    async def _fetch_test_layer_page(self, page: int, size: int) -> PageTestLayerDto:
         if not self._client._test_layer_api:
             raise AllureAPIError("Test Layer API is not initialized")
 
         try:
-            page_dto: PageTestLayerDto = await self._client._test_layer_api.find_all7(
-                page=page,
-                size=size,
-            )
-            return page_dto.content or []
+            return await self._client._test_layer_api.find_all7(page=page, size=size)
+        except AllureDeadlineExceededError:
+            raise
         except Exception as e:
             raise AllureAPIError(f"Failed to list test layers: {e}") from e
 
+    def _catalogue_key(self) -> str:
+        return self._client.get_base_url().rstrip("/")
+
     async def create_test_layer(self, name: str) -> TestLayerDto:
         """Create a new test layer.
 
@@ -95,12 +236,14 @@ class TestLayerService:
             raise AllureValidationError(f"Invalid test layer data: {e}", suggestions=[hint]) from e
 
         try:
-            return await self._client._test_layer_api.create9(test_layer_create_dto=create_dto)
+            created = await self._client._test_layer_api.create9(test_layer_create_dto=create_dto)
         except Exception as e:
             raise AllureAPIError(
                 f"Failed to create test layer '{name}': {e}. "
                 "Ensure the name is unique and you have project permissions."
             ) from e
+        invalidate_test_layer_catalogue(self._client.get_base_url())
+        return created
 
     async def get_test_layer(self, layer_id: int) -> TestLayerDto:
         """Get a test layer by ID.
@@ -168,12 +311,13 @@ class TestLayerService:
 
         try:
             updated = await self._client._test_layer_api.patch9(id=layer_id, test_layer_patch_dto=patch_data)
-            return updated, True
         except Exception as e:
             raise AllureAPIError(
                 f"Failed to update test layer {layer_id}: {e}. "
                 "Check that the layer exists and you have update permissions."
             ) from e
+        invalidate_test_layer_catalogue(self._client.get_base_url())
+        return updated, True
 
     async def delete_test_layer(self, layer_id: int) -> bool:
         """Delete a test layer with idempotent behavior.
@@ -197,11 +341,12 @@ class TestLayerService:
             # Check existence first for accurate feedback
             await self.get_test_layer(layer_id)
             await self._client._test_layer_api.delete9(id=layer_id)
-            return True
         except AllureNotFoundError:
             # Idempotent: if already deleted, this is fine
             logger.debug(f"Test layer {layer_id} already deleted or not found")
             return False
+        invalidate_test_layer_catalogue(self._client.get_base_url())
+        return True
 
     # ==========================================
     # Test Layer Schema CRUD Operations
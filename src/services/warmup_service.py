@@ -0,0 +1,57 @@
+"""Service for warming caches and connections before the first tool call."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.client import AllureClient
+from src.services.integration_service import IntegrationService
+from src.services.test_layer_service import TestLayerService
+
+logger = logging.getLogger(__name__)
+
+type WarmupStep = Callable[[], Awaitable[object]]
+
+
+class WarmupService:
+    """Prefetch the default project's metadata through an authenticated client.
+
+    Entering the client already exchanged the API token. The prefetches run
+    concurrently, which also opens several pooled keep-alive connections, and
+    their GET responses land in the shared response cache, so the first tool
+    calls revalidate them instead of downloading them again.
+    """
+
+    def __init__(self, client: AllureClient) -> None:
+        """Initialize WarmupService.
+
+        Args:
+            client: Entered AllureClient instance
+        """
+        self._client = client
+        self._project_id = client.get_project()
+
+    async def warm_up(self) -> list[str]:
+        """Prefetch custom fields, test layers, and integrations for the default project.
+
+        A failed prefetch is logged and skipped; it never fails the warm-up.
+
+        Returns:
+            Names of the prefetches that succeeded
+        """
+        steps: dict[str, WarmupStep] = {
+            "custom_fields": lambda: self._client.get_custom_fields_with_values(self._project_id),
+            "test_layers": TestLayerService(self._client).get_test_layer_catalogue,
+            "integrations": lambda: IntegrationService(self._client).list_integrations(self._project_id),
+        }
+        outcomes = await asyncio.gather(*(step() for step in steps.values()), return_exceptions=True)
+
+        warmed: list[str] = []
+        for name, outcome in zip(steps, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning("Warm-up prefetch of %s failed: %s", name, outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                warmed.append(name)
+        return warmed
@@ -98,6 +98,13 @@ DESTRUCTIVE_IDEMPOTENT_TOOLS: Final[frozenset[str]] = frozenset(
     }
 )
 
+# Writes that stop at the tool deadline and report what they finished as partial
+PARTIAL_RESULT_WRITE_TOOLS: Final[frozenset[str]] = frozenset(
+    {
+        "delete_archived_test_cases",
+    }
+)
+
 
 def _build_hint_policy() -> dict[str, dict[str, bool]]:
     policy: dict[str, dict[str, bool]] = {}
@@ -224,6 +231,15 @@ def get_tool_annotations(tool_name: str) -> ToolAnnotations:
     )
 
 
+def uses_default_deadline(tool_name: str) -> bool:
+    """Whether ``TOOL_DEADLINE_SECONDS`` bounds the tool.
+
+    Only reads and writes that return partial results are bounded; other writes
+    run to completion so a deadline never leaves them half-applied.
+    """
+    return tool_name in READ_ONLY_TOOLS or tool_name in PARTIAL_RESULT_WRITE_TOOLS
+
+
 def get_tool_tags(tool_name: str) -> set[str]:
     tags = TOOL_TAGS.get(tool_name)
     if tags is None:
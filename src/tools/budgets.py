@@ -0,0 +1,30 @@
+from typing import Final
+
+# Upper bounds on Allure TestOps API requests for one call of a tool on a single record,
+# with no steps, attachments, or custom field values in the input. Token exchanges and
+# transport retries are not counted (see ``src.client.request_accounting``).
+# Tools whose request count grows with project size or input size are not budgeted here.
+TOOL_REQUEST_BUDGETS: Final[dict[str, int]] = {
+    "create_test_case": 1,
+    "create_test_layer": 1,
+    "delete_test_case": 3,
+    "delete_test_layer": 2,
+    "get_launch": 4,
+    "get_test_case_custom_fields": 1,
+    "get_test_case_details": 3,
+    "link_shared_step": 3,
+    "list_custom_field_values": 1,
+    "list_integrations": 1,
+    "list_launch_test_results": 1,
+    "list_launches": 2,
+    "list_shared_steps": 1,
+    "list_test_cases": 1,
+    "list_test_layers": 1,
+    "search_test_cases": 1,
+    "unlink_shared_step": 3,
+    "update_test_case": 7,
+    "update_test_layer": 2,
+}
+
+
+__all__ = ["TOOL_REQUEST_BUDGETS"]
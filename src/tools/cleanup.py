@@ -16,23 +16,31 @@ from src.tools.output_contract import (
     render_output,
 )
 from src.tools.output_schemas import output_fields
+from src.utils.deadline import deadline_scope
 
 DESTRUCTIVE_CONFIRMATION_MESSAGE = "⚠️ Destructive operation. Pass confirm=True to proceed."
 
 
-@output_fields("requires_confirmation", "action", "deleted_count")
+@output_fields("requires_confirmation", "action", "deleted_count", "partial")
 async def delete_archived_test_cases(
     confirm: Annotated[bool, Field(description="Must be set to True to proceed.")] = False,
     project_id: Annotated[int | None, Field(description="Optional Allure TestOps project ID override.")] = None,
+    deadline_seconds: Annotated[
+        float | None,
+        Field(description="Optional time budget in seconds, overriding the server default.", gt=0),
+    ] = None,
     output_format: Annotated[OutputFormat | None, Field(description="Output format: 'json' (default) or 'plain'.")] = (
         DEFAULT_OUTPUT_FORMAT
     ),
 ) -> ToolOutput:
     """Permanently delete all archived/deleted test cases in the current project.
 
+    When the time budget runs out first, the result is marked partial; call again to continue.
+
     Args:
         confirm: Must be set to True to proceed.
         project_id: Optional Allure TestOps project ID override.
+        deadline_seconds: Optional time budget in seconds, overriding the server default.
         output_format: Output format: 'json' (default) or 'plain'.
     """
     if not confirm:
@@ -42,14 +50,19 @@ async def delete_archived_test_cases(
             output_format=output_format,
         )
 
-    async with AllureClient.from_env(project=project_id) as client:
-        service = TestCaseService(client=client)
-        deleted_count = await service.cleanup_archived()
-        return render_output(
-            plain=f"Deleted {deleted_count} archived test case(s).",
-            json_payload={"deleted_count": deleted_count},
-            output_format=output_format,
-        )
+    with deadline_scope(deadline_seconds):
+        async with AllureClient.from_env(project=project_id) as client:
+            service = TestCaseService(client=client)
+            result = await service.cleanup_archived()
+
+    plain = f"Deleted {result.deleted_count} archived test case(s)."
+    if result.partial:
+        plain += " Stopped at the time limit; run again to delete the rest."
+    return render_output(
+        plain=plain,
+        json_payload={"deleted_count": result.deleted_count, "partial": result.partial},
+        output_format=output_format,
+    )
 
 
 @output_fields("requires_confirmation", "action", "deleted_count")
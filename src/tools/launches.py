@@ -21,6 +21,7 @@ from src.services.launch_service import (
 from src.tools.output_contract import DEFAULT_OUTPUT_FORMAT, OutputFormat, ToolOutput, render_output
 from src.tools.output_schemas import LaunchDetailOutput, LaunchMutationSummary, ListLaunchesOutput, output_fields
 from src.utils.auth_resolution import resolve_auth_settings
+from src.utils.deadline import deadline_scope
 from src.utils.links import launch_url
 
 _COLLECTION_OUTPUT_FIELDS = ("items", "total", "page", "size", "total_pages")
@@ -263,7 +264,7 @@ async def get_launch(
     )
 
 
-@output_fields("launch_id", "manual_only", "failed_only", *_COLLECTION_OUTPUT_FIELDS)
+@output_fields("launch_id", "manual_only", "failed_only", *_COLLECTION_OUTPUT_FIELDS, "partial")
 async def list_launch_test_results(
     launch_id: Annotated[int, Field(description="Launch ID (required).")],
     manual_only: Annotated[
@@ -283,12 +284,19 @@ async def list_launch_test_results(
         Field(description="Optional sort directives such as ['name,ASC'] or ['createdDate,DESC']."),
     ] = None,
     project_id: Annotated[int | None, Field(description="Optional override for the default Project ID.")] = None,
+    deadline_seconds: Annotated[
+        float | None,
+        Field(description="Optional time budget in seconds, overriding the server default.", gt=0),
+    ] = None,
     output_format: Annotated[OutputFormat | None, Field(description="Output format: 'json' (default) or 'plain'.")] = (
         DEFAULT_OUTPUT_FORMAT
     ),
 ) -> ToolOutput:
     """List test results inside a launch, including manual execution metadata.
 
+    Filtering by manual_only or failed_only scans the whole launch. If the time budget
+    runs out first, the results found so far are returned and marked partial.
+
     Args:
         launch_id: Launch ID.
         manual_only: Restrict results to manual tests.
@@ -299,23 +307,25 @@ async def list_launch_test_results(
         filter_id: Optional saved filter ID.
         sort: Optional sort directives.
         project_id: Optional override for the default Project ID.
+        deadline_seconds: Optional time budget in seconds, overriding the server default.
         output_format: Output format: 'json' (default) or 'plain'.
 
     Returns:
         Launch result summaries with result IDs, test case IDs, statuses, and assignee/tester fields.
     """
-    async with _launch_client_context(project_id=project_id) as client:
-        service = LaunchService(client=client)
-        result = await service.list_launch_test_results(
-            launch_id,
-            page=page,
-            size=size,
-            search=search,
-            filter_id=filter_id,
-            sort=sort,
-            manual_only=manual_only,
-            failed_only=failed_only,
-        )
+    with deadline_scope(deadline_seconds):
+        async with _launch_client_context(project_id=project_id) as client:
+            service = LaunchService(client=client)
+            result = await service.list_launch_test_results(
+                launch_id,
+                page=page,
+                size=size,
+                search=search,
+                filter_id=filter_id,
+                sort=sort,
+                manual_only=manual_only,
+                failed_only=failed_only,
+            )
 
     items = [
         {
@@ -340,6 +350,7 @@ async def list_launch_test_results(
             "size": result.size,
             "total_pages": result.total_pages,
             "items": items,
+            "partial": result.partial,
         },
         output_format=output_format,
     )
@@ -1040,10 +1051,14 @@ def _format_launch_delete(result: LaunchDeleteResult) -> str:
 
 
 def _format_launch_test_result_list(result: LaunchTestResultListResult) -> str:
+    partial_note = "Stopped at the time limit; results are partial."
     if not result.items:
-        return "No matching launch test results found."
+        message = "No matching launch test results found."
+        return f"{message} {partial_note}" if result.partial else message
 
     lines = [f"Found {result.total} launch test results (page {result.page + 1} of {result.total_pages}):"]
+    if result.partial:
+        lines.append(partial_note)
     for item in result.items:
         name = item.name or "(unnamed)"
         result_id = item.result_id if item.result_id is not None else "unknown"
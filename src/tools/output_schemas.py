@@ -139,6 +139,7 @@ class SearchTestCasesOutput(BaseModel):
     total_pages: int = Field(ge=0, description="Number of result pages.")
     query: str = Field(description="Query that produced these results.")
     items: list[TestCaseSummary] = Field(description="Matching test cases.")
+    truncated: bool | None = Field(default=None, description="Whether max_items cut an all-pages listing short.")
 
 
 class SuiteNodeOutput(BaseModel):
@@ -440,6 +441,7 @@ class ToolOutputModel(BaseModel):
     operation: str | None = Field(default=None)
     page: int | None = Field(default=None, ge=0)
     parent_suite_id: int | None = Field(default=None)
+    partial: bool | None = Field(default=None, description="Whether the time limit cut the operation short.")
     plan_id: int | None = Field(default=None)
     precondition: str | None = Field(default=None)
     project_id: int | None = Field(default=None)
@@ -476,6 +478,7 @@ class ToolOutputModel(BaseModel):
     trace_regex: str | None = Field(default=None)
     tree: EntitySummary | None = Field(default=None)
     tree_id: int | None = Field(default=None)
+    truncated: bool | None = Field(default=None, description="Whether max_items cut an all-pages listing short.")
     type: str | None = Field(default=None)
     updated_fields: list[str] | None = Field(default=None)
     uploaded_count: int | None = Field(default=None, ge=0)
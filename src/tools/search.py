@@ -1,16 +1,31 @@
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from pydantic import Field
 
 from src.client import AllureClient, AllureValidationError
 from src.client.generated.models.shared_step_step_dto import SharedStepStepDto
-from src.services.search_service import SearchQueryParser, SearchService, TestCaseDetails, TestCaseListResult
+from src.services.search_service import (
+    ALL_PAGES_MAX_ITEMS,
+    SearchQueryParser,
+    SearchService,
+    TestCaseDetails,
+    TestCaseListResult,
+    TestCaseScanResult,
+)
 from src.tools.output_contract import DEFAULT_OUTPUT_FORMAT, OutputFormat, ToolOutput, render_output
 from src.tools.output_schemas import SearchTestCasesOutput, TestCaseDetailsOutput, output_fields
 from src.utils.links import shared_step_url, test_case_url
 
+_ALL_PAGES_DESCRIPTION = (
+    "Return every matching test case as compact id/name/status/tags rows instead of one page; "
+    "page and size are ignored."
+)
+_MAX_ITEMS_DESCRIPTION = f"Most test cases returned with all_pages (max {ALL_PAGES_MAX_ITEMS})."
+DEFAULT_MAX_ITEMS = 1000
+
 
-@output_fields("total", "page", "size", "total_pages", "items")
+@output_fields("total", "page", "size", "total_pages", "items", "truncated")
 async def list_test_cases(
     page: Annotated[int, Field(description="Zero-based page index.")] = 0,
     size: Annotated[int, Field(description="Number of results per page (max 100).", le=100)] = 20,
@@ -18,6 +33,10 @@ async def list_test_cases(
     tags: Annotated[list[str] | None, Field(description="Optional tag filters (exact match).", max_length=100)] = None,
     status: Annotated[str | None, Field(description="Optional status filter (exact match).", max_length=100)] = None,
     project_id: Annotated[int | None, Field(description="Allure TestOps project ID to list test cases from.")] = None,
+    all_pages: Annotated[bool, Field(description=_ALL_PAGES_DESCRIPTION)] = False,
+    max_items: Annotated[int, Field(description=_MAX_ITEMS_DESCRIPTION, ge=1, le=ALL_PAGES_MAX_ITEMS)] = (
+        DEFAULT_MAX_ITEMS
+    ),
     output_format: Annotated[OutputFormat | None, Field(description="Output format: 'json' (default) or 'plain'.")] = (
         DEFAULT_OUTPUT_FORMAT
     ),
@@ -34,6 +53,9 @@ async def list_test_cases(
         tags: Optional list of tag names to filter by (exact match).
         status: Optional test case status name to filter by (exact match).
         project_id: Optional override for the default Project ID.
+        all_pages: Fetch every page (concurrently) and return compact rows without URLs
+            as a single page; 'truncated' is true when max_items cut the list short.
+        max_items: Most test cases returned with all_pages. Default: 1000.
         output_format: Output format: 'json' (default) or 'plain'.
 
     Returns:
@@ -45,6 +67,9 @@ async def list_test_cases(
 
     async with AllureClient.from_env(project=project_id) as client:
         service = SearchService(client=client)
+        if all_pages:
+            scan = await service.scan_test_cases(name_filter=name_filter, tags=tags, status=status, max_items=max_items)
+            return _render_scan_result(await scan.collect(), output_format=output_format)
         result = await service.list_test_cases(
             page=page,
             size=size,
@@ -62,7 +87,7 @@ async def list_test_cases(
     )
 
 
-@output_fields("total", "page", "size", "total_pages", "items", "query", model=SearchTestCasesOutput)
+@output_fields("total", "page", "size", "total_pages", "items", "query", "truncated", model=SearchTestCasesOutput)
 async def search_test_cases(
     query: Annotated[
         str | None,
@@ -92,6 +117,10 @@ async def search_test_cases(
     page: Annotated[int, Field(description="Zero-based page index.")] = 0,
     size: Annotated[int, Field(description="Number of results per page (max 100).", le=100)] = 20,
     project_id: Annotated[int | None, Field(description="Allure TestOps project ID to list test cases from.")] = None,
+    all_pages: Annotated[bool, Field(description=_ALL_PAGES_DESCRIPTION)] = False,
+    max_items: Annotated[int, Field(description=_MAX_ITEMS_DESCRIPTION, ge=1, le=ALL_PAGES_MAX_ITEMS)] = (
+        DEFAULT_MAX_ITEMS
+    ),
     output_format: Annotated[OutputFormat | None, Field(description="Output format: 'json' (default) or 'plain'.")] = (
         DEFAULT_OUTPUT_FORMAT
     ),
@@ -130,6 +159,9 @@ async def search_test_cases(
         page: Page number (0-indexed). Default: 0.
         size: Results per page (max 100). Default: 20.
         project_id: Optional override for the default Project ID.
+        all_pages: Fetch every page (concurrently) and return compact rows without URLs
+            as a single page; 'truncated' is true when max_items cut the list short.
+        max_items: Most test cases returned with all_pages. Default: 1000.
         output_format: Output format: 'json' (default) or 'plain'.
 
     Returns:
@@ -149,24 +181,15 @@ async def search_test_cases(
         → "Found 12 test cases matching 'status=\"failed\" and tag=\"regression\"':
            - [#5] Critical Path Test ..."
     """
-    # Validate that at least one search parameter is provided
-    if not aql and not query:
-        raise AllureValidationError(
-            "Either 'query' or 'aql' must be provided. Use 'query' for simple searches "
-            "or 'aql' for advanced AQL filtering."
-        )
-
-    # Validate simple query if provided (and not using AQL)
-    if not aql:
-        if not isinstance(query, str) or not query.strip():
-            raise AllureValidationError("Search query must be a non-empty string")
-
-        parsed = SearchQueryParser.parse(query)
-        if not parsed.name_query and not parsed.tags:
-            raise AllureValidationError("Search query must include a name or tag filter")
+    _validate_search_input(query, aql)
 
+    # Use the appropriate display query for formatting
+    display_query = aql if aql else query
     async with AllureClient.from_env(project=project_id) as client:
         service = SearchService(client=client)
+        if all_pages:
+            scan = await service.scan_search_results(query, aql=aql, max_items=max_items)
+            return _render_scan_result(await scan.collect(), output_format=output_format, query=display_query or "")
         result = await service.search_test_cases(
             query=query,
             page=page,
@@ -176,8 +199,6 @@ async def search_test_cases(
         base_url = client.get_base_url()
         resolved_project_id = client.get_project()
 
-    # Use the appropriate display query for formatting
-    display_query = aql if aql else query
     return render_output(
         plain=_format_search_results(result, display_query or "", base_url=base_url, project_id=resolved_project_id),
         json_payload={
@@ -241,6 +262,92 @@ async def get_test_case_details(
     )
 
 
+async def stream_list_test_cases(
+    name_filter: str | None = None,
+    tags: list[str] | None = None,
+    status: str | None = None,
+    project_id: int | None = None,
+    max_items: int = DEFAULT_MAX_ITEMS,
+) -> AsyncGenerator[dict[str, object]]:
+    """Yield compact rows for every test case ``list_test_cases`` matches, as pages arrive.
+
+    Backs ``--format ndjson`` in the CLI; not registered as an MCP tool.
+    """
+    async with AllureClient.from_env(project=project_id) as client:
+        scan = await SearchService(client=client).scan_test_cases(
+            name_filter=name_filter, tags=tags, status=status, max_items=max_items
+        )
+        async for tc in scan:
+            yield _serialize_test_case_row(tc)
+
+
+async def stream_search_test_cases(
+    query: str | None = None,
+    aql: str | None = None,
+    project_id: int | None = None,
+    max_items: int = DEFAULT_MAX_ITEMS,
+) -> AsyncGenerator[dict[str, object]]:
+    """Yield compact rows for every test case ``search_test_cases`` matches, as pages arrive.
+
+    Backs ``--format ndjson`` in the CLI; not registered as an MCP tool.
+    """
+    _validate_search_input(query, aql)
+    async with AllureClient.from_env(project=project_id) as client:
+        scan = await SearchService(client=client).scan_search_results(query, aql=aql, max_items=max_items)
+        async for tc in scan:
+            yield _serialize_test_case_row(tc)
+
+
+def _validate_search_input(query: str | None, aql: str | None) -> None:
+    # Validate that at least one search parameter is provided
+    if not aql and not query:
+        raise AllureValidationError(
+            "Either 'query' or 'aql' must be provided. Use 'query' for simple searches "
+            "or 'aql' for advanced AQL filtering."
+        )
+
+    # Validate simple query if provided (and not using AQL)
+    if not aql:
+        if not isinstance(query, str) or not query.strip():
+            raise AllureValidationError("Search query must be a non-empty string")
+
+        parsed = SearchQueryParser.parse(query)
+        if not parsed.name_query and not parsed.tags:
+            raise AllureValidationError("Search query must include a name or tag filter")
+
+
+def _render_scan_result(
+    result: TestCaseScanResult, *, output_format: OutputFormat | None, query: str | None = None
+) -> ToolOutput:
+    payload: dict[str, object] = {
+        "total": result.total,
+        "page": 0,
+        "size": len(result.items),
+        "total_pages": 1,
+        "items": [_serialize_test_case_row(tc) for tc in result.items],
+        "truncated": result.truncated,
+    }
+    if query is not None:
+        payload["query"] = query
+    return render_output(plain=_format_scan_result(result), json_payload=payload, output_format=output_format)
+
+
+def _format_scan_result(result: TestCaseScanResult) -> str:
+    if not result.items:
+        return "No test cases found."
+
+    lines = [f"Found {result.total} test cases; returning {len(result.items)}:"]
+    for tc in result.items:
+        tags = ", ".join([t.name for t in (tc.tags or []) if t.name]) if tc.tags else "none"
+        status = tc.status.name if tc.status and tc.status.name else "unknown"
+        lines.append(f"- [#{tc.id}] {tc.name} (status: {status}; tags: {tags})")
+
+    if result.truncated:
+        lines.append(f"\nStopped at max_items={len(result.items)}; narrow the filters or raise max_items.")
+
+    return "\n".join(lines)
+
+
 def _format_test_case_list(result: TestCaseListResult, *, base_url: str = "", project_id: int = 0) -> str:
     if not result.items:
         return "No test cases found in this project."
@@ -261,6 +368,14 @@ def _format_test_case_list(result: TestCaseListResult, *, base_url: str = "", pr
 
 
 def _serialize_test_case_summary(tc: object, *, base_url: str, project_id: int) -> dict[str, object]:
+    payload = _serialize_test_case_row(tc)
+    test_case_id = payload["id"]
+    if isinstance(test_case_id, int):
+        payload["url"] = test_case_url(base_url, project_id, test_case_id)
+    return payload
+
+
+def _serialize_test_case_row(tc: object) -> dict[str, object]:
     status_obj = getattr(tc, "status", None)
     status_name = getattr(status_obj, "name", None) if status_obj is not None else None
 
@@ -272,16 +387,12 @@ def _serialize_test_case_summary(tc: object, *, base_url: str, project_id: int)
             if isinstance(tag_name, str):
                 tags.append(tag_name)
 
-    test_case_id = getattr(tc, "id", None)
-    payload: dict[str, object] = {
-        "id": test_case_id,
+    return {
+        "id": getattr(tc, "id", None),
         "name": getattr(tc, "name", None),
         "status": status_name or "unknown",
         "tags": tags,
     }
-    if isinstance(test_case_id, int):
-        payload["url"] = test_case_url(base_url, project_id, test_case_id)
-    return payload
 
 
 def _serialize_test_case_list_result(
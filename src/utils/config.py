@@ -31,6 +31,26 @@ class Settings(BaseSettings):
     HOST: str = Field(default="127.0.0.1", description="Host to bind the server to")
     PORT: int = Field(default=8000, description="Port to bind the server to")
     MCP_MODE: Literal["http", "stdio"] = Field(default="stdio", description="Running mode: http or stdio")
+    TOOL_DEADLINE_SECONDS: float = Field(
+        default=55.0,
+        ge=0,
+        description=(
+            "Time budget for each read-only tool call and for archived test case cleanup; long listings "
+            "return partial results when it runs out (0 disables). Other writes are not bounded. "
+            "The default stays under the 60 second request timeout common in MCP clients"
+        ),
+    )
+    METRICS_ENABLED: bool = Field(
+        default=True, description="Expose Prometheus metrics at /metrics when running in http mode"
+    )
+    TRACING_ENABLED: bool = Field(
+        default=False,
+        description="Export OpenTelemetry spans over OTLP/HTTP; requires the 'tracing' extra",
+    )
+    TRACING_OTLP_ENDPOINT: str | None = Field(
+        default=None,
+        description="OTLP/HTTP traces URL; when unset the standard OTEL_EXPORTER_OTLP_* variables apply",
+    )
     TELEMETRY_ENABLED: bool | None = Field(
         default=None,
         description="Optional telemetry override. When unset, TelemetryConfig.enabled is used.",
@@ -44,6 +64,131 @@ class Settings(BaseSettings):
         description="Optional Umami hostname override. When unset, TelemetryConfig.umami_hostname is used.",
     )
 
+    # Allure client session reuse
+    ALLURE_SESSION_POOL_ENABLED: bool = Field(
+        default=True,
+        description="Reuse authenticated Allure TestOps sessions across tool calls in long-running server modes",
+    )
+    ALLURE_SESSION_POOL_MAX_SESSIONS: int = Field(
+        default=16,
+        gt=0,
+        description="Maximum number of pooled sessions (distinct endpoint and token pairs) kept open",
+    )
+    STARTUP_WARMUP_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "At server start, authenticate and prefetch the default project's custom fields, test layers, "
+            "and integrations in the background"
+        ),
+    )
+
+    # Local search index
+    SEARCH_INDEX_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Keep a local SQLite full-text index of the default project's test cases and answer simple searches from it"
+        ),
+    )
+    SEARCH_INDEX_DIR: str | None = Field(
+        default=None, description="Directory for search index databases (default: the user cache directory)"
+    )
+    SEARCH_INDEX_REFRESH_SECONDS: float = Field(
+        default=300.0, gt=0, description="Seconds between incremental refreshes of the search index in server modes"
+    )
+    SEARCH_INDEX_MAX_AGE_SECONDS: float = Field(
+        default=900.0,
+        gt=0,
+        description="Searches fall back to TestOps when the index was last refreshed longer ago than this",
+    )
+    SEARCH_INDEX_CUSTOM_FIELDS: bool = Field(
+        default=True,
+        description="Index custom field values too; costs one request per new or changed test case",
+    )
+
+    # Custom field metadata cache
+    CUSTOM_FIELD_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds a project's resolved custom fields are reused across tool calls (0 disables the cache)",
+    )
+    CUSTOM_FIELD_CACHE_STALE_SECONDS: float = Field(
+        default=600.0,
+        ge=0,
+        description="Seconds after the TTL during which cached custom fields are served while they reload",
+    )
+    TEST_LAYER_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds the test layer catalogue is reused across tool calls (0 disables the cache)",
+    )
+
+    # Allure client HTTP transport
+    ALLURE_HTTP2: bool = Field(
+        default=False,
+        description="Use HTTP/2 multiplexing for Allure TestOps requests (requires the 'http2' extra)",
+    )
+    ALLURE_HTTP_MAX_CONNECTIONS: int = Field(
+        default=100, gt=0, description="Maximum concurrent connections per Allure TestOps session"
+    )
+    ALLURE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, ge=0, description="Maximum idle keep-alive connections per Allure TestOps session"
+    )
+    ALLURE_HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=30.0, ge=0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    ALLURE_HTTP_CONNECT_TIMEOUT: float = Field(default=10.0, gt=0, description="Connect timeout in seconds")
+    ALLURE_HTTP_READ_TIMEOUT: float = Field(default=30.0, gt=0, description="Read timeout for API calls in seconds")
+    ALLURE_HTTP_WRITE_TIMEOUT: float = Field(default=30.0, gt=0, description="Write timeout for API calls in seconds")
+    ALLURE_HTTP_POOL_TIMEOUT: float = Field(
+        default=10.0, gt=0, description="Seconds to wait for a free pooled connection"
+    )
+    ALLURE_HTTP_TRANSFER_TIMEOUT: float = Field(
+        default=300.0, gt=0, description="Read and write timeout for attachment uploads and downloads in seconds"
+    )
+
+    # Allure client rate limiting and retries
+    ALLURE_RATE_LIMIT_RPS: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Maximum requests per second per Allure TestOps endpoint; 0 sets no ceiling, "
+            "so requests are only limited after the server throttles them"
+        ),
+    )
+    ALLURE_RATE_LIMIT_BURST: int = Field(
+        default=50, gt=0, description="Requests allowed in a burst above the rate while requests are limited"
+    )
+    ALLURE_RETRY_MAX_ATTEMPTS: int = Field(
+        default=4, ge=1, description="Attempts per request for throttled (429) or unavailable (502-504) responses"
+    )
+    ALLURE_RETRY_BACKOFF_BASE: float = Field(
+        default=0.5, ge=0, description="Base delay in seconds for exponential retry backoff with jitter"
+    )
+    ALLURE_RETRY_BACKOFF_MAX: float = Field(default=30.0, ge=0, description="Maximum retry delay in seconds")
+
+    # Allure client response cache
+    ALLURE_HTTP_CACHE_ENABLED: bool = Field(
+        default=True, description="Cache GET responses and revalidate them with ETag/Last-Modified"
+    )
+    ALLURE_HTTP_CACHE_MAX_ENTRIES: int = Field(default=1024, gt=0, description="Maximum cached responses")
+    ALLURE_HTTP_CACHE_MAX_BYTES: int = Field(
+        default=32 * 1024 * 1024, gt=0, description="Maximum total size of cached response bodies in bytes"
+    )
+    ALLURE_HTTP_CACHE_TTLS: str = Field(
+        default="",
+        description=(
+            "Comma-separated '/api/path=seconds' prefixes whose cached responses are served without "
+            "revalidation for the given time; all other paths are always revalidated"
+        ),
+    )
+    ALLURE_HTTP_COALESCE_GETS: bool = Field(
+        default=True, description="Share one upstream request between concurrent identical GET requests"
+    )
+    ALLURE_FAST_DESERIALIZATION: bool = Field(
+        default=False,
+        description=("Validate list pages in a single pass, decoding with orjson when the 'fast' extra is installed"),
+    )
+
 
 @dataclass(frozen=True)
 class TelemetryConfig:
@@ -0,0 +1,62 @@
+"""Time budgets for tool calls, carried through services into the TestOps client.
+
+A deadline is an absolute ``time.monotonic()`` instant held in a context
+variable, so it follows the call through ``await`` and into tasks started
+during the call (such as concurrently fetched pages) without being passed as
+an argument. The tool wrapper opens a scope with the server-wide default and a
+tool may open a nested one with a per-call budget; the innermost scope wins, so
+a per-call budget may be longer or shorter than the default.
+
+``AllureClient`` reads the deadline on every request: it caps the HTTP
+timeouts at the remaining budget, skips retries that would sleep past it, and
+raises ``AllureDeadlineExceededError`` once it has passed. Services that page
+through large listings catch that error and return what they gathered,
+flagged as partial.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+# Smallest timeout handed to the transport, so a nearly spent budget still gets one quick attempt.
+MIN_REQUEST_TIMEOUT = 0.05
+
+_deadline: ContextVar[float | None] = ContextVar("lucius_tool_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Give calls made inside the block ``seconds`` from now; ``None`` keeps the current deadline."""
+    if seconds is None:
+        yield
+        return
+    reset_token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(reset_token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline (never negative), or ``None`` without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def deadline_expired() -> bool:
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def cap_timeout(seconds: float | None) -> float | None:
+    """Shorten a request timeout to the remaining budget; ``None`` means no timeout."""
+    budget = remaining_time()
+    if budget is None:
+        return seconds
+    budget = max(budget, MIN_REQUEST_TIMEOUT)
+    return budget if seconds is None else min(seconds, budget)
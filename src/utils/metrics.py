@@ -0,0 +1,258 @@
+"""In-process Prometheus metrics for the HTTP server.
+
+Metrics are plain counters, gauges, and fixed-bucket histograms rendered in the
+Prometheus text exposition format (0.0.4) by the ``/metrics`` route, so no
+client library is needed. Recording is a dict lookup plus an increment, cheap
+enough for every tool call and upstream request. Metrics are updated from the
+event loop thread only, so they take no locks.
+
+Labels are limited to bounded sets: tool names, generated API operation names,
+HTTP status classes (``2xx``, ``4xx``...), and fixed outcome values. Resource
+IDs, URLs, and project IDs are never used as label values.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from typing import Literal
+
+type LabelValues = tuple[str, ...]
+type MetricKind = Literal["counter", "gauge", "histogram"]
+
+# Latency buckets in seconds, from fast cache hits to slow attachment transfers.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+REQUEST_COUNT_BUCKETS = (1.0, 2.0, 3.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind: MetricKind
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind: MetricKind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+    def reset(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """Value that can go up and down, e.g. requests currently in flight."""
+
+    kind: MetricKind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.reset()
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def reset(self) -> None:
+        super().reset()
+        if not self.labelnames:
+            # An unlabelled gauge always has a value, so it is scraped as 0 before first use.
+            self._values[()] = 0.0
+
+
+class Histogram(_Metric):
+    """Fixed-bucket distribution of observed values per label set."""
+
+    kind: MetricKind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last slot is +Inf), then sum.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series is not None else 0
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        self._series.clear()
+
+
+class CallbackMetric(_Metric):
+    """Counter or gauge whose values are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        collect: Callable[[], Mapping[LabelValues, float]],
+        *,
+        kind: Literal["counter", "gauge"] = "gauge",
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._collect().items())
+        ]
+
+    def reset(self) -> None:
+        return None
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register[MetricT: _Metric](self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            samples = metric.render()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+def _status_class(status: int | None) -> str:
+    return f"{status // 100}xx" if isinstance(status, int) and 100 <= status < 600 else "error"
+
+
+registry = MetricsRegistry()
+
+TOOL_CALLS_IN_FLIGHT = registry.register(Gauge("lucius_tool_calls_in_flight", "MCP tool calls currently running"))
+TOOL_CALL_DURATION = registry.register(
+    Histogram("lucius_tool_call_duration_seconds", "MCP tool call latency", ("tool", "outcome"))
+)
+TOOL_UPSTREAM_REQUESTS = registry.register(
+    Histogram(
+        "lucius_tool_upstream_requests",
+        "Allure TestOps API calls made per MCP tool call",
+        ("tool",),
+        buckets=REQUEST_COUNT_BUCKETS,
+    )
+)
+UPSTREAM_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("lucius_upstream_requests_in_flight", "Allure TestOps API calls currently awaiting a response")
+)
+UPSTREAM_REQUEST_DURATION = registry.register(
+    Histogram(
+        "lucius_upstream_request_duration_seconds",
+        "Allure TestOps API call latency by generated API operation and HTTP status class",
+        ("endpoint", "status"),
+    )
+)
+TOKEN_REFRESHES = registry.register(
+    Counter("lucius_token_refreshes_total", "JWT exchanges against Allure TestOps", ("outcome",))
+)
+
+
+def observe_tool_call(tool: str, outcome: str, seconds: float, upstream_requests: int | None = None) -> None:
+    """Record a finished MCP tool call and, when counted, the API calls it made."""
+    TOOL_CALL_DURATION.observe(seconds, tool, outcome)
+    if upstream_requests is not None:
+        TOOL_UPSTREAM_REQUESTS.observe(upstream_requests, tool)
+
+
+def observe_upstream_request(endpoint: str, status: int | None, seconds: float) -> None:
+    """Record a finished Allure TestOps API call; ``status`` is ``None`` when no response arrived."""
+    UPSTREAM_REQUEST_DURATION.observe(seconds, endpoint, _status_class(status))
+
+
+def render_metrics() -> str:
+    """Return every metric in the Prometheus text exposition format."""
+    return registry.render()
+
+
+def reset_metrics() -> None:
+    """Clear recorded values (used by tests)."""
+    registry.reset()
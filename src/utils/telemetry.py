@@ -11,6 +11,12 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
+from src.client.request_accounting import RequestLedger, count_requests
+from src.utils.config import settings
+from src.utils.deadline import deadline_scope
+from src.utils.metrics import TOOL_CALLS_IN_FLIGHT, observe_tool_call
+from src.utils.tracing import span
+
 if TYPE_CHECKING:
     from src.services.telemetry_service import TelemetryService
 
@@ -25,16 +31,32 @@ def set_telemetry_service(service: TelemetryService) -> None:
     _telemetry_service = service
 
 
-def wrap_tool_with_telemetry(tool: ToolFn, *, output_model: type[BaseModel] | None = None) -> ToolFn:
-    """Wrap a tool with telemetry and the MCP-only structured-output contract."""
+def wrap_tool_with_telemetry(
+    tool: ToolFn, *, output_model: type[BaseModel] | None = None, default_deadline: bool = False
+) -> ToolFn:
+    """Wrap a tool with telemetry and the MCP-only structured-output contract.
+
+    With ``default_deadline`` the call also runs under ``TOOL_DEADLINE_SECONDS``.
+    """
 
     @wraps(tool)
     async def wrapped(*args: object, **kwargs: object) -> object:
         started_at = time.perf_counter()
+        TOOL_CALLS_IN_FLIGHT.inc()
+        ledger = RequestLedger()
         try:
-            result = await tool(*args, **kwargs)
+            with (
+                deadline_scope((settings.TOOL_DEADLINE_SECONDS or None) if default_deadline else None),
+                span(f"tool {tool.__name__}", attributes={"mcp.tool.name": tool.__name__}) as current,
+                count_requests() as ledger,
+            ):
+                result = await tool(*args, **kwargs)
+                if current is not None:
+                    current.set_attribute("lucius.upstream_requests", ledger.total)
         except Exception as exc:
-            duration_ms = (time.perf_counter() - started_at) * 1000.0
+            elapsed = time.perf_counter() - started_at
+            observe_tool_call(tool.__name__, "error", elapsed, ledger.total)
+            duration_ms = elapsed * 1000.0
             if _telemetry_service is not None:
                 _telemetry_service.emit_tool_usage_event(
                     tool_name=tool.__name__,
@@ -43,11 +65,15 @@ def wrap_tool_with_telemetry(tool: ToolFn, *, output_model: type[BaseModel] | No
                     error=exc,
                 )
             raise
+        finally:
+            TOOL_CALLS_IN_FLIGHT.dec()
 
         if output_model is not None:
             result = _apply_mcp_output_contract(result, output_model)
 
-        duration_ms = (time.perf_counter() - started_at) * 1000.0
+        elapsed = time.perf_counter() - started_at
+        observe_tool_call(tool.__name__, "success", elapsed, ledger.total)
+        duration_ms = elapsed * 1000.0
         if _telemetry_service is not None:
             _telemetry_service.emit_tool_usage_event(
                 tool_name=tool.__name__,
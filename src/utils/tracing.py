@@ -0,0 +1,141 @@
+"""Optional OpenTelemetry tracing for tool calls, services, and TestOps requests.
+
+Spans are created through the OpenTelemetry API, a direct dependency.
+Recording and exporting them needs the ``opentelemetry-sdk`` and
+``opentelemetry-exporter-otlp-proto-http`` packages of the ``tracing`` extra
+(``pip install 'lucius-mcp[tracing]'``). Tracing is off until
+``configure_tracing`` installs a tracer provider; until then ``span`` and
+``traced`` add no overhead beyond a module-global check.
+
+A traced tool call produces a tree such as::
+
+    tool create_test_case
+    └── TestCaseService.create_test_case
+        ├── TestCaseService._add_steps
+        │   ├── HTTP POST
+        │   └── HTTP POST
+        └── HTTP GET
+
+The provider is kept in this module instead of being registered globally with
+OpenTelemetry, so tests can swap in an in-memory exporter per test.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from functools import wraps
+from typing import TYPE_CHECKING
+
+from opentelemetry.trace import Span, SpanKind
+
+from src.utils.logger import get_logger
+from src.version import __version__
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.util.types import AttributeValue
+
+logger = get_logger(__name__)
+
+TRACER_NAME = "lucius-mcp"
+
+_tracer_provider: TracerProvider | None = None
+
+
+def _new_provider() -> TracerProvider:
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+
+    return TracerProvider(resource=Resource.create({"service.name": TRACER_NAME, "service.version": __version__}))
+
+
+def configure_tracing(*, enabled: bool, otlp_endpoint: str | None = None) -> bool:
+    """Start exporting spans over OTLP/HTTP when ``enabled``.
+
+    Args:
+        enabled: Whether tracing is turned on.
+        otlp_endpoint: OTLP/HTTP traces URL. When unset, the exporter falls back to the
+            standard ``OTEL_EXPORTER_OTLP_*`` environment variables.
+
+    Returns:
+        Whether spans are now being exported.
+    """
+    global _tracer_provider
+    if not enabled or _tracer_provider is not None:
+        return _tracer_provider is not None
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning(
+            "Tracing requested but the OpenTelemetry SDK is not installed; spans are not exported. "
+            "Install the 'tracing' extra: pip install 'lucius-mcp[tracing]'"
+        )
+        return False
+
+    provider = _new_provider()
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=otlp_endpoint)))
+    _tracer_provider = provider
+    logger.info("Exporting OpenTelemetry spans over OTLP")
+    return True
+
+
+def use_in_memory_exporter() -> InMemorySpanExporter:
+    """Record spans synchronously into memory, replacing any configured exporter (used by tests)."""
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    global _tracer_provider
+    exporter = InMemorySpanExporter()
+    provider = _new_provider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    _tracer_provider = provider
+    return exporter
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop tracing."""
+    global _tracer_provider
+    provider, _tracer_provider = _tracer_provider, None
+    if provider is not None:
+        provider.shutdown()
+
+
+def tracing_enabled() -> bool:
+    return _tracer_provider is not None
+
+
+@contextlib.contextmanager
+def span(
+    name: str,
+    *,
+    kind: SpanKind = SpanKind.INTERNAL,
+    attributes: Mapping[str, AttributeValue] | None = None,
+) -> Iterator[Span | None]:
+    """Open a child span of the current one, or do nothing while tracing is off.
+
+    Exceptions escaping the block are recorded on the span, which is marked as failed.
+    """
+    provider = _tracer_provider
+    if provider is None:
+        yield None
+        return
+    tracer = provider.get_tracer(TRACER_NAME, __version__)
+    with tracer.start_as_current_span(name, kind=kind, attributes=attributes) as current:
+        yield current
+
+
+def traced[**P, R](fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Run an async method inside a span named after its qualified name, e.g. ``LaunchService.add_results``."""
+    name = fn.__qualname__
+
+    @wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if _tracer_provider is None:
+            return await fn(*args, **kwargs)
+        with span(name):
+            return await fn(*args, **kwargs)
+
+    return wrapper
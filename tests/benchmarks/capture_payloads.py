@@ -0,0 +1,67 @@
+"""Capture list pages from a TestOps instance as deserialization benchmark payloads.
+
+Usage::
+
+    ALLURE_ENDPOINT=https://testops.example ALLURE_API_TOKEN=... ALLURE_PROJECT_ID=1 \\
+        python -m tests.benchmarks.capture_payloads --launch-id 42
+
+Each page is saved byte for byte as TestOps sent it, so the benchmark decodes
+real field shapes, nulls, and nesting instead of a schema-driven sample.
+Review the captured pages for confidential names before committing them.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import httpx
+
+PAYLOADS = Path(__file__).parent / "payloads"
+PAGE_SIZE = 100
+
+
+def _pages(project_id: str, launch_id: int) -> dict[str, tuple[str, dict[str, object]]]:
+    return {
+        "test_case_page.json": ("/api/testcase", {"projectId": project_id, "page": 0, "size": PAGE_SIZE}),
+        "launch_page.json": ("/api/launch", {"projectId": project_id, "page": 0, "size": PAGE_SIZE}),
+        "test_result_flat_page.json": (
+            f"/api/v2/launch/{launch_id}/test-result/flat",
+            {"page": 0, "size": PAGE_SIZE},
+        ),
+    }
+
+
+def capture(endpoint: str, api_token: str, project_id: str, launch_id: int, output: Path) -> list[Path]:
+    """Download one page per benchmarked response type into ``output``."""
+    with httpx.Client(base_url=endpoint.rstrip("/"), timeout=60) as client:
+        token = client.post("/api/uaa/oauth/token", data={"grant_type": "apitoken", "token": api_token})
+        token.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {token.json()['access_token']}"
+
+        written = []
+        for name, (path, params) in _pages(project_id, launch_id).items():
+            response = client.get(path, params=params)
+            response.raise_for_status()
+            target = output / name
+            target.write_bytes(response.content)
+            written.append(target)
+        return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Capture TestOps list pages as benchmark payloads.")
+    parser.add_argument("--launch-id", type=int, required=True, help="Launch whose test results are captured.")
+    parser.add_argument("--output", type=Path, default=PAYLOADS)
+    args = parser.parse_args()
+    for path in capture(
+        os.environ["ALLURE_ENDPOINT"],
+        os.environ["ALLURE_API_TOKEN"],
+        os.environ["ALLURE_PROJECT_ID"],
+        args.launch_id,
+        args.output,
+    ):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
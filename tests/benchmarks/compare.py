@@ -0,0 +1,52 @@
+"""Compare two tool benchmark result files.
+
+Usage::
+
+    python -m tests.benchmarks.compare .benchmarks/tools-<base>.json .benchmarks/tools-<head>.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+METRICS = ("wall_seconds", "api_requests", "bytes_received", "bytes_sent", "peak_memory_bytes")
+
+
+def _load(path: Path) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = json.loads(path.read_text())["results"]
+    return results
+
+
+def _change(base: float, head: float) -> str:
+    if base == head:
+        return "="
+    if base == 0:
+        return "new"
+    return f"{(head - base) / base:+.1%}"
+
+
+def compare(base: dict[str, dict[str, Any]], head: dict[str, dict[str, Any]]) -> list[str]:
+    """Render one line per benchmark and metric present in both runs."""
+    lines = [f"{'benchmark':<44} {'metric':<18} {'base':>14} {'head':>14} {'change':>8}"]
+    for name in sorted(base.keys() & head.keys()):
+        for metric in METRICS:
+            base_value, head_value = base[name][metric], head[name][metric]
+            lines.append(
+                f"{name:<44} {metric:<18} {base_value:>14} {head_value:>14} {_change(base_value, head_value):>8}"
+            )
+    for name in sorted(base.keys() ^ head.keys()):
+        lines.append(f"{name:<44} only in {'base' if name in base else 'head'}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two tool benchmark result files.")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    args = parser.parse_args()
+    print("\n".join(compare(_load(args.base), _load(args.head))))
+
+
+if __name__ == "__main__":
+    main()
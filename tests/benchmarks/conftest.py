@@ -0,0 +1,16 @@
+"""Fixtures for tool benchmarks."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from tests.benchmarks.harness import BenchmarkResult, write_results
+
+
+@pytest.fixture(scope="session")
+def tool_benchmark_results() -> Iterator[list[BenchmarkResult]]:
+    """Collects tool benchmark results and writes them as JSON at the end of the session when requested."""
+    results: list[BenchmarkResult] = []
+    yield results
+    if results:
+        write_results(results)
@@ -0,0 +1,128 @@
+"""Harness timing tool calls end to end against the fake TestOps server.
+
+Each measurement runs the tool twice against a fresh fake project: once for
+wall time and upstream traffic, and once under ``tracemalloc`` for peak
+memory, whose tracing overhead would otherwise distort the timing.
+Client-side rate limiting is off during runs: the fake never throttles, and
+the limiter would otherwise dominate the timings of request-heavy tools.
+Results are written as JSON to ``$LUCIUS_BENCHMARK_RESULTS`` when it is set (see
+``write_results``) and two result files can be compared with
+``python -m tests.benchmarks.compare BASE.json HEAD.json``.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.client.rate_limit import RateLimitConfig, get_endpoint_limiter
+from tests.support.fake_testops import FakeTestOps, FakeTestOpsConfig
+
+type ToolCall = Callable[[], Awaitable[Any]]
+
+RESULTS_ENV = "LUCIUS_BENCHMARK_RESULTS"
+
+
+@dataclass(frozen=True)
+class ToolBenchmark:
+    """A tool call and the fake project it runs against."""
+
+    name: str
+    call: ToolCall
+    config: FakeTestOpsConfig = field(default_factory=FakeTestOpsConfig)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    wall_seconds: float
+    requests: int
+    api_requests: int
+    bytes_sent: int
+    bytes_received: int
+    peak_memory_bytes: int
+    calls: dict[str, int]
+    output: Any = field(default=None, repr=False, compare=False)
+
+    def to_json(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload.pop("output")
+        payload["wall_seconds"] = round(self.wall_seconds, 4)
+        return payload
+
+
+async def _run(benchmark: ToolBenchmark) -> tuple[FakeTestOps, Any]:
+    fake = FakeTestOps(benchmark.config)
+    # Registering the fake's endpoint first makes every client share this unlimited bucket.
+    get_endpoint_limiter(fake.base_url, RateLimitConfig(rate=0))
+    with patch.dict(os.environ, fake.env()), fake.mock():
+        output = await benchmark.call()
+    return fake, output
+
+
+async def measure(benchmark: ToolBenchmark) -> BenchmarkResult:
+    """Run ``benchmark`` and collect wall time, upstream traffic, and peak memory."""
+    started_at = time.perf_counter()
+    fake, output = await _run(benchmark)
+    wall_seconds = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    try:
+        await _run(benchmark)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = fake.stats
+    return BenchmarkResult(
+        name=benchmark.name,
+        wall_seconds=wall_seconds,
+        requests=stats.total,
+        api_requests=stats.api_calls,
+        # The fake's bytes sent are the client's bytes downloaded, and the other way round.
+        bytes_sent=stats.bytes_received,
+        bytes_received=stats.bytes_sent,
+        peak_memory_bytes=peak_memory,
+        calls=dict(sorted(stats.calls.items())),
+        output=output,
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def write_results(results: list[BenchmarkResult]) -> Path | None:
+    """Write results to ``$LUCIUS_BENCHMARK_RESULTS``; nothing is written when it is unset."""
+    target = os.environ.get(RESULTS_ENV)
+    if not target:
+        return None
+    commit = _git_commit()
+    path = Path(target)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "commit": commit,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": {result.name: result.to_json() for result in sorted(results, key=lambda result: result.name)},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+    return path
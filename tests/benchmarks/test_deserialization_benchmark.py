@@ -0,0 +1,62 @@
+"""Benchmark of generated vs fast deserialization on list-page payloads in the TestOps wire format.
+
+Timings depend on the machine and its load, so they are recorded as test properties
+(``--junitxml``) instead of being asserted; the test only checks that both paths build
+the same models. It is deselected by default, run it with ``pytest -m benchmark``.
+Refresh the pages in ``payloads/`` from a TestOps instance with
+``python -m tests.benchmarks.capture_payloads``.
+"""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.client.deserialization import FastApiClient, orjson_available
+from src.client.generated.api_client import ApiClient
+
+PAYLOADS = Path(__file__).parent / "payloads"
+ROUNDS = 5
+ITERATIONS = 20
+
+
+def _best_of(fn: Callable[[], Any]) -> float:
+    """Return the fastest mean seconds per call over several rounds."""
+    fn()
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            fn()
+        timings.append((time.perf_counter() - started) / ITERATIONS)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("payload", "response_type"),
+    [
+        ("test_result_flat_page.json", "PageTestResultFlatDto"),
+        ("test_case_page.json", "PageTestCaseDto"),
+        ("launch_page.json", "PageLaunchDto"),
+    ],
+)
+def test_fast_deserialization_of_list_pages(
+    payload: str, response_type: str, record_property: Callable[[str, object], None]
+) -> None:
+    text = (PAYLOADS / payload).read_text()
+    generated = ApiClient()
+    fast = FastApiClient(fast_deserialization=True)
+
+    assert fast.deserialize(text, response_type, "application/json") == generated.deserialize(
+        text, response_type, "application/json"
+    )
+
+    generated_seconds = _best_of(lambda: generated.deserialize(text, response_type, "application/json"))
+    fast_seconds = _best_of(lambda: fast.deserialize(text, response_type, "application/json"))
+
+    record_property("generated_ms", round(generated_seconds * 1000, 3))
+    record_property("fast_ms", round(fast_seconds * 1000, 3))
+    record_property("orjson", orjson_available())
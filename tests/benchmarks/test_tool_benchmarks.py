@@ -0,0 +1,101 @@
+"""End-to-end tool benchmarks against the fake TestOps server.
+
+They are deselected by default. Run them on their own
+(``uv run pytest tests/benchmarks -m benchmark -p no:xdist``) to get stable
+timings, with ``LUCIUS_BENCHMARK_RESULTS`` set to keep the results for
+comparison between commits.
+"""
+
+import base64
+from collections.abc import Callable
+
+import pytest
+
+from src.tools.cleanup import delete_archived_test_cases
+from src.tools.create_test_case import create_test_case
+from src.tools.launches import list_launch_test_results, upload_test_results
+from src.tools.list_test_suites import list_test_suites
+from src.tools.search import list_test_cases
+from src.tools.update_test_case import update_test_case
+from tests.benchmarks.harness import BenchmarkResult, ToolBenchmark, measure
+from tests.support.fake_testops import FakeTestOpsConfig
+
+# Per-response delay standing in for the network round trip to TestOps.
+LATENCY_SECONDS = 0.002
+ATTACHMENT = base64.b64encode(b"x" * 4096).decode()
+
+
+def _steps(count: int, *, with_attachments: int = 0) -> list[dict[str, object]]:
+    steps: list[dict[str, object]] = []
+    for index in range(count):
+        step: dict[str, object] = {"action": f"Action {index}", "expected": f"Expected {index}"}
+        if index < with_attachments:
+            step["attachments"] = [{"name": f"step-{index}.txt", "content": ATTACHMENT, "content_type": "text/plain"}]
+        steps.append(step)
+    return steps
+
+
+BENCHMARKS = [
+    ToolBenchmark(
+        name="create_test_case_with_steps_and_attachments",
+        call=lambda: create_test_case(
+            name="Benchmark checkout",
+            steps=_steps(10, with_attachments=3),
+            attachments=[{"name": "report.txt", "content": ATTACHMENT, "content_type": "text/plain"}],
+            output_format="json",
+        ),
+        config=FakeTestOpsConfig(latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="update_test_case_replacing_steps",
+        call=lambda: update_test_case(test_case_id=5, steps=_steps(10), confirm=True, output_format="json"),
+        config=FakeTestOpsConfig(steps_per_test_case=10, latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="list_test_suites",
+        call=lambda: list_test_suites(output_format="json"),
+        config=FakeTestOpsConfig(suites_per_level=(10, 5), latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="add_results_1000",
+        call=lambda: upload_test_results(
+            launch_id=1,
+            results=[{"test_case_id": index % 200 + 1, "status": "passed"} for index in range(1000)],
+            output_format="json",
+        ),
+        config=FakeTestOpsConfig(launches=1, results_per_launch=0, latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="list_launch_test_results_failed_only",
+        call=lambda: list_launch_test_results(launch_id=1, failed_only=True, output_format="json"),
+        config=FakeTestOpsConfig(launches=1, results_per_launch=10_000, latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="list_test_cases_all_pages_5000",
+        call=lambda: list_test_cases(all_pages=True, max_items=5000, output_format="json"),
+        config=FakeTestOpsConfig(test_cases=5000, latency=LATENCY_SECONDS),
+    ),
+    ToolBenchmark(
+        name="delete_archived_test_cases",
+        call=lambda: delete_archived_test_cases(confirm=True, output_format="json"),
+        config=FakeTestOpsConfig(archived_test_cases=200, latency=LATENCY_SECONDS),
+    ),
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("benchmark", BENCHMARKS, ids=lambda benchmark: benchmark.name)
+async def test_tool_benchmark(
+    benchmark: ToolBenchmark,
+    tool_benchmark_results: list[BenchmarkResult],
+    record_property: Callable[[str, object], None],
+) -> None:
+    result = await measure(benchmark)
+    tool_benchmark_results.append(result)
+
+    for metric, value in result.to_json().items():
+        if metric not in {"name", "calls"}:
+            record_property(metric, value)
+    assert result.output.structured_content is not None
+    assert not any(call.endswith(" unmatched") for call in result.calls), result.calls
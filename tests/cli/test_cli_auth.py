@@ -901,7 +901,7 @@ class TestCLICompletionScripts:
             assert "--pretty" in rendered
             assert "csv" in rendered
         assert "-l pretty" in fish
-        assert "json table plain csv" in fish
+        assert "json table plain csv ndjson" in fish
         for rendered in (bash, zsh, powershell):
             assert "--url" in rendered
             assert "--token" in rendered
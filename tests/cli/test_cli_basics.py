@@ -24,7 +24,7 @@ def test_cli_help():
     assert "lucius list" in result.stdout
     assert "Available Entities" in result.stdout
     assert "test_case" in result.stdout
-    assert "--format json|table|plain|csv" in result.stdout
+    assert "--format json|table|plain|csv|ndjson" in result.stdout
 
 
 def test_cli_version():
@@ -41,7 +41,7 @@ def test_cli_entity_actions():
     assert result.returncode == 0
     assert "Actions for test_case" in result.stdout
     assert "list" in result.stdout
-    assert "--format json|table|plain|csv" in result.stdout
+    assert "--format json|table|plain|csv|ndjson" in result.stdout
 
 
 def test_cli_list_displays_discovery_table():
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta, tzinfo
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -278,6 +279,36 @@ class TestE2ERouting:
                 run_cli(["test_case", "list", "--args", "{}", "--format", "csv"])
         assert "invalid json" in exc_info.value.message.lower()
 
+    def test_run_cli_ndjson_streams_one_row_per_line(self, capsys: pytest.CaptureFixture[str]) -> None:
+        calls: list[dict[str, object]] = []
+
+        async def stream_rows(**kwargs: object) -> AsyncGenerator[dict[str, object]]:
+            calls.append(kwargs)
+            yield {"id": 1, "name": "Ünïcode [smoke]"}
+            yield {"id": 2, "name": "Beta"}
+
+        with patch("src.cli.runtime.resolve_tool_function", return_value=stream_rows) as mock_resolve:
+            run_cli(
+                [
+                    "test_case",
+                    "list",
+                    "--args",
+                    '{"tags": ["smoke"], "size": 50, "all_pages": true}',
+                    "--format",
+                    "ndjson",
+                ]
+            )
+
+        mock_resolve.assert_called_once_with("stream_list_test_cases")
+        assert calls == [{"tags": ["smoke"]}]
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1, "name": "Ünïcode [smoke]"}, {"id": 2, "name": "Beta"}]
+
+    def test_run_cli_ndjson_rejects_actions_without_a_row_stream(self) -> None:
+        with pytest.raises(CLIError) as exc_info:
+            run_cli(["launch", "list", "--args", "{}", "--format", "ndjson"])
+        assert "does not support --format ndjson" in exc_info.value.message
+
     def test_run_cli_invalid_json(self) -> None:
         with pytest.raises(CLIError) as exc_info:
             run_cli(["test_case", "list", "--args", "{invalid}"])
@@ -0,0 +1,96 @@
+"""Tests for the persistent CLI JWT cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from src.cli.token_cache import TOKEN_CACHE_ENV, FileTokenCache, cli_token_cache, token_cache_path
+from src.client.token_cache import CachedToken, get_token_cache
+
+ENDPOINT = "https://example.testops.cloud"
+
+
+def test_token_cache_lives_next_to_auth_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.cli.auth_config.platformdirs.user_config_path", lambda *args, **kwargs: tmp_path)
+    assert token_cache_path() == tmp_path / "token_cache.json"
+
+
+def test_store_and_load_round_trip_without_leaking_api_token(tmp_path: Path) -> None:
+    cache = FileTokenCache(tmp_path / "token_cache.json")
+    expires_at = time.time() + 3000
+    cache.store(f"{ENDPOINT}/", SecretStr("api-token"), CachedToken("jwt", expires_at, "csrf"))
+
+    assert cache.load(ENDPOINT, SecretStr("api-token")) == CachedToken("jwt", expires_at, "csrf")
+    assert cache.load(ENDPOINT, SecretStr("other-token")) is None
+    assert cache.load("https://other.testops.cloud", SecretStr("api-token")) is None
+    assert "api-token" not in (tmp_path / "token_cache.json").read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions only")
+def test_cache_file_is_private(tmp_path: Path) -> None:
+    path = tmp_path / "lucius" / "token_cache.json"
+    FileTokenCache(path).store(ENDPOINT, SecretStr("api-token"), CachedToken("jwt", time.time() + 3000))
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_store_prunes_expired_entries(tmp_path: Path) -> None:
+    path = tmp_path / "token_cache.json"
+    cache = FileTokenCache(path)
+    cache.store(ENDPOINT, SecretStr("old-token"), CachedToken("old-jwt", time.time() - 1))
+    cache.store(ENDPOINT, SecretStr("new-token"), CachedToken("new-jwt", time.time() + 3000))
+
+    tokens = json.loads(path.read_text(encoding="utf-8"))["tokens"]
+    assert [entry["access_token"] for entry in tokens.values()] == ["new-jwt"]
+
+
+def test_discard_removes_entry(tmp_path: Path) -> None:
+    cache = FileTokenCache(tmp_path / "token_cache.json")
+    cache.store(ENDPOINT, SecretStr("api-token"), CachedToken("jwt", time.time() + 3000))
+    cache.discard(ENDPOINT, SecretStr("api-token"))
+
+    assert cache.load(ENDPOINT, SecretStr("api-token")) is None
+
+
+def test_malformed_cache_file_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "token_cache.json"
+    path.write_text("{not-json", encoding="utf-8")
+    cache = FileTokenCache(path)
+
+    assert cache.load(ENDPOINT, SecretStr("api-token")) is None
+    cache.store(ENDPOINT, SecretStr("api-token"), CachedToken("jwt", time.time() + 3000))
+    assert cache.load(ENDPOINT, SecretStr("api-token")) is not None
+
+
+def test_clear_removes_cache_file(tmp_path: Path) -> None:
+    cache = FileTokenCache(tmp_path / "token_cache.json")
+    cache.store(ENDPOINT, SecretStr("api-token"), CachedToken("jwt", time.time() + 3000))
+
+    assert cache.clear() is True
+    assert cache.clear() is False
+
+
+def test_cli_token_cache_installs_cache_for_command_scope(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(TOKEN_CACHE_ENV, raising=False)
+    assert get_token_cache() is None
+
+    with cli_token_cache() as cache:
+        assert isinstance(cache, FileTokenCache)
+        assert get_token_cache() is cache
+
+    assert get_token_cache() is None
+
+
+def test_cli_token_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(TOKEN_CACHE_ENV, "0")
+
+    with cli_token_cache() as cache:
+        assert cache is None
+        assert get_token_cache() is None
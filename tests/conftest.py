@@ -1,9 +1,17 @@
+from collections.abc import Iterator
+
 import pytest
 import umami
 from starlette.applications import Starlette
 from starlette.routing import Mount
 
+from src.client.http_cache import reset_response_cache
+from src.client.rate_limit import reset_endpoint_limiters
+from src.services.custom_field_cache import reset_resolved_custom_field_cache
+from src.services.search_index import reset_test_case_indexes
+from src.services.test_layer_service import reset_test_layer_catalogues
 from src.utils.config import settings
+from src.utils.metrics import reset_metrics
 
 settings.MCP_MODE = "http"
 
@@ -13,9 +21,22 @@ pytest_plugins = [
     "tests.support.fixtures.logger_fixture",
     "tests.support.fixtures.client_fixture",
     "tests.support.fixtures.allure_client_fixture",
+    "tests.support.fixtures.fake_testops_fixture",
 ]
 
 
+@pytest.fixture(autouse=True)
+def _reset_process_wide_http_state() -> Iterator[None]:
+    """Keep throttling, cached responses and metadata, metrics, and search indexes from leaking across tests."""
+    yield
+    reset_endpoint_limiters()
+    reset_response_cache()
+    reset_metrics()
+    reset_test_case_indexes()
+    reset_resolved_custom_field_cache()
+    reset_test_layer_catalogues()
+
+
 @pytest.fixture
 def app() -> Starlette:
     """
@@ -398,3 +398,30 @@ async def test_e2e_8_test_layer_assignment(
             test_layer_name="Missing-Layer",
             project_id=project_id,
         )
+
+
+async def test_e2e_9_expected_results_round_trip(
+    project_id: int,
+    allure_client: AllureClient,
+    cleanup_tracker: CleanupTracker,
+) -> None:
+    """
+    E2E-9: Expected Results Round Trip.
+    Expected results written on creation are read back unchanged, with and without step-less neighbours.
+    """
+    service = TestCaseService(client=allure_client)
+
+    steps = [
+        {"action": "Open the cart", "expected": "Cart is empty"},
+        {"action": "Add an item"},
+        {"action": "Check out", "expected": "Order is placed"},
+    ]
+
+    created_case = await service.create_test_case(name="E2E-9 Expected Results", steps=steps)
+    test_case_id = created_case.id
+    assert test_case_id is not None
+    cleanup_tracker.track_test_case(test_case_id)
+
+    scenario = await allure_client.get_test_case_scenario(test_case_id)
+    written = [(step.actual_instance.body, step.actual_instance.expected_result) for step in scenario.steps or []]
+    assert written == [(step["action"], step.get("expected")) for step in steps]
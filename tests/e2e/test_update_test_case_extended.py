@@ -55,6 +55,32 @@ async def test_e2e_u5_update_steps(
     assert "New Step 1" in step_bodies or "New Step 2" in step_bodies or "New Step 3" in step_bodies
 
 
+async def test_e2e_u5b_recreated_steps_keep_expected_results(
+    project_id: int,
+    allure_client: AllureClient,
+    cleanup_tracker: CleanupTracker,
+) -> None:
+    """
+    E2E-U5b: Recreated Steps Keep Expected Results.
+    Replacing most of a scenario rewrites it; the expected results must survive the rewrite.
+    """
+    service = TestCaseService(client=allure_client)
+
+    created_case = await service.create_test_case(name="E2E-U5b Expected Results", steps=[{"action": "Old"}])
+    test_case_id = created_case.id
+    assert test_case_id is not None
+    cleanup_tracker.track_test_case(test_case_id)
+
+    new_steps: list[dict[str, object]] = [
+        {"action": f"Step {index}", "expected": f"Result {index}"} for index in range(12)
+    ]
+    await service.update_test_case(test_case_id, TestCaseUpdate(steps=new_steps))
+
+    scenario = await allure_client.get_test_case_scenario(test_case_id)
+    written = [(step.actual_instance.body, step.actual_instance.expected_result) for step in scenario.steps or []]
+    assert written == [(step["action"], step["expected"]) for step in new_steps]
+
+
 async def test_e2e_u6_update_global_attachments(
     project_id: int,
     allure_client: AllureClient,
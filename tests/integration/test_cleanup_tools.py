@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.services.test_case_service import ArchivedCleanupResult
 from src.tools.cleanup import (
     DESTRUCTIVE_CONFIRMATION_MESSAGE,
     delete_archived_shared_steps,
@@ -28,7 +29,7 @@ async def test_delete_archived_test_cases_output() -> None:
 
         with patch("src.tools.cleanup.TestCaseService") as mock_service_cls:
             mock_service = mock_service_cls.return_value
-            mock_service.cleanup_archived = AsyncMock(return_value=4)
+            mock_service.cleanup_archived = AsyncMock(return_value=ArchivedCleanupResult(deleted_count=4))
 
             output = await delete_archived_test_cases(confirm=True, output_format="plain")
 
@@ -36,6 +37,21 @@ async def test_delete_archived_test_cases_output() -> None:
             mock_service.cleanup_archived.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_delete_archived_test_cases_marks_partial_cleanup() -> None:
+    with patch("src.tools.cleanup.AllureClient.from_env") as mock_client_ctx:
+        mock_client_ctx.return_value.__aenter__.return_value = AsyncMock()
+
+        with patch("src.tools.cleanup.TestCaseService") as mock_service_cls:
+            mock_service_cls.return_value.cleanup_archived = AsyncMock(
+                return_value=ArchivedCleanupResult(deleted_count=3, partial=True)
+            )
+
+            output = await delete_archived_test_cases(confirm=True, deadline_seconds=5, output_format="json")
+
+    assert output.structured_content == {"deleted_count": 3, "partial": True}
+
+
 @pytest.mark.asyncio
 async def test_delete_archived_shared_steps_requires_confirmation() -> None:
     with patch("src.tools.cleanup.SharedStepService") as mock_service_cls:
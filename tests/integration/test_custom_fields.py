@@ -1,9 +1,15 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.client import AllureClient
-from src.client.exceptions import AllureValidationError
+from src.client.exceptions import AllureAPIError, AllureValidationError
+from src.client.generated.models.custom_field_dto import CustomFieldDto
+from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto
+from src.client.generated.models.custom_field_value_with_tc_count_dto import CustomFieldValueWithTcCountDto
+from src.client.generated.models.page_custom_field_project_dto import PageCustomFieldProjectDto
+from src.client.generated.models.page_custom_field_value_with_tc_count_dto import PageCustomFieldValueWithTcCountDto
 
 
 @pytest.mark.asyncio
@@ -52,8 +58,8 @@ async def test_client_get_custom_fields_integration() -> None:
                 await client.get_custom_fields_with_values(project_id)
 
                 # Verify calls
-                mock_v2.find_by_project1.assert_called_once_with(project_id=project_id)
-                mock_val.find_all22.assert_called_once_with(project_id=project_id, custom_field_id=1)
+                mock_v2.find_by_project1.assert_called_once_with(project_id=project_id, page=0, size=100)
+                mock_val.find_all22.assert_called_once_with(project_id=project_id, custom_field_id=1, page=0, size=100)
 
 
 @pytest.mark.asyncio
@@ -67,3 +73,51 @@ async def test_client_get_custom_fields_validation() -> None:
             # Should raise error for invalid project_id
             with pytest.raises(AllureValidationError):
                 await client.get_custom_fields_with_values(0)
+
+
+@pytest.mark.asyncio
+async def test_client_get_custom_fields_pages_fully_and_loads_values_concurrently() -> None:
+    """Every field and value page is read; values load concurrently and one failing field yields no values."""
+    field_pages = [
+        [CustomFieldProjectDto(custom_field=CustomFieldDto(id=field_id, name=f"Field{field_id}")) for field_id in ids]
+        for ids in ([1, 2, 3], [4, 5])
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def find_by_project1(*, project_id: int, page: int, size: int) -> PageCustomFieldProjectDto:
+        return PageCustomFieldProjectDto(content=field_pages[page], total_pages=len(field_pages))
+
+    async def find_all22(
+        *, project_id: int, custom_field_id: int, page: int, size: int
+    ) -> PageCustomFieldValueWithTcCountDto:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if custom_field_id == 3:
+            raise AllureAPIError("values unavailable", status_code=500)
+        return PageCustomFieldValueWithTcCountDto(
+            content=[CustomFieldValueWithTcCountDto(id=custom_field_id * 10 + page, name=f"v{page}")],
+            total_pages=2,
+        )
+
+    with patch("src.client.client.AllureClient._ensure_valid_token", new_callable=AsyncMock):
+        from pydantic import SecretStr
+
+        async with AllureClient("http://localhost", SecretStr("token"), 1) as client:
+            client._custom_field_project_v2_api = AsyncMock(find_by_project1=find_by_project1)
+            client._custom_field_value_project_api = AsyncMock(find_all22=find_all22)
+
+            fields = await client.get_custom_fields_with_values(1)
+
+    assert [field.custom_field.custom_field.id for field in fields] == [1, 2, 3, 4, 5]
+    assert [field.values and [value.id for value in field.values] for field in fields] == [
+        [10, 11],
+        [20, 21],
+        None,
+        [40, 41],
+        [50, 51],
+    ]
+    assert peak > 1
@@ -4,14 +4,14 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.client import AllureClient
-from src.client.exceptions import AllureNotFoundError, AllureValidationError
+from src.client.exceptions import AllureValidationError
 from src.client.generated.models import TestLayerDto
 
 # We need to test the TOOLS, or at least the Service which supports them.
 # The tools are simple wrappers. Testing the Service validation logic (which we just updated)
 # is the most direct way to verify the hints.
 from src.services.test_case_service import TestCaseService
-from src.services.test_layer_service import TestLayerService
+from src.services.test_layer_service import TestLayerCatalogue, TestLayerService
 from src.tools.create_test_case import create_test_case
 from src.tools.update_test_case import update_test_case
 
@@ -221,11 +221,10 @@ async def test_create_test_case_tool_propagates_errors(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_create_test_case_invalid_test_layer_id_message(service: TestCaseService) -> None:
-    service._test_layer_service.get_test_layer.side_effect = AllureNotFoundError("missing")
-    service._test_layer_service.list_test_layers.return_value = [
-        TestLayerDto(id=1, name="Layer1"),
-        TestLayerDto(id=2, name="Layer2"),
-    ]
+    service._test_layer_service.find_test_layer.return_value = None
+    service._test_layer_service.get_test_layer_catalogue.return_value = TestLayerCatalogue.from_layers(
+        [TestLayerDto(id=1, name="Layer1"), TestLayerDto(id=2, name="Layer2")]
+    )
 
     with pytest.raises(AllureValidationError) as excinfo:
         await service.create_test_case(name="Test", test_layer_id=123)
@@ -241,9 +240,10 @@ async def test_create_test_case_invalid_test_layer_id_message(service: TestCaseS
 
 @pytest.mark.asyncio
 async def test_create_test_case_invalid_test_layer_name_message(service: TestCaseService) -> None:
-    service._test_layer_service.list_test_layers.return_value = [
-        TestLayerDto(id=1, name="Layer1"),
-    ]
+    service._test_layer_service.find_test_layers_by_name.return_value = ()
+    service._test_layer_service.get_test_layer_catalogue.return_value = TestLayerCatalogue.from_layers(
+        [TestLayerDto(id=1, name="Layer1")]
+    )
 
     with pytest.raises(AllureValidationError) as excinfo:
         await service.create_test_case(name="Test", test_layer_name="Missing")
@@ -259,10 +259,10 @@ async def test_create_test_case_invalid_test_layer_name_message(service: TestCas
 
 @pytest.mark.asyncio
 async def test_create_test_case_ambiguous_test_layer_name_message(service: TestCaseService) -> None:
-    service._test_layer_service.list_test_layers.return_value = [
+    service._test_layer_service.find_test_layers_by_name.return_value = (
         TestLayerDto(id=1, name="Layer"),
         TestLayerDto(id=2, name="Layer"),
-    ]
+    )
 
     with pytest.raises(AllureValidationError) as excinfo:
         await service.create_test_case(name="Test", test_layer_name="Layer")
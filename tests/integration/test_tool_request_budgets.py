@@ -0,0 +1,87 @@
+"""Upstream request budgets of tools, checked against the fake TestOps server."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from src.client.request_accounting import count_requests
+from src.tools.annotations import TOOL_HINT_POLICY
+from src.tools.budgets import TOOL_REQUEST_BUDGETS
+from src.tools.create_test_case import create_test_case
+from src.tools.delete_test_case import delete_test_case
+from src.tools.get_test_case_custom_fields import get_test_case_custom_fields
+from src.tools.launches import get_launch, list_launch_test_results, list_launches
+from src.tools.link_shared_step import link_shared_step
+from src.tools.list_custom_field_values import list_custom_field_values
+from src.tools.list_integrations import list_integrations
+from src.tools.search import get_test_case_details, list_test_cases, search_test_cases
+from src.tools.shared_steps import list_shared_steps
+from src.tools.test_layers import create_test_layer, delete_test_layer, list_test_layers, update_test_layer
+from src.tools.unlink_shared_step import unlink_shared_step
+from src.tools.update_test_case import update_test_case
+from tests.support.fake_testops import FakeTestOps
+
+type ToolCall = Callable[[], Awaitable[Any]]
+
+
+async def _nothing() -> None:
+    return None
+
+
+# tool name -> (setup, measured call); setup requests are not counted.
+BUDGET_CALLS: dict[str, tuple[ToolCall, ToolCall]] = {
+    "create_test_case": (_nothing, lambda: create_test_case(name="Budget", tags=["smoke"], output_format="json")),
+    "create_test_layer": (_nothing, lambda: create_test_layer(name="Contract", output_format="json")),
+    "delete_test_case": (_nothing, lambda: delete_test_case(test_case_id=5, confirm=True, output_format="json")),
+    "delete_test_layer": (_nothing, lambda: delete_test_layer(layer_id=1, confirm=True, output_format="json")),
+    "get_launch": (_nothing, lambda: get_launch(launch_id=1, output_format="json")),
+    "get_test_case_custom_fields": (
+        _nothing,
+        lambda: get_test_case_custom_fields(test_case_id=5, output_format="json"),
+    ),
+    "get_test_case_details": (_nothing, lambda: get_test_case_details(test_case_id=5, output_format="json")),
+    "link_shared_step": (
+        _nothing,
+        lambda: link_shared_step(test_case_id=5, shared_step_id=2, confirm=True, output_format="json"),
+    ),
+    "list_custom_field_values": (_nothing, lambda: list_custom_field_values(custom_field_id=1, output_format="json")),
+    "list_integrations": (_nothing, lambda: list_integrations(output_format="json")),
+    "list_launch_test_results": (_nothing, lambda: list_launch_test_results(launch_id=1, output_format="json")),
+    "list_launches": (_nothing, lambda: list_launches(output_format="json")),
+    "list_shared_steps": (_nothing, lambda: list_shared_steps(output_format="json")),
+    "list_test_cases": (_nothing, lambda: list_test_cases(tags=["smoke"], output_format="json")),
+    "list_test_layers": (_nothing, lambda: list_test_layers(output_format="json")),
+    "search_test_cases": (_nothing, lambda: search_test_cases(query="tag:smoke", output_format="json")),
+    "unlink_shared_step": (
+        lambda: link_shared_step(test_case_id=5, shared_step_id=2, confirm=True, output_format="json"),
+        lambda: unlink_shared_step(test_case_id=5, shared_step_id=2, confirm=True, output_format="json"),
+    ),
+    "update_test_case": (
+        _nothing,
+        lambda: update_test_case(test_case_id=5, name="Renamed", confirm=True, output_format="json"),
+    ),
+    "update_test_layer": (
+        _nothing,
+        lambda: update_test_layer(layer_id=1, name="Renamed", confirm=True, output_format="json"),
+    ),
+}
+
+
+def test_every_budget_names_a_tool_and_is_exercised() -> None:
+    assert set(TOOL_REQUEST_BUDGETS) <= set(TOOL_HINT_POLICY)
+    assert set(BUDGET_CALLS) == set(TOOL_REQUEST_BUDGETS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool_name", sorted(TOOL_REQUEST_BUDGETS))
+async def test_tool_stays_within_request_budget(tool_name: str, fake_testops: FakeTestOps) -> None:
+    setup, call = BUDGET_CALLS[tool_name]
+    await setup()
+
+    with count_requests() as ledger:
+        await call()
+
+    budget = TOOL_REQUEST_BUDGETS[tool_name]
+    assert ledger.total <= budget, f"{tool_name} made {ledger.total} requests (budget {budget}): {ledger.summary()}"
+    assert not any(route.endswith("unmatched") for route in fake_testops.stats.calls)
@@ -8,7 +8,9 @@ import ast
 import os
 import platform
 import re
+import socket
 import subprocess
+import sys
 import tempfile
 import time
 from os import environ
@@ -436,6 +438,50 @@ class TestBinaryExecution:
         assert "lucius <entity>" in output, "Help output missing entity/action usage"
         assert "Available Entities" in output, "Help output missing entity list"
 
+    def test_binary_runs_a_command_against_testops(self, built_cli_binary: Path, tmp_path: Path) -> None:
+        """Test the binary reaches the lazily imported generated client and its models."""
+        project_root = Path(__file__).parent.parent.parent
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        server = subprocess.Popen(
+            [sys.executable, "-m", "tests.support.fake_testops", "--port", str(port), "--test-cases", "5"],
+            cwd=project_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        pytest.fail("Fake TestOps server did not start")
+                    time.sleep(0.2)
+
+            result = subprocess.run(
+                [str(built_cli_binary), "test_case", "get", "--args", '{"test_case_id": 1}', "--format", "plain"],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env={
+                    **os.environ,
+                    "HOME": str(tmp_path),
+                    "ALLURE_ENDPOINT": f"http://127.0.0.1:{port}",
+                    "ALLURE_API_TOKEN": "fake-api-token",
+                    "ALLURE_PROJECT_ID": "1",
+                },
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+        assert result.returncode == 0, f"Command failed: {result.stdout}{result.stderr}"
+        assert "Test Case #1" in result.stdout
+
 
 class TestBinaryStandaloneExecution:
     """Test binary executes standalone without Python runtime."""
@@ -580,6 +626,23 @@ class TestBinaryBuildScriptConfiguration:
             sorted(missing)
         )
 
+    def test_lazily_imported_client_packages_included_in_nuitka_builds(self) -> None:
+        """Nuitka cannot follow the importlib imports of the generated and overridden client packages."""
+        project_root = Path(__file__).parent.parent.parent
+        scripts = [
+            project_root / "deployment/scripts/build_cli_unix.sh",
+            project_root / "deployment/scripts/build_cli_windows.bat",
+        ]
+
+        missing: list[str] = []
+        for script_path in scripts:
+            content = script_path.read_text(encoding="utf-8")
+            for package in ("src.client.generated", "src.client.overridden"):
+                if f"--include-package={package}" not in content:
+                    missing.append(f"{script_path}: {package}")
+
+        assert not missing, "Nuitka build scripts missing client package include flags:\n" + "\n".join(sorted(missing))
+
     def test_onefile_cached_mode_enabled_for_build_scripts(self) -> None:
         """Onefile builds must enable cached startup extraction mode."""
         project_root = Path(__file__).parent.parent.parent
@@ -0,0 +1,63 @@
+"""Local stand-in for Allure TestOps, for offline benchmarks and load tests.
+
+The fake serves a synthetic project through the endpoints ``AllureClient``
+uses (token exchange, test cases, scenarios, attachments, custom fields, test
+layers, shared steps, trees, launches, and test results) and counts every
+request it answers.
+
+In-process, ``FakeTestOps.mock()`` routes the client's HTTP traffic straight
+into the ASGI app, so no port is opened::
+
+    fake = FakeTestOps(FakeTestOpsConfig(test_cases=50_000))
+    with fake.mock():
+        async with AllureClient(fake.base_url, SecretStr(fake.config.api_token), fake.config.project_id) as client:
+            ...
+    print(fake.stats.snapshot())
+
+For load tests against a running server, serve it on a local port with
+``python -m tests.support.fake_testops --port 8787``.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import respx
+from respx.handlers import ASGIHandler
+from starlette.applications import Starlette
+
+from .app import RequestStats, create_app
+from .config import FakeTestOpsConfig
+from .store import FakeTestOpsStore
+
+DEFAULT_BASE_URL = "https://fake-testops.local"
+
+
+class FakeTestOps:
+    """A fake TestOps project with its ASGI app and request statistics."""
+
+    def __init__(self, config: FakeTestOpsConfig | None = None, *, base_url: str = DEFAULT_BASE_URL) -> None:
+        self.config = config or FakeTestOpsConfig()
+        self.base_url = base_url
+        self.store = FakeTestOpsStore(self.config)
+        self.stats = RequestStats()
+        self.app: Starlette = create_app(self.store, self.stats)
+
+    def env(self) -> dict[str, str]:
+        """Environment variables that point ``AllureClient.from_env`` at this fake."""
+        return {
+            "ALLURE_ENDPOINT": self.base_url,
+            "ALLURE_API_TOKEN": self.config.api_token,
+            "ALLURE_PROJECT_ID": str(self.config.project_id),
+        }
+
+    @contextmanager
+    def mock(self) -> Iterator[respx.MockRouter]:
+        """Serve every request to ``base_url`` from the app in-process; other hosts are left unmocked."""
+        host = self.base_url.split("://", 1)[-1].split("/", 1)[0]
+        with respx.mock(assert_all_called=False) as router:
+            router.route(host=host).mock(side_effect=ASGIHandler(self.app))
+            router.route().pass_through()
+            yield router
+
+
+__all__ = ["FakeTestOps", "FakeTestOpsConfig", "FakeTestOpsStore", "RequestStats", "create_app"]
@@ -0,0 +1,69 @@
+"""Serve the fake Allure TestOps API on a local port.
+
+Example::
+
+    python -m tests.support.fake_testops --port 8787 --test-cases 50000 --results-per-launch 10000 --latency 0.02
+    ALLURE_ENDPOINT=http://127.0.0.1:8787 ALLURE_API_TOKEN=fake-api-token ALLURE_PROJECT_ID=1 lucius-mcp
+
+Request counts are printed when the server stops.
+"""
+
+import argparse
+import json
+
+import uvicorn
+
+from . import FakeTestOps, FakeTestOpsConfig
+
+
+def _parse_args() -> argparse.Namespace:
+    defaults = FakeTestOpsConfig()
+    parser = argparse.ArgumentParser(prog="python -m tests.support.fake_testops", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--project-id", type=int, default=defaults.project_id)
+    parser.add_argument("--api-token", default=defaults.api_token)
+    parser.add_argument("--test-cases", type=int, default=defaults.test_cases)
+    parser.add_argument("--archived-test-cases", type=int, default=defaults.archived_test_cases)
+    parser.add_argument("--launches", type=int, default=defaults.launches)
+    parser.add_argument("--results-per-launch", type=int, default=defaults.results_per_launch)
+    parser.add_argument("--failed-ratio", type=float, default=defaults.failed_ratio)
+    parser.add_argument("--custom-fields", type=int, default=defaults.custom_fields)
+    parser.add_argument("--values-per-custom-field", type=int, default=defaults.values_per_custom_field)
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="Seconds added to every API response.")
+    parser.add_argument("--latency-jitter", type=float, default=defaults.latency_jitter)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Share of failed API requests.")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    config = FakeTestOpsConfig(
+        project_id=args.project_id,
+        api_token=args.api_token,
+        test_cases=args.test_cases,
+        archived_test_cases=args.archived_test_cases,
+        launches=args.launches,
+        results_per_launch=args.results_per_launch,
+        failed_ratio=args.failed_ratio,
+        custom_fields=args.custom_fields,
+        values_per_custom_field=args.values_per_custom_field,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    fake = FakeTestOps(config, base_url=f"http://{args.host}:{args.port}")
+    try:
+        uvicorn.run(fake.app, host=args.host, port=args.port, log_level="warning", lifespan="off")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(fake.stats.snapshot(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
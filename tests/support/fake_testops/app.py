@@ -0,0 +1,373 @@
+"""Starlette application serving the fake Allure TestOps API."""
+
+import asyncio
+import json
+import random
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from .store import FakeTestOpsStore, RecordNotFoundError, paginate
+
+type Handler = Callable[[Request], Awaitable[Response]]
+
+TOKEN_PATH = "/api/uaa/oauth/token"  # noqa: S105
+UNMATCHED = "unmatched"
+
+
+@dataclass
+class RequestStats:
+    """Traffic seen by the fake server, counted per ``"<METHOD> <route template>"``."""
+
+    calls: Counter[str] = field(default_factory=Counter)
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    injected_errors: int = 0
+
+    @property
+    def total(self) -> int:
+        """All requests, including token exchanges."""
+        return sum(self.calls.values())
+
+    @property
+    def api_calls(self) -> int:
+        """Requests other than token exchanges."""
+        return self.total - self.calls[f"POST {TOKEN_PATH}"]
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.bytes_received = self.bytes_sent = self.injected_errors = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.total,
+            "api_requests": self.api_calls,
+            "bytes_received": self.bytes_received,
+            "bytes_sent": self.bytes_sent,
+            "injected_errors": self.injected_errors,
+            "calls": dict(sorted(self.calls.items())),
+        }
+
+
+def _json(payload: object, status_code: int = 200) -> JSONResponse:
+    return JSONResponse(payload, status_code=status_code)
+
+
+def _int_param(request: Request, name: str) -> int | None:
+    value = request.query_params.get(name)
+    return int(value) if value else None
+
+
+def _path_id(request: Request, name: str = "id") -> int:
+    return int(request.path_params[name])
+
+
+def _page(request: Request, items: Sequence[dict[str, Any]]) -> JSONResponse:
+    return _json(paginate(items, _int_param(request, "page") or 0, _int_param(request, "size") or 20))
+
+
+def _sorted(request: Request, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Apply ``sort=field,asc|desc`` parameters, the first one being the primary key."""
+    for criterion in reversed(request.query_params.getlist("sort")):
+        field, _, direction = criterion.partition(",")
+        items = sorted(items, key=lambda item: item.get(field) or 0, reverse=direction.lower() == "desc")
+    return items
+
+
+async def _body(request: Request) -> Any:
+    raw = await request.body()
+    return json.loads(raw) if raw else {}
+
+
+class _TestOpsApi:
+    """Request handlers translating TestOps endpoints into store calls."""
+
+    def __init__(self, store: FakeTestOpsStore) -> None:
+        self.store = store
+
+    async def token(self, request: Request) -> Response:
+        form = await request.form()
+        if form.get("grant_type") != "apitoken" or form.get("token") != self.store.config.api_token:
+            return _json({"error": "invalid_grant"}, 401)
+        return _json({"access_token": "fake-jwt", "token_type": "bearer", "expires_in": 3600})
+
+    # Test cases
+
+    async def list_test_cases(self, request: Request) -> Response:
+        return _page(request, self.store.test_case_rows(search=request.query_params.get("search")))
+
+    async def search_test_cases(self, request: Request) -> Response:
+        return _page(request, _sorted(request, self.store.search_test_cases(request.query_params.get("rql", ""))))
+
+    async def validate_query(self, request: Request) -> Response:
+        return _json({"valid": True, "count": len(self.store.search_test_cases(request.query_params.get("rql", "")))})
+
+    async def list_archived_test_cases(self, request: Request) -> Response:
+        return _page(request, self.store.archived_rows())
+
+    async def create_test_case(self, request: Request) -> Response:
+        return _json(self.store.create_test_case(await _body(request)))
+
+    async def get_test_case(self, request: Request) -> Response:
+        return _json(self.store.get_test_case(_path_id(request)))
+
+    async def patch_test_case(self, request: Request) -> Response:
+        return _json(self.store.patch_test_case(_path_id(request), await _body(request)))
+
+    async def delete_test_case(self, request: Request) -> Response:
+        self.store.delete_test_case(_path_id(request), force=request.query_params.get("force") == "true")
+        return Response(status_code=202)
+
+    async def get_overview(self, request: Request) -> Response:
+        test_case_id = _path_id(request, "testCaseId")
+        overview = dict(self.store.get_test_case(test_case_id))
+        overview["customFields"] = self.store.test_case_custom_fields(test_case_id)
+        overview["layer"] = overview.pop("testLayer", None)
+        return _json(overview)
+
+    # Scenarios and attachments
+
+    async def get_scenario(self, request: Request) -> Response:
+        return _json(self.store.scenario(_path_id(request)))
+
+    async def set_scenario(self, request: Request) -> Response:
+        body = await _body(request)
+        return _json(self.store.set_scenario(_path_id(request), body.get("steps") or []))
+
+    async def create_step(self, request: Request) -> Response:
+        return _json(
+            self.store.create_step(
+                await _body(request),
+                after_id=_int_param(request, "afterId"),
+                with_expected_result=request.query_params.get("withExpectedResult") == "true",
+            )
+        )
+
+    async def patch_step(self, request: Request) -> Response:
+        return _json(self.store.patch_step(_path_id(request), await _body(request)))
+
+    async def delete_step(self, request: Request) -> Response:
+        self.store.delete_step(_path_id(request))
+        return Response(status_code=202)
+
+    async def upload_attachments(self, request: Request) -> Response:
+        test_case_id = _int_param(request, "testCaseId")
+        if test_case_id is None:
+            return _json({"message": "testCaseId is required"}, 400)
+        form = await request.form()
+        files = []
+        for upload in form.getlist("file"):
+            if isinstance(upload, str):
+                continue
+            content = await upload.read()
+            files.append(
+                (upload.filename or "attachment", upload.content_type or "application/octet-stream", len(content))
+            )
+        return _json(self.store.add_attachments(test_case_id, files))
+
+    # Custom fields
+
+    async def list_custom_fields(self, request: Request) -> Response:
+        return _page(request, self.store.custom_fields())
+
+    async def list_custom_field_values(self, request: Request) -> Response:
+        return _page(request, self.store.custom_field_values(_int_param(request, "customFieldId")))
+
+    async def create_custom_field_value(self, request: Request) -> Response:
+        return _json(self.store.create_custom_field_value(await _body(request)))
+
+    async def patch_custom_field_value(self, request: Request) -> Response:
+        return _json(self.store.patch_custom_field_value(_path_id(request, "cfvId"), await _body(request)))
+
+    async def delete_custom_field_value(self, request: Request) -> Response:
+        self.store.delete_custom_field_value(_path_id(request))
+        return Response(status_code=202)
+
+    async def get_test_case_custom_fields(self, request: Request) -> Response:
+        values = self.store.test_case_custom_fields(_path_id(request, "testCaseId"))
+        by_field: dict[int, dict[str, Any]] = {}
+        for value in values:
+            field_id = value["customField"]["id"]
+            project_field = {**value["customField"], "customField": dict(value["customField"])}
+            entry = by_field.setdefault(field_id, {"customField": project_field, "values": []})
+            entry["values"].append({"id": value["id"], "name": value["name"]})
+        return _json(list(by_field.values()))
+
+    async def set_test_case_custom_fields(self, request: Request) -> Response:
+        self.store.set_test_case_custom_fields(_path_id(request, "testCaseId"), await _body(request))
+        return Response(status_code=200)
+
+    # Test layers and shared steps
+
+    async def list_test_layers(self, request: Request) -> Response:
+        return _page(request, self.store.test_layers())
+
+    async def create_test_layer(self, request: Request) -> Response:
+        return _json(self.store.create_test_layer(await _body(request)))
+
+    async def get_test_layer(self, request: Request) -> Response:
+        return _json(self.store.get_test_layer(_path_id(request)))
+
+    async def patch_test_layer(self, request: Request) -> Response:
+        return _json(self.store.patch_test_layer(_path_id(request), await _body(request)))
+
+    async def delete_test_layer(self, request: Request) -> Response:
+        self.store.delete_test_layer(_path_id(request))
+        return Response(status_code=202)
+
+    async def list_shared_steps(self, request: Request) -> Response:
+        return _page(request, self.store.shared_steps())
+
+    async def get_shared_step(self, request: Request) -> Response:
+        return _json(self.store.get_shared_step(_path_id(request)))
+
+    # Hierarchy trees
+
+    async def list_trees(self, request: Request) -> Response:
+        return _page(request, [self.store.tree()])
+
+    async def get_tree(self, request: Request) -> Response:
+        tree = self.store.tree()
+        if _path_id(request) != tree["id"]:
+            raise RecordNotFoundError(f"Tree {_path_id(request)} not found")
+        return _json(tree)
+
+    async def get_tree_node(self, request: Request) -> Response:
+        return _json(self.store.tree_node(_int_param(request, "parentNodeId")))
+
+    # Launches and test results
+
+    async def list_launches(self, request: Request) -> Response:
+        return _page(request, self.store.launches())
+
+    async def create_launch(self, request: Request) -> Response:
+        return _json(self.store.create_launch(await _body(request)))
+
+    async def get_launch(self, request: Request) -> Response:
+        return _json(self.store.get_launch(_path_id(request)))
+
+    async def list_launch_details(self, request: Request) -> Response:
+        self.store.get_launch(_path_id(request))
+        return _json([])
+
+    async def delete_launch(self, request: Request) -> Response:
+        self.store.delete_launch(_path_id(request))
+        return Response(status_code=202)
+
+    async def list_launch_results(self, request: Request) -> Response:
+        return _page(request, self.store.launch_results(_path_id(request, "launchId")))
+
+    async def create_result(self, request: Request) -> Response:
+        return _json(self.store.create_result(await _body(request)))
+
+    # Integrations
+
+    async def list_integrations(self, request: Request) -> Response:
+        return _page(request, [])
+
+    async def list_available_integrations(self, request: Request) -> Response:
+        return _json([])
+
+    async def unmatched(self, request: Request) -> Response:
+        return _json({"message": f"No fake TestOps endpoint for {request.method} {request.url.path}"}, 404)
+
+    def routes(self) -> list[tuple[str, str, Handler]]:
+        return [
+            ("POST", TOKEN_PATH, self.token),
+            ("GET", "/api/testcase", self.list_test_cases),
+            ("POST", "/api/testcase", self.create_test_case),
+            ("GET", "/api/testcase/__search", self.search_test_cases),
+            ("GET", "/api/testcase/query/validate", self.validate_query),
+            ("GET", "/api/testcase/deleted", self.list_archived_test_cases),
+            ("GET", "/api/testcase/{id:int}", self.get_test_case),
+            ("PATCH", "/api/testcase/{id:int}", self.patch_test_case),
+            ("DELETE", "/api/testcase/{id:int}", self.delete_test_case),
+            ("GET", "/api/testcase/{testCaseId:int}/overview", self.get_overview),
+            ("GET", "/api/testcase/{id:int}/step", self.get_scenario),
+            ("POST", "/api/testcase/{id:int}/scenario", self.set_scenario),
+            ("POST", "/api/testcase/step", self.create_step),
+            ("PATCH", "/api/testcase/step/{id:int}", self.patch_step),
+            ("DELETE", "/api/testcase/step/{id:int}", self.delete_step),
+            ("POST", "/api/testcase/attachment", self.upload_attachments),
+            ("GET", "/api/testcase/{testCaseId:int}/cfv", self.get_test_case_custom_fields),
+            ("POST", "/api/testcase/{testCaseId:int}/cfv", self.set_test_case_custom_fields),
+            ("GET", "/api/project/{projectId:int}/cf", self.list_custom_fields),
+            ("GET", "/api/project/{projectId:int}/cfv", self.list_custom_field_values),
+            ("POST", "/api/project/{projectId:int}/cfv", self.create_custom_field_value),
+            ("PATCH", "/api/project/{projectId:int}/cfv/{cfvId:int}", self.patch_custom_field_value),
+            ("DELETE", "/api/project/{projectId:int}/cfv/{id:int}", self.delete_custom_field_value),
+            ("GET", "/api/testlayer", self.list_test_layers),
+            ("POST", "/api/testlayer", self.create_test_layer),
+            ("GET", "/api/testlayer/{id:int}", self.get_test_layer),
+            ("PATCH", "/api/testlayer/{id:int}", self.patch_test_layer),
+            ("DELETE", "/api/testlayer/{id:int}", self.delete_test_layer),
+            ("GET", "/api/sharedstep", self.list_shared_steps),
+            ("GET", "/api/sharedstep/{id:int}", self.get_shared_step),
+            ("GET", "/api/v2/tree", self.list_trees),
+            ("GET", "/api/v2/tree/{id:int}", self.get_tree),
+            ("GET", "/api/v2/project/{projectId:int}/test-case/tree/tree-node", self.get_tree_node),
+            ("GET", "/api/launch", self.list_launches),
+            ("POST", "/api/launch", self.create_launch),
+            ("GET", "/api/launch/{id:int}", self.get_launch),
+            ("DELETE", "/api/launch/{id:int}", self.delete_launch),
+            ("GET", "/api/launch/{id:int}/statistic", self.list_launch_details),
+            ("GET", "/api/launch/{id:int}/env", self.list_launch_details),
+            ("GET", "/api/launch/{id:int}/job", self.list_launch_details),
+            ("GET", "/api/v2/launch/{launchId:int}/test-result/flat", self.list_launch_results),
+            ("POST", "/api/testresult", self.create_result),
+            ("GET", "/api/integration", self.list_integrations),
+            ("GET", "/api/integration/project/{projectId:int}/available", self.list_available_integrations),
+        ]
+
+
+def create_app(store: FakeTestOpsStore, stats: RequestStats | None = None) -> Starlette:
+    """Build the ASGI app serving ``store`` and counting its traffic into ``stats``.
+
+    Every API response is delayed by the configured latency, and a configured
+    share of API requests is answered with the configured error status before
+    it reaches the store. Requests for unknown paths get a 404 and are counted
+    under ``"<METHOD> unmatched"``.
+    """
+    config = store.config
+    stats = stats if stats is not None else RequestStats()
+    rng = random.Random(config.seed)  # noqa: S311 - reproducible fault injection, not security
+    api = _TestOpsApi(store)
+
+    def endpoint(key: str, handler: Handler, *, faults: bool) -> Handler:
+        async def serve(request: Request) -> Response:
+            stats.calls[key] += 1
+            stats.bytes_received += len(await request.body())
+            if faults and (config.latency or config.latency_jitter):
+                await asyncio.sleep(config.latency + rng.uniform(0, config.latency_jitter))
+            if faults and config.error_rate and rng.random() < config.error_rate:
+                stats.injected_errors += 1
+                response: Response = _json({"message": "Injected failure"}, config.error_status)
+            else:
+                try:
+                    response = await handler(request)
+                except RecordNotFoundError as exc:
+                    response = _json({"message": str(exc)}, 404)
+            stats.bytes_sent += len(response.body)
+            return response
+
+        return serve
+
+    routes = [
+        Route(path, endpoint(f"{method} {path}", handler, faults=path != TOKEN_PATH), methods=[method])
+        for method, path, handler in api.routes()
+    ]
+    for method in ("GET", "POST", "PUT", "PATCH", "DELETE"):
+        routes.append(
+            Route("/{path:path}", endpoint(f"{method} {UNMATCHED}", api.unmatched, faults=False), methods=[method])
+        )
+
+    app = Starlette(routes=routes)
+    app.state.store = store
+    app.state.stats = stats
+    return app
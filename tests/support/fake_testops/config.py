@@ -0,0 +1,35 @@
+"""Size, latency, and fault settings for the fake Allure TestOps server."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FakeTestOpsConfig:
+    """Shape of the synthetic project and behaviour of the fake server.
+
+    The defaults give a small project that is quick enough for unit tests;
+    benchmarks scale it up, e.g. ``FakeTestOpsConfig(test_cases=50_000, results_per_launch=10_000)``.
+    Synthetic records are derived from their IDs and ``seed`` on demand, so
+    large projects cost memory only for the records that tools change.
+    """
+
+    project_id: int = 1
+    api_token: str = "fake-api-token"  # noqa: S105
+    test_cases: int = 200
+    archived_test_cases: int = 20
+    steps_per_test_case: int = 3
+    launches: int = 3
+    results_per_launch: int = 500
+    failed_ratio: float = 0.1
+    suites_per_level: tuple[int, ...] = (5, 3)
+    custom_fields: int = 5
+    values_per_custom_field: int = 20
+    test_layers: int = 5
+    shared_steps: int = 10
+    # Seconds added to every API response, plus a uniformly random extra of up to ``latency_jitter``.
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Share of API requests answered with ``error_status`` instead of being served; the token exchange is exempt.
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int = 0
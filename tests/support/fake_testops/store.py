@@ -0,0 +1,686 @@
+"""Synthetic, mutable data behind the fake Allure TestOps server.
+
+Records of the generated project are computed from their IDs, so a project
+with tens of thousands of test cases or results starts instantly. A record is
+copied into the store's dictionaries the first time a tool changes it; from
+then on the stored copy wins. Payloads use the camelCase JSON of the TestOps
+API so the generated client deserializes them as it would real responses.
+"""
+
+import random
+import re
+import time
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, overload
+
+from .config import FakeTestOpsConfig
+
+type Json = dict[str, Any]
+
+STATUSES = ({"id": 1, "name": "Draft"}, {"id": 2, "name": "Active"}, {"id": 3, "name": "Outdated"})
+TAG_NAMES = ("smoke", "regression", "api", "ui", "flaky", "security")
+WORKFLOW = {"id": 1, "name": "Default"}
+CREATED_AT_MS = 1_700_000_000_000
+
+# IDs of records created through the API start here, above every synthetic ID.
+CREATED_ID_BASE = 10_000_000
+# Scenario step IDs of a synthetic test case are ``test_case_id * STEP_ID_STRIDE + position``.
+STEP_ID_STRIDE = 1_000
+ROOT_SUITE_ID = 1
+TREE_ID = 1
+
+
+class RecordNotFoundError(LookupError):
+    """Raised when a request names a record the fake project does not have."""
+
+
+class LazyRecords(Sequence[Json]):
+    """Records built from their keys only when a page of them is served."""
+
+    def __init__(self, keys: Sequence[int], build: Callable[[int], Json]) -> None:
+        self._keys = keys
+        self._build = build
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @overload
+    def __getitem__(self, index: int) -> Json: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Json]: ...
+
+    def __getitem__(self, index: int | slice) -> Json | list[Json]:
+        if isinstance(index, slice):
+            return [self._build(key) for key in self._keys[index]]
+        return self._build(self._keys[index])
+
+
+def paginate(items: Sequence[Json], page: int, size: int) -> Json:
+    """Wrap one slice of ``items`` in the Spring page envelope TestOps returns."""
+    size = max(size, 1)
+    total = len(items)
+    content = list(items[page * size : (page + 1) * size])
+    total_pages = (total + size - 1) // size
+    return {
+        "content": content,
+        "totalElements": total,
+        "totalPages": total_pages,
+        "size": size,
+        "number": page,
+        "numberOfElements": len(content),
+        "first": page == 0,
+        "last": page >= total_pages - 1,
+        "empty": not content,
+    }
+
+
+class FakeTestOpsStore:
+    """In-memory TestOps project generated from a :class:`FakeTestOpsConfig`."""
+
+    def __init__(self, config: FakeTestOpsConfig) -> None:
+        self.config = config
+        self._next_id = CREATED_ID_BASE
+        self._test_cases: dict[int, Json] = {}
+        self._removed_test_cases: set[int] = set()
+        self._scenarios: dict[int, Json] = {}
+        self._test_case_custom_fields: dict[int, list[Json]] = {}
+        self._test_case_attachments: dict[int, list[Json]] = {}
+        self._launches: dict[int, Json] = {}
+        self._removed_launches: set[int] = set()
+        self._created_results: dict[int, list[Json]] = {}
+        self._removed_archived: set[int] = set()
+        self._custom_field_values: dict[int, list[Json]] = {
+            field_id: [
+                self._synthetic_custom_field_value(field_id, index) for index in range(config.values_per_custom_field)
+            ]
+            for field_id in range(1, config.custom_fields + 1)
+        }
+        self._test_layers: dict[int, Json] = {
+            layer_id: self._stamp({"id": layer_id, "name": f"Layer {layer_id}"})
+            for layer_id in range(1, config.test_layers + 1)
+        }
+        self._shared_steps: dict[int, Json] = {
+            step_id: self._stamp(
+                {
+                    "id": step_id,
+                    "name": f"Shared step {step_id}",
+                    "projectId": config.project_id,
+                    "archived": False,
+                    "stepsCount": 1,
+                    "attachmentsCount": 0,
+                    "testCasesCount": 0,
+                }
+            )
+            for step_id in range(1, config.shared_steps + 1)
+        }
+
+    def next_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _stamp(self, record: Json) -> Json:
+        now = int(time.time() * 1000)
+        return {"createdDate": CREATED_AT_MS, "createdBy": "fake", "lastModifiedDate": now, **record}
+
+    def _rng(self, *key: int) -> random.Random:
+        return random.Random(hash((self.config.seed, *key)))  # noqa: S311 - reproducible synthetic data
+
+    # ==========================================
+    # Test cases
+    # ==========================================
+
+    def _synthetic_test_case(self, test_case_id: int) -> Json:
+        rng = self._rng(1, test_case_id)
+        layer_id = test_case_id % self.config.test_layers + 1 if self.config.test_layers else None
+        return {
+            "id": test_case_id,
+            "name": f"Test case {test_case_id}",
+            "fullName": f"tests.synthetic.test_case_{test_case_id}",
+            "projectId": self.config.project_id,
+            "description": f"Synthetic test case {test_case_id}",
+            "automated": rng.random() < 0.5,
+            "deleted": False,
+            "editable": True,
+            "external": False,
+            "status": dict(STATUSES[test_case_id % len(STATUSES)]),
+            "tags": [{"id": TAG_NAMES.index(name) + 1, "name": name} for name in sorted(rng.sample(TAG_NAMES, k=2))],
+            "testLayer": {"id": layer_id, "name": f"Layer {layer_id}"} if layer_id else None,
+            "workflow": dict(WORKFLOW),
+            "createdDate": CREATED_AT_MS,
+            "lastModifiedDate": CREATED_AT_MS + test_case_id * 1000,
+        }
+
+    def test_case_ids(self) -> Iterator[int]:
+        for test_case_id in range(1, self.config.test_cases + 1):
+            if test_case_id not in self._removed_test_cases:
+                yield test_case_id
+        for test_case_id, test_case in self._test_cases.items():
+            if test_case_id > self.config.test_cases and not test_case["deleted"]:
+                yield test_case_id
+
+    def get_test_case(self, test_case_id: int) -> Json:
+        if test_case_id in self._test_cases:
+            return self._test_cases[test_case_id]
+        if 1 <= test_case_id <= self.config.test_cases and test_case_id not in self._removed_test_cases:
+            return self._synthetic_test_case(test_case_id)
+        raise RecordNotFoundError(f"Test case {test_case_id} not found")
+
+    def _own_test_case(self, test_case_id: int) -> Json:
+        test_case = self.get_test_case(test_case_id)
+        self._test_cases[test_case_id] = test_case
+        return test_case
+
+    def create_test_case(self, body: Json) -> Json:
+        test_case_id = self.next_id()
+        test_case = self._synthetic_test_case(test_case_id) | {
+            "name": body.get("name") or f"Test case {test_case_id}",
+            "fullName": body.get("fullName"),
+            "description": body.get("description"),
+            "automated": bool(body.get("automated", False)),
+            "tags": [
+                {"id": tag.get("id") or self.next_id(), "name": tag.get("name")} for tag in body.get("tags") or []
+            ],
+            "testLayer": self._test_layers.get(body.get("testLayerId") or 0),
+            "lastModifiedDate": int(time.time() * 1000),
+        }
+        self._test_cases[test_case_id] = test_case
+        self._scenarios[test_case_id] = {"root": {"children": []}, "scenarioSteps": {}, "attachments": {}}
+        self._test_case_custom_fields[test_case_id] = [
+            self._custom_field_value(item["customField"]["id"], item.get("id"), item.get("name"))
+            for item in body.get("customFields") or []
+            if isinstance(item.get("customField"), dict)
+        ]
+        return test_case
+
+    def patch_test_case(self, test_case_id: int, body: Json) -> Json:
+        test_case = self._own_test_case(test_case_id)
+        for key in ("name", "fullName", "description", "precondition", "expectedResult", "automated", "deleted"):
+            if key in body and body[key] is not None:
+                test_case[key] = body[key]
+        if body.get("statusId") is not None:
+            test_case["status"] = next(
+                (dict(status) for status in STATUSES if status["id"] == body["statusId"]), test_case["status"]
+            )
+        if body.get("testLayerId") is not None:
+            test_case["testLayer"] = self._test_layers.get(body["testLayerId"])
+        if body.get("tags") is not None:
+            test_case["tags"] = [
+                {"id": tag.get("id") or self.next_id(), "name": tag.get("name")} for tag in body["tags"]
+            ]
+        if isinstance(body.get("scenario"), dict):
+            self._replace_scenario(test_case_id, body["scenario"].get("steps") or [])
+        test_case["lastModifiedDate"] = int(time.time() * 1000)
+        return test_case
+
+    def delete_test_case(self, test_case_id: int, *, force: bool) -> None:
+        if self._is_archived(test_case_id):
+            self._removed_archived.add(test_case_id)
+            return
+        test_case = self._own_test_case(test_case_id)
+        if force:
+            del self._test_cases[test_case_id]
+            self._removed_test_cases.add(test_case_id)
+        else:
+            test_case["deleted"] = True
+
+    def test_case_rows(self, *, search: str | None = None) -> Sequence[Json]:
+        if not search:
+            return LazyRecords(
+                list(self.test_case_ids()), lambda test_case_id: self._test_case_row(self.get_test_case(test_case_id))
+            )
+        rows = []
+        for test_case_id in self.test_case_ids():
+            test_case = self.get_test_case(test_case_id)
+            if search.lower() not in test_case["name"].lower():
+                continue
+            rows.append(self._test_case_row(test_case))
+        return rows
+
+    def _test_case_row(self, test_case: Json) -> Json:
+        return {key: test_case.get(key) for key in ("id", "name", "automated", "status", "testLayer")}
+
+    def search_test_cases(self, rql: str) -> list[Json]:
+        """Match test cases against the ``name ~=``, ``tag =``/``tag in`` and ``status =`` clauses of an AQL query.
+
+        Clauses are combined with AND; other clauses are ignored.
+        """
+        names = [value.lower() for value in re.findall(r'name\s*~=\s*"([^"]*)"', rql)]
+        tags = set(re.findall(r'tag\s*=\s*"([^"]*)"', rql))
+        for listed in re.findall(r"tag\s+in\s*\[([^\]]*)\]", rql):
+            tags.update(re.findall(r'"([^"]*)"', listed))
+        statuses = set(re.findall(r'status\s*=\s*"([^"]*)"', rql))
+
+        matches = []
+        for test_case_id in self.test_case_ids():
+            test_case = self.get_test_case(test_case_id)
+            tag_names = {tag["name"] for tag in test_case["tags"]}
+            if any(name not in test_case["name"].lower() for name in names):
+                continue
+            if tags and not tags <= tag_names:
+                continue
+            if statuses and test_case["status"]["name"] not in statuses:
+                continue
+            matches.append(test_case)
+        return matches
+
+    def _is_archived(self, test_case_id: int) -> bool:
+        first = self.config.test_cases + 1
+        return first <= test_case_id < first + self.config.archived_test_cases and (
+            test_case_id not in self._removed_archived
+        )
+
+    def archived_rows(self) -> list[Json]:
+        first = self.config.test_cases + 1
+        return [
+            self._test_case_row(self._synthetic_test_case(test_case_id) | {"deleted": True})
+            for test_case_id in range(first, first + self.config.archived_test_cases)
+            if self._is_archived(test_case_id)
+        ]
+
+    # ==========================================
+    # Scenarios and attachments
+    # ==========================================
+
+    def scenario(self, test_case_id: int) -> Json:
+        self.get_test_case(test_case_id)
+        if test_case_id not in self._scenarios:
+            step_ids = [test_case_id * STEP_ID_STRIDE + position for position in range(self.config.steps_per_test_case)]
+            self._scenarios[test_case_id] = {
+                "root": {"children": step_ids},
+                "scenarioSteps": {
+                    str(step_id): {"id": step_id, "body": f"Step {step_id}", "children": []} for step_id in step_ids
+                },
+                "attachments": {},
+            }
+        return self._scenarios[test_case_id]
+
+    def _replace_scenario(self, test_case_id: int, steps: list[Json]) -> None:
+        """Replace the scenario with top-level body steps, as a PATCH with ``scenario`` does."""
+        step_ids = [self.next_id() for _ in steps]
+        self._scenarios[test_case_id] = {
+            "root": {"children": step_ids},
+            "scenarioSteps": {
+                str(step_id): {"id": step_id, "body": step.get("body"), "children": []}
+                for step_id, step in zip(step_ids, steps, strict=True)
+            },
+            "attachments": {},
+        }
+
+    def set_scenario(self, test_case_id: int, steps: list[Json]) -> Json:
+        """Replace the scenario with a tree of v2 steps, as ``POST /api/testcase/{id}/scenario`` does.
+
+        Like the real write model, steps have no expected result field, so any sent is dropped.
+        """
+        attachments = self.scenario(test_case_id)["attachments"]
+        scenario: Json = {"root": {"children": []}, "scenarioSteps": {}, "attachments": attachments}
+
+        def add(step: Json, siblings: list[int]) -> None:
+            step_id = self.next_id()
+            record: Json = {"id": step_id, "children": []}
+            for key in ("body", "attachmentId", "sharedStepId"):
+                if step.get(key) is not None:
+                    record[key] = step[key]
+            scenario["scenarioSteps"][str(step_id)] = record
+            siblings.append(step_id)
+            for child in step.get("steps") or []:
+                add(child, record["children"])
+
+        for step in steps:
+            add(step, scenario["root"]["children"])
+        self._scenarios[test_case_id] = scenario
+        return scenario
+
+    def _scenario_of_step(self, step_id: int) -> tuple[int, Json]:
+        for test_case_id, scenario in self._scenarios.items():
+            if str(step_id) in scenario["scenarioSteps"]:
+                return test_case_id, scenario
+        test_case_id = step_id // STEP_ID_STRIDE
+        if 1 <= test_case_id <= self.config.test_cases:
+            scenario = self.scenario(test_case_id)
+            if str(step_id) in scenario["scenarioSteps"]:
+                return test_case_id, scenario
+        raise RecordNotFoundError(f"Scenario step {step_id} not found")
+
+    def create_step(self, body: Json, *, after_id: int | None, with_expected_result: bool = False) -> Json:
+        test_case_id = body.get("testCaseId")
+        if not isinstance(test_case_id, int):
+            raise RecordNotFoundError("testCaseId is required")
+        scenario = self.scenario(test_case_id)
+        step_id = self.next_id()
+        step: Json = {"id": step_id, "children": []}
+        for key in ("body", "attachmentId", "sharedStepId"):
+            if body.get(key) is not None:
+                step[key] = body[key]
+        scenario["scenarioSteps"][str(step_id)] = step
+        if with_expected_result:
+            # TestOps keeps expected results under a container step referenced by ``expectedResultId``.
+            container_id = self.next_id()
+            scenario["scenarioSteps"][str(container_id)] = {"id": container_id, "children": []}
+            step["expectedResultId"] = container_id
+
+        parent_id = body.get("parentId")
+        siblings = scenario["scenarioSteps"][str(parent_id)]["children"] if parent_id else scenario["root"]["children"]
+        # Like TestOps, a step created without ``after_id`` becomes the first of its siblings.
+        if after_id is None:
+            siblings.insert(0, step_id)
+        elif after_id in siblings:
+            siblings.insert(siblings.index(after_id) + 1, step_id)
+        else:
+            siblings.append(step_id)
+        return {"createdStepId": step_id, "scenario": scenario}
+
+    def patch_step(self, step_id: int, body: Json) -> Json:
+        _, scenario = self._scenario_of_step(step_id)
+        step = scenario["scenarioSteps"][str(step_id)]
+        for key in ("body", "attachmentId", "sharedStepId"):
+            if key in body and body[key] is not None:
+                step[key] = body[key]
+        return {"scenario": scenario}
+
+    def delete_step(self, step_id: int) -> None:
+        _, scenario = self._scenario_of_step(step_id)
+        steps = scenario["scenarioSteps"]
+        pending = [step_id]
+        while pending:
+            current = pending.pop()
+            pending.extend(steps.pop(str(current), {}).get("children", []))
+        for step in [scenario["root"], *steps.values()]:
+            if step_id in step["children"]:
+                step["children"].remove(step_id)
+
+    def add_attachments(self, test_case_id: int, files: list[tuple[str, str, int]]) -> list[Json]:
+        scenario = self.scenario(test_case_id)
+        created = []
+        for name, content_type, length in files:
+            attachment_id = self.next_id()
+            row = {
+                "id": attachment_id,
+                "name": name,
+                "contentType": content_type,
+                "contentLength": length,
+                "entity": "test_case",
+            }
+            scenario["attachments"][str(attachment_id)] = row
+            self._test_case_attachments.setdefault(test_case_id, []).append(row)
+            created.append(row)
+        return created
+
+    # ==========================================
+    # Custom fields
+    # ==========================================
+
+    def _synthetic_custom_field_value(self, field_id: int, index: int) -> Json:
+        value_id = field_id * STEP_ID_STRIDE + index + 1
+        return self._custom_field_value(field_id, value_id, f"Value {field_id}.{index + 1}")
+
+    def _custom_field_value(self, field_id: int, value_id: int | None, name: str | None) -> Json:
+        return {
+            "id": value_id,
+            "name": name,
+            "customField": {"id": field_id, "name": f"Field {field_id}"},
+            "global": False,
+            "testCasesCount": 0,
+        }
+
+    def custom_fields(self) -> list[Json]:
+        return [
+            self._stamp(
+                {
+                    "id": field_id,
+                    "name": f"Field {field_id}",
+                    "projectId": self.config.project_id,
+                    "customField": {"id": field_id, "name": f"Field {field_id}"},
+                    "required": False,
+                    "singleSelect": field_id % 2 == 1,
+                    "locked": False,
+                }
+            )
+            for field_id in self._custom_field_values
+        ]
+
+    def custom_field_values(self, field_id: int | None) -> list[Json]:
+        if field_id is None:
+            return [value for values in self._custom_field_values.values() for value in values]
+        if field_id not in self._custom_field_values:
+            raise RecordNotFoundError(f"Custom field {field_id} not found")
+        return self._custom_field_values[field_id]
+
+    def create_custom_field_value(self, body: Json) -> Json:
+        field_id = (body.get("customField") or {}).get("id")
+        if field_id not in self._custom_field_values:
+            raise RecordNotFoundError(f"Custom field {field_id} not found")
+        value = self._custom_field_value(field_id, self.next_id(), body.get("name"))
+        self._custom_field_values[field_id].append(value)
+        return value
+
+    def _find_custom_field_value(self, value_id: int) -> tuple[list[Json], Json]:
+        for values in self._custom_field_values.values():
+            for value in values:
+                if value["id"] == value_id:
+                    return values, value
+        raise RecordNotFoundError(f"Custom field value {value_id} not found")
+
+    def patch_custom_field_value(self, value_id: int, body: Json) -> Json:
+        _, value = self._find_custom_field_value(value_id)
+        if body.get("name") is not None:
+            value["name"] = body["name"]
+        return value
+
+    def delete_custom_field_value(self, value_id: int) -> None:
+        values, value = self._find_custom_field_value(value_id)
+        values.remove(value)
+
+    def test_case_custom_fields(self, test_case_id: int) -> list[Json]:
+        self.get_test_case(test_case_id)
+        if test_case_id not in self._test_case_custom_fields:
+            values = self.custom_field_values(None)
+            self._test_case_custom_fields[test_case_id] = [values[test_case_id % len(values)]] if values else []
+        return self._test_case_custom_fields[test_case_id]
+
+    def set_test_case_custom_fields(self, test_case_id: int, values: list[Json]) -> None:
+        self.get_test_case(test_case_id)
+        self._test_case_custom_fields[test_case_id] = [
+            self._custom_field_value(value["customField"]["id"], value.get("id"), value.get("name"))
+            for value in values
+            if isinstance(value.get("customField"), dict)
+        ]
+
+    # ==========================================
+    # Test layers and shared steps
+    # ==========================================
+
+    def test_layers(self) -> list[Json]:
+        return list(self._test_layers.values())
+
+    def get_test_layer(self, layer_id: int) -> Json:
+        if layer_id not in self._test_layers:
+            raise RecordNotFoundError(f"Test layer {layer_id} not found")
+        return self._test_layers[layer_id]
+
+    def create_test_layer(self, body: Json) -> Json:
+        layer_id = self.next_id()
+        self._test_layers[layer_id] = self._stamp({"id": layer_id, "name": body.get("name")})
+        return self._test_layers[layer_id]
+
+    def patch_test_layer(self, layer_id: int, body: Json) -> Json:
+        layer = self.get_test_layer(layer_id)
+        if body.get("name") is not None:
+            layer["name"] = body["name"]
+        return layer
+
+    def delete_test_layer(self, layer_id: int) -> None:
+        self.get_test_layer(layer_id)
+        del self._test_layers[layer_id]
+
+    def shared_steps(self) -> list[Json]:
+        return [step for step in self._shared_steps.values() if not step["archived"]]
+
+    def get_shared_step(self, shared_step_id: int) -> Json:
+        if shared_step_id not in self._shared_steps:
+            raise RecordNotFoundError(f"Shared step {shared_step_id} not found")
+        return self._shared_steps[shared_step_id]
+
+    # ==========================================
+    # Hierarchy tree
+    # ==========================================
+
+    def tree(self) -> Json:
+        return {"id": TREE_ID, "name": "Suites", "projectId": self.config.project_id, "customFieldsProject": []}
+
+    def tree_node(self, node_id: int | None) -> Json:
+        """Return a suite with its child suites; suite IDs number the levels breadth-first from the root."""
+        node_id = node_id or ROOT_SUITE_ID
+        path = self._suite_path(node_id)
+        depth = len(path)
+        children: list[Json] = []
+        if depth < len(self.config.suites_per_level):
+            first_child = self._suite_id((*path, 0))
+            children = [
+                {
+                    "id": first_child + index,
+                    "name": f"Suite {'.'.join(str(part + 1) for part in (*path, index))}",
+                    "type": "GROUP",
+                    "parentNodeId": node_id,
+                    "customFieldValueId": self._suite_id((*path, index)),
+                    "count": 0,
+                }
+                for index in range(self.config.suites_per_level[depth])
+            ]
+        return {
+            "id": node_id,
+            "name": "Root" if node_id == ROOT_SUITE_ID else f"Suite {'.'.join(str(part + 1) for part in path)}",
+            "type": "GROUP",
+            "children": paginate(children, 0, max(len(children), 1)),
+        }
+
+    def _suite_id(self, path: tuple[int, ...]) -> int:
+        level_offset = ROOT_SUITE_ID + 1
+        width = 1
+        for depth in range(len(path) - 1):
+            width *= self.config.suites_per_level[depth]
+            level_offset += width
+        index = 0
+        for depth, part in enumerate(path):
+            index = index * self.config.suites_per_level[depth] + part
+        return level_offset + index
+
+    def _suite_path(self, node_id: int) -> tuple[int, ...]:
+        if node_id == ROOT_SUITE_ID:
+            return ()
+        offset = node_id - ROOT_SUITE_ID - 1
+        width = 1
+        for depth, fanout in enumerate(self.config.suites_per_level):
+            width *= fanout
+            if offset < width:
+                path: list[int] = []
+                for level in reversed(range(depth + 1)):
+                    offset, part = divmod(offset, self.config.suites_per_level[level])
+                    path.insert(0, part)
+                return tuple(path)
+            offset -= width
+        raise RecordNotFoundError(f"Suite {node_id} not found")
+
+    # ==========================================
+    # Launches and test results
+    # ==========================================
+
+    def _synthetic_launch(self, launch_id: int) -> Json:
+        return {
+            "id": launch_id,
+            "name": f"Launch {launch_id}",
+            "projectId": self.config.project_id,
+            "closed": launch_id < self.config.launches,
+            "autoclose": False,
+            "external": False,
+            "tags": [],
+            "links": [],
+            "issues": [],
+            "createdDate": CREATED_AT_MS + launch_id * 60_000,
+            "lastModifiedDate": CREATED_AT_MS + launch_id * 60_000,
+        }
+
+    def launches(self) -> list[Json]:
+        synthetic = [
+            self._synthetic_launch(launch_id)
+            for launch_id in range(1, self.config.launches + 1)
+            if launch_id not in self._launches and launch_id not in self._removed_launches
+        ]
+        return synthetic + list(self._launches.values())
+
+    def get_launch(self, launch_id: int) -> Json:
+        if launch_id in self._launches:
+            return self._launches[launch_id]
+        if 1 <= launch_id <= self.config.launches and launch_id not in self._removed_launches:
+            return self._synthetic_launch(launch_id)
+        raise RecordNotFoundError(f"Launch {launch_id} not found")
+
+    def create_launch(self, body: Json) -> Json:
+        launch_id = self.next_id()
+        launch = self._synthetic_launch(launch_id) | {"name": body.get("name"), "closed": False}
+        self._launches[launch_id] = launch
+        return launch
+
+    def delete_launch(self, launch_id: int) -> None:
+        self.get_launch(launch_id)
+        self._launches.pop(launch_id, None)
+        self._removed_launches.add(launch_id)
+
+    def _synthetic_result(self, launch_id: int, index: int) -> Json:
+        result_id = (launch_id - 1) * self.config.results_per_launch + index + 1
+        rng = self._rng(2, result_id)
+        test_case_id = index % max(self.config.test_cases, 1) + 1
+        roll = rng.random()
+        if roll < self.config.failed_ratio * 0.8:
+            status = "failed"
+        elif roll < self.config.failed_ratio:
+            status = "broken"
+        else:
+            status = "passed"
+        start = CREATED_AT_MS + launch_id * 60_000 + index * 100
+        duration = rng.randint(10, 5_000)
+        return {
+            "id": result_id,
+            "name": f"Test case {test_case_id}",
+            "testCaseId": test_case_id,
+            "status": status,
+            "manual": index % 10 == 0,
+            "flaky": False,
+            "hidden": False,
+            "start": start,
+            "stop": start + duration,
+            "duration": duration,
+            "createdDate": start,
+            "lastModifiedDate": start + duration,
+        }
+
+    def launch_results(self, launch_id: int) -> Sequence[Json]:
+        self.get_launch(launch_id)
+        synthetic_count = self.config.results_per_launch if launch_id <= self.config.launches else 0
+        created = self._created_results.get(launch_id, [])
+
+        def build(index: int) -> Json:
+            return (
+                self._synthetic_result(launch_id, index)
+                if index < synthetic_count
+                else created[index - synthetic_count]
+            )
+
+        return LazyRecords(range(synthetic_count + len(created)), build)
+
+    def create_result(self, body: Json) -> Json:
+        launch_id = body.get("launchId")
+        if not isinstance(launch_id, int):
+            raise RecordNotFoundError("launchId is required")
+        self.get_launch(launch_id)
+        result = {
+            key: body.get(key)
+            for key in ("name", "fullName", "testCaseId", "manual", "start", "stop", "duration", "message", "launchId")
+        } | {
+            "id": self.next_id(),
+            "projectId": self.config.project_id,
+            "status": (body.get("status") or "unknown").lower(),
+            "createdDate": int(time.time() * 1000),
+        }
+        self._created_results.setdefault(launch_id, []).append(result)
+        return result
@@ -0,0 +1,20 @@
+"""Fixture serving the fake Allure TestOps API to tools in-process."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from tests.support.fake_testops import FakeTestOps
+
+
+@pytest.fixture
+def fake_testops(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeTestOps]:
+    """
+    Points ``AllureClient.from_env`` at a small fake TestOps project and routes its traffic in-process.
+    Inspect ``fake_testops.stats`` for the requests a tool made.
+    """
+    fake = FakeTestOps()
+    for name, value in fake.env().items():
+        monkeypatch.setenv(name, value)
+    with fake.mock():
+        yield fake
@@ -1,115 +1,174 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from src.client import AllureClient
-from src.client.client import StepWithExpected
+from src.client import AllureClient, AttachmentStepDtoWithName
+from src.client.client import SharedStepStepDtoWithId, StepWithExpected
+from src.client.exceptions import AllureValidationError
 from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto
 from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto
 from src.client.generated.models.scenario_step_created_response_dto import ScenarioStepCreatedResponseDto
 from src.client.generated.models.shared_step_scenario_dto_steps_inner import SharedStepScenarioDtoStepsInner
+from src.client.request_accounting import count_requests
 from src.services.test_case_service import TestCaseService
+from src.tools.create_test_case import create_test_case
+from tests.support.fake_testops import FakeTestOps
 
 
 @pytest.mark.asyncio
-async def test_add_steps_with_expected_result_logic():
-    # Setup
+async def test_write_scenario_sends_the_whole_tree_in_one_request():
     mock_client = AsyncMock(spec=AllureClient)
-    service = TestCaseService(mock_client)
-
-    # Mock create_scenario_step response for Action Step
-    # The first call (create Action) should return a response containing the scenario
-    # with the created step populated with expectedResultId
-    mock_response = ScenarioStepCreatedResponseDto(
-        createdStepId=100,
-        scenario=NormalizedScenarioDto(scenarioSteps={"100": NormalizedScenarioStepDto(id=100, expectedResultId=101)}),
+    mock_client.set_test_case_scenario.return_value = [10, 11, 12]
+    attachment_service = AsyncMock()
+    rows = [Mock(id=500), Mock(id=501)]
+    rows[0].name, rows[1].name = "step.png", "global.png"
+    attachment_service.upload_attachments.return_value = rows
+    service = TestCaseService(mock_client, attachment_service=attachment_service)
+
+    steps = [
+        {"action": "Action", "attachments": [{"name": "step.png", "content": "eA=="}]},
+        {"expected": "No action, skipped"},
+        {"action": "Just Action", "expected": None},
+    ]
+
+    step_ids = await service._write_scenario(1, steps, [{"name": "global.png", "content": "eA=="}])
+
+    assert step_ids == [10, 11, 12]
+    # All uploads go out in one batch, step attachments before test case level ones
+    attachment_service.upload_attachments.assert_called_once_with(
+        1, [{"name": "step.png", "content": "eA=="}, {"name": "global.png", "content": "eA=="}]
     )
-    mock_client.create_scenario_step.return_value = mock_response
+    mock_client.create_scenario_step.assert_not_called()
+    mock_client.set_test_case_scenario.assert_called_once()
+    test_case_id, written = mock_client.set_test_case_scenario.call_args.args
+    assert test_case_id == 1
 
-    # Define steps
-    steps = [{"action": "Action", "expected": "Result"}]
+    action, just_action, global_attachment = (step.actual_instance for step in written)
+    assert (action.body, action.expected_result) == ("Action", None)
+    assert [child.actual_instance.attachment_id for child in action.steps] == [500]
+    assert (just_action.body, just_action.expected_result, just_action.steps) == ("Just Action", None, [])
+    assert global_attachment.attachment_id == 501
 
-    # Execution
-    await service._add_steps(test_case_id=1, steps=steps, last_step_id=None)
 
-    # Verification
-    # 1. Verify Action step creation was called with with_expected_result=True
-    # Capture calls to verify arguments
-    calls = mock_client.create_scenario_step.call_args_list
-    assert len(calls) == 2, "Should have made 2 create_scenario_step calls"
+@pytest.mark.asyncio
+async def test_write_scenario_creates_steps_with_expected_results_one_by_one():
+    mock_client = AsyncMock(spec=AllureClient)
+    created = [
+        ScenarioStepCreatedResponseDto(
+            created_step_id=step_id,
+            scenario=NormalizedScenarioDto(
+                scenario_steps={str(step_id): NormalizedScenarioStepDto(id=step_id, expected_result_id=container)}
+            ),
+        )
+        for step_id, container in ((10, 11), (12, None))
+    ]
+    mock_client.create_scenario_step.side_effect = [created[0], Mock(), created[1]]
+    service = TestCaseService(mock_client)
 
-    # Check first call (Action Step)
-    _args1, kwargs1 = calls[0]
-    assert kwargs1.get("test_case_id") == 1
-    assert kwargs1.get("step").body == "Action"
-    assert kwargs1.get("with_expected_result") is True
+    step_ids = await service._write_scenario(1, [{"action": "Open", "expected": "Opened"}, {"action": "Close"}], None)
 
-    # Check second call (Expected Result Step)
-    _args2, kwargs2 = calls[1]
-    assert kwargs2.get("test_case_id") == 1
-    assert kwargs2.get("step").body == "Result"
-    assert kwargs2.get("step").parent_id == 101  # Should be linked to expectedResultId
-    assert (
-        kwargs2.get("after_id") is None
-    )  # Expected result text usually appended without specific ordering within the Expected Result container
+    assert step_ids == [10, 12]
+    mock_client.set_test_case_scenario.assert_not_called()
+    calls = mock_client.create_scenario_step.call_args_list
+    assert [(call.kwargs["step"].body, call.kwargs["step"].parent_id) for call in calls] == [
+        ("Open", None),
+        ("Opened", 11),
+        ("Close", None),
+    ]
+    assert [call.kwargs.get("with_expected_result") for call in calls] == [True, None, False]
+    assert calls[2].kwargs["after_id"] == 10
 
 
 @pytest.mark.asyncio
-async def test_add_steps_without_expected_result():
-    # Setup
+async def test_write_scenario_skips_the_request_without_steps():
     mock_client = AsyncMock(spec=AllureClient)
     service = TestCaseService(mock_client)
 
-    mock_response = ScenarioStepCreatedResponseDto(createdStepId=200)
-    mock_client.create_scenario_step.return_value = mock_response
+    assert await service._write_scenario(1, [{"action": ""}], None) == []
+    mock_client.set_test_case_scenario.assert_not_called()
+
+
+def test_scenario_step_payload_unwraps_nested_steps():
+    # Steps read back from TestOps are built with model_construct and carry read-only ids.
+    step = SharedStepScenarioDtoStepsInner(
+        actual_instance=StepWithExpected(
+            type="BodyStepDto",
+            body="Parent",
+            id=7,
+            steps=[
+                SharedStepScenarioDtoStepsInner(
+                    actual_instance=AttachmentStepDtoWithName.model_construct(
+                        type="AttachmentStepDto", attachment_id=5, name="a.png", id=8
+                    )
+                ),
+                SharedStepScenarioDtoStepsInner(
+                    actual_instance=SharedStepStepDtoWithId.model_construct(
+                        type="SharedStepStepDto", shared_step_id=3, id=9
+                    )
+                ),
+            ],
+        )
+    )
+
+    assert AllureClient._scenario_step_payload(step) == {
+        "type": "BodyStepDto",
+        "body": "Parent",
+        "steps": [
+            {"type": "AttachmentStepDto", "attachmentId": 5},
+            {"type": "SharedStepStepDto", "sharedStepId": 3},
+        ],
+    }
+
+
+def test_scenario_step_payload_rejects_expected_results():
+    step = SharedStepScenarioDtoStepsInner(
+        actual_instance=StepWithExpected(type="BodyStepDto", body="Parent", expected_result="Done")
+    )
 
-    steps = [{"action": "Just Action"}]
+    with pytest.raises(AllureValidationError, match="expected results"):
+        AllureClient._scenario_step_payload(step)
 
-    # Execution
-    await service._add_steps(test_case_id=1, steps=steps, last_step_id=None)
 
-    # Verification
-    mock_client.create_scenario_step.assert_called_once()
-    _args, kwargs = mock_client.create_scenario_step.call_args
-    assert kwargs.get("with_expected_result") is False
-    assert kwargs.get("step").body == "Just Action"
+def test_scenario_step_ids_are_depth_first_in_scenario_order():
+    raw = {
+        "root": {"children": [1, 4]},
+        "scenarioSteps": {
+            "1": {"id": 1, "children": [2, 3]},
+            "2": {"id": 2, "children": []},
+            "3": {"id": 3},
+            "4": {"id": 4, "children": [5], "expectedResultId": 6},
+            "5": {"id": 5, "children": []},
+            "6": {"id": 6, "children": []},
+        },
+    }
+
+    assert AllureClient._scenario_step_ids(raw) == [1, 2, 3, 4, 5]
 
 
 @pytest.mark.asyncio
-async def test_recursive_add_step_with_expected_result():
-    # Setup
-    mock_client = AsyncMock(spec=AllureClient)
-    service = TestCaseService(mock_client)
+async def test_create_test_case_writes_forty_steps_in_one_request(fake_testops: FakeTestOps):
+    steps = [{"action": f"Action {index}"} for index in range(40)]
 
-    mock_response = ScenarioStepCreatedResponseDto(
-        createdStepId=300,
-        scenario=NormalizedScenarioDto(scenarioSteps={"300": NormalizedScenarioStepDto(id=300, expectedResultId=301)}),
-    )
-    mock_client.create_scenario_step.return_value = mock_response
+    with count_requests() as ledger:
+        output = await create_test_case(name="Bulk", steps=steps, output_format="json")
 
-    # Construct the DTO that _recursive_add_step expects
-    # It uses SharedStepScenarioDtoStepsInner -> actual_instance (BodyStepDto/StepWithExpected)
-    # Note: We need to use StepWithExpected to pass expected_result attribute check
-    step_input = SharedStepScenarioDtoStepsInner(
-        actual_instance=StepWithExpected(
-            type="BodyStepDto", body="Recursive Action", expectedResult="Recursive Expected", steps=[]
-        )
-    )
+    assert ledger.calls == {"POST /api/testcase": 1, "POST /api/testcase/{id}/scenario": 1}
+    assert output.structured_content is not None
+    async with AllureClient.from_env() as client:
+        scenario = await client.get_test_case_scenario(output.structured_content["id"])
+    assert [step.actual_instance.body for step in scenario.steps or []] == [step["action"] for step in steps]
 
-    # Execution
-    await service._recursive_add_step(test_case_id=1, step=step_input)
 
-    # Verification
-    calls = mock_client.create_scenario_step.call_args_list
-    assert len(calls) == 2, "Should have made 2 create_scenario_step calls"
-
-    # Action Step
-    _args1, kwargs1 = calls[0]
-    # Check arguments
-    assert kwargs1.get("step").body == "Recursive Action"
-    assert kwargs1.get("with_expected_result") is True
-
-    # Expected Result Child Step
-    _args2, kwargs2 = calls[1]
-    assert kwargs2.get("step").body == "Recursive Expected"
-    assert kwargs2.get("step").parent_id == 301
+@pytest.mark.asyncio
+async def test_create_test_case_keeps_expected_results(fake_testops: FakeTestOps):
+    steps = [{"action": "Open", "expected": "Opened"}, {"action": "Close"}, {"action": "Check", "expected": "Clean"}]
+
+    with count_requests() as ledger:
+        output = await create_test_case(name="Expected", steps=steps, output_format="json")
+
+    assert "POST /api/testcase/{id}/scenario" not in ledger.calls
+    assert output.structured_content is not None
+    async with AllureClient.from_env() as client:
+        scenario = await client.get_test_case_scenario(output.structured_content["id"])
+    written = [(step.actual_instance.body, step.actual_instance.expected_result) for step in scenario.steps or []]
+    assert written == [("Open", "Opened"), ("Close", None), ("Check", "Clean")]
@@ -0,0 +1,76 @@
+"""Unit tests for concurrent attachment uploads."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.client import AllureClient
+from src.client.exceptions import AllureValidationError
+from src.client.request_accounting import count_requests
+from src.services.attachment_service import ATTACHMENT_UPLOAD_CONCURRENCY, AttachmentService
+from src.tools.create_test_case import create_test_case
+from tests.support.fake_testops import FakeTestOps
+
+
+def _attachment(index: int) -> dict[str, str]:
+    return {"name": f"shot-{index}.png", "content_type": "image/png", "content": "eA=="}
+
+
+@pytest.mark.asyncio
+async def test_upload_attachments_runs_bounded_and_keeps_order() -> None:
+    in_flight = peak = 0
+
+    async def upload_attachment(test_case_id: int, files: list[tuple[str, bytes]]) -> list[object]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        name = files[0][0]
+        # Later attachments finish first
+        await asyncio.sleep(0.01 / (int(name.split("-")[1].split(".")[0]) + 1))
+        in_flight -= 1
+        return [SimpleNamespace(id=test_case_id, name=name)]
+
+    service = AttachmentService(client=SimpleNamespace(upload_attachment=upload_attachment))  # type: ignore[arg-type]
+
+    rows = await service.upload_attachments(3, [_attachment(index) for index in range(20)])
+
+    assert [row.name for row in rows] == [f"shot-{index}.png" for index in range(20)]
+    assert peak == ATTACHMENT_UPLOAD_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_upload_attachments_raises_the_first_failure_in_order() -> None:
+    async def upload_attachment(_test_case_id: int, files: list[tuple[str, bytes]]) -> list[object]:
+        return [SimpleNamespace(id=1, name=files[0][0])]
+
+    service = AttachmentService(client=SimpleNamespace(upload_attachment=upload_attachment))  # type: ignore[arg-type]
+
+    with pytest.raises(AllureValidationError, match="missing required"):
+        await service.upload_attachments(3, [_attachment(0), {"name": "broken.png"}, {"content_type": "text/plain"}])
+    assert await service.upload_attachments(3, []) == []
+
+
+@pytest.mark.asyncio
+async def test_create_test_case_with_ten_screenshots_uploads_them_before_one_scenario_write(
+    fake_testops: FakeTestOps,
+) -> None:
+    steps = [{"action": f"Action {index}", "attachments": [_attachment(index)]} for index in range(5)]
+    attachments = [_attachment(index) for index in range(5, 10)]
+
+    with count_requests() as ledger:
+        output = await create_test_case(name="Screens", steps=steps, attachments=attachments, output_format="json")
+
+    assert ledger.calls == {
+        "POST /api/testcase": 1,
+        "POST /api/testcase/attachment": 10,
+        "POST /api/testcase/{id}/scenario": 1,
+    }
+    assert output.structured_content is not None
+    async with AllureClient.from_env() as client:
+        scenario = await client.get_test_case_scenario(output.structured_content["id"])
+    written = [step.actual_instance for step in scenario.steps or []]
+    assert [[child.actual_instance.name for child in step.steps] for step in written[:5]] == [
+        [f"shot-{index}.png"] for index in range(5)
+    ]
+    assert [step.name for step in written[5:]] == [f"shot-{index}.png" for index in range(5, 10)]
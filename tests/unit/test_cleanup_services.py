@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
-from src.client.exceptions import AllureAPIError, AllureNotFoundError
+from src.client.exceptions import AllureAPIError, AllureDeadlineExceededError, AllureNotFoundError
 from src.services.custom_field_service import CustomFieldService
 from src.services.shared_step_service import SharedStepService
 from src.services.test_case_service import TestCaseService
@@ -34,9 +34,10 @@ async def test_cleanup_archived_test_cases_force_deletes_archived_and_deleted(mo
     )
     mock_client.delete_test_case = AsyncMock()
 
-    deleted_count = await service.cleanup_archived(page_size=2)
+    result = await service.cleanup_archived(page_size=2)
 
-    assert deleted_count == 2
+    assert result.deleted_count == 2
+    assert result.partial is False
     assert mock_client.delete_test_case.await_args_list == [
         call(101, force=True),
         call(102, force=True),
@@ -54,12 +55,30 @@ async def test_cleanup_archived_test_cases_accepts_missing_status(mock_client: M
     )
     mock_client.delete_test_case = AsyncMock()
 
-    deleted_count = await service.cleanup_archived(page_size=100)
+    result = await service.cleanup_archived(page_size=100)
 
-    assert deleted_count == 1
+    assert result.deleted_count == 1
     mock_client.delete_test_case.assert_awaited_once_with(999, force=True)
 
 
+@pytest.mark.asyncio
+async def test_cleanup_archived_test_cases_stops_at_the_tool_deadline(mock_client: MagicMock) -> None:
+    service = TestCaseService(client=mock_client)
+    mock_client.list_deleted_test_cases = AsyncMock(
+        side_effect=[
+            SimpleNamespace(content=[SimpleNamespace(id=101), SimpleNamespace(id=102), SimpleNamespace(id=103)]),
+            SimpleNamespace(content=[]),
+        ]
+    )
+    mock_client.delete_test_case = AsyncMock(side_effect=[None, AllureDeadlineExceededError()])
+
+    result = await service.cleanup_archived(page_size=100)
+
+    assert result.deleted_count == 1
+    assert result.partial is True
+    assert mock_client.delete_test_case.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_cleanup_archived_shared_steps_hard_deletes_archived_only(mock_client: MagicMock) -> None:
     service = SharedStepService(client=mock_client)
@@ -145,3 +164,25 @@ async def test_cleanup_unused_custom_fields_continues_when_remove_fails(mock_cli
         call(custom_field_id=301, project_id=1),
         call(custom_field_id=302, project_id=1),
     ]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_unused_custom_fields_stops_at_the_tool_deadline(mock_client: MagicMock) -> None:
+    service = CustomFieldService(client=mock_client)
+    mock_client.list_project_custom_fields = AsyncMock(
+        side_effect=[
+            [
+                SimpleNamespace(custom_field=SimpleNamespace(id=301)),
+                SimpleNamespace(custom_field=SimpleNamespace(id=302)),
+            ],
+            [],
+        ]
+    )
+    mock_client.count_test_cases_in_projects = AsyncMock(side_effect=AllureDeadlineExceededError())
+    mock_client.remove_custom_field_from_project = AsyncMock()
+
+    with pytest.raises(AllureDeadlineExceededError):
+        await service.cleanup_unused(page_size=100)
+
+    mock_client.count_test_cases_in_projects.assert_awaited_once()
+    mock_client.remove_custom_field_from_project.assert_not_awaited()
@@ -0,0 +1,184 @@
+"""Unit tests for the process-wide resolved custom field cache."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.client import AllureClient
+from src.client.generated.models import (
+    CustomFieldDto,
+    CustomFieldProjectDto,
+    CustomFieldProjectWithValuesDto,
+    CustomFieldValueDto,
+)
+from src.client.request_accounting import count_requests
+from src.services.custom_field_cache import resolved_custom_field_cache, resolved_custom_fields_key
+from src.services.custom_field_service import CustomFieldService
+from src.services.metadata_cache import StaleWhileRevalidateCache
+from src.services.test_case_service import TestCaseService
+from src.tools.create_custom_field_value import create_custom_field_value
+from src.tools.get_custom_fields import get_custom_fields
+from tests.support.fake_testops import FakeTestOps
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def _loader[V](values: list[V]) -> Callable[[], Awaitable[V]]:
+    calls = iter(values)
+
+    async def load() -> V:
+        await asyncio.sleep(0)
+        return next(calls)
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_entries_are_fresh_then_stale_while_reloading_then_expired(clock: Clock) -> None:
+    cache: StaleWhileRevalidateCache[tuple[str, int], str] = StaleWhileRevalidateCache("values", ttl=10, stale_ttl=20)
+    load = _loader(["first", "second", "third"])
+
+    assert await cache.get(("https://x", 1), load) == "first"
+    clock.now += 9
+    assert await cache.get(("https://x", 1), load) == "first"
+
+    clock.now += 2
+    assert await cache.get(("https://x", 1), load) == "first"
+    assert await cache.get(("https://x", 1), load) == "first"  # one reload at a time
+    await cache.wait_for_reloads()
+    assert await cache.get(("https://x", 1), load) == "second"
+
+    clock.now += 31
+    assert await cache.get(("https://x", 1), load) == "third"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_a_reload_in_progress(clock: Clock) -> None:
+    cache: StaleWhileRevalidateCache[tuple[str, int], str] = StaleWhileRevalidateCache("values", ttl=10, stale_ttl=20)
+    released = asyncio.Event()
+
+    async def slow_reload() -> str:
+        await released.wait()
+        return "outdated"
+
+    await cache.get(("https://x", 1), _loader(["first"]))
+    clock.now += 11
+    assert await cache.get(("https://x", 1), _loader([]), slow_reload) == "first"
+
+    cache.invalidate(("https://x", 1))
+    released.set()
+    await cache.wait_for_reloads()
+
+    assert await cache.get(("https://x", 1), _loader(["current"])) == "current"
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_caching() -> None:
+    cache: StaleWhileRevalidateCache[tuple[str, int], str] = StaleWhileRevalidateCache("values", ttl=0, stale_ttl=20)
+    load = _loader(["first", "second"])
+
+    assert await cache.get(("https://x", 1), load) == "first"
+    assert await cache.get(("https://x", 1), load) == "second"
+
+
+@pytest.mark.asyncio
+async def test_values_rejected_by_cacheable_are_not_stored() -> None:
+    cache: StaleWhileRevalidateCache[tuple[str, int], str] = StaleWhileRevalidateCache("values", ttl=10)
+    load = _loader(["partial", "complete", "unused"])
+
+    def cacheable(value: str) -> bool:
+        return value != "partial"
+
+    assert await cache.get(("https://x", 1), load, cacheable=cacheable) == "partial"
+    assert await cache.get(("https://x", 1), load, cacheable=cacheable) == "complete"
+    assert await cache.get(("https://x", 1), load, cacheable=cacheable) == "complete"
+
+
+@pytest.mark.asyncio
+async def test_custom_fields_with_failed_values_are_fetched_again() -> None:
+    field = CustomFieldProjectDto(id=10, custom_field=CustomFieldDto(id=1, name="Priority"))
+    client = AsyncMock(spec=AllureClient)
+    client.get_base_url.return_value = "https://testops.example"
+    client.get_custom_fields_with_values.side_effect = [
+        [CustomFieldProjectWithValuesDto(custom_field=field, values=None)],
+        [CustomFieldProjectWithValuesDto(custom_field=field, values=[CustomFieldValueDto(id=3, name="High")])],
+    ]
+
+    failed = await TestCaseService(client)._get_resolved_custom_fields(1)
+    assert (failed["Priority"]["values"], failed["Priority"]["values_loaded"]) == ([], False)
+
+    loaded = await TestCaseService(client)._get_resolved_custom_fields(1)
+    assert loaded["Priority"]["values"] == ["High"]
+    assert await TestCaseService(client)._get_resolved_custom_fields(1) == loaded
+    assert client.get_custom_fields_with_values.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_share_custom_fields_until_a_value_is_created(fake_testops: FakeTestOps) -> None:
+    with count_requests() as ledger:
+        await get_custom_fields(output_format="json")
+    assert ledger.total > 0
+
+    with count_requests() as ledger:
+        await get_custom_fields(output_format="json")
+    assert ledger.total == 0
+
+    await create_custom_field_value(name="Created value", custom_field_id=1)
+    with count_requests() as ledger:
+        fields = await get_custom_fields(name="Field 1", output_format="json")
+    # Creating the value reloaded the project's fields once, so this call is still free
+    assert ledger.total == 0
+    assert fields.structured_content is not None
+    assert "Created value" in fields.structured_content["items"][0]["values"]
+
+
+@pytest.mark.asyncio
+async def test_stale_custom_fields_reload_in_the_background(fake_testops: FakeTestOps, clock: Clock) -> None:
+    await get_custom_fields(output_format="json")
+    fake_testops.store.create_custom_field_value({"customField": {"id": 1}, "name": "Added elsewhere"})
+
+    clock.now += 301
+    with count_requests() as ledger:
+        stale = await get_custom_fields(name="Field 1", output_format="json")
+    assert ledger.total == 0
+    assert stale.structured_content is not None
+    assert "Added elsewhere" not in stale.structured_content["items"][0]["values"]
+
+    await resolved_custom_field_cache().wait_for_reloads()
+    reloaded = await get_custom_fields(name="Field 1", output_format="json")
+    assert reloaded.structured_content is not None
+    assert "Added elsewhere" in reloaded.structured_content["items"][0]["values"]
+
+
+@pytest.mark.asyncio
+async def test_deleting_unused_custom_fields_invalidates_the_cache() -> None:
+    client = AsyncMock(spec=AllureClient)
+    client.get_project.return_value = 1
+    client.get_base_url.return_value = "https://testops.example"
+    client.list_project_custom_fields.return_value = [
+        CustomFieldProjectDto(custom_field=CustomFieldDto(id=5, name="Unused"))
+    ]
+    client.count_test_cases_in_projects.return_value = []
+    cache = resolved_custom_field_cache()
+    key = resolved_custom_fields_key("https://testops.example", 1)
+    await cache.get(key, _loader([{}]))
+
+    assert await CustomFieldService(client).cleanup_unused() == 1
+
+    assert await cache.get(key, _loader([{"Fresh": {}}])) == {"Fresh": {}}
@@ -0,0 +1,114 @@
+"""Unit tests for tool deadlines and their enforcement in the TestOps client."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import respx
+from httpx import Request, Response
+from pydantic import SecretStr
+
+from src.client import AllureClient
+from src.client.exceptions import AllureDeadlineExceededError
+from src.client.generated.configuration import Configuration
+from src.client.rate_limit import RetryPolicy
+from src.client.transport import AllureRESTClient, TransportConfig
+from src.tools.annotations import uses_default_deadline
+from src.utils.deadline import cap_timeout, deadline_expired, deadline_scope, remaining_time
+from src.utils.telemetry import wrap_tool_with_telemetry
+
+BASE_URL = "https://allure.example.com"
+
+
+def test_inner_scope_replaces_the_outer_deadline_until_it_exits() -> None:
+    assert remaining_time() is None
+
+    with deadline_scope(1.0):
+        with deadline_scope(None):
+            outer = remaining_time()
+            assert outer is not None and 0.9 < outer <= 1.0
+        with deadline_scope(30.0):
+            inner = remaining_time()
+            assert inner is not None and inner > 1.0
+        assert cap_timeout(30.0) == pytest.approx(1.0, abs=0.1)
+        assert cap_timeout(None) == pytest.approx(1.0, abs=0.1)
+
+    assert remaining_time() is None
+    assert cap_timeout(30.0) == 30.0
+    assert not deadline_expired()
+
+
+@pytest.mark.asyncio
+async def test_tool_wrapper_applies_the_default_deadline() -> None:
+    async def list_things() -> float | None:
+        return remaining_time()
+
+    with patch("src.utils.telemetry.settings.TOOL_DEADLINE_SECONDS", 5.0):
+        remaining = await wrap_tool_with_telemetry(list_things, default_deadline=True)()
+        exempt = await wrap_tool_with_telemetry(list_things)()
+    with patch("src.utils.telemetry.settings.TOOL_DEADLINE_SECONDS", 0.0):
+        unbounded = await wrap_tool_with_telemetry(list_things, default_deadline=True)()
+
+    assert isinstance(remaining, float) and 4.0 < remaining <= 5.0
+    assert exempt is None
+    assert unbounded is None
+
+
+def test_only_reads_and_partial_result_writes_use_the_default_deadline() -> None:
+    assert uses_default_deadline("list_launch_test_results")
+    assert uses_default_deadline("get_test_case_details")
+    assert uses_default_deadline("delete_archived_test_cases")
+    for write in ("create_test_case", "update_test_case", "upload_test_results", "delete_unused_custom_fields"):
+        assert not uses_default_deadline(write)
+
+
+@pytest.mark.asyncio
+async def test_api_calls_are_cancelled_when_the_deadline_passes() -> None:
+    client = AllureClient(BASE_URL, SecretStr("token"), 1)
+
+    async def _slow_call() -> None:
+        await asyncio.Event().wait()
+
+    started_at = time.monotonic()
+    with deadline_scope(0.05), pytest.raises(AllureDeadlineExceededError):
+        await client._call_api(_slow_call())
+
+    assert time.monotonic() - started_at < 1.0
+
+
+@pytest.mark.asyncio
+async def test_api_calls_are_not_started_after_the_deadline() -> None:
+    client = AllureClient(BASE_URL, SecretStr("token"), 1)
+    started = False
+
+    async def _call() -> None:
+        nonlocal started
+        started = True
+
+    with deadline_scope(0.0), pytest.raises(AllureDeadlineExceededError) as exc_info:
+        await client._call_api(_call())
+
+    assert started is False
+    assert exc_info.value.status_code == 504
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transport_caps_timeouts_and_skips_retries_past_the_deadline() -> None:
+    seen_timeouts: list[dict[str, float]] = []
+
+    def _unavailable(request: Request) -> Response:
+        seen_timeouts.append(request.extensions["timeout"])
+        return Response(503, headers={"Retry-After": "10"})
+
+    route = respx.get(f"{BASE_URL}/api/testcase/1").mock(side_effect=_unavailable)
+    rest_client = AllureRESTClient(Configuration(host=BASE_URL), transport=TransportConfig(retry=RetryPolicy()))
+
+    with deadline_scope(2.0):
+        response = await rest_client.request("GET", f"{BASE_URL}/api/testcase/1", headers={})
+    await rest_client.close()
+
+    assert response.status == 503
+    assert route.call_count == 1
+    assert all(0 < value <= 2.0 for value in seen_timeouts[0].values())
@@ -0,0 +1,68 @@
+"""Unit tests for the opt-in fast deserialization path."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.client.deserialization import FastApiClient, fast_json_loads, single_pass_model
+from src.client.generated.api_client import ApiClient
+from src.client.generated.models.page_launch_dto import PageLaunchDto
+from src.client.generated.models.test_case_dto import TestCaseDto
+from src.client.generated.models.test_status import TestStatus
+
+PAYLOADS = Path(__file__).parents[1] / "benchmarks" / "payloads"
+JSON = "application/json"
+
+
+@pytest.mark.parametrize(
+    ("payload", "response_type"),
+    [
+        ("test_result_flat_page.json", "PageTestResultFlatDto"),
+        ("test_case_page.json", "PageTestCaseDto"),
+        ("launch_page.json", "PageLaunchDto"),
+    ],
+)
+def test_fast_path_matches_generated_deserialization(payload: str, response_type: str) -> None:
+    text = (PAYLOADS / payload).read_text()
+
+    expected = ApiClient().deserialize(text, response_type, JSON)
+    actual = FastApiClient(fast_deserialization=True).deserialize(text, response_type, JSON)
+
+    assert actual == expected
+
+
+def test_fast_path_builds_nested_models_and_enums() -> None:
+    text = (PAYLOADS / "test_result_flat_page.json").read_text()
+
+    page = FastApiClient(fast_deserialization=True).deserialize(text, "PageTestResultFlatDto", JSON)
+
+    assert page.total_elements == 1350
+    assert page.content is not None
+    assert isinstance(page.content[0].status, TestStatus)
+
+
+def test_only_plain_list_pages_use_single_pass_validation() -> None:
+    assert single_pass_model("PageLaunchDto") is PageLaunchDto
+    assert single_pass_model("TestCaseDto") is None
+    # Tree pages hold oneOf wrappers that need their generated from_dict.
+    assert single_pass_model("PageTestCaseTreeNodeDto") is None
+
+
+def test_non_page_responses_keep_generated_path() -> None:
+    client = FastApiClient(fast_deserialization=True)
+
+    test_case = client.deserialize(json.dumps({"id": 5, "name": "Login"}), "TestCaseDto", JSON)
+    ids = client.deserialize("[1, 2]", "List[int]", JSON)
+
+    assert isinstance(test_case, TestCaseDto)
+    assert test_case.id == 5
+    assert ids == [1, 2]
+
+
+def test_fast_json_loads_decodes_json() -> None:
+    assert fast_json_loads('{"id": 1, "tags": ["smoke"]}') == {"id": 1, "tags": ["smoke"]}
+
+
+def test_fast_mode_is_opt_in() -> None:
+    assert FastApiClient().fast_deserialization is False
@@ -0,0 +1,91 @@
+"""Unit tests for the fake Allure TestOps server used by benchmarks and load tests."""
+
+import time
+
+import httpx
+import pytest
+
+from src.tools.create_test_case import create_test_case
+from src.tools.launches import list_launch_test_results
+from tests.support.fake_testops import FakeTestOps, FakeTestOpsConfig
+
+
+def _client(fake: FakeTestOps) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url=fake.base_url)
+
+
+@pytest.mark.asyncio
+async def test_tools_run_against_the_fake_and_their_requests_are_counted(fake_testops: FakeTestOps) -> None:
+    output = await create_test_case(
+        name="Checkout",
+        steps=[{"action": "Open cart", "expected": "Cart visible"}],
+        output_format="json",
+    )
+
+    assert output.structured_content is not None
+    test_case_id = output.structured_content["id"]
+    scenario = fake_testops.store.scenario(test_case_id)
+    first_step_id = scenario["root"]["children"][0]
+    assert scenario["scenarioSteps"][str(first_step_id)]["body"] == "Open cart"
+    assert fake_testops.stats.calls["POST /api/uaa/oauth/token"] == 1
+    assert fake_testops.stats.calls["POST /api/testcase"] == 1
+    assert fake_testops.stats.bytes_sent > 0
+
+
+@pytest.mark.asyncio
+async def test_large_projects_are_synthesized_page_by_page() -> None:
+    fake = FakeTestOps(FakeTestOpsConfig(test_cases=50_000, launches=1, results_per_launch=10_000))
+
+    started_at = time.monotonic()
+    async with _client(fake) as client:
+        test_cases = (await client.get("/api/testcase", params={"page": 499, "size": 100})).json()
+        results = (await client.get("/api/v2/launch/1/test-result/flat", params={"page": 0, "size": 100})).json()
+
+    assert time.monotonic() - started_at < 1.0
+    assert test_cases["totalElements"] == 50_000
+    assert test_cases["content"][-1]["id"] == 50_000
+    assert results["totalPages"] == 100
+    assert {result["status"] for result in results["content"]} <= {"passed", "failed", "broken"}
+
+
+@pytest.mark.asyncio
+async def test_failed_only_scan_reads_every_result_page(fake_testops: FakeTestOps) -> None:
+    output = await list_launch_test_results(launch_id=1, failed_only=True, output_format="json")
+
+    expected = [
+        result for result in fake_testops.store.launch_results(1)[:] if result["status"] in {"failed", "broken"}
+    ]
+    assert output.structured_content is not None
+    assert output.structured_content["total"] == len(expected)
+    assert fake_testops.stats.calls["GET /api/v2/launch/{launchId:int}/test-result/flat"] == 5
+
+
+@pytest.mark.asyncio
+async def test_configured_faults_and_latency_apply_to_api_requests_only() -> None:
+    fake = FakeTestOps(FakeTestOpsConfig(error_rate=1.0, error_status=503, latency=0.05))
+
+    async with _client(fake) as client:
+        token = await client.post(
+            "/api/uaa/oauth/token", data={"grant_type": "apitoken", "token": fake.config.api_token}
+        )
+        started_at = time.monotonic()
+        layers = await client.get("/api/testlayer")
+        elapsed = time.monotonic() - started_at
+
+    assert token.status_code == 200
+    assert layers.status_code == 503
+    assert elapsed >= 0.05
+    assert fake.stats.injected_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_paths_are_reported_as_unmatched() -> None:
+    fake = FakeTestOps()
+
+    async with _client(fake) as client:
+        response = await client.get("/api/testcase/1/history")
+        missing = await client.get("/api/testcase/999999")
+
+    assert response.status_code == 404
+    assert missing.status_code == 404
+    assert fake.stats.calls == {"GET unmatched": 1, "GET /api/testcase/{id:int}": 1}
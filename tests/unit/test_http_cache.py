@@ -0,0 +1,159 @@
+"""Unit tests for the conditional-GET response cache."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from src.client.generated.configuration import Configuration
+from src.client.http_cache import HttpCacheConfig, HttpResponseCache, get_response_cache, parse_cache_ttls
+from src.client.transport import AllureRESTClient, TransportConfig
+
+BASE_URL = "https://allure.example.com"
+TEST_CASE_URL = f"{BASE_URL}/api/testcase/1"
+
+
+def _response(status: int = 200, *, content: bytes = b"{}", headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, content=content, headers=headers, request=httpx.Request("GET", TEST_CASE_URL))
+
+
+def _rest_client(cache: HttpCacheConfig | None = None, *, scope: str | None = "scope-a") -> AllureRESTClient:
+    transport = TransportConfig(cache=cache or HttpCacheConfig())
+    return AllureRESTClient(Configuration(host=BASE_URL), transport=transport, cache_scope=scope)
+
+
+def test_parse_cache_ttls() -> None:
+    assert parse_cache_ttls("/api/integration=300, /api/testlayer=60,") == (
+        ("/api/integration", 300.0),
+        ("/api/testlayer", 60.0),
+    )
+    with pytest.raises(ValueError, match="expected"):
+        parse_cache_ttls("integration")
+
+
+def test_ttl_uses_longest_matching_prefix() -> None:
+    config = HttpCacheConfig(ttls=(("/api", 5.0), ("/api/integration", 300.0)))
+
+    assert config.ttl_for("/api/integration/1") == 300.0
+    assert config.ttl_for("/api/testcase/1") == 5.0
+    assert config.ttl_for("/other") == 0.0
+
+
+def test_only_responses_with_validators_or_ttl_are_stored() -> None:
+    cache = HttpResponseCache(HttpCacheConfig(ttls=(("/api/integration", 60.0),)))
+
+    cache.store("scope", TEST_CASE_URL, _response())
+    cache.store("scope", TEST_CASE_URL, _response(404, headers={"ETag": '"v1"'}))
+    cache.store("scope", f"{BASE_URL}/api/testcase/2", _response(headers={"ETag": '"v1"', "Cache-Control": "no-store"}))
+    assert len(cache) == 0
+
+    cache.store("scope", TEST_CASE_URL, _response(headers={"ETag": '"v1"'}))
+    cache.store("scope", f"{BASE_URL}/api/integration", _response())
+    assert len(cache) == 2
+
+
+def test_lru_is_bounded_by_bytes_and_entries() -> None:
+    cache = HttpResponseCache(HttpCacheConfig(max_entries=3, max_bytes=25, max_entry_bytes=20))
+
+    for index in range(3):
+        cache.store("scope", f"{BASE_URL}/api/testcase/{index}", _response(content=b"x" * 10, headers={"ETag": "e"}))
+    cache.store("scope", f"{BASE_URL}/api/testcase/big", _response(content=b"x" * 21, headers={"ETag": "e"}))
+
+    assert len(cache) == 2
+    assert cache.size_bytes == 20
+    assert cache.lookup("scope", f"{BASE_URL}/api/testcase/0") is None
+    assert cache.stats.evictions == 1
+
+
+def test_expire_scope_forces_revalidation_and_drops_ttl_only_entries() -> None:
+    cache = HttpResponseCache(HttpCacheConfig(ttls=(("/api", 60.0),)))
+    cache.store("scope", TEST_CASE_URL, _response(headers={"ETag": '"v1"'}))
+    cache.store("scope", f"{BASE_URL}/api/integration", _response())
+    cache.store("other", TEST_CASE_URL, _response(headers={"ETag": '"v1"'}))
+
+    cache.expire_scope("scope")
+
+    entry = cache.lookup("scope", TEST_CASE_URL)
+    assert entry is not None
+    assert not entry.is_fresh(0.5)
+    assert cache.lookup("scope", f"{BASE_URL}/api/integration") is None
+    other = cache.lookup("other", TEST_CASE_URL)
+    assert other is not None
+    assert other.fresh_until > 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_is_revalidated_with_validators() -> None:
+    route = respx.get(TEST_CASE_URL).mock(
+        side_effect=[
+            Response(200, json={"id": 1}, headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            Response(304, headers={"ETag": '"v1"'}),
+        ]
+    )
+    rest_client = _rest_client()
+
+    first = await rest_client.request("GET", TEST_CASE_URL, headers={})
+    second = await rest_client.request("GET", TEST_CASE_URL, headers={})
+
+    assert first.status == second.status == 200
+    assert json.loads(await second.read()) == {"id": 1}
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert route.calls[1].request.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    cache = get_response_cache()
+    assert cache is not None
+    assert (cache.stats.misses, cache.stats.revalidated, cache.stats.hits) == (1, 1, 0)
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fresh_entries_are_served_without_request_until_a_write() -> None:
+    get_route = respx.get(f"{BASE_URL}/api/integration").mock(return_value=Response(200, json=[{"id": 1}]))
+    respx.post(f"{BASE_URL}/api/integration").mock(return_value=Response(200, json={"id": 2}))
+    rest_client = _rest_client(HttpCacheConfig(ttls=(("/api/integration", 300.0),)))
+
+    await rest_client.request("GET", f"{BASE_URL}/api/integration", headers={})
+    await rest_client.request("GET", f"{BASE_URL}/api/integration", headers={})
+    assert get_route.call_count == 1
+
+    await rest_client.request("POST", f"{BASE_URL}/api/integration", headers={}, body={})
+    await rest_client.request("GET", f"{BASE_URL}/api/integration", headers={})
+    assert get_route.call_count == 2
+
+    cache = get_response_cache()
+    assert cache is not None
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == pytest.approx(1 / 3)
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cache_is_scoped_by_credentials() -> None:
+    route = respx.get(TEST_CASE_URL).mock(return_value=Response(200, json={"id": 1}, headers={"ETag": '"v1"'}))
+    first = _rest_client(scope="scope-a")
+    second = _rest_client(scope="scope-b")
+
+    await first.request("GET", TEST_CASE_URL, headers={})
+    await second.request("GET", TEST_CASE_URL, headers={})
+
+    assert "If-None-Match" not in route.calls[1].request.headers
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transport_without_scope_does_not_cache() -> None:
+    route = respx.get(TEST_CASE_URL).mock(return_value=Response(200, json={"id": 1}, headers={"ETag": '"v1"'}))
+    rest_client = _rest_client(scope=None)
+
+    await rest_client.request("GET", TEST_CASE_URL, headers={})
+    await rest_client.request("GET", TEST_CASE_URL, headers={})
+
+    assert "If-None-Match" not in route.calls[1].request.headers
+    assert get_response_cache() is None
+    await rest_client.close()
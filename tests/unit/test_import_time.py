@@ -0,0 +1,73 @@
+"""Import-time budgets for the lazily loaded generated client."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parents[2]
+SCRIPT_PATH = REPO_ROOT / "scripts" / "lazify_generated_client.py"
+MODELS_DIR = REPO_ROOT / "src" / "client" / "generated" / "models"
+
+# Without lazy loading, importing ``src.client`` pulled in every generated model and API controller.
+MAX_MODEL_SHARE = 0.4
+MAX_API_MODULES = 2
+MAX_IMPORT_SECONDS = 10.0
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import src.client
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "seconds": elapsed,
+    "models": sum(name.startswith("src.client.generated.models.") for name in sys.modules),
+    "apis": sum(name.startswith("src.client.generated.api.") for name in sys.modules),
+}))
+"""
+
+
+def _load_script_module():
+    spec = importlib.util.spec_from_file_location("lazify_generated_client", SCRIPT_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_importing_client_loads_only_the_models_it_uses() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=REPO_ROOT, capture_output=True, text=True, check=True, timeout=120
+    )
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    total_models = sum(1 for path in MODELS_DIR.glob("*.py") if path.name != "__init__.py")
+
+    assert profile["models"] < total_models * MAX_MODEL_SHARE
+    assert profile["apis"] <= MAX_API_MODULES
+    assert profile["seconds"] < MAX_IMPORT_SECONDS
+
+
+def test_generated_packages_resolve_names_lazily() -> None:
+    import src.client.generated.models as models
+
+    assert "TestCaseDto" in models.__all__
+    assert "TestCaseDto" in dir(models)
+    assert models.TestCaseDto.__name__ == "TestCaseDto"
+
+
+def test_lazify_is_idempotent() -> None:
+    module = _load_script_module()
+    source = (
+        '"""Doc."""\n\n# import models into model package\nfrom pkg.models.a import A\nfrom pkg.models.b import B\n'
+    )
+
+    once = module.lazify(source)
+
+    assert module.lazify(once) == once
+    assert "if TYPE_CHECKING:\n    from pkg.models.a import A" in once
+    assert '"B": "pkg.models.b"' in once
+    assert "__all__ = list(_LAZY_IMPORTS)" in once
+    assert "# import models" not in once
+    compile(once, "<lazified>", "exec")
@@ -1,12 +1,19 @@
 """Unit tests for LaunchService."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
 from src.client import AllureClient, LaunchDetailResponse, LaunchUploadResponseDto
-from src.client.exceptions import AllureAPIError, AllureNotFoundError, AllureValidationError, LaunchNotFoundError
+from src.client.exceptions import (
+    AllureAPIError,
+    AllureDeadlineExceededError,
+    AllureNotFoundError,
+    AllureValidationError,
+    LaunchNotFoundError,
+)
 from src.client.generated.models.aql_validate_response_dto import AqlValidateResponseDto
 from src.client.generated.models.body_step_dto import BodyStepDto
 from src.client.generated.models.find_all29200_response import FindAll29200Response
@@ -727,6 +734,87 @@ async def test_rerun_test_results_manually_identifies_missing_result_ids(
     mock_client.rerun_test_results_bulk.assert_not_awaited()
 
 
+def _launch_results_page(page: int, *, total_pages: int) -> PageTestResultFlatDto:
+    return PageTestResultFlatDto(
+        content=[
+            TestResultFlatDto(id=300 + page, test_case_id=11, name=f"Result {page}", manual=True, status="failed")
+        ],
+        total_elements=total_pages,
+        number=page,
+        size=100,
+        total_pages=total_pages,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_launch_test_results_filters_across_all_pages_in_order(
+    service: LaunchService, mock_client: MagicMock
+) -> None:
+    mock_client.list_launch_test_results.side_effect = lambda launch_id, *, page, **_: _launch_results_page(
+        page, total_pages=6
+    )
+
+    result = await service.list_launch_test_results(launch_id=9, failed_only=True, size=20)
+
+    assert [item.result_id for item in result.items] == [300, 301, 302, 303, 304, 305]
+    assert mock_client.list_launch_test_results.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_list_launch_test_results_returns_partial_results_at_the_deadline(
+    service: LaunchService, mock_client: MagicMock
+) -> None:
+    def _page(launch_id: int, *, page: int, **_: object) -> PageTestResultFlatDto:
+        if page >= 3:
+            raise AllureDeadlineExceededError()
+        return _launch_results_page(page, total_pages=40)
+
+    mock_client.list_launch_test_results.side_effect = _page
+
+    result = await service.list_launch_test_results(launch_id=9, failed_only=True, size=20)
+
+    assert result.partial is True
+    assert [item.result_id for item in result.items] == [300, 301, 302]
+    assert result.total == 3
+
+
+@pytest.mark.asyncio
+async def test_rerun_test_results_manually_stops_paging_once_all_ids_are_found(
+    service: LaunchService, mock_client: MagicMock
+) -> None:
+    mock_client.list_launch_test_results.side_effect = lambda launch_id, *, page, **_: _launch_results_page(
+        page, total_pages=50
+    )
+
+    result = await service.rerun_test_results_manually(launch_id=15, result_ids=[300, 301])
+
+    assert result.scheduled_count == 2
+    assert mock_client.list_launch_test_results.await_count < 10
+    mock_client.get_test_result.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rerun_test_results_manually_cancels_pages_in_flight_once_all_ids_are_found(
+    service: LaunchService, mock_client: MagicMock
+) -> None:
+    cancelled: list[int] = []
+
+    async def _page(launch_id: int, *, page: int, **_: object) -> PageTestResultFlatDto:
+        if page > 1:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        return _launch_results_page(page, total_pages=50)
+
+    mock_client.list_launch_test_results.side_effect = _page
+
+    await service.rerun_test_results_manually(launch_id=15, result_ids=[301])
+
+    assert sorted(cancelled) == [2, 3, 4]
+
+
 @pytest.mark.asyncio
 async def test_rerun_test_results_manually_falls_back_to_direct_lookup_for_new_results(
     service: LaunchService, mock_client: MagicMock
@@ -314,6 +314,7 @@ async def test_list_launch_test_results_output_format() -> None:
                             "page": 0,
                             "size": 20,
                             "total_pages": 1,
+                            "partial": False,
                         },
                     )
                 )
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -127,3 +128,40 @@ async def test_wrap_tool_with_telemetry_emits_error_and_reraises(mocker: MockerF
     assert emit_tool_usage_event.call_args.kwargs["tool_name"] == "failing_tool"
     assert emit_tool_usage_event.call_args.kwargs["outcome"] == "error"
     assert isinstance(emit_tool_usage_event.call_args.kwargs["error"], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_in_background_and_is_cancelled_on_shutdown(mocker: MockerFixture) -> None:
+    from src import main
+    from src.utils.config import settings
+
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow_warm_up() -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mocker.patch.object(settings, "STARTUP_WARMUP_ENABLED", True)
+    mocker.patch.object(main, "warm_up", slow_warm_up)
+
+    async with main.warmup_scope():
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_is_skipped_without_credentials(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    from src import main
+
+    mocker.patch.object(main.AllureClient, "from_env", side_effect=KeyError("ALLURE_API_TOKEN is not set"))
+
+    with caplog.at_level("INFO"):
+        await main.warm_up()
+
+    assert "Skipping startup warm-up" in caplog.text
@@ -0,0 +1,122 @@
+"""Unit tests for Prometheus metrics recording and exposition."""
+
+import pytest
+from pydantic import SecretStr
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from src.client import AllureClient
+from src.client.exceptions import AllureNotFoundError
+from src.client.generated.exceptions import ApiException
+from src.client.http_cache import HttpCacheConfig, shared_response_cache
+from src.client.request_accounting import record_request
+from src.utils.metrics import (
+    TOOL_CALL_DURATION,
+    TOOL_CALLS_IN_FLIGHT,
+    TOOL_UPSTREAM_REQUESTS,
+    UPSTREAM_REQUEST_DURATION,
+    UPSTREAM_REQUESTS_IN_FLIGHT,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from src.utils.telemetry import wrap_tool_with_telemetry
+
+
+class FakeControllerApi:
+    async def find_one11_without_preload_content(self, id: int) -> dict[str, int]:
+        return {"id": id}
+
+    async def delete13(self, id: int) -> None:
+        raise ApiException(status=404, reason="Not Found")
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("demo_seconds", "Demo latency", ("tool",), buckets=(0.1, 1.0)))
+
+    histogram.observe(0.05, "list")
+    histogram.observe(0.5, "list")
+    histogram.observe(5.0, "list")
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_seconds Demo latency",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{tool="list",le="0.1"} 1',
+        'demo_seconds_bucket{tool="list",le="1"} 2',
+        'demo_seconds_bucket{tool="list",le="+Inf"} 3',
+        'demo_seconds_sum{tool="list"} 5.55',
+        'demo_seconds_count{tool="list"} 3',
+    ]
+
+
+def test_label_values_are_escaped_and_duplicate_names_rejected() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("demo_total", "Demo", ("outcome",)))
+
+    counter.inc('bad "quote"\n')
+
+    assert 'demo_total{outcome="bad \\"quote\\"\\n"} 1' in registry.render()
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("demo_total", "Demo"))
+
+
+@pytest.mark.asyncio
+async def test_tool_wrapper_records_latency_by_tool_and_outcome() -> None:
+    async def list_things() -> str:
+        assert TOOL_CALLS_IN_FLIGHT.value() == 1
+        return "ok"
+
+    async def break_things() -> str:
+        raise RuntimeError("boom")
+
+    await wrap_tool_with_telemetry(list_things)()
+    with pytest.raises(RuntimeError):
+        await wrap_tool_with_telemetry(break_things)()
+
+    assert TOOL_CALL_DURATION.count("list_things", "success") == 1
+    assert TOOL_CALL_DURATION.count("break_things", "error") == 1
+    assert TOOL_CALLS_IN_FLIGHT.value() == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_wrapper_records_upstream_requests_per_call() -> None:
+    async def get_thing() -> str:
+        record_request("GET", "/api/testcase/1")
+        record_request("GET", "/api/testcase/1/overview")
+        return "ok"
+
+    await wrap_tool_with_telemetry(get_thing)()
+
+    assert TOOL_UPSTREAM_REQUESTS.count("get_thing") == 1
+    assert 'lucius_tool_upstream_requests_bucket{tool="get_thing",le="2"} 1' in TOOL_UPSTREAM_REQUESTS.render()
+    assert 'lucius_tool_upstream_requests_bucket{tool="get_thing",le="1"} 0' in TOOL_UPSTREAM_REQUESTS.render()
+
+
+@pytest.mark.asyncio
+async def test_api_calls_record_operation_and_status_class() -> None:
+    client = AllureClient("https://allure.example.com", SecretStr("token"), 1)
+    api = FakeControllerApi()
+
+    await client._call_api(api.find_one11_without_preload_content(id=1))
+    with pytest.raises(AllureNotFoundError):
+        await client._call_api(api.delete13(id=1))
+
+    assert UPSTREAM_REQUEST_DURATION.count("FakeControllerApi.find_one11", "2xx") == 1
+    assert UPSTREAM_REQUEST_DURATION.count("FakeControllerApi.delete13", "4xx") == 1
+    assert UPSTREAM_REQUESTS_IN_FLIGHT.value() == 0
+
+
+def test_metrics_route_serves_prometheus_text(app: Starlette) -> None:
+    cache = shared_response_cache(HttpCacheConfig())
+    cache.stats.hits = 3
+    cache.stats.misses = 1
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "lucius_tool_calls_in_flight 0" in response.text
+    assert 'lucius_http_cache_requests_total{result="hit"} 3' in response.text
+    assert "lucius_http_cache_hit_ratio 0.75" in response.text
@@ -85,6 +85,7 @@ def test_search_schema_validates_nested_serialized_payload() -> None:
                 "url": "https://example.com/project/1/test-cases/1",
             }
         ],
+        "truncated": None,
     }
 
 
@@ -0,0 +1,120 @@
+"""Unit tests for the async page iterator."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.client.pagination import iter_page_items, iter_pages
+
+
+def _page(number: int, total_pages: int | None, size: int = 2) -> SimpleNamespace:
+    return SimpleNamespace(content=[number * size + offset for offset in range(size)], total_pages=total_pages)
+
+
+@pytest.mark.asyncio
+async def test_pages_after_the_first_are_fetched_concurrently_and_yielded_in_order() -> None:
+    in_flight = 0
+    peak = 0
+    requested: list[int] = []
+
+    async def _fetch(number: int) -> SimpleNamespace:
+        nonlocal in_flight, peak
+        requested.append(number)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later pages finish first so ordering has to come from the pager.
+        await asyncio.sleep(0.001 * (10 - number))
+        in_flight -= 1
+        return _page(number, total_pages=8)
+
+    items = [item async for item in iter_page_items(_fetch, lambda page: page.content, concurrency=3)]
+
+    assert items == list(range(16))
+    assert requested[0] == 0
+    assert sorted(requested) == list(range(8))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_single_page_listing_fetches_only_page_zero() -> None:
+    requested: list[int] = []
+
+    async def _fetch(number: int) -> SimpleNamespace:
+        requested.append(number)
+        return _page(number, total_pages=0)
+
+    pages = [page async for page in iter_pages(_fetch)]
+
+    assert len(pages) == 1
+    assert requested == [0]
+
+
+@pytest.mark.asyncio
+async def test_closing_early_cancels_pages_in_flight() -> None:
+    cancelled: list[int] = []
+
+    async def _fetch(number: int) -> SimpleNamespace:
+        if number > 1:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(number)
+                raise
+        return _page(number, total_pages=10)
+
+    pages = iter_pages(_fetch, concurrency=4)
+    async for page in pages:
+        if page.content[0] == 2:
+            break
+    await pages.aclose()
+
+    assert sorted(cancelled) == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_page_errors_are_raised_in_order_and_cancel_the_rest() -> None:
+    cancelled: list[int] = []
+
+    async def _fetch(number: int) -> SimpleNamespace:
+        if number == 2:
+            raise RuntimeError("page 2 failed")
+        if number > 2:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(number)
+                raise
+        return _page(number, total_pages=5)
+
+    seen: list[int] = []
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        async for item in iter_page_items(_fetch, lambda page: page.content):
+            seen.append(item)
+
+    assert seen == [0, 1, 2, 3]
+    assert sorted(cancelled) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_listings_without_page_count_stop_at_the_first_short_page() -> None:
+    pages = {0: ["a", "b"], 1: ["c", "d"], 2: ["e"]}
+    requested: list[int] = []
+
+    async def _fetch(number: int) -> list[str]:
+        requested.append(number)
+        return pages.get(number, [])
+
+    items = [item async for item in iter_page_items(_fetch, lambda page: page, page_size=2)]
+
+    assert items == ["a", "b", "c", "d", "e"]
+    assert requested == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_must_be_positive() -> None:
+    async def _fetch(number: int) -> SimpleNamespace:
+        return _page(number, total_pages=1)
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await anext(iter_pages(_fetch, concurrency=0))
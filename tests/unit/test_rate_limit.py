@@ -0,0 +1,172 @@
+"""Unit tests for client-side rate limiting and retry backoff."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import respx
+from httpx import Response
+
+from src.client.generated.configuration import Configuration
+from src.client.rate_limit import (
+    AdaptiveTokenBucket,
+    RateLimitConfig,
+    RetryPolicy,
+    get_endpoint_limiter,
+    parse_retry_after,
+)
+from src.client.transport import AllureRESTClient, TransportConfig
+
+BASE_URL = "https://allure.example.com"
+
+
+def _rest_client(retry: RetryPolicy | None = None) -> tuple[AllureRESTClient, list[float]]:
+    transport = TransportConfig(retry=retry or RetryPolicy())
+    rest_client = AllureRESTClient(Configuration(host=BASE_URL), transport=transport)
+    delays: list[float] = []
+
+    async def _record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    rest_client._sleep = _record_sleep
+    return rest_client, delays
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    http_date = parse_retry_after(formatdate(time.time() + 20, usegmt=True))
+    assert http_date is not None
+    assert 15 < http_date <= 20
+
+
+def test_retry_policy_only_retries_idempotent_methods_except_for_429() -> None:
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry("GET", 503, attempt=1)
+    assert policy.should_retry("POST", 429, attempt=1)
+    assert not policy.should_retry("POST", 503, attempt=1)
+    assert not policy.should_retry("GET", 500, attempt=1)
+    assert not policy.should_retry("GET", 503, attempt=3)
+
+
+def test_retry_delay_honours_retry_after_with_jitter() -> None:
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=10.0)
+
+    assert 4.0 <= policy.delay(1, "4") <= 4.5
+    assert 10.0 <= policy.delay(1, "120") <= 10.5
+    assert all(0 <= policy.delay(attempt) <= min(10.0, 0.5 * 2 ** (attempt - 1)) for attempt in range(1, 8))
+
+
+def test_bucket_halves_rate_on_throttle_and_recovers_on_success() -> None:
+    bucket = AdaptiveTokenBucket(RateLimitConfig(rate=8.0, burst=8, min_rate=1.0, recovery_per_success=1.0))
+
+    bucket.on_throttle()
+    assert bucket.rate == 4.0
+    for _ in range(4):
+        bucket.on_throttle()
+    assert bucket.rate == 1.0
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 8.0
+
+
+def test_bucket_without_ceiling_starts_limiting_at_half_the_observed_rate_on_throttle() -> None:
+    bucket = AdaptiveTokenBucket(RateLimitConfig(burst=2, min_rate=1.0, recovery_per_success=1.0))
+
+    bucket.on_success()
+    assert bucket.rate == 0.0
+    for _ in range(10):
+        bucket._record_send()
+    bucket.on_throttle()
+    assert bucket.rate == 5.0
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 25.0
+
+
+@pytest.mark.asyncio
+async def test_bucket_without_ceiling_does_not_wait_until_throttled() -> None:
+    bucket = AdaptiveTokenBucket(RateLimitConfig(burst=1))
+
+    started = time.monotonic()
+    for _ in range(200):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.5
+
+    bucket.on_throttle()
+    assert bucket.rate >= 100.0
+    waited = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - waited >= 0.005
+
+
+@pytest.mark.asyncio
+async def test_bucket_spaces_requests_beyond_burst() -> None:
+    bucket = AdaptiveTokenBucket(RateLimitConfig(rate=100.0, burst=2))
+
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.025
+
+
+def test_limiter_is_shared_per_endpoint() -> None:
+    config = RateLimitConfig()
+
+    assert get_endpoint_limiter(f"{BASE_URL}/api", config) is get_endpoint_limiter(BASE_URL, config)
+    assert get_endpoint_limiter("https://other.example.com", config) is not get_endpoint_limiter(BASE_URL, config)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_is_retried_after_unavailable_response() -> None:
+    route = respx.get(f"{BASE_URL}/api/testcase/1").mock(
+        side_effect=[Response(503, headers={"Retry-After": "2"}), Response(200, json={"id": 1})]
+    )
+    rest_client, delays = _rest_client(RetryPolicy(backoff_base=0.1))
+
+    response = await rest_client.request("GET", f"{BASE_URL}/api/testcase/1", headers={})
+
+    assert response.status == 200
+    assert route.call_count == 2
+    assert len(delays) == 1
+    assert 2.0 <= delays[0] <= 2.1
+    assert get_endpoint_limiter(BASE_URL, RateLimitConfig()).rate > 0
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_is_retried_on_429_but_not_on_503() -> None:
+    throttled = respx.post(f"{BASE_URL}/api/testresult").mock(
+        side_effect=[Response(429), Response(429), Response(200, json={"id": 5})]
+    )
+    unavailable = respx.post(f"{BASE_URL}/api/launch").mock(return_value=Response(503))
+    rest_client, delays = _rest_client()
+
+    throttled_response = await rest_client.request("POST", f"{BASE_URL}/api/testresult", headers={}, body={})
+    unavailable_response = await rest_client.request("POST", f"{BASE_URL}/api/launch", headers={}, body={})
+
+    assert throttled_response.status == 200
+    assert throttled.call_count == 3
+    assert unavailable_response.status == 503
+    assert unavailable.call_count == 1
+    assert len(delays) == 2
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retries_stop_after_max_attempts() -> None:
+    route = respx.get(f"{BASE_URL}/api/testcase/1").mock(return_value=Response(504))
+    rest_client, delays = _rest_client(RetryPolicy(max_attempts=3))
+
+    response = await rest_client.request("GET", f"{BASE_URL}/api/testcase/1", headers={})
+
+    assert response.status == 504
+    assert route.call_count == 3
+    assert len(delays) == 2
+    await rest_client.close()
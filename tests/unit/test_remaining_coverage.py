@@ -16,7 +16,7 @@ from pydantic import BaseModel, Field, SecretStr
 from src.cli import cli_entry, command_runner
 from src.cli.models import ActionOptions, ActionSpec, CLIContext, CLIError, PreparedCommand
 from src.client import AllureClient, AllureValidationError, FindAll29200Response
-from src.client.exceptions import AllureAPIError
+from src.client.exceptions import AllureAPIError, AllureDeadlineExceededError
 from src.client.generated.models.custom_field_dto import CustomFieldDto
 from src.client.generated.models.custom_field_project_dto import CustomFieldProjectDto
 from src.client.models.plans import TestPlanCaseSelection, TestPlanValues
@@ -244,7 +244,11 @@ async def test_client_custom_field_value_conflict_and_fetch_fallback(entered_cli
 
     fields = await entered_client.get_custom_fields_with_values(7)
     assert len(fields) == 1
-    assert fields[0].values == []
+    assert fields[0].values is None
+
+    entered_client._custom_field_value_project_api = RecordingApi(AllureDeadlineExceededError())  # type: ignore[assignment]
+    with pytest.raises(AllureDeadlineExceededError):
+        await entered_client.get_custom_fields_with_values(7)
 
 
 @pytest.mark.asyncio
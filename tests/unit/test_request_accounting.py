@@ -0,0 +1,55 @@
+"""Unit tests for per-operation accounting of Allure TestOps requests."""
+
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from src.client.generated.configuration import Configuration
+from src.client.request_accounting import count_requests, record_request, route_template
+from src.client.transport import AllureRESTClient
+
+BASE_URL = "https://allure.example.com"
+
+
+def test_route_template_folds_numeric_segments() -> None:
+    assert route_template("get", "/api/testcase/42/scenario") == "GET /api/testcase/{id}/scenario"
+    assert route_template("DELETE", "/api/project/1/cfv/1001") == "DELETE /api/project/{id}/cfv/{id}"
+    assert route_template("GET", "/api/v2/launch/7") == "GET /api/v2/launch/{id}"
+
+
+@pytest.mark.asyncio
+async def test_ledgers_nest_and_follow_tasks() -> None:
+    async def fetch(path: str) -> None:
+        record_request("GET", path)
+
+    record_request("GET", "/api/testcase/1")
+    with count_requests() as outer:
+        await fetch("/api/testcase/1")
+        with count_requests() as inner:
+            await asyncio.gather(fetch("/api/testcase/2"), fetch("/api/testcase/3"))
+
+    assert outer.total == 3
+    assert inner.calls == {"GET /api/testcase/{id}": 2}
+    assert outer.summary() == "GET /api/testcase/{id} x3"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transport_counts_one_request_per_call_despite_retries() -> None:
+    respx.get(f"{BASE_URL}/api/testcase/1").mock(side_effect=[Response(503), Response(200, json={})])
+    rest_client = AllureRESTClient(Configuration(host=BASE_URL))
+
+    async def no_sleep(_delay: float) -> None:
+        return None
+
+    rest_client._sleep = no_sleep
+
+    with count_requests() as ledger:
+        response = await rest_client.request("GET", f"{BASE_URL}/api/testcase/1", headers={})
+    await rest_client.close()
+
+    assert response.status == 200
+    assert respx.calls.call_count == 2
+    assert ledger.calls == {"GET /api/testcase/{id}": 1}
@@ -0,0 +1,137 @@
+"""Unit tests for single-flight coalescing of identical GET requests."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from src.client.coalesce import RequestCoalescer
+from src.client.generated.configuration import Configuration
+from src.client.transport import AllureRESTClient, TransportConfig
+
+BASE_URL = "https://allure.example.com"
+SCENARIO_URL = f"{BASE_URL}/api/testcase/1/step"
+
+
+def _rest_client(*, scope: str = "scope-a", coalesce_gets: bool = True) -> AllureRESTClient:
+    transport = TransportConfig(coalesce_gets=coalesce_gets)
+    return AllureRESTClient(Configuration(host=BASE_URL), transport=transport, cache_scope=scope)
+
+
+def _response(payload: object) -> httpx.Response:
+    return httpx.Response(200, json=payload, request=httpx.Request("GET", SCENARIO_URL))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_identical_gets_share_one_request() -> None:
+    route = respx.get(SCENARIO_URL).mock(return_value=Response(200, json={"root": {"children": [1]}}))
+    rest_client = _rest_client()
+
+    responses = await asyncio.gather(*(rest_client.request("GET", SCENARIO_URL, headers={}) for _ in range(5)))
+
+    assert route.call_count == 1
+    assert len({id(response.response) for response in responses}) == 5
+    for response in responses:
+        assert json.loads(await response.read()) == {"root": {"children": [1]}}
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_differing_in_query_or_scope_are_not_coalesced() -> None:
+    route = respx.get(url__startswith=SCENARIO_URL).mock(return_value=Response(200, json={}))
+    first = _rest_client(scope="scope-a")
+    second = _rest_client(scope="scope-b")
+
+    await asyncio.gather(
+        first.request("GET", SCENARIO_URL, headers={}),
+        first.request("GET", f"{SCENARIO_URL}?page=1", headers={}),
+        second.request("GET", SCENARIO_URL, headers={}),
+    )
+
+    assert route.call_count == 3
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalescing_can_be_disabled() -> None:
+    route = respx.get(SCENARIO_URL).mock(return_value=Response(200, json={}))
+    rest_client = _rest_client(coalesce_gets=False)
+
+    await asyncio.gather(*(rest_client.request("GET", SCENARIO_URL, headers={}) for _ in range(3)))
+
+    assert route.call_count == 3
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_reach_every_waiter() -> None:
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def _fail() -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise httpx.ConnectError("connection refused")
+
+    results = await asyncio.gather(
+        *(coalescer.run("scope", "GET", SCENARIO_URL, _fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert len(coalescer) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_request() -> None:
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def _fetch() -> httpx.Response:
+        await release.wait()
+        return _response({"id": 1})
+
+    cancelled = asyncio.create_task(coalescer.run("scope", "GET", SCENARIO_URL, _fetch))
+    surviving = asyncio.create_task(coalescer.run("scope", "GET", SCENARIO_URL, _fetch))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await surviving).json() == {"id": 1}
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_upstream_request_is_cancelled_when_every_waiter_leaves() -> None:
+    coalescer = RequestCoalescer()
+    upstream_cancelled = asyncio.Event()
+
+    async def _fetch() -> httpx.Response:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            upstream_cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+    waiter = asyncio.create_task(coalescer.run("scope", "GET", SCENARIO_URL, _fetch))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    await asyncio.wait_for(upstream_cancelled.wait(), timeout=1)
+    assert len(coalescer) == 0
+
+    async def _fetch_again() -> httpx.Response:
+        return _response({"id": 2})
+
+    assert (await coalescer.run("scope", "GET", SCENARIO_URL, _fetch_again)).json() == {"id": 2}
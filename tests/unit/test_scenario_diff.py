@@ -0,0 +1,194 @@
+"""Unit tests for minimal scenario edits on test case update."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.client import AllureClient, AttachmentStepDtoWithName, StepWithExpected
+from src.client.generated.models import (
+    ScenarioStepCreatedResponseDto,
+    SharedStepScenarioDtoStepsInner,
+    TestCaseDto,
+    TestCaseScenarioV2Dto,
+)
+from src.client.request_accounting import count_requests
+from src.services.scenario_diff import DeleteStep, InsertSteps, PatchStep, diff_scenario, scenario_requests
+from src.services.test_case_service import TestCaseService, TestCaseUpdate
+from src.tools.create_test_case import create_test_case
+from src.tools.update_test_case import update_test_case
+from tests.support.fake_testops import FakeTestOps
+
+
+def _body(
+    body: str,
+    expected: str | None = None,
+    *children: SharedStepScenarioDtoStepsInner,
+    id: int | None = None,
+) -> SharedStepScenarioDtoStepsInner:
+    return SharedStepScenarioDtoStepsInner(
+        actual_instance=StepWithExpected(
+            type="BodyStepDto", body=body, expected_result=expected, steps=list(children), id=id
+        )
+    )
+
+
+def _attachment(attachment_id: int, id: int | None = None) -> SharedStepScenarioDtoStepsInner:
+    return SharedStepScenarioDtoStepsInner(
+        actual_instance=AttachmentStepDtoWithName(
+            type="AttachmentStepDto", attachment_id=attachment_id, name=f"{attachment_id}.png", id=id
+        )
+    )
+
+
+def test_identical_scenarios_need_no_edits() -> None:
+    current = [_body("Open", "Shown", _body("Child", id=2), id=1), _attachment(5, id=3)]
+    desired = [_body("Open", "Shown", _body("Child")), _attachment(5)]
+
+    assert diff_scenario(current, desired) == []
+
+
+def test_changed_step_is_patched_in_place() -> None:
+    current = [_body("A", id=1), _body("B", "old", id=2), _body("C", id=3)]
+    desired = [_body("A"), _body("B2", "new"), _body("C")]
+
+    assert diff_scenario(current, desired) == [PatchStep(2, "B2", "new")]
+
+
+def test_inserted_and_removed_steps_keep_their_neighbours() -> None:
+    current = [_body("A", id=1), _body("B", id=2), _body("C", id=3)]
+    new = _body("X", "done")
+    desired = [_body("A"), new, _body("C"), _body("D")]
+
+    operations = diff_scenario(current, desired)
+
+    assert operations == [
+        PatchStep(2, "X", "done"),
+        InsertSteps(None, 3, (_body("D"),)),
+    ]
+    assert operations is not None and scenario_requests(operations) == 2
+
+
+def test_reordered_steps_move_by_delete_and_insert() -> None:
+    current = [_body("A", id=1), _attachment(9, id=2), _body("B", id=3)]
+    desired = [_attachment(9), _body("A"), _body("B")]
+
+    assert diff_scenario(current, desired) == [
+        DeleteStep(1),
+        InsertSteps(None, 2, (_body("A"),)),
+    ]
+
+
+def test_cleared_expected_result_recreates_the_step() -> None:
+    current = [_body("A", "shown", id=1)]
+    desired = [_body("A")]
+
+    operations = diff_scenario(current, desired)
+
+    assert operations == [DeleteStep(1), InsertSteps(None, None, (_body("A"),))]
+
+
+def test_nested_steps_are_diffed_under_their_parent() -> None:
+    current = [_body("Parent", None, _body("One", id=2), _body("Two", id=3), id=1)]
+    desired = [_body("Parent", None, _body("One"), _body("Three", "ok", _body("Leaf")))]
+
+    operations = diff_scenario(current, desired)
+
+    assert operations == [PatchStep(3, "Three", "ok"), InsertSteps(3, None, (_body("Leaf"),))]
+    assert operations is not None and scenario_requests(operations) == 2
+
+
+def test_steps_without_ids_cannot_be_edited_in_place() -> None:
+    assert diff_scenario([_body("A", None, _body("Child"), id=1)], [_body("A")]) is None
+
+
+@pytest.mark.asyncio
+async def test_update_sends_step_edits_and_recreates_large_ones() -> None:
+    client = AsyncMock(spec=AllureClient)
+    client.api_client = Mock()
+    client.get_project.return_value = 1
+    client.get_test_case.return_value = TestCaseDto(id=7)
+    client.get_test_case_scenario.return_value = TestCaseScenarioV2Dto(
+        steps=[_body("A", id=1), _body("B", id=2), _attachment(5, id=3)]
+    )
+    client.create_scenario_step.return_value = ScenarioStepCreatedResponseDto(created_step_id=40)
+    service = TestCaseService(client)
+
+    await service.update_test_case(7, TestCaseUpdate(steps=[{"action": "A"}, {"action": "C", "expected": "Done"}]))
+
+    client.set_test_case_scenario.assert_not_called()
+    (step_id, patch), _ = client.patch_test_case_scenario_step.call_args
+    assert (step_id, patch.body, patch.expected_result) == (2, "C", "Done")
+    client.create_scenario_step.assert_not_called()
+    client.delete_scenario_step.assert_not_called()
+
+    many = [{"action": f"Step {index}"} for index in range(12)]
+    await service.update_test_case(7, TestCaseUpdate(steps=many))
+
+    client.set_test_case_scenario.assert_called_once()
+    written = client.set_test_case_scenario.call_args.args[1]
+    assert len(written) == 13
+
+
+@pytest.mark.asyncio
+async def test_recreated_scenarios_keep_expected_results(fake_testops: FakeTestOps) -> None:
+    created = await create_test_case(name="Rewritten", steps=[{"action": "Old"}], output_format="json")
+    assert created.structured_content is not None
+    test_case_id = created.structured_content["id"]
+
+    steps = [{"action": f"Step {index}", "expected": f"Result {index}"} for index in range(12)]
+    with count_requests() as ledger:
+        await update_test_case(test_case_id=test_case_id, steps=steps, confirm=True)
+
+    assert ledger.calls["POST /api/testcase/{id}/scenario"] == 1
+    async with AllureClient.from_env() as client:
+        after = await client.get_test_case_scenario(test_case_id)
+    assert [(step.actual_instance.body, step.actual_instance.expected_result) for step in after.steps or []] == [
+        (step["action"], step["expected"]) for step in steps
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_step_edit_falls_back_to_rewriting_the_scenario() -> None:
+    client = AsyncMock(spec=AllureClient)
+    client.api_client = Mock()
+    client.get_project.return_value = 1
+    client.get_test_case.return_value = TestCaseDto(id=7)
+    client.get_test_case_scenario.return_value = TestCaseScenarioV2Dto(steps=[_body("A", id=1)])
+    client.patch_test_case_scenario_step.side_effect = Exception("step is locked")
+    service = TestCaseService(client)
+
+    await service.update_test_case(7, TestCaseUpdate(steps=[{"action": "B"}]))
+
+    (written,) = [step.actual_instance.body for step in client.set_test_case_scenario.call_args.args[1]]
+    assert written == "B"
+
+
+@pytest.mark.asyncio
+async def test_editing_one_step_of_a_long_case_patches_only_that_step(fake_testops: FakeTestOps) -> None:
+    steps = [{"action": f"Action {index}", "expected": f"Result {index}"} for index in range(30)]
+    created = await create_test_case(name="Long", steps=steps, output_format="json")
+    assert created.structured_content is not None
+    test_case_id = created.structured_content["id"]
+    async with AllureClient.from_env() as client:
+        before = await client.get_test_case_scenario(test_case_id)
+
+    steps[12] = {"action": "Action 12, reworded", "expected": "Result 12"}
+    steps.append({"action": "Action 30", "expected": "Result 30"})
+    with count_requests() as ledger:
+        await update_test_case(test_case_id=test_case_id, steps=steps, confirm=True)
+
+    step_calls = {call: count for call, count in ledger.calls.items() if "step" in call or "scenario" in call}
+    assert step_calls == {
+        "GET /api/testcase/{id}/step": 1,
+        "PATCH /api/testcase/step/{id}": 1,
+        # The appended step and its expected result
+        "POST /api/testcase/step": 2,
+    }
+    async with AllureClient.from_env() as client:
+        after = await client.get_test_case_scenario(test_case_id)
+    assert [step.actual_instance.id for step in after.steps or []][:30] == [
+        step.actual_instance.id for step in before.steps or []
+    ]
+    assert [(step.actual_instance.body, step.actual_instance.expected_result) for step in after.steps or []] == [
+        (step["action"], step["expected"]) for step in steps
+    ]
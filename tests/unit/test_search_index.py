@@ -0,0 +1,181 @@
+"""Unit tests for the local full-text index of test cases."""
+
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from src.client import AllureClient
+from src.client.rate_limit import RateLimitConfig, get_endpoint_limiter
+from src.client.request_accounting import count_requests
+from src.services.search_index import (
+    IndexedTestCase,
+    IndexQuery,
+    SearchIndexRefresher,
+    TestCaseIndex,
+    get_test_case_index,
+)
+from src.services.search_service import SearchService
+from src.tools.search import list_test_cases, search_test_cases
+from src.utils.config import settings
+from tests.support.fake_testops import FakeTestOps
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> TestCaseIndex:
+    index = TestCaseIndex(tmp_path / "index.sqlite3")
+    generation = index.start_rebuild()
+    index.upsert(
+        [
+            IndexedTestCase(1, "User login flow", "Active", "UI", ("auth", "smoke"), 10, (("Priority", "High"),)),
+            IndexedTestCase(2, "Admin LOGIN", "Draft", "API", ("auth",), 20),
+            IndexedTestCase(3, "100% coverage", "Active", "API", ("smoke",), 30, (("Priority", "Low"),)),
+        ],
+        generation=generation,
+    )
+    index.finish_rebuild(generation)
+    return index
+
+
+@pytest.fixture
+def indexed_fake(fake_testops: FakeTestOps, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeTestOps:
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", True)
+    monkeypatch.setattr(settings, "SEARCH_INDEX_DIR", str(tmp_path))
+    get_endpoint_limiter(fake_testops.base_url, RateLimitConfig(rate=0))
+    return fake_testops
+
+
+async def _refresh() -> int:
+    async with AllureClient.from_env() as client:
+        index = get_test_case_index(client.get_base_url(), client.get_project(), client.get_auth_scope())
+        assert index is not None
+        return await SearchIndexRefresher(client, index).refresh()
+
+
+@pytest.mark.parametrize(
+    ("aql", "expected"),
+    [
+        ('name ~= "login"', IndexQuery(name="login")),
+        (
+            'tag = "smoke" and status = "Active" AND layer = "UI"',
+            IndexQuery(tags=("smoke",), status="Active", layer="UI"),
+        ),
+        (
+            'cf["Story"] = "Story \\"2\\"" and tag = "a" and tag = "b"',
+            IndexQuery(tags=("a", "b"), custom_fields=(("Story", 'Story "2"'),)),
+        ),
+        ('tag = "smoke" or tag = "e2e"', None),
+        ('not tag = "smoke"', None),
+        ('(tag = "smoke")', None),
+        ('name = "login"', None),
+        ('status != "Draft"', None),
+        ('createdBy = "John"', None),
+        ('status = "Active" and status = "Draft"', None),
+    ],
+)
+def test_index_query_translates_only_conjunctive_equality_aql(aql: str, expected: IndexQuery | None) -> None:
+    assert IndexQuery.from_aql(aql) == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "expected_ids"),
+    [
+        (IndexQuery(name="login"), [1, 2]),
+        (IndexQuery(name="%"), [3]),
+        (IndexQuery(name="in"), [1, 2]),
+        (IndexQuery(tags=("auth", "smoke")), [1]),
+        (IndexQuery(status="Active", layer="API"), [3]),
+        (IndexQuery(custom_fields=(("Priority", "High"),)), [1]),
+        (IndexQuery(), [1, 2, 3]),
+    ],
+)
+def test_index_search_matches_like_testops(index: TestCaseIndex, query: IndexQuery, expected_ids: list[int]) -> None:
+    page = index.search(query, page=0, size=20)
+
+    assert [tc.id for tc in page.content or []] == expected_ids
+    assert page.total_elements == len(expected_ids)
+
+
+def test_index_search_pages_and_rebuilds_drop_unseen_rows(index: TestCaseIndex) -> None:
+    second = index.search(IndexQuery(), page=1, size=2)
+    assert [tc.id for tc in second.content or []] == [3]
+    assert second.total_pages == 2
+    assert second.content is not None and second.content[0].tags is not None
+    assert [tag.name for tag in second.content[0].tags] == ["smoke"]
+
+    generation = index.start_rebuild()
+    index.upsert([IndexedTestCase(2, "Admin login", "Active", None, (), 40)], generation=generation)
+    index.finish_rebuild(generation)
+
+    assert index.count() == 1
+    assert index.is_fresh(60)
+    assert index.search(IndexQuery(tags=("auth",)), page=0, size=20).total_elements == 0
+
+
+@pytest.mark.asyncio
+async def test_searches_are_answered_from_a_fresh_index_without_requests(indexed_fake: FakeTestOps) -> None:
+    live = await search_test_cases(query="case 1 tag:smoke", size=100, output_format="json")
+    await _refresh()
+
+    with count_requests() as ledger:
+        indexed = await search_test_cases(query="case 1 tag:smoke", size=100, output_format="json")
+        by_aql = await search_test_cases(aql='tag = "smoke" and status = "Active"', size=100, output_format="json")
+        listed = await list_test_cases(tags=["smoke"], status="Active", size=100, output_format="json")
+
+    assert ledger.total == 0
+    assert indexed.structured_content == live.structured_content
+    assert by_aql.structured_content is not None and listed.structured_content is not None
+    assert by_aql.structured_content["items"] == listed.structured_content["items"]
+    assert by_aql.structured_content["total"] > 0
+
+
+@pytest.mark.asyncio
+async def test_stale_index_and_unsupported_aql_go_to_testops(
+    indexed_fake: FakeTestOps, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await _refresh()
+
+    with count_requests() as ledger:
+        await search_test_cases(aql='tag = "smoke" or tag = "api"', output_format="json")
+    assert ledger.total == 2
+
+    monkeypatch.setattr(time, "time", lambda: 10**12)
+    with count_requests() as ledger:
+        await search_test_cases(query="tag:smoke", output_format="json")
+    assert ledger.total == 1
+
+
+@pytest.mark.asyncio
+async def test_index_only_answers_callers_using_the_token_it_was_built_with(
+    indexed_fake: FakeTestOps, tmp_path: Path
+) -> None:
+    await _refresh()
+    config = indexed_fake.config
+
+    def _fetcher(token: str) -> object:
+        client = AllureClient(indexed_fake.base_url, SecretStr(token), config.project_id)
+        return SearchService(client=client)._index_page_fetcher(IndexQuery(), size=10)
+
+    assert _fetcher(config.api_token) is not None
+    assert _fetcher("another-users-token") is None
+    assert len(list(tmp_path.glob("*.sqlite3"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_reindexes_changed_test_cases_and_rebuilds_after_deletions(indexed_fake: FakeTestOps) -> None:
+    assert await _refresh() == 200
+
+    indexed_fake.store.patch_test_case(5, {"name": "Renamed checkout"})
+    with count_requests() as ledger:
+        assert await _refresh() == 1
+    assert ledger.calls == {"GET /api/testcase/__search": 1, "GET /api/testcase/{id}/cfv": 1}
+    found = await search_test_cases(query="checkout", output_format="json")
+    assert found.structured_content is not None
+    assert [item["id"] for item in found.structured_content["items"]] == [5]
+
+    indexed_fake.store.delete_test_case(7, force=True)
+    assert await _refresh() == 199
+    listed = await list_test_cases(size=10, output_format="json")
+    assert listed.structured_content is not None
+    assert listed.structured_content["total"] == 199
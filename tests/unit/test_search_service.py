@@ -14,8 +14,12 @@ from src.tools.search import (
     _format_test_case_details,
     _format_test_case_list,
     _serialize_test_case_details,
+    list_test_cases,
+    search_test_cases,
+    stream_search_test_cases,
 )
 from src.utils.aql import normalize_aql
+from tests.support.fake_testops import FakeTestOps
 
 
 @pytest.fixture
@@ -397,6 +401,86 @@ def test_format_test_case_list_includes_url_for_project_zero() -> None:
 # =============================================
 
 
+def _page(ids: list[int], *, number: int, total: int) -> PageTestCaseDto:
+    return PageTestCaseDto(
+        content=[TestCaseDto(id=test_case_id, name=f"Case {test_case_id}") for test_case_id in ids],
+        total_elements=total,
+        number=number,
+        size=100,
+        total_pages=(total + 99) // 100,
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_test_cases_reads_every_page_and_drops_repeats(
+    service: SearchService, mock_client: AllureClient
+) -> None:
+    # A test case created mid-scan shifts id 100 from page 0 onto page 1.
+    pages = {
+        0: _page(list(range(1, 101)), number=0, total=250),
+        1: _page(list(range(100, 200)), number=1, total=250),
+        2: _page(list(range(200, 251)), number=2, total=250),
+    }
+    mock_client.list_test_cases = AsyncMock(side_effect=lambda *, page, **_: pages[page])
+
+    scan = await service.scan_test_cases(tags=["smoke"])
+    result = await scan.collect()
+
+    assert [tc.id for tc in result.items] == list(range(1, 251))
+    assert result.total == 250
+    assert result.truncated is False
+    assert mock_client.list_test_cases.await_count == 3
+    mock_client.list_test_cases.assert_any_await(
+        project_id=123, page=2, size=100, search=None, tags=["smoke"], status=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_test_cases_stops_at_max_items(service: SearchService, mock_client: AllureClient) -> None:
+    mock_client.list_test_cases = AsyncMock(
+        side_effect=lambda *, page, **_: _page(list(range(page * 100 + 1, page * 100 + 101)), number=page, total=300)
+    )
+
+    scan = await service.scan_test_cases(max_items=150)
+    result = await scan.collect()
+
+    assert len(result.items) == 150
+    assert result.total == 300
+    assert result.truncated is True
+
+
+@pytest.mark.asyncio
+async def test_scan_test_cases_validates_max_items(service: SearchService) -> None:
+    with pytest.raises(AllureValidationError, match="max_items must be between 1 and 5000"):
+        await service.scan_test_cases(max_items=5001)
+
+
+@pytest.mark.asyncio
+async def test_list_test_cases_all_pages_returns_compact_rows(fake_testops: FakeTestOps) -> None:
+    output = await list_test_cases(all_pages=True, max_items=150, output_format="json")
+
+    assert output.structured_content is not None
+    payload = output.structured_content
+    assert payload["total"] == 200
+    assert payload["size"] == 150
+    assert payload["truncated"] is True
+    assert payload["items"][0] == {"id": 1, "name": "Test case 1", "status": "Active", "tags": ["flaky", "security"]}
+    assert fake_testops.stats.calls["GET /api/testcase/__search"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_test_cases_all_pages_with_aql(fake_testops: FakeTestOps) -> None:
+    output = await search_test_cases(aql='tag = "smoke"', all_pages=True, output_format="json")
+    rows = [row async for row in stream_search_test_cases(aql='tag = "smoke"')]
+
+    assert output.structured_content is not None
+    payload = output.structured_content
+    assert payload["truncated"] is False
+    assert payload["total"] == len(payload["items"]) > 0
+    assert all("smoke" in row["tags"] for row in payload["items"])
+    assert rows == payload["items"]
+
+
 @pytest.fixture
 def mock_client_with_aql() -> AllureClient:
     """Client mock with AQL-specific methods."""
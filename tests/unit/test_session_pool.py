@@ -0,0 +1,134 @@
+"""Unit tests for the process-wide Allure session pool."""
+
+import pytest
+import respx
+from httpx import Response
+from pydantic import SecretStr
+
+from src.client import AllureClient
+from src.client.session_pool import AllureSessionPool, get_session_pool, token_fingerprint
+
+BASE_URL = "https://allure.example.com"
+
+
+@pytest.fixture
+def oauth_route() -> respx.Route:
+    return respx.post(f"{BASE_URL}/api/uaa/oauth/token").mock(
+        return_value=Response(200, json={"access_token": "pooled-jwt", "expires_in": 3600})
+    )
+
+
+def test_token_fingerprint_is_stable_and_does_not_leak_token() -> None:
+    fingerprint = token_fingerprint(SecretStr("secret-token"))
+
+    assert fingerprint == token_fingerprint(SecretStr("secret-token"))
+    assert fingerprint != token_fingerprint(SecretStr("other-token"))
+    assert "secret" not in fingerprint
+
+
+def test_session_key_normalizes_trailing_slash() -> None:
+    token = SecretStr("token")
+
+    assert AllureSessionPool.session_key(f"{BASE_URL}/", token) == AllureSessionPool.session_key(BASE_URL, token)
+
+
+def test_pool_requires_positive_capacity() -> None:
+    with pytest.raises(ValueError, match="max_sessions"):
+        AllureSessionPool(max_sessions=0)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pooled_clients_share_token_exchange_and_api_client(oauth_route: respx.Route) -> None:
+    async with AllureSessionPool() as pool:
+        assert get_session_pool() is pool
+
+        async with AllureClient(BASE_URL, SecretStr("token"), project=1) as first:
+            first_api_client = first.api_client
+        async with AllureClient(BASE_URL, SecretStr("token"), project=2) as second:
+            assert second.api_client is first_api_client
+            assert second._jwt_token == "pooled-jwt"  # noqa: S105
+            assert second._test_case_api is not None
+            assert second.get_project() == 2
+
+        assert oauth_route.call_count == 1
+        assert len(pool) == 1
+
+    assert get_session_pool() is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pooled_sessions_are_keyed_by_token(oauth_route: respx.Route) -> None:
+    async with AllureSessionPool() as pool:
+        async with AllureClient(BASE_URL, SecretStr("token-a"), project=1) as first:
+            first_api_client = first.api_client
+        async with AllureClient(BASE_URL, SecretStr("token-b"), project=1) as second:
+            assert second.api_client is not first_api_client
+
+        assert oauth_route.call_count == 2
+        assert len(pool) == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pool_evicts_least_recently_used_session(oauth_route: respx.Route) -> None:
+    async with AllureSessionPool(max_sessions=1) as pool:
+        async with AllureClient(BASE_URL, SecretStr("token-a"), project=1) as first:
+            first_session = first._session
+        async with AllureClient(BASE_URL, SecretStr("token-b"), project=1):
+            pass
+
+        assert len(pool) == 1
+        assert first_session.evicted
+        assert first_session.api_client is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_evicted_session_stays_open_until_last_lease_ends(oauth_route: respx.Route) -> None:
+    async with AllureSessionPool(max_sessions=1):
+        async with AllureClient(BASE_URL, SecretStr("token-a"), project=1) as first:
+            async with AllureClient(BASE_URL, SecretStr("token-b"), project=1):
+                assert first._session.evicted
+                assert first._session.api_client is not None
+            assert first._session.api_client is not None
+        assert first._session.api_client is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failed_token_exchange_releases_lease() -> None:
+    respx.post(f"{BASE_URL}/api/uaa/oauth/token").mock(return_value=Response(401, text="bad token"))
+
+    async with AllureSessionPool() as pool:
+        client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+        with pytest.raises(Exception, match="Token exchange failed"):
+            await client.__aenter__()
+
+        session = await pool.acquire(BASE_URL, SecretStr("token"))
+        assert session.leases == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_discard_drops_session(oauth_route: respx.Route) -> None:
+    async with AllureSessionPool() as pool:
+        async with AllureClient(BASE_URL, SecretStr("token"), project=1):
+            pass
+        await pool.discard(BASE_URL, SecretStr("token"))
+
+        assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_clients_without_pool_keep_per_call_sessions(oauth_route: respx.Route) -> None:
+    assert get_session_pool() is None
+
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as first:
+        first_api_client = first.api_client
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as second:
+        assert second.api_client is not first_api_client
+
+    assert oauth_route.call_count == 2
@@ -9,6 +9,7 @@ from src.client import (
     SharedStepDto,
 )
 from src.client.exceptions import AllureValidationError
+from src.client.generated.models import ScenarioStepCreatedResponseDto
 from src.services.shared_step_service import SharedStepService
 
 
@@ -16,6 +17,7 @@ from src.services.shared_step_service import SharedStepService
 def mock_client():
     client = MagicMock(spec=AllureClient)
     client.create_shared_step = AsyncMock()
+    client.set_shared_step_scenario = AsyncMock()
     client.create_shared_step_scenario_step = AsyncMock()
     client.patch_shared_step_scenario_step = AsyncMock()
     client.list_shared_steps = AsyncMock()
@@ -33,28 +35,14 @@ def service(mock_client):
 async def test_create_shared_step_success(service, mock_client):
     """Test creating a shared step with steps and attachments."""
     mock_client.create_shared_step.return_value = SharedStepDto(id=100, name="Shared Step", project_id=1)
-    # Use generic objects for step response to avoid oneOf validation issues during test
-    action_mock = MagicMock()
-    action_mock.created_step_id = 201
-
-    expected_mock = MagicMock()
-    expected_mock.created_step_id = 202
-
-    att_mock = MagicMock()
-    att_mock.created_step_id = 203
-
-    mock_client.create_shared_step_scenario_step.side_effect = [
-        action_mock,  # Action
-        expected_mock,  # Expected
-        att_mock,  # Attachment step
-    ]
+    mock_client.set_shared_step_scenario.return_value = [201, 203]
     mock_client.upload_shared_step_attachment.return_value = [SharedStepAttachmentRowDto(id=500, name="file.txt")]
 
     steps = [
         {
             "action": "Do something",
-            "expected": "Something happens",
             "attachments": [{"name": "file.txt", "content": "Zm9vYmFy"}],
+            "steps": [{"action": "Nested"}, {"steps": [{"action": "Lifted"}]}],
         }
     ]
 
@@ -63,30 +51,45 @@ async def test_create_shared_step_success(service, mock_client):
     assert result.id == 100
     mock_client.create_shared_step.assert_called_once_with(1, "Shared Step")
 
-    # Check step creation calls
-    assert mock_client.create_shared_step_scenario_step.call_count == 3
-    mock_client.patch_shared_step_scenario_step.assert_called_once()
-
-    # 1. Action
-    action_call = mock_client.create_shared_step_scenario_step.call_args_list[0]
-    assert action_call[0][0].body == "Do something"
-    assert action_call[0][0].shared_step_id == 100
-
-    # Patch expected result on action step
-    patch_call = mock_client.patch_shared_step_scenario_step.call_args
-    assert patch_call.kwargs["step_id"] == 201
-    assert patch_call.kwargs["patch"].body == "Do something"
-    assert patch_call.kwargs["patch"].expected_result == "Something happens"
-
-    # 2. Expected
-    expected_call = mock_client.create_shared_step_scenario_step.call_args_list[1]
-    assert expected_call[0][0].body == "Something happens"
-    assert expected_call[0][0].parent_id == 201
-
-    # 3. Attachment
-    att_call = mock_client.create_shared_step_scenario_step.call_args_list[2]
-    assert att_call[0][0].attachment_id == 500
-    assert att_call[0][0].parent_id == 201
+    # The whole scenario is written in one request
+    mock_client.set_shared_step_scenario.assert_called_once()
+    shared_step_id, written = mock_client.set_shared_step_scenario.call_args.args
+    assert shared_step_id == 100
+
+    (action,) = (step.actual_instance for step in written)
+    assert action.body == "Do something"
+    assert action.expected_result is None
+    mock_client.create_shared_step_scenario_step.assert_not_called()
+
+    # Attachment first, then nested steps; a nested step without an action lifts its children
+    attachment, nested, lifted = (child.actual_instance for child in action.steps)
+    assert attachment.attachment_id == 500
+    assert nested.body == "Nested"
+    assert lifted.body == "Lifted"
+
+
+@pytest.mark.asyncio
+async def test_create_shared_step_with_expected_results_creates_steps_one_by_one(service, mock_client):
+    """Scenario writes cannot carry expected results, so such steps are created individually."""
+    mock_client.create_shared_step.return_value = SharedStepDto(id=100, name="Shared Step", project_id=1)
+    mock_client.create_shared_step_scenario_step.side_effect = [
+        ScenarioStepCreatedResponseDto(created_step_id=step_id) for step_id in (201, 202, 203)
+    ]
+
+    steps = [{"action": "Do something", "expected": "Something happens", "steps": [{"action": "Nested"}]}]
+
+    await service.create_shared_step(name="Shared Step", steps=steps)
+
+    mock_client.set_shared_step_scenario.assert_not_called()
+    created = [call.args[0] for call in mock_client.create_shared_step_scenario_step.call_args_list]
+    assert [(dto.shared_step_id, dto.body, dto.parent_id) for dto in created] == [
+        (100, "Do something", None),
+        (100, "Something happens", 201),
+        (100, "Nested", 201),
+    ]
+    patch = mock_client.patch_shared_step_scenario_step.call_args.kwargs
+    assert patch["step_id"] == 201
+    assert (patch["patch"].body, patch["patch"].expected_result) == ("Do something", "Something happens")
 
 
 @pytest.mark.asyncio
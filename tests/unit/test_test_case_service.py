@@ -12,6 +12,8 @@ from src.client.generated.models import (
     CustomFieldDto,
     CustomFieldProjectDto,
     CustomFieldProjectWithValuesDto,
+    NormalizedScenarioDto,
+    NormalizedScenarioStepDto,
     ScenarioStepCreatedResponseDto,
     SharedStepScenarioDtoStepsInner,
     TestCaseDto,
@@ -21,7 +23,7 @@ from src.client.generated.models import (
 )
 from src.services.attachment_service import AttachmentService
 from src.services.test_case_service import TestCaseService, TestCaseUpdate
-from src.services.test_layer_service import TestLayerService
+from src.services.test_layer_service import TestLayerCatalogue, TestLayerService
 
 
 @pytest.fixture
@@ -49,13 +51,15 @@ def service(
     )
 
 
+def _attachment_row(attachment_id: int, name: str) -> Mock:
+    row = Mock(id=attachment_id)
+    row.name = name
+    return row
+
+
 @pytest.fixture
 def mock_step_response() -> ScenarioStepCreatedResponseDto:
-    """Mock response for create_scenario_step calls."""
-    # Return a response that mimics the real API: providing scenario data to find expectedResultId
-    from src.client.generated.models.normalized_scenario_dto import NormalizedScenarioDto
-    from src.client.generated.models.normalized_scenario_step_dto import NormalizedScenarioStepDto
-
+    """Mock response for create_scenario_step calls, with the step's expectedResultId."""
     return ScenarioStepCreatedResponseDto(
         created_step_id=1000,
         scenario=NormalizedScenarioDto(
@@ -64,6 +68,14 @@ def mock_step_response() -> ScenarioStepCreatedResponseDto:
     )
 
 
+def _written_scenario(mock_client: AsyncMock) -> list[object]:
+    """Step instances of the single ``set_test_case_scenario`` call."""
+    mock_client.set_test_case_scenario.assert_called_once()
+    mock_client.create_scenario_step.assert_not_called()
+    _test_case_id, steps = mock_client.set_test_case_scenario.call_args.args
+    return [step.actual_instance for step in steps]
+
+
 @pytest.mark.asyncio
 async def test_create_test_case_success_minimal(service: TestCaseService, mock_client: AsyncMock) -> None:
     """Test creating a test case with minimal required fields."""
@@ -90,7 +102,7 @@ async def test_create_test_case_success_minimal(service: TestCaseService, mock_c
 async def test_create_test_case_with_steps(
     service: TestCaseService, mock_client: AsyncMock, mock_step_response: ScenarioStepCreatedResponseDto
 ) -> None:
-    """Test creating a test case with steps (via separate API calls)."""
+    """Test creating a test case with steps (via separate API calls, as they have expected results)."""
     project_id = 1
     name = "Steps Test"
     steps = [{"action": "A", "expected": "B"}]
@@ -108,6 +120,7 @@ async def test_create_test_case_with_steps(
     assert passed_dto.project_id == project_id
 
     # Steps added via separate API calls (action + expected child)
+    mock_client.set_test_case_scenario.assert_not_called()
     assert mock_client.create_scenario_step.call_count == 2
     mock_client.patch_test_case_scenario_step.assert_not_called()
 
@@ -130,34 +143,31 @@ async def test_create_test_case_with_attachments(
     service: TestCaseService,
     mock_client: AsyncMock,
     mock_attachment_service: AsyncMock,
-    mock_step_response: ScenarioStepCreatedResponseDto,
 ) -> None:
     """Test creating a test case with attachments."""
     project_id = 1
     name = "Attachment Test"
     attachments = [{"name": "img.png", "content": "...", "content_type": "image/png"}]
 
-    mock_attachment_service.upload_attachment.return_value = Mock(id=999, name="img.png")
+    mock_attachment_service.upload_attachments.return_value = [_attachment_row(999, "img.png")]
     result_mock = Mock(id=102)
     result_mock.name = name
     mock_client.create_test_case.return_value = result_mock
-    mock_client.create_scenario_step.return_value = mock_step_response
 
     await service.create_test_case(name, attachments=attachments)
 
     # Verify attachment upload called with test_case_id (not project_id)
     test_case_id = 102
-    mock_attachment_service.upload_attachment.assert_called_once_with(test_case_id, attachments[0])
+    mock_attachment_service.upload_attachments.assert_called_once_with(test_case_id, attachments)
 
     # Verify create_test_case called with project_id
     call_args = mock_client.create_test_case.call_args
     passed_dto = call_args[0][0]
     assert passed_dto.project_id == project_id
 
-    # Verify attachment step was created via separate API call
-    mock_client.create_scenario_step.assert_called_once()
-    step_call = mock_client.create_scenario_step.call_args
-    assert step_call.kwargs["step"].attachment_id == 999
+    # Verify the attachment step is the whole scenario
+    (attachment_step,) = _written_scenario(mock_client)
+    assert attachment_step.attachment_id == 999
 
 
 @pytest.mark.asyncio
@@ -192,7 +202,7 @@ async def test_create_test_case_with_custom_fields(service: TestCaseService, moc
     ]
 
     mock_layer = TestLayerDto(id=7, name="Layer7")
-    service._test_layer_service.get_test_layer.return_value = mock_layer
+    service._test_layer_service.find_test_layer.return_value = mock_layer
 
     result_mock = Mock(id=103)
     result_mock.name = name
@@ -200,7 +210,7 @@ async def test_create_test_case_with_custom_fields(service: TestCaseService, moc
 
     await service.create_test_case(name, custom_fields=custom_fields, test_layer_id=7)
 
-    service._test_layer_service.get_test_layer.assert_called_once_with(7)
+    service._test_layer_service.find_test_layer.assert_called_once_with(7)
 
     # Verify resolution call
     mock_client.get_custom_fields_with_values.assert_called_once_with(1)
@@ -226,7 +236,7 @@ async def test_create_test_case_custom_field_not_found(service: TestCaseService,
     # Mock custom field resolution directly on the client
     mock_client.get_custom_fields_with_values.return_value = []
 
-    service._test_layer_service.get_test_layer.return_value = TestLayerDto(id=7, name="Layer7")
+    service._test_layer_service.find_test_layer.return_value = TestLayerDto(id=7, name="Layer7")
 
     # Expect the new aggregated error format
     with pytest.raises(AllureValidationError, match="The following custom fields were not found"):
@@ -245,7 +255,7 @@ async def test_create_test_case_with_step_attachments(
     step_att = {"name": "s.png", "content": "x"}
     steps = [{"action": "Act", "expected": "Exp", "attachments": [step_att]}]
 
-    mock_attachment_service.upload_attachment.return_value = Mock(id=888, name="s.png")
+    mock_attachment_service.upload_attachments.return_value = [_attachment_row(888, "s.png")]
     result_mock = Mock(id=104)
     result_mock.name = name
     mock_client.create_test_case.return_value = result_mock
@@ -255,15 +265,12 @@ async def test_create_test_case_with_step_attachments(
 
     # Verify attachment upload called with test_case_id (not project_id)
     test_case_id = 104
-    mock_attachment_service.upload_attachment.assert_called_once_with(test_case_id, step_att)
+    mock_attachment_service.upload_attachments.assert_called_once_with(test_case_id, [step_att])
 
     # Expect: Action -> Expected -> Attachment (3 create_scenario_step calls)
-    # The order in _add_steps is: Action (create) -> Check Expected and create child
-    # -> Check Attachments and create child
+    mock_client.set_test_case_scenario.assert_not_called()
     assert mock_client.create_scenario_step.call_count == 3
     mock_client.patch_test_case_scenario_step.assert_not_called()
-
-    # Verify the order and nesting
     calls = mock_client.create_scenario_step.call_args_list
 
     # 1. Action
@@ -278,7 +285,6 @@ async def test_create_test_case_with_step_attachments(
     # 3. Attachment (child of Action=1000)
     assert calls[2].kwargs["step"].attachment_id == 888
     assert calls[2].kwargs["step"].parent_id == 1000
-    assert calls[2].kwargs["after_id"] is None
 
 
 # ==========================================
@@ -455,24 +461,23 @@ class TestTestLayerValidation:
     @pytest.mark.asyncio
     async def test_test_layer_id_valid(self, service: TestCaseService, mock_client: AsyncMock) -> None:
         layer = TestLayerDto(id=9, name="Layer9")
-        service._test_layer_service.get_test_layer.return_value = layer
+        service._test_layer_service.find_test_layer.return_value = layer
         result_mock = Mock(id=105)
         result_mock.name = "Test"
         mock_client.create_test_case.return_value = result_mock
 
         await service.create_test_case("Test", test_layer_id=9)
 
-        service._test_layer_service.get_test_layer.assert_called_once_with(9)
+        service._test_layer_service.find_test_layer.assert_called_once_with(9)
         passed_dto = mock_client.create_test_case.call_args[0][0]
         assert passed_dto.test_layer_id == 9
 
     @pytest.mark.asyncio
     async def test_test_layer_id_not_found(self, service: TestCaseService) -> None:
-        service._test_layer_service.get_test_layer.side_effect = AllureNotFoundError("missing")
-        service._test_layer_service.list_test_layers.return_value = [
-            TestLayerDto(id=1, name="Layer1"),
-            TestLayerDto(id=2, name="Layer2"),
-        ]
+        service._test_layer_service.find_test_layer.return_value = None
+        service._test_layer_service.get_test_layer_catalogue.return_value = TestLayerCatalogue.from_layers(
+            [TestLayerDto(id=1, name="Layer1"), TestLayerDto(id=2, name="Layer2")]
+        )
 
         with pytest.raises(AllureValidationError, match="does not exist") as excinfo:
             await service.create_test_case("Test", test_layer_id=123)
@@ -483,29 +488,26 @@ class TestTestLayerValidation:
         assert "Available test layers" in error_str
         assert "Use list_test_layers" in error_str
         assert "omit test_layer_id/test_layer_name" in error_str
-        service._test_layer_service.list_test_layers.assert_called_once_with(page=0, size=100)
 
     @pytest.mark.asyncio
     async def test_test_layer_name_valid(self, service: TestCaseService, mock_client: AsyncMock) -> None:
-        service._test_layer_service.list_test_layers.return_value = [
-            TestLayerDto(id=3, name="Layer3"),
-            TestLayerDto(id=4, name="Layer4"),
-        ]
+        service._test_layer_service.find_test_layers_by_name.return_value = (TestLayerDto(id=4, name="Layer4"),)
         result_mock = Mock(id=106)
         result_mock.name = "Test"
         mock_client.create_test_case.return_value = result_mock
 
         await service.create_test_case("Test", test_layer_name="Layer4")
 
-        service._test_layer_service.list_test_layers.assert_called_once_with(page=0, size=100)
+        service._test_layer_service.find_test_layers_by_name.assert_called_once_with("Layer4")
         passed_dto = mock_client.create_test_case.call_args[0][0]
         assert passed_dto.test_layer_id == 4
 
     @pytest.mark.asyncio
     async def test_test_layer_name_not_found(self, service: TestCaseService) -> None:
-        service._test_layer_service.list_test_layers.return_value = [
-            TestLayerDto(id=1, name="Layer1"),
-        ]
+        service._test_layer_service.find_test_layers_by_name.return_value = ()
+        service._test_layer_service.get_test_layer_catalogue.return_value = TestLayerCatalogue.from_layers(
+            [TestLayerDto(id=1, name="Layer1")]
+        )
 
         with pytest.raises(AllureValidationError, match="name 'Missing' not found") as excinfo:
             await service.create_test_case("Test", test_layer_name="Missing")
@@ -519,10 +521,10 @@ class TestTestLayerValidation:
 
     @pytest.mark.asyncio
     async def test_test_layer_name_ambiguous(self, service: TestCaseService) -> None:
-        service._test_layer_service.list_test_layers.return_value = [
+        service._test_layer_service.find_test_layers_by_name.return_value = (
             TestLayerDto(id=1, name="Layer"),
             TestLayerDto(id=2, name="Layer"),
-        ]
+        )
 
         with pytest.raises(AllureValidationError, match="Multiple test layers match") as excinfo:
             await service.create_test_case("Test", test_layer_name="Layer")
@@ -540,8 +542,8 @@ class TestTestLayerValidation:
 
         await service.create_test_case("Test")
 
-        service._test_layer_service.get_test_layer.assert_not_called()
-        service._test_layer_service.list_test_layers.assert_not_called()
+        service._test_layer_service.find_test_layer.assert_not_called()
+        service._test_layer_service.find_test_layers_by_name.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -555,8 +557,8 @@ async def test_create_test_case_rollback_on_failure(service: TestCaseService, mo
     result_mock.name = name
     mock_client.create_test_case.return_value = result_mock
 
-    # 2. Failed step creation
-    mock_client.create_scenario_step.side_effect = Exception("API Error during step creation")
+    # 2. Failed scenario write
+    mock_client.set_test_case_scenario.side_effect = Exception("API Error during scenario write")
 
     # 3. Call and expect rollback error
     with pytest.raises(AllureAPIError, match="Test case creation failed and was rolled back"):
@@ -626,9 +628,6 @@ class TestUpdateTestCase:
         mock_client.get_test_case.return_value = TestCaseDto(id=test_case_id)
         mock_client.get_test_case_scenario.return_value = mock_scenario_response
         mock_client.update_test_case.return_value = TestCaseDto(id=test_case_id)
-        mock_client.create_scenario_step.return_value = ScenarioStepCreatedResponseDto(
-            created_step_id=1000, scenario=None
-        )
 
         # New Steps
         steps = [{"action": "New Action"}]
@@ -636,21 +635,16 @@ class TestUpdateTestCase:
 
         await service.update_test_case(test_case_id, data)
 
-        # get_test_case_scenario is called twice: once in _get_existing_steps_to_preserve
-        # and once in _recreate_scenario for rollback backup
-        assert mock_client.get_test_case_scenario.call_count == 2
+        # get_test_case_scenario is only read to find the steps to preserve
+        assert mock_client.get_test_case_scenario.call_count == 1
 
-        # Verify scenario was cleared in update_test_case (called in _recreate_scenario)
-        assert mock_client.update_test_case.call_count >= 1
-        clear_calls = [
-            call
-            for call in mock_client.update_test_case.call_args_list
-            if call[0][1].scenario is not None and call[0][1].scenario.steps == []
-        ]
-        assert len(clear_calls) == 1
+        # The scenario is replaced by one write, without clearing it first
+        assert not [call for call in mock_client.update_test_case.call_args_list if call[0][1].scenario is not None]
 
-        # Verify create_scenario_step was called for new action and preserved attachment
-        assert mock_client.create_scenario_step.call_count == 2
+        # New action followed by the preserved attachment
+        new_action, preserved = _written_scenario(mock_client)
+        assert new_action.body == "New Action"
+        assert preserved.attachment_id == 1
 
     @pytest.mark.asyncio
     async def test_update_attachments_preserves_steps(
@@ -665,11 +659,8 @@ class TestUpdateTestCase:
         mock_client.get_test_case.return_value = TestCaseDto(id=test_case_id)
         mock_client.get_test_case_scenario.return_value = mock_scenario_response
         mock_client.update_test_case.return_value = TestCaseDto(id=test_case_id)
-        mock_client.create_scenario_step.return_value = ScenarioStepCreatedResponseDto(
-            created_step_id=1001, scenario=None
-        )
 
-        mock_attachment_service.upload_attachment.return_value = Mock(id=200, name="New Att")
+        mock_attachment_service.upload_attachments.return_value = [_attachment_row(200, "New Att")]
 
         # New Attachments
         attachments = [{"name": "new.png", "content": "base64"}]
@@ -677,22 +668,13 @@ class TestUpdateTestCase:
 
         await service.update_test_case(test_case_id, data)
 
-        # Verify scenario was cleared
-        assert mock_client.update_test_case.call_count >= 1
-        clear_calls = [
-            call
-            for call in mock_client.update_test_case.call_args_list
-            if call[0][1].scenario is not None and call[0][1].scenario.steps == []
-        ]
-        assert len(clear_calls) == 1
-
         # Verify attachment was uploaded
-        mock_attachment_service.upload_attachment.assert_called_once()
+        mock_attachment_service.upload_attachments.assert_called_once_with(test_case_id, attachments)
 
-        # Verify create_scenario_step was called:
-        # Existing body steps are preserved, and one new attachment step is added.
-        # We expect 2 calls: preserved body step + new attachment step.
-        assert mock_client.create_scenario_step.call_count == 2
+        # Existing body step is preserved, followed by the new attachment step
+        preserved, new_attachment = _written_scenario(mock_client)
+        assert preserved.body == "Existing Step"
+        assert new_attachment.attachment_id == 200
 
     @pytest.mark.asyncio
     async def test_update_nested_steps(
@@ -704,16 +686,6 @@ class TestUpdateTestCase:
         mock_client.get_test_case_scenario.return_value = mock_scenario_response
         mock_client.update_test_case.return_value = TestCaseDto(id=test_case_id)
 
-        # Setup mock for create_scenario_step to return increasing IDs
-        step_id_counter = [2000]  # Use list to allow mutation in nested function
-
-        def create_step_side_effect(*args, **kwargs):
-            step_id = step_id_counter[0]
-            step_id_counter[0] += 1
-            return ScenarioStepCreatedResponseDto(created_step_id=step_id, scenario=None)
-
-        mock_client.create_scenario_step.side_effect = create_step_side_effect
-
         # Nested Steps Structure
         steps = [
             {
@@ -725,80 +697,34 @@ class TestUpdateTestCase:
 
         await service.update_test_case(test_case_id, data)
 
-        # Verify scenario was cleared
-        assert mock_client.update_test_case.call_count >= 1
-
-        # Verify create_scenario_step was called for Parent, Child 1, Child 2, Grandchild, and preserved attachment
-        # Total: 5 calls
-        assert mock_client.create_scenario_step.call_count == 5
-
-        # Verify the hierarchy by checking parent_id relationships
-        calls = mock_client.create_scenario_step.call_args_list
-
-        # Parent should have no parent_id
-        parent_call = calls[0]
-        assert parent_call.kwargs["step"].parent_id is None
-        assert parent_call.kwargs["step"].body == "Parent"
-
-        # Child 1 should have Parent as parent
-        child1_call = calls[1]
-        assert child1_call.kwargs["step"].parent_id == 2000  # Parent's ID
-        assert child1_call.kwargs["step"].body == "Child 1"
-
-        # Child 2 should have Parent as parent
-        child2_call = calls[2]
-        assert child2_call.kwargs["step"].parent_id == 2000  # Parent's ID
-        assert child2_call.kwargs["step"].body == "Child 2"
-
-        # Grandchild should have Child 2 as parent
-        grandchild_call = calls[3]
-        assert grandchild_call.kwargs["step"].parent_id == 2002  # Child 2's ID
-        assert grandchild_call.kwargs["step"].body == "Grandchild"
-
-        # Final call preserves existing attachment
-        preserved_call = calls[4]
-        assert preserved_call.kwargs["step"].attachment_id == 1
+        # The whole tree is written at once: Parent > (Child 1, Child 2 > Grandchild), then the preserved attachment
+        parent, preserved = _written_scenario(mock_client)
+        assert parent.body == "Parent"
+        child1, child2 = (child.actual_instance for child in parent.steps)
+        assert child1.body == "Child 1"
+        assert child2.body == "Child 2"
+        assert [grandchild.actual_instance.body for grandchild in child2.steps] == ["Grandchild"]
+        assert preserved.attachment_id == 1
 
     @pytest.mark.asyncio
-    async def test_recreate_scenario_rollback(self, service: TestCaseService, mock_client: AsyncMock) -> None:
-        """Test scenario recreation rollback on failure."""
+    async def test_recreate_scenario_failure(self, service: TestCaseService, mock_client: AsyncMock) -> None:
+        """Test a failed scenario write is reported without clearing the scenario first."""
         test_case_id = 999
 
-        # 1. Setup mock current scenario (to be restored)
         step = SharedStepScenarioDtoStepsInner(
             actual_instance=BodyStepDtoWithSteps(type="BodyStepDto", body="Old Step")
         )
-        current_scenario = TestCaseScenarioV2Dto(steps=[step])
-        mock_client.get_test_case_scenario.return_value = current_scenario
-
-        # 2. Mock update_test_case for clearing (success first time, success on rollback)
+        mock_client.get_test_case_scenario.return_value = TestCaseScenarioV2Dto(steps=[step])
         mock_client.update_test_case.return_value = TestCaseDto(id=test_case_id)
+        mock_client.set_test_case_scenario.side_effect = Exception("API Fail")
 
-        # 3. Mock recursive add step to fail
-        # This mocks the creation of the NEW steps failing
-        service._recursive_add_step = AsyncMock(side_effect=Exception("API Fail"))  # type: ignore[method-assign]
-
-        # 4. Call update with new steps
         data = TestCaseUpdate(steps=[{"action": "New Step"}])
 
         with pytest.raises(AllureAPIError, match="Failed to recreate scenario"):
             await service.update_test_case(test_case_id, data)
 
-        # 5. Verify Rollback behavior
-        # Should have called update_test_case to clear scenario twice:
-        # 1. Initial clear
-        # 2. Rollback clear
-        clear_calls = [
-            call
-            for call in mock_client.update_test_case.call_args_list
-            if call[0][1].scenario is not None and call[0][1].scenario.steps == []
-        ]
-        assert len(clear_calls) == 2
-
-        # Verify get_test_case_scenario was called twice:
-        # 1. In _get_existing_steps_to_preserve (to check for steps to preserve)
-        # 2. In _recreate_scenario (to fetch backup scenario)
-        assert mock_client.get_test_case_scenario.call_count == 2
+        mock_client.set_test_case_scenario.assert_called_once()
+        assert not [call for call in mock_client.update_test_case.call_args_list if call[0][1].scenario is not None]
 
 
 @pytest.mark.asyncio
@@ -311,8 +311,7 @@ class TestIssueLinking:
         service._validate_attachments = Mock()
         service._validate_custom_fields = Mock()
         service._validate_test_layer = AsyncMock(return_value=None)
-        service._add_steps = AsyncMock()
-        service._add_global_attachments = AsyncMock()
+        service._write_scenario = AsyncMock()
         service.get_test_case = AsyncMock(return_value=Mock(issues=[], project_id=1))
 
         # Mock integrations via IntegrationService
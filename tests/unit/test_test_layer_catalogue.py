@@ -0,0 +1,67 @@
+"""Unit tests for the shared, paginated test layer catalogue."""
+
+import pytest
+
+from src.client.exceptions import AllureValidationError
+from src.client.generated.models.test_layer_dto import TestLayerDto
+from src.client.request_accounting import count_requests
+from src.services.test_layer_service import TestLayerCatalogue
+from src.tools.create_test_case import create_test_case
+from src.tools.test_layers import delete_test_layer, update_test_layer
+from tests.support.fake_testops import FakeTestOps
+
+
+def test_catalogue_indexes_layers_by_id_and_name() -> None:
+    catalogue = TestLayerCatalogue.from_layers(
+        [TestLayerDto(id=1, name="UI"), TestLayerDto(id=2, name="API"), TestLayerDto(id=3, name="UI")]
+    )
+
+    assert catalogue.get(2) == TestLayerDto(id=2, name="API")
+    assert catalogue.get(4) is None
+    assert [layer.id for layer in catalogue.named("UI")] == [1, 3]
+    assert catalogue.named("E2E") == ()
+
+
+@pytest.mark.asyncio
+async def test_layers_beyond_the_first_hundred_are_found_and_shared_across_calls(fake_testops: FakeTestOps) -> None:
+    layers = [fake_testops.store.create_test_layer({"name": f"Layer {index}"}) for index in range(250)]
+
+    with count_requests() as ledger:
+        await create_test_case(name="By name", test_layer_name="Layer 240", output_format="json")
+    assert ledger.calls["GET /api/testlayer"] == 3
+
+    with count_requests() as ledger:
+        created = await create_test_case(name="By ID", test_layer_id=layers[180]["id"], output_format="json")
+    assert "GET /api/testlayer" not in ledger.calls
+    assert "GET /api/testlayer/{id}" not in ledger.calls
+    assert created.structured_content is not None
+
+
+@pytest.mark.asyncio
+async def test_layers_created_elsewhere_reload_the_cached_catalogue_once(fake_testops: FakeTestOps) -> None:
+    fake_testops.store.create_test_layer({"name": "Known"})
+    await create_test_case(name="Warm", test_layer_name="Known", output_format="json")
+
+    fake_testops.store.create_test_layer({"name": "Added elsewhere"})
+    with count_requests() as ledger:
+        await create_test_case(name="Fresh", test_layer_name="Added elsewhere", output_format="json")
+    assert ledger.calls["GET /api/testlayer"] == 1
+
+    with count_requests() as ledger, pytest.raises(AllureValidationError, match="'Missing' not found"):
+        await create_test_case(name="Missing", test_layer_name="Missing", output_format="json")
+    assert ledger.calls["GET /api/testlayer"] == 1
+
+
+@pytest.mark.asyncio
+async def test_layer_tools_invalidate_the_catalogue(fake_testops: FakeTestOps) -> None:
+    renamed = fake_testops.store.create_test_layer({"name": "Before"})
+    deleted = fake_testops.store.create_test_layer({"name": "Doomed"})
+    await create_test_case(name="Warm", test_layer_name="Before", output_format="json")
+
+    await update_test_layer(layer_id=renamed["id"], name="After", confirm=True, output_format="json")
+    await delete_test_layer(layer_id=deleted["id"], confirm=True, output_format="json")
+
+    with pytest.raises(AllureValidationError, match="'Before' not found"):
+        await create_test_case(name="Old name", test_layer_name="Before", output_format="json")
+    with pytest.raises(AllureValidationError, match=f"ID {deleted['id']} does not exist"):
+        await create_test_case(name="Deleted", test_layer_id=deleted["id"], output_format="json")
@@ -0,0 +1,238 @@
+"""Unit tests for JWT exchange, caching, and renewal in AllureClient."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+import respx
+from httpx import Request, Response
+from pydantic import SecretStr
+
+from src.client import AllureClient
+from src.client.client import TOKEN_RENEWAL_RETRY_SECONDS
+from src.client.session_pool import AllureSessionPool
+from src.client.token_cache import CachedToken, set_token_cache
+from src.utils.deadline import deadline_scope, remaining_time
+
+BASE_URL = "https://allure.example.com"
+OAUTH_URL = f"{BASE_URL}/api/uaa/oauth/token"
+
+
+def _jwt_responses() -> list[Response]:
+    return [Response(200, json={"access_token": f"jwt-{i}", "expires_in": 3600}) for i in range(1, 10)]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_callers_share_one_token_exchange() -> None:
+    route = respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+
+    await asyncio.gather(*(client._ensure_valid_token() for _ in range(10)))
+
+    assert route.call_count == 1
+    assert client._jwt_token == "jwt-1"  # noqa: S105
+    await client.api_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_refresh_keeps_controllers_and_swaps_authorization_header() -> None:
+    respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+    await client._ensure_valid_token()
+    api_client = client.api_client
+    test_case_api = client._test_case_api
+
+    client._token_expires_at = time.time() - 1
+    await client._ensure_valid_token()
+
+    assert client.api_client is api_client
+    assert client._test_case_api is test_case_api
+    assert api_client.default_headers["Authorization"] == "Bearer jwt-2"
+    assert api_client.configuration.access_token == "jwt-2"  # noqa: S105
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_token_in_renewal_window_is_renewed_in_background() -> None:
+    route = respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+    await client._ensure_valid_token()
+    client._session.token_renew_at = time.time() - 1
+
+    await client._ensure_valid_token()
+    # The caller keeps the current token while renewal runs.
+    assert client._jwt_token == "jwt-1"  # noqa: S105
+    renewal = client._session.renewal_task
+    assert renewal is not None
+
+    await client._ensure_valid_token()
+    assert client._session.renewal_task is renewal
+
+    await renewal
+    assert route.call_count == 2
+    assert client._jwt_token == "jwt-2"  # noqa: S105
+    assert client._session.token_renew_at is not None
+    assert client._session.token_renew_at > time.time()
+    await client.api_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_background_renewal_ignores_the_deadline_of_the_scheduling_call() -> None:
+    responses = iter(_jwt_responses())
+    budgets: list[float | None] = []
+
+    def exchange(_request: Request) -> Response:
+        budgets.append(remaining_time())
+        return next(responses)
+
+    route = respx.post(OAUTH_URL).mock(side_effect=exchange)
+    client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+    await client._ensure_valid_token()
+    client._session.token_renew_at = time.time() - 1
+
+    with deadline_scope(0):
+        await client._ensure_valid_token()
+        renewal = client._session.renewal_task
+    assert renewal is not None
+    await renewal
+
+    assert route.call_count == 2
+    assert budgets == [None, None]
+    assert client._jwt_token == "jwt-2"  # noqa: S105
+    await client.api_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failed_background_renewal_backs_off() -> None:
+    respx.post(OAUTH_URL).mock(
+        side_effect=[
+            Response(200, json={"access_token": "jwt-1", "expires_in": 3600}),
+            Response(503, text="unavailable"),
+        ]
+    )
+    client = AllureClient(BASE_URL, SecretStr("token"), project=1)
+    await client._ensure_valid_token()
+    client._session.token_renew_at = time.time() - 1
+
+    await client._ensure_valid_token()
+    assert client._session.renewal_task is not None
+    await client._session.renewal_task
+
+    assert client._jwt_token == "jwt-1"  # noqa: S105
+    assert client._session.token_renew_at is not None
+    assert client._session.token_renew_at > time.time() + TOKEN_RENEWAL_RETRY_SECONDS - 5
+    await client.api_client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pooled_session_arms_renewal_timer_until_pool_closes() -> None:
+    respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+
+    async with AllureSessionPool():
+        async with AllureClient(BASE_URL, SecretStr("token"), project=1) as client:
+            session = client._session
+        renewal = session.renewal_task
+        assert renewal is not None
+        assert not renewal.done()
+
+    await asyncio.sleep(0)
+    assert renewal.cancelled()
+    assert session.renewal_task is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_unpooled_client_cancels_renewal_on_exit() -> None:
+    respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as client:
+        assert client._session.renewal_task is None
+        client._schedule_token_renewal(3600)
+        renewal = client._session.renewal_task
+
+    assert renewal is not None
+    await asyncio.sleep(0)
+    assert renewal.cancelled()
+
+
+class _MemoryTokenCache:
+    def __init__(self, cached: CachedToken | None = None) -> None:
+        self.cached = cached
+        self.discarded = 0
+
+    def load(self, base_url: str, token: SecretStr) -> CachedToken | None:
+        return self.cached
+
+    def store(self, base_url: str, token: SecretStr, cached: CachedToken) -> None:
+        self.cached = cached
+
+    def discard(self, base_url: str, token: SecretStr) -> None:
+        self.cached = None
+        self.discarded += 1
+
+
+@pytest.fixture
+def memory_token_cache() -> Iterator[_MemoryTokenCache]:
+    cache = _MemoryTokenCache()
+    set_token_cache(cache)
+    yield cache
+    set_token_cache(None)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cached_jwt_skips_token_exchange(memory_token_cache: _MemoryTokenCache) -> None:
+    route = respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    memory_token_cache.cached = CachedToken("cached-jwt", time.time() + 1800, "csrf")
+
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as client:
+        assert client._jwt_token == "cached-jwt"  # noqa: S105
+        assert client.api_client.default_headers["Authorization"] == "Bearer cached-jwt"
+        assert client.api_client.default_headers["X-XSRF-TOKEN"] == "csrf"
+
+    assert route.call_count == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_nearly_expired_cached_jwt_is_exchanged_and_stored(memory_token_cache: _MemoryTokenCache) -> None:
+    route = respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    memory_token_cache.cached = CachedToken("cached-jwt", time.time() + 10)
+
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as client:
+        assert client._jwt_token == "jwt-1"  # noqa: S105
+
+    assert route.call_count == 1
+    assert memory_token_cache.cached is not None
+    assert memory_token_cache.cached.jwt_token == "jwt-1"  # noqa: S105
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rejected_jwt_is_exchanged_again_and_request_replayed(memory_token_cache: _MemoryTokenCache) -> None:
+    oauth = respx.post(OAUTH_URL).mock(side_effect=_jwt_responses())
+    memory_token_cache.cached = CachedToken("revoked-jwt", time.time() + 1800)
+    launch = respx.get(f"{BASE_URL}/api/launch/7").mock(
+        side_effect=[
+            Response(401, text="Unauthorized"),
+            Response(200, json={"id": 7, "name": "Launch", "projectId": 1}),
+        ]
+    )
+
+    async with AllureClient(BASE_URL, SecretStr("token"), project=1) as client:
+        result = await client.get_launch_base(7)
+
+    assert result.id == 7
+    assert oauth.call_count == 1
+    assert memory_token_cache.discarded == 1
+    assert launch.calls[0].request.headers["Authorization"] == "Bearer revoked-jwt"
+    assert launch.calls[1].request.headers["Authorization"] == "Bearer jwt-1"
+    assert memory_token_cache.cached is not None
+    assert memory_token_cache.cached.jwt_token == "jwt-1"  # noqa: S105
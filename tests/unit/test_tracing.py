@@ -0,0 +1,87 @@
+"""Unit tests for OpenTelemetry spans across tool, service, and HTTP layers."""
+
+from collections.abc import Iterator
+
+import pytest
+import respx
+from httpx import Response
+
+from src.client.generated.configuration import Configuration
+from src.client.transport import AllureRESTClient
+from src.utils.telemetry import wrap_tool_with_telemetry
+from src.utils.tracing import configure_tracing, shutdown_tracing, span, traced, tracing_enabled, use_in_memory_exporter
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+BASE_URL = "https://allure.example.com"
+TEST_CASE_URL = f"{BASE_URL}/api/testcase/7"
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    yield use_in_memory_exporter()
+    shutdown_tracing()
+
+
+class DemoService:
+    def __init__(self, rest_client: AllureRESTClient) -> None:
+        self._rest_client = rest_client
+
+    @traced
+    async def load(self) -> int:
+        response = await self._rest_client.request("GET", TEST_CASE_URL, headers={})
+        return response.status
+
+    @traced
+    async def fail(self) -> None:
+        raise ValueError("bad input")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_tool_service_and_http_spans_form_one_tree(exporter: InMemorySpanExporter) -> None:
+    respx.get(TEST_CASE_URL).mock(return_value=Response(200, json={"id": 7}))
+    rest_client = AllureRESTClient(Configuration(host=BASE_URL))
+
+    async def get_test_case() -> int:
+        return await DemoService(rest_client).load()
+
+    await wrap_tool_with_telemetry(get_test_case)()
+    await rest_client.close()
+
+    spans = {finished.name: finished for finished in exporter.get_finished_spans()}
+    tool_span = spans["tool get_test_case"]
+    service_span = spans["DemoService.load"]
+    http_span = spans["HTTP GET"]
+
+    assert tool_span.parent is None
+    assert tool_span.attributes == {"mcp.tool.name": "get_test_case", "lucius.upstream_requests": 1}
+    assert service_span.parent is not None and service_span.parent.span_id == tool_span.context.span_id
+    assert http_span.parent is not None and http_span.parent.span_id == service_span.context.span_id
+    assert http_span.kind is SpanKind.CLIENT
+    assert http_span.attributes is not None
+    assert http_span.attributes["url.path"] == "/api/testcase/7"
+    assert http_span.attributes["http.response.status_code"] == 200
+    assert len({finished.context.trace_id for finished in spans.values()}) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_service_calls_mark_spans_as_errors(exporter: InMemorySpanExporter) -> None:
+    with pytest.raises(ValueError, match="bad input"):
+        await DemoService(AllureRESTClient(Configuration(host=BASE_URL))).fail()
+
+    (failed,) = exporter.get_finished_spans()
+    assert failed.name == "DemoService.fail"
+    assert failed.status.status_code is StatusCode.ERROR
+    assert failed.events[0].name == "exception"
+
+
+def test_spans_are_no_ops_until_tracing_is_configured() -> None:
+    assert not tracing_enabled()
+    assert configure_tracing(enabled=False) is False
+
+    with span("ignored") as current:
+        assert current is None
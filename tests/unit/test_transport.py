@@ -0,0 +1,114 @@
+"""Unit tests for the configurable Allure HTTP transport."""
+
+from typing import Any
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from src.client.generated.configuration import Configuration
+from src.client.transport import AllureRESTClient, TimeoutProfile, TransportConfig, use_transfer_timeouts
+from src.utils.config import Settings
+
+BASE_URL = "https://allure.example.com"
+
+
+def _rest_client(transport: TransportConfig | None = None) -> AllureRESTClient:
+    return AllureRESTClient(Configuration(host=BASE_URL), transport=transport)
+
+
+def test_transport_config_from_settings() -> None:
+    settings = Settings(
+        ALLURE_HTTP2=True,
+        ALLURE_HTTP_MAX_CONNECTIONS=50,
+        ALLURE_HTTP_MAX_KEEPALIVE_CONNECTIONS=10,
+        ALLURE_HTTP_KEEPALIVE_EXPIRY=15.0,
+        ALLURE_HTTP_CONNECT_TIMEOUT=3.0,
+        ALLURE_HTTP_READ_TIMEOUT=20.0,
+        ALLURE_HTTP_WRITE_TIMEOUT=25.0,
+        ALLURE_HTTP_POOL_TIMEOUT=5.0,
+        ALLURE_HTTP_TRANSFER_TIMEOUT=600.0,
+    )
+
+    config = TransportConfig.from_settings(settings)
+
+    assert config.http2 is True
+    assert config.limits() == httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=15.0)
+    assert config.timeouts == TimeoutProfile(connect=3.0, read=20.0, write=25.0, pool=5.0)
+    assert config.transfer_timeouts == TimeoutProfile(connect=3.0, read=600.0, write=600.0, pool=5.0)
+
+
+def test_scalar_request_timeout_sets_read_phase_only() -> None:
+    rest_client = _rest_client(TransportConfig(timeouts=TimeoutProfile(connect=2.0, read=30.0, write=40.0, pool=4.0)))
+
+    assert rest_client.resolve_timeout(7.5) == httpx.Timeout(connect=2.0, read=7.5, write=40.0, pool=4.0)
+    assert rest_client.resolve_timeout((1.0, 9.0)) == httpx.Timeout(connect=1.0, read=9.0, write=40.0, pool=4.0)
+    assert rest_client.resolve_timeout(None) == httpx.Timeout(connect=2.0, read=30.0, write=40.0, pool=4.0)
+
+
+def test_transfer_profile_ignores_api_read_timeout() -> None:
+    transfer = TimeoutProfile(connect=5.0, read=300.0, write=300.0, pool=20.0)
+    rest_client = _rest_client(TransportConfig(transfer_timeouts=transfer))
+
+    assert rest_client.resolve_timeout(7.5, transfer=True) == transfer.to_httpx()
+
+
+def test_pool_manager_uses_limits_and_http2(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def _fake_async_client(**kwargs: Any) -> object:
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr("src.client.transport.httpx.AsyncClient", _fake_async_client)
+    monkeypatch.setattr("src.client.transport.http2_available", lambda: True)
+    config = TransportConfig(http2=True, max_connections=8, max_keepalive_connections=4, keepalive_expiry=5.0)
+
+    _rest_client(config)._create_pool_manager()
+
+    assert captured["http2"] is True
+    assert captured["limits"] == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=5.0)
+    assert captured["timeout"] == config.timeouts.to_httpx()
+
+
+def test_pool_manager_falls_back_to_http1_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def _fake_async_client(**kwargs: Any) -> object:
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr("src.client.transport.httpx.AsyncClient", _fake_async_client)
+    monkeypatch.setattr("src.client.transport.http2_available", lambda: False)
+
+    _rest_client(TransportConfig(http2=True))._create_pool_manager()
+
+    assert captured["http2"] is False
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_pick_timeout_profile_by_kind() -> None:
+    route = respx.route(host="allure.example.com").mock(return_value=Response(200, json={}))
+    transfer = TimeoutProfile(connect=5.0, read=300.0, write=300.0, pool=20.0)
+    rest_client = _rest_client(
+        TransportConfig(timeouts=TimeoutProfile(connect=2.0, write=40.0, pool=4.0), transfer_timeouts=transfer)
+    )
+
+    await rest_client.request("GET", f"{BASE_URL}/api/testcase/1", headers={}, _request_timeout=12.0)
+    await rest_client.request(
+        "POST",
+        f"{BASE_URL}/api/testcase/attachment",
+        headers={"Content-Type": "multipart/form-data"},
+        post_params=[("file", ("a.txt", b"content", "text/plain"))],
+        _request_timeout=12.0,
+    )
+    with use_transfer_timeouts():
+        await rest_client.request("GET", f"{BASE_URL}/api/testresult/attachment/1/content", _request_timeout=12.0)
+    await rest_client.close()
+
+    timeouts = [call.request.extensions["timeout"] for call in route.calls]
+    assert timeouts[0] == {"connect": 2.0, "read": 12.0, "write": 40.0, "pool": 4.0}
+    assert timeouts[1] == {"connect": 5.0, "read": 300.0, "write": 300.0, "pool": 20.0}
+    assert timeouts[2] == timeouts[1]
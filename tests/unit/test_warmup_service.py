@@ -0,0 +1,42 @@
+"""Unit tests for WarmupService."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.client import AllureClient
+from src.client.exceptions import AllureAPIError
+from src.client.generated.models.page_test_layer_dto import PageTestLayerDto
+from src.services.warmup_service import WarmupService
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    client = MagicMock(spec=AllureClient)
+    client.get_project.return_value = 7
+    client.get_base_url.return_value = "https://testops.example"
+    client.get_custom_fields_with_values = AsyncMock(return_value=[])
+    client.get_project_available_integrations = AsyncMock(return_value=[])
+    client._test_layer_api = MagicMock()
+    client._test_layer_api.find_all7 = AsyncMock(return_value=PageTestLayerDto(content=[]))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_warm_up_prefetches_default_project_metadata(mock_client: MagicMock) -> None:
+    warmed = await WarmupService(mock_client).warm_up()
+
+    assert warmed == ["custom_fields", "test_layers", "integrations"]
+    mock_client.get_custom_fields_with_values.assert_awaited_once_with(7)
+    mock_client.get_project_available_integrations.assert_awaited_once_with(7)
+    mock_client._test_layer_api.find_all7.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetches_are_skipped(mock_client: MagicMock, caplog: pytest.LogCaptureFixture) -> None:
+    mock_client.get_custom_fields_with_values.side_effect = AllureAPIError("forbidden")
+
+    warmed = await WarmupService(mock_client).warm_up()
+
+    assert warmed == ["test_layers", "integrations"]
+    assert "Warm-up prefetch of custom_fields failed: forbidden" in caplog.text